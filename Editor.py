@@ -1,22 +1,45 @@
 #!/usr/bin/env -S uv run --script
 #
-import json
 import os
 import sys
+from contextlib import contextmanager
 
 from PySide6.QtCore import Property, QObject, QUrl, Signal, Slot
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtWidgets import QApplication, QFileDialog
 
+from core.schema import compile_schema, duplicate_errors, fix_booleans, read_catalogue_json, write_catalogue_json
+
 
 class AppModel(QObject):
+    """
+    The catalogue being edited.
+
+    Edits made between beginBatch and commitBatch are published with a
+    single appsChanged, and can be undone together with rollbackBatch. Each
+    changed entry is checked against the schema when the change is
+    published, errors lists every problem in the catalogue, and a catalogue
+    with problems is not saved.
+    """
+
     appsChanged = Signal()
     filePathChanged = Signal()
+    errorsChanged = Signal()
 
     def __init__(self):
         super().__init__()
         self._apps = {}  # {name: {fields...}}
         self._file_path = ""
+        self._validate = compile_schema()
+        # app name -> its problems, only apps with problems are kept
+        self._entry_errors = {}
+        # problems seen when the file was read, such as an app name given twice
+        self._load_errors = []
+        self._errors = []
+        # names changed since the last appsChanged
+        self._touched = set()
+        self._batch_depth = 0
+        self._batch_snapshot = None
 
     @Property("QVariant", notify=appsChanged)
     def apps(self):
@@ -26,18 +49,146 @@ class AppModel(QObject):
     def filePath(self):
         return self._file_path
 
+    @Property("QVariantList", notify=errorsChanged)
+    def errors(self):
+        return [str(error) for error in self._errors]
+
+    @Slot()
+    def beginBatch(self):
+        """
+        Start a batch of edits, nothing is published until the matching commitBatch.
+
+        Batches may nest, only the outermost one publishes or rolls back.
+        """
+        if self._batch_depth == 0:
+            # entries are replaced, never changed in place, so a shallow copy is enough to roll back
+            self._batch_snapshot = dict(self._apps)
+        self._batch_depth += 1
+
+    @Slot(result=bool)
+    def commitBatch(self):
+        """
+        End a batch of edits, publishing them with one appsChanged.
+
+        Returns:
+            True if the catalogue has no problems.
+        """
+        if self._batch_depth == 0:
+            return not self._errors
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._batch_snapshot = None
+            self._publish()
+        return not self._errors
+
+    @Slot()
+    def rollbackBatch(self):
+        """
+        Abandon the outermost batch, undoing every edit made in it.
+        """
+        if self._batch_depth == 0:
+            return
+        self._apps = self._batch_snapshot
+        self._batch_snapshot = None
+        self._batch_depth = 0
+        self._touched.clear()
+
+    @contextmanager
+    def batch(self):
+        """
+        Make edits as one batch, rolled back if an exception is raised.
+        """
+        self.beginBatch()
+        try:
+            yield self
+        except BaseException:
+            self.rollbackBatch()
+            raise
+        self.commitBatch()
+
+    @Slot("QVariantList", result=bool)
+    def applyEdits(self, edits):
+        """
+        Apply many edits as one batch.
+
+        Args:
+            edits: Each is {"remove": name}, or an app entry with its "name" to add or replace it.
+
+        Returns:
+            True if the catalogue has no problems afterwards.
+        """
+        with self.batch():
+            for edit in edits:
+                if "remove" in edit:
+                    self.removeApp(edit["remove"])
+                else:
+                    self.addApp(edit)
+        return not self._errors
+
+    @Slot(result=int)
+    def fixBooleans(self):
+        """
+        Replace "true" and "false" strings in boolean fields such as popup with booleans.
+
+        Returns:
+            The number of apps fixed.
+        """
+        fixed = 0
+        with self.batch():
+            for name, entry in list(self._apps.items()):
+                replacement = fix_booleans(entry) if isinstance(entry, dict) else None
+                if replacement is not None:
+                    self.updateApp(name, replacement)
+                    fixed += 1
+        return fixed
+
+    def _changed(self, name):
+        self._touched.add(name)
+        if self._batch_depth == 0:
+            self._publish()
+
+    def _publish(self):
+        """
+        Check the entries changed since the last time and tell QML, once per batch.
+        """
+        if not self._touched:
+            return
+        for name in self._touched:
+            problems = self._validate(name, self._apps[name]) if name in self._apps else []
+            if problems:
+                self._entry_errors[name] = problems
+            else:
+                self._entry_errors.pop(name, None)
+        self._touched.clear()
+        self._update_errors()
+        self.appsChanged.emit()
+
+    def _update_errors(self):
+        errors = [*self._load_errors]
+        for name in self._apps:
+            errors.extend(self._entry_errors.get(name, ()))
+        errors.extend(duplicate_errors(self._apps))
+        if errors != self._errors:
+            self._errors = errors
+            self.errorsChanged.emit()
+
     @Slot(str)
     def loadJson(self, path):
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                self._apps = json.load(f)
-            self._file_path = path
-            self.appsChanged.emit()
-            self.filePathChanged.emit()
+            apps, self._load_errors = read_catalogue_json(path)
         except Exception as e:
             print(f"Failed to load: {e}")
+            return
+        self._apps = apps if isinstance(apps, dict) else {}
+        self._file_path = path
+        self._entry_errors = {}
+        self._touched = set(self._apps)
+        self._publish()
+        self.filePathChanged.emit()
+        for error in self._errors:
+            print(error)
 
     @Slot()
     def openJsonDialog(self):
@@ -49,19 +200,35 @@ class AppModel(QObject):
             if files:
                 self.loadJson(files[0])
 
-    @Slot()
+    @Slot(result=bool)
     def saveJson(self):
+        """
+        Save the catalogue, replacing the file in one rename so running launchers never read half of it.
+
+        Returns:
+            True if it was saved, a catalogue with problems is not.
+        """
         if not self._file_path:
-            self.saveJsonAs()
-            return
+            return self.saveJsonAs()
+        # the duplicates found when reading are gone once the catalogue is saved
+        errors = [error for error in self._errors if error not in self._load_errors]
+        if errors:
+            print(f"Not saved, {len(errors)} problems:")
+            for error in errors:
+                print(f"  {error}")
+            return False
         try:
-            with open(self._file_path, "w", encoding="utf-8") as f:
-                json.dump(self._apps, f, indent=2)
-            print(f"Saved to {self._file_path}")
-        except Exception as e:
+            write_catalogue_json(self._file_path, self._apps)
+        except OSError as e:
             print(f"Failed to save: {e}")
+            return False
+        print(f"Saved to {self._file_path}")
+        if self._load_errors:
+            self._load_errors = []
+            self._update_errors()
+        return True
 
-    @Slot()
+    @Slot(result=bool)
     def saveJsonAs(self):
         dialog = QFileDialog()
         dialog.setAcceptMode(QFileDialog.AcceptSave)
@@ -71,25 +238,26 @@ class AppModel(QObject):
             if files:
                 self._file_path = files[0]
                 self.filePathChanged.emit()
-                self.saveJson()
+                return self.saveJson()
+        return False
 
     @Slot(str, "QVariant")
     def updateApp(self, name, appdata):
-        self._apps[name] = appdata
-        self.appsChanged.emit()
+        # the name is the key in apps.json, not a field of the entry
+        self._apps[name] = {field: value for field, value in appdata.items() if field != "name"}
+        self._changed(name)
 
     @Slot(str)
     def removeApp(self, name):
         if name in self._apps:
             del self._apps[name]
-            self.appsChanged.emit()
+            self._changed(name)
 
     @Slot("QVariant")
     def addApp(self, appdata):
         name = appdata.get("name", "")
         if name:
-            self._apps[name] = appdata
-            self.appsChanged.emit()
+            self.updateApp(name, appdata)
 
     @Slot(result="QVariant")
     def getAppNames(self):
@@ -135,6 +135,14 @@ ApplicationWindow {
                 wrapMode: TextEdit.WordWrap
             }
         }
+        // every problem in the catalogue, it is not saved until they are fixed
+        Label {
+            visible: appModel.errors.length > 0
+            text: appModel.errors.length + " problems:\n" + appModel.errors.slice(0, 20).join("\n")
+            color: "firebrick"
+            Layout.fillWidth: true
+            wrapMode: Text.WordWrap
+        }
         Button {
             text: root.isNew ? "Add App" : "Save Changes"
             onClicked: {
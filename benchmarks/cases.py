@@ -0,0 +1,319 @@
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QCoreApplication
+
+from benchmarks.synthetic import REAL_NAMES, app_names, synthetic_catalogue, write_catalogue
+from core.applauncher import AppLauncher
+from core.catalogue import load_apps_json, load_catalogue, parse_catalogue
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Typed one character at a time, each prefix is searched as a keystroke would be.
+KEYSTROKE_SEQUENCES = ["houdini", "nuke studio", "hodini", "blender", "viewer 12", "pycharm pro", "zz"]
+
+# A benchmark result: summary statistics of the samples in seconds, plus any extra figures.
+Result = Dict[str, Any]
+
+
+def summarize(samples: List[float], **extra: Any) -> Result:
+    """
+    Summarize timing samples.
+
+    Args:
+        samples: Durations in seconds.
+        **extra: Other figures to store with the result, e.g. a throughput.
+
+    Returns:
+        The sample count and the min, median, p95 and mean in seconds.
+    """
+    ordered = sorted(samples)
+    return dict(
+        extra,
+        n=len(ordered),
+        min=ordered[0],
+        median=statistics.median(ordered),
+        p95=ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        mean=statistics.fmean(ordered),
+    )
+
+
+def measure(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Time a function several times.
+
+    Args:
+        fn: The code to time.
+        repeat: Number of timed runs.
+        setup: Called untimed before every run.
+
+    Returns:
+        The duration of each run in seconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def process_events_until(done: Callable[[], bool], timeout: float = 60.0) -> bool:
+    """
+    Run the Qt event loop until a condition holds.
+
+    Args:
+        done: The condition.
+        timeout: Seconds to give up after.
+
+    Returns:
+        True if the condition was met.
+    """
+    deadline = time.monotonic() + timeout
+    while not done():
+        if time.monotonic() > deadline:
+            return False
+        QCoreApplication.processEvents()
+        time.sleep(0.001)
+    return True
+
+
+def make_launcher(apps_by_tab: List[Dict[str, Any]]) -> AppLauncher:
+    """
+    Create a launcher and wait until its search index is built.
+
+    Args:
+        apps_by_tab: The catalogue.
+
+    Returns:
+        The launcher, call dispose_launcher when done.
+    """
+    launcher = AppLauncher(apps_by_tab)
+    launcher.search_apps("warm up")
+    return launcher
+
+
+def dispose_launcher(launcher: AppLauncher) -> None:
+    launcher.shutdown()
+    launcher.deleteLater()
+    QCoreApplication.processEvents()
+
+
+def bench_load_apps_json(workdir: Path, size: int, repeat: int) -> Dict[str, Result]:
+    path = write_catalogue(workdir / f"apps-{size}.json", size)
+    # what the loaded catalogue holds on to, the decoded JSON is freed once the entries are built
+    tracemalloc.start()
+    apps_by_tab = load_apps_json(str(path))
+    retained_mb = round(tracemalloc.get_traced_memory()[0] / (1024 * 1024), 3)
+    tracemalloc.stop()
+    del apps_by_tab
+    samples = measure(lambda: load_apps_json(str(path)), repeat)
+    results = {f"load_apps_json[{size}]": summarize(samples, retained_mb=retained_mb)}
+    cache = workdir / f"catalogue-{size}.bin"
+    cold_samples = []
+    for _ in range(repeat):
+        cache.unlink(missing_ok=True)
+        start = time.perf_counter()
+        index = load_catalogue(str(path), cache)[1]
+        cold_samples.append(time.perf_counter() - start)
+        # the index is built and cached in the background, wait for it outside the timing
+        index.state()
+        process_events_until(cache.exists, timeout=30.0)
+    results[f"load_catalogue.cold[{size}]"] = summarize(cold_samples)
+    warm_samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        index = load_catalogue(str(path), cache)[1]
+        warm_samples.append(time.perf_counter() - start)
+        index.state()
+    results[f"load_catalogue.warm[{size}]"] = summarize(warm_samples)
+    return results
+
+
+def bench_launcher_init(size: int, repeat: int) -> Dict[str, Result]:
+    apps_by_tab = parse_catalogue(synthetic_catalogue(size))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        launcher = AppLauncher(apps_by_tab)
+        samples.append(time.perf_counter() - start)
+        dispose_launcher(launcher)
+    return {f"AppLauncher.__init__[{size}]": summarize(samples)}
+
+
+def bench_search(size: int, repeat: int) -> Dict[str, Result]:
+    launcher = make_launcher(parse_catalogue(synthetic_catalogue(size)))
+    keystrokes: List[float] = []
+    sequences: List[float] = []
+    for _ in range(repeat):
+        for sequence in KEYSTROKE_SEQUENCES:
+            start = time.perf_counter()
+            for i in range(1, len(sequence) + 1):
+                keystrokes.extend(measure(lambda: launcher.search_apps(sequence[:i]), 1))
+            sequences.append(time.perf_counter() - start)
+    dispose_launcher(launcher)
+    return {
+        f"search_apps.keystroke[{size}]": summarize(keystrokes),
+        f"search_apps.sequence[{size}]": summarize(sequences),
+    }
+
+
+def bench_favourites(size: int, repeat: int, count: int = 50, moves: int = 200) -> Dict[str, Result]:
+    data = synthetic_catalogue(size)
+    launcher = make_launcher(parse_catalogue(data))
+    names = app_names(data)
+    rng = random.Random(2)
+    added: List[float] = []
+    moved: List[float] = []
+    removed: List[float] = []
+    for _ in range(repeat):
+        chosen = rng.sample(names, min(count, len(names)))
+        for name in chosen:
+            added.extend(measure(lambda: launcher.add_to_favourites(name), 1))
+        for _ in range(moves):
+            a, b = rng.randrange(len(chosen)), rng.randrange(len(chosen))
+            moved.extend(measure(lambda: launcher.move_favourite(a, b), 1))
+        for name in chosen:
+            removed.extend(measure(lambda: launcher.remove_from_favourites(name), 1))
+    dispose_launcher(launcher)
+    return {
+        f"favourites.add[{size}]": summarize(added),
+        f"favourites.move[{size}]": summarize(moved),
+        f"favourites.remove[{size}]": summarize(removed),
+    }
+
+
+def bench_about_text(repeat: int) -> Dict[str, Result]:
+    first: List[float] = []
+    cached: List[float] = []
+    for _ in range(repeat):
+        # a new launcher has not parsed or rendered the help yet
+        launcher = AppLauncher(parse_catalogue(synthetic_catalogue(len(REAL_NAMES))))
+        for theme in ("light", "dark"):
+            for name in REAL_NAMES:
+                first.extend(measure(lambda: launcher.get_about_text(name, theme), 1))
+                cached.extend(measure(lambda: launcher.get_about_text(name, theme), 1))
+        dispose_launcher(launcher)
+    return {"get_about_text.first": summarize(first), "get_about_text.cached": summarize(cached)}
+
+
+def bench_debug_output(repeat: int, mb: float = 20.0) -> Dict[str, Result]:
+    """
+    Time how long the launcher takes to take in a child's output, from launch until every line reached the log.
+    """
+    launcher = make_launcher(parse_catalogue(synthetic_catalogue(len(REAL_NAMES))))
+    child = str(REPO_ROOT / "benchmarks" / "fakechild.py")
+    python = Path(sys.executable)
+    supervisor = launcher.runningApps
+    pipeline = launcher._log_pipeline
+    samples = []
+    dropped = 0
+    for _ in range(repeat):
+        launcher.debugLog.clear()
+        start = time.perf_counter()
+        launcher.launch_app(str(python.parent), python.name, [child, "--mb", str(mb)])
+        finished = process_events_until(
+            lambda: supervisor.running_count() == 0 and not pipeline.active(), timeout=120.0
+        )
+        if not finished:
+            raise RuntimeError("fake child did not finish")
+        samples.append(time.perf_counter() - start)
+        dropped = max(dropped, launcher.debugLog.droppedLines)
+        supervisor.clear_finished()
+    dispose_launcher(launcher)
+    median = statistics.median(samples)
+    return {f"debug_output[{mb:g}MB]": summarize(samples, mb_per_s=round(mb / median, 2), dropped_lines=dropped)}
+
+
+def _first_frame_ms(cwd: Path, env: Dict[str, str], timeout: float) -> float:
+    """
+    Start the launcher with --startup-trace and read when it showed its first frame.
+
+    Args:
+        cwd: Directory holding the apps.json to load.
+        env: The environment to run in.
+        timeout: Seconds to wait for the first frame.
+
+    Returns:
+        Milliseconds from process start to the first frame.
+    """
+    proc = subprocess.Popen(
+        [sys.executable, str(REPO_ROOT / "main.py"), "--startup-trace", "--new-instance"],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    # ends the read below if the launcher hangs without printing anything
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    output = []
+    try:
+        assert proc.stderr is not None
+        for line in proc.stderr:
+            # the report has one line per phase, "first frame" is marked once the window is up
+            if line.strip().startswith("first frame"):
+                return float(line.split()[2])
+            output.append(line)
+        raise RuntimeError("no first frame reported:\n" + "".join(output[-10:]))
+    finally:
+        watchdog.cancel()
+        proc.kill()
+        proc.wait()
+
+
+def bench_startup(workdir: Path, size: int, repeat: int, timeout: float = 60.0) -> Dict[str, Result]:
+    rundir = workdir / f"startup-{size}"
+    rundir.mkdir(exist_ok=True)
+    write_catalogue(rundir / "apps.json", size)
+    (rundir / "appsereicon.png").write_bytes((REPO_ROOT / "appsereicon.png").read_bytes())
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    cold: List[float] = []
+    warm: List[float] = []
+    for _ in range(repeat):
+        cache = tempfile.mkdtemp(dir=workdir, prefix="cache")
+        env["XDG_CACHE_HOME"] = cache
+        cold.append(_first_frame_ms(rundir, env, timeout) / 1000)
+        # the compiled catalogue is written in the background after the first frame
+        time.sleep(1.0)
+        warm.append(_first_frame_ms(rundir, env, timeout) / 1000)
+    return {f"startup.cold[{size}]": summarize(cold), f"startup.warm[{size}]": summarize(warm)}
+
+
+def describe_environment() -> Dict[str, Any]:
+    """
+    Describe where the benchmarks ran, stored with the results.
+
+    Returns:
+        Python version, platform, CPU count and the git commit if known.
+    """
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def dump(path: Path, environment: Dict[str, Any], results: Dict[str, Result]) -> None:
+    path.write_text(json.dumps({"environment": environment, "results": results}, indent=2), encoding="utf-8")
@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_THRESHOLD = 0.25
+# Changes smaller than this are noise whatever the ratio, e.g. 20 µs against 30 µs.
+DEFAULT_MIN_DELTA_S = 0.0005
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read a results file written by the benchmark runner.
+
+    Args:
+        path: The JSON file.
+
+    Returns:
+        Benchmark name to its result.
+    """
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare the medians of two runs, benchmarks only in one of them are skipped.
+
+    Args:
+        baseline: The reference results.
+        current: The new results.
+        threshold: Relative slow down that counts as a regression, 0.25 is 25% slower.
+        min_delta_s: Absolute slow down in seconds below which nothing counts as a regression.
+
+    Returns:
+        A tuple of (report lines for every compared benchmark, the names that regressed).
+    """
+    lines = [f"{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'change':>8}"]
+    regressions = []
+    for name in sorted(set(baseline) & set(current)):
+        before, after = baseline[name]["median"], current[name]["median"]
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > threshold and after - before > min_delta_s
+        if regressed:
+            regressions.append(name)
+        flag = "  REGRESSION" if regressed else ""
+        lines.append(f"{name:<40} {before * 1000:12.3f} {after * 1000:12.3f} {change:+8.1%}{flag}")
+    return lines, regressions
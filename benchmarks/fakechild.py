@@ -0,0 +1,41 @@
+"""
+A stand in for a chatty app, writes lines to stdout and stderr as fast as
+it can (or at a fixed rate) and exits.
+
+    python fakechild.py --mb 20 --line-length 120 [--rate-mb-s 5]
+"""
+
+import argparse
+import sys
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="write a fixed amount of output and exit")
+    parser.add_argument("--mb", type=float, default=10.0, help="megabytes of output to write")
+    parser.add_argument("--line-length", type=int, default=120, help="characters per line")
+    parser.add_argument("--rate-mb-s", type=float, default=0.0, help="limit the output rate, 0 for as fast as possible")
+    parser.add_argument("--stderr-every", type=int, default=10, help="every nth line goes to stderr, 0 for none")
+    args = parser.parse_args()
+    line = ("x" * (args.line_length - 1)) + "\n"
+    total = int(args.mb * 1024 * 1024)
+    lines = max(1, total // len(line))
+    start = time.monotonic()
+    written = 0
+    out, err = sys.stdout, sys.stderr
+    for i in range(lines):
+        if args.stderr_every and i % args.stderr_every == 0:
+            err.write(line)
+        else:
+            out.write(line)
+        written += len(line)
+        if args.rate_mb_s and i % 256 == 0:
+            ahead = written / (args.rate_mb_s * 1024 * 1024) - (time.monotonic() - start)
+            if ahead > 0:
+                time.sleep(ahead)
+    out.flush()
+    err.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmarks for the launcher backend, run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.run --output results.json
+    python -m benchmarks.run --output new.json --compare results.json
+
+The settings and caches of the launcher are redirected to a temporary
+directory so a run neither reads nor changes the user's own.
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Apps'Ere backend benchmarks")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma separated catalogue sizes, default %(default)s",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark, default %(default)s")
+    parser.add_argument("--only", default="*", help="only run benchmark groups matching this glob, e.g. 'search*'")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="compare against a previous results file, exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=None, help="relative slow down that fails a compare")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=None, help="absolute slow down below which a compare never fails"
+    )
+    parser.add_argument("--debug-mb", type=float, default=20.0, help="megabytes the fake child writes")
+    parser.add_argument("--startup-sizes", default="100,10000", help="catalogue sizes to measure start up with")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="appsere-bench-"))
+    # isolate QSettings and the caches before anything from Qt or the launcher is imported
+    os.environ["XDG_CONFIG_HOME"] = str(workdir / "config")
+    os.environ["XDG_CACHE_HOME"] = str(workdir / "cache")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+    from PySide6.QtWidgets import QApplication
+
+    from benchmarks import cases
+    from benchmarks.compare import DEFAULT_MIN_DELTA_S, DEFAULT_THRESHOLD, compare, load_results
+
+    app = QApplication(sys.argv[:1])  # noqa: F841 needed by the launcher's QObjects
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    startup_sizes = [int(size) for size in args.startup_sizes.split(",") if size]
+    repeat = args.repeat
+    groups: Dict[str, Callable[[], Dict[str, cases.Result]]] = {}
+    for size in sizes:
+        groups[f"load_apps_json[{size}]"] = lambda size=size: cases.bench_load_apps_json(workdir, size, repeat)
+        groups[f"AppLauncher.__init__[{size}]"] = lambda size=size: cases.bench_launcher_init(size, repeat)
+        groups[f"search_apps[{size}]"] = lambda size=size: cases.bench_search(size, repeat)
+        groups[f"favourites[{size}]"] = lambda size=size: cases.bench_favourites(size, repeat)
+    groups["get_about_text"] = lambda: cases.bench_about_text(repeat)
+    groups["debug_output"] = lambda: cases.bench_debug_output(repeat, args.debug_mb)
+    for size in startup_sizes:
+        groups[f"startup[{size}]"] = lambda size=size: cases.bench_startup(workdir, size, min(repeat, 3))
+
+    results: Dict[str, cases.Result] = {}
+    for name, run in groups.items():
+        if not fnmatch.fnmatch(name, args.only):
+            continue
+        print(f"running {name}", file=sys.stderr, flush=True)
+        for key, result in run().items():
+            results[key] = result
+            extra = "".join(f" {k}={v}" for k, v in result.items() if k not in ("n", "min", "median", "p95", "mean"))
+            print(
+                f"  {key:<40} median {result['median'] * 1000:10.3f} ms  p95 {result['p95'] * 1000:10.3f} ms{extra}",
+                flush=True,
+            )
+
+    if args.output is not None:
+        cases.dump(args.output, cases.describe_environment(), results)
+    if args.compare is not None:
+        threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+        min_delta_s = DEFAULT_MIN_DELTA_S if args.min_delta_ms is None else args.min_delta_ms / 1000
+        lines, regressions = compare(load_results(args.compare), results, threshold, min_delta_s)
+        print("\n".join(lines))
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
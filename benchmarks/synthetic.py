@@ -0,0 +1,75 @@
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Real catalogue names are mixed in so searches and help lookups hit entries that look like the lab's.
+REAL_NAMES = ["Maya", "Houdini", "Nuke", "NukeStudio", "Blender", "Krita", "Gimp3", "PyCharm", "Firefox", "Zed Editor"]
+TAB_NAMES = [
+    "Core DCC Tools", "FOSS DCC", "Developer Tools", "Web / Office", "Installers", "Renderers", "Audio", "Misc"
+]
+_SYLLABLES = ["ma", "ya", "hou", "di", "ni", "nu", "ke", "blen", "der", "kri", "ta", "gim", "py", "char", "zed", "fox"]
+_WORDS = ["Studio", "Viewer", "Editor", "Render", "Shell", "Tool", "Pro", "Lite", "Suite", "Manager", "Player"]
+
+
+def synthetic_catalogue(size: int, seed: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate an apps.json style catalogue.
+
+    Args:
+        size: Number of apps.
+        seed: Random seed, the same size and seed always give the same catalogue.
+
+    Returns:
+        App name to entry, as stored in apps.json.
+    """
+    rng = random.Random(seed)
+    data: Dict[str, Dict[str, Any]] = {}
+    names = list(REAL_NAMES[: min(len(REAL_NAMES), size)])
+    while len(names) < size:
+        stem = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        name = f"{stem}{rng.choice(_WORDS)}{len(names)}"
+        names.append(name)
+    for i, name in enumerate(names):
+        entry = {
+            "path": f"/public/bin/{rng.randint(20, 26)}-{rng.randint(20, 27)}",
+            "execName": f"go{name.replace(' ', '')}",
+            "desc": f"Launch {name} {rng.choice(_WORDS).lower()} version {rng.randint(1, 30)}.{rng.randint(0, 9)}",
+            "icon": f"file:////opt/{name.lower().replace(' ', '')}/icon.png",
+            "tabName": TAB_NAMES[i % len(TAB_NAMES)],
+        }
+        if i % 7 == 0:
+            entry["flags"] = ["--debug"]
+        if i % 11 == 0:
+            entry["popup"] = True
+        data[name] = entry
+    return data
+
+
+def write_catalogue(path: Path, size: int, seed: int = 1) -> Path:
+    """
+    Write a synthetic apps.json.
+
+    Args:
+        path: The file to write.
+        size: Number of apps.
+        seed: Random seed.
+
+    Returns:
+        The path written.
+    """
+    path.write_text(json.dumps(synthetic_catalogue(size, seed), indent=2), encoding="utf-8")
+    return path
+
+
+def app_names(data: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Get the app names of a catalogue in file order.
+
+    Args:
+        data: App name to entry.
+
+    Returns:
+        The names.
+    """
+    return list(data)
@@ -0,0 +1,164 @@
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+Flag = Union[str, int, float]
+
+# Shared by every app that sets none of the options.
+_NO_OPTIONS: Mapping = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class AppEntry(Mapping):
+    """
+    One app of the catalogue, immutable and shared by everything that shows or launches it.
+
+    The catalogue creates one entry per app and the tabs, favourites,
+    search index and results hold references to it, nothing copies it.
+    The fields every app has are attributes, the options only some apps set
+    (limits, launch profiles, prefetch lists, ...) are kept as in apps.json
+    in a read-only mapping that apps without any share. Strings other than
+    the description are interned, so the paths, tab names and flags
+    repeated across a catalogue are stored once, and lists are tuples.
+
+    Entries can still be read like the apps.json dictionaries they come
+    from, app["name"] or app.get("limits"), an icon or description that is
+    not set reads as a missing key.
+    """
+
+    name: str
+    path: str
+    execName: str
+    tabName: str
+    desc: Optional[str] = None
+    icon: Optional[str] = None
+    popup: bool = False
+    flags: Tuple[Flag, ...] = ()
+    options: Mapping = field(default=_NO_OPTIONS, hash=False, repr=False)
+
+    @classmethod
+    def from_json(cls, name: str, entry: Mapping) -> "AppEntry":
+        """
+        Create an entry from apps.json.
+
+        Args:
+            name: The app name, its key in apps.json.
+            entry: The app's entry.
+
+        Returns:
+            The entry.
+
+        Raises:
+            KeyError: If it has no tabName.
+        """
+        options = None
+        if entry.keys() - _FIELD_NAMES:
+            options = {key: value for key, value in entry.items() if key not in _FIELD_NAMES and value is not None}
+        desc = entry.get("desc")
+        flags = entry.get("flags")
+        return cls(
+            sys.intern(str(name)),
+            _intern(entry.get("path", "")),
+            _intern(entry.get("execName", "")),
+            _intern(entry["tabName"]),
+            # descriptions are free text, seldom repeated and not worth a place in the interned strings
+            None if desc is None else str(desc),
+            _intern(entry.get("icon")),
+            # older catalogues wrote it as the string "true"
+            entry.get("popup", False) in (True, "true"),
+            tuple(map(_freeze, flags)) if flags else (),
+            _freeze(options) if options else _NO_OPTIONS,
+        )
+
+    @classmethod
+    def from_row(cls, row: Tuple[Any, ...]) -> "AppEntry":
+        """
+        Create an entry from a row made by to_row.
+
+        Args:
+            row: The field values in order.
+
+        Returns:
+            The entry.
+        """
+        options = row[-1]
+        return cls(*row[:-1], _freeze(options) if options else _NO_OPTIONS)
+
+    def to_row(self) -> Tuple[Any, ...]:
+        """
+        Get the field values in order, for the compiled catalogue cache.
+
+        marshal keeps the strings interned and writes repeated ones once.
+
+        Returns:
+            A tuple of plain values, the options as a dictionary or None.
+        """
+        return (*(getattr(self, name) for name in _FIELD_ORDER[:-1]), _thaw(self.options, False) or None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the entry as an apps.json style dictionary, e.g. for QML or JSON output.
+
+        Returns:
+            A new dictionary of what is set, with "name" and lists rather than tuples.
+        """
+        return {key: _thaw(value, True) for key, value in self._items()}
+
+    def _items(self) -> Iterator[Tuple[str, Any]]:
+        for name in _FIELD_ORDER[:-1]:
+            value = getattr(self, name)
+            if value is not None:
+                yield name, value
+        yield from self.options.items()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_NAMES:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        return self.options[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key) if key in _FIELD_NAMES else self.options.get(key)
+        return default if value is None else value
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_NAMES:
+            return getattr(self, key) is not None  # type: ignore[arg-type]
+        return key in self.options
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self._items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._items())
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({sys.intern(str(key)): _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any, lists: bool) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item, lists) for key, item in value.items()}
+    if lists and isinstance(value, tuple):
+        return [_thaw(item, lists) for item in value]
+    return value
+
+
+_FIELD_ORDER: Tuple[str, ...] = tuple(f.name for f in fields(AppEntry))
+# the keys read from the fields rather than the options, "options" itself is not an apps.json key
+_FIELD_NAMES = frozenset(_FIELD_ORDER[:-1])
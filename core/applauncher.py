@@ -1,13 +1,59 @@
-import re
-import shutil
-import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from PySide6.QtCore import Property, QFile, QObject, QSettings, Signal, Slot
+from PySide6.QtCore import Property, QCoreApplication, QFile, QObject, QSettings, QTimer, Signal, Slot
 
 import resources_rc  # noqa: F401 qt resource
+from core.appentry import AppEntry
+from core.catalogue import CatalogueDiff, CatalogueRegistry, diff_catalogues, save_catalogue
+from core.cataloguewatcher import DEFAULT_DEBOUNCE_MS, DEFAULT_POLL_INTERVAL_S, CatalogueWatcher
+from core.debuglog import (
+    DEFAULT_FLUSH_INTERVAL_MS,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_LINES,
+    DebugLogModel,
+    LogPipeline,
+)
+from core.favourites import Favourites, favourite_names
+from core.helpindex import HelpIndex
+from core.iconprovider import DEFAULT_MEMORY_CACHE_SIZE as DEFAULT_ICON_MEMORY_CACHE_SIZE
+from core.iconprovider import DEFAULT_PLACEHOLDER_AFTER_MS, AppIconProvider, IconCache
+from core.instance import Command
+from core.launch import app_command, find_app, launch_command
+from core.metrics import FirstWindowTimer, Metrics, MetricsServer
+from core.models import AppListModel, TabsModel
+from core.outputreader import create_output_reader
+from core.paths import cache_dir
+from core.prefetch import DEFAULT_DELAY_S as DEFAULT_PREFETCH_DELAY_S
+from core.prefetch import DEFAULT_RATE_MB_S as DEFAULT_PREFETCH_RATE_MB_S
+from core.prefetch import Prefetcher
+from core.prober import DEFAULT_TIMEOUT as DEFAULT_PROBE_TIMEOUT
+from core.prober import DEFAULT_TTL_S, Prober, ProbeResult, broken_icons, executable_path, unavailable_apps
+from core.probeservice import ProbeService
+from core.profiles import DEFAULT_SETUP_TIMEOUT_S, EnvironmentCache, LaunchSpec, resolve_launch
+from core.quota import DEFAULT_MOUNTS, create_providers
+from core.quotaservice import DEFAULT_REFRESH_INTERVAL_S, QuotaService
+from core.scheduler import (
+    DEFAULT_DEBOUNCE_S,
+    DEFAULT_MAX_RUNNING,
+    DEFAULT_MIN_AVAILABLE_MB,
+    DEFAULT_QUEUE_TIMEOUT_S,
+    FOCUS,
+    LAUNCH,
+    QUEUE,
+    LaunchScheduler,
+    resource_prefix,
+)
+from core.search import SearchIndex
+from core.searchworker import AsyncSearcher
+from core.settings import SETTINGS_APPLICATION, SETTINGS_ORGANIZATION
+from core.supervisor import ProcessSupervisor
+from core.usage import DEFAULT_HALF_LIFE_DAYS, DEFAULT_RECENT_LIMIT, RECENT_TAB, UsageStore
+from core.windows import focus_session
 
 
 class AppLauncher(QObject):
@@ -16,26 +62,220 @@ class AppLauncher(QObject):
     and search for apps. It exposes slots for QML integration.
     """
 
+    SEARCH_RESULT_LIMIT = 50
+    # rapid changes such as dragging a favourite are written to QSettings once they settle
+    SETTINGS_SAVE_DELAY_MS = 500
+    # how often queued launches check for memory or a free slot
+    LAUNCH_QUEUE_POLL_MS = 2000
+    # icons that arrive late are reloaded together
+    ICON_RELOAD_DELAY_MS = 100
+
     favourites_changed = Signal()
-    debug_output = Signal(str)
+    apps_changed = Signal()
     status_changed = Signal(str)
     theme_changed = Signal(str)
+    disk_quotas_changed = Signal()
+    availability_changed = Signal()
+    # raised by commands from later invocations, see handle_command
+    show_requested = Signal()
+    search_requested = Signal(str)
+    icon_revisions_changed = Signal()
+    # an icon decoded after its placeholder was shown, from a decoding thread
+    _icon_late = Signal(str)
+    # a launch waiting for its setup script's environment, see _start
+    _profile_resolved = Signal(object)
 
-    def __init__(self, apps_by_tab: List[Dict[str, Any]]) -> None:
+    def __init__(
+        self,
+        apps_by_tab: List[Dict[str, Any]],
+        search_index: Optional[SearchIndex] = None,
+        catalogue_path: Optional[str] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
         """
         Initialize the AppLauncher.
 
         Args:
             apps_by_tab: List of dictionaries, each representing a tab with its apps.
+            search_index: A prebuilt index of apps_by_tab, e.g. from the catalogue cache.
+            catalogue_path: The apps.json the catalogue came from, watched and reloaded when it changes.
+            metrics: Where operation timings are recorded, e.g. shared with the start up trace.
         """
         super().__init__()
-        self._apps_by_tab: List[Dict[str, Any]] = apps_by_tab
-        self._settings: QSettings = QSettings("YourCompany", "AppLauncher")
-        self._favourites: List[Dict[str, Any]] = self._load_favourites()
-        self._disk_quotas: List[Dict[str, Union[float, str]]] = []
-        self._create_disk_quotas()
+        self._metrics: Metrics = metrics or Metrics()
+        self._catalogue: CatalogueRegistry = CatalogueRegistry(apps_by_tab)
+        if search_index is None:
+            # built off the GUI thread so the window can show while it is indexed
+            search_index = SearchIndex()
+            search_index.rebuild_in_background(apps_by_tab)
+        self._search_index: SearchIndex = search_index
+        self._search_results: AppListModel = AppListModel(self)
+        self._searcher: AsyncSearcher = AsyncSearcher(
+            self._search_index, self._search_results, self.SEARCH_RESULT_LIMIT, metrics=self._metrics, parent=self
+        )
+        self._settings: QSettings = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        stored_favourites = self._settings.value("user/favourites", [])
+        self._favourites: Favourites = Favourites(favourite_names(stored_favourites))
+        self._favourites_save_timer = QTimer(self)
+        self._favourites_save_timer.setSingleShot(True)
+        self._favourites_save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._favourites_save_timer.timeout.connect(self._flush_favourites)
+        if stored_favourites and stored_favourites != self._favourites.names():
+            # stored by an older version as copies of the app entries
+            self._save_favourites()
+        # persistent models so QML only sees the rows that change
+        self._favourites_model: AppListModel = AppListModel(self)
+        self._favourites_model.set_apps(self._favourite_apps())
+        # launches are logged locally, their frecency fills the Recent & Frequent tab and breaks ties in search,
+        # the tab is there from the start and filled once the history is opened, see _start_services
+        self._usage: Optional[UsageStore] = None
+        self._recent_model: Optional[AppListModel] = None
+        self._recent_limit = int(self._settings.value("usage/recent_limit", DEFAULT_RECENT_LIMIT))
+        # pid -> launch id, to record how long each launched app ran
+        self._launch_ids: Dict[int, int] = {}
+        pinned = []
+        if self._settings.value("usage/enabled", True) in (True, "true"):
+            self._recent_model = AppListModel(self)
+            pinned.append((RECENT_TAB, self._recent_model))
+        self._tabs_model: TabsModel = TabsModel(self._favourites_model, self, pinned)
+        self._tabs_model.set_tabs(apps_by_tab)
+        # the services the first frame does not need are created once the event loop runs, see _start_services
+        self._services_started = False
+        self._quota_service: Optional[QuotaService] = None
+        self._environments: Optional[EnvironmentCache] = None
+        self._probe_service: Optional[ProbeService] = None
+        self._prefetcher: Optional[Prefetcher] = None
+        self._catalogue_path = catalogue_path
+        self._catalogue_watcher: Optional[CatalogueWatcher] = None
+        self._metrics_server: Optional[MetricsServer] = None
         self._theme: str = str(self._settings.value("user/theme", "System"))  # Default to System
         self._debug_dialogs: List[Any] = []
+        max_lines = int(self._settings.value("debug/max_lines", DEFAULT_MAX_LINES))
+        self._debug_log: DebugLogModel = DebugLogModel(max_lines, self)
+        self._log_pipeline: LogPipeline = LogPipeline(
+            self._debug_log,
+            max_lines=max_lines,
+            max_bytes=int(self._settings.value("debug/max_bytes", DEFAULT_MAX_BYTES)),
+            flush_interval_ms=int(self._settings.value("debug/flush_interval_ms", DEFAULT_FLUSH_INTERVAL_MS)),
+            parent=self,
+        )
+        self._supervisor: ProcessSupervisor = ProcessSupervisor(self)
+        # "eventloop" multiplexes every child's pipes on the Qt event loop, "threads" is the fallback
+        self._output_reader = create_output_reader(str(self._settings.value("debug/io_engine", "eventloop")), self)
+        self._supervisor.process_exited.connect(self._on_process_exited)
+        # apps launched from the catalogue go through the scheduler, see launch_by_name
+        self._scheduler = LaunchScheduler(
+            max_running=int(self._settings.value("launch/max_running", DEFAULT_MAX_RUNNING)),
+            min_available_mb=float(self._settings.value("launch/min_available_mb", DEFAULT_MIN_AVAILABLE_MB)),
+            debounce_s=float(self._settings.value("launch/debounce_s", DEFAULT_DEBOUNCE_S)),
+            queue_timeout_s=float(self._settings.value("launch/queue_timeout_s", DEFAULT_QUEUE_TIMEOUT_S)),
+            focus_existing=self._settings.value("launch/focus_existing", False) in (True, "true"),
+        )
+        self._default_nice = int(self._settings.value("launch/nice", 0))
+        self._profile_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="profile")
+        self._profile_resolved.connect(self._on_profile_resolved)
+        self._queue_status = ""
+        self._launch_queue_timer = QTimer(self)
+        self._launch_queue_timer.setInterval(self.LAUNCH_QUEUE_POLL_MS)
+        self._launch_queue_timer.timeout.connect(self._drain_launch_queue)
+        self._unavailable: Dict[str, str] = {}
+        self._broken_icons: Dict[str, bool] = {}
+        # icons are decoded and scaled off the GUI thread and served as image://appicon/<name>
+        self._icon_cache = IconCache(
+            self._icon_source,
+            thumbnail_dir=cache_dir() / "icons",
+            memory_cache_size=int(self._settings.value("icons/memory_cache_size", DEFAULT_ICON_MEMORY_CACHE_SIZE)),
+            on_late=self._icon_late.emit,
+        )
+        self._icon_revisions: Dict[str, int] = {}
+        self._icon_reload_timer = QTimer(self)
+        self._icon_reload_timer.setSingleShot(True)
+        self._icon_reload_timer.setInterval(self.ICON_RELOAD_DELAY_MS)
+        self._icon_reload_timer.timeout.connect(self.icon_revisions_changed)
+        self._icon_late.connect(self._reload_icons)
+        # one thread polls wmctrl for every app still starting, off to never run wmctrl at all
+        self._window_timer: Optional[FirstWindowTimer] = None
+        if self._settings.value("metrics/first_window", True) in (True, "true"):
+            self._window_timer = FirstWindowTimer(
+                lambda exec_name, seconds: self._metrics.observe("launch.first_window", seconds, app=exec_name)
+            )
+        self._help: Optional[HelpIndex] = None
+        self._help_lock = threading.Lock()
+        QTimer.singleShot(0, self._start_services)
+
+    def _start_services(self) -> None:
+        """
+        Open the launch history and start the background services once the event loop is running.
+
+        None of them is needed for the first frame and each reads files in
+        the cache dir, often on an NFS home, so they are left until the
+        window is up. A launch that comes first, e.g. from --launch, starts
+        them itself.
+        """
+        if self._services_started:
+            return
+        self._services_started = True
+        if self._recent_model is not None:
+            self._usage = UsageStore(
+                cache_dir() / "usage.db",
+                half_life_days=float(self._settings.value("usage/half_life_days", DEFAULT_HALF_LIFE_DAYS)),
+            )
+            self._search_index.set_boosts(self._usage.frecency())
+            self._recent_model.set_apps(self._recent_apps())
+        mounts = self._settings.value("quota/mounts", DEFAULT_MOUNTS)
+        self._quota_service = QuotaService(
+            create_providers([mounts] if isinstance(mounts, str) else list(mounts)),
+            refresh_interval_s=int(self._settings.value("quota/refresh_interval_s", DEFAULT_REFRESH_INTERVAL_S)),
+            parent=self,
+        )
+        self._quota_service.quotas_changed.connect(self.disk_quotas_changed)
+        self._quota_service.start()
+        self.disk_quotas_changed.emit()
+        # what each app's setup script puts in the environment, captured once and reused until the script changes
+        self._environments = EnvironmentCache(
+            cache_dir() / "environments.json",
+            timeout=float(self._settings.value("launch/setup_timeout_s", DEFAULT_SETUP_TIMEOUT_S)),
+        )
+        # every executable and icon is stat'ed off the GUI thread, a hung mount only delays the report
+        probe_ttl_s = int(self._settings.value("probe/ttl_s", DEFAULT_TTL_S))
+        self._probe_service = ProbeService(
+            Prober(
+                timeout=float(self._settings.value("probe/timeout", DEFAULT_PROBE_TIMEOUT)),
+                ttl_s=probe_ttl_s,
+                cache_path=cache_dir() / "probe.json",
+            ),
+            refresh_interval_s=probe_ttl_s,
+            parent=self,
+        )
+        self._probe_service.results_changed.connect(self._on_probe_results)
+        self._probe_service.set_apps(self._catalogue.apps())
+        # off by default, hovering an app or opening a tab reads its files ahead from the network share
+        if self._settings.value("prefetch/enabled", False) in (True, "true"):
+            self._prefetcher = Prefetcher(
+                rate_mb_s=float(self._settings.value("prefetch/rate_mb_s", DEFAULT_PREFETCH_RATE_MB_S)),
+                delay_s=float(self._settings.value("prefetch/delay_s", DEFAULT_PREFETCH_DELAY_S)),
+                learned_path=cache_dir() / "prefetch.json",
+            )
+        if self._catalogue_path is not None:
+            self._catalogue_watcher = CatalogueWatcher(
+                self._catalogue_path,
+                debounce_ms=int(self._settings.value("catalogue/debounce_ms", DEFAULT_DEBOUNCE_MS)),
+                poll_interval_s=int(self._settings.value("catalogue/poll_interval_s", DEFAULT_POLL_INTERVAL_S)),
+                parent=self,
+            )
+            self._catalogue_watcher.catalogue_changed.connect(self._on_catalogue_changed)
+            self._catalogue_watcher.load_failed.connect(self.status_changed)
+        if self._settings.value("metrics/trace", False) in (True, "true"):
+            self._metrics.open_trace(cache_dir() / "trace.jsonl")
+        # off unless a port is set, it only listens on localhost
+        metrics_port = int(self._settings.value("metrics/port", 0))
+        if metrics_port:
+            try:
+                self._metrics_server = MetricsServer(self._metrics, metrics_port)
+            except OSError as e:
+                self.status_changed.emit(f"Metrics endpoint not started on port {metrics_port}: {e}")
+        # so the About dialog opens instantly for the favourites
+        threading.Thread(target=self._prerender_help, name="help-prerender", daemon=True).start()
 
     @Property(str, notify=theme_changed)
     def theme(self) -> str:
@@ -57,91 +297,15 @@ class AppLauncher(QObject):
             self._settings.setValue("user/theme", theme)
             self.theme_changed.emit(theme)
 
-    def _create_disk_quotas(self) -> None:
-        """
-        Populate the disk quotas list with user and transfer quotas.
-        """
-        self._disk_quotas = []
-        user_quota = self._get_user_quota()
-        if user_quota:
-            self._disk_quotas.append(user_quota)
-        transfer_quota = self._get_transfer_usage()
-        if transfer_quota:
-            self._disk_quotas.append(transfer_quota)
-
-    def _parse_size_to_gigabytes(self, value: str) -> float:
-        """Convert quota human-readable sizes to bytes."""
-        value = value.strip()
-        match = re.match(r"([\d.]+)([KMGTP]?)", value)
-        if not match:
-            return 0
-        num, unit = match.groups()
-        num = int(num)
-        unit_multipliers = {
-            "": 1,
-            "K": 1024,
-            "M": 1024**2,
-            "G": 1024**3,
-            "T": 1024**4,
-            "P": 1024**5,
-        }
-        return num * unit_multipliers.get(unit, 1) // (1024**3)
-
-    def _get_user_quota(self) -> Optional[Dict[str, Union[str, int]]]:
-        """
-        Get the user's disk quota.
-
-        Returns:
-            A dictionary with quota information, or None if unavailable.
-        """
-        user = subprocess.getoutput("whoami")
-        try:
-            output = subprocess.check_output(["quota", "-u", "-s", user], text=True)
-            data = output.strip().splitlines()
-            numbers = data[3].split()
-            return {
-                "location": str(Path.home()),
-                "used": self._parse_size_to_gigabytes(numbers[0]),
-                "quota": self._parse_size_to_gigabytes(numbers[1]),
-                "limit": self._parse_size_to_gigabytes(numbers[2]),
-            }
-        except Exception as e:
-            print("Error:", e)
-        return None
-
-    def _get_transfer_usage(self) -> Optional[Dict[str, Union[str, float]]]:
-        """
-        Get the disk usage for the /transfer directory.
-
-        Returns:
-            A dictionary with usage information, or None if unavailable.
-        """
-        gb = 1024**3  # 1 GB in bytes
-        try:
-            usage = shutil.disk_usage("/transfer")
-            return {
-                "location": "/transfer",
-                "limit": round(usage.total / gb, 2),
-                "used": round(usage.used / gb, 2),
-                "quota": round(usage.free / gb, 2),
-            }
-        except FileNotFoundError:
-            return {
-                "location": "/dummydata",
-                "limit": round(50 / gb, 2),
-                "used": round(200 / gb, 2),
-                "quota": round(220 / gb, 2),
-            }
-
-    @Property("QVariantList", constant=True)
+    @Property("QVariantList", notify=disk_quotas_changed)
     def diskQuotas(self) -> List[Dict[str, Union[float, str]]]:
         """
-        Property for disk quotas, exposed to QML.
+        Property for disk quotas, exposed to QML. Updated in the background.
 
         Returns:
             A list of disk quota dictionaries.
         """
-        return self._disk_quotas
+        return [] if self._quota_service is None else self._quota_service.quotas()
 
     @Slot(str, str, "QVariantList", bool)
     def launch_app(
@@ -152,69 +316,536 @@ class AppLauncher(QObject):
         popup: bool = False,
     ) -> None:
         """
-        Launch an application with optional flags and debug popup.
+        Launch an application with optional flags and debug popup, straight away.
+
+        Catalogue apps are launched with launch_by_name so their limits apply.
+
+        Args:
+            path: The directory path to the executable.
+            execName: The name of the executable.
+            flags: Optional list of command-line flags.
+            popup: Whether to show the debug output dialog.
+        """
+        # a catalogue app gets its launch profile and is counted in the launch history
+        app = next((a for a in self._catalogue.apps() if a["path"] == path and a["execName"] == execName), None)
+        if app is not None:
+            self._start(replace(app, flags=tuple(flags or ())), popup, scheduled=False)
+        else:
+            self._spawn(path, execName, flags, popup)
+
+    def _spawn(
+        self,
+        path: str,
+        execName: str,
+        flags: Optional[List[str]] = None,
+        popup: bool = False,
+        prefix: Optional[List[str]] = None,
+        app_name: Optional[str] = None,
+        spec: Optional[LaunchSpec] = None,
+    ) -> Optional[int]:
+        """
+        Start an app under the supervisor and follow its output.
 
         Args:
             path: The directory path to the executable.
             execName: The name of the executable.
             flags: Optional list of command-line flags.
             popup: Whether to show the debug output dialog.
+            prefix: Commands to run it under, e.g. nice.
+            app_name: The catalogue app being launched, recorded in the launch history.
+            spec: The app's resolved launch profile, run instead of path/execName with its environment.
+
+        Returns:
+            The pid, or None if it could not be started.
         """
-        if flags is None:
-            flags = []
-        flags = [str(f) for f in flags]
+        start = time.monotonic()
         try:
-            cmd = [f"{path}/{execName}"] + flags
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+            cmd = launch_command(path, execName, flags)
+            popen_kwargs = self._output_reader.popen_kwargs()
+            if spec is not None:
+                popen_kwargs.update(env=spec.env, cwd=spec.cwd)
+            # the supervisor owns the child and reaps it when it exits
+            proc = self._supervisor.spawn(
+                execName, (prefix or []) + (cmd if spec is None else spec.command), **popen_kwargs
             )
+            self._metrics.observe("launch.spawn", time.monotonic() - start, app=execName)
             if popup:
-                # Emit a signal to QML to open the debug dialog and clear previous output
+                # Clear previous output and emit a signal to QML to open the debug dialog
+                self._debug_log.clear()
                 self.status_changed.emit("show_debug_dialog")
-
-            def read_output() -> None:
-                for line in proc.stdout:
-                    self.debug_output.emit(line.rstrip())
-                proc.stdout.close()
-
-            threading.Thread(target=read_output, daemon=True).start()
+            # lines are coalesced in the ring buffer and flushed to the GUI in batches
+            log = self._log_pipeline.open(execName)
+            log.on_first_line = lambda: self._metrics.observe(
+                "launch.first_output", time.monotonic() - start, app=execName
+            )
+            self._output_reader.watch(proc, log)
+            if self._window_timer is not None:
+                self._window_timer.watch(proc.pid, execName, start)
+            if self._prefetcher is not None:
+                self._prefetcher.learn(cmd[0], proc.pid)
+            if self._usage is not None and app_name is not None:
+                # only queued, the history is written on its own thread
+                self._launch_ids[proc.pid] = self._usage.record_launch(app_name)
+                self._on_usage_changed(app_name)
+            return proc.pid
         except Exception as e:
+            self._metrics.observe("launch.spawn", time.monotonic() - start, error=True, app=execName)
             print(f"Failed to launch: {e}")
+            self.status_changed.emit(f"Failed to launch {execName}: {e}")
+            return None
+
+    @Slot(str, result=bool)
+    def launch_by_name(self, app_name: str) -> bool:
+        """
+        Launch an app from the catalogue by name, called when its icon is clicked.
+
+        The scheduler may start it, queue it until there is memory or a free
+        slot, focus the instance already running, or ignore a repeated click.
+        The outcome is shown on the status bar.
+
+        Args:
+            app_name: The app name, matched without regard to case if there is no exact match.
+
+        Returns:
+            False if there is no such app.
+        """
+        app = find_app(self._catalogue, app_name)
+        if app is None:
+            return False
+        decision = self._scheduler.request(app)
+        if decision.action == LAUNCH:
+            self._start(app)
+            return True
+        self.status_changed.emit(decision.reason)
+        if decision.action == FOCUS and decision.session is not None:
+            threading.Thread(target=focus_session, args=(decision.session,), name="launch-focus", daemon=True).start()
+        elif decision.action == QUEUE:
+            self._queue_status = ""
+            self._launch_queue_timer.start()
+        return True
+
+    @Slot(str)
+    def cancel_queued_launch(self, app_name: str) -> None:
+        """
+        Stop waiting to launch an app.
+
+        Args:
+            app_name: The app name.
+        """
+        if self._scheduler.cancel(app_name):
+            self.status_changed.emit(f"{app_name} will not be started")
+            if not self._scheduler.queued():
+                self._launch_queue_timer.stop()
+
+    def _start(self, app: AppEntry, popup: Optional[bool] = None, scheduled: bool = True) -> None:
+        """
+        Launch a catalogue app with its launch profile.
+
+        An app with a setup script is started once the environment the
+        script sets up is known. That is cached, but the first launch after
+        the script changes has to source it, so it is resolved on a worker
+        thread.
+
+        Args:
+            app: The app dictionary.
+            popup: Whether to show the debug output dialog, the app's "popup" by default.
+            scheduled: The launch went through the scheduler, so it runs under the app's
+                resource limits and is counted as running.
+        """
+        # the launch history and setup script environments are needed from here on
+        self._start_services()
+        popup = bool(app.get("popup")) if popup is None else popup
+        # counted against the app's limits from now on, not only once its setup script is sourced
+        reservation = self._scheduler.reserve(app["name"]) if scheduled else None
+        if app.get("setupScript"):
+            start = time.monotonic()
+            future = self._profile_executor.submit(resolve_launch, app, (), self._environments)
+            future.add_done_callback(lambda f: self._profile_resolved.emit((app, popup, reservation, start, f)))
+            return
+        self._start_resolved(app, popup, reservation, resolve_launch(app))
+
+    def _on_profile_resolved(self, resolved: Any) -> None:
+        """
+        Start an app whose setup script environment was resolved on the worker thread.
+
+        Args:
+            resolved: A tuple of (app, popup, the scheduler reservation, the time.monotonic() it was requested,
+                the future).
+        """
+        app, popup, reservation, start, future = resolved
+        if future.cancelled():
+            if reservation is not None:
+                self._scheduler.release(reservation)
+            return
+        self._metrics.observe("launch.profile", time.monotonic() - start, app=app["execName"])
+        error = future.exception()
+        # the wrapper sets up its own environment, so it still starts the app if the profile failed
+        spec = future.result() if error is None else LaunchSpec(app_command(app), warning=f"{app['name']}: {error}")
+        self._start_resolved(app, popup, reservation, spec)
+
+    def _start_resolved(self, app: AppEntry, popup: bool, reservation: Optional[int], spec: LaunchSpec) -> None:
+        """
+        Launch a catalogue app whose launch profile is resolved.
+
+        Args:
+            app: The app dictionary.
+            popup: Whether to show the debug output dialog.
+            reservation: The scheduler's reservation for the launch, None to run it without its resource
+                limits and not count it.
+            spec: The command, environment and working directory.
+        """
+        if spec.warning:
+            self.status_changed.emit(spec.warning)
+        pid = self._spawn(
+            app["path"],
+            app["execName"],
+            app.get("flags") or [],
+            popup,
+            resource_prefix(app, self._default_nice) if reservation is not None else None,
+            app["name"],
+            spec,
+        )
+        if reservation is None:
+            return
+        if pid is None:
+            self._scheduler.release(reservation)
+        else:
+            self._scheduler.started(app["name"], pid, reservation)
+
+    def _drain_launch_queue(self) -> None:
+        """
+        Start the next queued launch that can go, and show what is still waiting.
+        """
+        app, expired = self._scheduler.due()
+        for queued in expired:
+            self.status_changed.emit(f"Gave up waiting to start {queued.app['name']}, {queued.reason}")
+        if app is not None:
+            self.status_changed.emit(f"Starting {app['name']}")
+            self._start(app)
+        queued = self._scheduler.queued()
+        if not queued:
+            self._launch_queue_timer.stop()
+            return
+        status = "Waiting to start " + ", ".join(f"{q.app['name']} ({q.reason})" for q in queued)
+        # only repeat the status when it changes, it would hide other messages every poll
+        if status != self._queue_status:
+            self._queue_status = status
+            self.status_changed.emit(status)
+
+    def handle_command(self, command: Command) -> Command:
+        """
+        Carry out a command sent by a later invocation of the launcher.
+
+        Args:
+            command: The command, see core.instance.
+
+        Returns:
+            The reply, with "ok" and "message".
+        """
+        action = command.get("action")
+        if action == "launch":
+            name = str(command.get("name", ""))
+            if not self.launch_by_name(name):
+                return {"ok": False, "message": f"unknown app: {name}"}
+        elif action == "search":
+            self.show_requested.emit()
+            self.search_requested.emit(str(command.get("query", "")))
+        elif action == "show":
+            self.show_requested.emit()
+        elif action == "quit":
+            # quit once the reply has been sent
+            QTimer.singleShot(0, QCoreApplication.quit)
+        elif action != "ping":
+            return {"ok": False, "message": f"unknown action: {action}"}
+        return {"ok": True, "message": ""}
+
+    @Property(QObject, constant=True)
+    def runningApps(self) -> ProcessSupervisor:
+        """
+        Property for the model of launched processes, exposed to QML.
+
+        Returns:
+            The process supervisor, which provides terminate and kill slots.
+        """
+        return self._supervisor
+
+    def _on_process_exited(self, pid: int, exit_code: int) -> None:
+        """
+        Report a child that exited with an error on the status bar.
+
+        Args:
+            pid: The process id.
+            exit_code: The exit code, negative if killed by a signal.
+        """
+        record = self._supervisor.find(pid)
+        if exit_code != 0:
+            name = record.name if record is not None else str(pid)
+            self.status_changed.emit(f"{name} exited with code {exit_code}")
+        launch_id = self._launch_ids.pop(pid, None)
+        if self._usage is not None and launch_id is not None and record is not None:
+            self._usage.record_exit(launch_id, record.wall_time)
+        if self._launch_queue_timer.isActive():
+            # a slot or memory may have been freed
+            self._drain_launch_queue()
+
+    def _on_probe_results(self) -> None:
+        """
+        Update which apps are unavailable or have broken icons from the latest probe.
+        """
+        if self._probe_service is None:
+            return
+        results: Dict[str, ProbeResult] = self._probe_service.results()
+        apps = self._catalogue.apps()
+        unavailable = unavailable_apps(apps, results)
+        broken = dict.fromkeys(broken_icons(apps, results), True)
+        if unavailable != self._unavailable or broken != self._broken_icons:
+            self._unavailable = unavailable
+            self._broken_icons = broken
+            self.availability_changed.emit()
+
+    def icon_provider(self) -> AppIconProvider:
+        """
+        Create the image provider to register with the QML engine as "appicon".
+
+        Returns:
+            The provider, the engine takes ownership of it.
+        """
+        return AppIconProvider(
+            self._icon_cache,
+            placeholder_after_ms=int(self._settings.value("icons/placeholder_after_ms", DEFAULT_PLACEHOLDER_AFTER_MS)),
+        )
+
+    @Property("QVariantMap", notify=icon_revisions_changed)
+    def iconRevisions(self) -> Dict[str, int]:
+        """
+        Get the revision of each app's icon, part of its image URL so QML reloads it when it changes.
+
+        Returns:
+            The revision for every app whose icon was reloaded, keyed by app name.
+        """
+        return self._icon_revisions
+
+    def _icon_source(self, app_name: str) -> Optional[str]:
+        """
+        Look up an app's icon source, called from the icon decoding threads.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The icon as written in apps.json, or None if there is no such app.
+        """
+        app = self._catalogue.app(app_name)
+        return None if app is None else app.get("icon")
+
+    def _reload_icons(self, *app_names: str) -> None:
+        """
+        Make QML request some icons again, shortly so that several are reloaded together.
+
+        Args:
+            *app_names: The apps whose icons changed or have been decoded since their placeholder was shown.
+        """
+        for name in app_names:
+            self._icon_revisions[name] = self._icon_revisions.get(name, 0) + 1
+        if not self._icon_reload_timer.isActive():
+            self._icon_reload_timer.start()
+
+    @Property("QVariantMap", notify=availability_changed)
+    def unavailableApps(self) -> Dict[str, str]:
+        """
+        Property for apps whose executable is missing, exposed to QML.
+
+        Returns:
+            App name to the reason it cannot be launched.
+        """
+        return self._unavailable
+
+    @Property("QVariantMap", notify=availability_changed)
+    def brokenIcons(self) -> Dict[str, bool]:
+        """
+        Property for apps whose icon file does not resolve, exposed to QML.
+
+        Returns:
+            App name to True, so QML can skip loading the icon.
+        """
+        return self._broken_icons
+
+    @Slot(result="QVariantList")
+    def performance_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the latency summary for the Performance panel.
+
+        Returns:
+            One entry per operation (and app for launches) with count, errors and timings in ms.
+        """
+        return self._metrics.snapshot()
+
+    @Slot(result="QVariantList")
+    def usage_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get the launch count and durations of every app launched, also exported by "main.py usage".
+
+        Returns:
+            One entry per app, see core.usage.export_usage, empty if the history is off.
+        """
+        return [] if self._usage is None else self._usage.export()
+
+    @Slot()
+    def reset_performance_stats(self) -> None:
+        """
+        Clear the recorded timings.
+        """
+        self._metrics.reset()
+
+    @Property(str, constant=True)
+    def metricsEndpoint(self) -> str:
+        """
+        Where the Prometheus metrics are served.
+
+        Returns:
+            The URL, or an empty string if the endpoint is off.
+        """
+        if self._metrics_server is None:
+            return ""
+        return f"http://127.0.0.1:{self._metrics_server.port}/metrics"
 
     @Slot(str)
     def emit_debug(self, text: str) -> None:
         """
-        Emit debug output to QML.
+        Add a line of launcher debug output to the debug log.
 
         Args:
-            text: The debug text to emit.
+            text: The debug text to add.
+        """
+        self._debug_log.append_lines("launcher", [(time.time(), "stdout", text)])
+
+    @Property(QObject, constant=True)
+    def debugLog(self) -> DebugLogModel:
+        """
+        Property for the debug output model, exposed to QML.
+
+        Returns:
+            The model holding output from launched processes.
         """
-        self.debug_output.emit(text)
+        return self._debug_log
 
     @Slot(str, result="QVariantList")
     def search_apps(self, query: str) -> List[Dict[str, Any]]:
         """
-        Search for applications whose names contain the query string.
+        Search for applications by name, description, tab and executable name.
 
         Args:
             query: The search query.
 
         Returns:
-            A list of app dictionaries matching the query.
+            A list of app dictionaries matching the query, best match first.
+            searchResults avoids converting the apps for QML.
         """
-        query = query.strip().lower()
-        if not query:
-            return []
-        matches: List[Dict[str, Any]] = []
-        for tab in self._apps_by_tab:
-            for app in tab["apps"]:
-                if query in app["name"].lower():
-                    matches.append(app)
-        return matches
+        with self._metrics.timed("search"):
+            return [app.to_dict() for app in self._search_index.search(query, self.SEARCH_RESULT_LIMIT)]
+
+    @Slot(str)
+    def search_async(self, query: str) -> None:
+        """
+        Search for applications on a worker thread, results are published to searchResults.
+
+        Args:
+            query: The search query, an empty query clears the results.
+        """
+        self._searcher.search(query)
+
+    @Property(QObject, constant=True)
+    def searchResults(self) -> AppListModel:
+        """
+        Property for the search results model, exposed to QML.
+
+        Returns:
+            The model holding the results of the latest search_async call.
+        """
+        return self._search_results
+
+    @Slot()
+    def shutdown(self) -> None:
+        """
+        Stop background work, called when the application is about to quit.
+        """
+        # nothing is started by a pending _start_services after this
+        self._services_started = True
+        if self._favourites_save_timer.isActive():
+            self._flush_favourites()
+        self._settings.sync()
+        self._searcher.shutdown()
+        if self._catalogue_watcher is not None:
+            self._catalogue_watcher.shutdown()
+        self._output_reader.shutdown()
+        if self._quota_service is not None:
+            self._quota_service.shutdown()
+        if self._probe_service is not None:
+            self._probe_service.shutdown()
+        self._launch_queue_timer.stop()
+        self._profile_executor.shutdown(wait=False, cancel_futures=True)
+        self._icon_cache.shutdown()
+        self._supervisor.shutdown()
+        if self._usage is not None:
+            self._usage.close()
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+        if self._metrics_server is not None:
+            self._metrics_server.shutdown()
+        if self._window_timer is not None:
+            self._window_timer.shutdown()
+        self._metrics.close_trace()
+
+    def set_apps(
+        self, apps_by_tab: List[Dict[str, Any]], on_indexed: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ) -> CatalogueDiff:
+        """
+        Replace the app catalogue, only the apps that changed are updated in the models and search index.
+
+        Args:
+            apps_by_tab: List of dictionaries, each representing a tab with its apps.
+            on_indexed: Called on a background thread with the new tabs once the search index is updated.
+
+        Returns:
+            What changed, nothing is updated if it is empty.
+        """
+        apps_by_tab, diff = diff_catalogues(self._catalogue.tabs(), apps_by_tab)
+        if not diff:
+            return diff
+        self._catalogue.set_tabs(apps_by_tab)
+        # the old index keeps answering searches until the new one is swapped in
+        self._search_index.update_in_background(
+            apps_by_tab, None if on_indexed is None else lambda: on_indexed(apps_by_tab)
+        )
+        self._tabs_model.set_tabs(apps_by_tab)
+        # favourites are stored by name, so they pick up the new entries
+        self._favourites_model.set_apps(self._favourite_apps())
+        if self._recent_model is not None:
+            self._recent_model.set_apps(self._recent_apps())
+        if self._probe_service is not None:
+            self._probe_service.set_apps(self._catalogue.apps())
+        if diff.changed:
+            self._reload_icons(*diff.changed)
+        self.apps_changed.emit()
+        return diff
+
+    def _on_catalogue_changed(self, loaded: Any) -> None:
+        """
+        Apply a reloaded apps.json and cache it once it is indexed.
+
+        Args:
+            loaded: A tuple of (apps by tab, stat, sha256) from the catalogue watcher.
+        """
+        apps_by_tab, stat, digest = loaded
+
+        def save(indexed: List[Dict[str, Any]]) -> None:
+            # skipped if a later reload has already replaced these tabs, it saves its own
+            if self._catalogue.tabs() is indexed:
+                save_catalogue(self._catalogue_path, stat, digest, indexed, self._search_index)
+
+        diff = self.set_apps(apps_by_tab, save)
+        if diff:
+            self.status_changed.emit(f"Apps updated: {diff.summary()}")
 
     @Slot(int, int)
     def move_favourite(self, from_index: int, to_index: int) -> None:
@@ -225,11 +856,12 @@ class AppLauncher(QObject):
             from_index: The current index of the favourite.
             to_index: The new index to move to.
         """
-        if 0 <= from_index < len(self._favourites) and 0 <= to_index < len(self._favourites):
-            fav = self._favourites.pop(from_index)
-            self._favourites.insert(to_index, fav)
-            self._save_favourites()
-            self.favourites_changed.emit()
+        shown = self._favourites_model.apps()
+        if 0 <= from_index < len(shown) and 0 <= to_index < len(shown):
+            if self._favourites.move(shown[from_index]["name"], shown[to_index]["name"]):
+                self._favourites_model.move(from_index, to_index)
+                self._save_favourites()
+                self.favourites_changed.emit()
 
     @Slot(str)
     def add_to_favourites(self, appName: str) -> None:
@@ -239,19 +871,10 @@ class AppLauncher(QObject):
         Args:
             appName: The name of the application to add.
         """
-        for fav in self._favourites:
-            if fav["name"] == appName:
-                return
-        for tab in self._apps_by_tab:
-            for app in tab["apps"]:
-                if app["name"] == appName:
-                    # Ensure flags is always present
-                    app_copy = dict(app)
-                    app_copy["flags"] = list(app.get("flags", []))
-                    self._favourites.append(app_copy)
-                    self._save_favourites()
-                    self.favourites_changed.emit()
-                    return
+        if appName in self._catalogue and self._favourites.add(appName):
+            self._favourites_model.set_apps(self._favourite_apps())
+            self._save_favourites()
+            self.favourites_changed.emit()
 
     @Slot(str)
     def remove_from_favourites(self, appName: str) -> None:
@@ -261,66 +884,112 @@ class AppLauncher(QObject):
         Args:
             appName: The name of the application to remove.
         """
-        for fav in self._favourites:
-            if fav["name"] == appName:
-                self._favourites.remove(fav)
-                self._save_favourites()
-                self.favourites_changed.emit()
-                return
+        if self._favourites.remove(appName):
+            self._favourites_model.set_apps(self._favourite_apps())
+            self._save_favourites()
+            self.favourites_changed.emit()
+
+    @Slot(str)
+    def prefetch_app(self, app_name: str) -> None:
+        """
+        Read an app's files ahead, called when the pointer rests on its icon.
+
+        The launcher script is prefetched along with the app's "prefetch"
+        list from apps.json and the files it was seen to load before.
+
+        Args:
+            app_name: The app name.
+        """
+        app = self._catalogue.app(app_name)
+        if self._prefetcher is None or app is None:
+            return
+        key = executable_path(app)
+        extra = app.get("prefetch") or []
+        if isinstance(extra, str):
+            extra = [extra]
+        self._prefetcher.request(key, [key, *extra, *self._prefetcher.learned(key)])
+
+    @Slot(str)
+    def cancel_prefetch(self, app_name: str) -> None:
+        """
+        Stop prefetching an app, called when the pointer leaves its icon.
+
+        Args:
+            app_name: The app name.
+        """
+        app = self._catalogue.app(app_name)
+        if self._prefetcher is not None and app is not None:
+            self._prefetcher.cancel(executable_path(app))
+
+    @Slot(str)
+    def prefetch_tab(self, tab_name: str) -> None:
+        """
+        Read the launcher scripts of every app on a tab ahead, called when the tab is opened.
+
+        Only the scripts are read, they are small and a click on any of them
+        then starts without waiting for the share. The larger files are left
+        for prefetch_app.
+
+        Args:
+            tab_name: The tab name.
+        """
+        if self._prefetcher is None:
+            return
+        if tab_name == "Favourites":
+            apps = self._favourite_apps()
+        elif tab_name == RECENT_TAB:
+            apps = self._recent_apps()
+        else:
+            apps = next((tab["apps"] for tab in self._catalogue.tabs() if tab["tabName"] == tab_name), [])
+        if apps:
+            self._prefetcher.request(f"tab:{tab_name}", [executable_path(app) for app in apps])
 
     @Slot(str, str, result=str)
     def get_about_text(self, app_name: str, theme: str) -> str:
         """
-        Load AboutText.md and extract the section for the given app name.
+        Get the help section for the given app name from AboutText.md.
         - In light mode: returns Markdown.
         - In dark mode: returns HTML with yellow links and headings.
         """
-        try:
-            file = QFile(":/help/AboutText.md")
-            if not file.open(QFile.ReadOnly | QFile.Text):
+        with self._metrics.timed("about_text"):
+            help_index = self._help_index()
+            if help_index is None:
                 return "No help available (resource not found)."
-            lines = bytes(file.readAll()).decode("utf-8").splitlines()
-            found = False
-            text = []
-            for line in lines:
-                if found:
-                    if line.strip() == "---":
-                        break
-                    text.append(line)
-                elif app_name in line:
-                    found = True
-                    text.append(line)  # Include the first found line
-            if not text:
-                return "No help available."
-            markdown = "\n".join(text).strip()
-            if theme == "light":
-                return markdown
-            else:
-                # Convert Markdown headings to HTML
-                def heading_repl(match):
-                    hashes, title = match.group(1), match.group(2)
-                    level = min(len(hashes), 6)
-                    return f'<h{level} style="color:#80cbc4;">{title.strip()}</h{level}>'
-
-                html = re.sub(r"^(#{1,6})\s+(.*)$", heading_repl, markdown, flags=re.MULTILINE)
-
-                # Convert Markdown links to yellow HTML links
-                def link_repl(match):
-                    text, url = match.group(1), match.group(2)
-                    return f'<a href="{url}" style="color: #FFD600;">{text}</a>'
-
-                html = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", link_repl, html)
-                # Convert line breaks to <br>
-                html = html.replace("\n", "<br>")
-                return html
-        except Exception as e:
-            return f"Error loading help: {e}"
+            return help_index.render(app_name, theme)
+
+    def _help_index(self) -> Optional[HelpIndex]:
+        """
+        Get the help index, the resource is read and parsed on first use.
+
+        Returns:
+            The help index, or None if the resource is missing.
+        """
+        with self._help_lock:
+            if self._help is None:
+                file = QFile(":/help/AboutText.md")
+                if not file.open(QFile.ReadOnly | QFile.Text):
+                    return None
+                self._help = HelpIndex(bytes(file.readAll()).decode("utf-8"))
+                file.close()
+            return self._help
+
+    def _prerender_help(self) -> None:
+        """
+        Render the help for every favourite in both themes, runs on a background thread.
+        """
+        help_index = self._help_index()
+        if help_index is not None:
+            help_index.prerender(self._favourites.names())
 
     @Slot("QVariant")
     def create_desktop_entry(self, app):
-        # Convert QJSValue to Python dict if needed
+        # QML passes the app name, older callers the app itself
         if hasattr(app, "toVariant"):
             app = app.toVariant()
+        if isinstance(app, str):
+            app = self._catalogue.app(app)
+            if app is None:
+                return
         try:
             icon = app["icon"]
             if icon.startswith("file:///"):
@@ -355,29 +1024,57 @@ Terminal=false
         except Exception as e:
             self.status_changed.emit(f"Failed to create shortcut: {e}")
 
-    def get_tabs_model(self) -> List[Dict[str, Any]]:
+    def get_tabs_model(self) -> TabsModel:
         """
-        Get the model for tabs, including the Favourites tab.
+        Get the model for tabs, including the Favourites and Recent & Frequent tabs.
 
         Returns:
-            A list of tab dictionaries, with Favourites as the first tab.
+            The tabs model, Favourites is the first row, Recent & Frequent the
+            second unless the launch history is off, and each tab's "apps" is an item model.
         """
-        tabs = [{"tabName": "Favourites", "apps": self._favourites}] + self._apps_by_tab
-        return tabs
+        return self._tabs_model
 
-    def _load_favourites(self) -> List[Dict[str, Any]]:
+    def _favourite_apps(self) -> List[AppEntry]:
         """
-        Load the favourites list from QSettings.
+        Get the current catalogue entry of every favourite.
 
         Returns:
-            A list of favourite app dictionaries.
+            The favourite apps, favourites no longer in the catalogue are skipped.
         """
-        favs = self._settings.value("user/favourites", [])
-        # QSettings may return a QVariantList of QVariantMaps, ensure Python dicts and flags
-        return [dict(fav, flags=list(fav.get("flags", []))) for fav in favs] if favs else []
+        return [app for app in map(self._catalogue.app, self._favourites.names()) if app is not None]
+
+    def _recent_apps(self) -> List[AppEntry]:
+        """
+        Get the apps for the Recent & Frequent tab.
+
+        Returns:
+            The catalogue entries of the apps launched most, most recently, apps no longer in the catalogue are skipped.
+        """
+        if self._usage is None:
+            return []
+        names = self._usage.top(self._recent_limit, include=lambda name: self._catalogue.app(name) is not None)
+        return [app for app in map(self._catalogue.app, names) if app is not None]
+
+    def _on_usage_changed(self, app_name: str) -> None:
+        """
+        Reorder the Recent & Frequent tab and the search tie breaks after a launch.
+
+        Args:
+            app_name: The app that was launched, the only one whose frecency changed.
+        """
+        if self._usage is not None and self._recent_model is not None:
+            self._recent_model.set_apps(self._recent_apps())
+            self._search_index.set_boost(app_name, self._usage.frecency_of(app_name))
 
     def _save_favourites(self) -> None:
         """
-        Save the current favourites list to QSettings.
+        Schedule the favourites to be saved, so a burst of changes is written once.
+        """
+        self._favourites_save_timer.start()
+
+    def _flush_favourites(self) -> None:
+        """
+        Save the favourites to QSettings now, as a list of app names.
         """
-        self._settings.setValue("user/favourites", self._favourites)
+        self._favourites_save_timer.stop()
+        self._settings.setValue("user/favourites", self._favourites.names())
@@ -0,0 +1,476 @@
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from core.appentry import AppEntry
+from core.paths import cache_dir
+
+if TYPE_CHECKING:
+    from core.search import SearchIndex
+
+# Bump when the cached layout or the search index state changes.
+CACHE_VERSION = 3
+
+# File layout: magic, header and apps lengths, then the marshalled header, apps and search index.
+_MAGIC = b"APPSCAT\0"
+_PREFIX = struct.Struct("<8sII")
+
+
+def parse_catalogue(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Normalize the apps and organize them by tab.
+
+    Args:
+        data: The decoded apps.json, app name to entry.
+
+    Returns:
+        A list of tab dictionaries, each containing a list of AppEntry.
+    """
+    tabs: Dict[str, List[AppEntry]] = {}
+    for app_name, entry in data.items():
+        app = AppEntry.from_json(app_name, entry)
+        tabs.setdefault(app.tabName, []).append(app)
+    return [{"tabName": tab, "apps": apps} for tab, apps in tabs.items()]
+
+
+def load_apps_json(json_path: str) -> List[Dict[str, Any]]:
+    """
+    Load applications from a JSON file and organize them by tab.
+
+    Args:
+        json_path: Path to the JSON file.
+
+    Returns:
+        A list of tab dictionaries, each containing a list of apps.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return parse_catalogue(data)
+
+
+@dataclass
+class CatalogueDiff:
+    """
+    What changed between two versions of the catalogue, by app name.
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    # the tabs or the apps within them are in a different order
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.reordered)
+
+    def summary(self) -> str:
+        """
+        Describe the change for the status bar.
+
+        Returns:
+            e.g. "2 added, 1 changed".
+        """
+        parts = [
+            f"{len(names)} {label}"
+            for names, label in ((self.added, "added"), (self.removed, "removed"), (self.changed, "changed"))
+            if names
+        ]
+        if self.reordered and not parts:
+            parts.append("reordered")
+        return ", ".join(parts)
+
+
+def diff_catalogues(
+    old_tabs: List[Dict[str, Any]], new_tabs: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], CatalogueDiff]:
+    """
+    Compare a freshly loaded catalogue with the current one.
+
+    Apps that are unchanged are replaced by the current entries, so
+    the models, which compare apps by identity, only update the rows whose
+    entry really changed.
+
+    Args:
+        old_tabs: The current list of tab dictionaries.
+        new_tabs: The newly loaded list of tab dictionaries.
+
+    Returns:
+        A tuple of (new_tabs reusing the unchanged apps, the differences).
+    """
+    old_apps = {app["name"]: (tab["tabName"], app) for tab in old_tabs for app in tab["apps"]}
+    diff = CatalogueDiff()
+    merged = []
+    for tab in new_tabs:
+        apps = []
+        for app in tab["apps"]:
+            old_tab, old_app = old_apps.get(app["name"], (None, None))
+            if old_app is None:
+                diff.added.append(app["name"])
+            elif old_app == app and old_tab == tab["tabName"]:
+                app = old_app
+            else:
+                diff.changed.append(app["name"])
+            apps.append(app)
+        merged.append({"tabName": tab["tabName"], "apps": apps})
+    new_names = {app["name"] for tab in new_tabs for app in tab["apps"]}
+    diff.removed = [name for name in old_apps if name not in new_names]
+
+    def layout(tabs: List[Dict[str, Any]]) -> List[Tuple[str, List[str]]]:
+        return [(tab["tabName"], [app["name"] for app in tab["apps"]]) for tab in tabs]
+
+    diff.reordered = not (diff.added or diff.removed) and layout(old_tabs) != layout(new_tabs)
+    return merged, diff
+
+
+class CatalogueRegistry:
+    """
+    The loaded catalogue with indexes for looking apps up by name.
+
+    App names are the keys of apps.json, so they are unique and stable
+    across reloads and are used as the app IDs everywhere else, e.g. by
+    the favourites.
+    """
+
+    def __init__(self, apps_by_tab: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            apps_by_tab: List of tab dictionaries, each with "tabName" and "apps".
+        """
+        self._tabs: List[Dict[str, Any]] = []
+        self._by_name: Dict[str, AppEntry] = {}
+        self._tab_of: Dict[str, str] = {}
+        self.set_tabs(apps_by_tab or [])
+
+    def __contains__(self, app_name: object) -> bool:
+        return app_name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def set_tabs(self, apps_by_tab: List[Dict[str, Any]]) -> None:
+        """
+        Replace the catalogue and rebuild the indexes.
+
+        Args:
+            apps_by_tab: List of tab dictionaries, each with "tabName" and "apps".
+        """
+        self._tabs = apps_by_tab
+        self._by_name = {}
+        self._tab_of = {}
+        for tab in apps_by_tab:
+            for app in tab["apps"]:
+                self._by_name[app["name"]] = app
+                self._tab_of[app["name"]] = tab["tabName"]
+
+    def tabs(self) -> List[Dict[str, Any]]:
+        """
+        Get the catalogue grouped by tab.
+
+        Returns:
+            The list of tab dictionaries.
+        """
+        return self._tabs
+
+    def apps(self) -> List[AppEntry]:
+        """
+        Get every app in the catalogue.
+
+        Returns:
+            The entries in tab order.
+        """
+        return list(self._by_name.values())
+
+    def app(self, app_name: str) -> Optional[AppEntry]:
+        """
+        Look an app up by name.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The entry, or None if there is no such app.
+        """
+        return self._by_name.get(app_name)
+
+    def tab_of(self, app_name: str) -> Optional[str]:
+        """
+        Look up which tab an app is on.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The tab name, or None if there is no such app.
+        """
+        return self._tab_of.get(app_name)
+
+
+def default_cache_path(json_path: str) -> Path:
+    """
+    Get where the compiled cache for a catalogue is kept, one file per source path.
+
+    Args:
+        json_path: Path to the JSON file.
+
+    Returns:
+        A path in the user cache directory.
+    """
+    key = hashlib.sha1(os.path.abspath(json_path).encode("utf-8")).hexdigest()[:16]
+    return cache_dir() / f"catalogue-{key}.bin"
+
+
+def _build_key() -> Dict[str, Any]:
+    # marshal's format can change between Python versions and the index arrays are native endian
+    return {"version": CACHE_VERSION, "python": tuple(sys.version_info[:2]), "byteorder": sys.byteorder}
+
+
+def _header(stat: os.stat_result, digest: str) -> Dict[str, Any]:
+    return dict(_build_key(), mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=digest)
+
+
+def _read_source(json_path: str) -> Tuple[bytes, os.stat_result]:
+    with open(json_path, "rb") as f:
+        return f.read(), os.fstat(f.fileno())
+
+
+def read_catalogue(json_path: str) -> Tuple[List[Dict[str, Any]], os.stat_result, str]:
+    """
+    Read and parse the source catalogue, skipping the cache.
+
+    Args:
+        json_path: Path to the JSON file.
+
+    Returns:
+        A tuple of (apps by tab, the file's stat, sha256 of its contents).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not valid JSON.
+    """
+    source, stat = _read_source(json_path)
+    return parse_catalogue(json.loads(source)), stat, hashlib.sha256(source).hexdigest()
+
+
+def save_catalogue(
+    json_path: str,
+    stat: os.stat_result,
+    digest: str,
+    apps_by_tab: List[Dict[str, Any]],
+    index: "SearchIndex",
+    cache_path: Optional[Path] = None,
+) -> None:
+    """
+    Cache a catalogue read with read_catalogue, call it once the index is built.
+
+    Args:
+        json_path: Path to the JSON file.
+        stat: The stat of the source the apps were read from.
+        digest: The sha256 of the source.
+        apps_by_tab: The apps by tab.
+        index: The search index of the apps.
+        cache_path: Where the compiled catalogue is kept, defaults to the user cache dir.
+    """
+    write_cache(cache_path or default_cache_path(json_path), _header(stat, digest), apps_by_tab, index.state())
+
+
+def read_cache(
+    cache_path: Path,
+) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], Callable[[], Dict[str, Any]], Callable[[], None]]]:
+    """
+    Read a compiled catalogue.
+
+    The file is memory-mapped and only the header and apps are decoded here,
+    the search index is decoded from the mapping when load_index is called,
+    normally on a background thread, straight from the mapping without
+    copying it. The mapping stays valid if the file is replaced in the
+    meantime, load_index closes it, a caller that will not load the index
+    must call close instead.
+
+    Args:
+        cache_path: The cache file.
+
+    Returns:
+        A tuple of (header, apps by tab, load_index, close), or None if there is no usable cache.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, header_size, tabs_size = _PREFIX.unpack_from(mm)
+        if magic != _MAGIC:
+            raise ValueError("not a catalogue cache")
+        start = _PREFIX.size
+        header = marshal.loads(mm[start : start + header_size])
+        if any(header.get(key) != value for key, value in _build_key().items()):
+            raise ValueError("catalogue cache from another version")
+        start += header_size
+        tabs = [
+            {"tabName": tab["tabName"], "apps": [AppEntry.from_row(row) for row in tab["apps"]]}
+            for tab in marshal.loads(mm[start : start + tabs_size])
+        ]
+        start += tabs_size
+    except (ValueError, EOFError, TypeError, AttributeError, struct.error):
+        mm.close()
+        return None
+
+    def load_index() -> Dict[str, Any]:
+        try:
+            # the views must be released before the mapping can be closed
+            with memoryview(mm) as view, view[start:] as index:
+                return marshal.loads(index)
+        finally:
+            mm.close()
+
+    return header, tabs, load_index, mm.close
+
+
+def write_cache(cache_path: Path, header: Dict[str, Any], tabs: List[Dict[str, Any]], index: Dict[str, Any]) -> None:
+    """
+    Write a compiled catalogue, written to a temporary file and renamed into place.
+
+    Args:
+        cache_path: The cache file.
+        header: Describes the source file the cache was built from.
+        tabs: The normalized apps by tab.
+        index: The search index state.
+    """
+    header_bytes = marshal.dumps(header)
+    # entries as rows of field values, marshal writes each repeated path or tab name once
+    tabs_bytes = marshal.dumps(
+        [{"tabName": tab["tabName"], "apps": [app.to_row() for app in tab["apps"]]} for tab in tabs]
+    )
+    fd, tmp = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREFIX.pack(_MAGIC, len(header_bytes), len(tabs_bytes)))
+            f.write(header_bytes)
+            f.write(tabs_bytes)
+            f.write(marshal.dumps(index))
+        os.replace(tmp, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def _read_valid_cache(
+    json_path: str, cache_path: Path
+) -> Tuple[Optional[Tuple[Any, ...]], os.stat_result, Optional[bytes]]:
+    """
+    Read the compiled catalogue if it still matches the source file.
+
+    Args:
+        json_path: Path to the JSON file.
+        cache_path: The cache file.
+
+    Returns:
+        A tuple of (what read_cache returned or None if it is stale or missing,
+        the source's stat, the source if it had to be read to compare hashes).
+    """
+    stat = os.stat(json_path)
+    cached = read_cache(cache_path)
+    source: Optional[bytes] = None
+    if cached is not None:
+        header, close = cached[0], cached[3]
+        valid = header["mtime_ns"] == stat.st_mtime_ns and header["size"] == stat.st_size
+        if not valid and header["size"] == stat.st_size:
+            source, stat = _read_source(json_path)
+            valid = hashlib.sha256(source).hexdigest() == header["sha256"]
+        if not valid:
+            # not kept open while save_catalogue replaces the file
+            close()
+            cached = None
+    return cached, stat, source
+
+
+def load_apps(json_path: str, cache_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """
+    Load only the apps, from the local cache when it is still valid, without a search index.
+
+    For one-shot use that does not search, such as listing the apps from
+    the command line. Nothing is built or cached, the next load_catalogue
+    does that.
+
+    Args:
+        json_path: Path to the JSON file.
+        cache_path: Where the compiled catalogue is kept, defaults to the user cache dir.
+
+    Returns:
+        List of tab dictionaries, each with "tabName" and "apps".
+    """
+    cached, _, source = _read_valid_cache(json_path, cache_path or default_cache_path(json_path))
+    if cached is not None:
+        _, apps_by_tab, _, close = cached
+        close()
+        return apps_by_tab
+    if source is not None:
+        return parse_catalogue(json.loads(source))
+    return load_apps_json(json_path)
+
+
+def load_catalogue(
+    json_path: str, cache_path: Optional[Path] = None, background: bool = True
+) -> Tuple[List[Dict[str, Any]], "SearchIndex"]:
+    """
+    Load the catalogue and its search index, from the local cache when it is still valid.
+
+    The cache is valid when the source file's mtime and size are unchanged,
+    or when only the mtime changed (e.g. the file was copied again) and its
+    hash still matches. The apps are decoded straight away and the index is
+    restored in the background. Otherwise the source is read once, parsed,
+    and the index is built in the background and cached once it is ready.
+
+    Args:
+        json_path: Path to the JSON file, usually on a slow shared file system.
+        cache_path: Where the compiled catalogue is kept, defaults to the user cache dir.
+        background: False to have the index ready and cached before returning,
+            for one-shot use such as the command line.
+
+    Returns:
+        A tuple of (apps by tab, search index).
+    """
+    # only loaded by what searches, the command line lists apps without it
+    from core.search import SearchIndex
+
+    cache_path = cache_path or default_cache_path(json_path)
+    cached, stat, source = _read_valid_cache(json_path, cache_path)
+    if cached is not None:
+        header, apps_by_tab, load_index, _ = cached
+        index = SearchIndex()
+
+        def refresh_header() -> None:
+            # same content with a new mtime, store it so the hash is not needed next time
+            write_cache(cache_path, _header(stat, header["sha256"]), apps_by_tab, index.state())
+
+        stale_mtime = header["mtime_ns"] != stat.st_mtime_ns
+        thread = index.restore_in_background(apps_by_tab, load_index, refresh_header if stale_mtime else None)
+        if not background:
+            thread.join()
+        return apps_by_tab, index
+    if source is None:
+        apps_by_tab, stat, digest = read_catalogue(json_path)
+    else:
+        apps_by_tab = parse_catalogue(json.loads(source))
+        digest = hashlib.sha256(source).hexdigest()
+    index = SearchIndex()
+
+    def save() -> None:
+        save_catalogue(json_path, stat, digest, apps_by_tab, index, cache_path)
+
+    thread = index.rebuild_in_background(apps_by_tab, on_done=save)
+    if not background:
+        thread.join()
+    return apps_by_tab, index
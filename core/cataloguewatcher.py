@@ -0,0 +1,160 @@
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from core.catalogue import read_catalogue
+
+DEFAULT_DEBOUNCE_MS = 500
+DEFAULT_POLL_INTERVAL_S = 30
+
+
+def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size, info.st_ino
+
+
+class CatalogueWatcher(QObject):
+    """
+    Watches apps.json and reloads it in the background when it changes.
+
+    Both the file and its directory are watched, editors and deploy scripts
+    usually save by writing a new file and renaming it over the old one, after
+    which the watch on the old file is gone and only the directory reports the
+    change. Bursts of events are debounced, and a file that has not really
+    changed (same mtime, size and inode, or the same contents) is ignored.
+    inotify does not see writes made by other NFS clients, so the file is
+    also stat'ed on a slow poll as a fallback. The stat and the read are
+    done on a daemon thread, a hung share neither freezes the GUI nor keeps
+    the launcher from quitting.
+    """
+
+    # (apps by tab, stat, sha256) of the new catalogue
+    catalogue_changed = Signal(object)
+    load_failed = Signal(str)
+    _collected = Signal(object)
+
+    def __init__(
+        self,
+        json_path: str,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        poll_interval_s: int = DEFAULT_POLL_INTERVAL_S,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            json_path: Path to the JSON file.
+            debounce_ms: How long the file must be quiet before it is read.
+            poll_interval_s: Seconds between fallback checks, 0 to rely on file system events only.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._path = os.path.abspath(json_path)
+        self._seen: Optional[Tuple[int, int, int]] = None
+        self._digest: Optional[str] = None
+        # a check is running, only touched on the GUI thread
+        self._checking = False
+        self._stopped = False
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.check)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.addPath(os.path.dirname(self._path))
+        self._watcher.fileChanged.connect(self._on_event)
+        self._watcher.directoryChanged.connect(self._on_event)
+        self._poll = QTimer(self)
+        self._poll.setInterval(poll_interval_s * 1000)
+        self._poll.timeout.connect(self.check)
+        if poll_interval_s > 0:
+            self._poll.start()
+        self._collected.connect(self._apply)
+        # the file as it is now is the one the launcher loaded, only note its signature
+        self._start_check(read=False)
+
+    def shutdown(self) -> None:
+        """
+        Stop watching, a read in progress is abandoned.
+        """
+        self._stopped = True
+        self._debounce.stop()
+        self._poll.stop()
+
+    def check(self) -> None:
+        """
+        Read the file on the worker thread if it changed since it was last read.
+        """
+        if self._checking:
+            # looked at again once the running check is done
+            self._debounce.start()
+            return
+        self._start_check(read=True)
+
+    def _start_check(self, read: bool) -> None:
+        self._checking = True
+        threading.Thread(target=self._check, args=(self._seen, read), name="catalogue", daemon=True).start()
+
+    def _check(self, seen: Optional[Tuple[int, int, int]], read: bool) -> None:
+        """
+        Stat the file and read it if it changed, runs on the worker thread.
+
+        Args:
+            seen: The signature of the file last read.
+            read: False to only stat it.
+        """
+        signature = _signature(self._path)
+        outcome: Any = None
+        # missing while it is being replaced, the rename will be reported by the directory
+        if read and signature is not None and signature != seen:
+            try:
+                outcome = read_catalogue(self._path)
+            except Exception as e:
+                outcome = e
+        if not self._stopped:
+            self._collected.emit((signature, read, outcome))
+
+    def _on_event(self, path: str) -> None:
+        """
+        Restart the debounce, called for every change to the file or its directory.
+
+        Args:
+            path: The file or directory that changed.
+        """
+        self._debounce.start()
+
+    def _apply(self, collected: Tuple[Optional[Tuple[int, int, int]], bool, Any]) -> None:
+        """
+        Publish a newly read catalogue on the GUI thread.
+
+        Args:
+            collected: The file signature, whether it was to be read, and the
+                read catalogue, the error reading it or None if it was not read.
+        """
+        signature, read, outcome = collected
+        self._checking = False
+        if self._stopped:
+            return
+        if signature is not None and self._path not in self._watcher.files():
+            # the watch on a file replaced by a rename is gone, watch the new one
+            self._watcher.addPath(self._path)
+        if not read:
+            self._seen = signature
+            return
+        if outcome is None:
+            return
+        self._seen = signature
+        if isinstance(outcome, Exception):
+            # probably caught half written, the rest of the write changes the signature again
+            self.load_failed.emit(f"{os.path.basename(self._path)} could not be read: {outcome}")
+            return
+        apps_by_tab, stat, digest = outcome
+        if digest == self._digest:
+            return
+        self._digest = digest
+        self.catalogue_changed.emit((apps_by_tab, stat, digest))
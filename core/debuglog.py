@@ -0,0 +1,376 @@
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import Property, QAbstractListModel, QByteArray, QModelIndex, QObject, Qt, QTimer, Signal, Slot
+
+DEFAULT_MAX_LINES = 5000
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_MAX_LINE_LENGTH = 2000
+DEFAULT_FLUSH_INTERVAL_MS = 100
+DEFAULT_BATCH_SIZE = 500
+
+# A line of output as (timestamp, stream name, text).
+LogLine = Tuple[float, str, str]
+
+
+def _utf8_size(line: str) -> int:
+    # most output is ASCII, where the length is the size without encoding it
+    return len(line) if line.isascii() else len(line.encode("utf-8", "replace"))
+
+
+class LogRingBuffer:
+    """
+    Bounded, thread safe buffer of output lines for one process.
+
+    The reader side appends lines as they arrive, tagged with the stream they
+    came from and when they were read, and the GUI side drains the ones it
+    has not seen yet. Once the line or byte cap is reached the oldest
+    lines are evicted, lines evicted before they were drained are counted as
+    dropped. Over long lines are cut and counted as truncated.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_line_length: int = DEFAULT_MAX_LINE_LENGTH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_batch: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            source: Label for the lines, usually the app name.
+            max_lines: Maximum number of lines kept.
+            max_bytes: Maximum size of the lines kept, in bytes of UTF-8.
+            max_line_length: Lines longer than this are truncated.
+            batch_size: Number of pending lines that triggers on_batch.
+            on_batch: Called from the writing thread when a batch is pending.
+        """
+        self.source = source
+        self._max_lines = max_lines
+        self._max_bytes = max_bytes
+        self._max_line_length = max_line_length
+        self._batch_size = batch_size
+        self._on_batch = on_batch
+        self._lock = threading.Lock()
+        self._lines: Deque[LogLine] = deque()
+        self._bytes = 0
+        self._first_seq = 0  # sequence number of self._lines[0]
+        self._next_seq = 0
+        self._read_seq = 0  # first sequence number not yet drained
+        self._batch_requested = False
+        self._dropped = 0
+        self._truncated = 0
+        self.closed = False
+        # called once from the writing thread when the first lines arrive, e.g. to time a launch
+        self.on_first_line: Optional[Callable[[], None]] = None
+
+    def append(self, line: str, stream: str = "stdout", timestamp: Optional[float] = None) -> None:
+        """
+        Append a line, called from the reader.
+
+        Args:
+            line: The line without its trailing newline.
+            stream: The stream the line came from, "stdout" or "stderr".
+            timestamp: When the line was read, defaults to now.
+        """
+        self.extend([line], stream, timestamp)
+
+    def extend(self, lines: List[str], stream: str = "stdout", timestamp: Optional[float] = None) -> None:
+        """
+        Append a batch of lines read together, called from the reader.
+
+        Args:
+            lines: The lines without their trailing newlines.
+            stream: The stream the lines came from, "stdout" or "stderr".
+            timestamp: When the lines were read, defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        limit = self._max_line_length
+        truncated = sum(1 for line in lines if len(line) > limit)
+        if truncated:
+            # the caller's list is left as it is
+            lines = [line if len(line) <= limit else line[:limit] + " [truncated]" for line in lines]
+        notify = False
+        with self._lock:
+            self._truncated += truncated
+            for line in lines:
+                self._lines.append((timestamp, stream, line))
+                self._bytes += _utf8_size(line)
+            self._next_seq += len(lines)
+            while len(self._lines) > self._max_lines or (self._bytes > self._max_bytes and len(self._lines) > 1):
+                self._bytes -= _utf8_size(self._lines.popleft()[2])
+                if self._first_seq >= self._read_seq:
+                    self._dropped += 1
+                self._first_seq += 1
+            if not self._batch_requested and self._pending() >= self._batch_size:
+                self._batch_requested = notify = True
+        if notify and self._on_batch is not None:
+            self._on_batch()
+        on_first_line, self.on_first_line = self.on_first_line, None
+        if on_first_line is not None:
+            on_first_line()
+
+    def close(self) -> None:
+        """
+        Mark the stream as finished, it is released after its last drain.
+        """
+        self.closed = True
+
+    def _pending(self) -> int:
+        return self._next_seq - max(self._read_seq, self._first_seq)
+
+    def drain(self) -> Tuple[List[LogLine], int, int]:
+        """
+        Take the lines appended since the last drain.
+
+        Returns:
+            A tuple of (new lines, lines dropped, lines truncated) where the
+            counters are the increments since the last drain.
+        """
+        with self._lock:
+            start = max(self._read_seq, self._first_seq) - self._first_seq
+            lines = list(islice(self._lines, start, None))
+            self._read_seq = self._next_seq
+            self._batch_requested = False
+            dropped, truncated = self._dropped, self._truncated
+            self._dropped = self._truncated = 0
+        return lines, dropped, truncated
+
+    def lines(self) -> List[LogLine]:
+        """
+        Get every line still held in the buffer.
+
+        Returns:
+            The buffered lines, oldest first.
+        """
+        with self._lock:
+            return list(self._lines)
+
+
+class DebugLogModel(QAbstractListModel):
+    """
+    List model of debug output lines for a virtualized QML ListView.
+
+    Rows are appended in batches and the oldest are removed once the
+    scrollback limit is reached, so the view never lays out more text than
+    is on screen.
+    """
+
+    LineRole = Qt.UserRole
+    SourceRole = Qt.UserRole + 1
+    StreamRole = Qt.UserRole + 2
+    TimeRole = Qt.UserRole + 3
+
+    countChanged = Signal()
+    countersChanged = Signal()
+
+    def __init__(self, max_rows: int = DEFAULT_MAX_LINES, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            max_rows: Scrollback limit, the oldest rows are removed past it.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._rows: Deque[Tuple[str, LogLine]] = deque()
+        self._max_rows = max_rows
+        self._dropped = 0
+        self._truncated = 0
+
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {
+            self.LineRole: QByteArray(b"line"),
+            self.SourceRole: QByteArray(b"source"),
+            self.StreamRole: QByteArray(b"stream"),
+            self.TimeRole: QByteArray(b"time"),
+        }
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        source, (timestamp, stream, line) = self._rows[index.row()]
+        if role in (Qt.DisplayRole, self.LineRole):
+            return line
+        if role == self.SourceRole:
+            return source
+        if role == self.StreamRole:
+            return stream
+        if role == self.TimeRole:
+            return time.strftime("%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+        return None
+
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        """
+        The number of lines in the model, exposed to QML.
+        """
+        return len(self._rows)
+
+    @Property(int, notify=countersChanged)
+    def droppedLines(self) -> int:
+        """
+        Lines discarded because the output arrived faster than it could be shown.
+        """
+        return self._dropped
+
+    @Property(int, notify=countersChanged)
+    def truncatedLines(self) -> int:
+        """
+        Lines shortened because they were over the line length limit.
+        """
+        return self._truncated
+
+    def append_lines(self, source: str, lines: List[LogLine], dropped: int = 0, truncated: int = 0) -> None:
+        """
+        Append a batch of lines from one source.
+
+        Args:
+            source: Label for the lines, usually the app name.
+            lines: The lines to append.
+            dropped: Lines from this source dropped since the last batch.
+            truncated: Lines from this source truncated since the last batch.
+        """
+        if dropped or truncated:
+            self._dropped += dropped
+            self._truncated += truncated
+            self.countersChanged.emit()
+        if not lines:
+            return
+        lines = lines[-self._max_rows :]
+        overflow = len(self._rows) + len(lines) - self._max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._rows.extend((source, line) for line in lines)
+        self.endInsertRows()
+        self.countChanged.emit()
+
+    @Slot()
+    def clear(self) -> None:
+        """
+        Remove every line and reset the counters.
+        """
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+        self._dropped = self._truncated = 0
+        self.countChanged.emit()
+        self.countersChanged.emit()
+
+    @Slot(result=str)
+    def text(self) -> str:
+        """
+        Get the whole log as plain text.
+
+        Returns:
+            Every line joined with newlines.
+        """
+        return "\n".join(line for _, (_, _, line) in self._rows)
+
+
+class LogPipeline(QObject):
+    """
+    Moves output from reader threads into a DebugLogModel in batches.
+
+    Each stream writes into its own LogRingBuffer without touching Qt. The
+    GUI thread drains every buffer at a fixed rate, or sooner when a buffer
+    has a full batch pending, and appends the lines to the model in one go.
+    """
+
+    _batch_ready = Signal()
+
+    def __init__(
+        self,
+        model: DebugLogModel,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            model: The model lines are published to.
+            max_lines: Line cap for each stream's ring buffer.
+            max_bytes: Size cap for each stream's ring buffer.
+            flush_interval_ms: How often buffers are drained to the model.
+            batch_size: Pending lines in a stream that trigger an early flush.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._model = model
+        self._max_lines = max_lines
+        self._max_bytes = max_bytes
+        self._batch_size = batch_size
+        self._streams: List[LogRingBuffer] = []
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+        # queued from the reader threads to the GUI thread
+        self._batch_ready.connect(self.flush)
+
+    def open(self, source: str) -> LogRingBuffer:
+        """
+        Open a stream for a process, must be called on the GUI thread.
+
+        Args:
+            source: Label for the lines, usually the app name.
+
+        Returns:
+            The ring buffer to append lines to, close it when the output ends.
+        """
+        stream = LogRingBuffer(
+            source,
+            max_lines=self._max_lines,
+            max_bytes=self._max_bytes,
+            batch_size=self._batch_size,
+            on_batch=self._batch_ready.emit,
+        )
+        with self._lock:
+            self._streams.append(stream)
+        if not self._timer.isActive():
+            self._timer.start()
+        return stream
+
+    def active(self) -> bool:
+        """
+        Check if any stream is still open or has lines that have not reached the model.
+
+        Returns:
+            True until every stream has been closed and drained.
+        """
+        with self._lock:
+            return bool(self._streams)
+
+    @Slot()
+    def flush(self) -> None:
+        """
+        Drain every stream into the model, closed streams are released.
+        """
+        with self._lock:
+            streams = list(self._streams)
+            self._streams = [stream for stream in streams if not stream.closed]
+        for stream in streams:
+            lines, dropped, truncated = stream.drain()
+            self._model.append_lines(stream.source, lines, dropped, truncated)
+        if not self._streams:
+            self._timer.stop()
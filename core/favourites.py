@@ -0,0 +1,117 @@
+from typing import Any, Iterable, List, Set
+
+
+class Favourites:
+    """
+    The user's favourite apps as an ordered list of app names.
+
+    Names rather than copies of the app entries are kept, so a favourite
+    always shows the current catalogue entry. A set mirrors the list for
+    O(1) membership tests.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """
+        Initialize the favourites.
+
+        Args:
+            names: The favourite app names in display order, duplicates are dropped.
+        """
+        self._names: List[str] = []
+        self._members: Set[str] = set()
+        for name in names:
+            self.add(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._members
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def names(self) -> List[str]:
+        """
+        Get the favourite app names.
+
+        Returns:
+            A copy of the names in display order.
+        """
+        return list(self._names)
+
+    def add(self, name: str) -> bool:
+        """
+        Add an app to the end of the favourites.
+
+        Args:
+            name: The app name.
+
+        Returns:
+            True if it was not already a favourite.
+        """
+        if name in self._members:
+            return False
+        self._names.append(name)
+        self._members.add(name)
+        return True
+
+    def remove(self, name: str) -> bool:
+        """
+        Remove an app from the favourites.
+
+        Args:
+            name: The app name.
+
+        Returns:
+            True if it was a favourite.
+        """
+        if name not in self._members:
+            return False
+        self._members.discard(name)
+        self._names.remove(name)
+        return True
+
+    def move(self, name: str, before: str) -> bool:
+        """
+        Move a favourite to where another one is.
+
+        Moving towards the end puts it after the other favourite and moving
+        towards the start puts it before, as when dragging it onto it.
+
+        Args:
+            name: The favourite to move.
+            before: The favourite whose position it takes.
+
+        Returns:
+            True if it was moved.
+        """
+        if name == before or name not in self._members or before not in self._members:
+            return False
+        to_index = self._names.index(before)
+        self._names.remove(name)
+        self._names.insert(to_index, name)
+        return True
+
+
+def favourite_names(stored: Any) -> List[str]:
+    """
+    Read the favourites as stored in QSettings.
+
+    Older versions stored a full copy of each app, newer ones only its name,
+    and QSettings may return a single entry list as the bare entry.
+
+    Args:
+        stored: The value of the user/favourites setting.
+
+    Returns:
+        The favourite app names.
+    """
+    if not stored:
+        return []
+    if isinstance(stored, (str, dict)):
+        stored = [stored]
+    names = []
+    for entry in stored:
+        if isinstance(entry, str):
+            names.append(entry)
+        elif hasattr(entry, "get") and entry.get("name"):
+            names.append(str(entry["name"]))
+    return names
@@ -0,0 +1,151 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MAX_RENDERS = 128
+NO_HELP = "No help available."
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$", re.MULTILINE)
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+def _heading_repl(match: "re.Match[str]") -> str:
+    hashes, title = match.group(1), match.group(2)
+    level = min(len(hashes), 6)
+    return f'<h{level} style="color:#80cbc4;">{title.strip()}</h{level}>'
+
+
+def _link_repl(match: "re.Match[str]") -> str:
+    text, url = match.group(1), match.group(2)
+    return f'<a href="{url}" style="color: #FFD600;">{text}</a>'
+
+
+def markdown_to_dark_html(markdown: str) -> str:
+    """
+    Convert a help section to HTML with colours that are readable on a dark background.
+
+    Args:
+        markdown: The section text.
+
+    Returns:
+        HTML with teal headings, yellow links and <br> line breaks.
+    """
+    html = _HEADING_RE.sub(_heading_repl, markdown)
+    html = _LINK_RE.sub(_link_repl, html)
+    return html.replace("\n", "<br>")
+
+
+def parse_sections(text: str) -> Dict[str, str]:
+    """
+    Split the help file into one section per app.
+
+    A section starts with a "# Name" heading and runs up to the next "---"
+    line or the next "# " heading. A heading may list several app names
+    separated by ", " when they share a section.
+
+    Args:
+        text: The contents of AboutText.md.
+
+    Returns:
+        App name to the Markdown of its section, including the heading.
+    """
+    sections: Dict[str, str] = {}
+    names: Tuple[str, ...] = ()
+    lines: List[str] = []
+
+    def close() -> None:
+        for name in names:
+            sections.setdefault(name, "\n".join(lines).strip())
+
+    for line in text.splitlines():
+        if line.startswith("# "):
+            close()
+            names = tuple(name.strip() for name in line[2:].split(", "))
+            lines = [line]
+        elif names:
+            if line.strip() == "---":
+                close()
+                names = ()
+            else:
+                lines.append(line)
+    close()
+    return sections
+
+
+class HelpIndex:
+    """
+    The per-app help sections, parsed once and rendered on demand.
+
+    Each rendered (app, theme) pair is kept in a bounded LRU so opening the
+    About dialog again, or switching theme back, costs a dictionary lookup.
+    It is safe to render from a background thread while the GUI reads.
+    """
+
+    def __init__(self, text: str, max_renders: int = DEFAULT_MAX_RENDERS) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            text: The contents of AboutText.md.
+            max_renders: How many rendered sections are kept.
+        """
+        self._sections = parse_sections(text)
+        self._max_renders = max_renders
+        self._renders: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, app_name: str) -> bool:
+        return app_name in self._sections
+
+    def section(self, app_name: str) -> Optional[str]:
+        """
+        Get the Markdown help for an app.
+
+        Args:
+            app_name: The exact app name.
+
+        Returns:
+            The section, or None if the app has no help.
+        """
+        return self._sections.get(app_name)
+
+    def render(self, app_name: str, theme: str) -> str:
+        """
+        Get the help for an app ready to show.
+
+        Args:
+            app_name: The exact app name.
+            theme: "light" for Markdown, anything else for dark mode HTML.
+
+        Returns:
+            The rendered help, or NO_HELP if the app has none.
+        """
+        key = (app_name, "light" if theme == "light" else "dark")
+        with self._lock:
+            rendered = self._renders.get(key)
+            if rendered is not None:
+                self._renders.move_to_end(key)
+                return rendered
+        markdown = self._sections.get(app_name)
+        if markdown is None:
+            return NO_HELP
+        rendered = markdown if key[1] == "light" else markdown_to_dark_html(markdown)
+        with self._lock:
+            self._renders[key] = rendered
+            while len(self._renders) > self._max_renders:
+                self._renders.popitem(last=False)
+        return rendered
+
+    def prerender(self, app_names: Iterable[str], themes: Iterable[str] = ("light", "dark")) -> None:
+        """
+        Render sections ahead of time, e.g. for the favourites after start up.
+
+        Args:
+            app_names: The apps to render.
+            themes: The themes to render each app in.
+        """
+        themes = tuple(themes)
+        for name in app_names:
+            for theme in themes:
+                self.render(name, theme)
@@ -0,0 +1,337 @@
+import hashlib
+import os
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+from PySide6.QtCore import QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QFont, QImage, QImageReader, QPainter
+from PySide6.QtQuick import QQuickAsyncImageProvider, QQuickImageResponse, QQuickTextureFactory
+
+from core.prober import icon_path
+
+DEFAULT_ICON_SIZE = 48
+DEFAULT_MEMORY_CACHE_SIZE = 512
+DEFAULT_WORKERS = 4
+# A slow source gets the placeholder after this long, the icon replaces it once decoded.
+DEFAULT_PLACEHOLDER_AFTER_MS = 150
+
+# Resolves an app name to its icon source as written in apps.json, None for an unknown app.
+IconResolver = Callable[[str], Optional[str]]
+# An icon to decode as (app name, size, done callback, missing).
+_IconJob = Tuple[str, QSize, Callable[[QImage], bool], bool]
+
+
+def placeholder_icon(name: str, size: QSize) -> QImage:
+    """
+    Draw the stand-in shown while an icon loads or when it is missing, the app's initial on a grey tile.
+
+    Args:
+        name: The app name.
+        size: The size in pixels.
+
+    Returns:
+        The image.
+    """
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor("#9e9e9e"))
+    radius = min(size.width(), size.height()) / 6
+    painter.drawRoundedRect(0, 0, size.width(), size.height(), radius, radius)
+    font = QFont()
+    font.setPixelSize(max(1, int(min(size.width(), size.height()) * 0.55)))
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(QColor("#fff"))
+    painter.drawText(image.rect(), Qt.AlignCenter, name[:1].upper())
+    painter.end()
+    return image
+
+
+def decode_icon(source: str, size: QSize) -> QImage:
+    """
+    Decode an image straight to the size it is shown at.
+
+    The reader is asked for the scaled size so SVGs are rendered at that
+    size and JPEGs can skip detail, anything larger is scaled down smoothly.
+
+    Args:
+        source: A file path or a ":/" resource path.
+        size: The largest size wanted, the aspect ratio is kept.
+
+    Returns:
+        The image, null if it could not be read.
+    """
+    reader = QImageReader(source)
+    original = reader.size()
+    if original.isValid() and (original.width() > size.width() or original.height() > size.height()):
+        reader.setScaledSize(original.scaled(size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and (image.width() > size.width() or image.height() > size.height()):
+        image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class IconCache:
+    """
+    Decodes app icons on a thread pool and keeps the results.
+
+    The pool's threads are daemon threads, an icon read stuck on a network
+    mount must not keep the launcher from quitting. Decoded icons are kept in memory, least recently used first out, and
+    as PNG thumbnails on local disk keyed by the source path, its mtime and
+    size and the thumbnail size, so the full sized images on the network
+    mounts are only read again when they change.
+    """
+
+    def __init__(
+        self,
+        resolve: IconResolver,
+        thumbnail_dir: Optional[Path] = None,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        on_late: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            resolve: Looks up an app's icon source, called from the image loading threads.
+            thumbnail_dir: Where thumbnails are stored, None to keep them in memory only.
+            memory_cache_size: Number of decoded icons kept in memory.
+            workers: Number of decoding threads.
+            on_late: Called on a decoding thread with the app name when an icon
+                arrives after its placeholder was shown.
+        """
+        self._resolve = resolve
+        self._thumbnail_dir = thumbnail_dir
+        if thumbnail_dir is not None:
+            thumbnail_dir.mkdir(parents=True, exist_ok=True)
+        self._capacity = memory_cache_size
+        self._on_late = on_late
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, int, int], QImage]" = OrderedDict()
+        self._workers = workers
+        self._threads: List[threading.Thread] = []
+        # None tells a decoding thread to stop
+        self._jobs: "queue.Queue[Optional[_IconJob]]" = queue.Queue()
+        self._stopped = False
+
+    def cached(self, source: str, size: QSize) -> Optional[QImage]:
+        """
+        Get an icon already decoded at a size.
+
+        Args:
+            source: The icon source.
+            size: The size.
+
+        Returns:
+            The image, or None if it is not in memory.
+        """
+        key = (source, size.width(), size.height())
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+            return image
+
+    def load(self, name: str, size: QSize, done: Callable[[QImage], bool], missing: bool = False) -> None:
+        """
+        Decode an app's icon on the pool.
+
+        Args:
+            name: The app name.
+            size: The size to decode to.
+            done: Called on a decoding thread with the image, or the
+                placeholder if it cannot be read. Returns False if the
+                placeholder was already shown.
+            missing: The prober found the icon missing, so the placeholder
+                is used without touching the file system.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            if not self._threads:
+                self._threads = [
+                    threading.Thread(target=self._work, name=f"icon-{i}", daemon=True) for i in range(self._workers)
+                ]
+                for thread in self._threads:
+                    thread.start()
+        self._jobs.put((name, size, done, missing))
+
+    def clear(self) -> None:
+        """
+        Forget the icons in memory, e.g. after the catalogue changed, thumbnails on disk are kept.
+        """
+        with self._lock:
+            self._memory.clear()
+
+    def shutdown(self) -> None:
+        """
+        Stop decoding, queued icons are dropped and a read in progress is abandoned.
+        """
+        with self._lock:
+            self._stopped = True
+            threads = self._threads
+        while True:
+            try:
+                self._jobs.get_nowait()
+            except queue.Empty:
+                break
+        for _ in threads:
+            self._jobs.put(None)
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                self._load(*job)
+            except Exception as e:
+                # the thread is kept for the next icon
+                print(f"Icon for {job[0]} not loaded: {e}")
+
+    def _load(self, name: str, size: QSize, done: Callable[[QImage], bool], missing: bool) -> None:
+        source = None if missing else self._resolve(name)
+        image = QImage()
+        if source:
+            cached = self.cached(source, size)
+            image = cached if cached is not None else self._decode(source, size)
+            if cached is None and not image.isNull():
+                self._remember(source, size, image)
+        if image.isNull():
+            image = placeholder_icon(name, size)
+        if not done(image) and self._on_late is not None:
+            self._on_late(name)
+
+    def _decode(self, source: str, size: QSize) -> QImage:
+        """
+        Read an icon from its thumbnail, or decode the source and store a thumbnail.
+
+        Args:
+            source: The icon as written in apps.json.
+            size: The size.
+
+        Returns:
+            The image, null if it could not be read.
+        """
+        path = icon_path(source)
+        if path is None:
+            # bundled in the Qt resources, already local and small, "/icons/x.png" is relative to qrc:/
+            return decode_icon(":" + source.removeprefix("qrc:"), size)
+        try:
+            # this stat and the read below are what can hang on a network mount
+            info = os.stat(path)
+        except OSError:
+            return QImage()
+        thumbnail = None
+        if self._thumbnail_dir is not None:
+            key = f"{path}\0{info.st_mtime_ns}\0{info.st_size}\0{size.width()}x{size.height()}"
+            thumbnail = self._thumbnail_dir / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+            image = QImage(str(thumbnail))
+            if not image.isNull():
+                return image
+        image = decode_icon(path, size)
+        if thumbnail is not None and not image.isNull():
+            # written aside and renamed so a reader never sees half a file
+            partial = thumbnail.with_suffix(f".{threading.get_ident()}.tmp")
+            try:
+                if image.save(str(partial), "PNG"):
+                    os.replace(partial, thumbnail)
+            except OSError:
+                pass
+        return image
+
+    def _remember(self, source: str, size: QSize, image: QImage) -> None:
+        with self._lock:
+            self._memory[(source, size.width(), size.height())] = image
+            self._memory.move_to_end((source, size.width(), size.height()))
+            while len(self._memory) > self._capacity:
+                self._memory.popitem(last=False)
+
+
+class IconResponse(QQuickImageResponse):
+    """
+    One icon request, finished with the icon or, if that is slow, with the placeholder first.
+
+    finished is always emitted from the thread that made the request, once
+    its event loop runs again, so it cannot fire before the engine has
+    connected to it.
+    """
+
+    _delivered = Signal()
+
+    def __init__(self, cache: IconCache, name: str, size: QSize, missing: bool, placeholder_after_ms: int) -> None:
+        super().__init__()
+        self._name = name
+        self._size = size
+        self._image = QImage()
+        self._lock = threading.Lock()
+        self._finished = False
+        self._delivered.connect(self.finished, Qt.QueuedConnection)
+        cache.load(name, size, self._deliver, missing)
+        if placeholder_after_ms >= 0:
+            QTimer.singleShot(placeholder_after_ms, self._on_timeout)
+
+    def textureFactory(self) -> QQuickTextureFactory:
+        return QQuickTextureFactory.textureFactoryForImage(self._image)
+
+    def _deliver(self, image: QImage) -> bool:
+        """
+        Finish with the decoded icon, runs on a decoding thread.
+
+        Returns:
+            False if the placeholder was delivered first.
+        """
+        with self._lock:
+            if self._finished:
+                return False
+            self._finished = True
+            self._image = image
+        self._delivered.emit()
+        return True
+
+    def _on_timeout(self) -> None:
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            self._image = placeholder_icon(self._name, self._size)
+        self._delivered.emit()
+
+
+class AppIconProvider(QQuickAsyncImageProvider):
+    """
+    Serves app icons to QML as image://appicon/<app name>?rev=<n>&missing=<0|1>.
+
+    Every icon is decoded off the GUI thread, icons decoded before come
+    from memory. The revision is only there so QML asks again when an icon
+    changes or arrives late, missing is set for icons the prober could not
+    find.
+    """
+
+    def __init__(self, cache: IconCache, placeholder_after_ms: int = DEFAULT_PLACEHOLDER_AFTER_MS) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            cache: Decodes and keeps the icons.
+            placeholder_after_ms: Milliseconds before a slow icon is shown as the placeholder, -1 to always wait.
+        """
+        super().__init__()
+        self._cache = cache
+        self._placeholder_after_ms = placeholder_after_ms
+
+    def requestImageResponse(self, id: str, requestedSize: QSize) -> QQuickImageResponse:
+        name, _, query = id.partition("?")
+        missing = parse_qs(query).get("missing", ["0"])[0] == "1"
+        size = requestedSize
+        if not size.isValid() or size.isEmpty():
+            size = QSize(DEFAULT_ICON_SIZE, DEFAULT_ICON_SIZE)
+        return IconResponse(self._cache, unquote(name), size, missing, self._placeholder_after_ms)
@@ -0,0 +1,68 @@
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SOCKET_NAME = "appsere.sock"
+DEFAULT_TIMEOUT_S = 5.0
+
+# A request to the running instance and its reply, each sent as one line of JSON.
+# {"action": "show"}, {"action": "launch", "name": "Maya"}, {"action": "search", "query": "nuke"}, {"action": "quit"}
+Command = Dict[str, Any]
+
+
+def socket_path() -> Path:
+    """
+    Get the path of the socket the running instance listens on, one per user.
+
+    Returns:
+        $XDG_RUNTIME_DIR/appsere.sock, or a per-user name in the temp directory
+        if XDG_RUNTIME_DIR is not set.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return Path(runtime) / SOCKET_NAME
+    return Path(tempfile.gettempdir()) / f"appsere-{os.getuid()}.sock"
+
+
+def send_command(
+    command: Command, path: Optional[Path] = None, timeout: float = DEFAULT_TIMEOUT_S
+) -> Optional[Command]:
+    """
+    Send a command to the running instance and wait for its reply.
+
+    This only uses the standard library so a second invocation can hand its
+    command over and exit without loading Qt.
+
+    Args:
+        command: The command, e.g. {"action": "launch", "name": "Maya"}.
+        path: The socket, socket_path() by default.
+        timeout: Seconds to wait for the connection and the reply.
+
+    Returns:
+        The reply, with "ok" and "message", or None if no instance is running.
+
+    Raises:
+        OSError: If an instance is listening but did not reply in time.
+    """
+    path = path or socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            # no socket, or one left behind by an instance that crashed
+            return None
+        sock.sendall(json.dumps(command).encode("utf-8") + b"\n")
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+    try:
+        return json.loads(reply)
+    except ValueError:
+        return {"ok": False, "message": "invalid reply from the running instance"}
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from core.instance import Command, send_command
+
+# Longest command accepted, anything larger is not from our client.
+MAX_COMMAND_BYTES = 64 * 1024
+
+
+class InstanceServer(QObject):
+    """
+    Listens on a local socket so later invocations hand their command to this instance.
+
+    Each connection sends one JSON command line and gets one JSON reply line
+    back, see core.instance. Commands are handled on the GUI thread.
+    """
+
+    def __init__(self, path: Path, handler: Callable[[Command], Command], parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the server, call listen to start accepting connections.
+
+        Args:
+            path: The socket path.
+            handler: Called with each command, returns the reply.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._path = path
+        self._handler = handler
+        self._buffers: Dict[QLocalSocket, bytes] = {}
+        self._server = QLocalServer(self)
+        # only this user may connect, the socket may be in the shared temp directory
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    def listen(self) -> bool:
+        """
+        Start listening, replacing a socket left behind by an instance that crashed.
+
+        Returns:
+            False if another instance is already listening, e.g. one that was
+            started at the same moment.
+        """
+        if self._server.listen(str(self._path)):
+            return True
+        try:
+            if send_command({"action": "ping"}, self._path) is not None:
+                return False
+        except OSError:
+            return False
+        QLocalServer.removeServer(str(self._path))
+        return self._server.listen(str(self._path))
+
+    def shutdown(self) -> None:
+        """
+        Stop listening and remove the socket.
+        """
+        self._server.close()
+
+    def _on_new_connection(self) -> None:
+        while self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            self._buffers[connection] = b""
+            connection.readyRead.connect(lambda connection=connection: self._on_ready_read(connection))
+            connection.disconnected.connect(lambda connection=connection: self._on_disconnected(connection))
+
+    def _on_ready_read(self, connection: QLocalSocket) -> None:
+        data = self._buffers.get(connection, b"") + bytes(connection.readAll().data())
+        if b"\n" not in data and len(data) < MAX_COMMAND_BYTES:
+            self._buffers[connection] = data
+            return
+        try:
+            command = json.loads(data.split(b"\n", 1)[0])
+            if not isinstance(command, dict):
+                raise ValueError("not an object")
+            reply = self._handler(command)
+        except ValueError as e:
+            reply = {"ok": False, "message": f"invalid command: {e}"}
+        connection.write(json.dumps(reply).encode("utf-8") + b"\n")
+        connection.flush()
+        connection.disconnectFromServer()
+
+    def _on_disconnected(self, connection: QLocalSocket) -> None:
+        self._buffers.pop(connection, None)
+        connection.deleteLater()
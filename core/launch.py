@@ -0,0 +1,70 @@
+import subprocess
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.appentry import AppEntry
+from core.catalogue import CatalogueRegistry
+
+
+def find_app(catalogue: CatalogueRegistry, app_name: str) -> Optional[AppEntry]:
+    """
+    Look an app up by the name a user typed.
+
+    Args:
+        catalogue: The catalogue.
+        app_name: The app name, matched without regard to case if there is no exact match.
+
+    Returns:
+        The entry, or None if there is no such app.
+    """
+    app = catalogue.app(app_name)
+    if app is None:
+        folded = app_name.casefold()
+        app = next((a for a in catalogue.apps() if a["name"].casefold() == folded), None)
+    return app
+
+
+def launch_command(path: str, exec_name: str, flags: Optional[Iterable[Any]] = None) -> List[str]:
+    """
+    Build the command line that starts an app.
+
+    Args:
+        path: The directory holding the executable.
+        exec_name: The executable, usually a wrapper script.
+        flags: Command line flags, converted to strings.
+
+    Returns:
+        The command line.
+    """
+    return [f"{path}/{exec_name}"] + [str(flag) for flag in flags or []]
+
+
+def app_command(app: Dict[str, Any], extra_flags: Iterable[Any] = ()) -> List[str]:
+    """
+    Build the command line for a catalogue entry.
+
+    Args:
+        app: The app dictionary.
+        extra_flags: Flags appended after the app's own.
+
+    Returns:
+        The command line.
+    """
+    return launch_command(app["path"], app["execName"], [*(app.get("flags") or []), *extra_flags])
+
+
+def spawn_detached(command: List[str], **popen_kwargs: Any) -> subprocess.Popen:
+    """
+    Start an app in its own session so it outlives the launcher and any wrapper children can be signalled together.
+
+    Args:
+        command: The command line.
+        **popen_kwargs: Extra arguments for subprocess.Popen.
+
+    Returns:
+        The Popen object.
+
+    Raises:
+        OSError: If the executable cannot be started.
+    """
+    popen_kwargs.setdefault("start_new_session", True)
+    return subprocess.Popen(command, **popen_kwargs)
@@ -0,0 +1,416 @@
+import bisect
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.procfs import live_sessions
+from core.windows import windows_by_session
+
+# Upper bounds of the histogram buckets in seconds, 100 µs to about 12 minutes in steps of 1.5x.
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(0.0001 * 1.5**k for k in range(40))
+
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_WINDOW_TIMEOUT_S = 120.0
+WINDOW_POLL_INTERVAL_S = 0.5
+
+# A metric name and its sorted label pairs.
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """
+    Counts of observed durations in fixed exponential buckets.
+
+    Memory and the cost of an observation do not grow with the number of
+    observations, percentiles are interpolated within a bucket so they are
+    accurate to about the bucket width (50%).
+    """
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds: How long the operation took.
+            error: Whether the operation failed.
+        """
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.min = seconds if self.count == 1 else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            fraction: The percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            The estimated duration in seconds, 0 if nothing was observed.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for i, in_bucket in enumerate(self.buckets):
+            if in_bucket and seen + in_bucket >= rank:
+                lower = BUCKET_BOUNDS[i - 1] if i > 0 else 0.0
+                upper = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+                return min(max(lower + (upper - lower) * (rank - seen) / in_bucket, self.min), self.max)
+            seen += in_bucket
+        return self.max
+
+
+class TraceWriter:
+    """
+    Appends one JSON line per recorded event to a file on a background thread.
+
+    The file may be on a slow home directory, so callers only put the event
+    on a queue. Events are dropped rather than queued without limit if the
+    writer cannot keep up.
+    """
+
+    def __init__(self, path: Path, max_pending: int = 10000) -> None:
+        """
+        Initialize the writer and start its thread.
+
+        Args:
+            path: The file to append to.
+            max_pending: Events queued before new ones are dropped.
+        """
+        self.path = path
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(max_pending)
+        self._thread = threading.Thread(target=self._run, name="metrics-trace", daemon=True)
+        self._thread.start()
+
+    def write(self, event: Dict[str, Any]) -> None:
+        """
+        Queue an event to be written.
+
+        Args:
+            event: A JSON serializable dictionary.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        """
+        Write the queued events and stop the thread.
+        """
+        self._queue.put(None)
+        self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        try:
+            f = open(self.path, "a", encoding="utf-8")
+        except OSError:
+            return
+        with f:
+            while True:
+                event = self._queue.get()
+                if event is None:
+                    return
+                f.write(json.dumps(event) + "\n")
+                # only flush once the queue is empty so bursts are written together
+                if self._queue.empty():
+                    f.flush()
+
+
+class Metrics:
+    """
+    Thread safe registry of latency histograms, keyed by operation name and labels.
+
+    Every recorded operation updates its histogram and, when a trace is open,
+    is also written to the JSON lines trace.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._trace: Optional[TraceWriter] = None
+
+    def open_trace(self, path: Path) -> None:
+        """
+        Start writing every recorded operation to a JSON lines file.
+
+        Args:
+            path: The file to append to.
+        """
+        self.close_trace()
+        self._trace = TraceWriter(path)
+
+    def close_trace(self) -> None:
+        """
+        Stop writing the trace, if one is open.
+        """
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            trace.close()
+
+    def observe(self, name: str, seconds: float, error: bool = False, **labels: str) -> None:
+        """
+        Record one operation.
+
+        Args:
+            name: The operation, e.g. "launch.spawn".
+            seconds: How long it took.
+            error: Whether it failed.
+            **labels: Extra dimensions such as app="Maya".
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds, error)
+        trace = self._trace
+        if trace is not None:
+            trace.write(dict(labels, ts=time.time(), op=name, ms=round(seconds * 1000, 3), ok=not error))
+
+    @contextmanager
+    def timed(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Time a block, an exception escaping it is recorded as an error and re-raised.
+
+        Args:
+            name: The operation.
+            **labels: Extra dimensions such as app="Maya".
+        """
+        start = time.perf_counter()
+        error = True
+        try:
+            yield
+            error = False
+        finally:
+            self.observe(name, time.perf_counter() - start, error, **labels)
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded so far.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Summarize every histogram, for the Performance panel.
+
+        Returns:
+            One dictionary per operation and label set with name, labels,
+            count, errors and mean, p50, p95, p99 and max in milliseconds,
+            sorted by name then labels.
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            return [
+                {
+                    "name": name,
+                    "labels": ", ".join(f"{key}={value}" for key, value in labels),
+                    "count": h.count,
+                    "errors": h.errors,
+                    "mean": round(h.total / h.count * 1000, 2) if h.count else 0.0,
+                    "p50": round(h.percentile(0.50) * 1000, 2),
+                    "p95": round(h.percentile(0.95) * 1000, 2),
+                    "p99": round(h.percentile(0.99) * 1000, 2),
+                    "max": round(h.max * 1000, 2),
+                }
+                for (name, labels), h in items
+            ]
+
+    def prometheus_text(self, prefix: str = "appsere") -> str:
+        """
+        Format every histogram in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prepended to every metric name.
+
+        Returns:
+            The exposition text, a histogram and an error counter per operation.
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            lines = []
+            declared = set()
+            for (name, labels), h in items:
+                metric = f"{prefix}_{name.replace('.', '_')}"
+                if metric not in declared:
+                    declared.add(metric)
+                    lines.append(f"# TYPE {metric}_seconds histogram")
+                    lines.append(f"# TYPE {metric}_errors_total counter")
+                label_text = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+                cumulative = 0
+                for bound, in_bucket in zip(BUCKET_BOUNDS, h.buckets):
+                    cumulative += in_bucket
+                    lines.append(f"{metric}_seconds_bucket{{{_with_le(label_text, f'{bound:.6g}')}}} {cumulative}")
+                lines.append(f"{metric}_seconds_bucket{{{_with_le(label_text, '+Inf')}}} {h.count}")
+                braces = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{metric}_seconds_sum{braces} {h.total:.6f}")
+                lines.append(f"{metric}_seconds_count{braces} {h.count}")
+                lines.append(f"{metric}_errors_total{braces} {h.errors}")
+            return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _with_le(label_text: str, bound: str) -> str:
+    le = f'le="{bound}"'
+    return f"{label_text},{le}" if label_text else le
+
+
+class MetricsServer:
+    """
+    Serves the metrics in the Prometheus text format on a localhost port.
+    """
+
+    def __init__(self, metrics: Metrics, port: int, host: str = DEFAULT_METRICS_HOST) -> None:
+        """
+        Initialize the server and start serving on a daemon thread.
+
+        Args:
+            metrics: The registry to serve.
+            port: The port to listen on, 0 picks a free one.
+            host: The address to bind, localhost by default so it is not reachable from other machines.
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+
+    def shutdown(self) -> None:
+        """
+        Stop serving and close the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FirstWindowTimer:
+    """
+    Times how long launched apps take to map their first top level window.
+
+    One thread polls for every pending launch, listing the windows once per
+    tick however many apps are starting, and exits when nothing is pending.
+    Apps are usually started through wrapper scripts, so the window belongs
+    to a descendant rather than the launched process, every child is
+    started in its own session so the session id identifies all of them.
+    A launch is given up once every process in its session has exited or
+    after the timeout. Windows are listed with wmctrl, so this only works
+    on X11 with wmctrl installed.
+    """
+
+    def __init__(
+        self,
+        on_shown: Callable[[str, float], None],
+        timeout: float = DEFAULT_WINDOW_TIMEOUT_S,
+        interval: float = WINDOW_POLL_INTERVAL_S,
+    ) -> None:
+        """
+        Initialize the timer, the polling thread is started by the first watch.
+
+        Args:
+            on_shown: Called on the polling thread with the label and the seconds until the window was seen.
+            timeout: Seconds to wait for a window before giving up.
+            interval: Seconds between polls.
+        """
+        self._on_shown = on_shown
+        self._timeout = timeout
+        self._interval = interval
+        self._condition = threading.Condition()
+        # session -> (label, time.monotonic() of the launch request)
+        self._pending: Dict[int, Tuple[str, float]] = {}
+        self._running = False
+        self._stopped = False
+
+    def watch(self, session: int, label: str, start: float) -> None:
+        """
+        Start timing a launch.
+
+        Args:
+            session: The session id, the pid of the launched process.
+            label: The app label the duration is recorded under.
+            start: The time.monotonic() the launch was requested.
+        """
+        with self._condition:
+            if self._stopped:
+                return
+            self._pending[session] = (label, start)
+            if not self._running:
+                self._running = True
+                threading.Thread(target=self._poll, name="launch-window", daemon=True).start()
+
+    def shutdown(self) -> None:
+        """
+        Stop timing, pending launches are dropped.
+        """
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def _poll(self) -> None:
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._running = False
+                    return
+                pending = dict(self._pending)
+            windows = windows_by_session()
+            now = time.monotonic()
+            if windows is None:
+                # no X11 or no wmctrl, nothing can be timed
+                finished = set(pending)
+            else:
+                alive = live_sessions()
+                finished = set()
+                for session, (label, start) in pending.items():
+                    if windows.get(session):
+                        self._on_shown(label, now - start)
+                        finished.add(session)
+                    elif session not in alive or now - start > self._timeout:
+                        finished.add(session)
+            with self._condition:
+                for session in finished:
+                    # unless it was watched again in the meantime
+                    if self._pending.get(session) == pending[session]:
+                        del self._pending[session]
+                if self._pending:
+                    self._condition.wait(self._interval)
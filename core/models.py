@@ -0,0 +1,248 @@
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Property, QAbstractListModel, QByteArray, QModelIndex, QObject, Qt, Signal, Slot
+
+from core.appentry import AppEntry
+
+# AppEntry fields exposed to QML delegates as model roles, e.g. model.name
+APP_ROLES: List[str] = ["name", "path", "execName", "desc", "icon", "tabName", "flags", "popup"]
+
+
+class AppListModel(QAbstractListModel):
+    """
+    A persistent list model of apps for QML views.
+
+    The model holds references to the catalogue's entries, a role is only
+    converted to a QML value when a delegate reads it. Replacing the
+    contents with set_apps applies the difference as row removals and
+    insertions, so views keep the delegates of rows that are still present
+    rather than rebuilding every one of them.
+    """
+
+    countChanged = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._apps: List[AppEntry] = []
+        self._roles: Dict[int, str] = {Qt.UserRole + i: name for i, name in enumerate(APP_ROLES)}
+
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {role: QByteArray(name.encode()) for role, name in self._roles.items()}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._apps)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._apps):
+            return None
+        app = self._apps[index.row()]
+        if role == Qt.DisplayRole:
+            return app.name
+        field = self._roles.get(role)
+        if field is None:
+            return None
+        if field == "flags":
+            return list(app.flags)
+        return getattr(app, field)
+
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        """
+        The number of apps in the model, exposed to QML.
+        """
+        return len(self._apps)
+
+    @Slot(int, result="QVariant")
+    def get(self, row: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the app at a row, for QML.
+
+        Args:
+            row: The row index.
+
+        Returns:
+            The app as a dictionary, or None if the row is out of range.
+        """
+        if 0 <= row < len(self._apps):
+            return self._apps[row].to_dict()
+        return None
+
+    def apps(self) -> List[AppEntry]:
+        """
+        Get a copy of the list of apps in the model.
+
+        Returns:
+            The apps in row order.
+        """
+        return list(self._apps)
+
+    def set_apps(self, apps: List[AppEntry]) -> None:
+        """
+        Replace the contents of the model, emitting only the row changes needed.
+
+        Rows are matched by app name, matched rows whose app has changed get a
+        dataChanged rather than being removed and inserted.
+
+        Args:
+            apps: The new list of apps.
+        """
+        old_keys = [app.name for app in self._apps]
+        new_keys = [app.name for app in apps]
+        old_count = len(self._apps)
+        opcodes = SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes()
+        # work backwards so the row numbers of earlier opcodes stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    if self._apps[i1 + offset] is not apps[j1 + offset]:
+                        self._apps[i1 + offset] = apps[j1 + offset]
+                        index = self.index(i1 + offset)
+                        self.dataChanged.emit(index, index)
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._apps[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self._apps[i1:i1] = apps[j1:j2]
+                self.endInsertRows()
+        if len(self._apps) != old_count:
+            self.countChanged.emit()
+
+    def move(self, from_row: int, to_row: int) -> bool:
+        """
+        Move one app to another row, views move the existing delegate.
+
+        Args:
+            from_row: The current row of the app.
+            to_row: The row it should end up at.
+
+        Returns:
+            True if the app was moved.
+        """
+        count = len(self._apps)
+        if from_row == to_row or not (0 <= from_row < count and 0 <= to_row < count):
+            return False
+        # Qt wants the row the app goes before in the old numbering
+        destination = to_row + 1 if to_row > from_row else to_row
+        self.beginMoveRows(QModelIndex(), from_row, from_row, QModelIndex(), destination)
+        self._apps.insert(to_row, self._apps.pop(from_row))
+        self.endMoveRows()
+        return True
+
+
+class TabsModel(QAbstractListModel):
+    """
+    The tabs shown in the TabBar and StackLayout, Favourites and any other
+    tabs the launcher fills itself first, then one per catalogue tab.
+
+    Each tab exposes its apps as its own AppListModel that is kept for the
+    life of the tab, so changing one tab's apps only updates the rows of
+    that tab's grid and leaves the other grids and their delegates alone.
+    """
+
+    TabNameRole = Qt.UserRole
+    AppsRole = Qt.UserRole + 1
+
+    countChanged = Signal()
+
+    def __init__(
+        self,
+        favourites: AppListModel,
+        parent: Optional[QObject] = None,
+        pinned: Sequence[Tuple[str, AppListModel]] = (),
+    ) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            favourites: The model of the Favourites tab, always the first row.
+            parent: The parent QObject.
+            pinned: Tabs filled by the launcher rather than the catalogue, as (name, apps), shown after Favourites.
+        """
+        super().__init__(parent)
+        self._tabs: List[Tuple[str, AppListModel]] = [("Favourites", favourites), *pinned]
+        # rows before the catalogue tabs
+        self._pinned = len(self._tabs)
+
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {self.TabNameRole: QByteArray(b"tabName"), self.AppsRole: QByteArray(b"apps")}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tabs)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._tabs):
+            return None
+        name, apps = self._tabs[index.row()]
+        if role in (Qt.DisplayRole, self.TabNameRole):
+            return name
+        if role == self.AppsRole:
+            return apps
+        return None
+
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        """
+        The number of tabs, exposed to QML.
+        """
+        return len(self._tabs)
+
+    def tab(self, name: str) -> Optional[AppListModel]:
+        """
+        Get the apps model of a tab.
+
+        Args:
+            name: The tab name.
+
+        Returns:
+            The tab's model, or None if there is no such tab.
+        """
+        return next((apps for tab_name, apps in self._tabs if tab_name == name), None)
+
+    def set_tabs(self, apps_by_tab: List[Dict[str, Any]]) -> None:
+        """
+        Replace the catalogue tabs, Favourites and the pinned tabs are left in place.
+
+        Tabs are matched by name, a tab that is still present keeps its model
+        and only gets the row changes for its apps.
+
+        Args:
+            apps_by_tab: List of tab dictionaries, each with "tabName" and "apps".
+        """
+        old_count = len(self._tabs)
+        first = self._pinned
+        old_keys = [name for name, _ in self._tabs[first:]]
+        new_keys = [tab["tabName"] for tab in apps_by_tab]
+        opcodes = SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes()
+        # work backwards so the row numbers of earlier opcodes stay valid, the catalogue tabs start at row first
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    self._tabs[first + i1 + offset][1].set_apps(apps_by_tab[j1 + offset]["apps"])
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), first + i1, first + i2 - 1)
+                for _, apps in self._tabs[first + i1 : first + i2]:
+                    apps.deleteLater()
+                del self._tabs[first + i1 : first + i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                added = []
+                for tab in apps_by_tab[j1:j2]:
+                    apps = AppListModel(self)
+                    apps.set_apps(tab["apps"])
+                    added.append((tab["tabName"], apps))
+                self.beginInsertRows(QModelIndex(), first + i1, first + i1 + j2 - j1 - 1)
+                self._tabs[first + i1 : first + i1] = added
+                self.endInsertRows()
+        if len(self._tabs) != old_count:
+            self.countChanged.emit()
@@ -0,0 +1,197 @@
+import codecs
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from PySide6.QtCore import QObject, QSocketNotifier
+
+from core.debuglog import LogRingBuffer
+
+# Bytes read from a pipe per wakeup.
+CHUNK_SIZE = 64 * 1024
+# A partial line longer than this is passed on without waiting for its newline.
+MAX_PARTIAL_LINE = 64 * 1024
+
+
+class _PipeState:
+    """
+    Decoder state for one pipe watched by EventLoopOutputReader.
+    """
+
+    def __init__(self, pipe: Any, stream: str, log: LogRingBuffer) -> None:
+        self.pipe = pipe
+        self.fd = pipe.fileno()
+        self.stream = stream
+        self.log = log
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.partial = ""
+        self.notifier: Optional[QSocketNotifier] = None
+
+
+class EventLoopOutputReader(QObject):
+    """
+    Reads the output of every launched child from the Qt event loop.
+
+    The stdout and stderr pipes of each child are made non-blocking and
+    watched with QSocketNotifiers, so one event loop multiplexes all of them
+    without a thread per child. Each wakeup reads a large chunk and only the
+    complete lines in it are split off, stdout and stderr are kept apart and
+    every chunk is timestamped when it is read.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._pipes: Dict[int, _PipeState] = {}
+        self._open: Dict[int, int] = {}  # id(log) -> pipes still open
+
+    def popen_kwargs(self) -> Dict[str, Any]:
+        """
+        Arguments for subprocess.Popen so the child's output can be watched.
+
+        Returns:
+            The keyword arguments to pass to Popen.
+        """
+        return {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE, "bufsize": 0}
+
+    def watch(self, proc: subprocess.Popen, log: LogRingBuffer) -> None:
+        """
+        Start forwarding a child's output into a log buffer.
+
+        Args:
+            proc: The child, started with popen_kwargs().
+            log: The buffer to write lines to, closed once both pipes end.
+        """
+        pipes = [(pipe, name) for pipe, name in ((proc.stdout, "stdout"), (proc.stderr, "stderr")) if pipe]
+        self._open[id(log)] = len(pipes)
+        for pipe, name in pipes:
+            state = _PipeState(pipe, name, log)
+            os.set_blocking(state.fd, False)
+            state.notifier = QSocketNotifier(state.fd, QSocketNotifier.Read, self)
+            state.notifier.activated.connect(lambda *_, fd=state.fd: self._read(fd))
+            self._pipes[state.fd] = state
+        if not pipes:
+            log.close()
+
+    def shutdown(self) -> None:
+        """
+        Stop watching every pipe.
+        """
+        for fd in list(self._pipes):
+            self._finish(self._pipes[fd])
+
+    def _read(self, fd: int) -> None:
+        """
+        Read whatever is available on a pipe and pass on the complete lines.
+
+        Args:
+            fd: The pipe's file descriptor.
+        """
+        state = self._pipes.get(fd)
+        if state is None:
+            return
+        try:
+            chunk = os.read(fd, CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        timestamp = time.time()
+        if not chunk:
+            tail = state.partial + state.decoder.decode(b"", final=True)
+            if tail:
+                state.log.append(tail.rstrip("\r"), state.stream, timestamp)
+            self._finish(state)
+            return
+        text = state.partial + state.decoder.decode(chunk)
+        end = text.rfind("\n")
+        if end < 0:
+            state.partial = text
+            if len(text) > MAX_PARTIAL_LINE:
+                state.log.append(text, state.stream, timestamp)
+                state.partial = ""
+            return
+        state.partial = text[end + 1 :]
+        lines = text[:end].split("\n")
+        state.log.extend([line.rstrip("\r") for line in lines], state.stream, timestamp)
+
+    def _finish(self, state: _PipeState) -> None:
+        """
+        Stop watching a pipe and close the log once all of a child's pipes are done.
+
+        Args:
+            state: The pipe state.
+        """
+        if state.notifier is not None:
+            state.notifier.setEnabled(False)
+            state.notifier.deleteLater()
+            state.notifier = None
+        self._pipes.pop(state.fd, None)
+        state.pipe.close()
+        key = id(state.log)
+        self._open[key] -= 1
+        if self._open[key] == 0:
+            del self._open[key]
+            state.log.close()
+
+
+class ThreadedOutputReader:
+    """
+    Fallback reader using a thread per child with stderr merged into stdout.
+    """
+
+    def popen_kwargs(self) -> Dict[str, Any]:
+        """
+        Arguments for subprocess.Popen so the child's output can be read.
+
+        Returns:
+            The keyword arguments to pass to Popen.
+        """
+        return {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True, "bufsize": 1}
+
+    def watch(self, proc: subprocess.Popen, log: LogRingBuffer) -> None:
+        """
+        Start forwarding a child's output into a log buffer.
+
+        Args:
+            proc: The child, started with popen_kwargs().
+            log: The buffer to write lines to, closed when the output ends.
+        """
+
+        def read_output() -> None:
+            for line in proc.stdout:
+                log.append(line.rstrip())
+            proc.stdout.close()
+            log.close()
+
+        threading.Thread(target=read_output, daemon=True).start()
+
+    def shutdown(self) -> None:
+        """
+        Nothing to do, the reader threads are daemons.
+        """
+
+
+def create_output_reader(engine: str, parent: Optional[QObject] = None) -> Any:
+    """
+    Create the output reader for the configured I/O engine.
+
+    Args:
+        engine: "threads" for the thread per child fallback, anything else
+            selects the event loop reader.
+        parent: The parent QObject for the event loop reader.
+
+    Returns:
+        The output reader.
+    """
+    if engine == "threads":
+        return ThreadedOutputReader()
+    return EventLoopOutputReader(parent)
+
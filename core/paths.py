@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+APP_DIR_NAME = "AppLauncher"
+
+
+def cache_dir() -> Path:
+    """
+    Get the per-user cache directory for the launcher, creating it if needed.
+
+    Returns:
+        $XDG_CACHE_HOME/AppLauncher, which defaults to ~/.cache/AppLauncher.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    path = Path(base) / APP_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,370 @@
+import glob
+import heapq
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from core.procfs import session_pids
+
+DEFAULT_RATE_MB_S = 50.0
+DEFAULT_CHUNK_MB = 4.0
+DEFAULT_TTL_S = 600
+DEFAULT_DELAY_S = 0.3
+DEFAULT_MAX_LEARNED_FILES = 400
+# When /proc/<pid>/maps of a launched app is sampled to learn what it loads.
+DEFAULT_LEARN_AFTER_S: Tuple[float, ...] = (10.0, 60.0)
+
+# Local system files are already fast to read, only files elsewhere (the network shares) are learned.
+IGNORED_PREFIXES: Tuple[str, ...] = (
+    "/usr/",
+    "/lib/",
+    "/lib64/",
+    "/etc/",
+    "/proc/",
+    "/sys/",
+    "/dev/",
+    "/run/",
+    "/tmp/",
+    "/var/",
+    "/memfd:",
+)
+
+
+def mapped_files(pid: int) -> List[str]:
+    """
+    List the files a process has mapped, its binary and shared libraries.
+
+    Args:
+        pid: The process id.
+
+    Returns:
+        The paths in the order they appear in /proc/<pid>/maps, without duplicates.
+    """
+    seen: Dict[str, None] = {}
+    try:
+        with open(f"/proc/{pid}/maps", "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split(None, 5)
+                if len(fields) == 6 and fields[5].startswith("/"):
+                    seen.setdefault(fields[5].rstrip("\n"), None)
+    except OSError:
+        pass
+    return list(seen)
+
+
+def expand(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Expand the entries of a prefetch list, which may be glob patterns.
+
+    Args:
+        paths: Files or patterns such as /opt/hfs20.5/dsolib/*.so.
+
+    Yields:
+        Each matching path once.
+    """
+    seen: Set[str] = set()
+    for path in paths:
+        matches = sorted(glob.glob(path)) if glob.has_magic(path) else [path]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                yield match
+
+
+@dataclass
+class _Sample:
+    """
+    A launched app whose mapped files are still being sampled.
+    """
+
+    key: str
+    session: int
+    # monotonic times of the samples still to take, soonest first
+    due: List[float]
+    found: Dict[str, None] = field(default_factory=dict)
+
+
+class Prefetcher:
+    """
+    Pulls the files an app will need into the page cache before it is launched.
+
+    Large apps spend much of their start up paging the binary and libraries
+    in from the network file system. Each request asks the kernel to read a
+    list of files ahead with posix_fadvise(WILLNEED), on a single low
+    priority thread, rate limited so that many users hovering over icons do
+    not swamp the file servers. Requests only start after a short delay so
+    sweeping the mouse across the grid starts nothing, the newest request is
+    served first and any request can be cancelled. Files prefetched recently
+    are skipped.
+
+    The files each app maps are sampled from /proc after it is launched and
+    remembered, so the list improves without anyone writing it by hand. The
+    samples are taken by the same thread when they are due, in between
+    requests.
+    """
+
+    def __init__(
+        self,
+        rate_mb_s: float = DEFAULT_RATE_MB_S,
+        delay_s: float = DEFAULT_DELAY_S,
+        ttl_s: float = DEFAULT_TTL_S,
+        chunk_mb: float = DEFAULT_CHUNK_MB,
+        learned_path: Optional[Path] = None,
+        max_learned: int = DEFAULT_MAX_LEARNED_FILES,
+    ) -> None:
+        """
+        Initialize the prefetcher, its thread starts with the first request or launch to learn from.
+
+        Args:
+            rate_mb_s: Maximum megabytes per second asked to be read ahead.
+            delay_s: Seconds a request waits before starting, so it can be cancelled cheaply.
+            ttl_s: Seconds a prefetched file is assumed to stay cached.
+            chunk_mb: Megabytes asked for at a time, cancelling takes effect between chunks.
+            learned_path: Where the learned file lists are stored, None to not store them.
+            max_learned: Maximum number of learned files kept per app.
+        """
+        self._rate = rate_mb_s * 1024 * 1024
+        self._delay_s = delay_s
+        self._ttl_s = ttl_s
+        self._chunk = int(chunk_mb * 1024 * 1024)
+        self._learned_path = learned_path
+        self._max_learned = max_learned
+        self._cond = threading.Condition()
+        # key -> (when it may start, paths), the newest request is at the end
+        self._jobs: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        # (when it is due, order, sample) of the launches being learned from, soonest first
+        self._samples: List[Tuple[float, int, _Sample]] = []
+        self._sample_order = itertools.count()
+        self._current: Optional[str] = None
+        self._cancel_current = False
+        # path -> when it was last prefetched, oldest first, only used by the thread
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._learned: Dict[str, List[str]] = self._load_learned()
+
+    def learned(self, key: str) -> List[str]:
+        """
+        Get the files an app was seen to load.
+
+        Args:
+            key: The app's key, its executable path.
+
+        Returns:
+            The learned paths, most recently seen first.
+        """
+        with self._cond:
+            return list(self._learned.get(key, []))
+
+    def request(self, key: str, paths: List[str]) -> None:
+        """
+        Ask for files to be prefetched, replacing any queued request with the same key.
+
+        Args:
+            key: Identifies the request so it can be cancelled, e.g. the app's executable path.
+            paths: Files or glob patterns to read ahead.
+        """
+        with self._cond:
+            if self._stopped:
+                return
+            self._jobs.pop(key, None)
+            self._jobs[key] = (time.monotonic() + self._delay_s, list(paths))
+            self._start()
+            self._cond.notify()
+
+    def cancel(self, key: Optional[str] = None) -> None:
+        """
+        Drop a request, stopping it after the current chunk if it has started.
+
+        Args:
+            key: The request to drop, None for every request.
+        """
+        with self._cond:
+            if key is None:
+                self._jobs.clear()
+            else:
+                self._jobs.pop(key, None)
+            if self._current is not None and key in (None, self._current):
+                self._cancel_current = True
+
+    def learn(self, key: str, session: int, after_s: Iterable[float] = DEFAULT_LEARN_AFTER_S) -> None:
+        """
+        Record the files a launched app maps, sampled by the prefetch thread while it starts.
+
+        Args:
+            key: The app's key, its executable path.
+            session: The session id of the launched process, i.e. its pid.
+            after_s: Seconds after the launch to sample at.
+        """
+        now = time.monotonic()
+        due = sorted(now + at for at in after_s)
+        if not due:
+            return
+        with self._cond:
+            if self._stopped:
+                return
+            heapq.heappush(self._samples, (due[0], next(self._sample_order), _Sample(key, session, due)))
+            self._start()
+            self._cond.notify()
+
+    def shutdown(self) -> None:
+        """
+        Stop prefetching, the current chunk is finished first.
+        """
+        with self._cond:
+            self._stopped = True
+            self._jobs.clear()
+            self._samples.clear()
+            self._cancel_current = True
+            self._cond.notify()
+
+    def _start(self) -> None:
+        # called with the lock held
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="prefetch", daemon=True)
+            self._thread.start()
+
+    def _next_job(self) -> Optional[Union[_Sample, Tuple[str, List[str]]]]:
+        """
+        Wait for a sample that is due or the newest request whose delay has passed.
+
+        Samples come first, they are quick and have to be taken on time.
+
+        Returns:
+            The sample, a tuple of (key, paths) for a request, or None once stopped.
+        """
+        with self._cond:
+            self._current = None
+            while not self._stopped:
+                now = time.monotonic()
+                wait: Optional[float] = None
+                if self._samples:
+                    if self._samples[0][0] <= now:
+                        return heapq.heappop(self._samples)[2]
+                    wait = self._samples[0][0] - now
+                if self._jobs:
+                    key = next(reversed(self._jobs))
+                    start, paths = self._jobs[key]
+                    if start <= now:
+                        del self._jobs[key]
+                        self._current, self._cancel_current = key, False
+                        return key, paths
+                    wait = start - now if wait is None else min(wait, start - now)
+                self._cond.wait(wait)
+            return None
+
+    def _run(self) -> None:
+        try:
+            # lowest CPU priority for this thread only, Linux gives each thread its own nice value
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if isinstance(job, _Sample):
+                self._take_sample(job)
+                continue
+            for path in expand(job[1]):
+                if self._cancel_current:
+                    break
+                now = time.monotonic()
+                if now - self._recent.get(path, -self._ttl_s) < self._ttl_s:
+                    continue
+                self._recent[path] = now
+                self._recent.move_to_end(path)
+                # forget the files whose time is up, so the history does not grow for as long as the launcher runs
+                while self._recent and now - next(iter(self._recent.values())) >= self._ttl_s:
+                    self._recent.popitem(last=False)
+                self._read_ahead(path)
+
+    def _read_ahead(self, path: str) -> None:
+        """
+        Ask the kernel to read a file into the page cache, a chunk at a time at the rate limit.
+
+        Args:
+            path: The file.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            size = os.fstat(fd).st_size
+            for offset in range(0, size, self._chunk):
+                if self._cancel_current:
+                    return
+                length = min(self._chunk, size - offset)
+                started = time.monotonic()
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+                else:
+                    os.pread(fd, length, offset)
+                pause = length / self._rate - (time.monotonic() - started)
+                if pause > 0:
+                    time.sleep(pause)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _take_sample(self, sample: _Sample) -> None:
+        """
+        Sample the files mapped by every process in the app's session.
+
+        After the last sample, or once the app has exited, they are merged into its list.
+
+        Args:
+            sample: The launch being learned from.
+        """
+        pids = session_pids(sample.session)
+        for pid in pids:
+            for path in mapped_files(pid):
+                if not path.startswith(IGNORED_PREFIXES) and " (deleted)" not in path:
+                    sample.found.setdefault(path, None)
+        del sample.due[0]
+        with self._cond:
+            if self._stopped:
+                return
+            if pids and sample.due:
+                heapq.heappush(self._samples, (sample.due[0], next(self._sample_order), sample))
+                return
+            if not sample.found:
+                return
+            # files seen again move to the front, so a full list drops the ones no longer used
+            previous = [path for path in self._learned.get(sample.key, []) if path not in sample.found]
+            self._learned[sample.key] = (list(sample.found) + previous)[: self._max_learned]
+            learned = dict(self._learned)
+        self._save_learned(learned)
+
+    def _load_learned(self) -> Dict[str, List[str]]:
+        if self._learned_path is None:
+            return {}
+        try:
+            data = json.loads(self._learned_path.read_text(encoding="utf-8"))
+            return {str(key): [str(path) for path in paths] for key, paths in data["learned"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _save_learned(self, learned: Dict[str, List[str]]) -> None:
+        if self._learned_path is None:
+            return
+        path = self._learned_path
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"learned": learned}, f)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,320 @@
+import json
+import os
+import queue
+import stat
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_TTL_S = 600
+DEFAULT_WORKERS = 8
+
+STATUS_OK = "ok"
+STATUS_MISSING = "missing"
+STATUS_NOT_EXECUTABLE = "not executable"
+STATUS_TIMEOUT = "timeout"
+STATUS_BUNDLED = "bundled"
+
+KIND_EXEC = "exec"
+KIND_ICON = "icon"
+
+
+@dataclass
+class ProbeResult:
+    """
+    The outcome of checking one executable or icon path.
+    """
+
+    path: str
+    kind: str
+    status: str
+    checked: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status in (STATUS_OK, STATUS_BUNDLED)
+
+
+def executable_path(app: Dict[str, Any]) -> str:
+    """
+    Get the file an app launches.
+
+    Args:
+        app: The app dictionary.
+
+    Returns:
+        The path/execName the launcher runs.
+    """
+    return f"{app.get('path', '')}/{app.get('execName', '')}"
+
+
+def icon_path(icon: str) -> Optional[str]:
+    """
+    Get the local file an icon source refers to.
+
+    Args:
+        icon: The icon as written in apps.json, a file: URL or a resource path.
+
+    Returns:
+        The file system path, or None for icons bundled in the Qt resources.
+    """
+    if icon.startswith("file:"):
+        return "/" + icon[len("file:") :].lstrip("/")
+    return None
+
+
+def _check(path: str, kind: str) -> str:
+    """
+    Stat a path, this can block for a long time on a hung network mount.
+
+    Args:
+        path: The file to check.
+        kind: KIND_EXEC or KIND_ICON.
+
+    Returns:
+        The probe status.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return STATUS_MISSING
+    if kind == KIND_EXEC and (not stat.S_ISREG(info.st_mode) or not os.access(path, os.X_OK)):
+        return STATUS_NOT_EXECUTABLE
+    return STATUS_OK
+
+
+class Prober:
+    """
+    Checks that every executable and icon in the catalogue exists.
+
+    Paths are checked in parallel by a small pool of daemon threads. A check
+    that takes longer than the timeout (e.g. on a hung NFS mount) is reported
+    as timed out and its worker is abandoned and replaced, so one bad mount
+    cannot stall the rest of the report or block the launcher from exiting.
+    Results are cached on disk and reused until they are older than the TTL,
+    timeouts are not cached so they are retried next time.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        ttl_s: float = DEFAULT_TTL_S,
+        cache_path: Optional[Path] = None,
+        check: Callable[[str, str], str] = _check,
+    ) -> None:
+        """
+        Initialize the prober.
+
+        Args:
+            workers: Number of paths checked at once.
+            timeout: Seconds a single check may take.
+            ttl_s: Seconds a cached result stays valid.
+            cache_path: Where results are stored between runs, None to not cache.
+            check: Function taking (path, kind) and returning a status.
+        """
+        self._workers = workers
+        self._timeout = timeout
+        self._ttl_s = ttl_s
+        self._cache_path = cache_path
+        self._check = check
+        self._lock = threading.Lock()
+        self._results: Dict[str, ProbeResult] = self._load_cache()
+        # paths whose check timed out and has still not returned, they are not checked again until it does
+        self._hung: Set[str] = set()
+
+    def probe(self, apps: Iterable[Dict[str, Any]], force: bool = False) -> Dict[str, ProbeResult]:
+        """
+        Check the executable and icon of every app, blocks until done so call it off the GUI thread.
+
+        Args:
+            apps: The app dictionaries.
+            force: Check every path even if it has a fresh cached result.
+
+        Returns:
+            The result for every path, keyed by path.
+        """
+        now = time.time()
+        wanted: Dict[str, ProbeResult] = {}
+        for app in apps:
+            exec_path = executable_path(app)
+            wanted[exec_path] = ProbeResult(exec_path, KIND_EXEC, STATUS_TIMEOUT, now)
+            icon = str(app.get("icon") or "")
+            if icon:
+                path = icon_path(icon)
+                if path is None:
+                    wanted[icon] = ProbeResult(icon, KIND_ICON, STATUS_BUNDLED, now)
+                else:
+                    wanted[path] = ProbeResult(path, KIND_ICON, STATUS_TIMEOUT, now)
+        with self._lock:
+            cached = dict(self._results)
+        todo = []
+        for path, result in wanted.items():
+            fresh = cached.get(path)
+            if result.status == STATUS_BUNDLED or path in self._hung:
+                continue
+            if not force and fresh is not None and fresh.kind == result.kind and now - fresh.checked < self._ttl_s:
+                wanted[path] = fresh
+            else:
+                todo.append(result)
+        for result in self._run(todo):
+            wanted[result.path] = result
+        with self._lock:
+            self._results.update((path, r) for path, r in wanted.items() if r.status != STATUS_TIMEOUT)
+            self._save_cache()
+        return wanted
+
+    def _run(self, todo: List[ProbeResult]) -> List[ProbeResult]:
+        """
+        Check paths on the worker threads, a check still running after the timeout is given up on.
+
+        Args:
+            todo: Results to fill in, their status starts as STATUS_TIMEOUT.
+
+        Returns:
+            The same results with the status of every finished check set.
+        """
+        if not todo:
+            return []
+        jobs: "queue.Queue[ProbeResult]" = queue.Queue()
+        for result in todo:
+            jobs.put(result)
+        done = threading.Condition()
+        pending = [len(todo)]
+        # worker id -> (result being checked, when it started)
+        running: Dict[int, Any] = {}
+
+        def work(worker: int) -> None:
+            while True:
+                try:
+                    result = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                with done:
+                    running[worker] = (result, time.monotonic())
+                status = self._check(result.path, result.kind)
+                with done:
+                    if running.pop(worker, None) is None:
+                        # timed out and replaced, the result was already counted
+                        self._hung.discard(result.path)
+                        return
+                    result.status, result.checked = status, time.time()
+                    pending[0] -= 1
+                    done.notify_all()
+
+        def start(worker: int) -> None:
+            threading.Thread(target=work, args=(worker,), name=f"probe-{worker}", daemon=True).start()
+
+        next_worker = 0
+        for _ in range(min(self._workers, len(todo))):
+            start(next_worker)
+            next_worker += 1
+        with done:
+            while pending[0] > 0:
+                done.wait(self._timeout / 4)
+                now = time.monotonic()
+                for worker, (result, started) in list(running.items()):
+                    if now - started > self._timeout:
+                        del running[worker]
+                        self._hung.add(result.path)
+                        pending[0] -= 1
+                        start(next_worker)
+                        next_worker += 1
+        return todo
+
+    def _load_cache(self) -> Dict[str, ProbeResult]:
+        if self._cache_path is None:
+            return {}
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            return {entry["path"]: ProbeResult(**entry) for entry in data["results"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        payload = {"results": [asdict(r) for r in self._results.values()]}
+        fd, tmp = tempfile.mkstemp(dir=self._cache_path.parent, prefix=self._cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def unavailable_apps(apps: Iterable[Dict[str, Any]], results: Dict[str, ProbeResult]) -> Dict[str, str]:
+    """
+    Find the apps whose executable is missing.
+
+    Args:
+        apps: The app dictionaries.
+        results: The probe results from Prober.probe.
+
+    Returns:
+        App name to the reason it cannot be launched.
+    """
+    unavailable = {}
+    for app in apps:
+        result = results.get(executable_path(app))
+        if result is not None and result.status in (STATUS_MISSING, STATUS_NOT_EXECUTABLE):
+            unavailable[app["name"]] = f"{result.path} is {result.status}"
+    return unavailable
+
+
+def broken_icons(apps: Iterable[Dict[str, Any]], results: Dict[str, ProbeResult]) -> List[str]:
+    """
+    Find the apps whose icon file does not resolve.
+
+    Args:
+        apps: The app dictionaries.
+        results: The probe results from Prober.probe.
+
+    Returns:
+        The names of the apps with a broken or timed out icon.
+    """
+    broken = []
+    for app in apps:
+        path = icon_path(str(app.get("icon") or ""))
+        result = results.get(path) if path else None
+        if result is not None and not result.ok:
+            broken.append(app["name"])
+    return broken
+
+
+def format_report(apps: List[Dict[str, Any]], results: Dict[str, ProbeResult]) -> str:
+    """
+    Format a validation report listing every problem found.
+
+    Args:
+        apps: The app dictionaries.
+        results: The probe results from Prober.probe.
+
+    Returns:
+        The report text.
+    """
+    lines = []
+    problems = 0
+    for app in apps:
+        issues = []
+        exec_result = results.get(executable_path(app))
+        if exec_result is not None and not exec_result.ok:
+            issues.append(f"executable {exec_result.path}: {exec_result.status}")
+        path = icon_path(str(app.get("icon") or ""))
+        icon_result = results.get(path) if path else None
+        if icon_result is not None and not icon_result.ok:
+            issues.append(f"icon {icon_result.path}: {icon_result.status}")
+        if issues:
+            problems += 1
+            lines.append(f"{app['name']} ({app.get('tabName', '')})")
+            lines.extend(f"    {issue}" for issue in issues)
+    lines.append(f"{len(apps)} apps checked, {problems} with problems")
+    return "\n".join(lines)
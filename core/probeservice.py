@@ -0,0 +1,103 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from core.prober import DEFAULT_TTL_S, Prober, ProbeResult
+
+
+class ProbeService(QObject):
+    """
+    Runs the executable and icon prober in the background and publishes the results.
+
+    The prober's own pool does the stats, this service only keeps that work
+    off the GUI thread and repeats it whenever the cached results expire or
+    the catalogue changes. Apps set while a run is going are checked as soon
+    as it finishes, and its results for the old apps are not published.
+    """
+
+    results_changed = Signal()
+    _collected = Signal(object)
+
+    def __init__(
+        self, prober: Prober, refresh_interval_s: int = DEFAULT_TTL_S, parent: Optional[QObject] = None
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            prober: The prober to run.
+            refresh_interval_s: Seconds between runs, 0 to only run when asked.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._prober = prober
+        self._apps: List[Dict[str, Any]] = []
+        self._results: Dict[str, ProbeResult] = {}
+        self._pending: Optional[Future] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe")
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_interval_s * 1000)
+        self._timer.timeout.connect(self.refresh)
+        if refresh_interval_s > 0:
+            self._timer.start()
+        self._collected.connect(self._apply)
+
+    def set_apps(self, apps: List[Dict[str, Any]]) -> None:
+        """
+        Set the apps to check and start checking them.
+
+        Args:
+            apps: The app dictionaries.
+        """
+        self._apps = list(apps)
+        self.refresh()
+
+    def results(self) -> Dict[str, ProbeResult]:
+        """
+        Get the latest results.
+
+        Returns:
+            The result for every path, keyed by path.
+        """
+        return self._results
+
+    def refresh(self) -> None:
+        """
+        Check the apps on the worker thread, skipped if a run is still going.
+        """
+        if self._pending is not None and not self._pending.done():
+            return
+        apps = self._apps
+        self._pending = self._executor.submit(self._prober.probe, apps)
+        self._pending.add_done_callback(lambda future: self._on_done(apps, future))
+
+    def shutdown(self) -> None:
+        """
+        Stop checking, a run in progress is abandoned.
+        """
+        self._timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_done(self, apps: List[Dict[str, Any]], future: Future) -> None:
+        """
+        Hand the results back to the GUI thread, runs on the worker thread.
+
+        Args:
+            apps: The apps the run checked.
+            future: The finished probe future.
+        """
+        if future.cancelled():
+            return
+        # a failed run is still reported, set_apps may have been called while it ran
+        self._collected.emit((apps, None if future.exception() is not None else future.result()))
+
+    def _apply(self, run: Tuple[List[Dict[str, Any]], Optional[Dict[str, ProbeResult]]]) -> None:
+        apps, results = run
+        if apps is not self._apps:
+            # the catalogue changed during the run, check the new apps rather than publish the old ones
+            self.refresh()
+            return
+        if results is not None:
+            self._results = results
+            self.results_changed.emit()
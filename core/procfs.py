@@ -0,0 +1,103 @@
+import os
+from typing import Dict, List, Optional, Set
+
+
+def session_of(pid: int) -> Optional[int]:
+    """
+    Get the session a process belongs to.
+
+    Args:
+        pid: The process id.
+
+    Returns:
+        The session id, or None if the process no longer exists.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            # the command name can contain spaces so split after its closing bracket
+            return int(f.read().rsplit(b")", 1)[1].split()[3])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def session_leader_alive(session: int) -> bool:
+    """
+    Check whether the process that started a session is still in it, reading only its own stat file.
+
+    Args:
+        session: The session id, the pid of the launched process.
+
+    Returns:
+        True if the leader is running, False if it has exited (other processes may still be in the session).
+    """
+    return session_of(session) == session
+
+
+def session_pids(session: int) -> List[int]:
+    """
+    Find every process in a session, launched apps get their own session so this includes wrapper children.
+
+    Args:
+        session: The session id, the pid of the launched process.
+
+    Returns:
+        The pids in the session.
+    """
+    pids = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit() and session_of(int(entry)) == session:
+            pids.append(int(entry))
+    return pids
+
+
+def live_sessions() -> Set[int]:
+    """
+    Find every session that still has a process in it, in one pass over /proc.
+
+    Returns:
+        The session ids.
+    """
+    sessions = set()
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            session = session_of(int(entry))
+            if session is not None:
+                sessions.add(session)
+    return sessions
+
+
+def meminfo(path: str = "/proc/meminfo") -> Dict[str, int]:
+    """
+    Read the kernel's memory counters.
+
+    Args:
+        path: The meminfo file.
+
+    Returns:
+        The counters in kB keyed by name, e.g. "MemAvailable", empty if they cannot be read.
+    """
+    counters = {}
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                fields = value.split()
+                if fields and fields[0].isdigit():
+                    counters[name] = int(fields[0])
+    except OSError:
+        pass
+    return counters
+
+
+def available_memory_mb(path: str = "/proc/meminfo") -> Optional[float]:
+    """
+    Get how much memory can be used by new processes without swapping.
+
+    Args:
+        path: The meminfo file.
+
+    Returns:
+        MemAvailable in megabytes, or None if it is not known.
+    """
+    available = meminfo(path).get("MemAvailable")
+    return None if available is None else available / 1024
@@ -0,0 +1,279 @@
+import json
+import os
+import re
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from core.launch import app_command
+from core.prober import executable_path
+
+# apps.json keys that make up an app's launch profile.
+PROFILE_KEYS = ("env", "cwd", "pathPrepend", "libraryPathPrepend", "setupScript", "binary")
+
+DEFAULT_SETUP_TIMEOUT_S = 30.0
+
+# Set by the shell itself rather than by a setup script.
+SHELL_VARIABLES = frozenset({"_", "SHLVL", "PWD", "OLDPWD"})
+
+_VARIABLE_RE = re.compile(r"\$(?:\{(\w+)\}|(\w+))")
+
+# Sources the script, then prints the environment it left NUL separated. Its
+# output goes to stderr so anything it echoes cannot be mistaken for the environment.
+_CAPTURE = '. "$0" >&2 </dev/null && exec env -0'
+
+
+@dataclass
+class LaunchSpec:
+    """
+    How to start an app, the command with the environment and directory to run it in.
+    """
+
+    command: List[str]
+    # None to inherit the launcher's
+    env: Optional[Dict[str, str]] = None
+    cwd: Optional[str] = None
+    # why the profile could not be applied in full, e.g. the setup script failed
+    warning: str = ""
+
+
+def has_profile(app: Dict[str, Any]) -> bool:
+    """
+    Check if an app sets any part of a launch profile.
+
+    Args:
+        app: The app dictionary.
+
+    Returns:
+        True if it has any of PROFILE_KEYS.
+    """
+    return any(app.get(key) for key in PROFILE_KEYS)
+
+
+def expand_variables(value: str, env: Mapping[str, str]) -> str:
+    """
+    Replace $NAME and ${NAME} with their values, unset variables become empty as in a shell.
+
+    Args:
+        value: The text.
+        env: The variables.
+
+    Returns:
+        The expanded text, with a leading ~ expanded to the home directory.
+    """
+    value = _VARIABLE_RE.sub(lambda m: env.get(m.group(1) or m.group(2), ""), value)
+    return os.path.expanduser(value)
+
+
+def prepend_paths(current: Optional[str], paths: Iterable[str]) -> str:
+    """
+    Put directories in front of a colon separated search path, without repeating any.
+
+    Args:
+        current: The current value, None or empty if unset.
+        paths: The directories, first is searched first.
+
+    Returns:
+        The new value.
+    """
+    entries = list(dict.fromkeys([*paths, *(current.split(":") if current else [])]))
+    return ":".join(entry for entry in entries if entry)
+
+
+def capture_environment(
+    script: str, base_env: Mapping[str, str], timeout: float = DEFAULT_SETUP_TIMEOUT_S
+) -> Dict[str, Optional[str]]:
+    """
+    Source a setup script in bash and record what it changed in the environment.
+
+    Only the changes are kept, so variables that belong to the session
+    such as DISPLAY are taken from the launcher at each launch rather than
+    from whenever the script was captured.
+
+    Args:
+        script: The script, as a wrapper would source it.
+        base_env: The environment it is sourced in.
+        timeout: Seconds to wait for it.
+
+    Returns:
+        The variables it set or changed, None for the ones it unset.
+
+    Raises:
+        OSError: If bash cannot be run, the script fails or takes too long.
+    """
+    try:
+        result = subprocess.run(
+            ["bash", "-c", _CAPTURE, script],
+            env=dict(base_env),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise OSError(f"{script} took longer than {timeout:g}s") from e
+    if result.returncode != 0 or not result.stdout:
+        # a script that calls exit leaves no environment to print
+        lines = result.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise OSError(f"{script} failed: {lines[-1] if lines else f'exit code {result.returncode}'}")
+    after = {}
+    for item in result.stdout.decode("utf-8", "surrogateescape").split("\0"):
+        name, separator, value = item.partition("=")
+        if separator and name not in SHELL_VARIABLES:
+            after[name] = value
+    changes: Dict[str, Optional[str]] = {name: value for name, value in after.items() if base_env.get(name) != value}
+    changes.update({name: None for name in base_env if name not in after and name not in SHELL_VARIABLES})
+    return changes
+
+
+def _stat_signature(path: str) -> List[int]:
+    info = os.stat(path)
+    return [info.st_mtime_ns, info.st_size]
+
+
+class EnvironmentCache:
+    """
+    The environments captured from setup scripts, kept on disk between runs.
+
+    A script is sourced once and its changes reused until its mtime or size,
+    or that of the wrapper that normally sources it, changes. Launching an
+    app then no longer starts a shell to source the same licence and plugin
+    settings every time.
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = DEFAULT_SETUP_TIMEOUT_S) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: Where the captured environments are stored, None to keep them in memory only.
+            timeout: Seconds a setup script may take.
+        """
+        self._path = path
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        # script -> {"signature": mtime and size of it and its wrapper, "changes"}
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def changes(
+        self, script: str, base_env: Mapping[str, str], wrapper: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get what a setup script changes in the environment, sourcing it only if it changed since last time.
+
+        Args:
+            script: The setup script.
+            base_env: The environment it is sourced in if it has to be.
+            wrapper: The app's wrapper script, the capture is also redone when it changes.
+
+        Returns:
+            The variables it sets or changes, None for the ones it unsets.
+
+        Raises:
+            OSError: If the script cannot be read or sourced.
+        """
+        signature = [_stat_signature(script)]
+        if wrapper:
+            try:
+                signature.append(_stat_signature(wrapper))
+            except OSError:
+                # the wrapper is only watched, the app can still be started without it
+                pass
+        with self._lock:
+            entry = self._entries.get(script)
+        if entry is not None and entry["signature"] == signature:
+            return dict(entry["changes"])
+        changes = capture_environment(script, base_env, self._timeout)
+        with self._lock:
+            self._entries[script] = {"signature": signature, "changes": changes}
+            entries = dict(self._entries)
+        self._save(entries)
+        return dict(changes)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._path is None:
+            return {}
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            return {
+                str(script): {"signature": [list(map(int, s)) for s in e["signature"]], "changes": dict(e["changes"])}
+                for script, e in data["environments"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if self._path is None:
+            return
+        path = self._path
+        # mkstemp makes it readable by the user only, licence settings can be in here
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"environments": entries}, f)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def resolve_launch(
+    app: Dict[str, Any],
+    extra_flags: Iterable[Any] = (),
+    cache: Optional[EnvironmentCache] = None,
+    base_env: Optional[Mapping[str, str]] = None,
+) -> LaunchSpec:
+    """
+    Work out how to start an app from its launch profile.
+
+    The environment is built from the launcher's, then what "setupScript"
+    changes in it, then "env" (values may use $NAME of what is set so far),
+    then "pathPrepend" and "libraryPathPrepend" in front of PATH and
+    LD_LIBRARY_PATH. With "binary" the real executable is run directly
+    rather than the wrapper in "path"/"execName". If the setup script cannot
+    be sourced the wrapper is run instead, as it sets up its own environment.
+    This can source a script, so call it off the GUI thread for apps with one.
+
+    Args:
+        app: The app dictionary.
+        extra_flags: Flags appended after the app's own.
+        cache: Where setup script environments are kept, a new in-memory one by default.
+        base_env: The environment to start from, the launcher's by default.
+
+    Returns:
+        The command, environment and working directory.
+    """
+    if not has_profile(app):
+        return LaunchSpec(app_command(app, extra_flags))
+    env = dict(os.environ if base_env is None else base_env)
+    flags = [str(flag) for flag in [*(app.get("flags") or []), *extra_flags]]
+    warning = ""
+    direct = bool(app.get("binary"))
+    script = app.get("setupScript")
+    if script:
+        try:
+            changes = (cache or EnvironmentCache()).changes(expand_variables(script, env), env, executable_path(app))
+            for name, value in changes.items():
+                if value is None:
+                    env.pop(name, None)
+                else:
+                    env[name] = value
+        except OSError as e:
+            warning = f"{app['name']} started through its wrapper, the setup script could not be used: {e}"
+            direct = False
+    for name, value in (app.get("env") or {}).items():
+        env[name] = expand_variables(str(value), env)
+    if app.get("pathPrepend"):
+        env["PATH"] = prepend_paths(env.get("PATH"), (expand_variables(p, env) for p in app["pathPrepend"]))
+    if app.get("libraryPathPrepend"):
+        env["LD_LIBRARY_PATH"] = prepend_paths(
+            env.get("LD_LIBRARY_PATH"), (expand_variables(p, env) for p in app["libraryPathPrepend"])
+        )
+    command = [expand_variables(app["binary"], env), *flags] if direct else app_command(app, extra_flags)
+    cwd = expand_variables(app["cwd"], env) if app.get("cwd") else None
+    return LaunchSpec(command, env, cwd, warning)
@@ -0,0 +1,162 @@
+import getpass
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+QuotaEntry = Dict[str, Union[str, float]]
+
+DEFAULT_MOUNTS: List[str] = ["/transfer"]
+DEFAULT_TIMEOUT = 10.0
+
+_GB = 1024**3
+
+
+def parse_size_to_gigabytes(value: str) -> float:
+    """
+    Convert a human readable size from quota -s (e.g. "1.5G", "800M") to gigabytes.
+
+    Args:
+        value: The size string, a trailing "*" marks an exceeded quota.
+
+    Returns:
+        The size in gigabytes, 0 if it could not be parsed.
+    """
+    match = re.match(r"([\d.]+)([KMGTP]?)", value.strip())
+    if not match:
+        return 0.0
+    num, unit = match.groups()
+    unit_multipliers = {
+        "": 1,
+        "K": 1024,
+        "M": 1024**2,
+        "G": 1024**3,
+        "T": 1024**4,
+        "P": 1024**5,
+    }
+    return round(float(num) * unit_multipliers.get(unit, 1) / _GB, 2)
+
+
+class QuotaProvider(ABC):
+    """
+    Base class for a source of disk usage, subclass and implement collect.
+    """
+
+    location: str = ""
+
+    @abstractmethod
+    def collect(self, timeout: float = DEFAULT_TIMEOUT) -> Optional[QuotaEntry]:
+        """
+        Collect the usage for this provider, may block so it is run off the GUI thread.
+
+        Args:
+            timeout: Seconds to allow any subprocess to run for.
+
+        Returns:
+            A dictionary with location, used, quota and limit in GB, or None if unavailable.
+        """
+
+
+class UserQuotaProvider(QuotaProvider):
+    """
+    The user's home directory quota as reported by quota -u -s.
+    """
+
+    def __init__(self) -> None:
+        self.location = str(Path.home())
+
+    def collect(self, timeout: float = DEFAULT_TIMEOUT) -> Optional[QuotaEntry]:
+        try:
+            output = subprocess.check_output(
+                ["quota", "-u", "-s", getpass.getuser()], text=True, timeout=timeout, stderr=subprocess.DEVNULL
+            )
+            numbers = output.strip().splitlines()[3].split()
+            return {
+                "location": self.location,
+                "used": parse_size_to_gigabytes(numbers[0]),
+                "quota": parse_size_to_gigabytes(numbers[1]),
+                "limit": parse_size_to_gigabytes(numbers[2]),
+            }
+        except (OSError, subprocess.SubprocessError, IndexError):
+            return None
+
+
+class MountUsageProvider(QuotaProvider):
+    """
+    Usage of the file system a path is mounted on.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.location = path
+
+    def collect(self, timeout: float = DEFAULT_TIMEOUT) -> Optional[QuotaEntry]:
+        try:
+            usage = shutil.disk_usage(self.location)
+        except OSError:
+            return None
+        return {
+            "location": self.location,
+            "limit": round(usage.total / _GB, 2),
+            "used": round(usage.used / _GB, 2),
+            "quota": round(usage.free / _GB, 2),
+        }
+
+
+def create_providers(mounts: Optional[List[str]] = None) -> List[QuotaProvider]:
+    """
+    Create the default providers, the user quota followed by each mount point.
+
+    Args:
+        mounts: Paths to report disk usage for, defaults to DEFAULT_MOUNTS.
+
+    Returns:
+        The list of providers.
+    """
+    providers: List[QuotaProvider] = [UserQuotaProvider()]
+    providers.extend(MountUsageProvider(path) for path in (DEFAULT_MOUNTS if mounts is None else mounts))
+    return providers
+
+
+def load_cache(path: Path) -> Dict[str, Any]:
+    """
+    Load previously collected quotas.
+
+    Args:
+        path: The cache file.
+
+    Returns:
+        A dictionary with "timestamp" and "quotas", empty values if there is no usable cache.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {"timestamp": float(data["timestamp"]), "quotas": list(data["quotas"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"timestamp": 0.0, "quotas": []}
+
+
+def save_cache(path: Path, quotas: List[QuotaEntry], timestamp: Optional[float] = None) -> None:
+    """
+    Save collected quotas, written to a temporary file and renamed into place.
+
+    Args:
+        path: The cache file.
+        quotas: The quota entries.
+        timestamp: When they were collected, defaults to now.
+    """
+    payload = {"timestamp": time.time() if timestamp is None else timestamp, "quotas": quotas}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
@@ -0,0 +1,141 @@
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from core.paths import cache_dir
+from core.quota import DEFAULT_TIMEOUT, QuotaEntry, QuotaProvider, load_cache, save_cache
+
+DEFAULT_REFRESH_INTERVAL_S = 300
+
+
+class QuotaService(QObject):
+    """
+    Collects disk quotas in the background and caches the last result on disk.
+
+    At start up the cached quotas are served straight away, then every
+    provider is queried on its own daemon thread with a timeout and again on
+    a fixed interval. Each provider's result is applied as soon as it
+    arrives. A provider that hangs (e.g. statvfs on a stale NFS mount, which
+    cannot be timed out) keeps its last known value, is not queried again
+    until it returns and does not keep the launcher from exiting.
+    """
+
+    quotas_changed = Signal()
+    _collected = Signal(object)
+
+    def __init__(
+        self,
+        providers: List[QuotaProvider],
+        refresh_interval_s: int = DEFAULT_REFRESH_INTERVAL_S,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_path: Optional[Path] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            providers: The quota providers to query, in display order.
+            refresh_interval_s: Seconds between refreshes, 0 to only refresh at start.
+            timeout: Seconds each provider may spend in a subprocess.
+            cache_path: Where the last result is stored, defaults to the user cache dir.
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._providers = list(providers)
+        self._timeout = timeout
+        self._cache_path = cache_path or cache_dir() / "quotas.json"
+        cached = load_cache(self._cache_path)
+        self._by_location: Dict[str, QuotaEntry] = {entry["location"]: entry for entry in cached["quotas"]}
+        # ids of the providers whose query is still running, only touched on the GUI thread
+        self._in_flight: Set[int] = set()
+        self._refresh_interval_s = refresh_interval_s
+        self._stopped = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_interval_s * 1000)
+        self._timer.timeout.connect(self.refresh)
+        self._collected.connect(self._apply)
+
+    def add_provider(self, provider: QuotaProvider) -> None:
+        """
+        Add another source of quota information.
+
+        Args:
+            provider: The provider to add, it is queried on the next refresh.
+        """
+        self._providers.append(provider)
+
+    def start(self) -> None:
+        """
+        Start the first refresh once the event loop is running, then refresh periodically.
+        """
+        QTimer.singleShot(0, self.refresh)
+        if self._refresh_interval_s > 0:
+            self._timer.start()
+
+    def shutdown(self) -> None:
+        """
+        Stop refreshing, providers still running are abandoned, their threads are daemons.
+        """
+        self._stopped = True
+        self._timer.stop()
+
+    def quotas(self) -> List[QuotaEntry]:
+        """
+        Get the latest quotas for every provider that has reported.
+
+        Returns:
+            The quota entries in provider order, "updated" is when each was collected.
+        """
+        ordered = [self._by_location[p.location] for p in self._providers if p.location in self._by_location]
+        return [
+            dict(entry, updated=time.strftime("%d/%m %H:%M", time.localtime(float(entry.get("timestamp", 0)))))
+            for entry in ordered
+        ]
+
+    def refresh(self) -> None:
+        """
+        Query every provider on its own thread, the result is applied on the GUI thread.
+        """
+        # the first refresh is queued by start(), it can arrive after shutdown
+        if self._stopped:
+            return
+        for provider in self._providers:
+            if id(provider) in self._in_flight:
+                continue
+            self._in_flight.add(id(provider))
+            threading.Thread(target=self._collect, args=(provider,), name="quota", daemon=True).start()
+
+    def _collect(self, provider: QuotaProvider) -> None:
+        """
+        Query one provider and hand the result back to the GUI thread, runs on the provider's thread.
+
+        Args:
+            provider: The provider.
+        """
+        try:
+            entry = provider.collect(self._timeout)
+        except Exception as e:
+            print(f"Quota for {provider.location} not collected: {e}")
+            entry = None
+        # the service may be gone by now if the provider hung until the launcher was quitting
+        if not self._stopped:
+            self._collected.emit((id(provider), entry))
+
+    def _apply(self, result: Tuple[int, Optional[QuotaEntry]]) -> None:
+        """
+        Merge a provider's result, save it and notify QML.
+
+        Args:
+            result: The provider's id and the quota entry it collected, None if it had none.
+        """
+        provider_id, entry = result
+        self._in_flight.discard(provider_id)
+        if not entry or self._stopped:
+            return
+        self._by_location[entry["location"]] = dict(entry, timestamp=time.time())
+        save_cache(self._cache_path, list(self._by_location.values()))
+        self.quotas_changed.emit()
@@ -0,0 +1,302 @@
+import itertools
+import shutil
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from core.procfs import available_memory_mb, live_sessions, session_leader_alive
+
+DEFAULT_DEBOUNCE_S = 2.0
+# 0 means no limit on the number of apps running at once.
+DEFAULT_MAX_RUNNING = 0
+DEFAULT_MIN_AVAILABLE_MB = 1024
+DEFAULT_QUEUE_TIMEOUT_S = 600
+
+# Launch decisions.
+LAUNCH = "launch"
+QUEUE = "queue"
+FOCUS = "focus"
+REFUSE = "refuse"
+IGNORE = "ignore"
+
+IONICE_CLASSES = {"realtime": "1", "best-effort": "2", "idle": "3"}
+
+
+def resource_prefix(
+    app: Dict[str, Any], default_nice: int = 0, which: Callable[[str], Any] = shutil.which
+) -> List[str]:
+    """
+    Build the commands that start an app with lower priority or in a resource limited cgroup.
+
+    The app's "limits" are systemd resource control properties, e.g.
+    {"MemoryMax": "16G", "CPUQuota": "400%"}, applied with a transient
+    systemd-run scope. "ionice" is a class name or number and "nice" a niceness.
+    Each is skipped if its tool is not installed. They all exec the app so its
+    pid is the one launched.
+
+    Args:
+        app: The app dictionary.
+        default_nice: Niceness for apps that do not set their own.
+        which: Finds a tool on the PATH.
+
+    Returns:
+        The command line to put in front of the app's own.
+    """
+    prefix: List[str] = []
+    limits = app.get("limits") or {}
+    if limits and which("systemd-run"):
+        prefix += ["systemd-run", "--user", "--scope", "--quiet", "--collect"]
+        prefix += [f"--property={name}={value}" for name, value in limits.items()]
+        prefix.append("--")
+    ionice = app.get("ionice")
+    if ionice and which("ionice"):
+        prefix += ["ionice", "-c", IONICE_CLASSES.get(str(ionice), str(ionice))]
+    nice = int(app.get("nice", default_nice) or 0)
+    if nice and which("nice"):
+        prefix += ["nice", "-n", str(nice)]
+    return prefix
+
+
+@dataclass
+class LaunchDecision:
+    """
+    What to do with a launch request and why.
+    """
+
+    action: str
+    reason: str = ""
+    # the session of the running instance to focus
+    session: Optional[int] = None
+
+
+@dataclass
+class QueuedLaunch:
+    """
+    A launch waiting for memory or for another app to close.
+    """
+
+    app: Dict[str, Any]
+    queued_at: float
+    reason: str
+
+
+class LaunchScheduler:
+    """
+    Decides whether a launch starts now, waits, or is not needed.
+
+    Repeated clicks on the same app are ignored for a short time. An app
+    with "maxInstances" in apps.json is refused, or its running instance is
+    focused when it has "focusExisting", once that many are running. When
+    more apps are running than the global limit, or less memory is available
+    than the app needs ("minMemoryMB", else the default), the launch is
+    queued and started by due() once it can be.
+
+    Running instances are counted per session, so an app started by a
+    wrapper script counts until every process it started has exited. While
+    the launched processes are running only their own /proc entries are
+    read, all of /proc is only scanned once one of them has exited. A launch
+    that was decided but has not started a process yet, e.g. while its setup
+    script is sourced, holds its place through reserve().
+    This has no Qt dependency, the caller polls due() and reports the results.
+    """
+
+    def __init__(
+        self,
+        max_running: int = DEFAULT_MAX_RUNNING,
+        min_available_mb: float = DEFAULT_MIN_AVAILABLE_MB,
+        debounce_s: float = DEFAULT_DEBOUNCE_S,
+        queue_timeout_s: float = DEFAULT_QUEUE_TIMEOUT_S,
+        focus_existing: bool = False,
+        memory: Callable[[], Optional[float]] = available_memory_mb,
+        sessions: Callable[[], Set[int]] = live_sessions,
+        leader_alive: Callable[[int], bool] = session_leader_alive,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_running: Apps that may run at once, 0 for no limit.
+            min_available_mb: Megabytes that must be available to start an app.
+            debounce_s: Seconds in which another request for the same app is ignored.
+            queue_timeout_s: Seconds a queued launch waits before it is dropped.
+            focus_existing: Focus a running instance instead of starting another, for every app.
+            memory: Returns the available megabytes, None if unknown.
+            sessions: Returns the ids of the sessions that still have processes.
+            leader_alive: Checks whether the launched process of a session is still running.
+            clock: Returns the time in seconds.
+        """
+        self.max_running = max_running
+        self.min_available_mb = min_available_mb
+        self.debounce_s = debounce_s
+        self.queue_timeout_s = queue_timeout_s
+        self.focus_existing = focus_existing
+        self._memory = memory
+        self._sessions = sessions
+        self._leader_alive = leader_alive
+        self._clock = clock
+        self._last_request: Dict[str, float] = {}
+        # session id -> app name, in launch order
+        self._running: Dict[int, str] = {}
+        # reservation -> app name, launches decided whose process is not started yet
+        self._starting: Dict[int, str] = {}
+        self._reservations = itertools.count(1)
+        self._queue: List[QueuedLaunch] = []
+
+    def request(self, app: Dict[str, Any]) -> LaunchDecision:
+        """
+        Decide what to do when the user asks for an app, queueing it if it has to wait.
+
+        Args:
+            app: The app dictionary.
+
+        Returns:
+            The decision, call reserve() if it is LAUNCH, then started() once the app was started.
+        """
+        name = app["name"]
+        now = self._clock()
+        if now - self._last_request.get(name, -self.debounce_s) < self.debounce_s:
+            return LaunchDecision(IGNORE, f"{name} is already starting")
+        self._last_request[name] = now
+        if any(queued.app["name"] == name for queued in self._queue):
+            return LaunchDecision(IGNORE, f"{name} is already waiting to start")
+        self.refresh()
+        sessions = [session for session, running in self._running.items() if running == name]
+        starting = sum(1 for starting_name in self._starting.values() if starting_name == name)
+        if app.get("focusExisting", self.focus_existing) in (True, "true"):
+            if sessions:
+                return LaunchDecision(FOCUS, f"{name} is already running", sessions[-1])
+            if starting:
+                return LaunchDecision(IGNORE, f"{name} is already starting")
+        limit = int(app.get("maxInstances", 0) or 0)
+        count = len(sessions) + starting
+        if limit and count >= limit:
+            return LaunchDecision(REFUSE, f"{name} is already running ({count} of {limit} allowed)")
+        reason = self._wait_reason(app)
+        if reason:
+            self._queue.append(QueuedLaunch(app, now, reason))
+            return LaunchDecision(QUEUE, f"{name} queued, {reason}")
+        return LaunchDecision(LAUNCH)
+
+    def reserve(self, app_name: str) -> int:
+        """
+        Count an app as running from when its launch is decided until its process is started.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The reservation to pass to started(), or to release() if the app could not be started.
+        """
+        reservation = next(self._reservations)
+        self._starting[reservation] = app_name
+        return reservation
+
+    def release(self, reservation: int) -> None:
+        """
+        Stop counting a reserved launch that did not start.
+
+        Args:
+            reservation: What reserve() returned.
+        """
+        self._starting.pop(reservation, None)
+
+    def started(self, app_name: str, session: int, reservation: Optional[int] = None) -> None:
+        """
+        Count a launched app as running.
+
+        Args:
+            app_name: The app name.
+            session: The session id, the pid of the launched process.
+            reservation: What reserve() returned for the launch, if anything.
+        """
+        if reservation is not None:
+            self.release(reservation)
+        self._running[session] = app_name
+
+    def running(self, app_name: Optional[str] = None) -> int:
+        """
+        Count the running apps started through the scheduler, including those still starting.
+
+        Args:
+            app_name: Only count this app, None for every app.
+
+        Returns:
+            The number of running instances.
+        """
+        names = itertools.chain(self._running.values(), self._starting.values())
+        return sum(1 for name in names if app_name is None or name == app_name)
+
+    def queued(self) -> List[QueuedLaunch]:
+        """
+        Get the launches waiting to start.
+
+        Returns:
+            The queued launches, oldest first.
+        """
+        return list(self._queue)
+
+    def cancel(self, app_name: str) -> bool:
+        """
+        Remove an app from the queue.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            True if it was queued.
+        """
+        before = len(self._queue)
+        self._queue = [queued for queued in self._queue if queued.app["name"] != app_name]
+        return len(self._queue) != before
+
+    def refresh(self) -> None:
+        """
+        Stop counting apps whose processes have all exited.
+        """
+        # a session whose launched process is running is alive, only the others need the scan of /proc
+        if not all(map(self._leader_alive, self._running)):
+            alive = self._sessions()
+            self._running = {session: name for session, name in self._running.items() if session in alive}
+
+    def due(self) -> Tuple[Optional[Dict[str, Any]], List[QueuedLaunch]]:
+        """
+        Find the queued launch that can start now, call this regularly while anything is queued.
+
+        At most one app is released per call, so the memory it takes is seen
+        before the next one is considered. Queued apps that need less than
+        the oldest one are not held up behind it.
+
+        Returns:
+            A tuple of (the app to launch or None, the launches that waited too long and were dropped).
+        """
+        self.refresh()
+        now = self._clock()
+        expired = [queued for queued in self._queue if now - queued.queued_at > self.queue_timeout_s]
+        self._queue = [queued for queued in self._queue if queued not in expired]
+        for queued in self._queue:
+            reason = self._wait_reason(queued.app)
+            if not reason:
+                self._queue.remove(queued)
+                return queued.app, expired
+            queued.reason = reason
+        return None, expired
+
+    def _wait_reason(self, app: Dict[str, Any]) -> str:
+        """
+        Check whether an app has to wait before it starts.
+
+        Args:
+            app: The app dictionary.
+
+        Returns:
+            Why it has to wait, empty if it can start now.
+        """
+        running = len(self._running) + len(self._starting)
+        if self.max_running and running >= self.max_running:
+            return f"waiting for one of the {running} running apps to close"
+        needed = float(app.get("minMemoryMB", self.min_available_mb) or 0)
+        available = self._memory() if needed else None
+        if available is not None and available < needed:
+            return f"waiting for memory, {available / 1024:.1f} GB free of {needed / 1024:.1f} GB needed"
+        return ""
@@ -0,0 +1,304 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Fields of an apps.json entry. "type" is a type or tuple of types, "items"
+# the type of list items, "values" the type of dictionary values,
+# "choices" the allowed values and "min"/"max" bounds for numbers.
+APP_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "path": {"type": str, "required": True, "nonempty": True},
+    "execName": {"type": str, "required": True, "nonempty": True},
+    "tabName": {"type": str, "required": True, "nonempty": True},
+    "desc": {"type": str},
+    "icon": {"type": str},
+    "popup": {"type": bool},
+    "flags": {"type": list, "items": (str, int, float)},
+    "prefetch": {"type": (str, list), "items": str},
+    "limits": {"type": dict, "values": (str, int, float)},
+    "ionice": {"type": (str, int), "choices": ("realtime", "best-effort", "idle", 1, 2, 3, "1", "2", "3")},
+    "nice": {"type": int, "min": -20, "max": 19},
+    "maxInstances": {"type": int, "min": 0},
+    "focusExisting": {"type": bool},
+    "minMemoryMB": {"type": (int, float), "min": 0},
+    "env": {"type": dict, "values": (str, int, float)},
+    "cwd": {"type": str, "nonempty": True},
+    "pathPrepend": {"type": list, "items": str},
+    "libraryPathPrepend": {"type": list, "items": str},
+    "setupScript": {"type": str, "nonempty": True},
+    "binary": {"type": str, "nonempty": True},
+}
+
+TypeSpec = Union[type, Tuple[type, ...]]
+
+
+@dataclass(frozen=True)
+class ValidationError:
+    """
+    One problem found in a catalogue.
+    """
+
+    app: str
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        where = f"{self.app}.{self.field}" if self.field else self.app
+        return f"{where}: {self.message}" if where else self.message
+
+
+# Checks one field value, returns the problem or an empty string.
+FieldCheck = Callable[[Any], str]
+# Validates one entry given its name.
+EntryValidator = Callable[[str, Any], List[ValidationError]]
+
+
+def _type_name(types: TypeSpec) -> str:
+    names = {
+        str: "a string",
+        bool: "true or false",
+        int: "an integer",
+        float: "a number",
+        list: "a list",
+        dict: "an object",
+    }
+    types = types if isinstance(types, tuple) else (types,)
+    return " or ".join(names.get(t, t.__name__) for t in types)
+
+
+def _is_instance(value: Any, types: TypeSpec) -> bool:
+    # JSON true and false load as bool, which Python also counts as an int
+    if isinstance(value, bool):
+        return bool in (types if isinstance(types, tuple) else (types,))
+    return isinstance(value, types)
+
+
+def _compile_field(spec: Dict[str, Any]) -> FieldCheck:
+    """
+    Turn a field's spec into one function, so the spec is read once rather than for every entry.
+
+    Args:
+        spec: The field's entry in the schema.
+
+    Returns:
+        The check.
+    """
+    checks: List[FieldCheck] = []
+    types = spec["type"]
+    expected = _type_name(types)
+    if bool in (types if isinstance(types, tuple) else (types,)):
+
+        def check_type(value: Any) -> str:
+            if isinstance(value, str) and value in ("true", "false"):
+                return f'must be {expected}, not the string "{value}"'
+            return "" if _is_instance(value, types) else f"must be {expected}"
+
+    else:
+
+        def check_type(value: Any) -> str:
+            return "" if _is_instance(value, types) else f"must be {expected}"
+
+    checks.append(check_type)
+    if spec.get("nonempty"):
+        checks.append(lambda value: "" if str(value).strip() else "must not be empty")
+    if "items" in spec:
+        items, item_name = spec["items"], _type_name(spec["items"])
+        checks.append(
+            lambda value: ""
+            if not isinstance(value, list) or all(_is_instance(item, items) for item in value)
+            else f"items must be {item_name}"
+        )
+    if "values" in spec:
+        values, value_name = spec["values"], _type_name(spec["values"])
+        checks.append(
+            lambda value: ""
+            if not isinstance(value, dict) or all(_is_instance(v, values) for v in value.values())
+            else f"values must be {value_name}"
+        )
+    if "choices" in spec:
+        choices = spec["choices"]
+        listed = ", ".join(str(choice) for choice in dict.fromkeys(map(str, choices)))
+        checks.append(lambda value: "" if value in choices else f"must be one of {listed}")
+    if "min" in spec or "max" in spec:
+        low, high = spec.get("min"), spec.get("max")
+
+        def check_range(value: Any) -> str:
+            if not _is_instance(value, (int, float)):
+                return ""
+            if (low is not None and value < low) or (high is not None and value > high):
+                return f"must be between {low} and {high}" if high is not None else f"must be at least {low}"
+            return ""
+
+        checks.append(check_range)
+
+    def check(value: Any) -> str:
+        # later checks assume the type is right, so stop at the first problem
+        for one in checks:
+            problem = one(value)
+            if problem:
+                return problem
+        return ""
+
+    return check
+
+
+def compile_schema(schema: Optional[Dict[str, Dict[str, Any]]] = None) -> EntryValidator:
+    """
+    Build a validator for catalogue entries.
+
+    Args:
+        schema: The field specs, APP_SCHEMA by default.
+
+    Returns:
+        A function taking an app name and its entry and returning every problem with it.
+    """
+    schema = APP_SCHEMA if schema is None else schema
+    checks = {field: _compile_field(spec) for field, spec in schema.items()}
+    required = [field for field, spec in schema.items() if spec.get("required")]
+    known = ", ".join(schema)
+
+    def validate(app_name: str, entry: Any) -> List[ValidationError]:
+        if not isinstance(entry, dict):
+            return [ValidationError(app_name, "", "must be an object")]
+        errors = [ValidationError(app_name, field, "is missing") for field in required if field not in entry]
+        if not app_name.strip():
+            errors.append(ValidationError(app_name, "", "the app name must not be empty"))
+        for field, value in entry.items():
+            check = checks.get(field)
+            if check is None:
+                errors.append(ValidationError(app_name, field, f"is not a known field ({known})"))
+                continue
+            problem = check(value)
+            if problem:
+                errors.append(ValidationError(app_name, field, problem))
+        return errors
+
+    return validate
+
+
+def duplicate_errors(data: Dict[str, Any]) -> List[ValidationError]:
+    """
+    Find apps that launch the same command on the same tab, usually a copy that was never edited.
+
+    Args:
+        data: The decoded apps.json, app name to entry.
+
+    Returns:
+        One error per app duplicating an earlier one.
+    """
+    errors: List[ValidationError] = []
+    # (tab, command) -> the first app launching it
+    seen: Dict[Tuple[Any, ...], str] = {}
+    for app_name, entry in data.items():
+        if isinstance(entry, dict):
+            key = (entry.get("tabName"), entry.get("path"), entry.get("execName"), repr(entry.get("flags") or []))
+            first = seen.setdefault(key, app_name)
+            if first != app_name:
+                errors.append(ValidationError(app_name, "", f"duplicates {first}, same command on the same tab"))
+    return errors
+
+
+def validate_catalogue(data: Any, validator: Optional[EntryValidator] = None) -> List[ValidationError]:
+    """
+    Check a whole catalogue in one pass and report every problem, not just the first.
+
+    Args:
+        data: The decoded apps.json, app name to entry.
+        validator: From compile_schema, the one for APP_SCHEMA by default.
+
+    Returns:
+        The problems with each entry followed by the duplicates, empty if it is valid.
+    """
+    validator = validator or _DEFAULT_VALIDATOR
+    if not isinstance(data, dict):
+        return [ValidationError("", "", "the catalogue must be an object of app name to entry")]
+    errors = [error for app_name, entry in data.items() for error in validator(app_name, entry)]
+    return errors + duplicate_errors(data)
+
+
+def fix_booleans(entry: Dict[str, Any], schema: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Turn "true" and "false" strings in boolean fields into booleans, the one mistake that can be fixed without asking.
+
+    Args:
+        entry: An apps.json entry.
+        schema: The field specs, APP_SCHEMA by default.
+
+    Returns:
+        A fixed copy of the entry, or None if there was nothing to fix.
+    """
+    schema = APP_SCHEMA if schema is None else schema
+    fixed = {
+        field: value == "true"
+        for field, value in entry.items()
+        if value in ("true", "false") and schema.get(field, {}).get("type") is bool
+    }
+    return dict(entry, **fixed) if fixed else None
+
+
+_DEFAULT_VALIDATOR = compile_schema()
+
+
+def read_catalogue_json(path: str) -> Tuple[Dict[str, Any], List[ValidationError]]:
+    """
+    Read an apps.json, reporting app names that appear twice instead of silently keeping the last.
+
+    Args:
+        path: The file.
+
+    Returns:
+        A tuple of (the decoded catalogue, the repeated names as errors).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not valid JSON.
+    """
+    duplicates: List[ValidationError] = []
+
+    def pairs(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        decoded: Dict[str, Any] = {}
+        for key, value in items:
+            if key in decoded:
+                duplicates.append(ValidationError(key, "", "appears more than once, only the last is kept"))
+            decoded[key] = value
+        return decoded
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f, object_pairs_hook=pairs)
+    return data, duplicates
+
+
+def write_catalogue_json(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write an apps.json so that a launcher reading it never sees a half written file.
+
+    The catalogue is written to a temporary file in the same directory,
+    flushed to disk and renamed over the original, keeping its permissions.
+
+    Args:
+        path: The file.
+        data: The catalogue, app name to entry.
+
+    Raises:
+        OSError: If it cannot be written, the original is left untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,732 @@
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from itertools import islice
+from typing import Any, Callable, Collection, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Relative weight of each indexed field, a name hit outranks an exec name hit etc.
+FIELD_WEIGHTS: Dict[str, int] = {"name": 8, "execName": 4, "tabName": 2, "desc": 1}
+
+# How a single query token matched an indexed token, higher is better.
+MATCH_EXACT = 3
+MATCH_PREFIX = 2
+MATCH_INFIX = 1
+MATCH_FUZZY = 0
+
+# Ranking tiers for a whole result, higher is better.
+TIER_NAME_EXACT = 4
+TIER_NAME_PREFIX = 3
+TIER_TOKEN = 2
+TIER_INFIX = 1
+TIER_FUZZY = 0
+
+# Shorter query tokens only match at the start of a word.
+MIN_INFIX_LENGTH = 3
+
+# Narrowed candidate sets up to this size are rescanned doc by doc, larger
+# ones are cheaper to filter through the postings.
+NARROW_SCAN_LIMIT = 1000
+
+# How many docs are scanned between checks for a cancelled search.
+CANCEL_CHECK_INTERVAL = 256
+
+_PAD = "\0"
+_WORD_RE = re.compile(r"[^\W_]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def strip_accents(text: str) -> str:
+    """
+    Remove combining marks so that "Café" and "Cafe" index the same way.
+
+    Args:
+        text: The text to clean.
+
+    Returns:
+        The text with accents removed, case is preserved.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for matching (accents removed and case folded).
+
+    Args:
+        text: The text to normalize.
+
+    Returns:
+        The normalized text.
+    """
+    return strip_accents(text).casefold()
+
+
+def query_tokens(query: str) -> List[str]:
+    """
+    Split a search query into normalized tokens.
+
+    Args:
+        query: The raw query as typed by the user.
+
+    Returns:
+        The list of query tokens in the order they were typed.
+    """
+    return _WORD_RE.findall(normalize(query))
+
+
+def field_tokens(text: str) -> Set[str]:
+    """
+    Tokenize an indexed field, CamelCase words are also split into their parts
+    so "NukeStudio" can be found by "studio".
+
+    Args:
+        text: The field text.
+
+    Returns:
+        The set of normalized tokens for the field.
+    """
+    tokens: Set[str] = set()
+    for word in _WORD_RE.findall(strip_accents(text)):
+        tokens.add(word.casefold())
+        parts = _CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            tokens.update(part.casefold() for part in parts)
+    return tokens
+
+
+def compact(text: str) -> str:
+    """
+    Normalize text and drop everything that is not a letter or digit.
+
+    Args:
+        text: The text to compact.
+
+    Returns:
+        The compacted text, e.g. "PDF Viewer" becomes "pdfviewer".
+    """
+    return "".join(_WORD_RE.findall(normalize(text)))
+
+
+def typo_tolerance(token: str) -> int:
+    """
+    Number of edits allowed when fuzzy matching a query token of this length.
+
+    Args:
+        token: The query token.
+
+    Returns:
+        The maximum edit distance to accept.
+    """
+    if len(token) < 4:
+        return 0
+    if len(token) < 8:
+        return 1
+    return 2
+
+
+def trigrams(token: str) -> Set[str]:
+    """
+    Trigrams of a token, including the two start padded ones so that prefixes
+    of one or two characters still have postings.
+
+    Args:
+        token: The token to split.
+
+    Returns:
+        The set of trigrams.
+    """
+    padded = _PAD * 2 + token
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def within_prefix_distance(query: str, token: str, max_edits: int) -> bool:
+    """
+    Check if the query is within max_edits edits of some prefix of token.
+
+    Matching against a prefix means a partially typed word with a typo still
+    matches, e.g. "hodu" finds "houdini".
+
+    Args:
+        query: The query token.
+        token: The indexed token.
+        max_edits: The maximum edit distance allowed.
+
+    Returns:
+        True if the query matches a prefix of the token within the tolerance.
+    """
+    if len(token) < len(query) - max_edits:
+        return False
+    token = token[: len(query) + max_edits]
+    previous = list(range(len(token) + 1))
+    for i, qc in enumerate(query, 1):
+        current = [i]
+        for j, tc in enumerate(token, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (qc != tc)))
+        if min(current) > max_edits:
+            return False
+        previous = current
+    return min(previous) <= max_edits
+
+
+def match_mode(token: str) -> Tuple[int, bool]:
+    """
+    How permissive matching is for a query token of this length.
+
+    Args:
+        token: The query token.
+
+    Returns:
+        A tuple of (maximum edit distance, whether substring matches count).
+    """
+    return typo_tolerance(token), len(token) >= MIN_INFIX_LENGTH
+
+
+def match_token(query: str, token: str, max_edits: int) -> Optional[int]:
+    """
+    Classify how a query token matches an indexed token.
+
+    Args:
+        query: The query token.
+        token: The indexed token.
+        max_edits: Typo tolerance for the query token.
+
+    Returns:
+        One of the MATCH_* constants, or None if the tokens do not match.
+    """
+    if token == query:
+        return MATCH_EXACT
+    if token.startswith(query):
+        return MATCH_PREFIX
+    if len(query) >= MIN_INFIX_LENGTH and query in token:
+        return MATCH_INFIX
+    if max_edits and within_prefix_distance(query, token, max_edits):
+        return MATCH_FUZZY
+    return None
+
+
+def _indexed_fields(app: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(app.get(field) for field in FIELD_WEIGHTS)
+
+
+def _app_tokens(app: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Tokenize the indexed fields of an app.
+
+    Args:
+        app: The app dictionary.
+
+    Returns:
+        Each token mapped to the weight of the best field it appears in.
+    """
+    tokens: Dict[str, int] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        value = app.get(field)
+        if not value:
+            continue
+        found = field_tokens(str(value))
+        if field == "name":
+            found.add(compact(str(value)))
+        for token in found:
+            if tokens.get(token, 0) < weight:
+                tokens[token] = weight
+    return tokens
+
+
+class SearchCancelled(Exception):
+    """
+    Raised from SearchIndex.search when the cancelled callback returns True.
+    """
+
+
+def _never_cancelled() -> bool:
+    return False
+
+
+class SearchIndex:
+    """
+    Prebuilt inverted index over the app catalogue.
+
+    Apps are indexed by name, desc, tabName and execName using normalized tokens,
+    and every token is indexed by its trigrams so substring and typo tolerant
+    lookups never have to scan the whole catalogue. Results are ranked as
+    exact name > name prefix > token > substring > fuzzy, ties are broken by
+    how often and how recently each app was launched (see set_boosts).
+
+    Successive queries that extend the previous one (as happens when typing)
+    are answered by filtering the previous candidate set rather than
+    searching the index again.
+    """
+
+    def __init__(self, apps_by_tab: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            apps_by_tab: List of tab dictionaries to index, each with an "apps" list.
+        """
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._apps: List[Dict[str, Any]] = []
+        self._names: List[str] = []
+        self._doc_tokens: List[Dict[str, int]] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._last: Optional[Tuple[List[str], str, FrozenSet[int]]] = None
+        self._boosts: Dict[str, float] = {}
+        self.rebuild(apps_by_tab or [])
+
+    def __len__(self) -> int:
+        return len(self._apps)
+
+    def rebuild(self, apps_by_tab: List[Dict[str, Any]]) -> None:
+        """
+        Rebuild the index from scratch, used when the catalogue changes.
+
+        Args:
+            apps_by_tab: List of tab dictionaries to index.
+        """
+        with self._lock:
+            self._apps = []
+            self._names = []
+            self._doc_tokens = []
+            self._postings = {}
+            self._trigrams = {}
+            self._last = None
+            for tab in apps_by_tab:
+                for app in tab["apps"]:
+                    self._add(app)
+        self._ready.set()
+
+    def set_boosts(self, boosts: Dict[str, float]) -> None:
+        """
+        Set the scores that order results which match equally well, e.g. launch frecency.
+
+        Args:
+            boosts: Scores keyed by app name, higher ranks first, apps without one rank last.
+        """
+        # swapped whole, a search running on another thread sees the old or the new scores
+        self._boosts = dict(boosts)
+
+    def set_boost(self, name: str, boost: float) -> None:
+        """
+        Set the score of one app, e.g. after it was launched, leaving the others as they are.
+
+        Args:
+            name: The app name.
+            boost: Its score, higher ranks first.
+        """
+        # searches only look scores up, so one can be replaced in place while they run
+        self._boosts[name] = boost
+
+    def rebuild_in_background(
+        self, apps_by_tab: List[Dict[str, Any]], on_done: Optional[Callable[[], None]] = None
+    ) -> threading.Thread:
+        """
+        Rebuild the index on a background thread, searches wait until it is done.
+
+        Args:
+            apps_by_tab: List of tab dictionaries to index.
+            on_done: Called on the background thread once the index is built.
+
+        Returns:
+            The thread doing the build.
+        """
+
+        def build() -> None:
+            self.rebuild(apps_by_tab)
+            if on_done is not None:
+                on_done()
+
+        self._ready.clear()
+        thread = threading.Thread(target=build, name="search-index", daemon=True)
+        thread.start()
+        return thread
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Export the built index so it can be cached and restored without re-tokenizing.
+
+        Tokens are stored once in a vocabulary and referenced by number, the
+        doc tokens and trigram lists are packed into arrays of unsigned ints.
+        The postings are left out as they are rebuilt from the doc tokens.
+
+        Returns:
+            A dictionary of strings, lists and bytes that marshal can store.
+        """
+        self._ready.wait()
+        with self._lock:
+            vocabulary = list(self._postings)
+            ids = {token: i for i, token in enumerate(vocabulary)}
+            doc_tokens = array("I")
+            offsets = array("I", [0])
+            for tokens in self._doc_tokens:
+                for token, weight in tokens.items():
+                    doc_tokens.append(ids[token])
+                    doc_tokens.append(weight)
+                offsets.append(len(doc_tokens))
+            return {
+                "vocabulary": vocabulary,
+                "names": list(self._names),
+                "doc_tokens": doc_tokens.tobytes(),
+                "doc_offsets": offsets.tobytes(),
+                "trigrams": {
+                    gram: array("I", (ids[token] for token in tokens)).tobytes()
+                    for gram, tokens in self._trigrams.items()
+                },
+            }
+
+    def restore(self, apps_by_tab: List[Dict[str, Any]], state: Dict[str, Any]) -> None:
+        """
+        Load an index exported with state(), the apps must be in the same order as when it was built.
+
+        Args:
+            apps_by_tab: List of tab dictionaries the index was built from.
+            state: The exported index.
+
+        Raises:
+            ValueError: If the state does not match the apps.
+        """
+        apps = [app for tab in apps_by_tab for app in tab["apps"]]
+        vocabulary, names = state["vocabulary"], state["names"]
+        flat, offsets = array("I"), array("I")
+        flat.frombytes(state["doc_tokens"])
+        offsets.frombytes(state["doc_offsets"])
+        if len(names) != len(apps) or len(offsets) != len(apps) + 1:
+            raise ValueError("search index state does not match the catalogue")
+        pairs = zip(map(vocabulary.__getitem__, flat[0::2]), flat[1::2])
+        doc_tokens: List[Dict[str, int]] = []
+        postings: Dict[str, Dict[int, int]] = {token: {} for token in vocabulary}
+        for doc_id in range(len(apps)):
+            tokens = dict(islice(pairs, (offsets[doc_id + 1] - offsets[doc_id]) // 2))
+            for token, weight in tokens.items():
+                postings[token][doc_id] = weight
+            doc_tokens.append(tokens)
+        trigram_index: Dict[str, Set[str]] = {}
+        for gram, packed_ids in state["trigrams"].items():
+            token_ids = array("I")
+            token_ids.frombytes(packed_ids)
+            trigram_index[gram] = set(map(vocabulary.__getitem__, token_ids))
+        with self._lock:
+            self._apps = apps
+            self._names = list(names)
+            self._doc_tokens = doc_tokens
+            self._postings = postings
+            self._trigrams = trigram_index
+            self._last = None
+        self._ready.set()
+
+    def restore_in_background(
+        self,
+        apps_by_tab: List[Dict[str, Any]],
+        load_state: Callable[[], Dict[str, Any]],
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> threading.Thread:
+        """
+        Restore the index on a background thread, falling back to a rebuild if the state is unusable.
+
+        Args:
+            apps_by_tab: List of tab dictionaries the index was built from.
+            load_state: Returns the exported index, called on the background thread.
+            on_done: Called on the background thread once the index is ready.
+
+        Returns:
+            The thread doing the restore.
+        """
+
+        def load() -> None:
+            try:
+                self.restore(apps_by_tab, load_state())
+            except (KeyError, TypeError, ValueError, IndexError, EOFError):
+                self.rebuild(apps_by_tab)
+            if on_done is not None:
+                on_done()
+
+        self._ready.clear()
+        thread = threading.Thread(target=load, name="search-index", daemon=True)
+        thread.start()
+        return thread
+
+    def update(self, apps_by_tab: List[Dict[str, Any]]) -> None:
+        """
+        Re-index after the catalogue changed, only apps whose indexed fields changed are tokenized again.
+
+        The new index is built aside and swapped in at the end, so searches
+        keep being answered from the old one in the meantime.
+
+        Args:
+            apps_by_tab: List of tab dictionaries to index.
+        """
+        self._ready.wait()
+        with self._lock:
+            known = {
+                (app.get("name"), _indexed_fields(app)): tokens for app, tokens in zip(self._apps, self._doc_tokens)
+            }
+        fresh = SearchIndex()
+        for tab in apps_by_tab:
+            for app in tab["apps"]:
+                fresh._add(app, known.get((app.get("name"), _indexed_fields(app))))
+        with self._lock:
+            self._apps = fresh._apps
+            self._names = fresh._names
+            self._doc_tokens = fresh._doc_tokens
+            self._postings = fresh._postings
+            self._trigrams = fresh._trigrams
+            self._last = None
+
+    def update_in_background(
+        self, apps_by_tab: List[Dict[str, Any]], on_done: Optional[Callable[[], None]] = None
+    ) -> threading.Thread:
+        """
+        Run update() on a background thread, searches are not held up while it runs.
+
+        Args:
+            apps_by_tab: List of tab dictionaries to index.
+            on_done: Called on the background thread once the new index is in place.
+
+        Returns:
+            The thread doing the update.
+        """
+
+        def build() -> None:
+            self.update(apps_by_tab)
+            if on_done is not None:
+                on_done()
+
+        thread = threading.Thread(target=build, name="search-index", daemon=True)
+        thread.start()
+        return thread
+
+    def _add(self, app: Dict[str, Any], tokens: Optional[Dict[str, int]] = None) -> None:
+        """
+        Add a single app to the index.
+
+        Args:
+            app: The app dictionary.
+            tokens: The app's tokens if they are already known, e.g. from before an update.
+        """
+        doc_id = len(self._apps)
+        if tokens is None:
+            tokens = _app_tokens(app)
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for trigram in trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(token)
+            postings[doc_id] = weight
+        self._apps.append(app)
+        self._names.append(compact(str(app.get("name", ""))))
+        self._doc_tokens.append(tokens)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the index.
+
+        Args:
+            query: The raw query string.
+            limit: Maximum number of results to return, None for all.
+            cancelled: Optional callback polled during the search, when it
+                returns True the search stops and SearchCancelled is raised.
+
+        Returns:
+            The matching app dictionaries, best match first.
+
+        Raises:
+            SearchCancelled: If the search was cancelled.
+        """
+        cancelled = cancelled or _never_cancelled
+        tokens = query_tokens(query)
+        if not tokens:
+            return []
+        compacted = "".join(tokens)
+        self._ready.wait()
+        with self._lock:
+            candidates = self._last[2] if self._extends_last(tokens, compacted) else None
+            if candidates is not None and len(candidates) <= NARROW_SCAN_LIMIT:
+                matches = self._match_candidates(tokens, candidates, cancelled)
+            else:
+                matches = self._match_index(tokens, candidates, cancelled)
+            if cancelled():
+                raise SearchCancelled(query)
+            self._last = (tokens, compacted, frozenset(matches))
+            keys = (self._rank_key(doc_id, hits, compacted) + (doc_id,) for doc_id, hits in matches.items())
+            ranked = sorted(keys) if limit is None else heapq.nsmallest(limit, keys)
+            return [self._apps[key[-1]] for key in ranked]
+
+    def _extends_last(self, tokens: List[str], compacted: str) -> bool:
+        """
+        Check if a query can be answered by narrowing the previous result set.
+
+        This holds when every previous token is unchanged or extended and no
+        token has become more permissive by growing (gaining typo tolerance or
+        substring matching would widen the match).
+
+        Args:
+            tokens: The new query tokens.
+            compacted: The new query with separators removed.
+
+        Returns:
+            True if the previous candidates are a superset of the new matches.
+        """
+        if self._last is None:
+            return False
+        last_tokens, last_compacted, _ = self._last
+        if len(tokens) < len(last_tokens) or not compacted.startswith(last_compacted):
+            return False
+        for i, (old, new) in enumerate(zip(last_tokens, tokens)):
+            if new == old:
+                continue
+            # only the last token typed can have grown
+            if i != len(last_tokens) - 1 or not new.startswith(old):
+                return False
+            if match_mode(new) != match_mode(old):
+                return False
+        return True
+
+    def _lookup_token(self, query: str, cancelled: Callable[[], bool]) -> Dict[str, int]:
+        """
+        Find every indexed token matching a query token.
+
+        Args:
+            query: The query token.
+            cancelled: Callback polled to abandon the lookup.
+
+        Returns:
+            A mapping of indexed token to MATCH_* kind.
+        """
+        if len(query) < MIN_INFIX_LENGTH:
+            candidates: Iterable[str] = self._trigrams.get((_PAD * 2 + query)[-3:], ())
+        else:
+            inner = [query[i : i + 3] for i in range(len(query) - 2)]
+            sets = sorted((self._trigrams.get(t, set()) for t in inner), key=len)
+            candidates = set.intersection(*sets) if sets[0] else set()
+        found = {}
+        for token in candidates:
+            kind = match_token(query, token, 0)
+            if kind is not None:
+                found[token] = kind
+        max_edits = typo_tolerance(query)
+        if max_edits:
+            # q-gram lemma: each edit destroys at most three padded trigrams.
+            grams = trigrams(query)
+            needed = len(grams) - 3 * max_edits
+            counts: Dict[str, int] = {}
+            for gram in grams:
+                for token in self._trigrams.get(gram, ()):
+                    counts[token] = counts.get(token, 0) + 1
+            if cancelled():
+                raise SearchCancelled(query)
+            for token, count in counts.items():
+                if count >= needed and token not in found and within_prefix_distance(query, token, max_edits):
+                    found[token] = MATCH_FUZZY
+        return found
+
+    def _match_index(
+        self, tokens: List[str], candidates: Optional[FrozenSet[int]], cancelled: Callable[[], bool]
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Match query tokens using the inverted index.
+
+        Args:
+            tokens: The query tokens.
+            candidates: Optional set of doc ids to restrict the match to.
+            cancelled: Callback polled to abandon the search.
+
+        Returns:
+            A mapping of doc id to the best (kind, weight) for each query token,
+            only docs matching every token are included.
+        """
+        matches: Optional[Dict[int, List[Tuple[int, int]]]] = None
+        allowed: Optional[Collection[int]] = candidates
+        for query in tokens:
+            best: Dict[int, Tuple[int, int]] = {}
+            for token, kind in self._lookup_token(query, cancelled).items():
+                if cancelled():
+                    raise SearchCancelled(query)
+                for doc_id, weight in self._postings[token].items():
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    if best.get(doc_id, (-1, 0)) < (kind, weight):
+                        best[doc_id] = (kind, weight)
+            if matches is None:
+                matches = {doc_id: [hit] for doc_id, hit in best.items()}
+            else:
+                matches = {doc_id: hits + [best[doc_id]] for doc_id, hits in matches.items() if doc_id in best}
+            allowed = matches
+            if not matches:
+                break
+        return matches or {}
+
+    def _match_candidates(
+        self, tokens: List[str], candidates: FrozenSet[int], cancelled: Callable[[], bool]
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Match query tokens against a known superset of docs by scanning their tokens.
+
+        Args:
+            tokens: The query tokens.
+            candidates: Doc ids that matched the previous query.
+            cancelled: Callback polled to abandon the search.
+
+        Returns:
+            The same structure as _match_index.
+        """
+        tolerances = [typo_tolerance(query) for query in tokens]
+        matches: Dict[int, List[Tuple[int, int]]] = {}
+        for count, doc_id in enumerate(candidates):
+            if count % CANCEL_CHECK_INTERVAL == 0 and cancelled():
+                raise SearchCancelled(" ".join(tokens))
+            hits = []
+            doc_tokens = self._doc_tokens[doc_id].items()
+            for query, max_edits in zip(tokens, tolerances):
+                best = None
+                for token, weight in doc_tokens:
+                    kind = match_token(query, token, 0)
+                    if kind is not None and (best is None or best < (kind, weight)):
+                        best = (kind, weight)
+                if best is None and max_edits:
+                    # any other kind of hit outranks a fuzzy one so only look if needed
+                    for token, weight in doc_tokens:
+                        if (best is None or best[1] < weight) and within_prefix_distance(query, token, max_edits):
+                            best = (MATCH_FUZZY, weight)
+                if best is None:
+                    break
+                hits.append(best)
+            else:
+                matches[doc_id] = hits
+        return matches
+
+    def _rank_key(
+        self, doc_id: int, hits: List[Tuple[int, int]], compacted: str
+    ) -> Tuple[int, int, float, int, str]:
+        """
+        Sort key for a matched doc, lower sorts first.
+
+        Args:
+            doc_id: The doc id.
+            hits: Best (kind, weight) per query token.
+            compacted: The query with separators removed.
+
+        Returns:
+            A tuple of (negated tier, negated weight, negated boost, name length, name).
+        """
+        name = self._names[doc_id]
+        if name == compacted:
+            tier = TIER_NAME_EXACT
+        elif name.startswith(compacted):
+            tier = TIER_NAME_PREFIX
+        else:
+            worst = min(kind for kind, _ in hits)
+            tier = {MATCH_EXACT: TIER_TOKEN, MATCH_PREFIX: TIER_TOKEN, MATCH_INFIX: TIER_INFIX}.get(worst, TIER_FUZZY)
+        weight = sum((kind + 1) * weight for kind, weight in hits)
+        boost = self._boosts.get(self._apps[doc_id].get("name"), -math.inf)
+        return (-tier, -weight, -boost, len(name), name)
@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from core.metrics import Metrics
+from core.models import AppListModel
+from core.search import SearchCancelled, SearchIndex
+
+
+class AsyncSearcher(QObject):
+    """
+    Runs searches off the GUI thread and publishes the results into a model.
+
+    Queries are debounced so a burst of keystrokes only searches once, and a
+    newer query cancels any search still running for an older one.
+    """
+
+    # generation, results; results stay Python objects so nothing is converted to QVariant
+    _results_ready = Signal(int, object)
+
+    def __init__(
+        self,
+        index: SearchIndex,
+        model: AppListModel,
+        limit: Optional[int] = None,
+        debounce_ms: int = 120,
+        metrics: Optional[Metrics] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initialize the searcher.
+
+        Args:
+            index: The search index to query.
+            model: The model the results are published to.
+            limit: Maximum number of results, None for all.
+            debounce_ms: How long the query has to be stable before searching.
+            metrics: Where the time of each completed search is recorded as "search.async".
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._index = index
+        self._model = model
+        self._limit = limit
+        self._metrics = metrics
+        self._query = ""
+        self._generation = 0
+        # a single worker keeps the index's narrowing state in typing order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._submit)
+        self._results_ready.connect(self._publish)
+
+    def search(self, query: str) -> None:
+        """
+        Request a search, superseding any pending or running one.
+
+        Args:
+            query: The raw query string, an empty query clears the results.
+        """
+        self._generation += 1
+        self._query = query
+        if not query.strip():
+            self._timer.stop()
+            self._model.set_apps([])
+            return
+        self._timer.start()
+
+    def shutdown(self) -> None:
+        """
+        Cancel outstanding searches and stop the worker thread.
+        """
+        self._generation += 1
+        self._timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self) -> None:
+        """
+        Hand the debounced query to the worker thread.
+        """
+        self._executor.submit(self._run, self._generation, self._query)
+
+    def _run(self, generation: int, query: str) -> None:
+        """
+        Run a search on the worker thread.
+
+        Args:
+            generation: The request generation the search belongs to.
+            query: The query to search for.
+        """
+        if generation != self._generation:
+            return
+        start = time.perf_counter()
+        try:
+            results = self._index.search(query, self._limit, cancelled=lambda: generation != self._generation)
+        except SearchCancelled:
+            return
+        if self._metrics is not None:
+            self._metrics.observe("search.async", time.perf_counter() - start)
+        self._results_ready.emit(generation, results)
+
+    def _publish(self, generation: int, results: List[Dict[str, Any]]) -> None:
+        """
+        Apply results to the model on the GUI thread, unless they are stale.
+
+        Args:
+            generation: The request generation the results belong to.
+            results: The matching apps.
+        """
+        if generation == self._generation:
+            self._model.set_apps(results)
@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# QSettings("YourCompany", "AppLauncher") stores the user's settings in
+# $XDG_CONFIG_HOME/YourCompany/AppLauncher.conf
+SETTINGS_ORGANIZATION = "YourCompany"
+SETTINGS_APPLICATION = "AppLauncher"
+
+_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def settings_path() -> Path:
+    """
+    Get the file QSettings keeps the launcher's settings in on Linux.
+
+    Returns:
+        $XDG_CONFIG_HOME/YourCompany/AppLauncher.conf, which defaults to ~/.config.
+    """
+    base = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(base) / SETTINGS_ORGANIZATION / f"{SETTINGS_APPLICATION}.conf"
+
+
+def read_settings(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Read the settings the GUI stored, without Qt, for the command line.
+
+    Only what QSettings writes for strings, numbers, booleans and string
+    lists is decoded, values it stores as binary variants are left out.
+
+    Args:
+        path: The settings file, settings_path() by default.
+
+    Returns:
+        The settings keyed as QSettings keys them, e.g. "user/favourites".
+    """
+    path = path or settings_path()
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    settings: Dict[str, Any] = {}
+    group = ""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(";"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            group = _unescape_key(line[1:-1])
+            group = "" if group == "General" else group + "/"
+            continue
+        key, separator, raw = line.partition("=")
+        if not separator:
+            continue
+        value = _decode_value(raw.strip())
+        if value is not None:
+            settings[group + _unescape_key(key.strip())] = value
+    return settings
+
+
+def _unescape_key(key: str) -> str:
+    # QSettings percent-encodes characters in keys that INI files cannot hold, "/" is written as "\"
+    out = []
+    i = 0
+    while i < len(key):
+        if key[i] == "%" and i + 2 < len(key):
+            try:
+                out.append(chr(int(key[i + 1 : i + 3], 16)))
+                i += 3
+                continue
+            except ValueError:
+                pass
+        out.append("/" if key[i] == "\\" else key[i])
+        i += 1
+    return "".join(out)
+
+
+def _decode_value(raw: str) -> Union[None, str, List[str]]:
+    """
+    Decode a value as QSettings writes it, a bare string or a comma separated list.
+
+    Args:
+        raw: The text after the "=".
+
+    Returns:
+        The string or list of strings, None for values that are not plain text.
+    """
+    if raw.startswith("@") and not raw.startswith("@@"):
+        # @Invalid(), @Variant(...), @ByteArray(...) and other typed values
+        return None
+    items: List[str] = []
+    # characters of the current item and whether each was inside quotes, only unquoted spaces are trimmed
+    current: List[Tuple[str, bool]] = []
+    in_quotes = False
+    is_list = False
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        if c == "\\" and i + 1 < len(raw):
+            nxt = raw[i + 1]
+            i += 2
+            if nxt == "x":
+                digits = ""
+                while i < len(raw) and raw[i] in "0123456789abcdefABCDEF":
+                    digits += raw[i]
+                    i += 1
+                if digits:
+                    current.append((chr(int(digits, 16)), True))
+                continue
+            current.append((_ESCAPES.get(nxt, nxt), True))
+            continue
+        if c == '"':
+            in_quotes = not in_quotes
+        elif c == "," and not in_quotes:
+            items.append(_join(current))
+            current = []
+            is_list = True
+        else:
+            current.append((c, in_quotes))
+        i += 1
+    items.append(_join(current))
+    items = [item[1:] if item.startswith("@@") else item for item in items]
+    return items if is_list else items[0]
+
+
+def _join(chars: List[Tuple[str, bool]]) -> str:
+    start, end = 0, len(chars)
+    while start < end and chars[start][0].isspace() and not chars[start][1]:
+        start += 1
+    while end > start and chars[end - 1][0].isspace() and not chars[end - 1][1]:
+        end -= 1
+    return "".join(c for c, _ in chars[start:end])
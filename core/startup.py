@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from core.metrics import Metrics
+
+
+def seconds_since_process_start() -> Optional[float]:
+    """
+    Time since the process was started, so interpreter start up and imports are included.
+
+    Returns:
+        Seconds since the kernel started the process, or None if not available.
+    """
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            # the command name can contain spaces so split after its closing bracket
+            fields = f.read().rsplit(b")", 1)[1].split()
+        start_ticks = int(fields[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError, AttributeError):
+        return None
+
+
+class StartupTrace:
+    """
+    Records how long each start up phase takes and prints a report.
+
+    When disabled every call is a cheap no-op, so the phases can stay
+    instrumented in normal runs. Phases are also recorded in the metrics as
+    "startup.<phase>" when a registry is given, whether or not the report is
+    enabled.
+    """
+
+    def __init__(self, enabled: bool = False, stream: TextIO = sys.stderr, metrics: Optional[Metrics] = None) -> None:
+        """
+        Initialize the trace.
+
+        Args:
+            enabled: Whether to record and report anything.
+            stream: Where the report is written.
+            metrics: Where the phase durations are also recorded.
+        """
+        self.enabled = enabled
+        self._stream = stream
+        self._metrics = metrics
+        self._t0 = time.perf_counter()
+        self._before_main = seconds_since_process_start() if enabled else None
+        self._phases: List[Tuple[str, float, float]] = []
+        self._reported = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a block of start up work.
+
+        Args:
+            name: The phase name shown in the report.
+        """
+        if not self.enabled and self._metrics is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if self._metrics is not None:
+                self._metrics.observe(f"startup.{name}", duration)
+            if self.enabled:
+                self._phases.append((name, start - self._t0, duration))
+
+    def mark(self, name: str) -> None:
+        """
+        Record a point in time, such as the first frame being shown.
+
+        Args:
+            name: The event name shown in the report.
+        """
+        now = time.perf_counter() - self._t0
+        if self._metrics is not None:
+            self._metrics.observe(f"startup.{name.replace(' ', '_')}", now)
+        if self.enabled:
+            self._phases.append((name, now, 0.0))
+
+    def report(self) -> None:
+        """
+        Print the phases recorded so far, only the first call prints anything.
+        """
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        offset = self._before_main or 0.0
+        lines = ["startup trace (ms since process start)"]
+        if self._before_main is not None:
+            lines.append(f"  {'interpreter + imports':<28} {0.0:9.1f} {offset * 1000:9.1f}")
+        for name, start, duration in self._phases:
+            lines.append(f"  {name:<28} {(offset + start) * 1000:9.1f} {duration * 1000:9.1f}")
+        print("\n".join(lines), file=self._stream, flush=True)
@@ -0,0 +1,373 @@
+import os
+import signal
+import socket
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QDateTime,
+    QModelIndex,
+    QObject,
+    QSocketNotifier,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+
+from core.launch import spawn_detached
+
+# Finished processes kept in the model so their exit status can be inspected.
+MAX_FINISHED = 20
+
+
+@dataclass
+class ProcessRecord:
+    """
+    Bookkeeping for one launched child process.
+    """
+
+    name: str
+    command: List[str]
+    popen: subprocess.Popen
+    start_time: float = field(default_factory=time.time)
+    start_monotonic: float = field(default_factory=time.monotonic)
+    end_monotonic: Optional[float] = None
+    exit_code: Optional[int] = None
+    cpu_time: float = 0.0
+    peak_rss_kb: int = 0
+    notifier: Optional[QSocketNotifier] = None
+    pidfd: Optional[int] = None
+
+    @property
+    def pid(self) -> int:
+        return self.popen.pid
+
+    @property
+    def running(self) -> bool:
+        return self.exit_code is None
+
+    @property
+    def wall_time(self) -> float:
+        end = self.end_monotonic if self.end_monotonic is not None else time.monotonic()
+        return end - self.start_monotonic
+
+
+class ProcessSupervisor(QAbstractListModel):
+    """
+    Owns every launched child process and exposes them to QML as a list model.
+
+    Children are reaped as soon as they exit using a pidfd per child watched
+    by the Qt event loop, or a single SIGCHLD wakeup when pidfds are not
+    available, so no thread is needed per process and no zombies are left.
+    Exit code, wall time, CPU time and peak RSS are taken from wait4.
+    """
+
+    PidRole = Qt.UserRole
+    NameRole = Qt.UserRole + 1
+    RunningRole = Qt.UserRole + 2
+    ExitCodeRole = Qt.UserRole + 3
+    StartTimeRole = Qt.UserRole + 4
+    WallTimeRole = Qt.UserRole + 5
+    CpuTimeRole = Qt.UserRole + 6
+    PeakRssRole = Qt.UserRole + 7
+
+    process_started = Signal(int)
+    process_exited = Signal(int, int)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._records: List[ProcessRecord] = []
+        self._use_pidfd = hasattr(os, "pidfd_open")
+        self._sigchld_notifier: Optional[QSocketNotifier] = None
+        self._wakeup_sockets: Optional[tuple] = None
+        # refresh the wall time of running processes while any are alive
+        self._tick = QTimer(self)
+        self._tick.setInterval(1000)
+        self._tick.timeout.connect(self._refresh_running)
+
+    def roleNames(self) -> Dict[int, QByteArray]:
+        return {
+            self.PidRole: QByteArray(b"pid"),
+            self.NameRole: QByteArray(b"name"),
+            self.RunningRole: QByteArray(b"running"),
+            self.ExitCodeRole: QByteArray(b"exitCode"),
+            self.StartTimeRole: QByteArray(b"startTime"),
+            self.WallTimeRole: QByteArray(b"wallTime"),
+            self.CpuTimeRole: QByteArray(b"cpuTime"),
+            self.PeakRssRole: QByteArray(b"peakRssMb"),
+        }
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._records):
+            return None
+        record = self._records[index.row()]
+        if role in (Qt.DisplayRole, self.NameRole):
+            return record.name
+        if role == self.PidRole:
+            return record.pid
+        if role == self.RunningRole:
+            return record.running
+        if role == self.ExitCodeRole:
+            return record.exit_code if record.exit_code is not None else 0
+        if role == self.StartTimeRole:
+            return QDateTime.fromSecsSinceEpoch(int(record.start_time)).toString("HH:mm:ss")
+        if role == self.WallTimeRole:
+            return round(record.wall_time, 1)
+        if role == self.CpuTimeRole:
+            return round(record.cpu_time, 1)
+        if role == self.PeakRssRole:
+            return round(record.peak_rss_kb / 1024, 1)
+        return None
+
+    def spawn(self, name: str, command: List[str], **popen_kwargs: Any) -> subprocess.Popen:
+        """
+        Start a child process and take ownership of it.
+
+        The child gets its own session so terminate and kill reach any
+        processes a wrapper script starts as well.
+
+        Args:
+            name: Name shown for the process, usually the app name.
+            command: The command line to run.
+            **popen_kwargs: Extra arguments for subprocess.Popen.
+
+        Returns:
+            The Popen object, do not wait on it as the supervisor reaps it.
+        """
+        popen = spawn_detached(command, **popen_kwargs)
+        record = ProcessRecord(name=name, command=list(command), popen=popen)
+        self._watch(record)
+        self._prune_finished()
+        row = len(self._records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._records.append(record)
+        self.endInsertRows()
+        if not self._tick.isActive():
+            self._tick.start()
+        self.process_started.emit(record.pid)
+        return popen
+
+    def records(self) -> List[ProcessRecord]:
+        """
+        Get every tracked process, running and recently finished.
+
+        Returns:
+            The process records in launch order.
+        """
+        return list(self._records)
+
+    def find(self, pid: int) -> Optional[ProcessRecord]:
+        """
+        Find the record of a child by its process id.
+
+        Pids are reused, so a running child wins over finished ones with the
+        same pid, and of those the latest wins.
+
+        Args:
+            pid: The process id.
+
+        Returns:
+            The record, or None if no child had that pid.
+        """
+        latest = None
+        for record in reversed(self._records):
+            if record.pid != pid:
+                continue
+            if record.running:
+                return record
+            latest = latest or record
+        return latest
+
+    def running_count(self) -> int:
+        """
+        Get the number of children still running.
+
+        Returns:
+            The number of running processes.
+        """
+        return sum(1 for record in self._records if record.running)
+
+    @Slot(int)
+    def terminate(self, pid: int) -> None:
+        """
+        Ask a process (and its session) to exit with SIGTERM.
+
+        Args:
+            pid: The process id.
+        """
+        self._signal(pid, signal.SIGTERM)
+
+    @Slot(int)
+    def kill(self, pid: int) -> None:
+        """
+        Force a process (and its session) to exit with SIGKILL.
+
+        Args:
+            pid: The process id.
+        """
+        self._signal(pid, signal.SIGKILL)
+
+    @Slot()
+    def clear_finished(self) -> None:
+        """
+        Remove every finished process from the model.
+        """
+        for row in reversed(range(len(self._records))):
+            if not self._records[row].running:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._records[row]
+                self.endRemoveRows()
+
+    def shutdown(self) -> None:
+        """
+        Stop watching children, they keep running after the launcher exits.
+        """
+        self._tick.stop()
+        for record in self._records:
+            self._unwatch(record)
+        if self._sigchld_notifier is not None:
+            self._sigchld_notifier.setEnabled(False)
+            signal.set_wakeup_fd(-1)
+
+    def _signal(self, pid: int, sig: int) -> None:
+        """
+        Send a signal to the process group of a running child.
+
+        Args:
+            pid: The process id.
+            sig: The signal to send.
+        """
+        record = self.find(pid)
+        if record is None or not record.running:
+            return
+        try:
+            os.killpg(pid, sig)
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            record.popen.send_signal(sig)
+
+    def _watch(self, record: ProcessRecord) -> None:
+        """
+        Arrange for the event loop to reap a child when it exits.
+
+        Args:
+            record: The process record.
+        """
+        if self._use_pidfd:
+            try:
+                record.pidfd = os.pidfd_open(record.pid)
+            except OSError:
+                self._use_pidfd = False
+        if record.pidfd is not None:
+            record.notifier = QSocketNotifier(record.pidfd, QSocketNotifier.Read, self)
+            record.notifier.activated.connect(lambda *_, pid=record.pid: self._reap(pid))
+        else:
+            self._install_sigchld()
+
+    def _unwatch(self, record: ProcessRecord) -> None:
+        """
+        Release the pidfd and notifier of a record.
+
+        Args:
+            record: The process record.
+        """
+        if record.notifier is not None:
+            record.notifier.setEnabled(False)
+            record.notifier.deleteLater()
+            record.notifier = None
+        if record.pidfd is not None:
+            os.close(record.pidfd)
+            record.pidfd = None
+
+    def _install_sigchld(self) -> None:
+        """
+        Fallback for kernels without pidfd, SIGCHLD wakes the event loop through a socket.
+        """
+        if self._sigchld_notifier is not None:
+            return
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        writer.setblocking(False)
+        self._wakeup_sockets = (reader, writer)
+        signal.set_wakeup_fd(writer.fileno())
+        # a Python level handler is needed for the wakeup fd to be written to
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        self._sigchld_notifier = QSocketNotifier(reader.fileno(), QSocketNotifier.Read, self)
+        self._sigchld_notifier.activated.connect(self._on_sigchld)
+
+    def _on_sigchld(self, *_: Any) -> None:
+        """
+        Drain the wakeup socket and reap every child that has exited.
+        """
+        try:
+            while self._wakeup_sockets[0].recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        for record in list(self._records):
+            if record.running and record.pidfd is None:
+                self._reap(record.pid)
+
+    def _reap(self, pid: int) -> None:
+        """
+        Collect the exit status and resource usage of a child if it has exited.
+
+        Args:
+            pid: The process id.
+        """
+        record = self.find(pid)
+        if record is None or not record.running:
+            return
+        try:
+            reaped, status, usage = os.wait4(pid, os.WNOHANG)
+        except ChildProcessError:
+            # somebody else waited on it, the status is lost
+            reaped, status, usage = pid, 0, None
+        if reaped == 0:
+            return
+        record.exit_code = os.waitstatus_to_exitcode(status)
+        record.end_monotonic = time.monotonic()
+        if usage is not None:
+            record.cpu_time = usage.ru_utime + usage.ru_stime
+            record.peak_rss_kb = usage.ru_maxrss
+        # keep the Popen object consistent so it never tries to wait itself
+        record.popen.returncode = record.exit_code
+        self._unwatch(record)
+        row = self._records.index(record)
+        self.dataChanged.emit(self.index(row), self.index(row))
+        if not self.running_count():
+            self._tick.stop()
+        self.process_exited.emit(pid, record.exit_code)
+
+    def _refresh_running(self) -> None:
+        """
+        Update the wall time shown for running processes.
+        """
+        for row, record in enumerate(self._records):
+            if record.running:
+                self.dataChanged.emit(self.index(row), self.index(row), [self.WallTimeRole])
+
+    def _prune_finished(self) -> None:
+        """
+        Drop the oldest finished processes once more than MAX_FINISHED are kept.
+        """
+        finished = [row for row, record in enumerate(self._records) if not record.running]
+        for row in reversed(finished[: max(0, len(finished) - MAX_FINISHED + 1)]):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._records[row]
+            self.endRemoveRows()
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from PySide6.QtGui import QAction, QIcon
+from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
+
+from core.applauncher import AppLauncher
+
+
+def create_tray_icon(app: QApplication, app_launcher: AppLauncher, icon: QIcon) -> Optional[QSystemTrayIcon]:
+    """
+    Keep the launcher resident in the system tray, closing the window then only hides it.
+
+    Clicking the icon shows the window again, its menu can also quit.
+
+    Args:
+        app: The application.
+        app_launcher: The launcher, asked to show the window.
+        icon: The tray icon.
+
+    Returns:
+        The tray icon, or None if the desktop has no system tray.
+    """
+    if not QSystemTrayIcon.isSystemTrayAvailable():
+        return None
+    tray = QSystemTrayIcon(icon, app)
+    tray.setToolTip("Apps'Ere")
+    menu = QMenu()
+    show = QAction("Show", menu)
+    show.triggered.connect(lambda: app_launcher.show_requested.emit())
+    quit_action = QAction("Quit", menu)
+    quit_action.triggered.connect(app.quit)
+    menu.addAction(show)
+    menu.addAction(quit_action)
+    tray.setContextMenu(menu)
+    # the menu is not parented to a widget, so keep it alive with the icon
+    tray.menu = menu
+    tray.activated.connect(
+        lambda reason: app_launcher.show_requested.emit() if reason == QSystemTrayIcon.Trigger else None
+    )
+    app.setQuitOnLastWindowClosed(False)
+    tray.show()
+    return tray
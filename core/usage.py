@@ -0,0 +1,411 @@
+import heapq
+import math
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# The auto-populated tab listing the apps launched most, most recently.
+RECENT_TAB = "Recent & Frequent"
+
+# A launch counts half as much after this many days.
+DEFAULT_HALF_LIFE_DAYS = 14.0
+# Launches older than this are dropped from the log when it is compacted, their totals are kept.
+DEFAULT_RETENTION_DAYS = 180
+# How many launches are logged between compactions.
+DEFAULT_COMPACT_EVERY = 1000
+# Seconds close waits for the queued writes, the database may be on a hung NFS home.
+CLOSE_TIMEOUT_S = 5.0
+DEFAULT_RECENT_LIMIT = 12
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL,
+    started REAL NOT NULL,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    app TEXT PRIMARY KEY,
+    launches INTEGER NOT NULL,
+    timed_launches INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    last_launch REAL NOT NULL,
+    frecency REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class AppUsage:
+    """
+    The launch totals of one app.
+    """
+
+    launches: int = 0
+    # launches whose app exited while the launcher was running, so their duration is known
+    timed_launches: int = 0
+    total_duration: float = 0.0
+    last_launch: float = 0.0
+    # see bump_frecency, only comparable to other apps' values
+    frecency: float = -math.inf
+
+
+def bump_frecency(frecency: float, when: float, half_life_s: float) -> float:
+    """
+    Add a launch to an app's frecency.
+
+    The frecency is the sum of 2^((t - now) / half life) over the launch
+    times t, stored as log2 of the sum plus now / half life so the value
+    does not have to be decayed as time passes. Apps compare by it directly
+    and a launch only needs the app's own value, nothing is recomputed from
+    the log.
+
+    Args:
+        frecency: The app's frecency, -inf if it was never launched.
+        when: The launch time in seconds since the epoch.
+        half_life_s: Seconds after which a launch counts half as much.
+
+    Returns:
+        The new frecency.
+    """
+    high, low = sorted((frecency, when / half_life_s), reverse=True)
+    return high + math.log2(1.0 + 2.0 ** (low - high))
+
+
+def frecency_score(frecency: float, now: float, half_life_s: float) -> float:
+    """
+    Convert a frecency to the number of launches it is worth now, for display and export.
+
+    Args:
+        frecency: The stored frecency.
+        now: The time in seconds since the epoch.
+        half_life_s: Seconds after which a launch counts half as much.
+
+    Returns:
+        The decayed launch count, a launch right now counts 1.
+    """
+    return 0.0 if frecency == -math.inf else 2.0 ** (frecency - now / half_life_s)
+
+
+def _read_totals(connection: sqlite3.Connection) -> Dict[str, AppUsage]:
+    rows = connection.execute(
+        "SELECT app, launches, timed_launches, total_duration, last_launch, frecency FROM totals"
+    ).fetchall()
+    return {row[0]: AppUsage(*row[1:]) for row in rows}
+
+
+def load_usage(path: Path) -> Dict[str, AppUsage]:
+    """
+    Read the launch totals without opening the store for writing, e.g. from the command line.
+
+    Args:
+        path: The usage database.
+
+    Returns:
+        The totals keyed by app name, empty if there are none yet.
+    """
+    if not path.exists():
+        return {}
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return _read_totals(connection)
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return {}
+
+
+def export_usage(
+    usage: Dict[str, AppUsage], half_life_days: float = DEFAULT_HALF_LIFE_DAYS, now: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate launch totals for export, to decide which tools to prefetch or keep on local disk.
+
+    Args:
+        usage: The totals keyed by app name.
+        half_life_days: The half life the frecency was recorded with.
+        now: The time the frecency is evaluated at, the current time by default.
+
+    Returns:
+        One entry per app, highest frecency first, with launches, durations in
+        seconds, the last launch as an ISO 8601 UTC time and the decayed frecency.
+    """
+    now = time.time() if now is None else now
+    half_life_s = half_life_days * 86400
+    entries = []
+    for name, totals in sorted(usage.items(), key=lambda item: -item[1].frecency):
+        timed = totals.timed_launches
+        entries.append(
+            {
+                "name": name,
+                "launches": totals.launches,
+                "timed_launches": timed,
+                "total_duration": round(totals.total_duration, 1),
+                "mean_duration": round(totals.total_duration / timed, 1) if timed else None,
+                "last_launch": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(totals.last_launch)),
+                "frecency": round(frecency_score(totals.frecency, now, half_life_s), 3),
+            }
+        )
+    return entries
+
+
+class UsageStore:
+    """
+    A local log of which apps are launched and for how long.
+
+    Every launch is appended to an SQLite log and the per-app totals and
+    frecency are updated as it is recorded, so ranking never reads the log.
+    The totals are kept in memory and written by a single background thread,
+    recording a launch only queues it. The log is compacted by dropping
+    entries older than the retention period, when the store is opened with
+    any in the log and after every so many launches. Launch ids are kept
+    across runs, so that count does not start again with each launcher.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        half_life_days: float = DEFAULT_HALF_LIFE_DAYS,
+        retention_days: float = DEFAULT_RETENTION_DAYS,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the store, the totals are read straight away.
+
+        Args:
+            path: The database file, None to keep the usage in memory only.
+            half_life_days: Days after which a launch counts half as much.
+            retention_days: Days launches are kept in the log.
+            compact_every: Launches logged between compactions.
+            clock: Returns the time in seconds since the epoch.
+        """
+        self._half_life_s = half_life_days * 86400
+        self._retention_s = retention_days * 86400
+        self._compact_every = compact_every
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._usage: Dict[str, AppUsage] = {}
+        # launch id -> app name, for launches whose app has not exited yet
+        self._open: Dict[int, str] = {}
+        self._next_id = 1
+        self._writes: "queue.Queue[Optional[Tuple[str, Tuple[Any, ...]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            try:
+                # only used by the writer thread once the totals are read
+                self._connection = sqlite3.connect(str(path), check_same_thread=False)
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.executescript(_SCHEMA)
+                self._usage = _read_totals(self._connection)
+                self._next_id = (self._connection.execute("SELECT MAX(id) FROM launches").fetchone()[0] or 0) + 1
+            except sqlite3.Error as e:
+                print(f"Launch history not stored, {path}: {e}")
+                self._connection = None
+                self._usage = {}
+        if self._connection is not None:
+            self._thread = threading.Thread(target=self._write, name="usage-writer", daemon=True)
+            self._thread.start()
+
+    def record_launch(self, app_name: str) -> int:
+        """
+        Count a launch, the log is written in the background.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The launch id to pass to record_exit.
+        """
+        now = self._clock()
+        with self._lock:
+            launch_id = self._next_id
+            self._next_id += 1
+            totals = self._usage.setdefault(app_name, AppUsage())
+            totals.launches += 1
+            totals.last_launch = now
+            totals.frecency = bump_frecency(totals.frecency, now, self._half_life_s)
+            self._open[launch_id] = app_name
+            row = asdict(totals)
+        self._queue("launch", launch_id, app_name, now, row)
+        return launch_id
+
+    def record_exit(self, launch_id: int, duration_s: float) -> None:
+        """
+        Add how long a launched app ran to its totals.
+
+        Args:
+            launch_id: The id record_launch returned.
+            duration_s: Seconds from the launch until every process it started exited.
+        """
+        with self._lock:
+            app_name = self._open.pop(launch_id, None)
+            totals = self._usage.get(app_name) if app_name is not None else None
+            if totals is None:
+                return
+            totals.timed_launches += 1
+            totals.total_duration += duration_s
+            row = asdict(totals)
+        self._queue("exit", launch_id, app_name, duration_s, row)
+
+    def frecency(self) -> Dict[str, float]:
+        """
+        Get every launched app's frecency, higher ranks first.
+
+        Returns:
+            A new dictionary keyed by app name.
+        """
+        with self._lock:
+            return {name: totals.frecency for name, totals in self._usage.items()}
+
+    def frecency_of(self, app_name: str) -> float:
+        """
+        Get one app's frecency.
+
+        Args:
+            app_name: The app name.
+
+        Returns:
+            The frecency, -inf if the app was never launched.
+        """
+        with self._lock:
+            totals = self._usage.get(app_name)
+            return -math.inf if totals is None else totals.frecency
+
+    def top(
+        self, limit: Optional[int] = DEFAULT_RECENT_LIMIT, include: Optional[Callable[[str], bool]] = None
+    ) -> List[str]:
+        """
+        Get the apps launched most, most recently.
+
+        With a limit only that many are ranked, the others are not sorted.
+
+        Args:
+            limit: Maximum number of apps, None for all.
+            include: Only apps it returns True for are counted, e.g. those still in the catalogue.
+
+        Returns:
+            App names, highest frecency first, equal ones by name.
+        """
+        with self._lock:
+            usage = self._usage
+            names = [name for name in usage if include is None or include(name)]
+
+            def rank(name: str) -> Tuple[float, str]:
+                return -usage[name].frecency, name
+
+            if limit is None:
+                return sorted(names, key=rank)
+            # the highest frecencies, with ties by name, are the smallest ranks
+            return heapq.nsmallest(limit, names, key=rank)
+
+    def usage(self) -> Dict[str, AppUsage]:
+        """
+        Get a copy of the launch totals.
+
+        Returns:
+            The totals keyed by app name.
+        """
+        with self._lock:
+            return {name: AppUsage(**asdict(totals)) for name, totals in self._usage.items()}
+
+    def export(self) -> List[Dict[str, Any]]:
+        """
+        Get the aggregated launch counts and durations, see export_usage.
+
+        Returns:
+            One entry per app.
+        """
+        return export_usage(self.usage(), self._half_life_s / 86400, self._clock())
+
+    def close(self) -> None:
+        """
+        Write what is queued and close the database, giving up after CLOSE_TIMEOUT_S.
+        """
+        if self._thread is not None:
+            self._writes.put(None)
+            # the writer is a daemon thread, one stuck on a hung home directory is left behind
+            self._thread.join(CLOSE_TIMEOUT_S)
+            self._thread = None
+
+    def _queue(self, kind: str, *args: Any) -> None:
+        if self._thread is not None:
+            self._writes.put((kind, args))
+
+    def _write(self) -> None:
+        """
+        Apply queued writes, runs on the writer thread.
+
+        Everything queued at the time is committed together, so a burst of
+        launches costs one transaction.
+        """
+        assert self._connection is not None
+        try:
+            # checked on every start too, or a launcher that logs a few launches per run would never compact
+            oldest = self._connection.execute("SELECT MIN(started) FROM launches").fetchone()[0]
+            if oldest is not None and oldest < self._clock() - self._retention_s:
+                self._compact()
+        except sqlite3.Error as e:
+            print(f"Launch history not compacted: {e}")
+        stopping = False
+        while not stopping:
+            compact = False
+            batch = [self._writes.get()]
+            while True:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._connection:
+                    for item in batch:
+                        if item is None:
+                            stopping = True
+                            continue
+                        kind, args = item
+                        if kind == "launch":
+                            # every compact_every-th launch id, counted over every run of the launcher
+                            compact = compact or args[0] % self._compact_every == 0
+                            self._log_launch(*args)
+                        else:
+                            self._log_exit(*args)
+                if compact:
+                    self._compact()
+            except sqlite3.Error as e:
+                print(f"Launch history not written: {e}")
+        self._connection.close()
+
+    def _log_launch(self, launch_id: int, app_name: str, started: float, totals: Dict[str, Any]) -> None:
+        assert self._connection is not None
+        self._connection.execute(
+            "INSERT INTO launches (id, app, started) VALUES (?, ?, ?)", (launch_id, app_name, started)
+        )
+        self._store_totals(app_name, totals)
+
+    def _log_exit(self, launch_id: int, app_name: str, duration_s: float, totals: Dict[str, Any]) -> None:
+        assert self._connection is not None
+        self._connection.execute("UPDATE launches SET duration = ? WHERE id = ?", (duration_s, launch_id))
+        self._store_totals(app_name, totals)
+
+    def _store_totals(self, app_name: str, totals: Dict[str, Any]) -> None:
+        assert self._connection is not None
+        self._connection.execute(
+            "INSERT OR REPLACE INTO totals (app, launches, timed_launches, total_duration, last_launch, frecency) "
+            "VALUES (:app, :launches, :timed_launches, :total_duration, :last_launch, :frecency)",
+            dict(totals, app=app_name),
+        )
+
+    def _compact(self) -> None:
+        """
+        Drop launches older than the retention period and give their space back, the totals keep them.
+        """
+        assert self._connection is not None
+        with self._connection:
+            self._connection.execute("DELETE FROM launches WHERE started < ?", (self._clock() - self._retention_s,))
+        self._connection.execute("VACUUM")
@@ -0,0 +1,91 @@
+import os
+import shutil
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from core.procfs import session_of
+
+# Seconds wmctrl may take to answer, it hangs if the X server does.
+WMCTRL_TIMEOUT_S = 5
+
+
+def list_windows() -> Optional[List[Tuple[str, int]]]:
+    """
+    List the top level windows on the display with the pid that owns each.
+
+    Windows are listed with wmctrl, so this only works on X11 with wmctrl installed.
+
+    Returns:
+        (X window id, pid) pairs, or None if windows cannot be listed.
+    """
+    wmctrl = shutil.which("wmctrl")
+    if wmctrl is None or not os.environ.get("DISPLAY"):
+        return None
+    try:
+        output = subprocess.check_output(
+            [wmctrl, "-lp"], text=True, timeout=WMCTRL_TIMEOUT_S, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    windows = []
+    for line in output.splitlines():
+        fields = line.split(None, 3)
+        if len(fields) >= 3 and fields[2].isdigit():
+            windows.append((fields[0], int(fields[2])))
+    return windows
+
+
+def windows_by_session() -> Optional[Dict[int, List[str]]]:
+    """
+    Group the top level windows by the session of the process that shows them, with one wmctrl call.
+
+    Returns:
+        The X window ids keyed by session id, or None if windows cannot be listed.
+    """
+    windows = list_windows()
+    if windows is None:
+        return None
+    sessions: Dict[int, List[str]] = {}
+    for window, pid in windows:
+        session = session_of(pid)
+        if session is not None:
+            sessions.setdefault(session, []).append(window)
+    return sessions
+
+
+def session_windows(session: int) -> Optional[List[str]]:
+    """
+    List the top level windows shown by any process in a session.
+
+    Args:
+        session: The session id, the pid of the launched process.
+
+    Returns:
+        The X window ids, or None if windows cannot be listed.
+    """
+    windows = list_windows()
+    if windows is None:
+        return None
+    return [window for window, pid in windows if session_of(pid) == session]
+
+
+def focus_session(session: int) -> bool:
+    """
+    Raise and focus the first window of a session, blocks so run it off the GUI thread.
+
+    Args:
+        session: The session id, the pid of the launched process.
+
+    Returns:
+        True if a window was focused.
+    """
+    windows = session_windows(session)
+    if not windows:
+        return False
+    try:
+        subprocess.run(
+            ["wmctrl", "-i", "-a", windows[0]], timeout=WMCTRL_TIMEOUT_S, check=True, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return True
@@ -1,42 +1,18 @@
 #!/usr/bin/env -S uv run --script
-import json
+import argparse
 import shutil
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QIcon
-from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtWidgets import QApplication
+# Qt is only imported once we know no other instance will take the command, see __main__,
+# and nothing else is imported before the command line frontend has been ruled out
+from core.cli import COMMANDS
+from core.cli import run as run_cli
 
-import resources_rc  # noqa: F401 qt resource
-from core.applauncher import AppLauncher
-
-
-def load_apps_json(json_path: str) -> List[Dict[str, Any]]:
-    """
-    Load applications from a JSON file and organize them by tab.
-
-    Args:
-        json_path: Path to the JSON file.
-
-    Returns:
-        A list of tab dictionaries, each containing a list of apps.
-    """
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    tabs = {}
-    for app_name, entry in data.items():
-        app = dict(entry)
-        app["name"] = app_name
-        app["popup"] = app.get("popup", False)
-        app["flags"] = list(app.get("flags", []))
-        tab_name = app["tabName"]
-        if tab_name not in tabs:
-            tabs[tab_name] = []
-        tabs[tab_name].append(app)
-    return [{"tabName": tab, "apps": apps} for tab, apps in tabs.items()]
+if TYPE_CHECKING:
+    from core.instance import Command
 
 
 def check_for_menu():
@@ -52,45 +28,141 @@ def check_for_menu():
             pass
 
 
-if __name__ == "__main__":
-    check_for_menu()
+def instance_command(args: argparse.Namespace) -> "Command":
+    """
+    Turn the command line into the command for the running instance.
+    """
+    if args.quit:
+        return {"action": "quit"}
+    if args.launch:
+        return {"action": "launch", "name": args.launch}
+    if args.search is not None:
+        return {"action": "search", "query": args.search}
+    return {"action": "show"}
 
-    app = QApplication(sys.argv)
-    apps_by_tab = load_apps_json("apps.json")
+
+def forward(command: "Command") -> Optional[int]:
+    """
+    Hand a command to the running instance.
+
+    Returns:
+        The exit code if an instance took the command, None if none is running.
+    """
+    from core.instance import send_command
+
+    try:
+        reply = send_command(command)
+    except OSError as e:
+        print(f"The running Apps'Ere did not answer: {e}", file=sys.stderr)
+        return 1
+    if reply is None:
+        return None
+    if not reply.get("ok"):
+        print(reply.get("message", "failed"), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # appsere list|search|launch|quota runs without Qt or the resources
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(run_cli(sys.argv[1:]))
+    parser = argparse.ArgumentParser(description="Apps'Ere application launcher")
+    parser.add_argument("--startup-trace", action="store_true", help="print how long each start up phase takes")
+    parser.add_argument(
+        "--validate", action="store_true", help="check every executable and icon in apps.json, print a report and exit"
+    )
+    parser.add_argument("--launch", metavar="APP", help="launch an app by name")
+    parser.add_argument("--search", metavar="TEXT", help="show the launcher with a search filled in")
+    parser.add_argument("--tray", action="store_true", help="stay resident in the system tray when closed")
+    parser.add_argument("--quit", action="store_true", help="quit the running launcher")
+    parser.add_argument(
+        "--new-instance", action="store_true", help="start a separate launcher even if one is already running"
+    )
+    # anything not recognised here is passed on to Qt (e.g. -platform)
+    args, qt_args = parser.parse_known_args()
+    command = instance_command(args)
+    # a second start hands its command to the running launcher and exits without loading Qt
+    if not args.new_instance and not args.validate:
+        exit_code = forward(command)
+        if exit_code is not None:
+            sys.exit(exit_code)
+        if args.quit:
+            sys.exit(0)
+
+    from PySide6.QtCore import Qt, QUrl
+    from PySide6.QtGui import QIcon
+    from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtWidgets import QApplication
+
+    import resources_rc  # noqa: F401 qt resource
+    from core.applauncher import AppLauncher
+    from core.catalogue import load_apps_json, load_catalogue
+    from core.instance import socket_path
+    from core.instanceserver import InstanceServer
+    from core.metrics import Metrics
+    from core.paths import cache_dir
+    from core.prober import Prober, format_report
+    from core.startup import StartupTrace
+    from core.tray import create_tray_icon
+
+    if args.validate:
+        apps = [app for tab in load_apps_json("apps.json") for app in tab["apps"]]
+        results = Prober(cache_path=cache_dir() / "probe.json").probe(apps, force=True)
+        print(format_report(apps, results))
+        sys.exit(1 if any(not result.ok for result in results.values()) else 0)
+    # shared by the start up trace and the launcher, shown in Debug > Performance
+    metrics = Metrics()
+    trace = StartupTrace(args.startup_trace, metrics=metrics)
+
+    with trace.phase("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+    # served from the local compiled cache unless apps.json has changed
+    with trace.phase("load_catalogue"):
+        apps_by_tab, search_index = load_catalogue("apps.json")
     # create the app launcher backend for our QML tools
-    app_launcher = AppLauncher(apps_by_tab)
+    with trace.phase("AppLauncher"):
+        app_launcher = AppLauncher(apps_by_tab, search_index, catalogue_path="apps.json", metrics=metrics)
+    app.aboutToQuit.connect(app_launcher.shutdown)
+    instance_server = None
+    if not args.new_instance:
+        instance_server = InstanceServer(socket_path(), app_launcher.handle_command)
+        if not instance_server.listen():
+            # another launcher started at the same moment and won the socket
+            sys.exit(forward(command) or 0)
+        app.aboutToQuit.connect(instance_server.shutdown)
     # grab the QML engine.
     engine = QQmlApplicationEngine()
     # associate the qml data (context Properties) to our app_launcher class.
     # This basically makes python objects and data available to the QML UI.
     engine.rootContext().setContextProperty("appLauncher", app_launcher)
+    # tabs and favourites are item models updated in place, so this is only set once
     engine.rootContext().setContextProperty("tabsModel", app_launcher.get_tabs_model())
-    engine.rootContext().setContextProperty("diskQuotas", app_launcher._disk_quotas)
     engine.rootContext().setContextProperty("theme", app_launcher._theme)
     engine.rootContext().setContextProperty("appLauncher", app_launcher)
-    # ... already done in your code
-    engine.load(QUrl("qrc:/qml/main.qml"))
-
-    # closture to update QML model when favourites change
-    def update_tabs_model() -> None:
-        """
-        Update the QML context property for the tabs model when favourites change.
-        """
-        engine.rootContext().setContextProperty("tabsModel", app_launcher.get_tabs_model())
-
-    app_launcher.favourites_changed.connect(update_tabs_model)
+    # icons are decoded and scaled on a thread pool, see core/iconprovider.py
+    engine.addImageProvider("appicon", app_launcher.icon_provider())
+    # only the Favourites grid is built here, other tabs, About and Help load on first use
+    with trace.phase("engine.load"):
+        engine.load(QUrl("qrc:/qml/main.qml"))
 
     root_objects = engine.rootObjects()
+    if not root_objects:
+        sys.exit(-1)
     root = root_objects[0]
-    debug_output = root.findChild(object, "debugOutput")
-
-    # closure do append debut text to the hidden debug panel
-    def append_debug_output(text):
-        if debug_output:
-            debug_output.appendText(text)
-
-    app_launcher.debug_output.connect(append_debug_output)
 
+    def on_first_frame() -> None:
+        """
+        Finish the start up work that is not needed to show the window.
+        """
+        root.frameSwapped.disconnect(on_first_frame)
+        trace.mark("first frame")
+        trace.report()
+        # the desktop menu entry lives on a network share, so check it off the GUI thread
+        threading.Thread(target=check_for_menu, daemon=True).start()
+
+    # frameSwapped comes from the render thread, so queue it to the GUI thread
+    root.frameSwapped.connect(on_first_frame, Qt.QueuedConnection)
     status_bar = root.findChild(object, "statusBar")
     status_label = status_bar.findChild(object, "statusLabel")
 
@@ -102,7 +174,10 @@ if __name__ == "__main__":
     app_launcher.status_changed.connect(set_status)
     # this needs to be loaded locally for menu bars etc as resources are not read by the system icon setup
     app.setWindowIcon(QIcon("./appsereicon.png"))
-    # ensure we have a valid engine.
-    if not engine.rootObjects():
-        sys.exit(-1)
+    tray = None
+    if args.tray or app_launcher._settings.value("instance/tray", False) in (True, "true"):
+        tray = create_tray_icon(app, app_launcher, QIcon("./appsereicon.png"))
+    # a first start with --launch or --search carries it out itself
+    if command["action"] != "show":
+        app_launcher.handle_command(command)
     sys.exit(app.exec())
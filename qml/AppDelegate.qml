@@ -7,6 +7,9 @@ Rectangle {
     property var app: {}
     property var rootWindow
     property int theme: Material.theme
+    // set by the background prober when the executable or icon file is missing
+    readonly property string unavailableReason: appLauncher.unavailableApps[app.name] || ""
+    readonly property bool iconBroken: !!appLauncher.brokenIcons[app.name]
     width: 90
     height: 90
     color: theme === Material.Dark ? "#333" : "#fff"
@@ -16,9 +19,12 @@ Rectangle {
     // Main content layer
     Item {
         anchors.fill: parent
+        opacity: unavailableReason ? 0.4 : 1.0
 
+        // decoded and scaled off the GUI thread, a placeholder is shown if the icon is slow or missing
         Image {
-            source: app.icon
+            source: "image://appicon/" + encodeURIComponent(app.name) + "?rev=" + (appLauncher.iconRevisions[app.name] || 0) + "&missing=" + (iconBroken ? 1 : 0)
+            sourceSize: Qt.size(48, 48)
             anchors.centerIn: parent
             width: 48
             height: 48
@@ -96,9 +102,16 @@ Rectangle {
         acceptedButtons: Qt.LeftButton | Qt.RightButton
         hoverEnabled: true
 
+        // resting on an icon reads the app's files ahead, if prefetching is enabled
+        onContainsMouseChanged: {
+            if (containsMouse)
+                appLauncher.prefetch_app(app.name);
+            else
+                appLauncher.cancel_prefetch(app.name);
+        }
         onClicked: function (mouse) {
             if (mouse.button === Qt.LeftButton) {
-                appLauncher.launch_app(app.path, app.execName, app.flags, !!app.popup);
+                appLauncher.launch_by_name(app.name);
             }
         }
         onPressed: function (mouse) {
@@ -106,8 +119,8 @@ Rectangle {
                 contextMenu.popup();
             }
         }
-        ToolTip.visible: containsMouse && !!app.desc
-        ToolTip.text: app.desc || ""
+        ToolTip.visible: containsMouse && (!!app.desc || !!unavailableReason)
+        ToolTip.text: unavailableReason ? "Not available: " + unavailableReason : (app.desc || "")
         ToolTip.delay: 300
     }
 
@@ -125,7 +138,7 @@ Rectangle {
         }
         MenuItem {
             text: "Create Desktop Shortcut"
-            onTriggered: appLauncher.create_desktop_entry(app)
+            onTriggered: appLauncher.create_desktop_entry(app.name)
         }
     }
 }
@@ -23,7 +23,7 @@ GridView {
 
     delegate: AppDelegate {
         tabName: gridView.tabName
-        app: modelData
+        app: model
         rootWindow: gridView.rootWindow
     }
 }
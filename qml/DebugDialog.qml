@@ -11,8 +11,6 @@ Dialog {
     width: Math.min(700, parent ? parent.width * 0.8 : 700)
     height: Math.min(400, parent ? parent.height * 0.6 : 400)
 
-    property alias debugText: debugTextArea.text
-
     // Center the dialog when it becomes visible
     onVisibleChanged: {
         var win = parent || Qt.application.activeWindow;
@@ -22,17 +20,10 @@ Dialog {
         }
     }
 
-    contentItem: ScrollView {
-        TextArea {
-            id: debugTextArea
-            readOnly: false
-            wrapMode: TextArea.Wrap
-            selectByMouse: true
-            selectByKeyboard: true
-            font.family: "monospace"
-            font.pixelSize: 14
-            text: ""
-        }
+    contentItem: LogView {
+        textColor: Material.foreground
+        fontFamily: "monospace"
+        fontPixelSize: 14
     }
 
     onAccepted: visible = false
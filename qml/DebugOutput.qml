@@ -5,13 +5,11 @@ import QtQuick.Layouts 1.15
 /**
  * DebugOutput.qml
  *
- * Displays debug output in a scrollable text area with a clear button.
- * Use the appendText(text) method to add output.
+ * Displays debug output from appLauncher.debugLog in a scrollable list with a clear button.
  */
 
 Item {
     id: debugOutput
-    property alias text: debugArea.text
     objectName: "debugOutput"
     signal cleared
 
@@ -28,20 +26,14 @@ Item {
         ColumnLayout {
             anchors.fill: parent
             spacing: 8
-            ScrollView {
+            Rectangle {
                 Layout.fillWidth: true
                 Layout.fillHeight: true
-                TextArea {
-                    id: debugArea
-                    Layout.fillWidth: true
-                    Layout.fillHeight: true
-                    readOnly: true
-                    wrapMode: TextArea.Wrap
-                    color: "#fff"
-                    font.family: "Courier New"
-                    background: Rectangle {
-                        color: "#333"
-                    }
+                color: "#333"
+                LogView {
+                    anchors.fill: parent
+                    textColor: "#fff"
+                    fontFamily: "Courier New"
                 }
             }
 
@@ -49,14 +41,10 @@ Item {
                 text: "Clear"
                 Layout.alignment: Qt.AlignRight
                 onClicked: {
-                    debugArea.text = "";
+                    appLauncher.debugLog.clear();
                     debugOutput.cleared();
                 }
             }
         }
     }
-
-    function appendText(msg) {
-        debugArea.text += msg + "\n";
-    }
 }
@@ -10,6 +10,7 @@ RowLayout {
     property real used: 0
     property real quota: 1
     property real limit: 1
+    property string updated: ""
     property int theme: Material.theme
 
     spacing: 12
@@ -27,6 +28,11 @@ RowLayout {
 
     Rectangle {
         id: barBg
+        ToolTip.visible: barHover.hovered && root.updated !== ""
+        ToolTip.text: "Last updated " + root.updated
+        HoverHandler {
+            id: barHover
+        }
         color: theme === Material.Dark ? "#333" : "#e0e0e0"
         radius: 6
         height: 18
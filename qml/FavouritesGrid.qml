@@ -27,7 +27,7 @@ GridView {
         AppDelegate {
             id: appDelegate
             tabName: "Favourites"
-            app: modelData
+            app: model
             rootWindow: gridView.rootWindow
             anchors.fill: parent
         }
@@ -0,0 +1,31 @@
+import QtQuick 2.15
+import QtQuick.Window 2.15
+import QtWebEngine 1.15
+
+/**
+ * HelpWindow.qml
+ *
+ * Shows the documentation page in a web view. Kept in its own file so
+ * QtWebEngine is only loaded the first time Help → Documentation is used.
+ */
+
+Window {
+    id: helpWindow
+    width: 800
+    height: 600
+    visible: false
+    flags: Qt.Dialog | Qt.WindowTitleHint | Qt.WindowCloseButtonHint
+    title: "Using AppsHere!"
+
+    WebEngineView {
+        anchors.fill: parent
+        url: Qt.resolvedUrl("qrc:/help/help.html")
+    }
+
+    function open() {
+        helpWindow.visible = true;
+    }
+    function close() {
+        helpWindow.visible = false;
+    }
+}
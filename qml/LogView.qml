@@ -0,0 +1,73 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+
+/**
+ * LogView.qml
+ *
+ * Virtualized view of the debug output model (appLauncher.debugLog).
+ * Only the visible lines have delegates, and the view follows new output
+ * while it is scrolled to the bottom. Each line shows when it was read and
+ * stderr lines are highlighted. Dropped and truncated line counts are shown
+ * underneath when there are any.
+ */
+
+ColumnLayout {
+    id: logView
+    property var model: appLauncher.debugLog
+    property color textColor: "#fff"
+    property string fontFamily: "monospace"
+    property int fontPixelSize: 13
+    property color stderrColor: "#ef9a9a"
+    spacing: 4
+
+    ListView {
+        id: lineList
+        Layout.fillWidth: true
+        Layout.fillHeight: true
+        clip: true
+        model: logView.model
+        boundsBehavior: Flickable.StopAtBounds
+        ScrollBar.vertical: ScrollBar {}
+
+        // keep following the output unless the user has scrolled up
+        property bool followTail: true
+        onMovementEnded: followTail = atYEnd
+        onCountChanged: {
+            if (followTail) {
+                Qt.callLater(lineList.positionViewAtEnd);
+            }
+        }
+
+        delegate: RowLayout {
+            width: ListView.view ? ListView.view.width : 0
+            spacing: 8
+
+            Text {
+                text: model.time
+                color: "#888"
+                font.family: logView.fontFamily
+                font.pixelSize: logView.fontPixelSize - 2
+                Layout.alignment: Qt.AlignTop
+            }
+            TextEdit {
+                text: model.line
+                readOnly: true
+                selectByMouse: true
+                wrapMode: TextEdit.Wrap
+                color: model.stream === "stderr" ? logView.stderrColor : logView.textColor
+                font.family: logView.fontFamily
+                font.pixelSize: logView.fontPixelSize
+                Layout.fillWidth: true
+            }
+        }
+    }
+
+    Label {
+        Layout.fillWidth: true
+        visible: logView.model.droppedLines > 0 || logView.model.truncatedLines > 0
+        text: "Dropped lines: " + logView.model.droppedLines + "  Truncated lines: " + logView.model.truncatedLines
+        color: "#fbc02d"
+        font.pixelSize: 12
+    }
+}
@@ -2,20 +2,18 @@ import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Controls.Material 2.15
 import QtQuick.Layouts 1.15
-import QtWebEngine 1.15
-import QtQuick.Window 2.15
 
 /**
  * MainMenu.qml
  *
  * Provides the main menu bar with a Help → About item and an About dialog.
  * Usage: Set as the menuBar property of ApplicationWindow.
+ * The dialogs and the help window are created the first time they are opened.
  */
 
 MenuBar {
     id: mainMenuBar
     property var rootWindow
-    property alias aboutDialog: aboutDialog
     Menu {
         title: "Theme"
         MenuItem {
@@ -42,82 +40,98 @@ MenuBar {
                 }
             }
         }
+        MenuItem {
+            text: "Running Apps"
+            onTriggered: openLazily("runningApps", runningAppsComponent)
+        }
+        MenuItem {
+            text: "Performance"
+            onTriggered: openLazily("performance", performanceComponent)
+        }
     }
     Menu {
         title: "Help"
         MenuItem {
             text: "About"
-            onTriggered: {
-                onTriggered: aboutDialog.open();
-            }
+            onTriggered: openLazily("about", aboutComponent)
         }
         MenuItem {
             text: "Documentation"
-            onTriggered: {
-                onTriggered: helpWindow.open();
-            }
+            onTriggered: openLazily("help", Qt.createComponent("qrc:/qml/HelpWindow.qml"))
         }
     }
 
-    Dialog {
-        id: aboutDialog
-        title: "Apps'ere! Launcher"
-        modal: true
-        standardButtons: Dialog.Ok
-        // Center the dialog on the rootWindow
-        x: rootWindow ? (rootWindow.width - width) / 2 : 0
-        y: rootWindow ? (rootWindow.height - height) / 2 : 0
+    // created on first use, the help window is a separate file so QtWebEngine is only loaded when needed
+    property var lazyObjects: ({})
 
-        contentItem: ColumnLayout {
-            width: 300
-            spacing: 12
-            Label {
-                text: "Simple App launcher for Linux"
-                font.bold: true
-                font.pixelSize: 18
-                horizontalAlignment: Text.AlignHCenter
-                Layout.alignment: Qt.AlignHCenter
-            }
-            Label {
-                text: "Version 1.0.0"
-                horizontalAlignment: Text.AlignHCenter
-                Layout.alignment: Qt.AlignHCenter
-            }
-            Label {
-                text: "Written by Jon Macey jmacey@bournemouth.ac.uk"
-                wrapMode: Text.WordWrap
-                horizontalAlignment: Text.AlignHCenter
-                Layout.alignment: Qt.AlignHCenter
-            }
-            Text {
-                text: '<a href="https://github.com/NCCA/AppLauncher">https://github.com/NCCA/AppLauncher</a>'
-                textFormat: Text.RichText
-                wrapMode: Text.WordWrap
-                horizontalAlignment: Text.AlignHCenter
-                Layout.alignment: Qt.AlignHCenter
-                onLinkActivated: Qt.openUrlExternally(link)
+    function openLazily(key, component) {
+        if (!lazyObjects[key]) {
+            if (component.status === Component.Error) {
+                console.error(component.errorString());
+                return;
             }
+            lazyObjects[key] = component.createObject(rootWindow ? rootWindow.contentItem : mainMenuBar);
         }
+        lazyObjects[key].open();
     }
 
-    Window {
-        id: helpWindow
-        width: 800
-        height: 600
-        visible: false
-        flags: Qt.Dialog | Qt.WindowTitleHint | Qt.WindowCloseButtonHint
-        title: "Using AppsHere!"
+    Component {
+        id: aboutComponent
+        Dialog {
+            id: aboutDialog
+            title: "Apps'ere! Launcher"
+            modal: true
+            standardButtons: Dialog.Ok
+            // Center the dialog on the rootWindow
+            x: rootWindow ? (rootWindow.width - width) / 2 : 0
+            y: rootWindow ? (rootWindow.height - height) / 2 : 0
 
-        WebEngineView {
-            anchors.fill: parent
-            url: Qt.resolvedUrl("qrc:/help/help.html")
+            contentItem: ColumnLayout {
+                width: 300
+                spacing: 12
+                Label {
+                    text: "Simple App launcher for Linux"
+                    font.bold: true
+                    font.pixelSize: 18
+                    horizontalAlignment: Text.AlignHCenter
+                    Layout.alignment: Qt.AlignHCenter
+                }
+                Label {
+                    text: "Version 1.0.0"
+                    horizontalAlignment: Text.AlignHCenter
+                    Layout.alignment: Qt.AlignHCenter
+                }
+                Label {
+                    text: "Written by Jon Macey jmacey@bournemouth.ac.uk"
+                    wrapMode: Text.WordWrap
+                    horizontalAlignment: Text.AlignHCenter
+                    Layout.alignment: Qt.AlignHCenter
+                }
+                Text {
+                    text: '<a href="https://github.com/NCCA/AppLauncher">https://github.com/NCCA/AppLauncher</a>'
+                    textFormat: Text.RichText
+                    wrapMode: Text.WordWrap
+                    horizontalAlignment: Text.AlignHCenter
+                    Layout.alignment: Qt.AlignHCenter
+                    onLinkActivated: Qt.openUrlExternally(link)
+                }
+            }
         }
+    }
 
-        function open() {
-            helpWindow.visible = true;
+    Component {
+        id: runningAppsComponent
+        RunningAppsDialog {
+            x: rootWindow ? (rootWindow.width - width) / 2 : 0
+            y: rootWindow ? (rootWindow.height - height) / 2 : 0
         }
-        function close() {
-            helpWindow.visible = false;
+    }
+
+    Component {
+        id: performanceComponent
+        PerformanceDialog {
+            x: rootWindow ? (rootWindow.width - width) / 2 : 0
+            y: rootWindow ? (rootWindow.height - height) / 2 : 0
         }
     }
 }
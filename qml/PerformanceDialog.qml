@@ -0,0 +1,121 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Controls.Material 2.15
+import QtQuick.Layouts 1.15
+
+/**
+ * PerformanceDialog.qml
+ *
+ * Shows the latency of launches, searches, help and start up phases recorded
+ * by appLauncher, as counts, errors and p50/p95/p99 in milliseconds.
+ * The figures are refreshed every second while the dialog is open.
+ */
+
+Dialog {
+    id: performanceDialog
+    title: "Performance"
+    modal: false
+    standardButtons: Dialog.Close
+    width: Math.min(860, parent ? parent.width * 0.95 : 860)
+    height: Math.min(480, parent ? parent.height * 0.8 : 480)
+    property int theme: Material.theme
+    property var stats: []
+
+    function refresh() {
+        stats = appLauncher.performance_stats();
+    }
+
+    onOpened: refresh()
+
+    Timer {
+        interval: 1000
+        repeat: true
+        running: performanceDialog.visible
+        onTriggered: performanceDialog.refresh()
+    }
+
+    contentItem: ColumnLayout {
+        spacing: 8
+
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: 12
+            Repeater {
+                model: ["Operation", "App", "Count", "Errors", "p50 ms", "p95 ms", "p99 ms", "Max ms"]
+                Label {
+                    text: modelData
+                    font.bold: true
+                    Layout.preferredWidth: index === 0 ? 200 : (index === 1 ? 150 : 60)
+                }
+            }
+        }
+
+        ListView {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+            model: performanceDialog.stats
+            ScrollBar.vertical: ScrollBar {}
+
+            delegate: RowLayout {
+                width: ListView.view ? ListView.view.width : 0
+                spacing: 12
+
+                Label {
+                    text: modelData.name
+                    Layout.preferredWidth: 200
+                    elide: Label.ElideRight
+                }
+                Label {
+                    text: modelData.labels.replace("app=", "")
+                    Layout.preferredWidth: 150
+                    elide: Label.ElideRight
+                }
+                Label {
+                    text: modelData.count
+                    Layout.preferredWidth: 60
+                }
+                Label {
+                    text: modelData.errors
+                    Layout.preferredWidth: 60
+                    color: modelData.errors > 0 ? "#e53935" : (theme === Material.Dark ? "#fff" : "#222")
+                }
+                Label {
+                    text: modelData.p50.toFixed(1)
+                    Layout.preferredWidth: 60
+                }
+                Label {
+                    text: modelData.p95.toFixed(1)
+                    Layout.preferredWidth: 60
+                }
+                Label {
+                    text: modelData.p99.toFixed(1)
+                    Layout.preferredWidth: 60
+                }
+                Label {
+                    text: modelData.max.toFixed(1)
+                    Layout.preferredWidth: 60
+                }
+            }
+        }
+
+        RowLayout {
+            Layout.fillWidth: true
+            Label {
+                text: appLauncher.metricsEndpoint !== "" ? "Prometheus: " + appLauncher.metricsEndpoint : ""
+                Layout.fillWidth: true
+                elide: Label.ElideRight
+            }
+            Button {
+                text: "Reset"
+                onClicked: {
+                    appLauncher.reset_performance_stats();
+                    performanceDialog.refresh();
+                }
+            }
+        }
+    }
+
+    onAccepted: visible = false
+    onRejected: visible = false
+}
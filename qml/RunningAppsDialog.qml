@@ -0,0 +1,79 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Controls.Material 2.15
+import QtQuick.Layouts 1.15
+
+/**
+ * RunningAppsDialog.qml
+ *
+ * Lists the apps launched in this session from appLauncher.runningApps,
+ * with their run time and resource use, and buttons to terminate or kill them.
+ */
+
+Dialog {
+    id: runningAppsDialog
+    title: "Running Apps"
+    modal: false
+    standardButtons: Dialog.Close
+    width: Math.min(700, parent ? parent.width * 0.9 : 700)
+    height: Math.min(400, parent ? parent.height * 0.7 : 400)
+    property int theme: Material.theme
+
+    contentItem: ColumnLayout {
+        spacing: 8
+
+        ListView {
+            id: processList
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+            model: appLauncher.runningApps
+            ScrollBar.vertical: ScrollBar {}
+
+            delegate: RowLayout {
+                width: ListView.view ? ListView.view.width : 0
+                spacing: 12
+
+                Label {
+                    text: model.name + " (" + model.pid + ")"
+                    font.bold: model.running
+                    Layout.preferredWidth: 180
+                    elide: Label.ElideRight
+                }
+                Label {
+                    text: model.running ? "running since " + model.startTime : "exited " + model.exitCode
+                    Layout.preferredWidth: 150
+                    color: !model.running && model.exitCode !== 0 ? "#e53935" : (theme === Material.Dark ? "#fff" : "#222")
+                }
+                Label {
+                    text: model.wallTime.toFixed(1) + " s"
+                    Layout.preferredWidth: 70
+                }
+                Label {
+                    // CPU time and peak memory are only known once the process has been reaped
+                    text: model.running ? "" : model.cpuTime.toFixed(1) + " s cpu, " + model.peakRssMb.toFixed(0) + " MB"
+                    Layout.fillWidth: true
+                }
+                Button {
+                    text: "Terminate"
+                    visible: model.running
+                    onClicked: appLauncher.runningApps.terminate(model.pid)
+                }
+                Button {
+                    text: "Kill"
+                    visible: model.running
+                    onClicked: appLauncher.runningApps.kill(model.pid)
+                }
+            }
+        }
+
+        Button {
+            text: "Clear Finished"
+            Layout.alignment: Qt.AlignRight
+            onClicked: appLauncher.runningApps.clear_finished()
+        }
+    }
+
+    onAccepted: visible = false
+    onRejected: visible = false
+}
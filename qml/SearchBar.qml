@@ -8,6 +8,7 @@ import QtQuick.Controls.Material 2.15
  *
  * A simple search bar component with a text field and a clear button.
  * Emits 'search' signal on text change and 'clear' signal when cleared.
+ * setQuery fills the field from outside, e.g. a search passed on the command line.
  */
 
 RowLayout {
@@ -16,6 +17,11 @@ RowLayout {
 
     property int theme: Material.theme
 
+    function setQuery(query) {
+        searchField.text = query;
+        searchField.forceActiveFocus();
+    }
+
     TextField {
         id: searchField
         Layout.fillWidth: true
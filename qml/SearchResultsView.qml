@@ -47,9 +47,10 @@ ScrollView {
                 spacing: 12
                 Layout.alignment: Qt.AlignLeft | Qt.AlignVCenter
 
-                // App icon
+                // App icon, a placeholder if the prober found the file missing
                 Image {
-                    source: model.icon
+                    source: "image://appicon/" + encodeURIComponent(model.name) + "?rev=" + (appLauncher.iconRevisions[model.name] || 0) + "&missing=" + (appLauncher.brokenIcons[model.name] ? 1 : 0)
+                    sourceSize: Qt.size(32, 32)
                     Layout.preferredWidth: 32
                     Layout.preferredHeight: 32
                     fillMode: Image.PreserveAspectFit
@@ -66,13 +67,14 @@ ScrollView {
                         horizontalAlignment: Text.AlignLeft
                         Layout.alignment: Qt.AlignLeft | Qt.AlignVCenter
                         color: theme === Material.Dark ? "#fff" : "#222"
+                        opacity: appLauncher.unavailableApps[model.name] ? 0.4 : 1.0
                     }
                 }
 
                 // Launch button
                 Button {
                     text: "Launch"
-                    onClicked: appLauncher.launch_app(model.path, model.execName, model.flags, !!model.popup)
+                    onClicked: appLauncher.launch_by_name(model.name)
                     Layout.alignment: Qt.AlignLeft | Qt.AlignVCenter
                 }
 
@@ -2,6 +2,7 @@ import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Controls.Material 2.15
 import QtQuick.Layouts 1.15
+import QtQuick.Window 2.15
 
 /**
  * main.qml
@@ -27,6 +28,16 @@ ApplicationWindow {
         function onTheme_changed(theme) {
             rootWindow.currentTheme = theme;
         }
+        // another invocation asked this instance to come to the front
+        function onShow_requested() {
+            if (rootWindow.visibility === Window.Minimized || rootWindow.visibility === Window.Hidden)
+                rootWindow.showNormal();
+            rootWindow.raise();
+            rootWindow.requestActivate();
+        }
+        function onSearch_requested(query) {
+            searchBar.setQuery(query);
+        }
     }
     menuBar: MainMenu {
         rootWindow: rootWindow
@@ -37,12 +48,9 @@ ApplicationWindow {
     }
     Connections {
         target: appLauncher
-        function onDebug_output(line) {
-            debugDialog.debugText += line + "\n";
-        }
         function onStatus_changed(status) {
+            // the output was cleared by the launcher before the process started
             if (status === "show_debug_dialog") {
-                debugDialog.debugText = ""; // Clear previous output
                 debugDialog.visible = true;
             }
         }
@@ -73,24 +81,19 @@ ApplicationWindow {
                 // Search bar at the top
                 SearchBar {
                     id: searchBar
+                    // searches run on a worker thread and update appLauncher.searchResults
                     onSearch: function (query) {
-                        searchResultsModel.clear();
-                        if (query.trim().length > 0) {
-                            var results = appLauncher.search_apps(query);
-                            for (var i = 0; i < results.length; ++i) {
-                                searchResultsModel.append(results[i]);
-                            }
-                        }
+                        appLauncher.search_async(query);
                     }
                     onClear: {
-                        searchResultsModel.clear();
+                        appLauncher.search_async("");
                     }
                 }
 
                 // Displays search results below the search bar
                 SearchResultsView {
                     id: searchResultsView
-                    model: searchResultsModel
+                    model: appLauncher.searchResults
                 }
 
                 // Tab bar for navigation (e.g., Favourites, All Apps)
@@ -100,7 +103,7 @@ ApplicationWindow {
                     Repeater {
                         model: tabsModel
                         TabButton {
-                            text: modelData.tabName
+                            text: model.tabName
                         }
                     }
                 }
@@ -115,11 +118,26 @@ ApplicationWindow {
                     // Dynamically load the correct grid for each tab
                     Repeater {
                         model: tabsModel
+                        // only the current tab is built at start up, the others on first visit
                         Loader {
                             id: tabLoader
-                            active: true
-                            property var tabData: modelData
-                            sourceComponent: tabData.tabName === "Favourites" ? favouritesGridComponent : appGridComponent
+                            readonly property bool isCurrent: stackLayout.currentIndex === index
+                            property bool visited: false
+                            active: visited || isCurrent
+                            onIsCurrentChanged: {
+                                if (isCurrent) {
+                                    visited = true;
+                                    appLauncher.prefetch_tab(tabTitle);
+                                }
+                            }
+                            Component.onCompleted: {
+                                visited = isCurrent;
+                                if (isCurrent)
+                                    appLauncher.prefetch_tab(tabTitle);
+                            }
+                            property string tabTitle: model.tabName
+                            property var tabApps: model.apps
+                            sourceComponent: tabTitle === "Favourites" ? favouritesGridComponent : appGridComponent
                         }
                     }
 
@@ -127,7 +145,7 @@ ApplicationWindow {
                     Component {
                         id: favouritesGridComponent
                         FavouritesGrid {
-                            model: tabData.apps
+                            model: tabApps
                             //rootWindow: rootWindow
                         }
                     }
@@ -136,8 +154,8 @@ ApplicationWindow {
                     Component {
                         id: appGridComponent
                         AppGrid {
-                            tabName: tabData.tabName
-                            model: tabData.apps
+                            tabName: tabTitle
+                            model: tabApps
                             //rootWindow: rootWindow
                         }
                     }
@@ -149,12 +167,14 @@ ApplicationWindow {
             spacing: 4   // This sets the gap between each DiskQuotaBar
 
             Repeater {
-                model: diskQuotas
+                // refreshed in the background, rebinds when diskQuotas changes
+                model: appLauncher.diskQuotas
                 DiskQuotaBar {
                     location: modelData.location
                     used: modelData.used
                     quota: modelData.quota
                     limit: modelData.limit
+                    updated: modelData.updated || ""
                     Layout.fillWidth: true
                 }
             }
@@ -181,9 +201,4 @@ ApplicationWindow {
             }
         }
     }
-
-    // Model to hold search results (must be outside layouts)
-    ListModel {
-        id: searchResultsModel
-    }
 }
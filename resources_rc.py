@@ -0,0 +1,13274 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00:T\
+#\
+ Maya\x0a\x0aCurrent i\
+nstalled version\
+ of [Maya](https\
+://help.autodesk\
+.com/view/MAYAUL\
+/2025/ENU/) is 2\
+025, as well as \
+the default Arno\
+ld Renderer it h\
+as plugins insta\
+lled for\x0a\x0a- [V-R\
+ay](https://docs\
+.chaos.com/displ\
+ay/VMAYA/V-Ray+f\
+or+Maya+Help)\x0a- \
+[Renderman](http\
+s://rmanwiki-26.\
+pixar.com/space/\
+RFM26/21037058/R\
+enderMan+26+for+\
+Maya)\x0a- [Substan\
+ce](https://www.\
+adobe.com/uk/pro\
+ducts/substance3\
+d/plugins/substa\
+nce-in-maya.html\
+)\x0a\x0a[PyMel](https\
+://github.com/Lu\
+maPictures/pymel\
+) is also instal\
+led.\x0a\x0aIt is also\
+ possible to sta\
+rt Maya from the\
+ terminal by typ\
+ing goMaya\x0a\x0aNote\
+ we tend not to \
+install the very\
+ latest version \
+of maya in the l\
+abs as not all p\
+lugins are suppo\
+rted at the time\
+ of release of t\
+he new versions.\
+\x0a\x0a---\x0a# Houdini\x0a\
+\x0aCurrent install\
+ed version of [H\
+oudini](https://\
+www.sidefx.com/d\
+ocs/houdini/) is\
+ 20.5, we also h\
+ave [Renderman f\
+or Houdini](http\
+s://rmanwiki-26.\
+pixar.com/space/\
+RFH26/19268152/I\
+nstallation+of+R\
+enderMan+for+Hou\
+dini) installed.\
+\x0a\x0aYou can run Ho\
+udini from the t\
+erminal using go\
+Houdini, there i\
+s also a Houdini\
+ shell you can r\
+un as a separate\
+ process in Apps\
+'Ere as well as \
+following instru\
+ctions [here](ht\
+tps://nccastaff.\
+bournemouth.ac.u\
+k/jmacey/post/de\
+sktopIcons/Deskt\
+opIcons/)\x0a\x0a---\x0a#\
+ Nuke\x0a\x0aThe curre\
+nt version of [N\
+uke](https://lea\
+rn.foundry.com/n\
+uke/content/user\
+_guide.html) is \
+16.02 you can ru\
+n it from the te\
+rminal using goN\
+uke. Note this w\
+ill default run \
+NukeX\x0a\x0a---\x0a# Nuk\
+eStudio\x0a\x0aThe cur\
+rent version of \
+[Nuke Studio](ht\
+tps://learn.foun\
+dry.com/nuke/con\
+tent/getting_sta\
+rted/using_inter\
+face/nuke_studio\
+_environments.ht\
+ml) is 16.02 you\
+ can run it from\
+ the terminal us\
+ing goNukeStudio\
+\x0a\x0a---\x0a# MudBox\x0a\x0a\
+The current vers\
+ion of [MudBox](\
+https://help.aut\
+odesk.com/view/M\
+BXPRO/ENU/) is 2\
+025 it is a digi\
+tal sculpting pr\
+ogram similar to\
+ ZBrush (which i\
+s not available \
+on Linux).\x0a\x0aIt c\
+an be run in the\
+ terminal using \
+goMudbox\x0a\x0a---\x0a# \
+MotionBuilder\x0a\x0aT\
+he current versi\
+on of [Motion Bu\
+ilder](https://h\
+elp.autodesk.com\
+/view/MOBPRO/202\
+2/ENU/) is 2025 \
+it is used to ed\
+it motion captur\
+e data.\x0a\x0aIt can \
+be run from the \
+terminal using g\
+oMotionbuilder\x0a\x0a\
+\x0a\x0a---\x0a# DavinciR\
+esolve\x0a\x0aThe curr\
+ent version of [\
+Davinci Resolve]\
+(https://www.bla\
+ckmagicdesign.co\
+m/products/davin\
+ciresolve) is 20\
+. It is used for\
+ video editing, \
+colour correctio\
+n, (VFX), motion\
+ graphics, and a\
+udio post-produc\
+tion. It is simi\
+lar to Premier p\
+ro which is not \
+available for Li\
+nux.\x0a\x0aYou can ru\
+n it in the term\
+inal using goDav\
+inci\x0a\x0a---\x0a# Kata\
+na\x0a\x0aThe current \
+installed versio\
+n of [Katana](ht\
+tps://www.foundr\
+y.com/products/k\
+atana) is 8.03 i\
+t has the [Rende\
+rman for Katana]\
+(https://rmanwik\
+i-26.pixar.com/s\
+pace/RFK26/20217\
+861/RenderMan+26\
++for+Katana) plu\
+gins installed a\
+nd the default r\
+enderer is set f\
+or Renderman.  I\
+t is used for Li\
+ghting and Look \
+Dev.\x0a\x0aIt can be \
+run from the ter\
+minal using goKa\
+tana\x0a\x0a---\x0a# Mari\
+\x0a\x0aThe current ve\
+rsion of [Mari](\
+https://learn.fo\
+undry.com/mari/C\
+ontent/user_guid\
+e/user_guide.htm\
+l) is 7.1v2. It \
+is a 3D Pain too\
+l. It has the [R\
+enderman for Mar\
+i](https://rmanw\
+iki-26.pixar.com\
+/space/REN26/196\
+61961/PxrSurface\
++for+Mari) plugi\
+ns installed.\x0a\x0aY\
+ou can run it fr\
+om the terminal \
+use goMari.\x0a\x0a---\
+\x0a# Blender\x0a\x0aThe \
+current version \
+of [blender](htt\
+ps://www.blender\
+.org/support/) i\
+nstalled is 4.4.\
+3 we don't use t\
+his in any teach\
+ing but it is in\
+stalled here for\
+ personal use / \
+experiments.\x0a\x0aPl\
+ease ensure you \
+read any project\
+ briefs closely \
+as some explicit\
+ly say you shoul\
+d use a particul\
+ar DCC tool such\
+ as Maya or Houd\
+ini and not Blen\
+der.\x0a\x0aYou can ru\
+n blender from t\
+he terminal by t\
+yping blender.\x0a\x0a\
+---\x0a# UnrealEdit\
+or\x0a\x0aThe current \
+version of [Uren\
+alEditor](https:\
+//dev.epicgames.\
+com/documentatio\
+n/en-us/unreal-e\
+ngine/unreal-eng\
+ine-5-6-document\
+ation) is 5.6. Y\
+ou will be able \
+to build both C+\
++ and Blueprint \
+apps, but will n\
+eed to read the \
+[Quick Start](ht\
+tps://dev.epicga\
+mes.com/document\
+ation/en-us/unre\
+al-engine/linux-\
+development-quic\
+kstart-for-unrea\
+l-engine) guide \
+here for more in\
+formation.\x0a\x0aYou \
+can run from the\
+ terminal using \
+UnrealEditor\x0a\x0a--\
+-\x0a\x0a# OpenRV\x0a\x0aThe\
+ current version\
+ of [OpenRV](htt\
+ps://aswf-openrv\
+.readthedocs.io/\
+en/latest/) is 3\
+.0.0 it is an im\
+age and sequence\
+ viewer for VFX \
+and animation ar\
+tists. Developed\
+ by the [Academy\
+ Software Founda\
+tion](https://gi\
+thub.com/Academy\
+SoftwareFoundati\
+on)\x0a\x0aYou can use\
+ it from the ter\
+minal by typing \
+rv\x0a\x0a---\x0a\x0a# Image\
+Tool (it)\x0a\x0aThe c\
+urrent version o\
+f [it](https://r\
+manwiki-26.pixar\
+.com/space/REN26\
+/19661909/Image+\
+Tool) is 26.3 it\
+ is the core Ren\
+derman image vie\
+wer tool and is \
+especially usefu\
+l for viewing ex\
+r files and sequ\
+ences. You can u\
+se it from the t\
+erminal by using\
+ it [filename]\x0a\x0a\
+\x0a# Rawtherapee\x0a\x0a\
+The current vers\
+ion of [Rawthera\
+pee](https://raw\
+therapee.com/) i\
+s 5.12 it is a p\
+owerful raw phot\
+o processing sys\
+tem.\x0a\x0aYou can ru\
+n it from the te\
+rminal using goR\
+awtherapee\x0a\x0a---\x0a\
+# Gimp3\x0a\x0a[Gimp](\
+https://www.gimp\
+.org/) (GNU Imag\
+e Manipulation P\
+rogram) is a ima\
+ge editor for Li\
+nux. This is the\
+ latest version \
+3 of gimp.\x0a\x0aIt c\
+an be run from t\
+he terminal usin\
+g gimp3\x0a\x0a---\x0a# G\
+imp2\x0a\x0a[Gimp](htt\
+ps://www.gimp.or\
+g/) (GNU Image M\
+anipulation Prog\
+ram) is a image \
+editor for Linux\
+. This is the la\
+test default RHE\
+L 9.5 2.99 versi\
+on.\x0a\x0aIt can be r\
+un from the term\
+inal using gimp\x0a\
+\x0a\x0a---\x0a\x0a# Audacit\
+y\x0a\x0a[Audacity](ht\
+tps://support.au\
+dacityteam.org/)\
+ is a audio reco\
+rding and editin\
+g tool. It can b\
+e run in the ter\
+minal using auda\
+city\x0a\x0a---\x0a\x0a# Met\
+aShape\x0a\x0a[metasha\
+pe](https://www.\
+agisoft.com/supp\
+ort/tutorials/) \
+is a tool for ph\
+otogrammetry pip\
+elines. It allow\
+s you to process\
+ digital images \
+and generate 3D \
+spatial data.\x0a\x0aY\
+ou can run it fr\
+om the terminal \
+using goMetashap\
+e\x0a\x0a---\x0a\x0a# Houdin\
+iShell\x0a\x0aThis wil\
+l open up a term\
+inal setting up \
+the [houdini she\
+ll](https://www.\
+sidefx.com/faq/q\
+uestion/how-do-i\
+-set-up-the-houd\
+ini-environment-\
+for-command-line\
+-tools/) allowin\
+g access to vari\
+ous [tool](https\
+://www.sidefx.co\
+m/docs/houdini/r\
+ef/utils/index.h\
+tml) packaged wi\
+th houdini. Ther\
+e are instructio\
+ns [here](https:\
+//nccastaff.bour\
+nemouth.ac.uk/jm\
+acey/post/deskto\
+pIcons/DesktopIc\
+ons/) to add you\
+r own tabs to th\
+e different term\
+inals and to cre\
+ate desktop shor\
+tcuts.\x0a\x0a\x0a---\x0a# C\
+Lion\x0a\x0a[Clion](ht\
+tps://www.jetbra\
+ins.com/clion/) \
+is a C++ ide it \
+can be run from \
+the terminal usi\
+ng clion.\x0a\x0a\x0a---\x0a\
+\x0a# PyCharm\x0a\x0a[pyc\
+harm](https://ww\
+w.jetbrains.com/\
+pycharm/) is a p\
+ython ide it can\
+ be run from the\
+ terminal using \
+pycharm\x0a\x0a# Rider\
+\x0a\x0a[Rider](https:\
+//www.jetbrains.\
+com/rider/) is a\
+n IDE for C# and\
+ C++ development\
+ and is ideal fo\
+r developing Unr\
+eal Games applic\
+ations. see [her\
+e](https://www.j\
+etbrains.com/hel\
+p/rider/Unreal_E\
+ngine__Before_Yo\
+u_Start.html#rvh\
+q9l_11) for init\
+ial setup.\x0a\x0a\x0a\x0a--\
+-\x0a\x0a# Warp\x0a\x0a[warp\
+](https://www.wa\
+rp.dev/) is a mo\
+dern terminal th\
+at can be used i\
+nstead of the de\
+fault gnome term\
+inal. If you sig\
+n up you can add\
+ the basic AI to\
+ols with limited\
+ prompts / reque\
+sts per month ht\
+tps://www.warp.d\
+ev/pricing by de\
+fault this is di\
+sabled and the U\
+niversity does n\
+ot license this \
+software.\x0a\x0a---\x0a#\
+ QtCreator\x0a\x0a[Qt \
+Creator](https:/\
+/www.qt.io/produ\
+ct/development-t\
+ools) is an ide \
+for Qt Projects \
+in C++ or Python\
+. Both Qt 5.15.2\
+ and Qt 6.8.3 ar\
+e installed in /\
+public/devel/25-\
+25/Qt\x0a\x0aYou can r\
+un the ide in th\
+e terminal by us\
+ing qtcreator\x0a\x0a-\
+--\x0a\x0a# DesignStud\
+io\x0a\x0a[Qt Design S\
+tudio](https://w\
+ww.qt.io/product\
+/ui-design-tools\
+) is a tool / id\
+e to aid the dev\
+elopment of mode\
+rn QML based app\
+lications in C++\
+ or PySide. Note\
+ for pyside deve\
+lopment you will\
+ need to install\
+ pyside. See Jon\
+'s lecture notes\
+ / labs for more\
+ details.\x0a\x0a---\x0a\x0a\
+# Podman\x0a\x0a[Podma\
+n](https://podma\
+n.io/) is a cont\
+ainer tool for m\
+anaging containe\
+rs on the local \
+machine. Note th\
+at images are st\
+ored on a partit\
+ion on the local\
+ disk so do not \
+transfer from ma\
+chine to machine\
+.\x0a\x0a---\x0a# LMStudi\
+o\x0a\x0a[LMStudio](ht\
+tps://lmstudio.a\
+i/) allows you t\
+o run local LLM \
+ models on your \
+computer. Note t\
+hat these can ge\
+t quite large an\
+d will be stored\
+ in your home di\
+rectory.\x0a\x0aComman\
+d line ollama to\
+ols are also ins\
+talled on the bu\
+ild, you can sta\
+rt ollama using \
+the command line\
+\x0a\x0aollama serve &\
+>/dev/null &\x0a\x0aTh\
+en run models on\
+ the local machi\
+ne, the gollama \
+tool is also ins\
+talled which all\
+ows you to conve\
+rt ollama models\
+ to run on LMStu\
+dio.\x0a\x0a---\x0a\x0a# Zea\
+l\x0a\x0a[zeal](https:\
+//zealdocs.org/)\
+ is an offline d\
+ocumentation bro\
+wser (as sometim\
+es it's quicker \
+to RTFM than it \
+is to process th\
+e AI slop that g\
+oogle serves you\
+ up). I have ins\
+talled quite a f\
+ew of the docset\
+s we use. More c\
+an be requested \
+from Jon.\x0a\x0a\x0a---\x0a\
+\x0a# Allusion\x0a\x0a[Al\
+lusion](https://\
+allusion-app.git\
+hub.io/) is a to\
+ol built for art\
+ists, aimed to h\
+elp you organize\
+ your Visual Lib\
+rary it can be r\
+un from the term\
+inal using allus\
+ion.\x0a\x0a---\x0a\x0a# DJV\
+\x0a\x0a[DJV](https://\
+darbyjohnston.gi\
+thub.io/DJV/)  p\
+rovides professi\
+onal review soft\
+ware for VFX, an\
+imation, and fil\
+m production. It\
+ can be run from\
+ the terminal us\
+ing djv\x0a\x0a---\x0a# G\
+affer\x0a\x0a[gaffer](\
+https://www.gaff\
+erhq.org/) is a \
+free, open-sourc\
+e, node-based VF\
+X application th\
+at enables look \
+developers, ligh\
+ters, and compos\
+itors to easily \
+build, tweak, it\
+erate, and rende\
+r scenes. Core d\
+evelopment on th\
+is project is by\
+ BU Alumni [John\
+ Haddon](https:/\
+/youtu.be/o7YxD7\
+LOpSc?si=GuXKy_2\
+YNqAiEfsd)\x0a\x0a\x0a---\
+\x0a# VLC\x0a\x0a[VLC](ht\
+tps://www.videol\
+an.org/vlc/) is \
+a free and open \
+source cross-pla\
+tform multimedia\
+ player and fram\
+ework that plays\
+ most multimedia\
+ files as well a\
+s DVDs, Audio CD\
+s, VCDs, and var\
+ious streaming p\
+rotocols. It can\
+ be run from the\
+ terminal using \
+vlc [filename]\x0a\x0a\
+\x0a---\x0a\x0a# Obs\x0a\x0a[Ob\
+s Studio](https:\
+//obsproject.com\
+/) is software f\
+or video recordi\
+ng and live stre\
+aming, it will a\
+llow you to reco\
+rd your desktop \
+as well as captu\
+re camera / micr\
+ophones is attac\
+hed. This can be\
+ used to make re\
+cordings of your\
+ project if requ\
+ired.\x0a\x0a---\x0a\x0a# In\
+kscapoe\x0a\x0a[Inksca\
+pe](https://inks\
+cape.org/) is a \
+Vector image too\
+l similar to Ill\
+ustrator which i\
+s not available \
+under Linux.\x0a\x0a\x0a-\
+--\x0a\x0a# Krita\x0a\x0a[Kr\
+ita](https://kri\
+ta.org/en/) is a\
+ professional FR\
+EE and open sour\
+ce painting prog\
+ram. It is made \
+by artists that \
+want to see affo\
+rdable art tools\
+ for everyone. I\
+t is a good alte\
+rnative to photo\
+shop under Linux\
+.\x0a\x0a---\x0a\x0a# MeshLa\
+b\x0a\x0a[Meshlab](htt\
+ps://www.meshlab\
+.net/) is a tool\
+ for processing \
+and editing 3D t\
+riangular meshes\
+.\x0aIt provides a \
+set of tools for\
+ editing, cleani\
+ng, healing, ins\
+pecting, renderi\
+ng, texturing an\
+d converting mes\
+hes. It offers f\
+eatures for proc\
+essing raw data \
+produced by 3D d\
+igitization tool\
+s/devices and fo\
+r preparing mode\
+ls for 3D printi\
+ng.\x0a\x0a---\x0a\x0a# Mesh\
+Room\x0a\x0a[Meshroom]\
+(https://alicevi\
+sion.org/#meshro\
+om)is a free, op\
+en-source 3D Rec\
+onstruction Soft\
+ware based on th\
+e AliceVision fr\
+amework. It allo\
+ws node based wo\
+rkflow to re-con\
+struct meshes fr\
+om 2D images.\x0a\x0a\x0a\
+---\x0a\x0a# MrViewer2\
+\x0a\x0a[Mr Viewer](ht\
+tps://mrv2.sourc\
+eforge.io/) is a\
+  Flipbook, Vide\
+o and Audio Play\
+er\x0a\x0a---\x0a\x0a# Natro\
+n\x0a\x0a[Natron](http\
+s://natrongithub\
+.github.io/) is \
+an open source N\
+ode-based compos\
+iting tool simil\
+ar to Nuke. If y\
+ou need to do si\
+mple comps on yo\
+ur own machine t\
+his is easy to u\
+se and setup and\
+ will seem quite\
+ familiar.\x0a\x0a---\x0a\
+\x0a# OpenToonz\x0a\x0a[O\
+penToonz](https:\
+//opentoonz.gith\
+ub.io/e/) is a 2\
+D animation tool\
+. Based on the s\
+oftware \x22Toonz\x22,\
+ developed by Di\
+gital Video S.p.\
+A. in Italy, Ope\
+nToonz has been \
+customized by St\
+udio Ghibli, and\
+ used for the cr\
+eation of its wo\
+rks for many yea\
+rs. Dwango has l\
+aunched the Open\
+Toonz project in\
+ cooperation wit\
+h Digital Video \
+and Studio Ghibl\
+i.\x0a\x0a\x0a---\x0a\x0a# Penc\
+il2D\x0a\x0a[Pencil2D]\
+(https://www.pen\
+cil2d.org/) is a\
+n easy, intuitiv\
+e tool to make 2\
+D hand-drawn ani\
+mations.\x0a\x0a---\x0a\x0a#\
+ PurRef\x0a\x0a[PurRef\
+](https://www.pu\
+reref.com/) is a\
+ stand-alone pro\
+gram that keeps \
+track of your im\
+ages. It can be \
+used to make moo\
+d-boards or just\
+ to gather refer\
+ences.\x0a\x0a---\x0a\x0a# U\
+ltimakerCura\x0a\x0a[U\
+ltimaker Cura](h\
+ttps://ultimaker\
+.com/software/ul\
+timaker-cura/) 3\
+D printing softw\
+are\x0a\x0a---\x0a# Firef\
+ox\x0a\x0aFirefox is i\
+nstalled as part\
+ of the core RHE\
+L build. Most th\
+ings should work\
+ ok but sometime\
+s Teams can be a\
+n issue and you \
+may have to use \
+chrome.  You can\
+ sign in to fire\
+fox to copy you \
+mozilla account \
+across machines.\
+ This should als\
+o include all pl\
+ugins.\x0a\x0a---\x0a\x0a# B\
+rave\x0a\x0aBrave is i\
+nstalled as part\
+ of the core RHE\
+L build this is \
+the best to use \
+for most things \
+as ad block etc \
+are installed as\
+ default.\x0a\x0a---\x0a#\
+ Chrome\x0a\x0aChrome \
+is installed as \
+part of the core\
+ RHEL build, tea\
+ms and Brightspa\
+ce both work wel\
+l with chrome, h\
+owever it will n\
+ot allow certain\
+ add blockers.\x0a\x0a\
+---\x0a\x0a# LibreOffi\
+ce\x0a\x0a[Libreoffce]\
+(https://www.lib\
+reoffice.org/) i\
+s the core offic\
+e suite for Linu\
+x. It will work \
+with most MS Off\
+ice type documen\
+ts.\x0a\x0a---\x0a\x0a# Writ\
+er\x0a\x0a[libreoffice\
+ --writer](https\
+://www.libreoffi\
+ce.org/discover/\
+writer/) is equi\
+valent to Word.\x0a\
+\x0a---\x0a\x0a# Calc\x0a\x0a[l\
+ibreoffice --cal\
+c](https://www.l\
+ibreoffice.org/d\
+iscover/calc/) i\
+s a spreadsheet \
+tool equivalent \
+to excel\x0a\x0a---\x0a\x0a#\
+ Draw\x0a\x0a[libreoff\
+ice --draw](http\
+s://www.libreoff\
+ice.org/discover\
+/draw/) is a dra\
+wing / diagram t\
+ool equivalent t\
+o visio\x0a\x0a\x0a---\x0a\x0a#\
+ Impress\x0a\x0a[libre\
+office --impress\
+](https://www.li\
+breoffice.org/di\
+scover/draw/) is\
+ a presentation \
+tool equivalent \
+to PowerPoint.\x0a\x0a\
+---\x0a# PDF Viewer\
+\x0a\x0a[evince](https\
+://apps.gnome.or\
+g/en-GB/Evince/)\
+ is a document v\
+iewer Evince sup\
+ports documents \
+in: PDF, PS, EPS\
+, XPS, DjVu, TIF\
+F, DVI (with Syn\
+cTeX), and Comic\
+ Books archives \
+(CBR, CBT, CBZ, \
+CB7).\x0a\x0a\x0a---\x0a\x0a# O\
+bsidian\x0a\x0a[Obsidi\
+an](https://obsi\
+dian.md/) is an \
+offline markdown\
+ based note taki\
+ng app.\x0a\x0a\x0a---\x0a\x0a#\
+ Joplin\x0a\x0a[Joplin\
+](https://joplin\
+app.org/) is an \
+open source note\
+-taking app base\
+d on Markdown.\x0a\x0a\
+\x0a---\x0a\x0a# Zed Edit\
+or, Zed installe\
+r\x0a\x0a[Zed](https:/\
+/zed.dev/) is a \
+fast modern text\
+ editor. This ne\
+eds to be instal\
+led into your ho\
+me directory. Th\
+is script will i\
+nstall it.\x0a\x0a---\x0a\
+# omz\x0a\x0a[oh-my-zs\
+h](https://ohmyz\
+.sh/) is a set o\
+f extension to m\
+ake the zsh even\
+ better. This is\
+ an installer sc\
+ript that only n\
+eeds to be run o\
+nce.\x0a\x0a---\x0a# rust\
+up\x0a\x0a[rustup](htt\
+ps://www.rust-la\
+ng.org/tools/ins\
+tall) is a simpl\
+e tool to instal\
+l rust into your\
+ local environme\
+nt so you can st\
+art developing i\
+n rust. You may \
+need to add .car\
+go/bin to your p\
+ath and re-start\
+ the terminal.\x0a\x0a\
+---\x0a\x0a# VenvClean\
+er\x0a\x0aThis tool al\
+lows you to scan\
+ and find .venv \
+files on your di\
+sk to help clean\
+ them. This was \
+written as an ex\
+ercise in \x22vibe\x22\
+ coding by Jon. \
+you can read mor\
+e [here](https:/\
+/github.com/NCCA\
+/VenvCleaner).\x0a\x0a\
+You can run this\
+ app in the term\
+inal using venv_\
+cleaner which wi\
+ll work as a sim\
+ple cli tool. If\
+ you use the fla\
+g venv_cleaner -\
+-tui you will ge\
+t the terminal u\
+ser interface mo\
+de.\x0a\x0a---\x0a\x0a# PyPr\
+oject\x0a\x0aThis tool\
+ will use uv to \
+setup template p\
+ython projects. \
+It has templates\
+ for all types o\
+f project we use\
+ at the NCCA inc\
+luding Machine L\
+earning with PyT\
+orch, Games with\
+ Pygame. PySide \
+and Marimo. See \
+the lecture [her\
+e](https://nccas\
+taff.bournemouth\
+.ac.uk/jmacey/Le\
+ctures/PythonToo\
+ling/#/)\x0a---\x0a\x0a\x0a#\
+ Code\x0a\x0a[Visual S\
+tudio Code](http\
+s://code.visuals\
+tudio.com/) is a\
+ very useful edi\
+tor there are fu\
+ll instructions \
+on setting up th\
+ings [here](http\
+s://code.visuals\
+tudio.com/docs) \
+you can use the \
+code command in \
+the terminal to \
+open the editor.\
+ Note this is a \
+RHEL installed v\
+ersion and will \
+not get updated \
+regularly. If yo\
+u need the very \
+latest versions,\
+ you should inst\
+all it locally.\x0a\
+\x0aYou can downloa\
+d the CLI versio\
+n [here](https:/\
+/code.visualstud\
+io.com/Download#\
+) extract is and\
+ add an alias in\
+ your .zshrc\x0a\x0a\x0a-\
+--\x0a\
+\x00\x00\x0eA\
+<\
+!doctype html>\x0a<\
+html lang=\x22en\x22>\x0a\
+    <head>\x0a     \
+   <meta charset\
+=\x22UTF-8\x22 />\x0a    \
+    <title>Apps'\
+Ere! Help - Usin\
+g the App</title\
+>\x0a        <style\
+>\x0a            bo\
+dy {\x0a           \
+     font-family\
+: Arial, sans-se\
+rif;\x0a           \
+     margin: 2em\
+;\x0a              \
+  background: #f\
+afafa;\x0a         \
+       color: #2\
+22;\x0a            \
+}\x0a            h1\
+,\x0a            h2\
+ {\x0a             \
+   color: #1976d\
+2;\x0a            }\
+\x0a            .se\
+ction {\x0a        \
+        margin-b\
+ottom: 2em;\x0a    \
+        }\x0a      \
+      img {\x0a    \
+            disp\
+lay: block;\x0a    \
+            marg\
+in: 1em auto;\x0a  \
+              ma\
+x-width: 90%;\x0a  \
+          }\x0a    \
+        code {\x0a \
+               b\
+ackground: #eee;\
+\x0a               \
+ padding: 2px 4p\
+x;\x0a             \
+   border-radius\
+: 3px;\x0a         \
+   }\x0a        </s\
+tyle>\x0a    </head\
+>\x0a    <body>\x0a   \
+     <h1>Using A\
+pps'Ere!</h1>\x0a  \
+      <div class\
+=\x22section\x22>\x0a    \
+        <h2>Over\
+view</h2>\x0a      \
+      <p>\x0a      \
+          <stron\
+g>Apps'Ere!</str\
+ong> is a simple\
+ application lau\
+ncher\x0a          \
+      designed t\
+o help you quick\
+ly find and star\
+t your favorite\x0a\
+                \
+programs.\x0a      \
+      </p>\x0a     \
+   </div>\x0a      \
+  <div class=\x22se\
+ction\x22>\x0a        \
+    <h2>Main Men\
+u</h2>\x0a         \
+   <ul>\x0a        \
+        <li>\x0a   \
+                \
+ <strong>Debug &\
+rarr; Show Outpu\
+t:</strong> Togg\
+le the debug\x0a   \
+                \
+ output panel.\x0a \
+               <\
+/li>\x0a           \
+     <li>\x0a      \
+              <s\
+trong>Help &rarr\
+; About:</strong\
+> View informati\
+on about\x0a       \
+             the\
+ app and its aut\
+hor.\x0a           \
+     </li>\x0a     \
+           <li>\x0a\
+                \
+    <strong>Help\
+ &rarr; Using th\
+e App:</strong> \
+Open this help\x0a \
+                \
+   page.\x0a       \
+         </li>\x0a \
+               <\
+li>\x0a            \
+        <strong>\
+Theme:</strong> \
+Switch between S\
+ystem, Light, an\
+d\x0a              \
+      Dark theme\
+s.\x0a             \
+   </li>\x0a       \
+     </ul>\x0a     \
+   </div>\x0a      \
+  <div class=\x22se\
+ction\x22>\x0a        \
+    <h2>Launchin\
+g Applications</\
+h2>\x0a            \
+<p>\x0a            \
+    Browse or se\
+arch for applica\
+tions in the mai\
+n window. Click \
+an\x0a             \
+   app to launch\
+ it instantly.\x0a \
+           </p>\x0a\
+            <p>\x0a\
+                \
+Right clicking o\
+n any of the app\
+s will give you \
+the option to\x0a  \
+              ad\
+d to the favouri\
+tes. You can als\
+o add a desktop \
+icon. Not that\x0a \
+               t\
+his will need to\
+ be authorized o\
+n first use by r\
+ight clicking\x0a  \
+              on\
+ the desktop ico\
+n and \x22allow lau\
+nch\x22\x0a           \
+ </p>\x0a          \
+  <p>\x0a          \
+      Installer \
+scripts may laun\
+ch a popup on us\
+e with further\x0a \
+               i\
+nstructions, in \
+most cases this \
+will be done as \
+part of a lab\x0a  \
+              so\
+ the instructor \
+will also advise\
+.\x0a            </\
+p>\x0a        </div\
+>\x0a        <div c\
+lass=\x22section\x22>\x0a\
+            <h2>\
+Customizing the \
+App</h2>\x0a       \
+     <p>\x0a       \
+         Use the\
+ <strong>Theme</\
+strong> menu to \
+change the appea\
+rance of\x0a       \
+         the app\
+. Your preferenc\
+e will be rememb\
+ered next time y\
+ou start\x0a       \
+         Apps'Er\
+e!.\x0a            \
+</p>\x0a           \
+ <p>\x0a           \
+     Favourites \
+can be re-arrang\
+ed by clicking o\
+n the lower righ\
+t\x0a              \
+  move area on e\
+ach of the icons\
+. This layout wi\
+ll be remembered\
+\x0a               \
+ on next launch.\
+\x0a            </p\
+>\x0a        </div>\
+\x0a        <div cl\
+ass=\x22section\x22>\x0a \
+           <h2>G\
+etting Help</h2>\
+\x0a            <p>\
+\x0a               \
+ For more inform\
+ation, visit our\
+\x0a               \
+ <a href=\x22https:\
+//github.com/NCC\
+A/AppLauncher\x22 t\
+arget=\x22_blank\x22\x0a \
+                \
+   >GitHub page<\
+/a\x0a             \
+   >\x0a           \
+     or contact \
+the author at\x0a  \
+              <a\
+ href=\x22mailto:jm\
+acey@bournemouth\
+.ac.uk\x22\x0a        \
+            >jma\
+cey@bournemouth.\
+ac.uk</a\x0a       \
+         >.\x0a    \
+        </p>\x0a   \
+     </div>\x0a    \
+</body>\x0a</html>\x0a\
+\
+\x00\x00\x04]\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.L\
+ayouts 1.15\x0a\x0a/**\
+\x0a * DebugOutput.\
+qml\x0a *\x0a * Displa\
+ys debug output \
+from appLauncher\
+.debugLog in a s\
+crollable list w\
+ith a clear butt\
+on.\x0a */\x0a\x0aItem {\x0a\
+    id: debugOut\
+put\x0a    objectNa\
+me: \x22debugOutput\
+\x22\x0a    signal cle\
+ared\x0a\x0a    width:\
+ 600\x0a    height:\
+ 300\x0a\x0a    Rectan\
+gle {\x0a        an\
+chors.fill: pare\
+nt\x0a        color\
+: \x22#222\x22\x0a       \
+ radius: 8\x0a     \
+   border.color:\
+ \x22#888\x22\x0a        \
+border.width: 1\x0a\
+\x0a        ColumnL\
+ayout {\x0a        \
+    anchors.fill\
+: parent\x0a       \
+     spacing: 8\x0a\
+            Rect\
+angle {\x0a        \
+        Layout.f\
+illWidth: true\x0a \
+               L\
+ayout.fillHeight\
+: true\x0a         \
+       color: \x22#\
+333\x22\x0a           \
+     LogView {\x0a \
+                \
+   anchors.fill:\
+ parent\x0a        \
+            text\
+Color: \x22#fff\x22\x0a  \
+                \
+  fontFamily: \x22C\
+ourier New\x22\x0a    \
+            }\x0a  \
+          }\x0a\x0a   \
+         Button \
+{\x0a              \
+  text: \x22Clear\x22\x0a\
+                \
+Layout.alignment\
+: Qt.AlignRight\x0a\
+                \
+onClicked: {\x0a   \
+                \
+ appLauncher.deb\
+ugLog.clear();\x0a \
+                \
+   debugOutput.c\
+leared();\x0a      \
+          }\x0a    \
+        }\x0a      \
+  }\x0a    }\x0a}\x0a\
+\x00\x00\x0a_\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.C\
+ontrols.Material\
+ 2.15\x0aimport QtQ\
+uick.Layouts 1.1\
+5\x0a\x0a/**\x0a * Runnin\
+gAppsDialog.qml\x0a\
+ *\x0a * Lists the \
+apps launched in\
+ this session fr\
+om appLauncher.r\
+unningApps,\x0a * w\
+ith their run ti\
+me and resource \
+use, and buttons\
+ to terminate or\
+ kill them.\x0a */\x0a\
+\x0aDialog {\x0a    id\
+: runningAppsDia\
+log\x0a    title: \x22\
+Running Apps\x22\x0a  \
+  modal: false\x0a \
+   standardButto\
+ns: Dialog.Close\
+\x0a    width: Math\
+.min(700, parent\
+ ? parent.width \
+* 0.9 : 700)\x0a   \
+ height: Math.mi\
+n(400, parent ? \
+parent.height * \
+0.7 : 400)\x0a    p\
+roperty int them\
+e: Material.them\
+e\x0a\x0a    contentIt\
+em: ColumnLayout\
+ {\x0a        spaci\
+ng: 8\x0a\x0a        L\
+istView {\x0a      \
+      id: proces\
+sList\x0a          \
+  Layout.fillWid\
+th: true\x0a       \
+     Layout.fill\
+Height: true\x0a   \
+         clip: t\
+rue\x0a            \
+model: appLaunch\
+er.runningApps\x0a \
+           Scrol\
+lBar.vertical: S\
+crollBar {}\x0a\x0a   \
+         delegat\
+e: RowLayout {\x0a \
+               w\
+idth: ListView.v\
+iew ? ListView.v\
+iew.width : 0\x0a  \
+              sp\
+acing: 12\x0a\x0a     \
+           Label\
+ {\x0a             \
+       text: mod\
+el.name + \x22 (\x22 +\
+ model.pid + \x22)\x22\
+\x0a               \
+     font.bold: \
+model.running\x0a  \
+                \
+  Layout.preferr\
+edWidth: 180\x0a   \
+                \
+ elide: Label.El\
+ideRight\x0a       \
+         }\x0a     \
+           Label\
+ {\x0a             \
+       text: mod\
+el.running ? \x22ru\
+nning since \x22 + \
+model.startTime \
+: \x22exited \x22 + mo\
+del.exitCode\x0a   \
+                \
+ Layout.preferre\
+dWidth: 150\x0a    \
+                \
+color: !model.ru\
+nning && model.e\
+xitCode !== 0 ? \
+\x22#e53935\x22 : (the\
+me === Material.\
+Dark ? \x22#fff\x22 : \
+\x22#222\x22)\x0a        \
+        }\x0a      \
+          Label \
+{\x0a              \
+      text: mode\
+l.wallTime.toFix\
+ed(1) + \x22 s\x22\x0a   \
+                \
+ Layout.preferre\
+dWidth: 70\x0a     \
+           }\x0a   \
+             Lab\
+el {\x0a           \
+         // CPU \
+time and peak me\
+mory are only kn\
+own once the pro\
+cess has been re\
+aped\x0a           \
+         text: m\
+odel.running ? \x22\
+\x22 : model.cpuTim\
+e.toFixed(1) + \x22\
+ s cpu, \x22 + mode\
+l.peakRssMb.toFi\
+xed(0) + \x22 MB\x22\x0a \
+                \
+   Layout.fillWi\
+dth: true\x0a      \
+          }\x0a    \
+            Butt\
+on {\x0a           \
+         text: \x22\
+Terminate\x22\x0a     \
+               v\
+isible: model.ru\
+nning\x0a          \
+          onClic\
+ked: appLauncher\
+.runningApps.ter\
+minate(model.pid\
+)\x0a              \
+  }\x0a            \
+    Button {\x0a   \
+                \
+ text: \x22Kill\x22\x0a  \
+                \
+  visible: model\
+.running\x0a       \
+             onC\
+licked: appLaunc\
+her.runningApps.\
+kill(model.pid)\x0a\
+                \
+}\x0a            }\x0a\
+        }\x0a\x0a     \
+   Button {\x0a    \
+        text: \x22C\
+lear Finished\x22\x0a \
+           Layou\
+t.alignment: Qt.\
+AlignRight\x0a     \
+       onClicked\
+: appLauncher.ru\
+nningApps.clear_\
+finished()\x0a     \
+   }\x0a    }\x0a\x0a    \
+onAccepted: visi\
+ble = false\x0a    \
+onRejected: visi\
+ble = false\x0a}\x0a\
+\x00\x00\x03\xfd\
+(\
+\xb5/\xfd`9\x0d\x9d\x1f\x00F\xef\x89'\xe0\x948\
+\x07\xd8\x03\xe8\xe5\x02\xbb\xdb\x07l|\xa9\x13\x8e\xbb\x8a\
+\x93\xc7'o\xd2\xa1h\x11\xbe\x85\x9a\xa9Y/\x83\x19\
+\x86a\xbc\x10{\x00x\x00\x82\x00[a\x8c\x10\xbb\x84\
+\xc7L\x18J M\xb4\xf2d\xdeWj\xcblR\xaf\
+\xef\x15\x9e\xa0\xf4}\xe4\xa3\xda\x8a'\xb5\xfc\xba\xf5]\
+\xf44{\xf3\xeb\xfaJ\xbe\xd3\xb8\x17\xbf\xad\xaf\xd4\xbd\
+(\x99\xbdxk~\x84\x92\xdb/~\xaf~\xf5\xcc\x0b\
+\xe3P\xc4D\x1ag:,%\x1f\xc6\xd3\xe2\xb5\xb8\xc0\
+!\x01\x01\x02\xc8\xf2\xda\xd9\x1cy\x13\xf1A\xde~\x14\
+\xad\xc6\xc9-\xa7\xa6A\x93\xa5]\x1eB\xc1\xec\xa2/\
+\xde<)\x06\x03\x139a[P\x07\xc7]m~\x9d\
+v\xb7XK\xf8\x91\xe6\xa5\x93)\x02\x82A_\x1c\xb8\
+\x17\xe5\xee\x13\xa6I\x17x[x\xcb\xe5G_\x91\x0e\
+\x10&\x12b\xed\xeaGqwu\x05=3j\xee\xaa\
+\x9c\xddYC\xc5\xaf\xeb\xd6\xf8\xac\xbb\xf8\xaa\x89E\xd1\
+\xdd\xc6\x86M\xef*\xf8\xff\x10\xc9!\x88@.\x9d\xaf\
+\xf0\xd5Fxy\xfe\x11\xde\xce\xbe\xda\xab.[\xcb_\
+~\xaf\xcb\x19\x07Z\xdf+\xa3\xd5JN*\x11\x9e\x85\
+\x1a]\xe1d\xb1L\xee.I\x97/\x5cz&\x93\xf9\
+g+\x09\xabe^k\x99Vq~\xb4\x96\xd3z\xfd\
+\x1c\x5c\x7f\xb6\xe3~t|\x1e\x05f\xc2`\x7f\xd0P\
+\xca\x10\xbd\x12=\x8e8\x96ws\xb1l\xc4\x08\xad\xe6\
+\x99\x1b\x08\x81zTbY\x9c\x9a;l[\xa2\xe5\xb6\
+\x9cT\xb5\xbc\x1c\x0e\xe4\x0c9\xe3\x07\xac\xb0\xd38\x12\
+J\x99m\xc6}\xd7o\xe9\xb2$I\x96\x0e//\x06\
+3\x5c\xb5ri\x85\x9c%\x09\x94\x89G\xcb\x9c\x12P\
+\x09\xb5 \xbb\x913\xf3\xa6KQ\x0c\x09\x1e\xec\xaa\x0d\
+\xa1`\xd4\xc8\xd9[w\x13\xb9\x81Gw5\xdbk\xb2\
+E\x14=\x93\x01xK8i%\x1f*\x05\xb9\x17\xfb\
+<\x0c3a(\xc52\xa9\xf6\x03!f7i\xa2\x94\
+\xe8r\xb9X\x96\x15\xc2\xcf!\x9a\x0a0\x05\xd3\x06D\
+\x0a\xe7\x19\xa5\x83\xc9B\x892\x94\xbeh\xb2\xd4\x8bt\
+\xb9\xd5\xb8yhn+\x18\x17{\xb2\xdd-t\x9a\xdb\
+~\x9c%\xb9\x8b\x8f\x82\xcd\xdbi\xfc\x1ab\x9cLa\
+P\x18\xa9\x80\xbf\xa8a%dFh\x84\xa4\x05)H\
+\x86\x030\x84\x10\xa4\xc8\x8c\x1b\xb2\x98h\x1aC\x90\xc4\
+\x08b\x84\x08\x08%$\x91D\x22yd\x96\xb8p\xc3\
+\x14\xb8\x98\xcf\xa9\xf2\x91]`a9\xf9\x7f\x84Y\x14\
+\xbb\xbfWXE?\xb8\x97\xe1Z\xe9\x01=\x93\x8d\xc5\
+\xbe\x9f\xa6\x12\x83\xb8C\x03\xf7\xca\x05\x16\xea\x9ay\xd9\
+i\xc0o\xc43\xb5d\xe4\xb2\xe2\xb5\xc0\xfa\x10\x88\xc7\
+\xb9\xac\xfe\xd1Xx\x0b\x07\x07Z\xb8\xde\x8361\xfc\
+P$\xf04L\xb5kx\xf9E\xdf\xd5\x92a\x0b\x0b\
+\xcb\x85N,i\x08i\xf0\x11\x80\xf6q\x01\xb4\xc9\xa0\
+\x11\xdf\x1e\xf2\xb5u\x04|9{\xbf_\x12{,\xc1\
+\xc7$r\x98\xad/\x07i\x09`\x1b\xefA\xab\xb8\xf8\
+\xdd\xabJV\xfc]\x945\x9d*\x03\xb9\xfc\x80\x89\xb2\
+p[\xd4A\xa3\xa0b\xd3'|\x89rfP\x1b\x1c\
+5t\xe7[\x15\xce;\xe4\x93\xa6\xb1-K\xe9D\xce\
+\xe1\xc6\xdc3Ri\x0a5\xea\x96\x1b/\x06)%\x09\
+\x092\x99?\xe0\xc7\x1e\x19\x8e\xbe(\xc0\x800\xadJ\
+\x02D\x90\x0d0\xac\xea\xfe\x5c.\xec\xb6\x92\xb9\xba\xad\
+RLq\x09E6\x10\xb2O\x96c%\x16\x08i6\
+H\x1a-\xfa\x8d_\x03\x86\xd1?/\xcf<\xf5\x86Y\
+\x1e\xb4\xee\xab\xa5\xdd\xe6\x18+9Y\x92\xae\x0d\xd2\x5c\
+\x8d\xd3\xbb\xb6\x89\xcb\xde@]P\x8d\xe5XQ\x90\x92\
+D\x8d\x86\xdfT\xe2U\x9c\xed=\xa6\x07\xa4^\x98\xa3\
+,w\xf8\x17\x81zH9\x8fJ\xb2\xc55.X\xa1\
+:\xc6\xd2\x14\xd8\x13V\x0fo\xa0\x09\xcc\xbcs\x8e\x1e\
+\xf1\x22GKM\x83b\x02x,\x89\xf2>\x8d\x02\xee\
+\xc5\xb1\x02\x06\xddGs\xece\x87\xfa\xfc\x0f^\xa3\x92\
+\x88\xa5\x9bR1S\x81\x0c%\x12\xafV\xce\x8a\xbf\xe3\
+\x17\xfd,\x9e\xa0\x0a\xd0\x89w\xa7@\x05\
+\x00\x00\x08\x01\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+\x0a/**\x0a * Favourit\
+esGrid.qml\x0a *\x0a *\
+ Displays a grid\
+ of favourite ap\
+plications, allo\
+wing users to re\
+order them via d\
+rag-and-drop.\x0a *\
+ Uses AppDelegat\
+e for each app i\
+con and provides\
+ a drag handle f\
+or reordering.\x0a \
+* The model is e\
+xpected to be se\
+t externally (e.\
+g., from main.qm\
+l).\x0a */\x0a\x0aGridVie\
+w {\x0a    id: grid\
+View\x0a    propert\
+y var rootWindow\
+\x0a    cellWidth: \
+100\x0a    cellHeig\
+ht: 100\x0a\x0a    mod\
+el: model\x0a\x0a    p\
+roperty int drag\
+Index: -1\x0a\x0a    d\
+elegate: Item {\x0a\
+        id: dele\
+gateItem\x0a       \
+ width: gridView\
+.cellWidth\x0a     \
+   height: gridV\
+iew.cellHeight\x0a\x0a\
+        AppDeleg\
+ate {\x0a          \
+  id: appDelegat\
+e\x0a            ta\
+bName: \x22Favourit\
+es\x22\x0a            \
+app: model\x0a     \
+       rootWindo\
+w: gridView.root\
+Window\x0a         \
+   anchors.fill:\
+ parent\x0a        \
+}\x0a\x0a        Recta\
+ngle {\x0a         \
+   id: dragHandl\
+e\x0a            wi\
+dth: 20\x0a        \
+    height: 20\x0a \
+           ancho\
+rs.right: parent\
+.right\x0a         \
+   anchors.botto\
+m: parent.bottom\
+\x0a            col\
+or: \x22#cccccc\x22\x0a  \
+          radius\
+: 10\x0a           \
+ border.color: \x22\
+#888\x22\x0a          \
+  border.width: \
+1\x0a\x0a            T\
+ext {\x0a          \
+      anchors.ce\
+nterIn: parent\x0a \
+               t\
+ext: \x22\x5cu2630\x22\x0a  \
+              fo\
+nt.pixelSize: 14\
+\x0a            }\x0a\x0a\
+            Mous\
+eArea {\x0a        \
+        anchors.\
+fill: parent\x0a   \
+             dra\
+g.target: delega\
+teItem\x0a         \
+       acceptedB\
+uttons: Qt.LeftB\
+utton\x0a\x0a         \
+       onPressed\
+: {\x0a            \
+        gridView\
+.dragIndex = ind\
+ex;\x0a            \
+    }\x0a          \
+      onReleased\
+: {\x0a            \
+        gridView\
+.dragIndex = -1;\
+\x0a               \
+ }\x0a             \
+   onPositionCha\
+nged: function (\
+mouse) {\x0a       \
+             var\
+ pos = gridView.\
+mapFromItem(dele\
+gateItem, mouse.\
+x, mouse.y);\x0a   \
+                \
+ var toIndex = g\
+ridView.indexAt(\
+pos.x, pos.y);\x0a \
+                \
+   if (toIndex !\
+== -1 && toIndex\
+ !== index && gr\
+idView.dragIndex\
+ === index) {\x0a  \
+                \
+      appLaunche\
+r.move_favourite\
+(index, toIndex)\
+;\x0a              \
+          gridVi\
+ew.dragIndex = t\
+oIndex;\x0a        \
+            }\x0a  \
+              }\x0a\
+            }\x0a  \
+      }\x0a    }\x0a}\x0a\
+\
+\x00\x00\x0cX\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.C\
+ontrols.Material\
+ 2.15\x0aimport QtQ\
+uick.Layouts 1.1\
+5\x0a\x0a/**\x0a * Search\
+ResultsView.qml\x0a\
+ *\x0a * Displays s\
+earch results in\
+ a scrollable li\
+st.\x0a * Each resu\
+lt shows the app\
+ icon, name, and\
+ buttons to laun\
+ch or add to fav\
+ourites.\x0a * The \
+model is expecte\
+d to be set exte\
+rnally.\x0a */\x0a\x0aScr\
+ollView {\x0a    id\
+: scrollArea\x0a\x0a  \
+  // Expose the \
+ListView's model\
+ as a property a\
+lias\x0a    propert\
+y alias model: s\
+earchResultsView\
+.model\x0a\x0a    Layo\
+ut.fillWidth: tr\
+ue\x0a    // Show u\
+p to 5 items (ea\
+ch 64px tall), a\
+djust as needed\x0a\
+    Layout.prefe\
+rredHeight: Math\
+.min(model.count\
+ * 64, 320)\x0a    \
+// Only visible \
+if there are sea\
+rch results\x0a    \
+visible: model.c\
+ount > 0\x0a\x0a    Li\
+stView {\x0a       \
+ id: searchResul\
+tsView\x0a        w\
+idth: parent.wid\
+th\x0a        heigh\
+t: contentHeight\
+\x0a        model: \
+model\x0a        in\
+teractive: true\x0a\
+        clip: tr\
+ue\x0a\x0a        dele\
+gate: Rectangle \
+{\x0a            id\
+: delegateRect\x0a \
+           width\
+: ListView.view \
+? ListView.view.\
+width : 0\x0a      \
+      height: 60\
+\x0a\x0a            //\
+ Theme-aware col\
+ors\x0a            \
+property int the\
+me: Material.the\
+me\x0a            c\
+olor: theme === \
+Material.Dark ? \
+\x22#232323\x22 : \x22#e0\
+e0e0\x22\x0a          \
+  border.color: \
+theme === Materi\
+al.Dark ? \x22#666\x22\
+ : \x22#888\x22\x0a      \
+      radius: 8\x0a\
+\x0a            Row\
+Layout {\x0a       \
+         anchors\
+.fill: parent\x0a  \
+              sp\
+acing: 12\x0a      \
+          Layout\
+.alignment: Qt.A\
+lignLeft | Qt.Al\
+ignVCenter\x0a\x0a    \
+            // A\
+pp icon, a place\
+holder if the pr\
+ober found the f\
+ile missing\x0a    \
+            Imag\
+e {\x0a            \
+        source: \
+\x22image://appicon\
+/\x22 + encodeURICo\
+mponent(model.na\
+me) + \x22?rev=\x22 + \
+(appLauncher.ico\
+nRevisions[model\
+.name] || 0) + \x22\
+&missing=\x22 + (ap\
+pLauncher.broken\
+Icons[model.name\
+] ? 1 : 0)\x0a     \
+               s\
+ourceSize: Qt.si\
+ze(32, 32)\x0a     \
+               L\
+ayout.preferredW\
+idth: 32\x0a       \
+             Lay\
+out.preferredHei\
+ght: 32\x0a        \
+            fill\
+Mode: Image.Pres\
+erveAspectFit\x0a  \
+                \
+  Layout.alignme\
+nt: Qt.AlignLeft\
+ | Qt.AlignVCent\
+er\x0a             \
+   }\x0a\x0a          \
+      // App nam\
+e\x0a              \
+  ColumnLayout {\
+\x0a               \
+     Layout.alig\
+nment: Qt.AlignL\
+eft | Qt.AlignVC\
+enter\x0a          \
+          Text {\
+\x0a               \
+         text: m\
+odel.name\x0a      \
+                \
+  font.pixelSize\
+: 16\x0a           \
+             fon\
+t.bold: true\x0a   \
+                \
+     horizontalA\
+lignment: Text.A\
+lignLeft\x0a       \
+                \
+ Layout.alignmen\
+t: Qt.AlignLeft \
+| Qt.AlignVCente\
+r\x0a              \
+          color:\
+ theme === Mater\
+ial.Dark ? \x22#fff\
+\x22 : \x22#222\x22\x0a     \
+                \
+   opacity: appL\
+auncher.unavaila\
+bleApps[model.na\
+me] ? 0.4 : 1.0\x0a\
+                \
+    }\x0a          \
+      }\x0a\x0a       \
+         // Laun\
+ch button\x0a      \
+          Button\
+ {\x0a             \
+       text: \x22La\
+unch\x22\x0a          \
+          onClic\
+ked: appLauncher\
+.launch_by_name(\
+model.name)\x0a    \
+                \
+Layout.alignment\
+: Qt.AlignLeft |\
+ Qt.AlignVCenter\
+\x0a               \
+ }\x0a\x0a            \
+    // Add to Fa\
+vourites button\x0a\
+                \
+Button {\x0a       \
+             tex\
+t: \x22Add to Favou\
+rites\x22\x0a         \
+           onCli\
+cked: appLaunche\
+r.add_to_favouri\
+tes(model.name)\x0a\
+                \
+    Layout.align\
+ment: Qt.AlignLe\
+ft | Qt.AlignVCe\
+nter\x0a           \
+     }\x0a         \
+   }\x0a        }\x0a \
+   }\x0a}\x0a\
+\x00\x00\x02r\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.L\
+ayouts 1.15\x0a\x0a/**\
+\x0a * AppGrid.qml\x0a\
+ *\x0a * Displays a\
+ grid of applica\
+tion icons using\
+ AppDelegate as \
+the delegate.\x0a *\
+ The model is ex\
+pected to be set\
+ externally.\x0a * \
+The tabName prop\
+erty is passed t\
+o each delegate \
+for context (e.g\
+., \x22Favourites\x22)\
+.\x0a */\x0a\x0aGridView \
+{\x0a    id: gridVi\
+ew\x0a\x0a    property\
+ string tabName:\
+ \x22\x22\x0a    property\
+ var rootWindow\x0a\
+\x0a    Layout.fill\
+Width: true\x0a    \
+Layout.fillHeigh\
+t: true\x0a    cell\
+Width: 100\x0a    c\
+ellHeight: 100\x0a\x0a\
+    delegate: Ap\
+pDelegate {\x0a    \
+    tabName: gri\
+dView.tabName\x0a  \
+      app: model\
+\x0a        rootWin\
+dow: gridView.ro\
+otWindow\x0a    }\x0a}\
+\x0a\
+\x00\x00\x07|\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.L\
+ayouts 1.15\x0aimpo\
+rt QtQuick.Contr\
+ols.Material 2.1\
+5\x0aimport QtQuick\
+.Window 2.15\x0a\x0aWi\
+ndow {\x0a    id: a\
+boutWindow\x0a    p\
+roperty string a\
+boutText: \x22\x22\x0a   \
+ property int th\
+eme: Material.th\
+eme\x0a    width: 4\
+00\x0a    height: 3\
+00\x0a    visible: \
+false\x0a    flags:\
+ Qt.Dialog | Qt.\
+WindowTitleHint \
+| Qt.WindowClose\
+ButtonHint\x0a    t\
+itle: \x22About\x22\x0a\x0a \
+   color: theme \
+=== Material.Dar\
+k ? \x22#222\x22 : \x22#f\
+ff\x22\x0a\x0a    // Top-\
+level Item for f\
+ocus and key han\
+dling\x0a    Item {\
+\x0a        id: con\
+tentRoot\x0a       \
+ anchors.fill: p\
+arent\x0a        fo\
+cus: true\x0a\x0a     \
+   Keys.onReleas\
+ed: {\x0a          \
+  if (event.key \
+=== Qt.Key_Escap\
+e) {\x0a           \
+     aboutWindow\
+.close()\x0a       \
+         event.a\
+ccepted = true\x0a \
+           }\x0a   \
+     }\x0a\x0a        \
+ColumnLayout {\x0a \
+           ancho\
+rs.fill: parent\x0a\
+            anch\
+ors.margins: 16\x0a\
+            spac\
+ing: 12\x0a\x0a       \
+     ScrollView \
+{\x0a              \
+  id: scroll\x0a   \
+             Lay\
+out.fillWidth: t\
+rue\x0a            \
+    Layout.fillH\
+eight: true\x0a    \
+            clip\
+: true\x0a\x0a        \
+        Text {\x0a \
+                \
+   id: aboutText\
+Item\x0a           \
+         text: a\
+boutWindow.about\
+Text\x0a           \
+         wrapMod\
+e: Text.WordWrap\
+\x0a               \
+     textFormat:\
+ theme === Mater\
+ial.Dark ? Text.\
+RichText : Text.\
+MarkdownText\x0a   \
+                \
+ color: theme ==\
+= Material.Dark \
+? \x22#fff\x22 : \x22#222\
+\x22\x0a              \
+      width: scr\
+oll.availableWid\
+th\x0a             \
+       onLinkAct\
+ivated: Qt.openU\
+rlExternally(lin\
+k)\x0a             \
+   }\x0a           \
+ }\x0a\x0a            \
+Button {\x0a       \
+         text: \x22\
+Close\x22\x0a         \
+       Layout.al\
+ignment: Qt.Alig\
+nRight\x0a         \
+       onClicked\
+: aboutWindow.cl\
+ose()\x0a          \
+  }\x0a        }\x0a  \
+  }\x0a\x0a    functio\
+n openWithText(t\
+ext) {\x0a        a\
+boutWindow.about\
+Text = text\x0a    \
+    aboutWindow.\
+visible = true\x0a \
+       contentRo\
+ot.forceActiveFo\
+cus()\x0a    }\x0a    \
+function closeWi\
+thClear() {\x0a    \
+    aboutWindow.\
+visible = false\x0a\
+        aboutWin\
+dow.aboutText = \
+\x22\x22\x0a    }\x0a}\x0a\
+\x00\x00\x12\xbf\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.C\
+ontrols.Material\
+ 2.15\x0a\x0aRectangle\
+ {\x0a    property \
+string tabName: \
+\x22\x22\x0a    property \
+var app: {}\x0a    \
+property var roo\
+tWindow\x0a    prop\
+erty int theme: \
+Material.theme\x0a \
+   // set by the\
+ background prob\
+er when the exec\
+utable or icon f\
+ile is missing\x0a \
+   readonly prop\
+erty string unav\
+ailableReason: a\
+ppLauncher.unava\
+ilableApps[app.n\
+ame] || \x22\x22\x0a    r\
+eadonly property\
+ bool iconBroken\
+: !!appLauncher.\
+brokenIcons[app.\
+name]\x0a    width:\
+ 90\x0a    height: \
+90\x0a    color: th\
+eme === Material\
+.Dark ? \x22#333\x22 :\
+ \x22#fff\x22\x0a    bord\
+er.color: theme \
+=== Material.Dar\
+k ? \x22#bbb\x22 : \x22#8\
+88\x22\x0a    radius: \
+8\x0a\x0a    // Main c\
+ontent layer\x0a   \
+ Item {\x0a        \
+anchors.fill: pa\
+rent\x0a        opa\
+city: unavailabl\
+eReason ? 0.4 : \
+1.0\x0a\x0a        // \
+decoded and scal\
+ed off the GUI t\
+hread, a placeho\
+lder is shown if\
+ the icon is slo\
+w or missing\x0a   \
+     Image {\x0a   \
+         source:\
+ \x22image://appico\
+n/\x22 + encodeURIC\
+omponent(app.nam\
+e) + \x22?rev=\x22 + (\
+appLauncher.icon\
+Revisions[app.na\
+me] || 0) + \x22&mi\
+ssing=\x22 + (iconB\
+roken ? 1 : 0)\x0a \
+           sourc\
+eSize: Qt.size(4\
+8, 48)\x0a         \
+   anchors.cente\
+rIn: parent\x0a    \
+        width: 4\
+8\x0a            he\
+ight: 48\x0a       \
+ }\x0a\x0a        Text\
+ {\x0a            t\
+ext: app.name\x0a  \
+          anchor\
+s.horizontalCent\
+er: parent.horiz\
+ontalCenter\x0a    \
+        anchors.\
+bottom: parent.b\
+ottom\x0a          \
+  anchors.bottom\
+Margin: 8\x0a      \
+      font.pixel\
+Size: 14\x0a       \
+     elide: Text\
+.ElideRight\x0a    \
+        color: t\
+heme === Materia\
+l.Dark ? \x22#fff\x22 \
+: \x22#222\x22\x0a       \
+ }\x0a    }\x0a\x0a    //\
+ Loader for Abou\
+tDialog (singlet\
+on per delegate)\
+\x0a    Loader {\x0a  \
+      id: aboutD\
+ialogLoader\x0a    \
+    source: \x22qrc\
+:/qml/AboutDialo\
+g.qml\x22\x0a        a\
+ctive: false\x0a   \
+     onLoaded: {\
+\x0a            if \
+(aboutDialogLoad\
+er.item) {\x0a     \
+           about\
+DialogLoader.ite\
+m.theme = theme\x0a\
+            }\x0a  \
+      }\x0a    }\x0a\x0a \
+   // Question m\
+ark button in th\
+e top-right corn\
+er, always on to\
+p\x0a    Button {\x0a \
+       id: helpB\
+utton\x0a        te\
+xt: \x22?\x22\x0a        \
+anchors.top: par\
+ent.top\x0a        \
+anchors.right: p\
+arent.right\x0a    \
+    anchors.topM\
+argin: 2\x0a       \
+ anchors.rightMa\
+rgin: 2\x0a        \
+width: 20\x0a      \
+  height: 24\x0a   \
+     font.pixelS\
+ize: 12\x0a        \
+z: 10\x0a        co\
+ntentItem: Item \
+{\x0a              \
+  anchors.fill: \
+parent\x0a         \
+       Text {\x0a  \
+                \
+  text: helpButt\
+on.text\x0a        \
+            colo\
+r: theme === Mat\
+erial.Dark ? \x22#f\
+ff\x22 : \x22#222\x22\x0a   \
+                \
+ font.pixelSize:\
+ 10\x0a            \
+        anchors.\
+centerIn: parent\
+\x0a               \
+     horizontalA\
+lignment: Text.A\
+lignHCenter\x0a    \
+                \
+verticalAlignmen\
+t: Text.AlignVCe\
+nter\x0a           \
+     }\x0a         \
+   }\x0a        bac\
+kground: Rectang\
+le {\x0a           \
+ color: theme ==\
+= Material.Dark \
+? \x22#444\x22 : \x22#eee\
+\x22\x0a            bo\
+rder.color: them\
+e === Material.D\
+ark ? \x22#bbb\x22 : \x22\
+#aaa\x22\x0a          \
+  radius: 10\x0a   \
+     }\x0a        M\
+aterial.foregrou\
+nd: theme === Ma\
+terial.Dark ? \x22#\
+fff\x22 : \x22#222\x22\x0a  \
+      ToolTip.vi\
+sible: hovered\x0a \
+       ToolTip.t\
+ext: \x22About this\
+ app\x22\x0a        on\
+Clicked: {\x0a     \
+       var theme\
+Str = theme === \
+Material.Dark ? \
+\x22dark\x22 : \x22light\x22\
+\x0a            var\
+ aboutText = app\
+Launcher.get_abo\
+ut_text(app.name\
+, themeStr)\x0a    \
+        aboutDia\
+logLoader.active\
+ = true\x0a        \
+    if (aboutDia\
+logLoader.item) \
+{\x0a              \
+  aboutDialogLoa\
+der.item.theme =\
+ theme\x0a         \
+       aboutDial\
+ogLoader.item.op\
+enWithText(about\
+Text)\x0a          \
+  }\x0a        }\x0a  \
+  }\x0a\x0a\x0a    MouseA\
+rea {\x0a        id\
+: mouseArea\x0a    \
+    anchors.fill\
+: parent\x0a       \
+ acceptedButtons\
+: Qt.LeftButton \
+| Qt.RightButton\
+\x0a        hoverEn\
+abled: true\x0a\x0a   \
+     // resting \
+on an icon reads\
+ the app's files\
+ ahead, if prefe\
+tching is enable\
+d\x0a        onCont\
+ainsMouseChanged\
+: {\x0a            \
+if (containsMous\
+e)\x0a             \
+   appLauncher.p\
+refetch_app(app.\
+name);\x0a         \
+   else\x0a        \
+        appLaunc\
+her.cancel_prefe\
+tch(app.name);\x0a \
+       }\x0a       \
+ onClicked: func\
+tion (mouse) {\x0a \
+           if (m\
+ouse.button === \
+Qt.LeftButton) {\
+\x0a               \
+ appLauncher.lau\
+nch_by_name(app.\
+name);\x0a         \
+   }\x0a        }\x0a \
+       onPressed\
+: function (mous\
+e) {\x0a           \
+ if (mouse.butto\
+n === Qt.RightBu\
+tton) {\x0a        \
+        contextM\
+enu.popup();\x0a   \
+         }\x0a     \
+   }\x0a        Too\
+lTip.visible: co\
+ntainsMouse && (\
+!!app.desc || !!\
+unavailableReaso\
+n)\x0a        ToolT\
+ip.text: unavail\
+ableReason ? \x22No\
+t available: \x22 +\
+ unavailableReas\
+on : (app.desc |\
+| \x22\x22)\x0a        To\
+olTip.delay: 300\
+\x0a    }\x0a\x0a    Menu\
+ {\x0a        id: c\
+ontextMenu\x0a     \
+   MenuItem {\x0a  \
+          text: \
+\x22Add to Favourit\
+es\x22\x0a            \
+visible: tabName\
+ !== \x22Favourites\
+\x22\x0a            on\
+Triggered: appLa\
+uncher.add_to_fa\
+vourites(app.nam\
+e)\x0a        }\x0a   \
+     MenuItem {\x0a\
+            text\
+: \x22Remove from F\
+avourites\x22\x0a     \
+       visible: \
+tabName === \x22Fav\
+ourites\x22\x0a       \
+     onTriggered\
+: appLauncher.re\
+move_from_favour\
+ites(app.name)\x0a \
+       }\x0a       \
+ MenuItem {\x0a    \
+        text: \x22C\
+reate Desktop Sh\
+ortcut\x22\x0a        \
+    onTriggered:\
+ appLauncher.cre\
+ate_desktop_entr\
+y(app.name)\x0a    \
+    }\x0a    }\x0a}\x0a\
+\x00\x00\x04\xff\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.L\
+ayouts 1.15\x0aimpo\
+rt QtQuick.Contr\
+ols.Material 2.1\
+5\x0a\x0a/**\x0a * Search\
+Bar.qml\x0a *\x0a * A \
+simple search ba\
+r component with\
+ a text field an\
+d a clear button\
+.\x0a * Emits 'sear\
+ch' signal on te\
+xt change and 'c\
+lear' signal whe\
+n cleared.\x0a * se\
+tQuery fills the\
+ field from outs\
+ide, e.g. a sear\
+ch passed on the\
+ command line.\x0a \
+*/\x0a\x0aRowLayout {\x0a\
+    signal searc\
+h(string query)\x0a\
+    signal clear\
+\x0a\x0a    property i\
+nt theme: Materi\
+al.theme\x0a\x0a    fu\
+nction setQuery(\
+query) {\x0a       \
+ searchField.tex\
+t = query;\x0a     \
+   searchField.f\
+orceActiveFocus(\
+);\x0a    }\x0a\x0a    Te\
+xtField {\x0a      \
+  id: searchFiel\
+d\x0a        Layout\
+.fillWidth: true\
+\x0a        placeho\
+lderText: \x22Searc\
+h apps...\x22\x0a     \
+   onTextChanged\
+: search(text)\x0a \
+       color: Ma\
+terial.theme ===\
+ Material.Dark ?\
+ \x22#fff\x22 : \x22#222\x22\
+\x0a        placeho\
+lderTextColor: M\
+aterial.theme ==\
+= Material.Dark \
+? \x22#bbb\x22 : \x22#888\
+\x22\x0a        backgr\
+ound: Rectangle \
+{\x0a            co\
+lor: Material.th\
+eme === Material\
+.Dark ? \x22#232323\
+\x22 : \x22#fff\x22\x0a     \
+       radius: 4\
+\x0a            bor\
+der.color: Mater\
+ial.theme === Ma\
+terial.Dark ? \x22#\
+555\x22 : \x22#ccc\x22\x0a  \
+      }\x0a    }\x0a\x0a \
+   Button {\x0a    \
+    text: \x22Clear\
+\x22\x0a        visibl\
+e: searchField.t\
+ext.length > 0\x0a \
+       onClicked\
+: {\x0a            \
+searchField.text\
+ = \x22\x22;\x0a         \
+   clear();\x0a    \
+    }\x0a    }\x0a}\x0a\
+\x00\x00\x09\x00\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.L\
+ayouts 1.15\x0a\x0a/**\
+\x0a * LogView.qml\x0a\
+ *\x0a * Virtualize\
+d view of the de\
+bug output model\
+ (appLauncher.de\
+bugLog).\x0a * Only\
+ the visible lin\
+es have delegate\
+s, and the view \
+follows new outp\
+ut\x0a * while it i\
+s scrolled to th\
+e bottom. Each l\
+ine shows when i\
+t was read and\x0a \
+* stderr lines a\
+re highlighted. \
+Dropped and trun\
+cated line count\
+s are shown\x0a * u\
+nderneath when t\
+here are any.\x0a *\
+/\x0a\x0aColumnLayout \
+{\x0a    id: logVie\
+w\x0a    property v\
+ar model: appLau\
+ncher.debugLog\x0a \
+   property colo\
+r textColor: \x22#f\
+ff\x22\x0a    property\
+ string fontFami\
+ly: \x22monospace\x22\x0a\
+    property int\
+ fontPixelSize: \
+13\x0a    property \
+color stderrColo\
+r: \x22#ef9a9a\x22\x0a   \
+ spacing: 4\x0a\x0a   \
+ ListView {\x0a    \
+    id: lineList\
+\x0a        Layout.\
+fillWidth: true\x0a\
+        Layout.f\
+illHeight: true\x0a\
+        clip: tr\
+ue\x0a        model\
+: logView.model\x0a\
+        boundsBe\
+havior: Flickabl\
+e.StopAtBounds\x0a \
+       ScrollBar\
+.vertical: Scrol\
+lBar {}\x0a\x0a       \
+ // keep followi\
+ng the output un\
+less the user ha\
+s scrolled up\x0a  \
+      property b\
+ool followTail: \
+true\x0a        onM\
+ovementEnded: fo\
+llowTail = atYEn\
+d\x0a        onCoun\
+tChanged: {\x0a    \
+        if (foll\
+owTail) {\x0a      \
+          Qt.cal\
+lLater(lineList.\
+positionViewAtEn\
+d);\x0a            \
+}\x0a        }\x0a\x0a   \
+     delegate: R\
+owLayout {\x0a     \
+       width: Li\
+stView.view ? Li\
+stView.view.widt\
+h : 0\x0a          \
+  spacing: 8\x0a\x0a  \
+          Text {\
+\x0a               \
+ text: model.tim\
+e\x0a              \
+  color: \x22#888\x22\x0a\
+                \
+font.family: log\
+View.fontFamily\x0a\
+                \
+font.pixelSize: \
+logView.fontPixe\
+lSize - 2\x0a      \
+          Layout\
+.alignment: Qt.A\
+lignTop\x0a        \
+    }\x0a          \
+  TextEdit {\x0a   \
+             tex\
+t: model.line\x0a  \
+              re\
+adOnly: true\x0a   \
+             sel\
+ectByMouse: true\
+\x0a               \
+ wrapMode: TextE\
+dit.Wrap\x0a       \
+         color: \
+model.stream ===\
+ \x22stderr\x22 ? logV\
+iew.stderrColor \
+: logView.textCo\
+lor\x0a            \
+    font.family:\
+ logView.fontFam\
+ily\x0a            \
+    font.pixelSi\
+ze: logView.font\
+PixelSize\x0a      \
+          Layout\
+.fillWidth: true\
+\x0a            }\x0a \
+       }\x0a    }\x0a\x0a\
+    Label {\x0a    \
+    Layout.fillW\
+idth: true\x0a     \
+   visible: logV\
+iew.model.droppe\
+dLines > 0 || lo\
+gView.model.trun\
+catedLines > 0\x0a \
+       text: \x22Dr\
+opped lines: \x22 +\
+ logView.model.d\
+roppedLines + \x22 \
+ Truncated lines\
+: \x22 + logView.mo\
+del.truncatedLin\
+es\x0a        color\
+: \x22#fbc02d\x22\x0a    \
+    font.pixelSi\
+ze: 12\x0a    }\x0a}\x0a\
+\x00\x00\x03*\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.C\
+ontrols.Material\
+ 2.15\x0a\x0aDialog {\x0a\
+    id: debugDia\
+log\x0a    title: \x22\
+Debug Output\x22\x0a  \
+  modal: false\x0a \
+   standardButto\
+ns: Dialog.Close\
+\x0a    visible: fa\
+lse\x0a    width: M\
+ath.min(700, par\
+ent ? parent.wid\
+th * 0.8 : 700)\x0a\
+    height: Math\
+.min(400, parent\
+ ? parent.height\
+ * 0.6 : 400)\x0a\x0a \
+   // Center the\
+ dialog when it \
+becomes visible\x0a\
+    onVisibleCha\
+nged: {\x0a        \
+var win = parent\
+ || Qt.applicati\
+on.activeWindow;\
+\x0a        if (vis\
+ible && win) {\x0a \
+           x = w\
+in.x + (win.widt\
+h - width) / 2;\x0a\
+            y = \
+win.y + (win.hei\
+ght - height) / \
+2;\x0a        }\x0a   \
+ }\x0a\x0a    contentI\
+tem: LogView {\x0a \
+       textColor\
+: Material.foreg\
+round\x0a        fo\
+ntFamily: \x22monos\
+pace\x22\x0a        fo\
+ntPixelSize: 14\x0a\
+    }\x0a\x0a    onAcc\
+epted: visible =\
+ false\x0a    onRej\
+ected: visible =\
+ false\x0a}\x0a\
+\x00\x00\x02\x98\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Window 2.15\x0aim\
+port QtWebEngine\
+ 1.15\x0a\x0a/**\x0a * He\
+lpWindow.qml\x0a *\x0a\
+ * Shows the doc\
+umentation page \
+in a web view. K\
+ept in its own f\
+ile so\x0a * QtWebE\
+ngine is only lo\
+aded the first t\
+ime Help \xe2\x86\x92 Doc\
+umentation is us\
+ed.\x0a */\x0a\x0aWindow \
+{\x0a    id: helpWi\
+ndow\x0a    width: \
+800\x0a    height: \
+600\x0a    visible:\
+ false\x0a    flags\
+: Qt.Dialog | Qt\
+.WindowTitleHint\
+ | Qt.WindowClos\
+eButtonHint\x0a    \
+title: \x22Using Ap\
+psHere!\x22\x0a\x0a    We\
+bEngineView {\x0a  \
+      anchors.fi\
+ll: parent\x0a     \
+   url: Qt.resol\
+vedUrl(\x22qrc:/hel\
+p/help.html\x22)\x0a  \
+  }\x0a\x0a    functio\
+n open() {\x0a     \
+   helpWindow.vi\
+sible = true;\x0a  \
+  }\x0a    function\
+ close() {\x0a     \
+   helpWindow.vi\
+sible = false;\x0a \
+   }\x0a}\x0a\
+\x00\x00\x04\x93\
+(\
+\xb5/\xfd`\xbb\x0fM$\x00\xd6\xb1\x952`o:\
+0\x0c\xc30\x0c\x03\xc3\xc1\x02\x8bK\xb32)\x8d-\
+\xd3\xaa\x0d\xb9\xbb\xa5\xddS\xe4\x91Ya\xb4\x9fj \
+\x81)t\x1d\xff\xd8\xa6;\xfa\xd82\xc8\x19\xa5\x04\x83\
+\x00\x89\x00\x87\x00\x16\xf7\xc6\xd9{}\xe9/\xc4\xbf\xec\
+\x95\xb2\xaf\x8e0\xc9\x18\xc7(Z\xfd>\x1d\xdfo\xf5\
+\xa0\xa6m4\x14u{g-\xba\xa6\xbe\x0f\xab\xcf\x1b\
+J\xf1\xb5\xb2\xc3]\x11\xee\xb3\xac^\xcd\xf8\x9f\x826\
+\x8ar\x92\xa2\x1a\xe4\x09]\xc5\xfe\x8d\xd4\x17\xa4\x99f\
+\xca\xd8\xabd\xeb\x91D\xc7\xd0\x0a\xccF\xdcl\xf6\xf4\
+[\x8f\x0ahE@`\xaa\x14\xa8\xfc\x19\xb7\xed\xc0}\
+\xce\xbf\x1e'a\xf4\xef\xc8q\x15\x84\x02g\xa0\xa2\xea\
+\xcd\x8c\xcf\xd0\xf7\xa8e/R\x19\xf2\xaf\xaf\xc6RW\
+\xe5\x1b`9;N\x13\xc62MT\xe5#\x96\x8b\xfb\
+\x8clV\x11B\x07\xb6\xa4q\xd5\x9by\x0c9c|\
+sG-\x8b\x1c\x1dp\xcbe\x83\xafd;\xf2\xea\xd7\
+=5\x14\x00T\xa3\x0cAO>\x0f\xcba.\x1a\x9a\
+\xda\xcf\x0b\x1dE\xec\x9a \x86\x10\xf9B<v\xbdN\
+\x09s\xf9\x90g\xe9\x9c\xb1\xaa\xe7v4m\x95\xb2\xd8\
+\xf9\xba\x9est\x94\xdb\xc6\x938\xe3\xa7\xb0pfQ\
+\x8a\xe1\xbf\xff\x18\x9d\x84\xb2\x9e\xaaj\xc5\xc4S\xa9L\
+\x01\xd9\x83\x0c\xda\x8eA\x81RW\xbfj5\x99\xc9\x1c\
+(\xd5\xd9\x84\x14c[F)5\xd0I1J\xa0\xd8\
+[o\xe4\x94\x22u\xd4W\xe7o\xe6\x88.\x1c\xf5?\
+\x1f,_\xaby\xfa+\x05\xd7\x8a\x99\x02\xb0s\x00\xc4\
+\xc5}\x83j\xb4}>;\x06s\xb9\xfa\xf9o\xb0c\
+\x18e\xc7\xca\xa3{\x04G5\x1a\x8d\xca\xf9\xfb\xd2\x81\
+|\x00T:\xb0\xb1\xa8\xea\x19\xc2\x94L.J\xc9\xaf\
+X\x04t\xb1\x95,dnm\xc6F\xd6F\xa8\x1b\xec\
+\xc8\xfd\xae\x8e\x00\xf1'\x06\x95\x92\x06\x06\xc2mR\x04\
+\xf4\x0e\x8b\x7fI\xdeW\x1bQ\xbfNG\xacz\x1a\x9b\
+y\x94\x08`\xd8i\x81a\xdap8\x16S\x16+\x07\
+\x9a\xd8\xbfk\x9a(\xa9\xfdc\x16M\x88\x1d\xd3]\x08\
+\xf8X\x1e?lE\x8f\xb6>\x12MW\xad\xc3~\xc6\
+\x8c\xdb\x1d2\x11\xdd\xb8Z\x8fv\xac\xd0\x0d\xa4\xcd\xff\
+\xcf?\x96\x8c\xcb\xb8\x02\xed\xf8\xa4\xb3G)c\xdd\x84\
+\xe3P\xea\x9b\xb3\xbe\x1e\xdc\xc0-y\x1e\xb1\x04.y\
+\x1b\x90IO\xb3`\x04YH\xb3_G=\x86\x14*\
+C-\x80\xf1\xa8\xa1)B\x86D\xa4d$I!\xc3\
+\x01 \x84\x10\x04\x15\x15=\x12qPF2,H\x11\
+\xe4\x04\xc4\x18b\x8cL \x22#\x81\x84\x12\x90D\xa9\
+\x1c\x16\xd08-M0\x8dW$\x18\xf6\x0a\xbe\x1e/\
+T\x11\x00\xfb\x17\x98\xa9\xb0\x83t\x0f\xe9V\xe0\xf9\x80\
+\xef{\xed\x86\x95\x0c\xc0\x8b\x22\xa3J\x1bz\xd9a\x18\
+L\xe3\xb51B6\xab\x08`Il\xf1\x04p{=\
+\x84b=\x1b#\xbbD\x95h\xc7x7+U\xf7\xa7\
+!\xab]F\x0a+crG}\x19\xca[\xc6\xde8\
+C\xb0C\xc7QDu\x07\x04\xf9\x10)\xb3\xe1\xb3\xaa\
+\x82b\xf4\xb2t*\xd9\x1a\xb9\xc1X\xb0\x12P\xf9\xd5\
+\x1c\xe7bp\x16\xd3O\x07\x9a\x0c\x8b C\x03^\xfc\
+\x11\x82`\xd3 \xc9\xce2\x15\x5c.\x88c\x8d\xf1\x06\
+\xb3\xdao\xeb2\xb4XL\xbdc\x10\xae\xda\x05*\xa8\
+B\xeb\x9c\xd9\xdf8\xf1\xf7\xf4\xf5\xec\xfa[\xad\x82a\
+e\x0b_\x11\xe6&\xe15\xbb8\xe9\xf7)\xd7V<\
+\xa0AE\xa1\x9d\x83\xa2cI\x16\xc4\x0c\xef\x06\x9d\xd0\
+\xcbu\x8bK.$\xfc\x10\x03\xb9X.\x0e\x061\x10\
+\x1b!fW\xceQo\xfa{X\xf5\xff\xfbm\xc4$\
+\xef\xc9j\xf3\xfc\xd9A%\xc1\x1cM\x93UG\x86\x06\
+\x12\xc8-I\xf0@\x06\xec\xb8\xb9\x17\xd4\x8d#\xb4c\
+j;x[\x92\xb5\xe2\x1aCrX\xcb\xc8+6\x9e\
+I\x9ci\xe2\x14\xa0\xda\x88\x14\x9b\x97\xf7\xd4\xe7\xdb\xde\
+\x0e]\xc1\xc3\xf3\x15\xed\x11\xec\x87s\x87a\x1f3\x90\
+ \xd6r\xde\x0c*\x0f\xafp\x9e\xc1\x9e'\xa4\xa0\xc1\
+\xaa\x22\x8e\xb9(\xabo*Q\xfc\x16\xd0m\x82\xcf\x99\
+\xdan\xc4\xaaiv.L+l\x0fh0\xe0T\x5c\
+\x8e|\x9fI\x86\xa5@\xb5q\x99+\x82\x97\x12\x8d\x9e\
+\xdb8\xc4>\x80P\xde\xe84\x83\x8dlP\x18\xcb]\
+v\xd5~\xe3,\x94hin\xbb\xbd'\x86\xa7\x04\xe8\
+x\xaf\x05\xfc#\xad[i\xca\xa4N\x9b\x14\xdb\x90x\
+vu\xbe\x18\x938P\xd1\x98\xfaSK>\x8ey\xd1\
+\x7f\x86$<\xa5\x86\xb7\xc8X\xfe\xf2s\xf4\xff\x0d\xe4\
+\x8c\x92u\x84\x98o\x8e\xaf\x96\xb2\x8f4\xd6Tm@\
+\xab\xf1\xc9`\xc6\x99\x18\xc3\xbf\xd4\xa6%\x0b\x08\xee.\
+\xa0\xa8\
+\x00\x00\x07\x0e\
+(\
+\xb5/\xfd`\x87\x1a%8\x00\xeaB|\x0b#\xf0\xd8\
+\xe6$\x9b\xb7\x96\xa2Mvo(\xd4$\xedvx\x8c\
+\xea\xffB1\x95\x1e\x88\x89\x99\xb7\x95\x9c\x81W&+\
+/\xab\x00\xb0\x00\xad\x00Je2\x0d\x08Q\xdf\x96\xa3\
+W?B\xea\xa2\xf5\xdd<s#\xd4\x16\x11\xf1\xb2\x12\
+q\xb9\x1cT\xfc\xcf\xd1'vF\xe8\xd7\xe7;f\xeb\
+\x86\xf1/\xeb/\xc6\xe9\x8a\xb4a^\x8e\xbd\x0co\xdb\
+\x13z'\x9d\xe5\xdb\xb0\xbdD\x83i7\xf9\xb0i\x14\
+\xe5\xa3A\xe7\xd7\xa5\x84\x14\xebTG\xd7\xb6\x1bn\x8f\
+\xa7\x95b\xefJ\x87\x8f\xf7\x93\xad\xb3\xacD\x00m\xc5\
+p\xcb\x8a@\xa5\x1e\x9b%\xfc\xb7la\xa7\xff)n\
+\xe0\xc5U(\xcf\xdb\xac\xb0\x00/\x05\x05\x07\x17\x0e\xb7\
+\xb7%\x08\xe8\x7fq'5\x5cn\xeb\xe7\xc6\xe3\x8e\xfb\
+\x1fO<\x97\x05\x84'\x015l\xaf\x8f\xff\xc0o\xb6\
+\xaa\x0d\x0c=9J\xbd\x87\xb4\x89].\x05\xc5\x06t\
+=\xad>^\xfd\xe9\x94\xf0N\xb7|n\xf6Y\x84\xfa\
+f;\x10\x0c\xb8\xac\x9a9\x9c\xe0ik\x8b\x81,,\
+\xd8Te\xab}\xbb\xb1\x03(\xed\xbb^(\xda&\x1c\
+\xa6B\xfeU\xcc\x90\x1f\x95\xbd|\x7f\x8b\xbeM5\x9e\
+\xbcy\x8b\xcf/[\x1c\x1e\x82\x81f\xf2\x18_\xa7N\
+\xd7\xf7\x98\xfa\x8e\x07V\xdc\x12\xbaN/)\xf6\xf4}\
+5\xf0\xe0\xa0\xd2\xf7N\x08j \x04b4\x9d\x14\x18\
+|xx@HC\xe4\x9fv_\xac\xdf\xdd\xa5D\xe2\
+\x98\xa3\xa7z\x8b\x9do\xb5\xb8-\xcc\xd3:)\xf4\xc5\
+\xe9\xad\xd5yT\xbf\x92\x09T\x08`~\x9f\x01\xa1\xa7\
+\xa6\x0d\xce%\xdb*_\xe7I\xd1\xf62\x9a>SG\
+9\xf2kX\xcb\x03}\x8a\xfe\xe3\xffk\xc3\xf5S-\
+\x05y\xe7\x22\xd0\xc0\xf5\xb7/\xde\xa4\x05\x1a<\xd3\xa3\
+\x03\x18\xa5\x08\xe4\xb4q\xc5\xd1%q\x0e;\x8d\xb0\x11\
+\x83\x81&\xd8\xebx\x9a@\xfe\xeer\x05\xd1\xcff]\
+-\xb5\xa9\xc7VM3\x07\x13\x1f\xe3\xbb\x1a]=\xc4\
+\xe2\xcf\x18\xc9d\x10\x10Ry\x19\xad\xff\x94a\xaa\xe4\
+x\xa6'\x11wLo?\xd9I\x03\x14\x18%\x95~\
+F\xe2?f\x97\x0cB\xd3[\x96\x96k\xa7\x85\x90s\
++=\xde\x9c\xaf\xba\x5c\x8b^\xed0\xcd\xc4\x9b~\xe7\
+;\xba+\xe3\xb6\xb4Y\xd2\x08;\x116\xedT\x17\x97\
+\x16\x05U\xd9\x10\xa7)k\xb1\x94\xf0v\xea\xdcxI\
+\xdd\xc4\xb7n$I\x820N\xa3K\xa6!!\xa3\x10\
+b\x12\x12\x12\x020\x08\xf1\x085;f\xea\xa6\x97\xcf\
+.\x17\x0c\xe6\xb7Z\x94\xa6~=\xf9I\xe1.\xde\xf0\
+)\xc5Aoo#m4h\xef\xe2\x9e4,\xa3\xb7\
+\xd8\x94rmI;\x9f\xaf\x0f\xcdS\xe5\xbcFh\xa5\
+\xbf:\xfaR\x0a.[\x9fN\x11\x16\xd8\xb6/$H\
+Y_\xec\xd9\xb9qxu\x8f\x9f\x7f\xfa\xd8\xaax\x82\
+@\xdd\xaf\xc8\xc0\xab\xa4mMd<\x864\x9b\xee\x84\
+oK\xd6\xf8\xf7^\x09\xdd\xc0\xba\xf0\x13\xdf\xed\x15\xa1\
+/\xba\xc7\x14K\xedf\xd6\x92\x1dv\x02\x81\xcc\xa8\xd1\
+-2$#\x22\x22I\x92\xa49!\x08\x82P<\x09\
+\xa5;\x0f\x92`\x5c\x94\x02!\x10B\x08\x1b\x82\x04\xc4\
+(\x12\xd0H %\x0a\x92\x82\x14$\xc3\x18\x8f\xd4+\
+F\x12\x849\x14!Tm6\x0f`\xe7\x0d:\x18\xa2\
+\xb6x\x1c\xaa*\x89\xd6\x8a\x91\xc2z\xa3\xf0\x101\xb1\
+\xa9\xa2-\x01\xba\xdc$_\xa9\xc9\x87\x95\x82\x08\x09E\
+.t\x08\x91k\xf9\x1e\x01\x14\xe5\xb5+\xf5\xb6?\x95\
+A\xf6f\x19\xce0x[\xb5C\xaf\xf5<y\x8d;\
+\x9b\x84\x16\x0e\xa5\x80\x0e\x7f\xdb\x0f;\x89\x93\xf0X\xd5\
++Qu\xdb\xe9(t\xb9ZI\x85@\xb2\xfb\x028\
+\xd7\xd4\x07\xb0Yt\xe0\x8fP$\xdb\xd6(O\xccN\
+G\x0ba\x04\xb5wOUp\x8e\x15\x81\xf4\x05t\xa4\
+6\xa6h\xcb\xf1\xdd\xfd\x12\xea\x15I@K\xa5v+\
+mf\xc1\x10a\x84\x9eYi\x02Ha^X\xf2\xcf\
+B\xcc02\x95\x1f\x04\xc8\x18\xb4\xb3c\x1d\xbfJ\x9b\
+\x92\x1dk\xd9AB\x96O/z\x82\x1aR\xbe\x008\
+zI?zy\xdb\x94HCr\x9e\x8dg\x22A\xa1\
+\x16\x10\xccc\xd2uIR#2\x89\xc1D1\x03r\
+\xf7T\xcf\x96\xcaY\xaa\xa25O\xd5\x8b\xea)a{\
+sO\xb7b\xd2\x87\xb8\xf5\xa0\xdaj\x1e\xa6\x0c\xb4\xe0\
+\xa3&B\x07\xe8\xf1c\x07x}\xa1H\xc8\x1f\x83(\
+9\xadX\xafTA\x0d\x01A=\x09\xb5\xa3\xc5\xd0\x22\
+\x19\xde!)\xc1\xc5y\x0aBw'\x9e\xe4\xcb\xa7\xd8\
+\x06V,\x1d\x1a\x93\x852\x12\xa20\x1f[\x00wV\
+\x82\x8d\xa4\xb9(\xa3(\x8cVN\x8f\xba\x12\xf9f&\
+b\x00)X\x0dym\x88g2\xf3\xce|a\xdby\
+\xd2K\x1b\xab\x8a\x9f\x94\xd9Q\x80\x9a\x1f\xb4\xc9\x923\
+\xf8\xf4\xa5\xb6\xc6\xdbc\xddmlI}\x0c\x97]\xb0\
+\x19\xa8nm\x09.wE+\x83\xc6*.\x8b\xaf\x8a\
+f\xb9\x87u\xb5G!\x13i`I\x06\xa2\xf7>b\
+\xb8%*\x16\x0a\xb5\xf5\x1b\xc2S\x1cg\x7fF\x99\x9b\
+8\x19\xa6\xfd\xe2%\xe2>\xe5\x902\x8fP\xcf\x12\xdf\
+\x1e\x16(\xad\x06s\xa25\xb5\xc4\xe80\xc9\xcb\xfc\xc8\
+^\xb6\xe6Uk\x08\x90\xa8M\x1e;V\x8e\xcdh\x0c\
+\x0fe\xb6\xb9;\x83\xcdV\x5cI\x18\xaa\x05>\xda\xf9\
+\xbb1\xfa,\xeb\xd3\x22RcRh\x88\x98-\xba\xc4\
+\xb0\x1a\xec\xd9\xc5\xe3\xe5\xbe,\xdbv\xce\xdc\xaf\xd4\xa6\
+\xc2b\xa8\x05\x84\xe7\xf1Md\x10Bx\x97;$\x1e\
+\xca\x0c\x1a\x18\x00\x8d\x12\xda\xfd\xa4\xc9\xec\xe60\xb6\x0e\
+\xa3\xfb\xc3T\x87\x22\xf9(\xebAQ\xf6\x09\x8a\x0e,\
+\x22\xc8U\x14\x90\xc3\x90\xdc\xae\xfb\x15\xaf*\x03p|\
+y\x128\x8e\x5ciO~G\xe2]\xcf\x15\xbc\xbf\x1d\
+i\x14\xf6\xc0\xfb\x0e\x160\xbc+:\xd4\x94\xd8:\x1e\
+\x91\xf8>]\xa9\x0d<6\x0c\xc8<\x1e\xb7\x12M\x0a\
+\x80\xc2\xe6\xe4\x0bX\xc3\xc2\xcd\xa2\xccH\xccy8\xe8\
+\xfdk~\x9b\x1d\xeatco\xed\x85|Q\x04*5\
+\x7f\xdf~\xea\xb9\x97\xe4\x93\xf3\xa6\x11\xbdN\xc3\xe9\x0a\
+U\xea\x8a\xb8c\x12\x94\x84G\x9d\xc6\xa7\xf9-\xe0\x04\
+\xac\x06\xa0\x8a\xaba\xb1'\x19\x90~\xef\x06\x22d\xac\
+\xd3\xf1\x8eX \xf49\x1a\x88M\x08Q@\x96\xb0\xc4\
+\xd6\xa50x\xfeZ?E\x95>h\xa0\xb0M\xeb\xdd\
+\x12v\x80$\x01\x82\x7fa\xd2\xe3\xe0\xf93\xd4\x85D\
+IHH}}\xa08'\xb3\x98\xa29\x8b\xf9P\xc8\
+\x02\x0a\x0d\xfft\xdb\x8d},\x8c\xf7\xfaM7\x18\x02\
+$\x9c\x89\x1aj\x8f'J9`\x9dQ{\x9c\x1e\x13\
+\xb7r\xb2sY2e\xc5\xf0\xa5Il\x85%)\xae\
+\xd1\xf9\xf5\xf5}S\x18\xfe\xf6\x0b\xabn\x86\xb4\x5c\xf0\
+\x1d\xc7I\xd2T\xd6\xcdsn)f4\xdf\xbe\x84\xdc\
+\x9dt\xf3\xd6\xd5Q\x1c\xf6\xcfM\xeb\xc3\x15\x1f\xfcd\
+\x8b=mXu%\xdf\xb544\x9d\xad!\x94m\x99\
+\xbd\xd30^\x97\x91\xa6a\xc9c\xb5\xd0\xb8\xad#\x9d\
+\xe6l/\x9f\xa9\xd0\xcf\xbfe%o\xec\x95s\x8e\x03\
+?,\x8er%\xdaq\xce\x91\x9c|\x1d\xb2\xdb\x01\x0f\
+\xfd\x91\xd0\xd5=c\x0c\xad\xb4\xbf\xb2\xd2\xc8\x14\xd0\x10\
+\x5cn9:\xc8\xd3\x1d\xfc-\x9f~\xa1\x05\x14b$\
+]\xbd\xf2\x9dQ\x8aE\xc0,r5\x81\x0a\
+\x00\x00\x08@\
+i\
+mport QtQuick 2.\
+15\x0aimport QtQuic\
+k.Controls 2.15\x0a\
+import QtQuick.C\
+ontrols.Material\
+ 2.15\x0aimport QtQ\
+uick.Layouts 1.1\
+5\x0aimport QtQuick\
+.Controls.Materi\
+al 2.15\x0a\x0aRowLayo\
+ut {\x0a    id: roo\
+t\x0a    property s\
+tring location: \
+\x22/\x22\x0a    property\
+ real used: 0\x0a  \
+  property real \
+quota: 1\x0a    pro\
+perty real limit\
+: 1\x0a    property\
+ string updated:\
+ \x22\x22\x0a    property\
+ int theme: Mate\
+rial.theme\x0a\x0a    \
+spacing: 12\x0a    \
+Layout.fillWidth\
+: true\x0a    heigh\
+t: 32\x0a\x0a    Label\
+ {\x0a        text:\
+ root.location\x0a \
+       font.pixe\
+lSize: 14\x0a      \
+  Layout.alignme\
+nt: Qt.AlignVCen\
+ter\x0a        Layo\
+ut.preferredWidt\
+h: 120\x0a        e\
+lide: Label.Elid\
+eRight\x0a        c\
+olor: theme === \
+Material.Dark ? \
+\x22#fff\x22 : \x22#222\x22\x0a\
+    }\x0a\x0a    Recta\
+ngle {\x0a        i\
+d: barBg\x0a       \
+ ToolTip.visible\
+: barHover.hover\
+ed && root.updat\
+ed !== \x22\x22\x0a      \
+  ToolTip.text: \
+\x22Last updated \x22 \
++ root.updated\x0a \
+       HoverHand\
+ler {\x0a          \
+  id: barHover\x0a \
+       }\x0a       \
+ color: theme ==\
+= Material.Dark \
+? \x22#333\x22 : \x22#e0e\
+0e0\x22\x0a        rad\
+ius: 6\x0a        h\
+eight: 18\x0a      \
+  Layout.fillWid\
+th: true\x0a       \
+ border.color: t\
+heme === Materia\
+l.Dark ? \x22#bbb\x22 \
+: \x22#888\x22\x0a\x0a      \
+  Rectangle {\x0a  \
+          id: us\
+edBar\x0a          \
+  color: used / \
+limit > 0.9 ? \x22#\
+e53935\x22\x0a        \
+          : used\
+ / limit > 0.7 ?\
+ \x22#fbc02d\x22\x0a     \
+             : (\
+theme === Materi\
+al.Dark ? \x22#66bb\
+6a\x22 : \x22#43a047\x22)\
+\x0a            rad\
+ius: 6\x0a         \
+   height: paren\
+t.height\x0a       \
+     width: Math\
+.max(4, parent.w\
+idth * Math.min(\
+used / limit, 1.\
+0))\x0a            \
+anchors.left: pa\
+rent.left\x0a      \
+  }\x0a\x0a        Rec\
+tangle {\x0a       \
+     id: quotaMa\
+rker\x0a           \
+ width: 2\x0a      \
+      height: pa\
+rent.height\x0a    \
+        color: t\
+heme === Materia\
+l.Dark ? \x22#90caf\
+9\x22 : \x22#1976d2\x22\x0a \
+           x: pa\
+rent.width * Mat\
+h.min(quota / li\
+mit, 1.0) - widt\
+h / 2\x0a          \
+  anchors.vertic\
+alCenter: parent\
+.verticalCenter\x0a\
+            visi\
+ble: quota < lim\
+it\x0a        }\x0a   \
+ }\x0a\x0a    Label {\x0a\
+        text: (u\
+sed).toFixed(2) \
++ \x22 GB / \x22 + (li\
+mit).toFixed(2) \
++ \x22 GB\x22\x0a        \
+font.pixelSize: \
+13\x0a        color\
+: theme === Mate\
+rial.Dark ? \x22#ff\
+f\x22 : \x22#222\x22\x0a\x0a   \
+     Layout.alig\
+nment: Qt.AlignV\
+Center\x0a        L\
+ayout.preferredW\
+idth: 130\x0a      \
+  horizontalAlig\
+nment: Text.Alig\
+nRight\x0a    }\x0a}\x0a\
+\x00\x00\x13\x96\
+(\
+\xb5/\xfd`\xeese\x9c\x00\xda\xd3h!,\xd0\x8c\
+h\xd4\x01\x1bK\xfb9:PWY\x83\x1e\x8d\x16-\
+\xe4\x00\x0d\xf1Bq\xa8\x97\xd3Mv\x93\xdd4\x88\x99\
+\x1d\xaa\x0e=\x8cR\xaf\x8c\xea\x05p\x02\xcc\x01\x1d\x02\
+\xd1j<D\xcc\xa3D\xca\xb3\x1e\xea$p\xba{]\
+\x11\x039\x8f\x86c\x006J\xe3Y\x9c\xc6\x82yx\
+8\xa0\xe0\x00=\xbdc5\x054Hv\x91\x81\xc2\x81\
+\xd1@@\xebi{]\x1c\xa79`1\x0a@\xa0\x81\
+\xe4p\x98Hi\x9c\x87\x83I\xc8\xe2P\x90\xb5 \x8f\
+\x83,\xc8\x91\x80\x82\x83\x07\x135\x8e\x13%\x88\x08R\
+\x9e\xc8\x01A\xcb\xd1 \xcdR(\xcdMH\xac\xbd>\
++jT(\x0b\x93)l\xa1\x0b\xc3\x92\xbb/K3\
+\xd9.E\xfe\xd9'W\xd6\xb7\x5c\x97\xd4l\xa1p\x86\
+'lM\xa6(x\x0bF'\x7f\xe6\xbd_4\xe9\x7f\
+*\xd0\x16\x06\x03\x13\xba\xe9\xf2cp\xf2\xfe\xcc\x05\xe3\
+\xde'D|\xc5\xedm2\xb4\xe4\xa7+\x1fm\x93\xa3\
+\xf9\xe7\x1a&\xc6O\x8a\xbcX\xd7\x9f\x89\xfd\xfd\x94\xb5\
+\xa4\xd0\x84\x12\xd1(\x8b\xd5dB3=\xfb\xe5\x8c\x93\
+\xef\x99\xf2f\x9dx;\xe9.4\x08\xb0\xac\x85\xe2x\
+\x01Q8\x86\x89\x88q\x04@\xbb\x85\xe7\x02\x86\xc7i\
+\x9cE\x8a\x16\xc4`8\xfap\x22\xc8\x13\xf2'\xb3(\
+\x0f\x02\x8f\xb2\xba\x1bb\xace\xa1A\x01\xe4\x81\xc2\xfb\
+j\x22&jx\xa0\xb0p\xea\x16\xa0\xc8\xb1\x1a\xabY\
+\x0b\x8b\xa5y \x1e\x0b\xe4p\x1a\x0dg\xb1&0\x8b\
+\xc5b\x01\xe4H\x12J\xe4\x98\x80RB\x5c@c,\
+\xcf\x82\x99\xe1\xc2\xff_F4\x12K\xb4(K\x10\x1e\
+\x80\xb0\x10-\x87Z\x8c\xb5x \x1cH-@k\xa1\
+< \x06\xc8\x11\xb1\x1c\x0c\x8b\x03\xc2y\x1c$,\x14\
+EZ\x8d\xa2\x99\x88\xa0\x09\xff\xfdU\x8a\xccc\x91P\
+\xbc\x98\xa2\x08\xe5\x89\xe0\xe0xD\x80\x96\x83\xd2`\x22\
+(\x91\xb2DO\x84\xf5\xac\x87\x07\x22\x94\x06\x224\xcb\
+i \xc2j8\x0f\x11\x94\xa1\x09\xa8\x11\x81\xc1\x80\xd5\
+0\x0c\xe7!\xb1\x94\xe3\xe04)z\x1a\x8ac\xe1,\
+\x0c\x0f\xa8\x81azK\x87\x86H\xb2\xb8\xd8R\x96\xa1\
+H\x06\xc8)\x86\xf4Vp\xb00\x87\xbb\xab\xa8\xfa\x0f\
+1\xc4\x14\x1cH8\x05D,fB\xf4\xe0\xc0\xac\x07\
+\x85F\xe3\xdc\xdbO\xe1*8x\x88\x16\x04Q\xe00\
+\x01jP\xa0\xe0AJH\x83\x05\x87\xc7Q\x8c\x8a\x88\
+\x88XX`xD\xd1\x03\x03d=\x94\x05$\xc1\x91\
+\x00\xf2\x101\x11\xc8\xb2\x22e=\x06 )\x01\xd0\xa0\
+\xe0\xc1\x00\x0a\x8eC\xc1\xc1r8\x8d\xb28\x94\x08B\
+\x14<\x1d\xf0\x00\x04\x0a\x0e\x1c\x1c\xcc\xe2,\x1c\x0bQ\
+0u\x0a\x0e\x1c\x0e\x03=k\x02\xd24$\x06h\x08\
+\xac\xcc\xde\x86|~l\x8b\xc9\x89g\xfb\x98\xbd\xa7\x8d\
+\x8egMppW1\x13\x16\x84E\xf1@4\x058\
+\x14\x06\x82 \x14\x04r\xfb\x16\xb7\xad\x80\xa6\xea\xb5\x15\
+V\xc4<D\xa0\xbb\xff\xaa\xf9g\xda\x9e\xb2\xc4\xdfl\
+\x96\x8a\xbb\xff\xde\xd4\xeao\xb6RL\xe4S\x95w\xaf\
+\xbb\x9c\xca4U\xf3\x22>\xa7\xa3:4L\xe3>U\
+\xc7\x8f\x8f\xe8\xca\xbc\x0f_\x11\x7fs\xb5s\xd5\xf5\xe7\
+\xf7\x9b\xca\xf5c_U\xebo\xf8\x99\x96*\xd7\x19;\
+Y\xb17?\xfb*\x7f=3cug\xf8\xea|\x0a\
+\x1d\xd3{\x95\x1fv\xb6\xabV4|D\xa5\x9e\xff\xfc\
+iJ\xff\x91\xf7\x1c{soU\xdf\xfa\xfb\xaf\xa9\xf3\
+\xfd5Wo~\x9c\xae\xf2\xcf\x12M%w\xa3n\xb7\
+r\xf5\xde>\x85\xaa\xde\xea\xea\xec\xce_Y\xe9\xfe\xbd\
+\xee+\xb6cKF\xc5\x8bj\xed\xac\x5c\xfd\xedO\x99\
+\x1e\xdf\xdf\xdf\xf2\xaf\xea=SW\xcc\xd5<T\x89\xcc\
+\xbb\xad\xdc0\xf7\xde\xdf\xef\xdb\xd5\xb3\x9e\x7f\xabY\xa7\
+*\xbe_{mv\xc4\xe4T\xde\xdc\xcd\x8f\xb8\x9d\xee\
+\x8b\xaa\xcc\xee\xdf|\x17S\xff\x94e{\xf6\xf9\xad\xea\
+[K~m\x8c\xaa\xe6\xaf\x1e\x9d\xf7\xd1\xd3\xb6]q\
+\xa7b\xf6+\xc6_\xb4V\x9e\xdc\x99\xa9\x96\xf37\x91\
+WW-\xff\xbd*\xdd<\xe5\xf7\xf7^e\xda\xd8I\
+WOM\x15\xe7\xb5\x7f\xae\xc2\xf65\xef\xf7[U\xec\
+wn\xe7\x09\xb97\x8f\xd5\xdd\xf9#v\x9b\xf9\xab\xc5\
+;_\xfbfM\xf6\xed\x88\xac\xf2\x11\x8dU\xff_\xa6\
+\xb3\xfa\xee\xf6k\xf5\xfa\xdb\xf7\xfb\xae\xaf.%\xa7\x98\
+\xaa\xd0<\xd9K\x0cV\xa4D\x0e\x03r(\xcf\x03\x0b\
+\x82\xc0\xc1\x80\x03\xcf\x82 \x22\xc6\x01\x81C\xff\xa6\xa6\
+\xeanUV\xee\xdb\xd6\xea3\xdf\xb6\x15#vk/\
+X\xcf\x03\x83\x83\xf1\x94\x89J%\x5c\x06\xbd\xbc\xa9\xea\
+TU\x9bs[\x99\x9f\xa9N\xf6z]\xbd\xf2\xaaM\
+\x985]m\xeaL\xc6\x98$\xf2v\xa9X3QT\
+S\xa5\xd9\xad{\xad\xf6\xaa/y\xec\xcc7\xde\xfd\xd5\
+K)\xa5\x84\xd9\xea\xad0\xf9>|\x85\xfd\xb6\xca\xfa\
+[\x95\xa9\xad)N\x7f\x89\xfc\xaa\xb4\x11_e\x82m\
+\xfb\xca\x92n\xaf)\xcc?\xf7\xc6$-o\x15#\xad\
+\x88J1\x13\xccuT\xd8f\x8a\xd3\xbc7ke\x98\
+\xb0{J\xce6\xd3\x94i\xfb\xae\xa9\xa2JM)%\
+\xc4\x9a\xbb\x1f]'@V7]u\xe2\x86\xf6\xff\xab\
+\xfd\xaf\xa7.\xf9\xad\x9b\xc2K\x0e\xb7W\xd9*\xba\xab\
+\xbb\x84\xcf\x1e/\xe9\xed4W\xea\xf8\x99\x97v\xad<\
+!\x0d\xb2\xd6\xbc\xca5%\x9a\x96*4$\xf1\xdbC\
+W\xf9\x88\x82\xb0\xa9\xa7\xc2d\x9b\xdf\x95#\xee\xfb\xa8\
+\xd81\xc9M?\xa5\x8f\x88\x83q$`X7tV\
+\xc6\xb0$8O\x04\x09\xd0`\x01\x03\x06F\xef\xdd\xb5\
+\x9eC\x83\xcen\xb5\xcc\x9a\xe9*\xaf\x89\x96\x07\xa2\x80\
+\x02\x07\x05w)-\xfd\x19>X\x0dg\xa1\x1eHP\
+\x1e'\x02\x02\x22\xc1b\x16\xca\x02\x0e\x04<N\x02M\
+\xc3D\x0e,0\x8d\xc5\xb2\x1e\x13\xd1BC\xd3\x90\x08\
+\xe0A\xc4`X,\x10\x8eB\x91\xf08\x110,\x16\
+\x07@h\x80\x81\xb1<\xe6\xadD\xca\xa2D\xab\xd1\xb0\
+<\x8a\xa3x\x96\x84\xc5z\x90H\xabi8Q\xe4(\
+\x9e\x88\xb1\x9a\x87\x13%\x07\xe3\xf0D\x0c\xc39\xfbR\
+!.\xae\xc2\xbfD3\x15\x9f>J\x04\xa5\xf5@@\
+\xca\xb2&`\x1a\x8c\x84\xd2pL\xcf\xf64\xd5L\x0e\
+&\xa2Q\x14N\xe3\xc0@,\x87e=D\xcac\xb1\
+\xa0\x87\xc8q\x1aP\xe4`\x9c\xc7\xc24R\xb4X\x12\
+(\x9c\xb5H\x91\xc4\x8a GZ\x10O\xe4(\x14\xe9\
+\xa18\xa0F\xa3Q\x1e\x87\x08\xe7\x01Z\x13J\xf3<\
+\x10\x12\x0f\x88\x04\xb1p\x96\x7f\xc5S\xdd\x8e\xb78S\
+\xea8\x13\xa0\x82\x83\x08gQ\x1e u\xfc\xac\xe5q\
+\x14\x8c\x05\xcbAy(\x8a\xe5RZ\xcaK\x09\xc8\x97\
+\x96\xb1\xd7\xcd\xf0\xfd.o\xf5\xfaL\xdd\xff\xcc\xd2\xee\
+\xce\xee\xfe\xed\xfa\xed\xd6\xee\x02\x0a\x1e8L\x80\x16\x1a\
+\x1c\x16\x1a\x1c\xadYa\x83\xe8m;\xf1\xd8[q\xea\
+\xa3N(\xcf\xa3<@\xca\xa2\x0cL\xf3\xac\x88i\xa4\
+:[\xc0\xb0\x1c\x8ec5\x8b\x87Yh\xa2\x8e\xac\x9e\
+d\xa2rJ)\xa5\xf4\xdb\x8c\x87\x9f\xae}\xc7\x8f\xff\
+i\x9dk\xc6\xae\x86\xbc\xf8\xdb\xdd\xdd\xda\xee\xfc\x8a\xf9\
+\xd9\xbe}w\xec\xde\xda\x8e\x8e\xcd\xca\xb9\x8a\xab\x8f\x9e\
+\xd8z}*\x13\xcc\xe7V\xff~u\xc9\xfdjJ\xc7\
+<g\xb5\xce\xe3wF\xf3M~M_\xf5mf\xd2\
+\xbf\xa9\xedSJ\xad\x8d\xef~\x8d\xbd\xf6\xe7\xaf\xc8\xa6\
+\xe6\xcc\xf8\xfb\x97\xcd\xb6\xbc\x88\x99\xc9\xeb\xa9\x22&\xed\
+\xb7\xebn\xff\xac\xbb\x8ch\xe7\xbf\xa6\xc8\x98\x8e\xc7\xa9\
+}m\xde\xa6\xa8.\xb9\xc3~\x95\xdf\x9a\x8e\x9a)Q\
+\xbeO\xc5\xc8\x1f\xab.\xaf\xa9\xc2\xc6]_T\x98\x12\
+\xbe\xcb\xd6o4\xa5\xf3oMK9\xb1\x95ar\xdf\
+\xef\xcbz\xe6\xdd\x99\xee\xd6\xdc\xbb\x86\xb8\xae\x9d\xbe\x8a\
+j}\xca\x92\xbd\xde4nc\xb7N\xbc\xe3eC\xd5\
+D\xcfnU~\xce;\xceUO\xd5\xb6\xc7M\x89n\
+;+\xf4N[G[La\xae\x98)\xa5\xc4\xe4\xd1\
+O\xb1[e_\xf2\x8c}\xca\x1d\xf1\xd3\x99\xd1\xf3\x12\
+M\xfe\xb3\x13]\x15\xfa%\xc7l\xec\xd6\x89)A\x9a\
+\xb7M)y~N\x14-Q\x9dW\xa9a\x82\xda}\
+\xcf\x97\x1c\xd2\xd8m\x9f'\x9b\x92\xa4\xd8\xaf\x0a\x15\x93\
+\xc3\xc7\xfee\xc3\xc4\x11iR\xf57\xf9\xde$I\x12\
+\xed\xd4DC]ey\x86\x99`\x824\x9b\xa7I'\
+\x9c$\x9c$\xbb\xbd\x09r\xbb\x89\x8e\xacp/\x7f\xfd\
+\x93\xb6\x7fV\x86\x9a\xa4\xd4\xe8\x89'\xfe\xab\x98<\xf3\
+;*4\xf7\x94\xd6\xaaN\xfa\x96Wy\xb2\x08v\xe2\
+\xad\xf5\xae\xb2\xbf\xf5\xbf\xc6\xc5tW\x9d\xa4\xad\xaf\xba\
+L)\xa5?\xb7}\x0f\x85\x10\xa8s\x07\x92\x9c\xcbI\
+&%\x11I\x92\x82d9sS!\x10\x1c\x98\x06d\
+\xe3E\xd4\xf3\x01#\x12\xb1 \x16 D\xa1@H@\
+\x04\xc2\x18\x06a\x10\x06A\x10\x12\x01\xb1\x86\x10D\x10\
+\x22V#\x22\x1e:\x0a\xd8\xc0\x8ccm\xfa\xde\x11\x12\
+<l\xf6\x89\xc4b\x9e+\xa9\xaa\x88uG\x13t\x13\
+\xa1f\x1c\xfb\x0e\xcf\x14G\x0bB|H\xddR>8\
+\xe5\xe6\x1c.+\x09\xd9#h\xb0H\x07Zd\xe8\x84\
+6\xba\x97\xf6\x93\xedi5i\xfb\xb7\xa0\x81.s\xdb\
+\xfd6\xad.\x22\x10\x02\xde\x98\x9d\x16\xf4j\x1e\xcc \
+:{\x8aI)\xfe\xa9\xfe\x97\x87?\x19\xee4\xeb0\
+]\x1e\xa3\xae2\xa1N\xf6\xfb\x98\x0c}\xc9W(U\
+\xe7\x92\x0a\xb5\xba\xa2tBY\xb4S\xbf<\xbf;\xa4\
+N[\xa63\x98\x8d*\x87\x1aD\xa5{\x01\xbdW\xb2\
+\x1da\x9b\xd1\xf2\xa11\xd1\xca\x92\x00O\xc8q\xa0>\
+\x93k\xc7r-\xca\xfc\x0b\x17\xc6\xf1\xd8\x1b\x05\xe9O\
+\xf2\x96Y\x09\xa6|\x8d\xd1\x02\x82\xd5\x91\x8d\xbfq\x95\
+\xca#\xfd\x14J\xfdO\xe7\xf7\xdfp\x8d\xe5W\x1c\x09\
+\x1e\xdaZR\xdc\x0e2\xa9{8\x08@(\xf7\xfce\
+\xc5n\x15g\x80+\xec\x19+b\xc7\x01Lz\x16h\
+5lU]\x1c\xaa\x0ecT\xef=\xf7/\xe5\xcfq\
+\x99\x0aI@U\xee\xa6\xdc\x1e)d\xd4\xfe\xc4\x90?\
+\xb1?\xad<\xa6I\x8d\x8a\x12\x0ee\xe4]\xba\x07\xd0\
+sFf\x04l\x14\xc9\xa3e\xa1a-,Q\xd3\x08\
+&\x17\xbf\xe5c\xb8\x7fq\xcc D.\xa1\xb4\x22\xcf\
+\x9fQ\xbf\x943\xa1\xccV\xa4F\xdb\xbds\x10\x94\x86\
+\x8a\xac\xe4\xd2\xf7\xd4\x83\xea\xe3\xaa\x95\xfe0gXg\
+\xce\x18\xb2\xda\xe1\xb1J]$\xb6\xb8\xe7[JK\xf4\
+\xed\xeb;\x8fb|\x9d\xdc\xf1;\xb6\x86\x89^\x8d\xaf\
+J=\x82m\xa1bHj\x92\xff\x97\xda\x02Q\xa7o\
+\x80ZJ\x050\xfb\xab~\x8f;*\xc2\xfe\x14\xdec\
+JM\x03PS\xffL\xdb\xaf\xcc\xa1\x82\xba?\xc5\xce\
+\x5c\xa5\xe4\xa3<l\x0d1\xacym\xd6.l\xc1\x89\
+4\xb5\x19f\xae\xc4\xb9QHd\xb1\xdcM\x02[\x92\
+\xefV\xe3\xc6b\x01\xbftq}\x03\x81\xc6W\xb9\xe3\
+\xd2}\xe0$\xe6\xc1'\xf0\xe0\x13{\xc8_\xc8\x9f+\
+(:\xder\xb8\xf5\xb0\x033\xe7\x91\x81g1\xf1\xae\
+pO2h\x82\xd6P\x1f\x02h]\xc1]{\x06X\
+\xca\x181j\xa5\xce\xfb\xc7\x05\x9f\xcf\x12\x9c\xcd\xec\x94\
+6d\xd7\x9a\xb4+\xf7+\xd3\xac\xa1_j*`-\
+\xb3\xbeRL\xa5\xad,\xf1\xbd/l\x88\x93\xbe\x8d\xea\
+\x10\xbbcF\x9d,\x81Z\x1d>\xa9\x87\x9c\xf7>\xe3\
+\xb0\xd0\x0b\xd0\x8e\xb03\x804*\x87\xbeY#\xfd\x07\
+\xe2\xdc\x9bjw\xa0\xd7P\x1d\xde\xea\x94\xdd\xc5\x8c~\
+\xcd\x8c\x8b\x19:\x11\x8f<O\xe3\xde\xf2\xba\x19\xa1=\
+\x9b\xcb(\xf0\xedeD\xb2Y\x89c\xc8\x87\xa0\x9d\xfc\
+\xd1\xe75>,\x8d8g\x0f\xccY$\xb1\xd8TO\
+<\xd0XF\xdd\x92:\xa6\x90\xf6\x8b\xcdP\xcb\x9a\x5c\
+iB\x0b\xcb\xb2X#\xc0\xb4\xaa\x04pl\xad^\x96\
+\xbbO\xaa\xdb\xceL\x87\x85\x88^\x84p\xda\xea\xcb\x0a\
+\xcap(\xb7\x89Z\xd2\x15(\x88\xd2\x1c\xe7\x04\xe1\x1d\
+\xcb`\xcc\xe3\xd8(M\xdarr\xd64h7[\x0d\
+\xe52p:\xdb\xf4\xfd\xef\x9d\xd1I\x1b\xc4f\xfd\xf8\
+g/\xb1fx\x9b\xfdrTt\x12\xd5\x1c\xd1,I\
+Un\xaaU\xda7\xfb\x94\x16\xa6\x11\x8d\x08\x95\xe6V\
+\xa1\x84\xf6\x08\x07J\xeb\xaa\xe7\x15\x87\xf4C\xca@\xf6\
+\xb2\xbe\xf1Ib\xf7)\x22M\xe0\x86\xdb\x1a$J\x83\
+|\xc9\x03\x8cNr-n\xa0\x0e\xbb}\xdei<S\
+i\xba\x7f\xce\x97\xd9,\xfc\xf6)M\x9a8j&\xb7\
+\x1f\x14<\xc8\x85\xd2\xffB}\xc2\xa8\xc0\xe4\x18\xa6\xe9\
+\xe0:t\x13y\xbe\x02~\xf79.,\x89M\xc7\xf3\
+\xe8\x8e\x94\xa2k\xcd\xce\xc8\xc7\xe7\xbf\x87\xec\xa3f\xe0\
+\x86\xc1\xe8\xcc@(\xe0\xba\xbc73w\x1dX\xaaY\
+q\x06HON\xcd1\x9dy\xce\xa6\xfbz\xe2.\x08\
+\xdc\x101\x85\xa3\xb1\x96O\xdb]Z\xb6L\xf6\xb1j\
+\x9dHv@b\x0a\x22\xec\x04\x8c\x02\xa8z\x90\xaa\xc2\
+\xa6\x1a\xdc\xfd\xc5\xa4\x8aj\xea\xd4\xdb'T=F\xda\
+5F\x91b+\xb5\xddk=\xc4h\xd8\x22L&\x93\
+\xbbt\x7f\xc1\xde\x16\xc9\xe7%L;F\xbe\xfe\xf9\x9d\
+\xf9\x99\x19i\x9d\xd3G j\x9d\x11h}\xb5\x06\xc6\
+\x95\x1cZi x9w\xe0\xd2K\xc7\xf7\xd3\x038\
+?c\x1f\xc5\xd0SAS\xa7FH\x94\x04(\xbf\xee\
+.=x\x1e\xf0\xf3\xedp^K\x5c\x7f@WHz\
+OQ4\x8c\xdc;\x002\xcf\x10\xd3e\xd1\xc8r\xd8\
+A\x85\x93)\x18{~\x91\xf8z\xcdV\xddOx\x9e\
+\x80\xf9\xec\xfb\x9b\xcbK<\xa7\xfbw\xaf\xff^\xf5\xe3\
+\x94\xed\xd3\xbb\xf4\xd0kt\x1c\xfcp\xfb\xe8\xd0kz\
+\x1f\x1d\x1aa%E\x22\x1d\x14%<\xc2;\x96\xda\x89\
+:\x83\x9b\x11\xb2^C\xf3k\xbb\x00$\xba\xd6\xb7Y\
+9\xf5\xc1U.\x80\xa1\xc6\x9c\xaf]\xebu\xe0\xbc\xd7\
+\xdcpO\xc4\xff\xea\x16\xea\xbbo\x19e\xc4[\x89\xe4\
+NU\xb9\x9f\x08O\x86Ca7M\xc8Mp\x85\xb3\
+\xc5\xfe~\xbd\xe4!Xx\xc1\x14\xc2\x15\xb0\x01\x15\x00\
+\x1c\xb4L\xf5\x92T\xfe\xe37J\x00\xca\x9e;'z\
+\xf8\xf2\x08\xf3!J\xcc\x1c\x92\x9b\xff\xdf\x1d\x9f\x1bq\
+\x82'4\xbb\xb7,\x07n\xd1\xe9\xd6\xa7\x94UI\x11\
+\xe8A'E\xea\xb5\xa8\x9c\xda0E6\x904/j\
+4y7\xb9\xa5Dxt\xd2\x9c^\x99\xcfMt\xea\
+\xfc\xd9\xfa2='\xef\x1c\xa2\x07\xaf\xe1\xf8p\xcc\xe7\
+!f\xba\xf1nUAep\xecI'\xf7V\xbf'\
+|!cEv\xfb\xea\xc9\x89\xa2|\x96\xdf\x84\xba\xe3\
+.z\xac\xeb-\xadn\x03\xd8\x22.\x92=#\xe4u\
+OM\xd9\xd5\x03|?\x00k\xbcn\xf0^4.Y\
+0\xcf\xfbY.\xeb\xda\xc76+\xba\xb9\x01\xbc\xc1\xdd\
+TO\xfb\xb6\xbeu\xcd\xa9Y\xf8\xd8\x80\xd0;\xcd#\
+z\x5c\x84}\x1c\x87\x94\x16+\xaf\x22\xb4B\x9b\x1dD\
+K\x8f\xc3(\x19\x05\x88\x8c\x06\x16\xc9U\xd6\xd1\xfe\xe1\
+\xfc0%\xbb\x02VIn\x0d\xed\x02\x0a\x1f\xc2\x12\xbc\
+\x5cY\xd6\x16\xedZ\xe9\xcb\x9bX\x87\x97%L!)\
+\xa4\xfe\xf8\xc70\xe8\xcf\xb0\xe0\xed\x82\x93\x1b\xc7 z\
+\x9cc\xe9\xb0=\x03\xe0k$\x17\xff!\x95C2\x12\
+p\xee\xde\xd9 \x94\x97\xcc\xc7f\xbaZ\xefi\xd5+\
+D\xf4<\xc6<\x0d\xe1\xa8F\x1f\xcc\xdc\x80\x19\x1eT\
+\xc8\x897\xd0\xec\x10\x12\x06\xd9\x1e &!\xac#z\
+\x19(\xc7\x95+\xacK\xb0\xc8\xac%\xa4\x22\x01p'\
+\x227\x02\xe1\x14sX\x0f\x84{_\xeb\xb1\xf2\x15f\
+\xc3\xeb\xbe.B\x05\x9fi\xa8\xdcX\xbb\x0d3?\x12\
+\xf9\x18\xcf\xda#(\x1f\x9d\xb6\x94wy\x98\xe9\xfe\x07\
+\x18Mf\x11\x94>\x1aR\x0av\x15L2*\xf3\x0d\
+\x0dd}\x92Q\x85\xdd\x8c\xdb\x84Z\xdfp\x8a\x00\x97\
+\x95X\x96\xc1\x91\xe5\x9e\x05KD\xed\xeb\xa1N\xd2s\
+O&NB<\xae\xdb*\xb2N\xcb\x0cllwO\
+u\xab\xf9\xc6\xc4\x1c\x06O\xba\xab\x10\x08\x0en\xb0\xcd\
+)\xc3,\xcf6\xa1\x840\xf2\x89\x9e\xb7Sv;x\
+r\xc3i\xdc|C5Qt\x99\xbc`\xd2z\x7f\x02\
+\xbd/G\xbdJ\x1b\x03\x92E\xbe\x92\x03;x~\xc3\
+%\x93g\xab\xaa\xe4\x0c\x9aghn\x16K\x09\xa7\xd8\
+\x14\xf5\xf1\xd5\x5c\x88u\xfb)\x96V\xbb\x98\xf5\xa5E\
+@\xa1\xe1\x22\xb4?\x85\x1b\xe7\x17n\x1a\x0bc\xbbc\
+[\xc0L\x93?xc#@vy}\xf7\xcd\x8c\x1d\
+\xc7\x8f\x1d,\x05W\xaeKYC\xb1zF\xacfX\
+\x0e\x17\xdag\x82\xce\x0dn$\x5c\x0c\xfc\x22I\x5c\xcc\
+\x1ev\xaf\x87\xa5\xec\xf2\xcd{\x8c\x82yy\xeb?\xc7\
+w\xd4\xd6\xa9\x13D\xc1\x9b%\xe4\xa9\xb6\x17!\xf8\xe3\
+\x90\xc0Y\x0fGb\x89\xe43\xf8s\xd6\xa1_\xc7\x7f\
+5\x0b\xe8qV\xd5\x1a\xbc\xd3E|\x01\xc8\xcc\x89\xa9\
+\xf6sC\xbc\xf5\x13r\xf0\xb5\xc2\x9d\xbb\xdd\xb8\x01]\
+\xea[\x19Zo\xff\xe1,\xf3\xb0xTRa\x865\
+)\xe4F$n\xcc5\xcc/\xdc\xbf\x81\xd5\xaf7(\
+\x9c\x02\xd2\xcb\x12,\x05\xcc(\xb2\x92\xc9\xfdb1;\
+\x8b.>\xfd{a\x13\xf7\x82\xda\xcdb\xd13\xed\x9f\
+\xbdY\x9ao\xb8\xaeN\xcb\xc9\x84@\xe3I\xef\xb2\xc1\
+\x82\x05\xd8\x1f\xf7*\x07\x17BT3.yB\x03^\
+&\xc1x.S\x95V\x88\xaa/\x1eQ\x9e\x8b\xc5\xb4\
+\xea+\xd7\xe2\xe5L^\xb7W\xac\xb7\x97\x8d6-\xff\
+\x14u\xb8V\x5cWx\xa8\xbf\x07\xb1\x11\x93\xc4b\xd7\
+\xbb\x87\xdf\x93\xc5\x92?W\x0e\x86\x84\x9c\x99 \xf7\x93\
+\x0e\xb7\x956\x92\xc3\x9d2\xa1p\x83N\xd1\xdcSZ\
+up\xbe\xde\xf9\xd7\xa3\xcd\xa9\xc0\x87YOuH\x1e\
+\x9f\xb7`\x99\x83\x92\x8f\x19\xc0\xe1\xa1\xe4\xa8\x86\xf7p\
+]\xfb\xe2Yu\x1c\x92\x85\xb8\x9a\xb7\xae\xa1=\xa9\xc0\
+/\xda\x1fm\xd63\x85\xd1G\xe9\xb3\xe6\xbc\xaf\x1eP\
+\xb9\x80\x1e\x9a\x88}\xaa\xb2\x97\xe4\x9f\x1e\x9f\xae\x89\xbb\
+O\xf4\xb8~\x14?\x5cxu<.\x9f\x01\xe3\xce\xdc\
+\xfb\xb3\xfc&\xa8\x03\x12\xd6\xb2F\x88\xbb\xc2*W\x81\
+\x87\x98\xe8\x0dw\x03\xcd\xbd\xde|H\x8b\xbdgNG\
+}\x9e\x83l^\xb5\x85\xb3\x1e\xa2K\x0c\x8e\x81~^\
+\x09\xaa\xa5\xa4\x18\xcfh\xe1\xfd\xb0\xde\x16\xd3\xf3$e\
+\x91h\xc2Z\xc5+\x1d\xafB\xe6\x1cEo\xc2\x86\xf9\
+\x9b\xd5#\xe0\x1eF\xce<w\x10\x06\xff\x0a\xbap\x12\
+\xed\x83\xb9\x80\x1d\x04\x00$\xff\xe9\xe6F\x19\x14\x95\xb6\
+T\x8e!\xaaW#\x87\xea\xe8+\xd2\xfbjU\xa7u\
+\x9c\xa9\xa6\xc6\xa5\xb4V\x0cX(W1\xbe\xe9%\xaf\
+)Z\x8c\xccW\x1d\x98\xf0\x0fL\x82\xd7\xc9\x9c]\xaf\
+~.\xd1\xbf\x0f7\xb0\x1d\x18tOG6\xf6A\x8c\
+6Vso\xc9\xe0zz\xd81\xe4[\x07y\xc0\xba\
+\xc0\xe2\xcf\x8d\xf6g\x05\x94\x0a~.\x04v!\x1eR\
+\xe1q\xac \xcb\x84\x8b\xd8\xa4Z.@\x03\xce\xed\x14\
+f\x8e\xa3\x80\xb3zPD\x9aDr(/\xce\xf7\x14\
+ko:\xe8\x05\x9d\xd1\xf3y6\x96)\x08\x84\xa7\xc5\
+\x96\x82\xda\xe9\xa1\x88?\x97\x08\x0b\xf1(\xae\x1c@]\
+nU\xe8~\xe8\xe0qf`\x10\x14$\xffu\x0a\xd9\
+#\x0c\xa2s)\xf1\xa6\x02\xa0\x5c\xaf(\xf0\xbf\xbb<\
+\x15\xf1\xe7\x12Y\xfc-\xb70\xe8\xdb?\xc6~W-\
+\x931\xab\xc5qS*C<=)4\x01\xacz\x98\
+(,\x14GU\x81o\x8e\xa0\xb5o\x0b ]^\xe1\
+_a\xe7h\xc6\xdc\xa4tR\x19\xf0+\xdb\x0b\x16e\
+\x22)D\xf4\x00\xb0\xf7\x01\x19\xa5/]\xaa!&\xca\
+\xb1b\xe3@.\xd9\x913\xb0[\x1e\xae\xa8h\x0cf\
+')Z,q\x1b\xbdu\xed!\xf5qD\xb8\xc0\x08\
+\xbfq\xca2>B\xa6\xe5\xa2\xb4\xbb\xd0C\xdd\xa0\xcd\
+\xcb'\xeb\x85\xc6z\x8c\x97\x8a!\xff\xf2\xb5\xab\x10\xc1\
+K\x02\xd8\xf9\xbdD\x88\xbf\x08r\x1c`\xfba\x9e\xef\
+\x96@Y*\xe0|\x8cn\xe9\x1a\xdd\xa3\xb5\xc3\x1aY\
+\xd7\xe9T\xbbFoh\xc4\xf1`\x88E@~P\x89\
+\x87\x88\xc9}\xf5\xdc\xfd(\x98,\x7f\xf3c\xf4\x13\x02\
+!\xa5{>R\x13\x0a\x00\xd2\xf8z'\xe3\x07\x83k\
+\x03\x10\x95\xdaXSd)\x13)\x93%\xce\xb2'\x1e\
+-cG\xca\x0f\xd4\xa6\xc7%t\xae\xd1\xc5\x19\xa6\xcb\
+\x87|\xab]\x01\
+\x00\x00\x0dz\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x0dAIDATx\x9c\xecY\x0bp\x5c\xd5\
+y\xfe\xee\xbd{\xef\xbeW\x8f\xdd\xd5JZK\xb6\xf5\
+\xb41\x8eEl\xd9\x22qqm\xb0\xc9\x18p<-\
+\x81\xf2(\x99\x92\xa4\x0d\xd3NS\x980n&I\xc9\
+\xa4C\x9b\x94\xa4v\x99\x06\x12\xda\x81BZ\x170I\
+\x87\x18\x94\x87\xb0\x83\xcdC\xc6\xd8F2\x92l\xad\xb4\
+\xb2d\xeb-Y\xda\xc7\xdd\xbd\xcfso\xe7\xdc\xbbZ\
+KX\x12\x228C\x98\xe1\x9f\xb9s\xaf\x8e\xce\xde\xf3\
+}\xff\xf9\xfe\xff\xfc\xe7\x5c\xc7\x8d\x7fw3>\xce\xc6\
+~\xd4\x00>\xac}B\xe0\xa3\xb6\x8f=\x01\xc7\x95~\
+\xa1\xa4\xf0\xd6\x9d\x18\x1c\x88\xe9`\xe83\xc7\xe8&\xc7\
+\x12\xab\xdd\xed\xd4\xae\xe8xW\x84\x00\x05\x9dRC\xa1\
+1\xb5v\xa7\xcc\x96n\x13Iq\xbd\x06_\x0d\x80@\
+\xaeK\x8a\x87\xd8\xeb\xe3\xa6\xba]\xe2\xe8\xe1\x88\xd0\xd3\
+\x1c\x10&'\xaf\x04\x19\xe6\xc3\xa4\xd1\xe9L\x01?\xa4\
+\xac\xbd}\xca\xac\xbbW2\x8b7\x03\xe0\x97\xf8S\xcd\
+\xcdL\xbd^\xcc\xc4\x9e\x8c:\xdf}\xae\xc8\x9b\xb4\x98\
+\x10\x83\x81\xa48\xe1\x12T88\xe3\xf7G@V\x1d\
+83\xdd\xb4k\x92[\xbf\xd7\x00_uY\x07\xd3\xcc\
+\xbd\x9d\x99\xff\xefY\xc6B\xeb\x0b+\xaf=\xc8\xf6\xff\
+\xca\x99\x19\x1b\xdb\x0c9\x11d]\xbe\x8bBq\xc9\x89\
+\xf2\xba\xc8\xcb\x05!\xd7\xb8K\xd0\x17\xc4\xf2\x81%$\
+\xca\x1e\xb6-u\xcb\xde\x0cW\xf1\xb7\x97\x81v\x16\x02\
+\xee  \xf8\x01\xde\x03\xb0\x9c\xfd?\x83\x00Z\x16P\
+\xd3\x80t\x11P\x126\x19\xd3\x80\xd1\xd3\x5ce\xc4\x7f\
+\xfe\xb3\xaf56\xe2\xba\x8d;PPX\x8c\x91T\x02\
+\xafu\xb5\xe3\xb9C\xc7\x94>\xb7\xe3\xb1\xaa\xeb6~\
++RB_p\xb9}\xa0\x19\x18J-\x8f\x9e\x95\xb6\
+\xef\xd7\xb9\xc2\xeb\xf2\x8d,\x0f\xf8\xa2\x807\x02p.\
+\xe0r'\xcf5:\x19D\x02\xce<\x8f\xd0\xe9\x1f\xe1\
+\xebkV\xe2/7m\x81\xc7\xe7\x87\xe9\xf3\xc3`X\
+\x98\x94\xb8\xe0\x04\xc9f\xb0\xbf\xe5E<\xf4\xea/\xe3\
+\xfeuU\xf7V\xad\x0d\x1eeY\xf3w#@\xc1w\
+\xa9\xbb\x8f\x19\xe0\x97\xd9@L\xc0\x13\x06\x8a\xea\x00n\
+\x1e\xe9\xd3q\x98\xf7<\xd3{\xaa\x1fl\xcb\xdf\xe0\xa6\
+Z\x1e?\xbc\xf96T\x8a\x0aLU\x83a\x10\x10\xc3\
+\xcc]\x06\x88i\xc2\xa0c\xb8\x5c\xb802\x84\xbb\x0e\
+\xfcD3\xd6V\xef\xa8YW\xfc\xea\xeca\x96$!\
+*\x9b\x98r\xfd\xff\x18\xcc\x0cx\x00E\xb5\xb6\xe7g\
+y\x9cg\x81R?P\xe8\x06|N\x80\xcf)H#\
+@Z\xd2\xd0\xfb\xca\x13(\xedy\x1aw\xdfv'\xb6\
+n\xfb#\x18\xd1\x10F8\x0e\xde\x81a\x08':@\
+2\x92\x05\x9e\x02'\x84\xd8$\x92)\x04\xdd><\xb5\
+\xfbK\xfc\xee\x03?yz\xa2t\xd3\xbap\x84M\xcc\
+\x8c\xc9\xd54\xd5-\x0a^\xd39\xb4\xa5>\xbf/\xcb\
+\x94\xdd\x9eo\x0c\xae\x02\xbcey\xf0\x1e\x1e\xa8\x0e\x02\
+\xab#@\xd0\x0bx\x04\xc0\xc1\x02,cw\x99n{\
+\x01\xd2K\x0f\xe0\x96Z\x01\xdf\xf9\xf67\xb1qS\x03\
+4EG\x7f\xff\x18&.&Q\xd6P\x0b\xd7\x865\
+0\xb32\xd4\xe1q\xe8\x84@\xa7\xb3`\x18\xd0\x89\x09\
+\x9d\x18p:xD}\xfe\x82\x9f\xb7\x1e\xad\x0a\xd6T\
+\xbf\xc0;\xc8\xd2\x08\xc4\x92\x8d\xbb\xc6\xcdu\xfbl\xcf\
+\x9b9\xcf_\x02O=\xfe\xa92 \xe0\x9a\x9bdh\
+W\xf1\xfcI\xc4\x9e\xbc\x07\xbb\xaaM|\xff\xbb\xdf\xc2\
+g>\xb3\x09\x89D\x06\xf1\xf80\x04\x81\xc7\xb5MW\
+\xa1\xac4\x88\x96\x96\x93\x08F\x8aQ\xb6\xb9\x01\x86\xd7\
+\x8dLg\xdc\x02M\xe5\xa4\x1b\x04\xbai\x93\xa9\x0c\x04\
+q<\xde\xb3fP\xd6\x8e\x87\xa3\xde\xde\xf7% *\
+>\xbeK\xde\xf5\x92\x09\xae\xc8vu\x18(\xac\xce\x83\
+\x8f\xf8\x81\xd5a\xdb\xd3\xb3\x8d(\x22\xe2?\xdb\x83\xfa\
+\xd8\x03\xf8\xf2\x0dA\x94xe\xf4\xf7\x8fB\xd4\x02h\
+h\xa8\xc5U\xab\x97\x83a\x18\x1c;\xd6\x85O\xad\xab\
+\xc6\x86\x0d\xabp\xe4H;\x5c.\x01\xa1\xd5+\x91\x9d\
+NC\xb90b\x81'\x96\x9cf\xc8\x18\x88\xfa\x8a\xf0\
+\xc2\x89\xa3\xa5\xa5k\xaa\x9f\xa1k\xc5\xa21p^Z\
+w{>\xcf\xd3lC\x03v\xc6\xf3>`Ux\xae\
+\xd7\x89\x9c\xc6\xe0o\x1fC\xd9\xc0\xe3\xf8\xb7\x9d\x194\
+\xadq\x03\x88\xc34\xe3`\x98V$\xb3?\xc5[\x07\
+6\x22|\xcd\x03\xd8\xb2\xb5\x11UU\xe5hn>\x86\
+\xf5\xeb\xeb\xb1e\xcb\xa7q\xf0\xe0\x1b\x88F\xcb\xe1\xab\
+\x5c\x0d\xa1#\x0evz\x0a\xbaa\xc2\xc8\xc9\x89\xc6F\
+}q\x04\x95\xbc{\xeb\xd4H\xa6\xa2|\xb9\xf3\xc2\x82\
+3@\xcb\x83^e\xeb>\x1d\x9e\x95V\x83\xbf\x12p\
+\x17[\x8fn\x1eXW~\xc9\xf34\xa6'\xdb^\xc4\
+\xf4\xb3\xb7\xe2\xa1\xa6C\xd8\xf3\x05\x13\xcbJ\xb8\xfc\xbb\
+l\x92\x0c\x5c<AE\xe0<\xd4\xe1f\xb4\x9ct\xe2\
+\x9a\xc6F\xd4\xd7U\xe2\x97\xbf>\x0eE\xe6PRR\
+\x8a\xd6\xd6\x93()\x8b\x80\x84\xc3`\xbb\xbb\xed80\
+\xec\x19\xd0\x88\x01\x8d\x10Ld2\xccY9\xfdVI\
+\x85\xbfs\xc1j4\xa9\x86B\x92\x19\xdc\x9cGH\xf3\
+|\xce\x96\x17\xda\xe0\xa9\xce3c1t\xee\xdb\x81\xc6\
+\xd8\xddxyO\x0a\xd7o\x10\xb0\xd8b@\xc9\x94\x17\
+\xa5\xd1T\xf0$\xf6?\xfd,\xbacS\xa8\xad]\x85\
+w\xde\xe9\xb4\xc0^}\xf5*\xf4\xc4\xe2 \x05\x85\x90\
+\xa3\xcb,\xc0\x9aN\xa0\xea\xbau)\x9a\x0e\x97\xc3\x03\
+\xa2dV`\xb14:\xae\xd6\xee\xcc\xd76\xce\x02{\
+\x91\xca\xa5\xca\x88\x0f\x90\xa7\xcec\xb0e/\x1a\x95g\
+\xb0\xef+\x0eTF\xfc\xf3U\x0a\x97\x19+\x14\x83s\
+\x95\xa3h<\x89\xaa\xbe\x1f\xe28\x13F\xfd\xaazD\
+\x97\x95\xa1\xb7\xa7\x0f+VT@\x92d\xa8\xaa\x0aG\
+]=\xd0\xdbke%\xcb\xfb\x94\x80\xae#!\xeaH\
++J`A\x02T>\x12\x1b\xd9\x06\x92k\xa0\xe5\xc1\
+L\xe0z5\x5c\xf8\xd5#(\xea\xfa>\x1e\xbfS\xc0\
+5\xf5\xce\xf7GM=\xcf\xb9\xe1\xf0\xad\x84\x99P\xa1\
+\x9d9\x03\xe8\x04UN\x13\xddm\x8f\x22\x11y\x18\xe1\
+P\x10}\xf1~D\xa3\xa5\x88DB\x18\x1c\x1c\xb6\x9e\
+\x89 @K\xa6l\x12\xba\x8e\xee\x8bYL\xa9\x0a\xfc\
+!_\x12\x8bmh2$Xo=P\x9d\x08>\xbb\
+q\xe4m$\xfe\xfd\xd3\xf8\xa2\xeb\x11\xbc\xf8\x1d/\x1a\
+\xea\x96R|2\xe0<\x95p8\xeb\xa0\xc7\x86\xa0w\
+\xf7X\xe0\xed\x7f1\xd8V\xdc\x86\xf6\xe3\xafY\x0bW\
+4Zf\x01/*\x0a`b\xe2\x22\x08\xd1\xa1\x06\x02\
+\x90U\x15\xb2\xaa!>\x95E\xdfT\x16\x17\xa5\x04\x9c\
+n\xf6\xdc\x823\xa0\x13\x16\x1a|\xd5\xf9\x06Z\x98\xc9\
+\xd3Xq\xec\xcb\xf8\xef\x87\x1b\xe0\xe3\xae\xc6\x84(\x83\
+3\xa7\xc1*\xe7P\x18\xd2\xe6\x91\x0f\x03\xd6\x15\x01\xe7\
+(\x01\x19\x1a\x856\xda\x9e\x07=\xdb\x9c\x9c\x81\x15\x93\
+\xff\x07Q\xbc\x16\xe1p\x11\xda\xdb\xcf\xa0\xb44\x04\x93\
+\x16z\x86\x81>Q\xc3\xd8p\x0aIYCF#V\
+\xc91\x90\xba\xa0VUl>\xb2 \x01\x03<\x1d\xa5\
+ ? \xe3\x00\xd7\xfa0\x1e\xf9\xeaj\x94W\x84\xc0\
+:\x5c\xe0\x04?XJ\xcc\xe41\xd9\xf1:\x9c\xda\x11\
+\xf8\x0af\xba\xfb-\xb9\x18\xc3S\xd0\x86:\x00c\xf1\
+\xda~\x93?\x86\x83=\xe7P\x7fU\x8d\x951\xe8l\
+\xb0,\x8bXG\x0f:\xbb/@K\xcb\x16\x19\x9aF\
+\xcf\x89\x17`\x86\xfcO\x15\x85\x85q\x80,\xb1\x9cN\
+\xc6qs\xe00\x1a\xd7m\x07\xeb\xf0\x80\xe5\xbd\xe0\x04\
+\x9f}\xe7}\xa8\xd8r/\xd2\xc3\xdb v\xff\x00E\
+\xe5e`\x14\x1ez{\x0c\xa6,/\xfe^\xca+a\
+\xc2\x9d\xd2q\xfe\xf4o\xa0\xa6\xb3\x98\x9aN\xa1KR\
+q\xa6\xad\x1bN\x8e\xb3k\x22\xc3\x9e\x8d\x8c.\xa1=\
+\xd15R{\xcbu\xdf\x9e)%\xe6%\xc0B\xa3\x89\
+\x93\x06I\x18DG\xc1o\xbf\x8ao\xfe\xd3V8\xdc\
+\xc1<h\x96\xf7\x81\xe3\xbd\xd6\x9d\xe5\xdd(\xaa.\x06\
+\xe7\xd8\x83\xe4\x1b\xfb\xe0\xcdL\xcc\xbby\xc9\x1b}{\
+\xc6\x04\xa6\xa9^\x19+\xcc\x0a\xb4q\xf4w\xf5!\x95\
+\x141\xedsC\x16\xb3\xe0\xfd^\x10I\xb6\x02xL\
+\x9e\xc4i\xb1g\xa0b\xfb\x1f\xdfT\x1a\xe5&.a\
+\x9d\xc7\xe8\x12\xcdC\x8c[o\xee\xdc\x8f\x7f\xfc\xb3\x08\
+\x96-_\x01\x87;\xfc\x9e+\x04N\xf0\xc0 *\x88\
+\x9c\x82\xab\xb8\x14F\xe5\xe7\xa0\xea\xe6\xc2\xe0\xe9\xa4\x0c\
+\x99\xc0\x04c\x81GN\xa5NF\x83i\x9a0a\xff\
+vf\x13\x97H\x8e\xe3\xd5\xb1V\xbc!\xf7\x1f\xa8\xf8\
+\xdc\xa6\x8d+\xaa\xb9\xce9X\x17\x1a\xc7\xcb]\xecN\
+$\xd3M7\x14\xbc\x83/\xec\xfe+\xb0\xbc?\xefq\
+N\xf0\x82\xe5\x04\x98\xb4\xd0RD\x18\xaa\x04\xa2\xc90\
+T\x19\x81\x15Wa,V\x8d\x12\xe3\xdc\xdc\x17\x92\x9c\
+\xc7\xd3\xcc\xbc\x0b\x9d\x01\xce\x92\x09%A\xeft\xe3\xd2\
+\xd6\xdd\x8aS\x13=\xf06\xdd\xbe\x7fc\xcd\xc8]>\
+\xb7r\xb9\xb3\xe7\x03\xefvjp\x8bc\x87\xb9\xde\xc3\
+_\xdc\xfb\xe8\x97\xc0\xbb\xc39\xa9\xf8\xc0:\x9c\x96{\
+\x88\x9a\x81\xa1\xc9 \xaa\x0c\xa2I04\x05\x86\x9a\xb5\
+\xda\x5c\xab>\x8b\xec\xa9>x\x5c\x8c\xad\xf3\x94\x09$\
+\x18`\xc1\x8911F\x02\x16xZ\xe4\xf5\x0ev\xe0\
+D\xbc\x1d\xe2\xf2\x1b\x81\x9d\x0f\xc2\xc3\x9f\xfe\xb5\xcf\xdd\
+?\xef/\xe7%@\x08\x03\xd2q\x80\xf9\xfb[\x1b\x11\
+\xad\xac\xb6toe\x1c\xea)]\x81\xa1e\xf3\xe0\x8d\
+\x9c\xe7m\x12\xf6\xc5;9\x88\xce\x12x\xd2\xe3\xb6\xd7\
+\xc9\xe2K\xf4\x94*`\xc2\x0c!;5\x8c\xd6\x8e\x16\
+L,\xdb\x01s\xc7c\x80\xc3C\xf5\xa5\x95\x08=\xcd\
+\x0b\xfdv^\x02\x13\xa3jH\x8a\x9f\xfd^M\xf5\x1d\
+\xe0\x5cE\x96\x5c\xa8\xceg\x00Z^\xa7\xe0u\xd9\x92\
+\x8f\xdd.\xe7\xffG\xdb\x09\xcd\xc2\x93\x13\x8b\x02\xb7\xcd\
+\xc4\xc1\xd1\xe5x\xb7\xffMt*\x0e\xe0\xa6\xe7`\xfa\
+\xca\x81\xd4\x80\xf5_7s\xf1\xf5\x02arr\xc9\x04\
+d\x99a\xe2G\xdf\xf9\x8fee5\xa5\xcf\xbe\x14\xc3\
+\x13?=\x84\xfb\xfe\xe2F|vC\x1d\x88\x9a\x93\x8a\
+&_\xd2\xbd\xf6^\x02v\x1fE\xe0\xedH\x5c$\x1b\
+eu\x13\xff\xd5-a\xef\xf9$\xb2M\xdf\x00V\xdd\
+f\x9f`\x8c\xbe\x9d\xef\x13\xe2bO.v\x00v\x19\
+\x81\xdeSC\xb72\x19m\xf7\x9d\x7f}\x1fB\xa1\x88\
+\x15P?z\xea\x7fA\xa4$6\xad\xad\xb4\xbdn\x11\
+\xc8\xc9(G\xc6\xd0m\xef\xeb\xaajU\x8cY\x0d\xd0\
+\xc1,\x90%L\x1c\x1e\xd6\xf1\xd0i\x07\x06\x1a\xfe\x19\
+d\xebW\x00\xd6a\xc7\xc8\xf4\x19\xc0\xb0\x01\xb3\xd0\xfa\
+*\xdd\xed\xcf-\x88\xfe\xbdi4\x99\xe6\x85\x89w\xbb\
+\x1e\xde\xbd\xfb\xcf\x11\x0c\x96\xd8\x1dX\x16\xb7\xec\xba\x03\
+\xff\xfaD34)\x09]JA\x9f\xb9\xcbi+}\
+\xear\x12\x9a$B\x91$\x88\x92\x86\xb4d \xab\x92\
+\xcbr\x0d\x9d\x90\xf3\x19\x82\xbb\x0f\xa7\xf0\xc0\xf4\x0e$\
+\xee9\x05\xb2\xee>\x1b<5q\x08\xc8^\x92\xdd2\
+\xae\xf5~\x9fS\x5c\xf4\xfc1\xef \xbay?\xfb\xca\
+\xc9\xef\xad\xa9__\xdbt\xed6+\x1b\xc0\x0ah\x1d\
+\xaf\xbc\xf2\x12\xba\xfb\x86\xd1|\xe8\x04vl\xac\xbc$\
+\x15\xdd\x8e\x05U\xd5\xa0h\x06$\xd5\x80\xac\x1aV\xad\
+\xc6**8\xc6>O\xa1\xc0'\x15\x13?\xee\x14\xf1\
+\x22\xb7\x15\xdc\x9f~\x17\x19_\x835K\xb9\x09\x01\xb2\
+c@\xa27/\xb9\x00\x06\x1e\xad\xf1\x9f\xfc\xc5b\xe0\
+\xe7\x10\xe8=5|\x8384\xfa\xb5\x9dw}=\xe7\
+-\x13\xb1X'\x9a\x9b\x9f\x87(\x8ap\xb9\xbchy\
+3\x86\xadk\x03\xf9\xac\xa3k\x1a\x14\x95X\xa0%\xcd\
+\x84\xaa\x99\xf9L\xe9Q2\x16xZ\xbf\xfc\xe7Y\x19\
+\xff2\xb0\x0c\xec\xf6g\xa0Vn\xb7\x8eY0\x1b<\
+\xf5\xfcto~y\x10\xcc\xa9#k\xfd/\xdf?S\
+.\xbc/\x81d\x92q\x0e\x9d\xec\xf8\xb1\xd7\x13`\xbb\
+c\x1dhk\x7f\x0b\xb1X\x07\x92\xc9i\x08\x82\x1b<\
+o\xd7\xfc\xa3\x13)\x10)\x0d\x9d\x06\xa9\xaaC\xb1\x80\
+\x1bPT\xd3Z\xa7f[A&\x89\xb7'T\xfc\xc3\
+\x09\x05\xa7\xeb\x1e\x04\xee\xf9\x86\xbd\xaf\x9e\x8d\x89h\xc0\
+t\xcc\x96M\xce\xf3,\xb4\xc1:\xe7\xa1\xbb|\xae\xec\
+\x92Nw-\x02CgF>\xef\x00S\xedvy\xf1\
+\xe6\x9b\x87\xc1\xb2\x9cu\xb9\x5c\xbe|GZ\xde\x16x\
+yH\xd9,d\x95\xd8r\xd1L\x10\xc3v\x1c\x93\xdb\
+b\xd2\x99\x1b\x1b\x1a\xc7\xe3\xafN\xe37\x81;`\xfe\
+\xc9\x1e \xb0r\xee)\x1d\x91\xe9^\xd4\xf6<\x0d\xd8\
+\x1cx\x07I\x1c]\xe5n\xb93\x1a\x18\x18Z\x0a\xf8\
+<\x81\xf4\x94TG\xeblY\x91 \xd0\xd27w\xf0\
+J\xab@\xab\x5c :\x08\xd1\x90*,\xc4\xde\xe7O\
+c*\xa3\x22\x9d\xa5\xdb;\x03bFA\xd6\xe0!j\
+<d\x83\x87d\xba`z\xc2\xc0\xd6\x16\x98\xa5\xeb\xed\
+Q\x0cu\xfe\xc3\xddY\xe65.<\xdaPp\xf0\xfe\
+\xa5z~\x0e\x81\xbaM\xcb\x1f;\xad9Y%9P\
+o\xb2)\xc2\x15\x94%YFO+*\x9f\x11\x1c$\
+\xed\x0b\x86\xd3.^I\xf5\xa9\xbc8(\xe9\xa27\x12\
+L\xa6\xb9\x9a\xbaa\xc7\xf5? \x8e\xc0J0\x1c\xc0\
+\xb09\xf7\x9a\xf6TP\xc0\x83\xaf\xcfL\x9f}\x9f\x01\
+=\x0b<M\x95!r\xf2\xfe\xd5E\xc7~\xb1\xd81\
+\xfaB6\xe7pW\x94\x5c`\x19\x034x\x96\x12@\
+W\xfa\x03\xc7\xefb\x1f\xea\x0b\xcd\x8c}\xa0OL\xc6\
+\x1f\xd0'\xa6\xf9l\xf6G>\x95\x08\x96V\x04N\xa5\
+\xba\x02\xc7\x1a\x7f\x98\x1f\xf9f\xdb%\x80\xf4./\xb2\
+\xb3\xb92\xf6\xb1\xffN\xfc\x09\x81\x8f\xda>\xf6\x04\xfe\
+?\x00\x00\xff\xff\xec\xc5\xe7|\xf2\x02`\x05\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x17v\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x09\
+pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\x01\xd2\xdd~\
+\xfc\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\
+\xbd\xa7\x93\x00\x00\x16\xeaIDATx\xda\xed\x9b{\
+\x90eWu\xde\x7fk\xefs\x9f\xdd=\xd33\xd33\
+\xd3\xdd\xf3\xd2\x0c\xd2Hh$\x22$$^\x01i\x90\
+\x83\xec\x0avp\xd9\x891\xca\xb3\xecr\x02\xc8\xc4\xb2\
+SN\x84I9\x09e\xecJ\xec8\xc4\xb1\x05\x81\x8a\
+)\xe3\x07\x100\x16\x14\xa4\x92\x08{\x84E\x10zZ\
+o!1o\xcdLw\xcf\xbb_\xf7q\xce\xde+\x7f\
+\xac}\xce\xbd3\x12\xea\x96D*\xa9\x0a\xa7\xeaN\xdf\
+\xb9\xe7\xde}\xf7Z{\xado}\xdf\xda\xfb\xc2\x0f\xae\
+\x1f\x5c?\xb8\xfe\x7f\xbed5o\xfa\xcb{\xef]z\
+\xfa\xa9'Z\xe7\xce\x9c\x96\x93\x8f?\xcc\x9em\x9b\xd9\
+\x7f\xfc\x14\x7f\x7f\xef\x0d\x80\x03\x14u\x82h9\xa4\xa2\
+\x00\xaa\xe0<\x82\xa2Z~\x9b\xa0\x1a\xed\x1e\xd8\xfb^\
+j\x82\x22\xf6^q\x88\xd8\x98\x22b\x1f\xb7\x7f\xd28\
+\x82\x13E\xc4Q\xdb0\xa92u\xc9_m\xbf\xee\xcd\
+\xd7\xbe*\x07|\xe9K\x7f\x1a?\xf7G\x9f\x96C\x07\
+\xbe\x8b\x22\xf4z}\x16\x16\x97\xf8\xd05\x9b\xb8\xf7d\
+\x97\xd3\x9d\xc0\x9b65\xb9o\xae\xcb\xdb'[\xec\x9b\
+\xe9\xb0\xb9\xe9\xd9\xdc\xf2<~\xb6\xcf\x8flm\xf3\xb5\
+\xe7\x97\xb9j\xbc\xce\x5c70\xd7\x09\xbc}\xb2\xc9=\
+':\xdc\xbc\xa5\xcd\xd7\x8f-3R\xf7\xbcn]\x9d\
+o\xcdu\xb9q\xaa\xc9=\xc7\xbblnyF2\xe1\
+\xe0b\xc1M\x93M\xfeb\xa6\xc3\xd5\xeb\xea\x1c\x5c(\
+X*\x94[\xb6\x8d\xf0\xdf\x8f.q\xf3T\x93\xaf\xcf\
+t\x19\xf5\x8e\xab74\xf8\xd6\x5c\x87\x9b\xa6Z\xf4\xa3\
+\xf2\xe6\x89&\xdb\xdf\xf2\xc3\x9c\xf6\xf5\xb7\xde\xf0\x8f\xff\
+\xe5\xffz\xd9\x0e\xf8\xf0\x1d\xbf\x1c\xef\xfa\xb3/H\xb3\
+Y'\xf3\x1eU\xe8us\xce-,\xf2\xd5wn\x03\
+\x8d\xf8\xf6\x1a\x1a;\xf7\x90\x9f\x99#[\xbf\x91\xfc\xd4\
+\x09\xb2\x0dS\x84\xee\x12\xda\xed\xe1\xc7\xd7\xd1=q\x98\
+\xc6\xe4\x0e\x8a\x85\xb3\x90\xd5q\xcd6\xc5\x99Yj\xeb\
+'\xe9\x9f:N\xb6a\x12\x8a\x82b\xe1,\xb5\xf5\x9b\
+\xe8\x9f<A}\xe3\x14\xb1\xd7%\xf4z\xd4\xc6\xd6R\
+\x9c9A\xb6~\x8a\xb8t\x0e\xd7^\x83\x88\xd0?\xf9\
+<\xcd\xe9\x1d\xe4s\xc7\xa9OL\xa3yA\xbep\x9a\
+|t\x03_{\xf0\x09\x16\xf3H;_\xe2\xdd\x97m\
+B~\xf4\x83\xfb\xaf\xf8\x1b\xef\xbat\xd5\x0e\xf8\xf5\x8f\
+~$\xfe\xfe'?a\xc6\xd72\x9a\x8d:\x1a\x95n\
+/g~a\x89/\xff\xd04\xbf\xfd\xe4<\xb7_=\
+\x8e\x16\x91\x08h\x0ai\xf1\x1e\x11\x08ED\xc4B_\
+\xa3\x82\x08\xe2\x9d\x85k\x88)I\x04U\xc5e\x8e\x18\
+t(\xbc\x15q\x828\xa9R\x05\x05\xa2\x82\x13\x9c\xb3\
+qb\x08\x88H\x95&.s\xc4\x22\xe2j5\x1a\x9b\
+\xb6s\xe7\xc3G\x98[\xe8\xf0\xe1\xd7od~\xf75\
+\x7f\xe7\x8d?\xff\xef\xfe\xeb\xc5\xb6\xba\x8b_\xd8\xb7o\
+\xdf#\x9f\xfe/\x9f\x94\xe1\xfc,\x8a@T\xb5\x1c\xc4\
+\x0c\xba\xfbD\x97\xd8\xeb\x13S\x1e\x8a\x80\x08h\x08\x84\
+<\x00\xd1\x0c'\x19\xa1\x9a\xee\x15f\xbcB\x8c\x11\xd5\
+H\xd1\xcd\xd1\x18\x13vD\x10Ec\xb4\xf7\x06E\xa3\
+\xa2j\x0fT\x89E \xe6}\xc49\x94\xf2>\x84n\
+n\x08\x14rz'\xf6\xf33\xd3\x81\xbf{\xddk\xf8\
+\xec\x09\xa553\xf3\xf9\x17[\xec\x178\xe0S\xff\xf9\
+\xf7\xae\xe9\xf7\xf24o\xc5\x89 @\xe6\x85\x18#1\
+\x19\xf2\x95\xbd\x13\xa8\xf3\x80\x12\x83\x12\xf3@\xe8\x07b\
+\x11\xcc\x08\xb5\xcf\xc7^\x1fD\x08A\x09\xc1\x8c\x88\x85\
+E\x80\x86`_\xea\xcdI!\x8d\x13s\x1b\xc7p\xd4\
+\x9c\x14z\x05\x0a\x84B\x93c\x1d1\x0f\x88B\x0c\x05\
+\x82\x22\xde\xa1\x0a\xb1(\xe7\x93\xb3\xe5\xcc\x01\xfe\xdb\x13\
+\x07i\xfb\xc0\x03\xbf\xf9\xcf~qE\x07<\xfa\xc8\xc3\
+T\xc0\x0b\x14\xc1\xc21\xc4\xe1\x9c\x1130DbQ\
+ Q\xc1\xb9\x0a\x9d5\x0fh\x11\xd1B\xc1;b\x8c\
+\xe0\xd4V3hrZL)`\xa1\x1dB\x80\xa8\xa8\
+8\x10AUl\xa5\x83\x12\xf3\xd28\x8b\xb4\x18\xcd\xe9\
+\x92\xd2I\x90\xb40\x8a\x0e\xcf\x07\x01\x15>\xf4\xda6\
+\xf7\x9d\x83\xfc\xe0\xd3?\xb3\xa2\x03\x96\x96\x96,<\xd5\
+\xf2\xd69I\x1e\xb7\x92d\xb9\x1b\xf9\xd1}\xa7\xcc0\
+\x04%\x12\xf3\x82\xa8\x01\x8d1\x85&\xa8\x80F\x88E\
+\xb4\xd5\x12E\x13>\xc4\x18m\xa4\x22\x10\x0a\xf3n\x8c\
+\xb6\xf2v/\x828\xf3\xb5DTC\x95B\x08D\x22\
+\xa1(R\xea`+\x1e\x038\x88!Z$\xa6\xe8Y\
+\x0e\xca=\x0f=J\xab\x96]r\xb1\xbd\xd9\x8b\xe5\x85\
+\x02YJ\xf8\x12\x07b\xb4\xd0s\x22\x84\x22\xf2\x8e\xcd\
+u3(hZ\xb1\x08\xc1\x80K\x8b`\xc6\xa7\xcf\xab\
+*x!\xc4\x80FE\xbc@\x84\x18\x0b\xc4;\xc4\xa5\
+\x95t\x82\x16\x05\xaa\x1eq\x06r$lA@\x83\x01\
+]\x95:)M5/\x90\xcc\xf8\x88E\x8b@P\xa2\
+\x17\x9c\x83=\xa3\x9ey\xd7 [;\xd1X\x95\x03D\
+J\xd0U\x5c\x89\xd7\x82M\x10[\xd5\xdbv\xb5\x12@\
+\xd9\x0a\x19\xf4\xab\x81\xa5\xb3H\x89\x85-\xa2\xa2\x10J\
+rd\x86\x18F\x00ED\x85\x0a3\xc4{4(\xcd\
+\xad\x97\xe1G\xc7\x0c\xf4,\xa2\xab\xd5)N\xcf\x92\x9f\
+:aNJ\xafI\x1eq\xae\x1c\xd3\xe6JPb\x00\
+\xe7\x85\xaf\x1e8\xcd\x1b\xa6\x9fge\x07\xa4\xb0\x05[\
+\xedz\xbdI\xb3\xd9\xa2\xe8\xe5\xf4b\x81C@\x94\xdf\
+y\xae\xc3\x07/m%\xe2g\xab\x80\xf7h\x8c(\x06\
+F8\x03Nu\xe0\x9b\xa3lz\xcf/\xd0\xbe\xfcZ\
+j\x1b&\xc9O\xcd\x90\x9f9\x01\x0a\xdd\xa3\xcf\x11\x96\
+\x17\xaa\x0a#)\xfa\xc4A{\xf7\xb5\xb4/\x7f}5\
+\xbd\xde\xd1\xefr\xea\xcb\x9f\x22?}\x82P(\xc4\x80\
+\xafy\xa4$\x97\x92jI?\xe2k\xbe*\xc3\x97\x8c\
+x\x9a[.\x91\x95\x1d\x90\xc0/\xf3uF\x9ak\xd9\
+\xb1\xf32\x00\x8e\x1e8H\x08\x1e\xef\x9b\xa4\x12\x9e0\
+\xc0J\x90x_\xe5\xad\x86H\xd4\x8a\xc1BPZ\xbb\
+_\x0f\xaa\x1c\xff\xe4\xbfa\xe9\xd9\x87m\x0c\x97r<\
+FD\x1c\xaa\xf6\xb7\xbcZ\xdb/c\xfd\x0f\xfdT\xf5\
+\xff3w\x7f\x8e\xd9?\xf9m\x04A#8o\xa19\
+\xc4\xc0\x11\x05%\xe2\xbc\xaf\xa2\x99\x18Y\xec\x07\xf2\xb3\
+\xe7X\x95\x03\x9c\xaf\xe3\xb3&\xc7gO2sz\x8e\
+\x22\xef[\x9d\x0d\x81N\xb7G\x8c;\xb8mkf\x93\
+/\x228\xc3\x80\x18\x94H\xcak\x06a\xae1\xb2\xf0\
+\xd0>\xe6\x1f\xdag)\x03\x88OX\xa1\x8a\xd4\x1c1\
+/\x0cd]@#\xac\x7f\xdb\xbb\x98\xbc\xf5v\x5ck\
+\x94\xfc\xf4\x0c\xc7?\xf5\xafYz\xfaa\xfb\x9c\x96\x15\
+ \xa5Xa\xd8\xe22O\x8c!\xa5`\x80\xa2\x84z\
+a\xae\xaf\x90\x9c\xb2B\x0a8D\x1cG\x9e?\xca\xe4\
+\xa6u\x8c\x8e\xb4\xc8\xb25x\xe7\xe8v{\xcc/.\
+\xa3y\xe4w\x8f\xe4\xbc\x7f\x1b\xe0-\xe7\x948\x00\xbe\
+n\x8ef\x1e\x01+W\x09\xacbP4\xf1\x8a\x10#\
+\xc4h\x93\xee\x05\xc4\x0b1\x9aaS\xb7\xfe\x22\x13\xef\
+|\x0f\x00\xf3\x0f\xdf\xc3\xf1O}\x84b\xfe<\xceK\
+*\xa5\xb6\xe0.\x13bnU\xc9g\x19\xa1\x1f\xf0\x99\
+\x18\x1bt\x82Z!D{\x05o\x1f\xf7\xb8\xfa\xc8\xca\
+\x0e\xd0(\x9c_\x9agb\xfd\x18\xb5\xccW\xa5\xf0\xc2\
+\x82\xa9\xfc\xc5\xa9\x82\xf7m\xcb \x0e\xd4Y\x88\x8as\
+\x8e\x98\x09\xc4H\x14+\x9d\xb1,U\x80\x88\x12b\x89\
+\xecV\xeb-\x0d\x84\xac\xbd\x96]\xbfr'\xcd\xed\xbb\
+\x09\xcb\x8b\x1c\xff\xa3\xdf\xe2\xec_~\x05I \x18\x83\
+&P\x15\xe3\x03\x95s!\xa4\x08\x8aa@\xa1U\x15\
+\x1cH&|\xe3l\xceMsGtE\x07\xf8\xacF\
+\x96up\x15\xb1\xb1\xcf\xc4\xc2\xd0=\xaa\x95\xc3\xcf_\
+S\x071\x1e\x10\xf28P\x15\x12\xd1\xa0)\x17A\xbc\
+V8a4\xb6\xcc\xcb\x94\xbf\x89m\x8e\x5cq-;\
+n\xff\xf7\xf8\xf6(\x9d\xc3\xcfr\xe4c\xbfDo\xf6\
+\xb8a\x8dj\xd2\x11j\xe4\x22\xc6\xf2\xe3)\xf1\x05I\
+NA\x94\x18\x02.\xd5/\xe7\x04-\x94\x1b\xc6\x1d\x8d\
+\x8d\xd3+\x83`\xa7\xdb\xa5Y\xaf\x1b\x18\x89\x85$\x9a\
+J`\x0a\xd1\xa8\x8asFK\x07\xc4\xd0&\x12z\x05\
+d\x8e\x90\xc8S\xc8S\x8e\x87hF\x84\x08>\x95\xd3\
+\x10q^\x98\xbc\xf5\x97\xd8\xf8#\xef\x05`\xf6\x8b\x9f\
+`\xe6\x8b\x9fH9-\x899B(\x02\xbe\xe6\x08E\
+\xc4\x97\xa2'\xb30\xb7:i\x8b\xe4\xc4\xa25\x15]\
+B?\xe0\xbc\xe3\x89\xf9\xc8-33+\xa7@\x08\x05\
+\xd43Sf\xceU\xab\xee\xcb\xd2d\x5c\x94\xbf\xfdh\
+\xc1g\xaf\xae\x0d\xa8RT#CN\x10-\xc5\x91\xa0\
+\xde\x98YI\x9d\xa5\xcccUZ;/g\xfb\xfb>\
+Bk\x87\x85\xfc\xc1\xdf\xbc\x9d\xc5'\x1fL\xe2JR\
+za\xb8\xe1I\xacO*\xc7\xc5<V$)\x84\xb2\
+5C*\x89V\xce\x04\x9b\xcfrP\xea\x13\x1bVv\
+@)55\xd5dcnF\x9aKg p\xe3:\
+INJ\xb5>\xc9RM\xc0W\x12)I\xe5RD\
+\xd0\x90\x1c%\xb0\xf1o\xde\xca\xe4O\xbe\x0f\xdf\x1ee\
+\xf1\xa9\x878\xf8[\xb7\x13\x16\xe7\xc1\x19\x7f'\xe5\xb8\
+E\xdf`<\xe7\x1c1bN\x1e\xe2-\xceY\x9a9\
+7\x98\x97&G\xc6\xa8\xdc8.\x88\xcbVv@\xab\
+\x99%.\xae\x95./\xd9\x9b\xc9\x03\x8b\x80\x0fl\xb5\
+\x1c\x8b\xd1\xf2?\x16\xc9\xc8\x98\x10\xce\xf8\x12\xb1j]\
+\xa5\xb2\xdf\x1ce\xe7/\x7f\x8c\xd1+\xdf\x00\xc0\xcc\x17\
+>\xce\xcc\x17\xee4G;I\xe3P\xfd\x7f\x18/P\
+\xad\xa2+\x06\xad\xea\xbc\x94\x12M\x8c>;\x97\xa2\xc3\
+\x1b\x85wN\xd8w6\xf2\xd7\x8f\x1f\x5c\x19\x04Uc\
+\x15:N\x84\x22\x8f\xd4ZYI\xea\x8d{G\xe5w\
+\x8fE\xde\xbf\xd5V\xd5\x1c\x95r0\x93\x81ZK\x8e\
+(i\xee\xd8\x1b\xf6\xb2\xe3\xe7\x7f\x0d\xdf\x1e%,/\
+r\xe0\xdf~\x90\xf9\xc7\x1f\xa8\xca[\x89\xf2\xb1P\xcb\
+\xf3\xa4\xf8\x86\x1b#\x9a$\xb9T|=q\x8d\xa0F\
+\x8c\xa2Io\xe7@sE2\x87\x16\xca\xcd\xe3Bc\
+\xd3vY\x95\x16\xa8\x94\x9f\x82\xcf\x5cbt\x16\xe2.\
+\xad\xc47\xce\xc3\xfb\xa6\xd3\x84\xcb\xda\x5c)G\xc5%\
+\xf4\x8c\x85\xe2\xc7\xd6\xb0\xfd\xb6_c\xed\xf5{\x01X\
+|\xeaA\xf6\x7f\xf46bg\x094\xa2Q\xd2\xaa\x1b\
+\xb9)\x91\xdb\xfba\xc3\x93\xb4r6\x07-\x81/7\
+\xac\xb2\x85\x1b\x1a'\x89IR\x84~\xfd\x1c\xbc\xe9\xd8\
+!V\xed\x80\xb2\xe3*\x94+_b\x9d\xa2!\xf2'\
+W@\xecE\xd4\xbb\x81\x1e\x88\xcep\x83\x94\x0e\x0eF\
+\xaf\xba\x9e\x9d\xff\xe2w\xf0\xed1\x00\xe6\xbe\xf2\x19\x8e\
+}\xfa7\xaa\x86\xae\x00\xa1\x17\x8c=J\x15\xe9\xd6#\
+\x88C\xad\xb1\xa4*-\x02\xcd!^\x1c8p\xed\x11\
+bg\xa1B\xfc\x12\x18\xd1\x04\xb8(#\xe2hNo\
+[\x9d\x16H\xfd\x8e\xb2\xd0\x0e\x1a\x1dX5P\x8d\x08\
+\x0e2\xb1n@,\xfb~\xd1&\x88\xe2\xc6\xc6\x98\xfa\
+\xa9\xdb\xd8\xf8\xae\xbfg\xd5ey\x81\xc3\xff\xf1C\x9c\
+\xbf\xff\xcf\x87Zb\x8a\xf3\x0e\x97\xa5Vz\xd4\xe4r\
+5*-)\x7f\xa2\x0e\xa4\xb0M\x04\xe7\xadJ\xd4&\
+\xb6\xb0\xf9=\xef\xe7\xd8\xef}\x18\xc9\xcc{1(\xa2\
+\x92\xe8\xb8\xa5\xcb\x8e&h/\x97U\xa9\xc12u\x8d\
+\xb2*\xb5\xe4\x04A\x08Ir\xfd\xf43\x8e?|\x8d\
+\xf5\xec\xc8\xc4\xa8l\xa1\xf8\x911F\xaf\xbe\x81\xe9\x9f\
+\xbd\x83\xfa\xc6i\xe3\x16\x87\x9e\xe1\xd0\xc7\xee`y\xff\
+3\xf6~/\xb8L\xaa\x8e\x8eq\x02\xd3\xf1.a\x80\
+\x8a\xb1\xc62\x9c\x9d\x17\xe3\x12e\x88\xf7\x8dWlz\
+\xc7\xbb9\xf5\xe5? \xa6\xa6\x8a\x94\xfd\x86*m\xac\
+b<\xb9\x04\xfd\xf9U\x8a!\xeb\x88\x80s\x9e\xf1\xf1\
+\x0d\xd4\xeb\x0d:\x0b\x0btb\x81w5 \xf2\xb6Q\
+\xd3\xe9&N\xac\x0aL\xbd\xf766\xbf\xe7\x03/\x18\
+r\xe1\xf1\xfb\xf1\xa9\x9d\xad5\xb1Nr\xd2\xec1\x0e\
+V4Fsx\x15\xc2b5\x1cWF\x18\xa6\xef\x1d\
+H\xe6Y\xbf\xf7o1\xb2\xe7zf?\xfb\x9f\xcaT\
+OcZ\x9f\xca\x95=/\x11\xde\xb6\x06\xea\xeb&V\
+n\x8b\xef\xda>\xa5\x00\x8dz\x9buk\xd6\xb1\xfd5\
+\xbb\xe8t;\xec\x7f\xf6Y\x96;\x1dB\x11\xf8\xc3\xcb\
+\xa2\x85c4Q#\x22\x04\xc3\xa7\xc4\x14\xcd\x89\xcd]\
+W\xe0G\xc7h^r\x05\xb5\xb1\xb5\x8c^u\x03\xc5\
+\xe2yD\x84\xa5\x03O\xb3\xb4\xffi\xb4\xb3\xc8\xc2\x13\
+\xf7\x13\x8aDn\xd2@\x99+\x9b\xc9\x89\xdd%<\xcb\
+2\xc1\xb5\xc6\xd8\xf8c\xff\x80\x0d7\xff8\xcf\xfe\xc2\
+\xbb\xc9\x17\xe7\xc9\xbcC\xd4\xe6\xe3\x13\x18;/\x15\x93\
+\xfd\xc8\xf1\x8c;\xfe\xda4o\xff\xfc}\xb2\x22\x08z\
+\xd7D\xc4\xf3\xdc\xa1\x83\x1c:v\x88\xb5kF\x10'\
+x\x17\x98\xef,\x01mn\xfdn\xc6gv\xe5\xa9\xf3\
+\x92\xc4JI\x01\x12\x86,\x1fx\x1aq0\xff\xd8\xfd\
+\x83\xf4J\x86\x8c\xbd\xee\x06Z\x97\xbc\x96\xc6\xe4\x16\xa6\
+~\xfa6\xda;\xaf`\xf9\xc03 \xd0\x9b=F\x7f\
+\xf6yC\xf12\x22\x1d\xf8\x915\xb4w\xbe\x96\xd1\xab\
+\xae\xa7s\xf0\x19\x0e~\xf4\x03\x14K\x0b\x88J%\x8c\
+\xca^\x818!\xb5\x08\x11\x07W\xb6\x95\xe6\xd4N\xe0\
+\xbe\x95\xaa\x801\xc1\x99\x933l\xda0N{\xa4I\
+\xcd{@\xe8g\xfd\x8a\xdd\xbdm4\xa6\x1al,M\
+\x8b\xd4\xb9M\x9b\x17eg'\x96\xfd\x82\x92\xd6\xa6\x02\
+3\xffW\xf7\xb1\xf0\xd8\xfd\xa9\xd3k\xf7\x1b\x9b\xb7P\
+\xdf\xb4\x85\xb5\xd7\xbc\xd1\x9eo\xde\x0a(cW\xdd`\
+\xe5\xf3\x89\xfb\x09\x8b\xf3\x1c\xf9\x0fwp\xfa\xee/U\
+\xe1\xe6\xbc\x85\x8b\xf9\xc9\x04\x96\x16\xf6\xba\x81\xa6p\xb2\
+\x0f\xfd3\xb3\xab\x90\xc3\xea9{\xfe\x1c\x13\xeb\xd6\xe0\
+3Wm\x86\xc8P\xe0\xc4\x18\xf9\xb9\x0dj\xfa=!\
+\xb5y<\x0e(\xec\x10\x08U\x9d\xdb04\x96\x0e\x00\
+\xa7tZ\xef\xe41\xfa'\x8f\xb1\xf0\xd8\xb7\xabH*\
+\xd3\xa9\xd4\x16\xae\x04A\xebsT%[Qk\xb4\x8a\
+\xa5\x8c&\xcdP6NO\x16\x1e\xd7l\xaf\xbc1\x22\
+\x08\xedV\x8d\x98DNL\xdbZZ\x95C\xfb\xa2\x8f\
+\x9f\xf4\x96\xfbe\xfb+\x96M\x8f\x8a\x16T:I\xa3\
+\x0cv\x87e\xa8w\x17l\xa5\xc4\x09\x9aG\xb3\xb6\xea\
+\x22%\xe3ci\xa3T\xaf\xe9P*\x91\xb4GE\xa1\
+\xd3N\x12Z\x96g{\xcf\x9b\xdb\x91\xc6\xf8\xba\x95\x1d\
+\xd0\xed\xf7\xc8\xbc\xc7\x89K@\x9c4\xbb\x97\x8a\x82\xc6\
+\x18\xf9\xe6\xb2\xb7\x15/\xbf\x8ch\x8c13\xe9\xaa1\
+\xa2\xa2\x17\xcc\xb4\xd4\x13\x0a\xb6\x0b\x14#\xe2 \xe4\xa1\
+\xa2\xd8\xb6]F%o\xb5\x12i\xe5.\x91\x111K\
+\x1d\x8bB\x1b\xc7\xd2mx\x1b\xad\xa4\xf5O-\xc1\xa3\
+\x1dO\xef\xd4q]\xd1\x01\x9a\xd6>\xaa)\xbc\xca\xe8\
+\x14\xd61Q\xc2\xdf\x9f\xea\x0cz\xfcjmo\x11%\
+\xe6I\x12'\xfe\x1er\xd3\xff$e\x07f\x80$\xa6\
+\x16\x0b[\xd2r[K\xd4\x9a(\xc6\x0b\xca\xbe\xa9\x0e\
+\x9a.e\x94$\xbdQ\x86\x99m\xb7Y\x9bLU+\
+^\x11\x832Q\x83\xbd\x93#\xb0nju) \x09\
+L\xac\xb70\xe0\xe3\x83r4p\xa4\x85\x9f\xadl\x0c\
+Z\xf1\xf4\x18,U|\xea\xcf\x97\x1b$Z\xa4]\xe1\
+\xa0\x10#\xea\x06\xd2W\xcb\xb0M\xcdLMc\xc7\xa0\
+6N\x1c\x08\xab\x0a|\x83\xa6\xaer\xea5&Q\xa5\
+P9\xedc\xa7\xea\x5c9\x0a\xc7\x9e\xfb\x8e\x02S/\
+\xe9\x80f\xc3\x0f\xb4<\xae\xd2\xf8N\xc4z~\x89\x16\
+\xff\xa3\x13\xad*\x05D\x06\x92\xb7\xe8\x87j+[\xa3\
+\x12\x8a`'D\xc2\x90\xb8I=\x05M,\x8d\xa0\xc6\
+\xe0\xb4\xdcf\xb7\x15\xf7$y\xad\xa4q\x0c\x80]\xd5\
+\x19\xd6\xa1\xcd\x8c\xb4\xdfX\x02p\x8a\xdc\xc3\x1d\xb8\xae\
+\xa5L\xbei/O>}$\x00\xf5\x15\x98\xa0\x19\xe4\
+\x92\xc2\x0aQ\xc92k.T\xa8\x1b\xe1\xad\xadb \
+IK-\x1e1#e \xe1\xc5\x99dvi\xb5|\
+b|\x95\x9e\x0fCt,A\x06\xd1v\xa3\x11[y\
+\xc5\x1a\x9b\x86!\xd6\x09.\xc7)\xa9\xaeu\xa2\x06\xf2\
+[\x10\xee]\xf6<\xd2\xaf\xf1\xabo\xd9\xce3\x8f<\
+M\x1e\xf3\x82A\xb3\xfc{8\xc0\x0dmSI2\xe8\
+\x82\xc3<\x96\x1a?;\x9eW\xdb`\xa8\xa2\x85mT\
+\x0c\xab<\x0d\xe5\xd6\xd5\xd0!\x88D\x96|\xcaO\xf1\
+\x83\xd5\xb2\x94\x8a\x83-\xb80Tz\x83\x8d\xe3\xb3\x81\
+\x03\xa5\x94\xc6\xe9}*6\xe7G\xba\x19G\xfa\x8eM\
+u\xc7?\xdf{%gd-\x8f=\xfe\x04\xf5\xcc\x05\
+\xe0\xd8\xcarX\xa8\x0e6iT\xf0\x9a\x0c7P|\
+\xa4\xe7\xf9\xf3\xe5\x8c\x00\xdc\xd0(\xf8v/\xe3\xf2Z\
+\xe4h!,\xab\xf0\x96f\xc17;\x197\xb6s\xbe\
+\xd1\xa9\xd1\x12e\x9b\x8f|'\xf7\xdc\xd8\xca\xb9\xa7S\
+cw-pZ\x1d\xa7\x0b\xe1\x8d\xcd\x82ow3\xae\
+i\x04\x9e\xcd\x9d\x8d\xd1(\xf8f7\xe3\x86z\xc1\x03\
+\xfd\x8c\xb6S\xb6\xba\xc8s\x85\xe7\xa6v\xc1\xbeN\xc6\
+\xe5Y\xe0Tt\x9c\x8e\xc2\x1b\xd3<\xaek)]\x9f\
+q\xd3\xeb\xb6\xb2cj3\xcf>\xfd<G\xf6?\xca\
+\xc2-?\xc9\xe6\xbb?\xa7\xab\xd3\x02\x0a>\xf3\xb4\x9a\
+u\xea\xf5\x1a\xa3\xa3k\xa9\xb7\xc7(\x82\x90\x179?\
+\xe1g8\xbc\x1cx\xef\xb5\xbbil\xdaJw\xee(\
+\x8dM\xdb\xc8\xcf\x9e\xc4\x8f\x8d#>\xa3;{\x84\xe6\
+\xe6mtg\x8e\xd2\x98\xdcF,r\xc2\xc2<\xd9\xf8\
+\x06:\xc7\x0e\xd2\xda\xb2\x93\xfc\xdci\x5c\xb3I\xd6\x1a\
+\xa5;{\x94\xc6\xa6-\xf4N\xcfR_\xb3\x1eWo\
+\xd0\x9d9Bc\xf3V\xfas\xc7hl\xde\x8a\xe69\
+qy\x81l\xedz\xba\xc7\x0f\xd1\x9c\xbe\x84\xe2\xfc\x19\
+\x5c\xb3\x85o\xb6\xe9\x9f<Ac\xe3\x14s\x07\x0er\
+f\xb9`\xf6\xd9\x83\x9c\xef\xf4\xd8\x7f\xf9\xb5l\xbd\xf6\
+z&\xbe\xf8\xf1\x85\x7f\xfa\xd4\xec\x9aU\xf5\x03\x00\xea\
+\xcd6\xeb&\xa68w\xee<\xc7O\x1e\xad\xc0%\xef\
+\xcd1\x0d\xec\xfb\xea\xc9\xaaQr\xf1\x10v\xdd7\xf4\
+W/\xba\xff\xc0\xcb<\xc3'/r\xff\x81\x17\xdd\xd9\
+.\xafS[_\xc3\xe9k\xaeD\xb2:\xedv\x8b\x86\
+\x93\x95{\x821\xa9\xaf\xf1u\x1bh\x8e\xac\xe5\xf0\xe1\
+\xc3\xd5\xbd\xd1\xd1Q\xa6\x1b5\x96\xd7o\xb7\xa33\x22\
+\x88\xb8\xd4\xfb\x93\xaa\x14\x91hk\xa5~\xcaM\x8b\x12\
+Ct\x95\x07\x14/\x86\x1f\x86\x0eL1T\x0aSK\
+\xbe\xc8\x0b\xf2<\xa736Nwb3Ro2\xe2\
+<!\xcfi4[\x178\xe7%\xda\xe2B\xbb=\x8a\
+\xab\xb7\x98\x9d\xb5\x8d\x84\xf5\xeb7p\xe5\x95{X;\
+\xbe\x96ZV\xa3\xeb\x8d\x06{\xef\xad\xa3\xe3l?\xd1\
+\xb9\xe4\x10'\xc6$\x9dT\x8d\x94\x01\xb6H\x05x\xab\
+\xbb\x06\xddh\xad6\x5c\x13\xf3\x0cj\x84-FB\x88\
+\xe4y\x1f\x8d\x91Z\x8c\xb4\xbcG\xc4\x11b`yq\
+\xc9\xe6\xc8*\x1c \x22\xac\xdf4\xcd\xcc\xcc\x09\x00.\
+\xbbl7\xbbw\xeff||\x9cV\xbbM\xa3^\xc7\
+y\x8f\xcf<\xdey\xbc\xcf\xf0\xde\x0d\x1c\xe2\x04q\xde\
+\x22\xc4\xb9\x8a<\x0dG\xc90\xea\xaftJT\x87s\
+L\x07\xdblQ#1\x9d-\x8a1\xd0\xef\xf5\xc9\xfb\
+}z\xfd\xdc\xa2!\x14\x84\x22\xb0\xbc\xb4d}\x8ar\
+\x1fa%\x07\xac[\xbf\x89\x93'\xe7\x0c\x10w\xed\xe2\
+\x92\x9d;\x19\x1d\x1d\xa5\xdd\x1e\xa1\xd9jQ\xaf\xd5\xc8\
+j\x19\xce93>\xf3x\x97\xe1\xbd\x19,\xe2\xf0\xce\
+\x99\xf1\xce\xd2\xc0\xb6\xab\x86\xf6\xef.H\x89\x95\xf3\xa0\
+tB\xb9\xdbS\x86|\x0c\x91\x10#1\x14\xb4\x1aM\
+BT\x96\x96\x97\x08yA\xaf\xd7\xa3\x13:\x888b\
+\x22P\xabr\x00>#\x84eZ\xad6;v\xecd\
+\xcd\x9a5\x8c\x8c\x8c\xd2l6\xa9\xd5jdYF\x96\
+exo\xab\xef\xbcK\x0e(\x8d\xbe\xd0\x01\x22\xaer\
+\x00:\xc0\x86\x97\x95\x05U\x00\xe8\xd0\xb9\xc0Ht\x11\
+\x17#\xd19\x8a\x22 .R\xcbj\x88B\x11\x8a\xea\
+\x10e\x96e,\x9f\x9eel5\x18\xd0\xedv\x01\x98\
+\x9e\x9ef\xed\xda\xb5\xb4GF\xa8\xd7\xeb\xd5n\xf1\xc5\
+\x0f\xe7\x5cu\xaf|\xee\x9c\x1b\x80by\x92s\xf8\xf9\
+\xcbt\x80^\x5cjR\x14\xb9\xf24Z\xd9\x96\x8b\x11\
+\xef\x1d!Xc\xc6g\xbeR\x99'\xef\xbf\x97\xed\xed\
+\x96[\xd1\x01\xfd~\x1f\x80={\xf6\xd8\xca7\x1a\xf8\
+,\xc3U\xf9\xed\x12\xf2'c\x13\xf89\xef\xf0\x09\x1c\
+\xcbH(\x81\xb0\x12R\xc3\xce\xe0\xe5;\xa0<\x19\x12\
+\xc5\xf6 \x22\xc1\x0a\x82\xf7\xb6\xa9\x8b5rQ\xb3!\
+\x18}\x04U\xb2c\x07\xa9\xado\xbdt[|\xfb\xf6\
+\xed\xbb\x06]\x1fh4\xec\xa0\xb4O`f\xe1\xec.\
+Xi\xe7\x86\x1d\xe1.\x8a\x02\xcc\x09U\xb9\xa4\x8a\x02\
+U]\xf9\x98\xfcP\x15\x18l\x8c\x80\xd3\x88:\x85R\
+G\xa8\x92e5z\xbd\xfe\xe0\xbc@R\x8f\x22\x8ev\
+\xdd\xd3\xd0>\x8d\xb1\x8d/-\x87\x8f\x1c9r\xa0|\
+\xbe\x7f\xffw\xab\xd0~\xc5?F\xb8 \xec\xbf\xf7\xbd\
+\x17{\xbc\xdc\xf1\x00\xb2\xcc\x9br\x0c\xe9\xccP*}\
+\xdd\xff\xf1\xa7\xacm\xd6X\xec\xf4\xcf\xaf\x98\x02Y\x96\
+Q\x14\x0533'\xc8\x8b\x9cV\xab\x89\xcf<Y\xe6\
+\xd3_\x97\x9eg\x16\x1dU%pC\xbc`\xa8\x0c\x96\
+\xf80\x9c\x02\x17\xac\xf0\xea\xf3\xbf:,\xad\xce\xca\xa0\
+\x8b\x84 \xa95\x17\x12\x0e\x84\xc4E\x0c\xf9\xf3\xc7\xbe\
+\xcdD\xf7<\xeb\xb7Mr\xe2\xd0\xec}+:`\xeb\
+\xd6\xadz\xe8\xd0!\x99\x9f?\xcf]w\xdd\xc5-\xb7\
+\xdc\xc2\xc4\x86\x09\x03\x950(=\xbe((|\x86\xcf\
+\x0a|nU\xc0p\xe2{W\x81\x01\x09ze \xf8\
+\x82*\x90\xe6\x12\x8a\xc2N\x87\x89KL\xd6T\xe5\xd2\
+\xb7\xee\xa6\xfd\xd4\x83l\x9a\x18g\xf1\xec<\xfdN\xf7\
+\x8f_P\xf4.~a\xef\xde\x9b\xf7\x1c>|h\x8f\
+\xaaR\xaf\xd7y\xf8\xe1\x87x\xfe\xe8Q\x9c\x13j\xb5\
+:\xa3##\x15\xfb\xbb0\xffK\x80\x94!\x9a|Q\
+\x15x\x85\x0exq\xb11\xd4\xfb\x8b1\x9dD\xb7\xb3\
+\xc4\xe7\x9e}\x92\x99?\xbe\x93\xd1\xb9#Lm^O\
+\xad\x9eq\xec\xe0\xec\xd1_9:\xffs\xab\xfa\xc1\xc4\
+\xe5\x97_\xfe\x84\xaa\xee1\xfe?FV\xabq\xf8\xd0\
+!:\x9de\xae\x9d\xde\x18\xdf\xbam\xb3\x93!#d\
+x\xd7\x83\x8b^{\xe1\xadW})\xc3\xed\xf0\xc1\xf7\
+iw\x99x\xe2\x08-\xefX\xb7v\x84\x89\x8d\x1bX\
+<s\x8e\xa3\x87\xe7@x\xe7\xaf\x1e\x9d\xff\x9f\xab\xfe\
+\xc9\xcc\xa5\x97^\xba\xdf9\xb7\xcb\xaa\x8cg\xfd\x86\x09\
+2\xef\x19Y>\xa7?<V|?\xedy\x15 ;\
+\xe8c:\xb1\xfec\xc3;j\xde\x13:\x1d\x9e?4\
+K\xe8\xe5\x04\xe5\x9f\xfc\xabc\xf3\x9fxY\xbf\x19\x9a\
+\x9c\x9c\xdc822r\xa7\xf7\xfe'\x86_\xdf\xd2j\
+,_7w\xb0\xfd\xff\xdaO\xdfRb\xe1\x052\x01\
+/B&\x1c[\xc8\xf5\x8e\xdf\x98Y\xf8\xcc+\xfe\xd9\
+\xdc\xc4\xc4\xc4\xeb\xc7\xc6\xc6\xfea\xadV{\x87\x88\xac\
+\xdb\x19z\xcd7w\xcel\xf8\xde=\x80\xff{\xd1 \
+@\xa1\xba?\xc0\xf3KE\xf8\xda\xbdg\x8b\xbb\x1e\xec\
+\xf7\xbf\xf3\xaa\x7f7\x08l\x06\xda\xc0Hz\xb4\x81\x16\
+\xd0\x00j\x09L\xdd\xd0x\xff'S\xa4\xdc\x0c\x88\x18\
+\x15*\x80>\xd0M\x8f\x0e\xb0\x9c\xfev\x80\xd9\x97\x1a\
+,[\xe5\x97\xce\x02[\x81^2\xb6\xdc\xdd+\xd2\x18\
+~\x88T\xc9\xabp\xf4\xcbq@\x18r@~\x91\x13\
+z\xe9\xff\xb3+\x0d\x96\xbd\x8c/\xee\x0f\x19\x1e\xd2\xff\
+\x87W\xdf\xbd\x02ce\x95\x06_\xfc\xbc\x8c\x80\x98\x1c\
+0\xec\x84\xf2q\xfc\xfb5\x81\x8b\xaf\xa9\xb4\xb9\x90\xa5\
+\xc7+5\xfe\xfb\x99\x06a\xc8\x11\x050\xb7\xda\x81\xfe\
+7\xd4F\xf1\xfe\xf7\xc6;\xe5\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x0e\x89\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\xaaeXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x01,\x00\x00\x00\x01\x00\x00\x01,\x00\x00\x00\x01\x00\
+\x04\x92\x86\x00\x07\x00\x00\x00\x19\x00\x00\x00\x90\xa0\x01\x00\
+\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x00\
+@\x00\x00\x00\x00ASCII\x00\x00\x00Cre\
+ated with GIMP\x00N\
+\xaf`\xa3\x00\x00\x00\x09pHYs\x00\x00.#\x00\
+\x00.#\x01x\xa5?v\x00\x00\x02=iTXt\
+XML:com.adobe.xm\
+p\x00\x00\x00\x00\x00<x:xmpmeta\
+ xmlns:x=\x22adobe:\
+ns:meta/\x22 x:xmpt\
+k=\x22XMP Core 6.0.\
+0\x22>\x0a   <rdf:RDF \
+xmlns:rdf=\x22http:\
+//www.w3.org/199\
+9/02/22-rdf-synt\
+ax-ns#\x22>\x0a      <\
+rdf:Description \
+rdf:about=\x22\x22\x0a   \
+         xmlns:t\
+iff=\x22http://ns.a\
+dobe.com/tiff/1.\
+0/\x22\x0a            \
+xmlns:exif=\x22http\
+://ns.adobe.com/\
+exif/1.0/\x22>\x0a    \
+     <tiff:Orien\
+tation>1</tiff:O\
+rientation>\x0a    \
+     <exif:UserC\
+omment>\x0a        \
+    <rdf:Alt>\x0a  \
+             <rd\
+f:li xml:lang=\x22x\
+-default\x22>Create\
+d with GIMP</rdf\
+:li>\x0a           \
+ </rdf:Alt>\x0a    \
+     </exif:User\
+Comment>\x0a      <\
+/rdf:Description\
+>\x0a   </rdf:RDF>\x0a\
+</x:xmpmeta>\x0a\x85\xe7f\
+M\x00\x00\x0b/IDATx\x01\xedZ{pT\
+\xd5\x19\xff\xdd\xd7\xee\xddlv\x93\x90\x17IQL\x08\
+\x11\x05\x05\xb5\xbc\x84\xf2\x10\x91\xd1JK\xc7\xb1t\xc6\
+\xb6\xb6\x1d\xa7\xa6\xd6\xd6\xd6\x19;u:\xa3\xd1\xd1Q\
+g\xb0\x8e\xb6Vi\xc5b\x9d\xda2\x1d+\x96\x22V\
+\x89\x80\x0f|!\xa8\x88T\x09B\x08D\x12\x93\xcdf\
+\xdf\xbb\xf7\xd5\xef\x9c\xcb.y\xb1\xee\xdee\xf4\x8f\xde\
+Cv\xf7\xdes\xbf\xef\x9c\xf3\xfd\xce\xf7\xbc\x07\xc0m\
+.\x02.\x02.\x02.\x02.\x02.\x02.\x02.\x02\
+.\x02.\x02\xff\x8f\x08\x08%\x08]\x0ao\x09\xd3\x8e\
+`\xb5F\xdc\xb97\xc5#\xe0|\x17-\x08\xedw\xd0\
+\xa7\x1d\xe6\xe8i\xa9O\x1c\xdd\x97\xbdo\xbf\x1d\xc4\x09\
+\xab}\xdb\x12\xb9}\xe9v=\x1f-\xe3\xc9\xd2g\xf9\
+y\xdf\x89\xf1\xc7\x9b{8]!\xd7\xce\x00 \x11V\
+\xaf[\xd0A?S\xc1\xe5\x17\xcai \x06\x04\x1b/\
+F\x22f\xe8\xeaTc\x0b\xf4H\xb1`\x85H\x7fk\
+\x89(\x99g\xa1L\xc5e\xfa\x04\x18\x0d\xdd\x88\x84l\
+\xd2\x12\x90\x86iE%M\x5c\xfc\xd4\x0d\xaf\x0erH\
+\x09TFSlc\x83\x17\xd3\x98P\xd9\x89\xa6\xa8\x01\
+yR*\xa2\x1d\xa1\xfd\xde&X\x82\xc7\x84e\x10\xc1\
+\x22Y\x95*M\x83\xe0\x19\x05\x81eY\x90=\x12\x12\
+a\xed>\xb1\xa6\xec\x1ei(y\xafR.\xb7\xe9)\
+\x03\x828\x92\x98H\xb9\xb4Z\xda\xd4i\x9c\x17!X\
+\x06\xe1\xabQ\x7f\xab\xc7'O\xcf$\xf4\x8c%\xc9R\
+1\x8b\x1f\x8f\xb6X\x00\xb2\xc23\x1c\xe2l\xc0\x81\x1e\
+\xe3W\x1d\xb7\xbf\xb1!;\xf8\xeau\x0b\xbf/J\xc2\
+\x13z\xdaHS\x9f\x92\xed\x07\x97H0Sq]~\
+\xbb#\xfe\xe4\x91\xa7w\x0e]\xfd\xc8\xfc\xbb\xac\x84\xde\
+F\x90\x1a\xd0\xcda:\xc3\xc1\xd0%U\xf2\xa4b\xe6\
+\x7f\xfe\xf5\xcb\xd7\xaf\xcc\x8e\xb3r\xedEeH\xa8\x11\
+\xd2\xaf\x94.\xa5\xc7\x98_\x96\xae\xd0\xdfb\x01\x18>\
+\xael\xea&\x02\x13\xc4;\xbf\xf1\xc0\xfcy\xa2\x04\x99\
+4 m\x99\xd62=C;\xca\x85\x17D\x1b1\xfa\
+f\xea@ (\xa4\x013\x17\xf8\xd6N\x9b5\xe76\
+A\x11o\x90\x14\x11F\x9a\x14G\x10F\xfb\x0dE\xcf\
+\x98P\xbc\xc2%+\x7f;o\xbd\xa4\x08a\xd3\xb4\x0c\
+\x8f)5\x89^Ab\x1a\xe6S\x98\xc2\x95\xd6\x9c\x03\
+`\x09\xa2\xa1\xd1\x22\x02b\xab\xec\x95Z\x99z\x8b\x82\
+\x04AW`j\xb4RA\x13\x0dK\xe7\xae@\x12\xbc\
+\xfc\x99aQ\x9f\x96\xb1\x025\xca\x82`\xad\xd0\xc1x\
+\x8c\x8c\xc9le\xb4\xf0L*\x81\xc0\xb4\x14U\xf4\x95\
+U*\xd7r1I\x5c&8\xf10,K\x16\x9e\x8d\
+\xe9\x1c\x00r:lS\x8d\x8c\xa5\xa75\x1d\x1e\xc9\x87\
+\x94\x91\xc0\x91\xd46Q',\xea<g! 7\x22\
+c%1\x90~\x15C:\xd0\xe0\x99\x8c\x1a\xefTA\
+\xcfdL\x03$\x89-C>;\xe6 d\xe2:W\
+)\xe6}\xe8\x0fdb\xf2i\x91\xbe$\x00\xf8\x0e\xb0\
+\xcd\x13DE\xf4\x8a\x87\xe2[qF\xd9\x02\xdc8\xf3\
+1\xcc\x984\x0b\xb5\xc1z(\xb2\x87v\xcaD,\x15\
+\xc5\xe1\xcf>\xc1k\x07\xb7bS\xf7\x1aLRg\x89\
+~\xb9\x1a\x193\xc95\x84\xedD\x9e\xc6|\x83\xbdQ\
+$5\xfd1\x0cN[s\xae\x01\xb4\x0eA`\xec&\
+\x0e%:\xf0\xe3\xf3\x1e\xc5\xd7/\xbc\x0a\xd5\x81\x9a1\
+\x8b\xab\xc3D4O\x9c\x8a\xc5\xd3/\xc5\xca\xae\xd5x\
+\xf4\xb5{p0\xda\x81\x06u6\xd2f\x9c\x84\x1a\xcf\
+\x02\xb2r\xb2\xbd>yM\xe1\x93\x81\x90\xeb\x193Y\
+\x91\x1d\x8e\x01\xb0\xcdV@(\xb3\x0f\x0f\xac\xd8\x89\xd9\
+-\xf3sS\xf7G\xfap\xb4\xff\x08\xa2\xa9\x08\x14I\
+\xe1\xdapF\xeddxd/f5}\x15k\x1a\xd6\
+\xe3\xf7/\xde\x87\x17\xba\xefF\x93\xffJhf\x8ax\
+\x99X\x054\x81\xec\x8b\xb2\x01\xcdJ#\x0a\xad\x00\x86\
+\xfc$\x8e\x01P\xc42t\xc6_\xc0\xfdKw\xe4\x84\
+\x0f\xc7\x07\xf1\xec\xae\x0d\xd8t`\x1d\x0e'wq+\
+g\xd3\x07i\x96\xb95\xd7a\xf5\x85\xd7\xe1\xa2\x96\xb9\
+(W\x03\xf8\xc5\x8a\xdf``c/\xfer\xf414\
+{@\xbe\xc2\x86 \xbb\xd7\xd9e\x8f\xdemv\xcf|\
+\x7f\xa3r\x16\x9a\xe4Et\xf7V\x96\xd4\xd1o\x81\xb0\
+\x8f\x1c\x9b\xbc\xb70\xffw\xc2\x81\xb6\x0b\x1e\x99r\xed\
+\xc26\x16\x8b\xc5\x9e\xd0Q\xb4o\xbe\x11{\xc2\xcfb\
+j\xd9\x22\xc8\xa27\xc7d\x91\x99D\xb4\xe3\xd8\x97\xd8\
+\x875\x17\xff\x1d\xab\xe6\xac\xe6\xcf\xfa#\x9f\xe1\xe3\x9e\
+\xfd\xa4\x19\xccW\x8c\x16=\xc7>\xe2\x82\xe8,\xd5\xa3\
+\x0a\xafw\xee\x88\xb6-\xbf\xb9\x89\x1e\x0ep\xab\xf8\x82\
+2\xc1\xdcb\x1a\xd4Y\xf8\xe6E\xdf\xe6\xf7\x91D\x18\
+w>\xf7st\xc7\xf7`F\xe0r$\x8d(9\xb8\
+D\x8e\x96]\x94\xcb\xb5\xf8Z\xe5\x15h{\xf5;\x08\
+\xa8A,;\xffr\xd4\x04k\xf9g\x04a\x817\xa1\
+X\xa8@\xca\xfcd\xe3y\x9f\xfc\x1c\xf4\x94<?V\
+\xb5\xb6\xa1\xd27\x81\xd3n}\x7f\x0b\xde\x0e=\x83\x89\
+\xeat$\x8c0\xf5\x8d\xddM\xca\x01\xc8\xe1EqI\
+\xe5b<\xfc\xe6\xad\x18\x88\xf6s^\x83\x02\x22\x8b\x14\
+\xcc\xb9\x0d\xffgR_\xf63\xba\x9f1\xeaF\x86\xf3\
+\x97\xfa\xe5\xd8\x07\xcc\x9a<\x9b\xcf\xcdB\xdc\xd6\xce\x7f\
+\xa2\xc9\x97\xcf\xa3\xdb\xcb4(\x9d\xf7Ie\xd8\x1f{\
+\x0f{\xbb\xf6`\xc9\x8c\xe50L\x1dO\xbe\xf68\x06\
+\xe2}\xe40mS\xa04\x0a?Zt#*\xfcU\
+\x18\x22\xedz\xe2\x95?\x9c0\x11\xdbbeYFW\
+\xe8\x00p+\x8d{Oi\x108\x06\xa0:P\xcbg\
+\x1e\x8a\x87q8\xfe\x16\xaa\x94frz\x94\xed\xe4i\
+,\xa03\x1a?\xe9]w\xe80\xa7d\x91\xe1x\xe4\
+\x18\xfe\xd8y7\xce\xf15\x933\x1c M\x19\xc2\xf7\
+.\xbe\x9e?\xd7\xf4\x0c6\x1f\xba\x9fJ\x858$\xa1\
+\x9c\xbc\x09y~!\x85r\xf1l\xfct\xda\xb7\xf00\
+\x9e\xc93\xe3\xe7?r\x0c\x80\x22\xdbu\x8ea\xe8d\
+\xef\xc7H\xb4)4\xdbX\xd5\x1f\xbd\x04\xa6\xce\x1e\x02\
+ \x92\x1e\xcc=\xaa\xf2U\xa3E\xadA\x9dz6\x0f\
+o:\x85Eff\xac\xb1p[\xaf^@\x9abR\
+:-\x127\xfdR\x18\xd4\x0d\x0d=8\x96\x1b\xc3\xe9\
+\x85c\x00R\x19\x16\xbb\xa9\xe2!\x0f\xee\x97ZiY\
+&\x81\xc0\x5cq~\x10DJzR\x147j\xfc\x13\
+sk\x8e\xa5#\xc4\x95>!<\xfd\x12\x00'G\xb1\
+\xe8\x9e\xca\x7f\x0e\x80D\xfd\xf6<T&\xd8/\x09r\
+\xa38\xbbp\xe4\x04\xd9T\xbd\xe1\x1e>\xe3\x84@5\
+Z+.FB\x1f\xa4\xdd\xca\x97\xd63\xfd`\x05\x93\
+\x8c8\x010\xb9\xba\x99\xf3\xc7S1\x1c\x0c\xef\xa3\xba\
+\xa1\x85\x9c\x1e3\xa1\xb1\x91yl\xcfxT|\xb8\xa2\
+\xbf\x1c\x03\xf0\xc6'\xaf\xf0\xc9\xbc\x8a\x8a+\xce\xbd\x1a\
+\x1f'\xdf\x87*\xf9\xb9\x90\xe3\xad\x82\x09\xafPU\x18\
+\xd5\xfa0\xafj\x15f\x9c9\x93\x93\x1d\x1b\xe8\xc6{\
+\x83\xff\x80_\x9e\xc0\xbd~!f4\xde\xf8N\xfb\x1c\
+\x01\xc0\x92\x96\x0d\x07~\x9dsd\x0b\xcf\xbd\x04?l\
+\xb9\x0d{#\xcf\x91 U\xe4\xac\x14n\x0e\xf6>1\
+\xc3\x10\x09\x1c\xe6\xc0L\x1cH\xee\xc6\xcf\x16\xb5\xa3\xdc\
+\xc7\xdfra\xeb\x87\x9b\xb9O\xf8<\xd3q*\xe0\xe7\
+\xf19\x02\x80\x0d\xea\x93\x82x\xea\xcd\xc7xxb\xf9\
+\xfe\x0d\xcbn\xc1\xea\xe6v\xbc<\xb8\x19a\xad\x9b(\
+\xa8\x84# \xa8r\xe56\xdd\x19{\x01\xfd\xe9\xddX\
+w\xf9N\xcc\x98l\xef\xfe\xde\xaew\xf1\xd7\x8fn\xc1\
+$\xdf2\xf2\xf2\xe9q\x94\xff\xd4\xcb?\xe9#NM\
+S\xc8\x13G\x00\xb0=mT\xe7\xe1\xdfG\xee\xc6\xd3\
+o>\xc5\xe7\xf1\xab\xe5\xb8i\xc5\xadX\x7f\xd9K\x98\
+[\xbf\x8a\x1cZ\x02\xc7\xd3\xafS\xb1t\x005\xbeI\
+\xb8\xfe\xbc\xb5x\xfc\xea\x0f0{\xaa]4}:x\
+\x0c\xf7\xbdt3\x8d3\x87B\xa3]\xd4\x8c+\x14u\
+\x8e\xd7o\xfb\x05[\x8b\x0a\x11\xf4T4\x8e\xa3@\xda\
+\x88a\x8a\xff2\xac\xd9\xf5]\xb0Px\xd5\xbckx\
+DXx\xeeR\xcc\x9f\xb6\x08!\xca\xf4\xa2I\xaa\x06\
+)JT\x95O\xe0\x05Pv\x11\x87z;q\xd7\xf3\
+7!\x92\xe9EP\xa9\xe7\xde\x9f\x81:\xbce\xefX\
+8\xb4\xcbez':\xac\xb1(\x00\xaa\x07Km\x8e\
+\x01`*\xae\xd1\x0b\x8dV\xff\xa5xp\xcf\x0f\xb0\xaf\
+w7\xae\x99{=Z\x1aZ!\x892j+\xea\xf9\
+g\xf8\x02\x87\xa8Z\xdc\xf1a\x07\x1e~\xe7'\x14:\
+'\x9dZx\x16\xefO\x14G\x1a\xc5{\xddJ\x91)\
+yI\x13\xec\xf4X\xa2\xe7^J\xa0\x10\xad\x1f>\xbc\
+\xa3\xeb\x12\x00\xb0\xe7cEO\x0b\x81\xb0\xabo\x13\xb6\
+m|\x08K\x1bn\xc2\xcc\xc69h\xac:\x83\xef:\
+KXB\xb1~t\xf6\xfd\x17;\x8fn\xc1\x87\xd1\x17\
+1\xd5\xbf\x983\xb3\x9a~\xf4\xce3`Y\x22$I\
+\xf6\xd2\xd6\xbd\xfc\x10\x07 \xe8\xadC\xc6\xa0\xfc@0\
+x4\xe9\xebN\xc1S\xf9%&B'\xe1\xa6S\x0a\
+\x02\xa1\x8a\xde\xf7U\x0b\xcdx\x87\x80x\xfe\xd8\x83\xb4\
+hJ\x92H\x8fY\xad\xcc\xae+(E\xa8\xf3\xce\xc5\
+9\xe5\x97\xf2Wa\x8c\x7f\xac\xf0\xac\x97e|2d\
+\x02`\xe3[\x1b\xb0\xfe\x93{1\xb7b\x19e\x8e!\
+2'\x19T:`\xff{\xfd\xf0\x96YX\xbc\xbc\x92\
+1\x94\xd4J\xd6\x00\xe6\xa2\x98 \xcc\x91\xb1O\xa5\xe7\
+LT{\x9biQ\xcc\x8a\x99\x9d\xb2\xc62D\xf6\xea\
+_\xcb\x09o\xf7\x8f\xfcf\x1c\x19\xda\xfdZ\xb5\x09\x1d\
+{\xb7`\xed\xee\x9b1;\xb8\x14\x1a\xed\xbc,S\x06\
+\x99\xd0p\xf0\x834\xc2\x83\x16.\x5c\xe8\x03\x95\x10%\
+\xb7\xd3\x00\xc0\xc85d\x81\x18\xd9[\xd8\x1d\xcb\x05d\
+Q\xe5*\xff\xe7w\xef@\x85\xdc\x0cS\xd0\xe8-0\
+\x10\xee\xd3\xd0\xf5\x11\x99S\xc8\xc4\xb4\xf3=P\xfd\x02\
+zz\xbeT'X\x98P\xc5P\xb1\xf7\x02eJ\x10\
+i=\x09\xbfRK\xa9\xb5\x85T\xd2@o\x97\x86O\
+\xbbuht\x0e\xd1\xd0H\xc5\xd1\x99t\xf6\xc0l\xab\
+\xf4(X\xf4\xb9\xc0p\xbd>!\x1b\xeb*\xa5\x91y\
+\x90\xe0\xac\xf9=A2\x14\xf2\xfa\x02\x15D\x09z\xe1\
+\xda\xa7\xa3\xf7\xa8\x8ex\x8c\x0a \x9a\xa6\xb6^B\xd3\
+t:d\xa1S\x01\x83\x1c\xcbi\x90\xbfh\x00\xb2F\
+m;kv\xb6A>\x8e4\xb7\xe0\x84*;\x80\x8d\
+$\xdd\x91W\x97\x15\x85v\xde\x8fD2\x85\xc1P\x82\
+\xd4\xddB_\x0f\x09\x9e\xa0\x81I\xfd+\x82\x22\x1a'\
+\xcb\xa8\xfe\x8a\xc2\x0eL-\x12\x9e\x1d\x8c\xe8\xa5\x1b@\
+\xf1'C\xf6\xba\x99\xd8@\xb5\x1aT\xa0\xa7M\x0f\x85\
+\xe5\xa2\x1b\x8b\xf3\xb2H5\x83\xa1 \x13\x17\xd0\xd5\x1d\
+\xc5\xf1\xe3I$c4\x05\xfd\xf9+eRu\x11\x95\
+\xb5\x12}d\xd0\x11\x19?\x16c\xe9\x01\x9d\x0c\x11\x8f\
+^%\x1b^\x073\x8f\x5cj\xb1N\xd0\xde@\xe6\xd4\
+\xffd]\x97\x08g*I5u:\xc3c\xc0\x14\xd1\
+$\xca\x1eSh\x08N\xc4\xc0a\x03\x7f\xdb\xb9\x9f\xdc\
+\xbf\x88\xa6\x1az\xb7\x10\xa4\xf3F\x15\xa8\xacSPU\
+'A\xf5I\xd02:\x92\xec\x1d(i\x03\x1d\xa3[\
+\x82e\x91\x1e\x08\x99X2\x10\xe1\x93\xb2\xf5\xb8\xcd\x19\
+\x02E\xee\xdc\xc9I\x96\xb4/\x91\x97,\x06\xb6\x9f\xec\
+*\xfaj\x09ql\xdf\x91\x87\x8d\xc6\xcf\xd7\xb6\xd3\x7f\
+\xb1\xc9\xf7\xdc}\xe6\x22\xe0\x22\xe0\x22\xe0\x22\xe0\x22\xe0\
+\x22\xe0\x22\xe0\x22\xe0\x22\xe0\x22\xe0\x22\xe0\x22\xe0\x220\
+>\x02\xff\x03)\x00b%\xc1\xf24\xbc\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x17\x19\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x14\xc9IDATx\
+\x01\xe5\x9bylWWv\xc7\x8f\xf7}\xc5\x18\x83I\
+l\x08k\xd8\x17\x19\x0a\x03\x85\x04F\x8a&\x9d\xb4i\
+\xca?\xd1d\x9a\x8e\xd4\xa6jiUi\xa6\x8d\xa2\x91\
+f\xda\xf9\xa3\x93\x81.\x9a6U3\x9aL+Ei\
+\xa3\xc9\xcc(\x09T\x89(\x01\xc2\x96\xa8a\x09[\x08\
+;\x18\x0c\xde\x8d1\xf6\xcf\xbb\xfb\xfd\x5cs\xcc\xf3\x0f\
+\xff\xc0\x10\x98F\xeaE\xc7\xe7\xbe\xfb\xee=\xf7|\xcf\
+9\xf7\xdc\xfb\xde\xfba\xf6\xff\xbc$\xfd:\xf0\x0f\x0c\
+\x0c$\x9d>}:=%%\xa50--\xadB\xd7\
+e\xfd\xfd\xfd\xa9\xba\xce\xd6\xfc\x03\xa2XrrrO\
+RRR\x8d\xda/\x94\x97\x97\xb7\xa9\x8dk\xee=\xd0\
+\xf2@\x0c \x80\xa9\x17/^,\xed\xed\xed\x9d\x22\xed\
+\xe7\x0a\xc8r\xf1\xf9\xe2cE9\xaa'\x8bT\xbd9\
+\xbd\xea\x1a6\xd0'\x0e\xf8z\xd1A]\xef\x15\x1d\x15\
+\x9d\xa9\xa8\xa8h\xd0\xbd^\xb5\xdf\xd7rS\x83\xfb \
+v\xdf\xbe}iEEE3\xa4\xf0\xd7\xa5\xec*\xd1\
+\x1cQ\x89(\xc5\xc5\xab\xee\xd5[\xb8\xc6a\x15\x83\xdf\
+(\xbd\x8a\x88\x06]\x1f\x11\xed\x94A7]\xbf~\xfd\
+\xf8\xe2\xc5\x8b{\xbc\xc3\x17\xe5\x89\xb5\xb9\x0b\xc9\x17.\
+\x5c(\xea\xee\xee\x9e\xa70\xfe\x96\x86\xad\x11\x881\xa2\
+4\xc0@\x89J\x04\xa8\x09h\xe8\xe6mQ\xce=]\
+\xf7\x887\x8b\xb6\xab\xfe\xb3\xd4\xd4\xd4\x033g\xcel\
+J${\xb4\xed\x89\xb5\x1b\x85\x04)\x92r\xf6\xec\xd9\
+G\xa5\xd4_\x0a\xe8ZQ\xa9\x8c \x96\x18\xb8\xc6\xdc\
+\x02\x94\xb6(\xd1!zM\x1d#@\xd4\xfb\xfa\xfa\x1a\
+U\xffo\xd57\x9c;w\xee\xf0\xbau\xeb\xfaF\xa1\
+\xee\x88]\xee\xc9\x00\x9a8\xe9\xcc\x993\xac\xe7\x17$\
+\xf5\x1b\xa2I\x02\x9e\xe2\xc0\xe1^P\xd8\x0b\xf5\x91\xc8\
+\x81\xf9=\xfa{\x1d\xee\xf7\xe1\x11R\xb5\xff\x82\x8c\xf1\
+\x86\x96\xc6+\xabV\xad\xaa\xd3\xbc7'\xf3I\xef\xc0\
+ojz\x87\x8e~[\x0a%UWW/\xd4\xc4\xdf\
+\xd1\x84\xcf\x88\xc2\xfa\x064\x14-(Oq0\xd4\x01\
+\xe0\xd7\x0e\x86k\xc9\xe3v\xb8\xe7\x9c\xf6h\x7f\xfax\
+_\x1f+\xde'\xda\xa41\x1b\x1e{\xec\xb1\x8f\xa5\xc3\
+\xe0ZB\xc8(\xcap\x8d\xef0@\xe1\x96)O\xaf\
+\x91\x12\x1b4\xd1\x14Q*C\x00\x8eb\xce]\x0cm\
+Qr0Q\x0e(\xae!\x0a\xfd)\xde\x87k\xbf\xef\
+u7\x84\x8fQ\x04\xf4\xe9\xde\xf9\xabW\xaf~7\x16\
+\x8b\xbd\xfd\xfc\xf3\xcfw\x06!\xa3\xf83j\x03\x9c:\
+u*#==\xfd9\xc9\xfc\xbe\x80N\x90!\x86y\
+\x1c\xe5\x9c\x98\xd7\xeb\x0ed$\x10\xb4\xb9\x01\xe8\x1f\x1d\
+\xc7ut,\xd7\x0e<\xda\xb7\xb9\xb9\xd9\x1a\x1b\x1b\x03\
+]\xbbv\xadv\xdc\xb8q\x1bD\xaf>\xf7\xdcs\xed\
+A\xe0\x1d\xfe\x0cmO\xb7\xeb\x07x\x95\xe7\xd5\xe7\x07\
+\x02>N\x07\x98$Q0\x00^\xf7\xe2\x8a\xc5+\xee\
+\xe0\x1d0@ y.\x90\x1b\xc1\xdb\x9d{\x7f\x1f\x1f\
+\x95\xcf\xd8\xc3\x87\x0f\xdb\xde\xbd{\xad\xbd\xbd\xdd>\xfd\
+\xf4S\xcb\xcf\xcf\xcfU\xfb\xd2w\xdf}\xb7\xa7\xaa\xaa\
+\xea\xd3\xcf>\xfb\xac\xdbuK\xc4\xefh\x00\xc0gf\
+f\xe2\xf9\xbf\x11\xe8\x00^[\x90\x11\x01\xd1(@9\
+W4\xca\x1d\x0c\x1c\xa5\x9d;x\xb8\x03\x8d\xf6\xa5\xee\
+r\x5c\xb6\xb6Z;\x7f\xfe\xbci\xdb5\x81\xb3\xf7\xde\
+{\xcf\x0a\x0a\x0a\xec\xe4\xc9\x93\xc1\x08\xf4\x97A2\x15\
+\x09Kt\xe2\xec[\xbbv\xed\xbe\xfd\xfb\xf7\xdf\xf6\xcc\
+\x10\xd6p\x22\xebh\xe2$M\xf6\xb8\xf8\xf7\x04\xb6\x14\
+\xaf\x03\x1aNA\xb1\x91\xc8\x15w\x10\x0e\x8cv7\x82\
+\xb71\xdeeE\xb9\xd7\x19#@\xd6\xda\xdaj\xday\
+L\x87-+--\xb5\xcf?\xff<\xe8\x811::\
+:,'''D\xe4\xbcy\xf3\xac\xab\xab+\xaf\xac\
+\xac\xec\xcf&N\x9cxV\xf2\xdfT\x94&L\x8c\x09\
+\x0d\xa0\x81\x80\x9f/\xc0\x1bE\xe5Q\xf0\x9e\xec\xa2\xe0\
+\x1d\xb4s\x07\x18\xcf\xdd\x00\xf0D\x05\xb9MMM\x81\
+0\xf8\xfb\xef\xbfo\xb9\xb9\xb9v\xe0\xc0\x01\x9b6m\
+\x9a]\xbe|\x19\x90VXXhc\xc7\x8e\xb5\x87\x1e\
+z(p\xe5\xa8\x105\xf4\xd5\x89t\xac\xa2\xe0\x07\xaf\
+\xbd\xf6\xda%\xc9\xdb%\x9d\x07-\x1d7iB\x03\xd4\
+\xd6\xd6\x96hr\xb6\xba\xa9(\xe1\xe4\x9eq\x8e\xb2\x0e\
+\x1a\xee\x80\xa3m\xd1v\xbf\x1f\xa7\xc7\xd0\xa5\xb2\xb8i\
+\xee\xe0a\x010\x92\xdc\x95+W\x82\x5c\x80\xd26f\
+\xcc\x18\xcb\xcb\xcb\xb3\x09\x13&\x98<\x1d\xa2P\x80-\
+++\xcb\xb4\x5c\xad\xb8\xb88D\x87\x8c\x5c\xa9\xc8\xf8\
+\xf6\xae]\xbbNi\x82+C\x93D*73X\xa4\
+Q\xa0R\xf40\xf3Wj\xfak\x01\xd7\x92\x1f\x5c\xf3\
+x\x1e\x02P\x148\xdet\xcf\x020\x0a8\xda\xeeu\
+\xc6z\xc1\x93\xda\xbe\xc2Zf}\x93\xd1\x8f\x1c9\x12\
+\x8c\xa0\xa4f:\xfb\x87\xae\x8c\x991cF\x88\x04\x0c\
+\xd0\xd6\xd6\x16@VVVZII\x89\xf5\xf4\xf4\x84\
+{\xae#\x1c\xa7\x89\xf7\x89\xffP\xf4\xfd\xd5\xabW\xdf\
+\x12v#F\x80\xd6\xdaL\x85\xfc\xef\x8bR\x11\xe2\x05\
+%\xe2)\x0a\xd6\xc1\x034\xbe}$\xf0\xc8U\x92\xb2\
+\x86\x86\x86\xe0Q\xd63\xeb\xbd\xb3\xb33\x847\xf7\xe7\
+\xcf\x9f\x1f\x80P\xc7\xeb\x10\xeb\x9d%ID\x00\x94\xfe\
+\x14\xf2\x04\xd7\xbe\x5c\xd1]\xceK\x11\x7fV\xedo\xab\
+\xcb\xbe\xd01\xf2\xe7\x96\x08\xd0a\xa7P\xf7\xffA\x03\
+\xbe!A\x14\xb7d\x10\xee\x06\x00 \x040\xac\x0f\xb9\
+\x01<\xcc\xe1\x0e\x9c:c)$-<Hx\xbf\xf5\
+\xd6[!dIl(\xcf\xd6\xb6`\xc1\x820NI\
+,\xcc\x01\x10\xc6T\xca\xdb\xcc\x89\x1c\xe7A\xe0\x8d?\
+\x8c\xa7/\x84\xde\x10\xd1+\xea\x17\xfdR\xf4\xc7O?\
+\xfd\xf4\xb0\x07\xa8[\x22@\xc2\xe7H\xdeW%$\x9c\
+\xed}\x02\x07\xce\xb5\xd7G\x02\x8cb\xf1\xc0\xa3\xe0\xf1\
+\xb0\xb6\xd6\xb0m\x91\xd1\xa7L\x99\x12\xd6.a\xdd\xd2\
+\xd2b\xcb\x96-\xb3\xf1\xe3\xc7\x07\x03\xe0i\x96\x07I\
+-;;;\xd4\x91\xef\xe4\xba\xc1\x01\xef\x06p\xf0\xe4\
+\x0b\x0c \x9e,Z\xad\xfa\x22u\xdd2l\x5c\xf4\x82\
+\xe7y\xed\xab?\x95\x00\xbc\x1f\x0e;X\xd3\x85;p\
+W\x00\xefB\xac\xe3\xa8\xa7\x01\xecD_\xc6q]S\
+S\x13\xd66\xa0X\xdb\xc8\xd5#m\x00\xc6\xb5Np\
+A\x1d\xf6{\x0a\xdc\xa3\x0b9\xcc\x81,\x97\x19:\xdd\
+\xf8\x13\xef\xf9\x08xcw\x80\xd4\xb6I|]\xf4\xa8\
+<,\x02d\xf1\x19\x92\xf7U\x91t\x1b\xbe:\x1c\xbc\
+s\x94\x00\x94\x1ba$\x03\xd0\x87\x02\x07<\x84W\x01\
+\x8a\xe7Q\xd2\x8dC\xf6\xe6D\xc7\x16\xc7.@v\xa7\
+\xb0\x03\xe8\x14\x1a\xb2;[#\xfd\x00KD0\x96\xe2\
+\xe0\x9d\xdf\xf0\xba\x83\x1e\xd2Q\xe0\x97\xcb\xf8\xf35\xe4\
+\xe30P\x7f\x86\x0c\xb0}\xfb\xf6T\x81~Jmc\
+\xfc&\xdc'\xf1:\xd7\x0e\xde\x0d\x80\x97\xdc\x00~/\
+~\x1c\xc0\xd9\xc3)$-\x12\x16\x91\x00h\x96\x05\xa0\
+\xdd\x00\xf4\xa1NT\xb0\xf6\xd9\xd6X\x1e\x5c#\x87\xac\
+\xcfXd\xb0\xf5\x91\x181\x12\x11\x03\xc7\x00p\xee\xc1\
+\xddIuuu\xf9\x1f}\xf4\xd1\xef<\xf1\xc4\x13\x07\
+u\x8a\xecb\x9e!\x03h\x922)\xbdZmi\xdc\
+\x88/\x00\x1a\x09\xbc\x0bw\x03x\xbf\xf8\xf1(\x03(\
+<\xaa\xc7\xe9p\xc8!,I\x84\x10\x9e\xc7\xbb\xc8A\
+i7\x08\xe3\xf4\xd2%\x18\x82:^&\x92\x00K\x1d\
+\x83\x90P\x89X\xc6\xc3i\xe7\x90D\xc1!\xf4\xc5`\
+\xc7\x8f\x1fO\x95\xf1W\xea~\xb9n\x9d\xe5\xfe\x90\x01\
+\xb4\xe6\xa7\xea\x9a\x04\x18\x0a@\xbcx\xdd\x0d\xe0^\xc6\
+\xf3\xbeNi\x83\xa2\x85\xfe\xdc\xc7s\x00\x92\x07B\x02\
+\xa4\x9d\xfd\x1e\x85u\xde\x089\x84<\xe2\xe3\x89\x10\xae\
+\x01\x83\xe2\x5c\x93\xd8\x98\x0f\xb0D\x1e\xc6\xf3\xfb\xeei\
+\x22\x89v\x8c\xc2\x18\x0c\x8bL\x22\x84\xad\x16Y*3\
+\xd56S|\xb8\x01$l\x81\x1a\x8b\xe9\x81`(Z\
+P\xda\x0d\xe0^w\x03p\x1d_P\x92S\x1dJ\xe1\
+12?F\x00\x00\xe3(x\x9d\x10GY\xfa\xa3,\
+\xf7\xa8S\x98\x0f=|\xeeh\x1b\xd1\x84\xa7\x01\x8c\x91\
+\xc9'\x18\x82:\xf2\x98\x97k\x8e\xca\x18\xbe\xbe\xbe\xde\
+\x9d\x95\xa7y\x16K\xd6\x7f!/D\x80&H:z\
+\xf4\xe8\x0a\x09L\xf8t\xe8\xe0Q\x0eBQ\x0f{\x04\
+E\x0bJ\xa0 \xeb\x16\xf0<\xc4@x\x11\xaf\xf8\xfa\
+\xc6@\x0e0%\x95\xf3F\x92e\xe7f\xabM\x1f\x05\
+\xfa\x94\xf1\xfb\xfa-;K\x0f9\xfa\x87q dw\
+\x09`\xff\x0d\xe3pMA\x1f\x80c\x08\x22\xc0\xf5E\
+\x07\xfap\x1f\x83(yr\xb4]\xa6\xfb\xbc\xbc\xec\x0f\
+\x06\xb8t\xe9R\xa6d\xccFP\xd4\xf3^G\x18\xe4\
+\xe0=\x02\xb8\xa6\xdd\x0bu\x0f=\xac\x0exNw\x92\
+\x1fB\x9e\xb0&qQP4=#\xdd\x92S\xb5\x8e\
+\xf3\xb3l\xcc\xb8BK\xcd\xd2\xa1%+]n\x19\xb0\
+\xf6\x8evk\xaa\xbdjU\xd3\x97\xd8\xf4\xc9\xd3\xc3\xdc\
+a\xbc\xc2\xb8^\xb2\x9b\xb4\x84.Jn\xab\x22\x8ay\
+\xd1\x09\x03\xd1\xc7\xa3\x03\x83\xfb\xc9\x91\x9c@?\x12\xa4\
+\xfa\xcd~\xf1\xc5\x17\xf3\xa4Fk0\x80\xc2e\xac.\
+x\x7f\x8fn\xc1\x08\xd1\xba[\x1f\x0e\xe8\xe8\xb5\x1b\x00\
+\xceZ\x078\xa1\x0d\x91\xf0\x00\x0f\xe7\x1e\xa0\xf5\xd5\xc7\
+r\xf3s\xedbM\xb5\xc5:\x15\x01\x03I\x96\xae\xd7\
+\x8a\x13\xa7\x8f\xb3\xd2r\x9d\x03\xd2\xe5miuU!\
+\x9cv\xea\xa2e\x16f\xda\xca\x95+\xc3\xbc!\xb2$\
+\xe7\xb2\xf2\xc6\x15\xc9\xedP\xbdQ\x11E.a~\xbc\
+\x0c\x87\x00\x8a\xc7\xe1\xcc\x0d\xf1lqC\xcf\xfc\xdd\xbb\
+w\xb3\xcf\x0e\x1a@\xa0*\x05\x98(\x18\x02\xcf\xfar\
+#0(\x0a\xda\x8d\x00\xa7p\x8f5Gv\x078\x9e\
+g\xbds\x0dxd\x95\x96\x8d\xb5U\x8f\xad\xb6\xdf{\
+\xe6\x19;t\xf8\x90\xbd\xfa\x93\x7f\x0dc\xd2S\xf5\x08\
+\xab\x7f\xe9\xb9\xe96g\x89\xb6\xc9\x8cT\x8b\xf5wY\
+]s\xa3u\x0d(\xa4{Sm\xf9\xf2\xe5a\x0e\xbc\
+L\xf8WkW8\x7f\xfa\xb4\x1d=v\xcc\x8e\x8b\xbb\
+~x\x1c\x9d \xda\x88\x06\xc6`xt 2\xc8\x19\
+2D\x9a\xfaVH\xf5\x13!\x02\x04`\x8c\x1a\xc2\xfa\
+\x07\xb4\x13\x83\x00G\xf1I\xa2\x86\xa0\x0d\x02<\x9e&\
+\xa3\x03\x1c\x03\xb0u\xb1\xde3\xb22\xac\xa04\xd7*\
+\xa6N\xb4is&\xd9\xd5\x8ef\xab\xa9\xab\xb1\xae\x9e\
+\xb0\x0d+/$[ZF\x9ae\xca\x00E\xa5\xf9\x96\
+\x94\x96e\xd7{:\xedzwL\xed\xca\xf4\xfd\x83\xdb\
+\x9b\xeb\x90-\xafv\xe9\xb9\xa1[`rt\x18BW\
+t\xc2\xfb\xae+m\x00\xa7\x8d:\x87&\x96\x00\x1cc\
+\xa8$+\x9a\xc2>\x19\x0c\xa0\x86\x22\xe1\x1f:\xfab\
+\x0b\xc8\x01FAS\x8fZ\x99D\x06x\xbc\xed\xe1~\
+\xe2\xc4\x89`\xed\xec\x82l+\x98\x90g\xa5\x13K\xac\
+p|\xae\xd5w\xd7XL\xeb\xfa\xf0\xd9\xfd\x96\x94e\
+V0.\xdfR3R,\xb70\xdb\xa6\xcc\x98d\x99\
+\x19\xb9\xd6\xd6\xdda\xed1\xb6\xbe\x98u\xcb\x83\xc5\x05\
+acB\xe9P\xc88\xe8\xc5bm\xd7\x0e\x02@t\
+\x85\xd3N\xc8\xf3n\x00\x1e\xf2\x8c<\x8e#\xe3J\xb2\
+\x96\xcdd\xf5OJ\xe5\x8f\x9e\xbf\xc3\x17\x1d:\x22\x0c\
+\xee\x02\x01\x8c\xe0x#p\x8d\x85\xc9\xb2\xec\xb1\xec\xeb\
+p\xb2=\x89\xb0\xa0\xa8\xc0z3z\xb4\x86\xd3\xadp\
+B\x81\x95O-\xb7\xd2\x87J\xac\xb8$\xdf\x16v\xcf\
+\xb4k\x1dmv\xfd\xeau\xcb\xce\xcb\xb2\xb9Kf\xd8\
+\xa4\xa9\x15\xd6\xd3\xdfk\xdd}\x1cp\xd2\x14\xea\xdd\x16\
+\xbb\xdeeSg\x0f\x9e\x1e\xd1\x812@\x88\xcb\xbbx\
+\x98\xf5\x8f\xaeN\xae;9\x81\xf5\x7f\xbb\x22\xdd\x83U\
+<\x02\x02p\x17\x80@\x8a\x83\xc6\xe3\xd4\xe1L\xec\xc4\
+\x9e\xce\xfe\xea\x06\xc0\xf3\xb4\xcd\x993\xc7\x8a\x8a\x8b\xec\
+\xf0\xf9C\x96Y\x90i%\x95%6~Z\x99\x15\x16\
+\x17ZNf\x8e-\x5c>\xd7\xa6\xce\xaa\xb4X{\x8f\
+\xe5h\xdb\xcb\xca\xcb\xd0n \xd0}z\xac\xd6<\xad\
+m\xad\xd6T\xdf\xac\xe7\xe6d[\xb1\xf8+\xc3p`\
+\xf4\x90\xe9\x95\xd4\xce\xe8\x05\x0a\x9e\x86\xd0\x19#q\x9f\
+\xb3\xc5\x9d\x0c\xe0B9\xff\x0f\xe8\x0dk\x83\x04\x0c\xe0\
+u'\x00G=\xefa\xef\x9c\x89\xc8\xac\xac\x7f\x88\xf5\
+\xcfI\x8b\xd7T\xbc\xa8\xe0Y\xbeC\xff\xaeZ\x93\x0d\
+\xa4)\xcd\xa5I\xb9\x81>\xeb\xe8\x89YzJ\x9ae\
+\x17\xe4Z\xe1\x98L\x19>\xddb\xdd\xed\xd6\xd9\xdb%\
+\xef\xf7ZGg\x87\xb54\xcb\x00\x97[l\xe1\xd4E\
+6\xa1\x94S\xeb`A\x1f\x96E\xb7\x22\xec\x84\x0eV\
+\x1dZ~d\xf6\xa8\x01\xfc\x19\x80\xbe`IT\xb4<\
+Br\x0b\x11\xa0\x8e-\x18\x00+2\xc8\x81G=\x1f\
+\xef}\xbc\x80\xb71\x02\xe1\x7f^\xde\xf0m\x87'\xb9\
+\xe9\xd3\xa7[\xd5oT\xd9\xbfm\xfe\x99\xd5]j\xb0\
+\x1c\xad\xf3\x81\x09\x03\x96\x9d\x99ayY\xf9\x8a\x22\x9d\
+\xd8\x14Qi\xa9z\xcc\x95\xb1\xafw\xb6Y\x87d6\
+\xd45\xd9\x85\x93\x17-\xbf\xbf\xc8\xbe\xf9\xd47-7\
+'7\xe8\x03\x90^\xbc\x8b\xd1e\xe8-\xdb\xb7\x87\x8c\
+\xce\xbb\x022\xbb\x97\xa8\x01\xc0\x91\xa0\xf4k\x99\x9e\x15\
+\xd6\x01_\x02\xcd\xba\xe8\x07<%\x1a\xfa\xeeq\xe7\xdc\
+\xc3\xfb\x1e\x8a\xec\xcd\x18\x03.M\xc3X^hTV\
+V\xda\x8c\x993,\xaf(\xcf6\xbe\xbe\xc1.|~\
+I\xb9\xa1\xcb&\x94\x8f\x17\xd0\x98\xe5d\xe5Y\x9f2\
+}\xba\x1c\xd1\x1e\xbb\xa6csw8\xdc\x5c:S\xab\
+D\xd9e/<\xbb\xdef<\xc2\xd3\xf9`\x01L\xa7\
+B\xbbCF?\xa1\xef\x00\xc7\xf4Z\x1c\xf0\x18\x1d\xc7\
+9p\xcf\xf48\x86\xa5\x90\xa0\xf4\xcbh\xe1\xc1\xc0#\
+\xe0\x82\xc0\xf3b-\x83\x89 \x07\xec\xdc\xd7\xbds\x0c\
+@\x9d\xfb(\x02`\xb6>\x8c\x81B<\xc2\x16\x17\x15\
+\xdb\xaae\xab\xac\xb0\xa0\xd0\xfe\xee\xdf7\xda\xd9\x83\xd5\
+\xd6R\xdbj\xb9E\xd9\x96W\xa0\x83\x98\xdeT\xeb\xad\
+\x9d\xc5\xa4\xe8\xd5\xc6Vk\xad\xbff\xe33\xcb\xed\xdb\
+\xdf\xfa#\xab\x9a_\x15tw/\xf6\xc8\xc0\xd7\x94p\
+\x1b\x95s\xde\xde\xbc\xd9\x9aT\x7f\xf8\xe1\x87\x83\xf7\x99\
+\x8fe\xe0\xbaM\x9e<9l\xc7\xb71@\x8f\xb6\xc5\
+\x0bL\x10\xf6\xfe\x97^z\xa9[\x13\xfd\x81\x8cP\xc8\
+\x84\xf1\x09\xcf\xc1\xc2\x01\xec\x1e\xc7\xca\x10K\xc1\xa3\x87\
+\x93 \x9f\xa98\x02\xd3\x97w}\x8fLz\xc4\xaaf\
+WYZ_\xba\x9d=u^\x07\x99\x8b\xd6X\xd7l\
+MW\x9a\xad\xae\xba\xdej\xcf5X\xfe@\x91=>\
+o\xad\xfd\xe1\xba\x17l\xf6\xf4\xd9\x96\x9c4\x98\xd4P\
+\x92\xac\xdf\xa6\xb0o\xd4\x19\xe3\xddM\x9b\xec\xe7\xef\xbc\
+\x13\x0c\xcc\xfa'\xfc\xd9\x8a\xd9\xe7\x1f}\xf4\xd1`\x14\
+^\xaf\x11\x91,M7 r\x22\xa5q\xe9\xd2\xa5/\
+\xef\xd9\xb3\xa7+D\x80B6\xa6$vP\xc0+\xa3\
+\x06\x00\x80[\x15\xee\xf7\xe0\x90\xef\xb3\x84\x1f\x8a01\
+u&\xde,/m\xdd\xba\xd5&M\x9ad\xfalm\
+O>\xf9\xa4}m\xe5\xd7\xec\xa95_\xb7\xe6\xd6\x16\
+;S}F\xa1\xdfn\xf99\xf9VQ^a\xe3\xc7\
+\x8d\xb7\xfc\xdc|\xe5\x84\xc1\xd7\x11\xc8\xa78\xf8\xf3\xda\
+^\xff\xf3\xcd7\xed?\xf4\x12\x95\xcfa\xbc\x14a\xbb\
+C/\xe6\xc4\x09D\x01\x91GD\x92\x90\x89\x0c\x9c\x19\
+_\xb4\xdb\x1d[\xb4hQx\xdf\xeeK`@Il\
+\x9b:\xfe\x96&N\x05\xf8H\xe4J9\x074k\x0e\
+\xc2\x0bD\x06\x13\x92\x04Q\x92\x07\x1f\xbe\xe1\x1d\xd3\x91\
+\xf5\xf5\xd7_\x0f\xdb\xe3\x8a\x15+\xc2\xab\xee\xc5\xf3\x17\
+\x0b\xc4\x18\x19.c\x98~.\x9bF\xc05)\xe4\xb7\
+n\xd9b?\xff\xc5/l\xd7\x9e=\xda^\x8b\x83|\
+\x8c\xef\x1fC\x00O\xd8\xb3\xfb\xa0\x0bO\x83\x90G\xe5\
+\xb0\x09\x94\xe24v\x8f\xff\xaa\xc4\x93 \xd6:\xa4\x09\
+\xf9\xe9IY\xbc\xe7Q$jI\x04\xfb\xba\xc3\xda\x80\
+\xa5\x0f\xe4\xf7P\x10eP\x92\xb3\x02\xeb\xf1\xc3\x0f?\
+\x0c_s\x09]\x12%\x0fF\xec\x16<\xb3\x13=\xc8\
+!\x94\xf1(K\xe9\x80\xde\x1ao\xdf\xb1\xc3\xe4\x1c\xd3\
+\xaf l\x92@\xd2\x07]\x90\x81\x9e\xcc\xa3\x1fM\x05\
+\xafso\x14\x06h\xd3\x98\xa1\xef\x03C\x06\x90\xd0\xd3\
+\xb2\xfea\x09\x0d\x06\x88\x1a\x81\xba{\x06\xe0~`r\
+\x90\x84\x9d\x17\xa2\x82\x87\x0e\xcf\x17x\x02\xa5(\x9c\x15\
+\x00G\xde\xd0\xef\x06\xc3W\xdd-\xf2.\xb2\xdd[>\
+\x0f\xb2\xe9\x0b\x95\xc9X\x84;m\x80G\x07\xe4\xf3\x0a\
+\x1d\xef\x13y,5\x9f\x8b\x9d\x81q#\x15\x8d=\xae\
+9\x8e\xfb\xbd!\x03\xf0;<\xbd\xb5\xd9%\xb0\xab\xe5\
+\xc94\xf7(<\xea}7\x00\xeb\x0d\x020\xcf\xdc\xee\
+y&\xc7\x00(\x85\x92\x00b<FD)N\x8d\x1c\
+\x96x`\xc2\xf3\x1c\xa5iG\x16\xfd\x00I\xa1\x8d1\
+\xc8\xa1\x1fsp\xe0\x22\xf33\x86\xf90<a\x8fC\
+\xfca\x07}\xd01\xaa\xb3\x83\x15\xef\xd5\xbd\x9d\x92U\
+\xe3mC\x06\x90\xc0^\x1de7i\xd2\xf5\x02\xcd\x8f\
+\x1cCH\xa3D\xb401J\xd2\xee\xc6\xa1N; \
+X\x12\xe4\x03\x9e\x07\xc8\xc4\xdcC\x19\x88\x10\xc5\xfb,\
+\x0b\x80\x01\xb2R\xdb'O\x8d\x00\xe1\x1erX\x0e\xfe\
+>\xcf\x13\x1d\xc01(Ki\xcd\x9a5aY!\xcf\
+\xc3\x1e\x9d0\x84\x17\xe6\xf5h\xf26\xf16\xc9\xdb\xe4\
+o\x84i\x1f2\x00\x17\x0a\xa7\xcf\x04\x82(\xf8]7\
+\xc0\x08B\x86<O\x1f\x0a}P\x9c\x82\x12x\x81H\
+\xc0\x00.\x07\x85X\x0a\xacy\x80\x13\xae\xacs\x92\x17\
+\xe3\x01\xc2\xf1\x99\x1f;(\x1a\x83\x110\x08\xef\x17H\
+\xaa$T\xd6:_\x930 9\x849\x1c\xb8\xcf\x1f\
+\x94\xd0\x1f\xe6\x8e\x8f\x02y\x7f\xb7\xc6\xed\xf7>\xf0a\
+\x06\xe0\x17\x98\x9f|\xf2\xc9\xabR\xfa7E%\xf1\x02\
+| \x93\x01\x92\x02`\xae\xf1>\xc4\xc4x\xca\x09\x03\
+\x00\x1e\xf2(\x00\xb0\x1b\x16 \x848\xc0\xf9\xfaK\xf8\
+\x02\x8c\x8f'\x18\x88\xe5\x82,\xe4\xd2\xb6p\xe1\xc2\xa1\
+\xd7\x5c\xf4MT\x88\xc2\xa8\xfe\xd2\xb1E\x86\xff\x17}\
+\x8b\x8cE\xc7\x0c3\x0074\xe8\x80&\xdc*\x85\xd7\
+\xe92\xe1\x0cn\x048\x84! <\x82\xc2\xeey7\
+\x00\xca8p\x07?w\xee\xdc\xb0d\x18O?\xd61\
+\x91A\x1d\xb0,'\x0c\x8d\xf7\x89\x0a\xeeG\x1f~\xa2\
+@\xa2u\x8c\xcd\x12\xf4y\x80\xc5\xdaW\x04\x1e\x8c\xf6\
+\xa3~\x8b\x01\x96,Y\xd2\xb4m\xdb\xb6\x8d\x1a\xbcT\
+\xf7+\xe9\x94\xa8\xb8\x11\xf0<a\x1d\xf5\xba\x03w\xcf\
+G\x0d\x80<7\x1c^\x84\x08s\x0cH\x1d\xce\xdaG\
+.u7p\x22=\xe2\xdb\xd1\x83D\xecE\xe3\xaf(\
+\xaa6~\xf0\xc1\x07u\xde\xe6\xfc\x16\x03pC\x03\x0e\
+\xc9\x00o\xa8\xfa\xa2\xe8ff\xe1\xe6\x08\x05\xa5\xf1\x94\
+\x1b\x02\xd0Q\x1a\x09<b\x18\xe7\xe0\x00\xea\xe4\xed\xdc\
+\xbb\x97\x82\xf1#\xcf\x01\xfd\x92\xfb\x96\x96\xda\xff\x8c$\
+kD\x03\xf0K\x8a\x9d;w\xbe\xa2u7[J<\
+\xa9\x81w4\x02\xc2Q\x1c\xc2\x10\x14B\xd0\xc3\xd0y\
+\xb8\xa1?\x0e\x0e\xeeu\xbf\xf7E9\xe1\xcf.\xa2\xc2\
+\x13\xee\x07\x0a\xfd\xbf\xd7\xda\x1f\xfc\x80\x10'<\xe1\x1a\
+\xd7\x91\xb5V\x83\x7f\xa4\xfe\xe7\xe2\xc6\x8c\xfa\x12`n\
+\x14\xf7\xaeso\xbf\xdf\xe0Q\x8e\xdd\x83g\x01\xc9\xae\
+Q\x1eyY\xcf\x22C\xfb~\xbc\xf2#F\x00\x9d4\
+XN\x1b\xf8x\xc7\x8e\x1d\xdfU8\xf3\x8b\x91\xf1\xf1\
+\x83\xbf\xac\xd7\xec(Z\x06\x0d\x8a\xc4\x97\xd6\xaf_\xbf\
+C\xe7\xfe[\x9f\x88n(\x9f0\x02\xb8/\xd0\x0c|\
+G\xde\xfa\xa1xx\x81@\xfb\x97\xb9\x90\x00\xf5\x1b\xc2\
+6\x81\xff\xb1\x12\xeb\xaf\xfc\xa1'\x91\xce\xb75\x00\x83\
+\x94\x0f:\xb5\xf5\xfcT\xd5\x97E_j#\x90g\xf4\
+\x8c\xd1\xa6#\xf3\xdfVVV\xfe\xe3\xa6M\x9b\x12\xbe\
+\x12\x02\x1b\xe5\x8e\x06\xa0\x93\x0eH\x1d:\xa9\xfdX\x11\
+\xf1=Mr\x85\xb6/c\xd1R\xad\xd5\x99\xe1e\xbd\
++\xf8'%\xbd\xc1\xdf\xd7\xddA\xd1Q\x19\x00\x19\x18\
+A\x06\xf8\x89\x92\xd8_\xe8\xf2\x8ch\xf8C\x02\x9d\xfe\
+\xef\x0a\xba\x9c\xd1R\xfds\xed\xf7d\xfcQ\x81G\xdd\
+\xbb\xdeh\x15\x01\xc9:(-\x15\xe7\xbf\xc9\x8cz\x8b\
+|\x80\xb6\xe1\xff\x0al\x16\xf8\x0dZ\xae\x1f\xdd\xc8[\
+\xa3\x9e\xee\xae\x0d\x80dM\x98\xa4\x9f\x9f\x96)\xe1\xfc\
+\x89.\x9f\x15=,\x1au4\xa9\xef\xfd($\xe8j\
+\xd1\x1b:~\xbfrc\xdbN\xf8\x1e<\xd1\x84\xf7d\
+\x00\x17\xc6\x0f\xabd\x8cy\xba\xfe\x8e\xf8\xe3\xe2%~\
+\xef\x01\xf3Fyz\x9b\xe6\xf8\x91\xf8!\x0en\xf7:\
+\xdf\x172\x80O\xaa\x97\x9f\xfc7\xb9E\x0a\xc3?\xd5\
+\xb1w\x99\xda\x0bD\x09\xcf\x18>\xee.9 [5\
+\xc7^\xcd\xf1\xcf2\xf8~\xbd\x17h\xbaK\x19\xb7t\
+\xbf/\x06p\xa9\x8a\x88\xf0K\x13)\xf8\xdbj[!\
+\x9a%*\x12\xdd\xeb\xf2 \xcc[D\xc7d\xe0\xdd\x02\
+\xff\xb6\x80\x1fakV\xdb})\xf7\xd5\x00\xae\x91\xde\
+\x02\xa7\xeb\xd5\xf88\x19b\xba\x14_ \xfe\x15)>\
+W\xf7yy\xc8\xcb:\x0c\xc2\xdc>?k\x17\x020\
+?\x1c\xe0K\xd5a\x01\xde\xadq\x07\xb5\xc6O\xea%\
+H\xed\xacY\xb3F<\xcf\xab\xff=\x17W\xe0\x9e\x05\
+\x8cf\xa0@$\xebG\xd0Y:\x9f\x97\xca\x18\x15\xba\
+.\xd6vZ$^\xcax\x81\xad\xd7\x1e\xde\x22\xde\xac\
+\x13\x5c\xb5\x0e^uzW\x10\xd35\x06y\xa0\xe5\xd7\
+b\x80\x91\x10\x08\xfc\xb0\xb9\x05\xf6\xae3\xf8Hr\xef\
+\xb6\xed\x7f\x01-\xaf\xdfJ\xf2\xff\x93\x96\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00'\x19\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x04\x0eiCCPkCGColor\
+SpaceGenericRGB\x00\
+\x008\x8d\x8dU]h\x1cU\x14>\x9b\xb9\xb3+$\
+\xce\x83\xd4\xa6\xa6\x92\x0e\xfe5\x94\xb4lR\xd1\x84\xda\
+\xe8\xfee\xb3m\xdc,\x93l\xb4A\x90\xc9\xec\xdd\x9d\
+i&3\xe3\xfc\xa4i)>\x14A\x10\xc1\xa8\xe0\x93\
+\xe0\xff[\xc1'!j\xab\xed\x8b-\xa2\xb4P\xa2\x04\
+\x83(\xf8\xd0\xfaG\xa1\xd2\x17\x09\xeb\xb93\xb3\xbb\x93\
+\xb8k\xbd\xcb\xdc\xf9\xe6\x9c\xef~\xe7\xdes\xee\xde\x0b\
+\x90\xb8,[\x96\xde%\x02,\x1a\xae-\xe5\xd3\xe2\xb3\
+\xc7\xe6\xc4\xc4:t\xc1}\xd0\x0d}\xd0-+\x8e\x95\
+*\x95&\x01\x1b\xe3\xc2\xbf\xda\xed\xef \xc6\xde\xd7\xf6\
+\xb7\xf7\xffg\xeb\xaePG\x01\x88\xdd\x85\xd8\xac8\xca\
+\x22\xe2e\x00\xfe\x15\xc5\xb2]\x80\x04A\xfb\xc8\x09\xd7\
+b\xf8\x09\xc4;l\x9c \xe2\x12\xc3\xb5\x00W\x18\x9e\
+\x0f\xf0\xb2\xcf\x99\x912\x88_E,(\xaa\x8c\xfe\xc4\
+\xdb\x88\x07\xe7#\xf6Z\x04\x07s\xf0\xdb\x8e<5\xa8\
+\xad)\x22\xcbE\xc96\xab\x9aN#\xd3\xbd\x83\xfb\x7f\
+\xb6E\xddk\xc4\xdb\x83O\x8f\xb30}\x14\xdf\x03\xb8\
+\xf6\x97*r\x96\xe1\x87\x10\x9fU\xe4\xdct\x88\xaf.\
+i\xb3\xc5\x10\xffe\xb9i\x09\xf1#\x00]\xbb\xbc\x85\
+r\x0a\xf1>\xc4cU{\xbc\x1c\xe8t\xa9\xaa7\xd1\
+\xc0+\xa7\xd4\x99g\x10\xdf\x83xu\xc1<\xca\xc6\xee\
+D\xfc\xb51_\x9c\x0au~R\x9c\x0c\xe6\x0f\x1e\x00\
+\xe0\xe2*-\xb0z\xf7#\x1e\xb0Mi*\x88\xcb\x8d\
+Wh6\xc7\xf2\x88\xf8\xb8\xe6\x16f\x02}\xee-g\
+i:\xd7\xd09\xa5f\x8aA,\xee\x8b\xe3\xf2\x11V\
+\xa7>\xc4W\xa9\x9e\x97B\xfd_-\xb7\x14\xc6%=\
+\x86^\x9c\x0ct\xc80u\xfc\xf5\xfavW\x9d\x99\x08\
+\xe2\x929\x17\x0b\x1a\x8c%/V\xb5\xf1B\xc8\x7fW\
+\xb5'\xa4\x10_\xb6t\x7f\x8f\xe2\xdc\xc8M\xdb\x93\xca\
+\x01\x9f\xbf\x9f\x1a\xe5P\x93\x1f\x93\xed\x5c>\xc4\x15\x98\
+\x8d\xc9@\xc1\x84y\xec\x150`\x13D\x90 \x0fi\
+|[`\xa3\xa7\x0a\x1a\xe8h\xa1\xe8\xa5h\xa1\xf8\xd5\
+\xe0\xec\xdf\xc2)\xf9\xfe\x00\xb7Tj\xfe\xc8\xeb\xe8\xd1\
+0B\xa6\xff#\xf0\xd0\xaa\xc2\xefhU#\xbc\x0c~\
+yh\xabu\xd0\x09fp#\xd41I/I\x92\x83\
+\xf8\x1c\x22\x93\xe40\x19!\xa3 \x92'\xc9Sd\x8c\
+d\xd1:J\x0e5\xc7\x96\x22sd\xf3\xb9\xd1\xd4y\
+\x01#R\x9f7\x8b\xbc\x8b\xe8wA\xc6\xfegd\x98\
+\xe0\xb4\xcf\xc5J\x9f7\x10\xd8\xcf\xd8\xcfk\xca\x95\xd7\
+n^:}nW\x8b\xbbFV\x9f\xbb\xd6s\xe9t\
+$g\x1aj-t\xc8\xda\xd4\x9dr\xcf\xff\xc2_\xe7\
+\xd7\xb0_\xe77Z\x0c\xfe\x07~\x03\x7f\xeb\xdbV\xb7\
+5\xeb4\xccV\x0a}\xbao[\xc4G\xf3=Nd\
+>\xa5-Ula\xb3\xa3\xa2Y5V\xfa\x02\x1f\xcb\
+\x00}\xb9x\xbb\x08g\x06[\xfc\xe4\xf7\xc9?\x92k\
+\xc9\xf7\x92\x1f&\x7f\xe3\xde\xe4>\xe1\xces\x9fr\x9f\
+q\xdf\x80\xc8]\xe0.r_r_q\x1fs\x9fG\
+j\xd4y\xef4k\xee\xaf\xa3\xb1\x0a\xe6i\x97Q\xdc\
+\x9fBZ\xd8-<(d\x85=\xc2\xc3\xc2dKO\
+\xe8\x15\x86\x84\x09a/zv7\xab\x13\x8d\x17]\xbb\
+\x06\xc7\xb0od\xab}\xac\x80\x17\xa9s\xecn\xac\xb3\
+\xd6\xe1?TF\x96\x06'|\xa6\xe3\xef3\x03Nn\
+\xe3\x84#I?\x19\x22\x85m\xbbz\x84\xed\xf5\xa6v\
+~K=\xda\xaf\x81\xc6s\xf1l<\x05b|_|\
+4>\x14?\xc2p\x83\x19\xdf\x8b\xbeQ\xec\xf1\xd4r\
+\xe9\xb2\xcb\x0e\xe2\x8ci\x9d\xb4\xb5\x9a\xea\x8a\xc3\xc9\xe4\
+\xe3b\x0a\xaf2*\x16\x0c\xe5\xc0\xa0(\xeb\xba\xe8\xbb\
+\x1c\xd1\xa6\x0e\xb5\x97h\xe5\x00\xb0{28\xc2oI\
+\xfe\xfd\x17\xdby\xa5es\x9f\x068\xfc';\xf7Z\
+\xb69\x0f\xe0\xac\x03\xd0\xfbh\xcb6\x80g\xe3\xbd\xef\
+\x00\xac>\xa6x\xf6Rx'\xc4b\xdf\x028\xd5\x83\
+\xc3\xc1WO\x1a\xcf\xab\x1f\xeb\xf5[xn%\xde\x00\
+\xd8|\xbd^\xff\xfb\xfdz}\xf3\x03\xd4\xdf\x00\xb8\xa0\
+\xff\x03\xff%x\x0b\xc5c\xd6\xcb\x00\x00\x00leX\
+IfMM\x00*\x00\x00\x00\x08\x00\x04\x01\x12\x00\x03\
+\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\
+\x00\x00\x00>\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00F\
+\x87i\x00\x04\x00\x00\x00\x01\x00\x00\x00N\x00\x00\x00\x00\
+\x00\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\
+\x00\x02\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00@\x00\x00\x00\x00\xc0]\
+\x8d\xc8\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x02fiTXtX\
+ML:com.adobe.xmp\
+\x00\x00\x00\x00\x00<x:xmpmeta \
+xmlns:x=\x22adobe:n\
+s:meta/\x22 x:xmptk\
+=\x22XMP Core 6.0.0\
+\x22>\x0a   <rdf:RDF x\
+mlns:rdf=\x22http:/\
+/www.w3.org/1999\
+/02/22-rdf-synta\
+x-ns#\x22>\x0a      <r\
+df:Description r\
+df:about=\x22\x22\x0a    \
+        xmlns:ti\
+ff=\x22http://ns.ad\
+obe.com/tiff/1.0\
+/\x22\x0a            x\
+mlns:exif=\x22http:\
+//ns.adobe.com/e\
+xif/1.0/\x22>\x0a     \
+    <tiff:XResol\
+ution>72</tiff:X\
+Resolution>\x0a    \
+     <tiff:Orien\
+tation>1</tiff:O\
+rientation>\x0a    \
+     <tiff:YReso\
+lution>72</tiff:\
+YResolution>\x0a   \
+      <exif:Pixe\
+lYDimension>280<\
+/exif:PixelYDime\
+nsion>\x0a         \
+<exif:PixelXDime\
+nsion>280</exif:\
+PixelXDimension>\
+\x0a      </rdf:Des\
+cription>\x0a   </r\
+df:RDF>\x0a</x:xmpm\
+eta>\x0a\x0c'w\xcc\x00\x00\x1f\xc7IDA\
+Tx\x01\xb5[\x09|\x15\xd5\xb9\xff\xcf\xdc}\xcbv\
+\x93\x9b\x84@\x02!\x01d\xa9\xbb\xa2H\xeds\xadE\
+k\xad\xb5U\xdc\xea\x86\xd5\xb6.\xf5UE}.\xe0\
+\xb3\xaf\xb5\xa2<\x9f[\xf9\xd9j\x8b[\xb5j\xad\xbb\
+\xb5jq\xdf\x17\x14\x03$\x84@\xc8\xbe\xde}\x99\x99\
+\xf7\xff\xce\xdc\x1b\x02\x04\x01\x97\x93\xdc\x99;3g\xce\
+9\xdfw\xbe\xfd\xfb\xae\x96H$,|\xe3-?\xc5\
+\xe8\x994N\xba\xf5\xb5\xac\xa3pO\x93\x0e\xdf|s\
+~cSX&\x87\x16ht~\x08\x8c\xc6\xb3\xce\x8f\
+\x02L\xaee\xe6Q@Z\xd2\x97\x1f9\xabw\xf9~\
+\xe1\x9e\xea*}G\xf5\x97{_C\xfb\x9a\x11`\x03\
+ \xa0@s\x10f\x17\xcf\x1a\x97-\xc0d\xa0\x19q\
+ \x97\x80\xa5\xcei\xc2i\xb0\xa3\xc5~Nvw\x03\
+N?,G\x00p\xf8\x88,7\x9f\x10a\x82\x043\
+\xc73?2\x8e \xf2kD\xc4\xd7\x87\x00\xcb\xe0Z\
+\x09,\x01\xd1\x1d\x1c\x96\x00#\xd3\x0b-\xb1\x01Vt\
+\x1d\xcc\xe8ZX\xb1\xf50\x93m|\xb4\x81\x88\xd8D\
+x\xfa\x09\x0c\x9b^L\xe0\xc7As\x8f\x87\xee\xad\x85\
+\x16\xa8\x83\x1ej\xe0\xa7\x1e\x08\x8c\x87\xe5\x0e\xc3\xd2\xfd\
+\xec\xcf9\x0c\x22\x12D\xdc\xd7\x84\x08\xed+\xcb\x00\x92\
+\xab\xc5]\xd2\x1c\x1e~\xb8\x93\xd9A`\xb8\x09V\xdf\
+{0z_\x831\xf4Oh\xe9\x1e8\x08\xa7\x8bx\
+q\x0aQp\xa7\x15\xd0\x1a/d7\xad,\x81\x8b\x02\
+F\x149~\xcd\xf2\x93\x132r\x13\x99EGC\xaf\
+\x98\x03-\xbc/P<\x0d\xf0\x10\x19\x86E\x82H\xe6\
+\xb9IF\xfe\xf2\xed\xab!\x80\xa4i\x11\x08\xdd\xed\xe5\
+n\xf7\x00=o\xc3\xda\xf4,\x8c\x9e\xbf\xc2Jv\xc3\
+M\xf8<\xfe2\x1e\xc6q\x85^$\xd2:\xa2\xa9\x1c\
+\x12)\x03\xa9\xac\x89\x0c\xa1\x94?\xb7S\x87\xd7\xa5\xc1\
+\xe7q\x22\xe4s \xe8&\xf4ZZ\x8d\x99Mt\x22\
+Eb\xd28\x85\xa3\xfc,h\xd5G\x01\x91\x039\x5c\
+\x15\xf1\xc6\x07&?d\xa1/\xdb\xbe$\x02\xb8l\xd3\
+\xe4N\xfa\xc8\xa5\xe4\xe5\xee\xd7a\xb5=\x00\xb3\xe7\x8f\
+\x8a\xf2\xfd\x01\xde\x0f4\x12@\x0f6\xf6e\xb1zc\
+\x1ak6e\xb0\x96\xe7u\x9d\x19t\x0d\xe4\xd0\x173\
+0\x10\x17\xb6\x01J\xfc\x0e\x84C:\x22%.\xd4U\
+\xba\xd0X\xe3FC\x8d\x07S\xf8\xa9\xadp\xc3\xe7\xce\
+\xc2J\xb4!\x11\xeb\x87EX\x1d\xe5?\x816\xe1$\
+\x22\xe3;0\xf5\x10\x11\x91 G\x88\x80\x14\xf9\xb0k\
+m\xd7\x11\xa0H^\xe3\xae\xfb\xc8\xdf\xcd0\xd7\xde\xcb\
+]\xbf\x1ef\x0a\xf0\xfb#\xd0\x83\xe3\xd0=\xa4\xe1\xad\
+\xa6$^z?\x8e\x97>\x8a\xe3\xc3U$o\x90\xae\
+w\xa9i\x989\xa5\x14\x87\xec\x19\xc0\xc1\xbb\x07\xb0\xff\
+T\x1fj\xc2\x1a\x11\xd1ED\xb4S^p\xb0\xaa\x0b\
+\xe0h8\x0bV\xd1L\x98\xd9\xb4-l\x95l\xd8\xf9\
+\x89v\x0d\x01\x02<\xa5\xbb\xc3\xe9\x84\xd5\xf5\x12\xccU\
+\x8b\xc9\xef+\xe0p\x15\xc3\x13\x1a\x8f\x9e\xa8\x0bO\xbd\
+\x93\xc0C/\x0d\xe2\xd9\xd7D\xc0\x89\xe4\xb6[y\x11\
+9\xc1-\x9aAx\x9ezA\x84\xbb\xf09\x9b\xdc\x12\
+\xed\xa8i\xbcA\x92H&\x0d$\xa80\x92\xf9\xe7\xd2\
+\xe7\xe0\xbd+\xf0\xe3C\x8a\xf1\xfd\xd9A\x8c/5\x90\
+\x8du\x22C\xb6\xd3\x02\xb3\xa0O\xbd\x06Z\xcd\xd1\x94\
+\x9126\x11\xbd\x0bH\xd8y\x04\x08\xf0TM\x0e=\
+\x0bs\xdd\xfd\xb0\x9a\xceQ\xf0y\x03\x93\x91\xd3\x03x\
+\xee\xc3\x1cn\xfak\x0f^y\x97\xb2`T\xab,\xe5\
+\x05\xb7\xabg\x90\xef\x15 \x1e\xf5|\xac\xaf\x15\xa5\x1e\
+\xf4\x0c\xa41{\xf7r\xec=\xad\x18\xcf\xbc5\x80\x96\
+V[c\xec>-\x8cKO\xac\xc0\xb1\xb3\xdd\x08h\
+\x09$\xe3\xd4.\x82\xbc\xfa\xdfA\x9f\xb2\x00\xa6F5\
+jP~\xec$\x12v\x0e\x01\x04^\xf4\xb2\x8e$\xcc\
+\xa6\xdbH\xf6W\x90\x0a*\xe1\x0d\x14a\xc3\x90\x0fK\
+\x1e\x1d\xc6-\xf7\xb7*X\xfc\xa5E\xb8\xe6\x94J\xcc\
+\x98\xe8\xc6'-\x19,\xbcm\x1d\xef\xe7\x10)s\xa3\
+\xbb?\xa3v[\xf8~\xd4\xe6\xaa\xf7\x84\x02\xe4~y\
+\x89\x1b\xbd\x83\x14l\x08\xe1\xcde\x93\xb0\x7f\x83A9\
+\xa2\xe1\x99\xf7sX|o'6\xb4S\xcb\xb0\x9d:\
+o\x02\xae\x9c_\x8a\xa9\x95)\xa4\x13\x09\xe4\xd2\x1b\xa1\
+\xd7^\x02\xc7\xcc\xcb`8\x88u\xaaK[M\xa8\xee\
+\xdb=\xec\x18\x01\xa3\x81_u\x13\xcc\xe6Epy'\
+\xc2\xeds\xe1\xcd\x16/\xce_\xda\x85\x0f>\xedV\x13\
+\x5cv\xfad\x9c\xfd\xdd\x00\x1a*(\x10\x88,\xd0\xa8\
+y\xe2m\x07\x8e\xbd\xecS\xf5\xbc\xba\xdc\x83\x8e^\xf2\
+j\x1e\xd8\xd1\xab*\xdc\x9bX\xedCkG\x12\x87\x1f\
+P\x8d\xe5\xbf.F\x85\xb7\x0f\x86\xa9\xc1\xe9\x0ba}\
+\x7f\x00w?\x9b\xc0\xe2\xbb\xd7\xaaW\xc3\x91R\xdc\xbf\
+\xb0\x06\x87\xcf\xca G\xed\x92M\xb6@\x1b\x7f>\x1c\
+\xdf\xba\x0e\x86^B\x1e\x13J\x105\xb95\xba7\xcf\
+\xbc\x03\xb1i\xf3\xbc\xae\xe7\xb8\xf3w\xd8\xc0\xfb\xea\x89\
+\x00'\x9e\xfa\xd0\x8d\x03\x164+\xe0\xf7\x9eY\x8e'\
+\x7f?\x1d7\x9cJ\xe9]\xda\x8ddl\x10\xf1h\x16\
+\xa9\xe1\x1e|\x7f\xef4\x1e\xba~\xba\x9aq\x80\xc0\x0b\
+\x12d\xa7\x05\xe0\xb1\x9a\xa6\x91\xda\xd8B~j\x19\x8d\
+Z\x02.j\x13'\x12\xd1\x18j\x83]\xb8n\xbe\x0b\
+\xcf.\x99\x81}fU\xa0\xaf{\x00G^\xbc\x12\xcb\
+_\xa5jp;\xe1\xf6O\x86\xb5\xe1v\x18+\x7fC\
+j\x8d\x93e\xa9\x87i\xa0q65\xe6X\x87/@\
+\x00U\x1d\x99K\x04\x9e\xb9\xeeA\x92\xfd\xe5\x04\xbc\x8e\
+\x1f\x1d\x8f\xbd\xeb\xc1\xd1\xff)\xbb\x9a\xc0)\xdf\x9b\xc0\
+]\xa8\xc6\xbc\xbd\x92\xc8\xc4\xba\x11\xa7\xae\xd7\x1d.\x1a\
+=:y\xd3K\xf2\x1c\xc2\x09\xb3s\xb8\xe7\xeai\x10\
+\xba\x88\x0f\xa6Q\x19\xa6\x99K$(\xcd\xb5\xd5\xaa\x1c\
+\xe2/\xb0\x15\x05<p;(\xf5i\xfe\x0a\xb2\x1c4\
+\xb2\x92\x19\x07R\xd1n\x1c\xb9G\x1c\x0f\x5cQ\x85S\
+\xe6\xd5\xaa\xbe\xa7]\xfb\x19\xeey\x99;\xedr\xc0\xe5\
+\xaf\x87\xd9\xb6\x04\xc6\xea\xbb\xf8\x8eX\x19\x1cO!A\
+u\xdd\xe6\xb0]\x04\x88\x9d\xae\xbb|\xd4\xf1\xff\xe6\xee\
+\x9fIDDH\xf6n<\xf3\x91\x07\xc7/\xb4I\xfa\
+\xa2\xf9\xf5X\xb2\xa0\x18S*\xfa\x11\x1b\xa4\xd8\xa6\x0d\
+O\xb8\xd9db^R\xaa\x1b\x16w01\x80S\xe6\
+Z\xb8\xf3\xf2\xa9\x18\xa6b\xc8\xa53\x08S\xe7\x8bL\
+t\xb0\xbf\x00X\xd8#\x01Y\x1a\xe1W\xcf\xf2\x97\xbc\
+c\xd9}9Gl0\x81\x86p\x1fn\xe6\xdc\x17\x9c\
+T\xaf\xfa/\xb8a\x15\x1ex\xdd\x05'\xa9\xd3\xe9\xa1\
+\xf9\xdc|\x19\xcc\x0dO*#M,\xd5\xed\xb5\xb1\x11\
+@\x0bO\x99\xab\x89\xf50V\xdd\x00r\x00\x05^1\
+\xdeY\xe7\xc5\xbcKZ\xd5X\x17\x9f\x5c\x8fk\xe6\xfb\
+Q\xe1\xe9E\x8cF\x8d\xcb\xe5\xb6\xf5\xf0\xa8\x99dZ\
+A\x88a\xb9a$\xfbq\xd6!\x1an\xbeh*\x8d\
+ \x8e\xe7\xc8\x12\x09\xbcO\x8a\x97\xf5\x15\x14\x84%2\
+\x87-H\xe3\xc8\xa1\x0b\x15\xaa\xcb\x91\x838V2W\
+\x94s\x96\xbb{p\xdd\xc9~\xfc\xf2\xc4I\xea\xf9i\
+\xd7~\x8a\xe7?q\xd3\xfa\xf4+\x93\xc8j\xba\x16\x18\
+\x5c\x09\xcd\x15\xc8;^#\xc3\x8c|\xd9\x16\x01\xa2\xee\
+4'\xc93C\x9e\xff\x0b\xb4\xa1\x179`=6\x0d\
+{q\xc1m\x22\xec\xe28\xfd\x98Z\x5c\xf9c?J\
+\x1c\xbd\x88R\xd6\xb9\xc5\xc8\x17Om\x8c\xa6\x90@\xea\
+\xcc\x9a.X\xe9>\x9c\x7f\x94\x037\xfc\xbc\x11\xed}\
+D\x82\x9e\xc1\x94Z?\xe5\x82\x17\x91R7J\x8b\xc8\
+:j,\xca\x00R\x9bF\xd2P\xb4T \x8f\x91\xf1\
+M\xda\x14.\xc48\xb7\xac\xe1\xea\x93\x02\x98OV\x94\
+6\xff\x86\x8dh\xea\xf2\xc2GK\x14\x89\x950\xd7,\
+\x83n\x0eS+\x16\xe4\xc1\xc8 \xea\xcb6\x08\x90\x1d\
+\x10\xd27{\xde\x01\xda\x97\x90\xf4}0\x9cA,}\
+\x22\x867?\xec\xa2n\xae\xc0U\xf3\x8b\x11\xf6\x91\xec\
+\x05x\x0a\x1fs;\xc0\x17\xa6\x12\x12t95d\x0c\
+\xfa\x0d\xd9^\x5cx\x8c\x13\xd7\x9f\xdf\x80v\xaa\xf6\xd5\
+m\x09j\x86\x14\xba\x072\x18\x18\xce\x22\x93L\xa8\xd7\
+\xdcN\xeet\x9e\x02\xb6\x81\x9f=d\x9d.\x1aV\xb2\
+\x01\xe5\xbe\x01\x5c{J\x09\xf6\x9aQ\x8e\xfe\x9eA\x5c\
+\x7f\xff\x00\xe2\xa6\x9f\xcf+\xc8\xc2\xb7\xc2\xecx\x99T\
+`\xcb\x9d\xc2\x9a\x0a\xe7-\x11 \xc2\x82^\x1dr\x83\
+\xb4\xed\x1f\xa6y;H\x0b\xaf\x1e/\xad4\xf0\xbb{\
+\xd7\xa9w\xae\xfbi\x04\x0d\x91(\xc9>\xc7\x09\xb8\xf3\
+y\x92-\x0c\xb8\xbd\xb3 \xc1I\xa1\x96\xc99\xe01\
+\x06\xf0\xabc\x1cxz\xc9t\x9c\xfb\xa3:\xec9#\
+\x82\xf15aT\xf3\xd3\xdc\x15Dm}%\xbe=\xd3\
+I\x0f2E\xe3\x89.\xf6X\x18\x90\x898\xa6P_\
+,\x96EcU\x0c\x8b\xce\xa8T\xd3/\x7fj\x03\x1e\
+\x7f+\x0dW\xa8JY\xe0V\xdb}\xd4\xca\x1d\xcaw\
+\xb1\xb6\x12\x88[\xd8\x01J\xf0\xb9\x83@\xd7\x8b\xc8\xbd\
+w\x18\xf9\xb4\x08Qm2N\xfe\x9f\x0e<\xf3j'\
+\xae:s2\x16\xcdw#Mi/\x02O\x05:\xb6\
+\x07\xf1v\xef\xf3-2\xbcK7)\xac<H\xe4\xbc\
+t\x8at\x22\x86^>\xf9%\xcbC\x88\x9e_$\x90\
+\xa4\xf0N\x11F}\xfb\x08\xc8\xcf!}`\xa5\xe0\x0a\
+T`\xe1\xbd)\xdc\xf8\x97u\x989\xb5\x0cO\xffw\
+-&\xf8)\xa3\x92\x1b\xe1\xd8\xfdah\xb5?\xa4\xcf\
+ n\xb4`\xd4\xc6\xeaf\x0a\xe0N\xaa\xa8\x0c}r\
+\xb3\xe3\x05\x19\x0f\xce\xd0$\xbc\xf0AB\x01\x1f,)\
+\xc2\x19G\x04\xe8\xef\x0f\xd0\xdc\xa4\xef\xbf\x03\xb2\xdf.\
+\xfc\xe4j\xd1t9.:\x9dJ\xc3m\x0e\xa1:0\
+\x88\xba\xe2~\xda\x10\xbd\xd8-\xd2\x8f\x9a@/\x83@\
+;\x07\xbc\xcc#\xb6\x83\x09\x9a\xe9\xb9\x01\x9cs\x147\
+0\x14\xc2\xca\xa6~<\xfe\x1a\xa5-\x1d4\x9a\x13\xb0\
+:\x9e\xa6{\xdd\xa7\xe2\x16\xa3\xa9v\x14\x02$\xa8A\
+A\x11m\x86\xd1\xfd8|~\x0a\xd0\xb8\x13\x0f\xbf<\
+\xa4`\xb9\xfe\x8cj\xd4W\xd0\xf6N\x9b\x94\xce\x82\xbd\
+\xad\xc4\xb3\xea\xb5\xf3\x07\xd9\x04\x8b\xf6z\xce\x94\xdd\x17\
+QGc\xc7*Cw\xa2\x0ci\xad\x0c^/\x01\x22\
+`[k\x81\xed\xcd kJ\xa6L4\xd24\xbe\xe9\
+,\x92>\xdb\x83/\x0fbC\xaf\x85@0\xcc\xe0\xcc\
+\x9f\x08\xd0*\x1a\x1f\x0e\xcee\xef\xbe\xf4\xc9#\x80\xc0\
+P\xf23\xcc\x02\xf4\x7f\xc4\xd0U\x13\x9c\xc1\x19xo\
+m\x0a\x8f\xbc\xd8\xc9n~\xcc\xdb\x8fB$C]/\
+\xd2T\x01/\xaf\xca@\xbb\xf2a\xf7Q\xcd^\x86\xf0\
+\xb1\x03\xab{\x8bp\xf6\xad\x09\x1c{M/.\xf8C\
+\x0a\xcf\x7f\x1a\x84\xe9,\xa6m\xc3\xdd\xdd),\x10,\
+Y[&\x86c\xf6#\x0f!\x80\xd7?\xe8\xc5\xeb\x9f\
+Q\xa8\xfah0\xd1*\xb6\xfa\xde\x86F\xbf]S\xb0\
+\xdaZ\xcbF\x80L\xe0\x10]5LL\xbdA\x0b\x8c\
+\xba\x9bR\xf4\xf5\x95\x04\x98\xed\xf2\xd3#\xa8-M\x11\
+\xc3\x0cLP\x88\x18T\xde\x86!\xe7]\xfc\x90\xf7M\
+q\xdd\xf2MMKI\x9f\xb1\x02\xb8\xf5\x09Zw\xcf\
+\xb4\xa1\xb9\xb5\x07\xcb\x1e[O\x13\xf73\xdc\xf0\xa8\x81\
+8\xa9\xc2%\x16\xdd(\x82\x93\xef\x06\xc72(/F\
+\xce\xfcn2H\x93\xa0O0\x81k\xbd\xf4\xb4\x88\x9a\
+\xe5\xdf\x1f\xc7i\x9d:\xe0\xa5l7z_e\xa0\x89\
+\xfawT\x04I\x14\xb8\xdd$\x8a\x9b\xea\x849\xf8\x1a\
+\x02$\xff\x8dC\x06\xde\x5ce\xab\xa4\xd93B\xb4\xb3\
+\xe3\xe42F!\xb6+\x92\x0b\x03}\xc1\x99+\xcf0\
+\xe0\x973h\xe4\x88\x09(\xc4H|\xa4y-Q\x22\
+i\xa1\x90\x1f\x1e\xaf\x08\xc2\x0c\x16-[K\xf5\xd9\x88\
+K\x8f-\xa2.\x1f\x22\xf2d\xb9B\xc0&\xa3D\xa2\
+\x1d6#S\xbd,O-\xc2\xe17\xb0g\xa3P\x01\
+\xf0\x16aX\xdf\x9d\xc1\xf4\xcaqH\x0e\xff\x9df\xcc\
+e4@\xc6\xf1\x89\xfd\xae\xd0=/(i\xa5w\xac\
+\x8d\xeab%P:\x15\xcd-)<\xfd\x96\x8d\x80\x17\
+\xdf\x8b\xa2\xbe\xb2\x98Z\x81\xa6\xb1\xf4\x93\xc6\x17\x0af\
+\xab}\xa30d\x9e\xc3\xd4\xf3\xc2\x13Y\x98\x05\xbf\xdb\
+D\xa4\x88\x1a\xc0\x8cS\x96\xd0\xd4\x16~$%\xfa\x9c\
+Y\xe5>?\xca\xee\xa2Y[\xda\x93(\x0a\xba\x19\x1a\
+3\xf0_w\xac\xc1\xc13g`n\x83\x9b\x14\x98\xa3\
+*e'\x87\x1f=I'\xb29\xf1\x138Q\x9e\xaa\
+df\x09\xaa$\x07}x\xe5C\xdbm~\xef\xd3\x18\
+\x9a\x18\x8a\x9b>\xbe\x1czf\x13\xccX\x8b\x0a\xb0Z\
+\x0ay\x22y\xa4\xa9\x8b,\x8cX+1mO\xd0\xdc\
+\xc10V6\x86\x08#\xd6\xb7>\xd4\x8a[\x1f-\xc3\
+\x94:\x07U\xd5(\x00\xf3@\xf2\xa4\x86\xb0\xcf|.\
+\xf7\xf3\x1f%)x!\xaa\xaf&\xecd\x88+\x88\x9f\
+\xcc-\xc5\x84\xe2a$\x92\x8c\xdeP%x\xf54\xbe\
+\xbbO\x11\xdd\x5c\xe2?\x9e\xc0\xb8\x0a\x1f6\xf5$Q\
+\x16b~\x80n\xf5So'q@\x83\x8fBq\x80\
+\x1e^\x08\x8f\xbf\xeb\xc2\x1d\xff\xe8W\xfeB\x96Q \
+R\xbe\xbd1<\x0b'\xaf\xeb\xea\xc7\x9a\x96^\x10f\
+l\xec\xcd`M;\xe3\x96V\x91\xf2%,\x86\xe75\
+\x09\xa4\xaa8\xb5Q@\x00\x97I\xdf\xd9\x8a\xb7*\x0c\
+g\xe9~\xae\xeb\xa0\xd4`\xd3)]+\xcb\x5c\xe8\xea\
+\xef\xc7\xea\xb5\xea\xd6\x97>|\xcc7\x9fy\xb5\x0bO\
+\xbf]\x8d?\x5cX\x8e\x86rZlq\xfa\xf1Y\x0b\
+\xfbL\xca\xe0\xc6\x0b\xa7\xe2\xd7K\x9b\xd08.\x89F\
+\x9a\xc8\x99\x9c\xa0\x0f\xf8\xac5\x8dX\xda\x83\x12\xa7\x85\
+\xae\x94\x07\xd7,\xef\xc7\xe7M[F\x9eT\xc7Q\x87\
+p\x11\xbdQ%\xe3sX\xb31\xc3h\xb4\x06?e\
+d\x8a\x9b\xec0\x98\x9cqpg)\xcf\x18\xdc\xe3[\
+\xdc!M\x8c\x8e\xc4&\x15\xb7\x1f\xa6\x0d\xb0\xbe\x8b\xca\
+\x93\xcdI\x9a\xdb\xd8\x93AU\xd8\xab\x90S`\x01\xd9\
+\xed1[\xfe\x81\xcd\x1e\x9b{\x15,A\xb7#\x87\x97\
+\xde\xea\xc0\x99KL\xfc\xf9\xd2\x08&R\xff\xc7\x18\x1d\
+\xf6\xe91,8\xbc\x842\xa2\x11W\xde\xbe\x86C'\
+\xf2\xbbC\xa3\xa8\xd4\xc5\xb0\xb9\xa8D\x0d\xe9\xac\x067\
+\xd5c\x98r\xaa\x22\x12 \x151\xcaD*\x12\xc1(\
+M(O\xa8\xa2\xbd;\x8d\xf1\x11{\xfe\xf5]Y\x0c\
+\x93}\x8a(\x08\xad\xe4z\x1a!\x14\xeeN\x09\x98\xf0\
+4\xf2\x96A\xcb+\xd3\xa9H(\x91\xceQ(\x09\x99\
+\xb0\xc9\x88l\x9d}\xc4\xca\xd7\xd24\xd4\x8f\xf3`\xc5\
+\xbb]8\xe7f\x1d\x7f\xbc\xa4\x02\x13B\xb4\xd6\xe2&\
+\x02\xdeA\x9a\xc8!\xec\xd3\xb8\x1b\xfe\xb6\x22\x89\x8f\x9a\
+\xb3d\x07\x07.\xfc\x01\xedz\x0cs\xbd\xb6\x0eOp\
+i}\x14O\x1a\xe3\x8c\xbd\xfcl\xaf\x15\x90\xd29\x90\
+U\xda\x01\x01&U2\x94s9\x1aHy\xb8\x98\xca\
+\x91\xd7\xb9_\x0c$\x9a9\xaa\x08\xf2P&k`\x90\
+\xee\xa6j\xa30k\xdf\xf8\x92G\x8e#s\x8aNo\
+\xd9\x94FM\x85\x0b\xff|\xa3\x03\x0b\x96j\xb8\xfb\xe2\
+0\xc6)\x93\x95\x02\xda\x15\xc5\x11\xd3]8h\xaa\x9f\
+\xbb\x16B\xc0\x9d\x83\xdf\x11E6c\xd0\xf1\x22\xbf\xf3\
+\xfdtF\x04\x15\xd9\xd3\xde\x1b;\xce\xb8\xd5\xb2\x04x\
+\x91\x0d\xd2:\x07\x0d%t\x99k#\xf0\xcd\x0c\x1c\xd3\
+\x83\x12\xc0\xf9o3\x99\x0c$\xe2X\x82\xfbZ\x88\xba\
+UHM^\xcd\x0b\x97\xfc\x17\x19\xf4K\x7f8\x06\xe5\
+\xa0\x8do~o\xef\xcd\xa1:\xec\xc0\xb3+6\xe1\xc2\
+;\x06\xd1\x97\xa9 \x05X\xcc\x18Q-\x92\x02]\xe6\
+ \xe3\x81\xdd\xf0\xa1\x9f2\x82*R\xb0\xc7\xc9\xdd\xb4\
+\x09\xcaB\xa2\x0a\xb8x\xa5J\xed5n\xbd.y\xce\
+\xe9T\xeb\x89YT\xbd\x02\xb0\xad\xf4,\x95h\xb5\x9f\
+\x89\xa4P=\x05\x07\xf2)4\x19\xf0\x9bh#\xc3r\
+\x82\x9e!\x13Ue:\x1eya\x03\x16\xde3\x84\xa8\
+Y\x0e\xbf\x87F\x96\xec\x05\xf5y\x96\x9ec\xce$\xb0\
+yr\x95\x1d-\x0d\x188p\xa6h\x07\xc6\x02\x02\xf6\
+\xfe\xd1\xc9\xdca\x1b\x99w\xab\x9ey\x03\x808\xa0]\
+n\xd1\xc9\xa1$\xa4P\xb1\x18p\xb0{\x16\xc6\x1e=\
+\x80\xacg\xe4\xb3\xd5\x80\xbbr\x99\xa3\x0f0DyT\
+U\xa6a\xd9\xa3\xeb\xb1\xf8\x01\xfa\x1a(\xa7-@\x0b\
+\x93\xe4\x22:^\xcd#\x83rN\xaa}\xf8\x9d)\xfc\
+p\x0ec\xffl}\xbd\x09\x15n\x97\xfb\xb6\x7f\xa2n\
+os(\x0b0\xaaL\xcaQ\xa6\xbe\x00\xa4\x22\xc5v\
+7\x9b\x02\x84\x0c\x98\xd6\xd6\x5ca\xda\x8b\x06<\xb4\xcd\
+K\x026\x99\x15\xc8\xa2\xc0o\xf2\xda\x16\xe4f\x8f\xb3\
+y\xa1\xf9\xeb\x9d9\xc9Z\xc4\xb9\x8a\xa5t\xda\x08\xc0\
+\xef\x97\xb7\xe0\xb6\xa7)\x8b\x5c%pj\x8cD\x8f\xc2\
+\xba\xf4\x15\x8e\xcd\xa4\xd3\xf8\xf6\xb4\x1c\xfe\xf7\x92\xa9\xe8\
+!\xf2\xdc\x8c\x5c\x85\x8b]\x0aay\x8e(,Y\xe9\
+}y\xab\xba\xc4A\xca\x22\xb5\x98\x14~\xce\x89\x84\x93\
+*$\xcf 6\x0d\x11\x22\x8dV\x9e\xee\xae\x12\xf8i\
+f:\x99\xa8\xb4I\xa0`\xed\xc9b\x9c\x8c\xea\x943\
+kS\x13\xf1a|\xa5}\x96,\x8e\xc7m\xab!Y\
+\xefhD\xc9\xe4_\xd4\x0a\xfdc\x09C\xb9\xd8\xd2\xf7\
+\xb2\xff\xeb\xc0{-Tu>\x86\xcf\xa50b\x04\x1c\
+~#\x16\x0c\xb2\x84\x9e\x1b\xc2\x82#t\x15Z\xdbH\
+\xb9\xedg\xf2T\xc2i\xc2:2\x7f\x01o\xd2_Z\
+U\xa9\x93\x08 \xff\x1b\xbd\xc4\xd8D\x02B\x0aR\xbb\
+XP\x83|\xc5rx\xa1\xf9\xaa!\x8a X\x04f\
+im\x0a\x10\x81\x14.f\xbc\x8e\xd9\xdbl&M\xbb\
+\xda6\x90\xd4\xc8\xf9\xc3\x84\x0a\xe6\xfd<^\x92\xb3\xc9\
+\x94\x96\xad>er\x99cGM\x10+\x8b\x96\x84I\
+]\xa5N\xfb#\x8e\xf7\xd7f\xb0\xffdI\xc3\x89\x05\
+g\x03^\x18G\x0c31\x90\xdcZ\x1f.<\xba\x9c\
+\xeam2\xae\xbf\xbb\x19u\x91\x9c\xf21\xa2\xb4)F\
+\xe6\xce/\xa0\xae\xd2\xcd\x18\xa3\x13\x06\x05\xac\x1e\xa8\xa5\
+,\x0cr\x5c{q\xb6\x1a\x14\x0d ,\xc0\xca\x8c\x1c\
+) \xe020\xa9\x9a\xf2\x80\xad\x94\xe4\xd5\xc9\x94\xf6\
+Z;,\xc0;\xc5\xa8\xads#\xe83I\xbe:\xd6\
+\xad\xcbb\x03\xe3p\xb4\xb1\xa4;\x1a\xc6\xfb\xd0\xd6\x95\
+\xa6*\x95\xb8\x81\xec\x98\xba\xfd\x85\x87\x02\xa9k*'\
+`b \xeaTq\x02\x158\xe1\xfb\xf9\x8d\xcc\x8f\xc1\
+\xf08\x07\x16-\xe5u\xf5\xe1\xd2\xe3\xcb\xb9\x8ez\xdc\
+D\xf6\xa9cD,\x9b\xd5YO\xc0\xf0\x08\xeb\x0d\x94\
+\xf6\xe0[\x8d\xe3]t\xae\xe8\x88\x89\xed\x10\x9c\xc8\xcd\
+\xa6\x10\x15\x989\xb0m\x08\xf1\x82b\x8f\xa9\xedI\xe0\
+\xfb\xe4\x15\xc6\xdd\xab\xc5\xefw\xa2\xa9M\xf4a\x10\xe7\
+\x9dP\x8e\xb93\xdd\x98T\xe5b>\x9f\xf1:&I\
+\x0dzg\xc3\x09\x13\xad]\x11\xbc\xf1y\x16\xb7\xdc\xd7\
+\xc7\x1a\x80ae\x83'\xb2.\xf4\x0fe\x95\xf5(H\
+\xdd\xa9\x96\xc7\x84\xc7MG\x89\x8b\xb3/\xc7\x22#:\
+1\x8c\xb7K\xe1D\x80a\xf9\xab\x98,\x8d\xa5&\xe2\
+\xaeGZQ\x1bq\xa2\xad\x9b\xde\x22\x138]\xd4\xff\
+\xd2\x1ak\xbc\x14\xec\xf4Be\x9fYz#yN\x18\
+\xb6\xf7I\x04\x08~e\x9b(q\x83u\xb0\xbc\xbbQ\
+\x11\xafb\x81\xc2^\x98PW\x8a\xff\x98\xe5\xc5E\xc7\
+\x15\xa1\xa1\xca\xa0A\xc2\xfa\x1c+FQ$\x03\xdb\x0b\
+3\xe9\xe0\xecU\xeb\xc1\xbc\xbd=8\xe3\xf0Z\xdc\xf7\
+\xaf\x04~\xf7\xe7\x16>\xcf\xa2\x82\xa1na\x09\xf1\xe0\
+v\x84\x04\x07u\x99\x91\xb7\x5c\xfc\x1eA\x80$U\xb8\
+&\x8e4f#\x09;]:\xabN,\x143\x7fx\
+\xc3ia\xc4\x93\xe3\xb1\xfc\xa9\x8d(/fvJ0\
+\xc8V;\xa1\x18\xd3\xc6\x93\x9a\x19\x0ecd\x9ea>\
+\xa6\xcf\xc4\xdaSitj\x87\x91\xc1\x85\x0a|Up\
+\x94\x1c\xc8j\x97U(%\x89?rE\x19\x1a\xab5\
+\x94z\x87\x99\xcd\x89s\xd7\xd9\x9d\x02Db\xfc\xb28\
+\xc9\xfc\xb8\x88Y\x9d\xce\x05\x8ca\xcc\xaa\xf2a\xf1\xc9\
+A\xea\xe9\x99\xf8\xc1\xa5-\x04>1\x82\x84\x1d\xb1\x83\
+\x84\xcd%\xd0\x22M\x04\x96 \xc0n\x02H\xe1{\xfe\
+V\xe1D$\xb8\x88\xdd\x04Cae\xbe^\xdctN\
+\x84\xbe\x81\x85G\xff\xd5\x8e\xf1\x15\xb6|?l\x0f?\
+&F<\xc810\xaa\x17\x1dC6\xafU\xfc/A\
+8Ao\x1e\x01\x9cD$.\x0b\x1d\xf4\xf0l\x18]\
+w\xc3e%\xb1o\x1d\xd3\xce\xac\xc31\xe9\xad\xc1S\
+\x81\x95\x9dn\xbc\xbb\x9a\xe5.\xed\x8c\xd4p\x22\xbfG\
+\xecz\x17m\xf7\x0aL\xa7\xef\xae3\xdc\x8d\x5c/\x8e\
+\xdd\xbb\x08+\xeel\xc0\xdc\x9f\x09\x12b\xd4\x1cLy\
+\x93\x126\x93u\x01\x82\xcdg\x85\xa0<\xabx\x84\xfb\
+H\x95JN\xd9pl\xee\xb8\xcd7\x9b\x1db,\xaa\
+\x88\x84\x06\xb0p~9\x11\xd0\x8b~\x0aUi\x87\xec\
+Es\xda\x9bC\x8c2\xccQ7\x07\x16\x8b\xac\x04\xd6\
+\x02e\xd9\x08\x10\xb1\xc9\x9b\x96\x93\xd1\xde\xf2}a\xf9\
+w\xa3\xd3\xb0\x0aI\xa3\x1e~\x0a\x8f\xf5C\xa5\xb8\xe5\
+\xf1\x18k\x00\x9a\xb6\x99\xbep\xe3\xec\xe3\xeap\xe9\x09\
+\x15tq\x87\x99\xc0\x1c\xc2A\x8d\xcc\xe9\xdf<\x09G\
+]\xfc\x09\x1c,\x99\x93T\x97\xa8\xbb\xed\xed\xa7\x90l\
+\xcefK\x1aB\xb2\xe3\xb2G6\x83\x16\xe6\xd8\xfeY\
+\x04#c\x15\xb4\x11\xaaKM\x92=\x05\xf1\x864f\
+14~\xd0\x0c\xaa\xbcT;K\xed8V\xf9~\xe4\
+\x7fF\x8a\x84b\xf3:2\x8f_NEKPa\x85\
+qA\x98\x03\xe4\xc7b\xd6\xfc8\xf1A{\x09\x8e\xb8\
+\xa2\x13\xb7<\xd4\x8d9{R\xdfQ\x02H\xdc\xbe2\
+\xec\xa1Yj/i\xdfY\xe5xbE\x1f\xa6\x9c\xb9\
+\x01o\xb4\x141\x95\x16b\xee`\x10\x87\xcf\xc8(]\
+\xddE%Q\xc5\x98\x82j\x05\xd4\xdbW#G\xb1\xe4\
+\xd2\x5c\x97\x08^\xb7\x04%\xa5\x09\x06v\xa2\x89\xc5h\
+\xd2\x80qP\x157\xb5[\x04\xde\x8e\x06\x9d~d\x09\
+\xea*4\xa6\xea\xbbYXu\x0amgn\xac\x14g\
+*\xd2\xb2\x17\xa2\x10\xa0t\xa2HF\x89\xf9\xb7\xfe\x05\
+F\xbc\x13\xfe\xe0\x04\xac\xebwc\xaf3[0\x87X\
+\x8c>3\x0dO.\xae\xc2]\x0b\xa71\xb8@\x040\
+\x9e0@K\xec\xca3\x1b\xf0\xd4\xe2j\xac\xbdo7\
+\x1c?\xc7\x8f9?\xfb\x0c\x9fu\x86\x985\x225\xe5\
+\x86q\xe2\x5c7&\xd7\x97S;\xa4\xe8\xdaz\xd5\xdc\
+y\xe4o\x01\x9a\xa8<\xfa,l\xf4\xfd)\x0fv\x86\
+\x02\x0a\xf8\x11\x01\xebv\xe6\x10\xcd\x14\xe1\xce\x7f\x90\x0d\
+\xd9&\xd5\x95\xd0d\xa6\xf7\x97\xeae\x14\x89\xdbV=\
+\x8fl\x1cQ^/%\xa4\xea#\x07\xf5M\x84\x81\xd2\
+\xc1\xcc\xa4\x9a=\xcb\xe0\xa1A\x94\xa2\x90[\xfaX\x94\
+]\x12\xd8\xc4\xdc],\x96B\x89\xbb\x1d'\x7f\x1b*\
+\x1b\xfbqK\x1a'\x1e5\x01\xe7\x1d\xe5\xa1\xa0\xeb\xc1\
+\xc6\xae\x18:\xfa\x85\x86\x0d,\xba\x8f\x91\x1e\xab\x84\xbb\
+\x92AMI\x06\xe7\xcec\xf0\x81Mb\x82\xaa\x15V\
+n_\xa9\xa3>\x82\x15\x1a9y\x16\x18\xf5x\xcc\xaf\
+6\x9a\x08\x02\xa3Y\xae@\x19\xee{%\x8b\x87_h\
+W}\xafb\x99\xce\xa4\x88\x858\xe3\x9cz\xf88F\
+U\x0e\xe2\xeeS\xf0\x8d\xda}\xe9\xc8\xb7\xb9\x1a)(\
+\xa2Z\xb0\xfa>P\x19!W0\xc2\x9c@\x16K\x1f\
+\xeca\xfd\x1e\xf0\xdck\x9d\xb8\xf1Q\xd6\xe2\x98\x11F\
+\xdb{q\xee\xf7\xfc\xd8c\xf7\x1a\xfc\xe2\xe8 m\xf8\
+A\xf4\xf6\x97b\xd1\x03q\xc6\xe1\xbb\x95P\xfc\xebs\
+\x1b\xf1F\x13%,I\xd2\xc9\x14\xd3\xfeS\xc5\xac\x0e\
+\xa0\xbd=\x832\x1aVc\xc0?\xa2\xb6\x84\x05<\x12\
+\x19\x1d\xb3\x97,yt\xa3\xdc\xa0u\xea/\x0ab\xc5\
+\xe7n\x9c\xb7t\x93zx\xfc\xa15\xf8\xd1\x1c/C\
+\x9a\xdd2\x1ck\x0a\xe7\x13\xfb5\xf4\x85\xc4\xdd\x17\xf6\
+\x92\x15\xd8\xab\xb0\x9d!\xb9\xc9(\x895\xb4R\xe9l\
+\xcaKJ{\xb1\xec\x18;\xe3\xa6\xd5T8\xb1dy\
+3\x9e\xfd\x88\xfd<\x01L,\x1a\xc0c\x0b\x99\x8d\x9d\
+@yA\xc0\xee[a\xe0A\xc6\xf4+\xb9\xd1\xc3q\
+{\xe0W>\xa2\x06a\xbc_\xb3\x18\xfc`}\xdf\x1e\
+3\xfcR5D\x89l\xf3\xf7\xc8\x86\xf3\x9e\xb4\x02\x05\
+\xf8K5\xb2\x80}o,D\xd9O\xd4\x1b*\xc4\x1e\
+d\x9ck5Y\xeeWw\x12\xd8\x14)\x96\xf1\x8ck\
+N+C\x913A\xc7\xa9\x13Z\xe4\x5c\xe8\xe3\x0e\xe5\
+\xfef)\xf78\xa2b}9\xa8/6\x0b(\x89H\
+\x04\x18\xc9V\xf2.y1eQ\xd5\x89\x05H\xc7\xc8\
+\xa7\xd3\xc6\xb7\x97r\xc9\x1d\x1dX\xcb\xec\xad\x8f\xa5\xac\
+\xe3\x02=L68\xf0\xe2\xc7N\x5c\xb4\xc4\xc6\xbc\x94\
+\xcd&\x92\xb6(_\xd5\x96B\x9c%-2\xa9Du\
+&W\xd9\x80;\xe9j\x8fn\xf62\x04\x016{\x84\
+\x03L{\x93\x9fG\x0b\xaa\xd1\xfd\xe5\xbb\x04;\xb3T\
+\xcf\xa1\x90\x0bm\x03%\xb8\xe4\xae>\xbc\xfb1\x11\xc0\
+\xf6\xf7\xdf\xd6bVM\x86\xd1\xe55\x5c\xfcd\xe8\x8d\
+\x0bh\xfa\x96p#\xa9\x16G\xb9\xc1\xaa3\x0fy\xd1\
+\xcfe\x98d\x01zY\x22\x1f\xd2\xb4\xe3\xfb\xa3\xf6\x82\
+D\xc2\x8a\xfa\xaa\xa2\xc5\xd7\xccZ\xbd;\xfe1\xc82\
+\xb4\x90\x92\xba\xc3\x19?\xeey^$n\x0c\x8d\x13<\
+\xcc\xf1\xd3\xf4U\x02\x8c\x19\xb6\xe14\xa3;\x82q\xb2\
+\x02\xc7\x0cR\xa3\xa8V\x80\xd8\xbe\x1a9\x0a\x17J+\
+\x09:h\xc7\xf3\xbd\x11^\xdd\x8c0y\xd5\xa4D3\
+H\xca\xc1b/\x9a{\xcb\xf0\xcb\xdb\x07\xf0\xe4\xbf\xed\
+\x0d\xb8k\xe1n8z\xcf\x1c\xb5\x09\xe3\x9b\x5c\xbe\xde\
+\xb8\x08Z\xe9\x1e\x04-N.\xb77@M2\xea`\
+\xfb\xb1rC\xd4\xa0\xd4\x9fr>)T\xf2\xd0\x99\x18\
+\xdd\x86\x06eg5\x15\xd7w2\xd1fR\x9d\x84\xdc\
+\x19\xfc\xe8\xdbt\x1d\xc9hk\xa8w\xcb\x8a\xe9qI\
+\x8e\x9b\xcdK>v*s\x94\xfa\x9c\xc0H\x12\xe3\x8b\
+Z\x81\x05\x8a\xfcn\xb2\x00\x91\xa5\x100\xfa\x0d:7\
+\x1c\xdbI\xa7+P\x5c\x82\xb7\x9b\x8b\xf0\xd3\x1b{\xf0\
+\xc4\xcb\xb6\xd0[\xfa\xabi8\xe3;t\xab3\xf4\x0a\
+\xd3m\xc0\xa4\xeb\xa0\xd7\x1d\xc7rA\x9a\xef\x8a\xdf\xb6\
+\x84\xa702\xf1\xce\x07D\x97\xd4\x04\xe9\xdeq\xca\x18\
+\x09z\xb5\x11w8\xcb\x00iu9\xb32T5\xbf\
+\xfdE\x03\xab\xc1X\xe5\x9d\xa1c\xc1\xd8\x81\x95\x8d\xf2\
+\x1a\xb8\xfa\xec:5\x9e\x9b\xc5Dn\xb2\x85\xb4\xdaJ\
+/-E\x02\xcd\xff\x14\xdd\xd7N\xa5!d\x07\xd5\xe3\
+m\x0e\x85\xe5I\xd5\xb8\xca\xfe\xe4\x85\x94\x10\xa9J|\
+0\x99\x11\xf0s\xf7=\x95\xf8\xf3\xcbN\x1c\xb5\xb0\x0d\
+\xaf\xbe\xdf\xa9\xc6\xb9\xeb\xf2i8\xefHV\xb6\x10A\
+i\xd6/k5\xe7\xc11\xed\xe7|O\x9c].\xbc\
+@^\xdb\xccZ`\x01\xf1\x03\xe8#\xeb\xa1\xa9\x04\x8e\
+\xfbI\x12\xdc\xbd\xde\xce\xad\xc9;\x1d\xcc\xae\x1c}p\
+\x0d\x16\x1c)\x142\x8c\x8f:Jp\xf5\xfdY\x0cf\
+\xc3\x8c\xdc\xf4\xe3\xcc\xc3}\x98\xb3w\x04\x9dT\xc1\xc5\
+\xf9H\xd2\xec\xe9>\xa6\xbc\xe8\xcf3\x10\xd9\x1fs\xe2\
+_\x9f\xd8\xb2!\x9d\xc9\x83\xba\x0d\x22\xec\x1b,4'\
+\x052#L\xc4\x09\xe5p\xdfYFO=O5\xf7\
+\xc1\xc62\x9cw[\x14\xa7/\xfa\x1c\xfd}\x22\x80C\
+\xe4\xf9\x198\xebP\xbeKc \x15#\xdfW\x9d\xce\
+B\xc9\xabYEN\x89,\x19\xa0/\x00^`\x1b\xa1\
+\x00\xe8\xac\xf8(\xdd\x8b\x02\x83wSq\xcc\x9e\xe6\xc1\
+w\xf6\xad\xa4K\x09\xd4\xd7\x16\xe37g\x96\xd2\x0d\xa6\
+\x8d\xcd\xfc\xfdM\x7f\x1b\xc6\xd2\xfb\x9bY2\xc7\x1d1\
+\x83\xa8+\xeb\xc3\xa2\xd3\x98\x87b5Vk\x07\x93(\
+\xd5\xa58tw7\xe7\x8fs!>\xac\x5c\xcf\x85$\
+\xfa\x95\xbf\xde;\xc4\xef\xa3[\x1e\x1f6\x99rA\xe4\
+U\xb1\x04u\x0aZ\x1f!7]e\xf8\xb0#\x8ck\
+\x1e\xc8\xd1(k\xc2=O\x90\xbc\xd9\x8e;d\x1c>\
+\xbag\x22\x0b1I\xf2I\xd6(&\xb9\xf3\xe3\xcf\x83\
+s\x8f\xdf0\xadN\x8b\x95\x89\x9e\x1d\x01/\xe3\x10\x01\
+\xd2H\x01r*\xdb\x9d\xde\xe0\xc14\x1dW\xd3\xa6v\
+\xe0\xb2\x13\xcb\xe4.N\xff^%fNf\x10\xc2\x08\
+c\xd9\xf3Y\x88\x9e/%\x81\x9c\xfa\xdb\x0dx\xa7\x95\
+\x15\x19,\x89\x9dK\xb7\xf9\xacyD\x02\xdb\xcd\xe7W\
+\xa3\xae\x84j\x95\x83\xc6\xb2^<\xf9\x96\xa8TN\xc6\
+@D./\x0b\xec\xfd\xde\xcc\xea\xd1\xa4-#\xfe\xfe\
+\xf60^]\xc5\xfc^_\x04\x8f\xbd\x17\xc0/\xeeL\
+`\xcf3>QQ\x1f\xfa\xb4\xb4\xf3K\xb0l\xe1\x14\
+\xdc\xc3\x84\xca\xb7\xc61e\x1fm\xa5P\xa4\xb1S\x7f\
+-\x1c{,&\xc2\x04x\x91\xf8y\xd0\xd4\xcc\xdb?\
+\xd85BJ\xe0\xd0\x1a\x942\xf8\x96\xe5\xb0>ea\
+\xa4g\x0a\x5c\x0c#\xdd\xfet\x86\x92\x96\x91\x97\x1f\x97\
+\xb2R\xd3\xc2\xad\x0f\xae\xe3N:U\xad\xde\xda\x8d\x09\
+\x1c\xb8G9\x8e\xd8\xaf\x84\xfa\xdf\xc0\x92\xfb\xdap\xfd\
+y\x93\xf0\xeb\x1fP\x88\xa5{9F\x11\xabJ\xdd8\
+\xe1\xca\xcf\xf9\xe3\x07\x91\x05\xa4\x0a\xce%\xd3\x89\xe7+\
+\xa9.i\xa2*\xe5\x9b\x94\xd3\x0f\x0e\xa60(\x06\x03\
+\x7fa\xc27\xe4\x8bj{\xee\x16\xc6I\x87\x16\xe3\xf8\
+\xb9!\xd4\xd3\xc2\xcb\xc6z\x90M\xb3\xf0\xc97\x09Z\
+\xe3bh\x22\xf0\xe8\xa6\xab\xc4\xe7N\x02/\x03o.\
+\x92\x12\xbd!\xbf\xfb\xc92p\xf0\xe1B\xa6S\xfe\xc4\
+\x1fq\xcdb\xa4\xcc\xc0\x03+r8u\xd1:v\xb7\
+m\x03\xb5\xa21\x0ew]\xd6\x88\xd3\x0f\xa1\xe0a\x95\
+\x86\xd4\x17\xf72\xb3\xf3\xd3[\x92xn\xc5\x861z\
+\xef\xf8\xd6\xf4\x86R\x1c@\x03\xea\xe0o\x05q\x10s\
+\x01\x93\x22\xdc\xd5t?)\xb4\x95\x9b\xc5\xc5W\x9cC\
+Uw.)wO[\xda\xef@\xe0\x8d5\xe3f\x04\
+\xf0\xa9xJ\x1ak\x04\xb5h\x13\x91p\x01\xbd\x9d\x17\
+Y\xa5=\x9d\x02\xc8\x81\x96.\x0b/\xbc\xc7_\x81|\
+\x98\xc0j\xa6\x9b\xa3\x0cB\xf8\x99\xaa\xdam\x82\x17\x07\
+\xcd\xf2\xe3\xb0\xbd\xbc\x986\x8eak\xea`\x83\xfc\xe7\
+t\xd2#\xa4\x14n\x1b\xd0T\xff\xa6\x0d)fi\xb3\
+he|\xb1\x83\xc5\x10\xeb\xfb\xb3\x88\xf7\xd9d\xaa\x95\
+X\x98\xc2,Q\x15\x93\xa0\xb5\x11\x17\xa6\xd2\xa6\x98\xca\
+(\xce\x94\xf1\x0c\xc11\xfa\x1cb\xc1\x03R]\x88\x0f\
+oR\x8e\x8d\xa3\xec\xfb4oO\xa6\xb4?\x8c2\xab\
+\x94z\x9e?\x99\x11\x12\xda\x85\x9d/ c\x0b\x04\xc8\
+M\xf9-\x90\xeeb\x848\xfa\x19\xcc\x95\x8bXh\xf8\
+\x08\xd5\x02UZ\xa8\x91\x14\xe2D_T~\xeb\x93\xa3\
+\x19*\xd1\x18\x1a.4p\xca\x8b\xb8\xebL5'\x86\
+\x99wc\xf1\x83\xd4ZI\xc4I\xd4\xb9\x8b68\x9c\
+LJ\xd2!\x97\x14u\x94\x96b\x8c\x91\xe68\x11\x98\
+c\xe6Gd\x81\xd4\x01\x05\x18\x5c\xf1\xd3L\x0e\xd2\x0e\
+.R\x9a\x80Z\x83U_9\x96\xeb\xa6\xc8\x09\xe2\xcf\
+;\xc2'\xd2\xab;\x1aZ\xe5\x5c\xc6,X\x0f\xcc\x94\
+\x99Xx\xb6\x91c\xb3S\x01\xb0\x9d=o\x83\x00N\
+\xc5Ail\x0a\x12R\xc4x\xebC07\xde\xcc_\
+\xb41uN\x80\xbc\xbe0\xa9\x84*F\xe5\xd9X\xce\
+\x9e\x1db\xb9\x1b\xf9\x91\x00\xb3p\x83\xb5x,U\x0f\
+\xef\x07\xab\xff}\x98\xbd\xaf 7\xcc\x82e\x0a~\x89\
+\xf8\xc8\xaf\xc8\x049pPP\xc9\xef\x00\x15\x1d\xf3Z\
+\x8a\x17\x19\x88E\xae[\xc5*\xe5\xc7`\x22+I@\
+T\xcdG\xc0Y>\x97\xc1\x8c\xfd\x89\xed\x19\x8cYV\
+r}\xccV\xf0\x07\x98\xf6\xae\x8fm\xe1}\x05\x04\x08\
+\x0adQ4\x8e(\x13huS\xf5\xaf\xe2o\x84V\
+\xc0\xea}\x95\x88x\x83\xc2\x98\x11\x16\xe9D\xa4k\xae\
+*.r6wg\x0e]\xce\xb9\xf6\x22iShL\
+\xb7\x8b D|\x03\x7f8I\xca\x88\xaea\xf5\x19%\
+v\xaa\x952\xa2\x8dRp\xbd(\x1f{.\xe1\x04\x07\
+)\xc5U\x0b\x07K\xf2\xb5\xc0D\xfa4\x8d\x8c\xe15\
+\xc0b\x0cO\xc2q\x96`\x97\xd4)YlM\xe4\x95\
+\xf2\xe9\xbf\xdc\xae\x0bx\x856\x06\x05\x14\x1e\xf1,;\
+#?n\xe4\xb6\x89A\xa2eX\xa2\xc2\xddF\x9a\xa5\
+\xb4\xa2j\x98K\xd0\xdd\xa4\x06o9I\xb4\x8c\xfc\xc9\
+l\x8ed\x1f\xe8W\xc8\xee\xcaOb\xedm\xa2l\xa1\
+Q\xa2I(Jr\xf3\xf2\xf3YqMe|\xc1$\
+u\xbf\xc6\xc4\x8c\xfctV\x82\xae\x96\xfaa\xa5h\x01\
+\xb2\x88 \x9a\xd9\x5c\x8bc\xaa,\x95\xe2s\x01\x5c>\
+\xf2\xf0\xab\xb5/F\x80\x8c-\xd8\x96&\x9e\xd4\x08@\
+\x85\xc9\xf3; }(@\xa5\x84\xce^$\xef\xab\x95\
+\xab\x17m$\xa8\x85s\xab\xe5\xac^\xcb\xbf\xab\x06\x97\
+\x03\x81Q\xc0\xca|\xf2\x9dg5w\x1e\xc8/\xb0\xe7\
+G\x86\xf8\x12_\xb8E;h#\x92\x95\x0bR?D\
+*\xf4/\x00\x90_8/\xb7p:\xd4\x82\x0b}\xa5\
+\x8f\xec\xb6PT\xe1\xdev\xce\x02o\xa1\xcf7\x04\xf4\
+\xe8\x99\xff\x1f\xed0y\x1a\xaeI\x04'\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x17^\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x15\x0eIDATx\
+\x01\x8d\x9b\xdb\x8f\xa4\xc7Y\xc6\xab\xbb\xe7\xb83\xb3G\
+\xefz\xedxc/\xc8\xbe\xb0\x159\xd8\xd8\x90\x08E\
+F\x91\x22\x91\xd3\x05J\x04\x17\x11\x91\xad\x00\xb9\xe1\x92\
+[\xfe\x01\xae\x91\x10\x12\x17\x08)\x91\xb8\x00\x94D\x89\
+\x82\x8c\x12\x89H\x01\x84q\xe4\x18\x07\x9c\xb5\xe3\xb3w\
+\xbd\xbb\xb33\xb3\xb3;=3}\xe0\xf9=o\xd5\xf7\
+\xd5\xd7\xd3\xebu\xa9\xfb\xabz\xeb}\xdeSU}u\
+\xea\x99\xde\x9f\xfd\xc5\xce4\x91xN\xa7|\x9c\x07M\
+Q\x15F\xe81\xa1\x98\xe9\x5c_\xe3;X`E\x16\
+y\x95k\xaciU\xbb\xd2\xfc\x1a_a\x8d\xe9\xf2\xec\
+B\xa3;\xfcAE\xab\xab\x92\xef\xd8\x0e\x8c\xfd\xc8q\
+, G\xd9\x0e\xe5<\xe89F\xb3P1T\x07\xd4\
+\x04\x9b1\x0d=O\xb70T\xfba\xfeQ[\xb6\x91\
+1\xad.\x81\xf9\xcc\x0b~b\x8d0C\xb4\xc2\x84\x9f\
+U\x8cV\x12\xf4B81+4\xcfH\x18\xb7\xf6\x8e\
+\x13\xa1\xa8\xe8\xb1\xcf\xf8\xe2o\xc8\x84\x03Q\x86Q\xd3\
+u\xf9\x88n\xab\xcer\x00\xf9\xe4\xbc\xc1R\xa9\x91\xe9\
+$^\xad\xaf\xc5ZQ\xf0\xac\xa4\xa5\xd5\x00]\xa1;\
+\x1a\x91\x9d\xc6\xa8\xcb\xd0\x95C\x10\x19Rp\xc1\xcf\x95\
+Y\xde(\x97\xa9\xef\xf2\x1a}\xaa\x86\x19\xc1\xb4\x986\
+ \x09\xf2A\xbe\xa4#q\x04\xa6\xf8\x12\xd8\xb6.t\
+O\xd3B)\x843(mA\xe8\x96\x1b6\xd6Q\x94\
+1\x0d6c\x1aZ\x22\xe0\xbb\xba\xad\xc9\xf5sma\
+\xa6\xd8\xc6\xaau\x84\x1e\xab/\xbc\x9c\x9b\x9f\xed\xce\xda\
+j\xf4d\x1d\x1f\x86\xf5\x08\x08\x87\xe6\x18\xad\x0c\x84\x13\
+wp\xc8\xd5D@!06\x9a\x9d\xb5\x83\xaavT\
+\x8dS\x05_\xecf:\xc3\x8a\x9e\xb0\xdbb;t\xd6\
+Y\xdb\x8a2JB\x91i\x0bUt\xe3WJ3s\
+@\x80\x02\x7f\x07\xa3T7\x0a\xb0R\xd3!\x1fN\xb4\
+\xf2]'j\xfcL\xf0\x16i\xe5:\xc1f\x9b\x8d\xed\
+0\xec6-\x0d\xdb\xf0pK\xf8\xae\xdd9\xb6\x04\xb8\
+\xf3\x1c0\xc7\xc0\x11\x87l\xa78\x5c\x19\xcd\xce\xce:\
+1\xd7\xc1\x1ak\x9b\xa1\xe7\x88-\xccDD*\x04\xd0\
+d\x96ou\x87?\x01-\xbe\xcd\x0f\x1e=\xf3\xe7\x00\
+\xeb\xbf\xb3\x90\x9b\xd6\xba[\x03\xe1p\xeb\xfc\xd1\xe0\xe1\
+\x95\xef\xac\xee\x8a\xb6\xed\x1c\xac\xf1a\xa3\x09\x10\xbe\x14\
+\xdd5\xf8h\x01\x14u\xb0\xe1g\xebw5\x07d\xa3\
+\xd6\xdf\x15\xea\xa9\xae?h\x85\x1a%\xe1\x0b\xfe\x84\x11\
+\x17\xf0\xaf\xc8\xa7\xd4k\xc4\xa6.\x17,\xfe\xa1\xd7~\
+f\xf9\xc9\xa1V4\x95Q\x08\x8f\xbc<{\x06\x8b_\
+\xad\xf7\xa1\x0ba\xa0\x91\x87\xbe\x90k\xfd(\xbc\xc8\x0b\
+\x1el\x9e\x03\x90\xcfLkm\x15bw<\x9e\xa6k\
+\xd7&i2\x8ezCy\xb0\xfe*7-\xc7\xa6\x15\
+\xdf\x95\xec\x1cQ[c\xb3LGV\xfa\x07\x83\x94N\
+\x9d\xeb)p\xe9\xa9\xf4\x16g\xc9\xfb\xc2\xf4\xe5\xd04\
+7B\xe3\xb3\x8d\x84-\x1b\x94[\xe4T\xfbQ|0\
+]\xf1\xa4\xd4\x0d\xd0(\xc2J\x05&\xf8\x83\x83IZ\
+^\xea\xa5\xdf\xff\xf2j:y\xb2\xef\x1e\xa0>R1\
+\x22\xc7\xfa\xe1 \xf2Mr\xb9\xae\x10\xc7^\x91\xf3\x09\
+yd\xb7n\x8c\xd3\x0b?\xdds\xf04\x06A6\x01\
+\x00W\xa3l]\x1f\xa5\xbd[\x934\x10~\x02\x13\xd5\
+9oc\x88\xbaF\xb6\xc2\x14\xbcy\x10\xd2\xa99 \
++\xca\xce\x14\x85\xa5\xe7\x17\x17{\xe9\x1b\xcfn\xa4\x8b\
+\x0f.\x85Q\xe9\xef$\x89\xf7\x07\xbd\xb4\x10\x9bj\xf5\
+`\xdb<\x1d\x5c!p\x08[\x85\x86B\x87\x82z\xf4\
+\xb1a\xfa\xc1?\xedx4\xd8/PS\x8d\x09e\xbc\
+JgN/\xa47^\x1f\xa6\x9b[c\x8f\x86\xe2\xab\
+\x03\x12\xdfID\xd0\xc8\xa2;r\x1b,<3@\xe7\
+\x11@\xa1\x16\x82`\xb8]\xbf>I_\xfc\xbd\x95\xf4\
+\x90\x82\xbf\xbd\xc7\xb8\xcc\x89\x181\xc8Wiii\x9a\
+\xc6\xa3p\xb4\xa9\x0cV\xf5\xcc`\xfbC\xb9(\x09H\
+O/\xf9\x85\x07\x97\xd3C\x0f/\xa6W~6L\xc7\
+\xd6{\xcd+\x17\xb6\xe4\xac:\xe3\xdc\xf9\x85\xb4\xb39\
+J=5\x98c\xf3C:\xac\xbe\x1b\xc7\xdc\xe0\x1b|\
+t\x82\xfa\xad+\x84V0(\x1c\x8f\xa6\xe9\xd8*\x81\
+Q\xa7F\xe1\x05$\xd9\x98\xf2\x99\xce\xf6De\xc0\x9c\
+\x07=\x89\xa0d\xdaQ\xd2*\x88\xc9\xad\x97VV\x14\
+\xb8\x86\xbf1\xd9\x8f,\xe9\xb9\x08\x1f\xb0\xc3+Q\xfc\
+\x0c\x7f\x8a\xdf\x12\xe2\x033\xcb\x03\x0c,\x15J\xd0\xce\
+\x8f,\x83\x05\xa8\xd7C\x13\xd3\x86z\xe1\xa5\x97\x0e\xd2\
+\xd3O\xad\xa6\xf5\xf5\xbe\x1c\xb0x(\xae\x8a\x035\xe3\
+\x82^\x03\x1bic\x0aD\xb6\x19B\x842'\xa9r\
+\xb0\xd0O\xdb7F\xe9\xcd\xd7\x0e\xd2\xb1c}\x0d\xf9\
+^\x1a0\xee\xf5E/j\xe9u0\xf8\xd6_\xa0\x15\
+\xc4\xd0\x87\x87m\x1f\x99\x1ca\x95\x98\x0cd\xf2\xc8\x22\
+![-\x83\x05\x18B\x13\xb5\xf0\xcaJJ\xaf\xbd>\
+J\xdf\xfa\xd6vz\xe6\x99ciu\xb5\xef\xc9\x09g\
+\xb2\xba&_\xd0+3\xc8#\xa43\x12\x8a\x83\x92i\
+S\x91V\x8d\x8a\xe0o\xdf\x9e\xa4\xff\xfc\xc9n\xbav\
+e\x94\x96\x96S\x1a\x1d\x14t\xf8\xc5\xa4\xb8\xb35J\
+\x9bW\x0f\xd3\xb2F\x09\xa3\xd3~\xe4u\xd6M\xeb6\
+\xc9\xf5\x98\xa8\x83/4jK\xc3\xa9./\x83\xdd\xe0\
+q\x8a!4\x19%\x8d\x82\x94^~\xf90\xbd\xf0\xc2\
+VZ;&3\xb4\xb2\xf9\xad\x22c5:\xfar\x86\
+\x19z{s\x92\xf6\xf7\xb2#\xb4\xb8\xf0^\xe0\xc9q\
+J\xd8\x89\x02`\x16.K\xde\xce\xffN\xd2\xfa\xc5\x94\
+\xd6\xeeQp\x07\x18\x00\xab\x8fz\x9b49\x94?\xfa\
+\x0e\x16SZ\x5c\x95_\xc2\xa1\x83\x8e\xea\xd9\x80\xb0\x96\
+A(V$\x1a\xc8\x95\xb9\x9e\xac\xa5)v\xb6\xc2-\
+\xb3\xbc?\xb4\xeaX\x8d\xb0\xb6\xd6K\xebk\xcc\x09h\
+P*\x0asnZ\x0f\x82\xd9\xdd\x99\xa4'?\xb5\x94\
+\xce\xdc3\xf0P\x0d\x01dl\xde\x19\x8e\xb1\xb1\xca\x9d\
+g}^\xdf\x85\xa1}\x09\xc8\xe8\x10\xc9\x06#c\xb4\
+\xb0\x1c\xbe\xfa\xdf\xfbi\xe5\x043En`d\x90\x15\
+\x8cWdw{\x9cF4\x98'\xcb\x8cA+:\xc9\
+\x00\xeb\x93\xb7\xc2TFEa\xc0u\xef(\x8f\x0d\x90\
+0\x96l\xb1E\x06\x0e\x01\xdc\xdc\x9d\xa6?\xfa\xc6\x89\
+\xf4\xe4S\xeb\x1e\xd6\xc0g\x13\x010\x9b\xfb5\x99\xc3\
+\x9f\xc57t\xc1\xda\xcdi\xfa\xc5K\xbb\xe9\xf9\x7f\xde\
+\xf2\xeb\x80\xeb\x8d/\x197\x1c\x8e\xd3\x9b\xaf\xee\xa5\xbd\
+\xdd\x89\xe7\x8e\xd6w\xa0Vb\x19\xbd\xd4\x10Q\xd10\
+\xaa\xe0\x1d\x84!\xd1 \xde\xa0\xa8\xa7\x99\xa9-\xa6\x9c\
+\xa1\xbf\xa5a\xff\x9b\xbf\xbd\x94\x9e\xfa\xadu\x1b\xa0\xf5\
+yOG\xe5\xab^\xa1L\xb7#{\x84\x0f.cJ\
+\xce\x0e\xb4\xa3c4\x11f\xec\xfd\xc8c\x9f\x5cO\x0f\
+\x7fb%\xdd\xbe\xa9\x00\xb3\xbft\x18#\x08\xb9\xd5\xd5\
+A\xba\xef\x82\xf6.*\xc3\xaf\xe3\x88r\xf8\xaf\x06\xa0\
+\xf5h\x83\x0c\x12Qz\xbe\x05\x16\x05\x917\xd8\xdc\x08\
+\x8c\xbb\xbd[\xd3t\xfe>\xbd\xa0*\x13\x1c)\x9e.\
+V\x84\xdc\x91\xa3\xa4\x0e\xbf\xae\xc8\x8c\xd27\x01,\xe8\
+<\x01\xca\xce\x99s\x0b\xe9p\x18\xf5\xe1\xbe\xca9\x8e\
+\xf1x\x92\x16\x97\xfa\xb1\xa9\xf2\x16\x1d\x16|\x0cG\xf0\
+\xe4n\x80#\x0cP\x06\x1a\xdb\x08\xb9\xba(1\x00\xaf\
+\xd5\xea\xea\xbdu-\x99\x97^\xddOc\x05\xbf\xbc\xdc\
+\xf7\xce\x8e-\xad\xf7\xef\xac\x10\x94\xf5>\xcao\x95{\
+\xae\xa7\xae`J\xb9\xc9\x85\xe5\xfd\x05\xdb\xd4e\x1d\xe8\
+\x1fi>z\xf7W\x9a\x07\xb4O\xc1\x15\xbfR\xd2\x8d\
+\xfe\x1e\x93\xb1\xe4\xf6ni\x1e`B\x05R\xfc\xae\x82\
+G\xae\xdd\x0a\xd7\x0c)i[)\xcaM\xf0\x99G\x86\
+\xd12\xbc64!\xfd\xcf\xcf\x0e\xd2\x0f\xbf\xbf\x95>\
+\xf3\xbb\xc7\xb55\x16\xa7r\xcc\xed%\xfaP\x0e-h\
+\xa0\xf4\x8b\xc7(\x9a\x97\x84\xd5G\x0f\x86\x8bK\x81\x92\
+M^\x8b\x17\xff}'\xfd\xea\x95\xfd\xb4\xba\xd6O\x87\
+\x8c\xb8\x12\xa0Q\xd3tS\xbb\xc5\xf7\xd4@4^Y\
+\xb9\xda\x98\xb2r\xc9\xf4\xfe\xf4\x9b\x97=\x1e\x90\xb7\x12\
+\x14\x88\x08:\xd7Y\x7f%D\xe0\xfa\xeek{\x8c\x7f\
+\xb4.x&\xc2\x1b\x1fL\xd2\xb9\x8f\xf5\xd3q5\x88\
+'O\xb7\x5c\xab\xdb\xce\x88dS\xe3U\xc0\x86*;\
+\x19/U\x1a\xc28\x1f\xf3\x8dH\x11\xd8\xd5\x0c\xbf5\
+I\xd7_\x1f\xa7\xe3\xf7\xc7\xeb\xd4\x09\x10\x98^\xcd\x83\
+\xdb\x02K\xc0\xed\xecb\x89IDE{#\x14\xc1R\
+k\x99\xbb\x06\x7f\xb0?M\xb7\xb4\xdc\xdd\x7fa\x90\x16\
+\xd5\x9b\xf1N\x87\xe2s\xf7\xaaG\xd4\xcb\x07\xec\x03\x88\
+\x82/\x06\x8a\xd1l\x83\xd9\xca\x16\x0bO\x94\x8bz \
+\xc2^\xe0\xd2\xcfGi\xe5t/-k\xddgOb\
+\x09\xc9\xb1\x17\xd8\xb8OC\x5c\x13 \xa3\x81\x83X\xe9\
+\x08\x94\x22\xdf\xefw\x03Fw\xc7\x0f\x1bo\x96AQ\
+\xae(B-\xb8~w\x08\x88\xe0\x8e\x1f\xef\xa5\xe7\xbe\
+y:]\xf8\xf8\xb2\x8dY\x16\xab$\xf4\xa8\xec\xf7\x97\
+\xed\xea\xddR\xc6[\xce> \x10\x85\xabW\xf6\xd3\xbf\
+~g\xcb3=\xdb\xed\xb6\xa7cT\x10\xfc\x95w\xf7\
+\xd3\x0d\xed\x1e\xfb\xb9\x11bT\x09\x8b\x0a\xb7h\xb7L\
+]\xc3\x13$\xb6\xc2\xd8\x94\xd1`P\x944\x9f\x9c\x07\
+Cqi\xd8n\xeb\x84\xf8\xb5\xe7N\xa5O>\xb1\xee\
+I\xc6\xbdl\xf9\xf6\xc1\xc9\x8e\xe1\xcbQ\xd6\x8a\xa2\x99\
+Z\xc0\xbcR\xc4\x9c\xf1a\xfb\x91G\xd7}\xfe\xf8\xce\
+\xdf]\xd7\xc4\xaaW\x0a}\xfa\x00\xc5\x17\x8e\xea\x0f<\
+\xb4\xa2\xb5\xfe\x96\xd7\xfb\xce\xa6\xa7\x89\x01\x95\x11\x0f9\
+\xc5&\xe9\xf5R\xbb)\x15\x06\xcc\x0c\xee\x04\x9f\x85\x98\
+\xe1\x8f\x9f\xec\xa5\xfb\xce/\xa6\xe1\xed\xb1\xd7[\x82\x9d\
+M\x03\xed\xf2\xc6c<-\xd6J>\x8b\xcct\xc3n\
+\x0a\x12\x9d\xa6\xe1\xde8\x9d\xbbw)\x1d\xdb\xe8\xf9l\
+\x80)\xfb\x85\x98\xa0#\x8d\xfb\x81\xa2^?>H\xb7\
+t\xa1\xd2\xd7\x19\xc2&Q\xa3o\x94)@\x97\xe0\x0b\
+M\xb5\x97\xc1\xbb\xf4\xbc\xf1`b[\xb9\xbb=I7\
+o\x8eu`Q\x17\xccK\xe0g&\xeey\xb0\xa6\x0e\
+\xe7\x9c(4\x84kX\xc7wo\xea\x16\xe8\xa6\x1c\x95\
+9|\x88\xa0\xa2\xec\xc6\xd7\x9c\xc0d\xec~\xb0\x0a=\
+\x1a\x1ce\xd4f9\x08\xd3TE\xf9\xce[\xe1,T\
+\x80\x08j\xceO\x8b\x1a\x8a\xff\xf2\xfd\x1d\xed\xf5\x17u\
+E\x16\x03\xc8\xde\x96\x07\x06\x94p\x98\xb5x\xde\x081\
+ \xe3\x5c\xb6W\xedH\xc27\x02\xda\xdd\x1e\xa5\xff\xf8\
+\xf1\xb6\xf5\xb0\x9f\x88\xf1\x1f\x82S\xee\x17Td\x9e\xd8\
+\xbeV\xe6\x00U\xf0\x01\xc2#\xe7\x0d\x8d\x0a\xf3[^\
+\xef\x8f\x9f{7\x9ag\x96!\x07XC\x8b\x12\xcb\xaa\
+\xb5\x09\x8c\x03\xcf\x99\xb3\x83\xf4\xd8\xe3K~\x0f=9\
+\xe1\xbf\x0d\x1a\xe9\x22\xef$\xf8\xa8\x89<\xbcSY^\
+1R|\xb7W\x10E^\xba\x98\xe0^{y?]\
+}k\x94V5\xe9\xfa\xf4hE\x92S\xcedG\xcf\
+\xef\xe8`TlX\xa7u\xe8\x91\xf3:x\xfbi\x1d\
+z\xe4\x06j\xee\x03\xda\x9e\x8e \x87Z\xc6\xb6t\x13\
+<\x95#\xd6\xc5\xb0f\xe9\xd2\x97e\xe7\xb2\xd6\xe1\xe7\
+\xfff\x98\x0e\xc55\xdfO\xecj\xaf\x8f\x11\xe5\xec@\
+\xe1\x93g\x8f\x5c\x1e\xab\x8e\xb1sQ3\xda\xc6\xd9^\
+:\xbc\xca\xd2\x87\x96\x90\xa7\x04}\xf2\xd1~Z\xd32\
+\xb8sC5|\xb2\xd3\xc5yF\x09\xb3\x7f\xa1\x9b`\
+Q b\x96V\xad\xf5\xd4<\xdf\x07\xd4\x8ai\xcd\xed\
+\x1b\x93\xf4\xf1\x8b\x83\xf4\xb9\xcf\xaf\xfa\xe4FO\x15\x07\
+\xadC\x9a1\xcen\x8f<,\xc1\x09\xfd<\xe9\xa1\xa0\
+s!\x88\xa8\xd4\x93\x1e\xbd\xf4\xca0\xbds\xe9\xd0\x93\
+\xdc\xbcM\xd3\x9e.I\xb6\xb4\xc4-\xeaV\x1a\x9d\x0c\
+{:\xc1\xde\x10\x1d\x1fh>\xfa\xfa\x91\xf3#\xb4\xd8\
+\xe0\xc0\xd4\xbc\xceV\x98\xe0w\xb4\xcbz\xeaS\xcb\xe9\
+\xab\x7fx:\xado\xb0\x8fDR)|\x88\xb2\x9el\
+g\xcb\x0dPS\xf9a\x85\xa2G\x98(j\x96\xff\xdc\
+$=\xff\xbd\xeb\xda\xf0\x0c\xd3\x8a.[\xdc\x08v\x12\
+\x8c\x0a\xfal\xac\x1f\xa4\xb7^\x1d\xa6\x1e\xafc\x13l\
+\xf0\x0c\xa0\xa8\xef\xdc\xe0\xf1\xa7\x04\x5c\x97\x11\xc82\x1e\
+\x015h\xac_g\x9e\xf9\xecz\xda\xd0\xd2r[\x87\
+\x09\xf70\xc2U\xe2b\x12\x1d\xda\x13}\xf4\xd4\xc1F\
+/\xac\xe8\x8a\xed\xc9Oo\xa4_\xbe\xb4\x17W`\xc2\
+\x84o\x14b\xd4\x9d\xd6d\xbbu\xfd0m}p\xe8\
+\x117;g\xb4\xa3W\xae\x94`\xab\x00\x1b\xb3\xf3x\
+bz\x0e\x00\x8fE\xb6\x9b+\xdav\xae\xac\xc4v\x96\
+\xe0\xe7\xcd\xe2\x8c\x94y\xf5wl\x0d\xf43\x82\xdc\xec\
+\xe41\x9c86\xaf\xe8\xdc\xce\x1d\x1fw\x801\xd3\xeb\
+\xf5\xf1$\x22\x7f\xe4\x18\x97\xa3\xbc\x02\x5c\xa3M\x17\xa4\
+(\xfbJn\xbf\xa1\xfd\xed\x0em7\x06\xa6\xee\xc4\xcb\
+\xf5y\x19\x14\xa5\x0f\xdb\xcd\x1d\xbd\xffo\xea\x14u\xe1\
+\xc2J\x1a\xea\xac}$P\xe1h\x18\x96\xb8\x8f\x940\
+\xe4D\xa1\x95\x91f\x1f\x9b\xff\xef\xe5[\xe9\xf6\xb6\xae\
+\xdf\xf3\xe1\xc9\x08=\x08\x8eM\xceH\xbfLq\xb2\xa3\
+q\xbc\xbfp\xe4\xf0\x05@\xa5\xbf\xdd\xe0\x1b\x1ev\x85\
+\x8b\x86*\xf8.\xdd\xac\x02(\xe2\xc6\xe6\x94.\x1b\xff\
+\xf1\xdb\xac\xbd)]\xfcu]\x0b\xe7\xde\xb2c\x18\x13\
+\x8d\x01\x1c\x8aI\xb0\x04e&\x806u\xaa*\x82\xa2\
+\xc4.\xbf;L?\xd2^\x7fA\xdbf\xce\x18Lh\
+\xde\xcb\xcb\x19\x9c\x1e\x1d\x8c\xd3\xfbo\xed\xa7!?\x87\
+1\xdb\x8b_\xb4`\xb5\x04Vr\x98\x1f-x\x84\xf5\
+Uj\xe7\x00(]\x1f\xb1v3\x0f\xfc\xf5_n\xea\
+\xc6E\xa7=9\xe7\x1f-\x10\xc0\x92>\x9c\xb4\xb8 \
+\xf5uT\xf6\xa4qB\xc3\x97\xb2/6\x81\xcfN\x5c\
+\x06*8-\xb3\x1f\xbc8N'\x1f\xd6\x85\x87\xb6\xb0\
+\xdc\xf8Z\x15AZ^\xbf8\x1d\x97\x9e\xfc\xab\xf4\x98\
+kr1\xe0\x11\xa4W\x19\x09x\x0f\xe0\xca\xa8'\x0c\
+\xa7\x8c\x0d\x01\xd5\xcc\xd2\xaeb9\x86\x81\x04J\xc8\xf4\
+\xaeqc{\xf6~\xcd\x03\xfb\x93tx+\xf3`\x0b\
+\xc3!\xe4\xb6\xb6\xc3\xac\x02\x8f|b\xc9\xaf\x82[\xdd\
+\xc2\xf1\xb0*\xe1{j(\x82r\xca\xfa);\x00\xe5\
+\xfd\xcf\x86\xbd\x22_r0\xdc\xe5\xbd\xfd\x8b\x83t\xa0\
+m\xf0\xf2I\xd1\x1a\x9dN\xe8\xc9E6B\xfb\xbbc\
+\x1d\x8fcT\xe6@\xcc\x0f\x1f2VD\x87\x96\x22\xdb\
+\x12\x9bi\x05*\x94:\xd3C\xbd\xc8\xc5\xa4\xdfu\x05\
+a\xc5\xca\x08~\xa8\xbb\xbf\x07\x1fYH_\xfb\x93\xb3\
+\xe9\xde{\x97\xbd25A\xda\xc3\x80\xfb\x87\x12\xf6\x09\
+\xb9\xae\xc9\xa4\x87D\x96\x8b\xa6;\x8fl\x8b\xd9\xff\x07\
+\xdf\xfe ]\x7f\xef0-j\xa2\xf4o\x04\xe29\x18\
+\xe45Z.\xbf\xb3\x97.s\xf3\xc3^!\xc7\xd1\x09\
+VD\x87\x96U\xd3y\xa2\x8d[a\x08+\xe6A9\
+r\x0c0\xf1\xd0Z\xa5wvt\xe3\xf3\xa5\xaf\x9eJ\
+\x0f]<\x16\xb34\x11\xce|\x99?\x16\xe4\x10\x0d6\
+\xcb\xab\xe9Xe\x04\x91|\xe7+9\xec\x9e\xbf\x7f9\
+}\xe6\x0b\xa7\xd2H\x170\xdc\x04uS\xccC\xf7i\
+\xb2^?\xa5\xdf 4\x87\xe0F'X\xfb\x9d+\x09\
+\xa9\xa1\xd1\x141\xea\x07\x7f\x88`v\x82G\x136\xcb\
+WE\x8e\xc3'\xce\xf6u\x0eX\xd2\x0a\xa1\x0d-\xbc\
+\x99D\x1d\x8eX\x7f\xd6\xdd\xe8pcj\x80U:-\
+^\xe8:\x97\xd0\xfe\xfeX\x93\xf2bZ\xd3\xdf%\xc4\
+\x1c\x80\x9fEy\x9c\x17X\xa5\xd6\xb4g\xa1\x01\xcc\xe3\
+a=3\xb4+%\x8bO\x19C\x83\xd0G\xa2[!\
+p-\x1de\xb3\xe55=\xbb}y\x9c6\xaf\x1dh\
+\xaf0p\xaf!_\xa7\xd2\x0b\xa5Gk^\xe9}x\
+\xd1J\x99[\xe8\x92G\x04\xda\x1f\x0c\xf4{\xc3a\x9c\
+\xf5\xb5\x0a\xe0\x87\x9e\xf1\xc1y\x8f\x94i\xba\xbd\xa3\x0d\
+\x9b|+\x81\x91\x1b\xcb\x03\x19h\x02w\x87\xb4\xf2\xf0\
+:[a\xeb\xae\x85,,\xc1l\x94\xad\xea\xda\x99^\
+\xfa\xee?lj\x9b\xbc\xe0!\x0a\x1c\xbf\x9d\xc0+\xf1\
++2\xcb\xda\xa0\xcc\x01\xaa\xcf\xac\x00\xcc>\x8b\x02\x83\
+\x02\xcc\xad\xf1\xfbo\xef\xa5\x7f\xfb\xde\xa6_'\x14\xf8\
+50;\xe6'&\xca+ZJo\xea8\xcc=\xa1\
+\x83$X\xf4\xe48\xea\xce\xc4\x8b\x9a\x07\xd1{\xf6+\
+\xafG-\x8a\xb3\x90\xe35\xb2\xab\x08\x03\x8c\x82[:\
+/p\x03\xfc\xc8\x13K\xfaY<\xdb\xc2\xa8\x04\x9bu\
+\x5cXz\xc8\xbd\x94y \xc2\x83\xc8\x82\xc7\x92\x8aq\
+3\x9dSd\xfey\xf3\xc5\xfd\xb4\xafU`U'B\
+\x96I#\xb2\x8f\x9e_4A\xdf\xba^m\xd7\xc5\xb3\
+\xdb\x05\xe3\x86U\x9d:\x04\xc55\x0f\x02\xba\xdd\x0ag\
+\xa1\xc2\xe88\x94y\x9a\x87\xbdG8\xa6\xf39\x0e\xbe\
+\xf2\xd3\xa1\x97+c\xf1Ou@\xfdP\xce\xac\x1d\x07\
+\x1c\x11\x1e\x82\xc1\xe7\x88\xbd\xa0=\xd6\xf5K\xda\xe0\x08\
+~\xfe\x89A\xcc\xf0\x16\x0d,\xbe\xaf\x9c\x8a\x9f\xe8\xa7\
+\xfa\x09\xd8\xd7]\xe8\x90\x01^\xa1\x91\xae\xbd\xafh\x1f\
+q\x8a}\x84&\xdcv\x99\x04\xa3\xaf\xd2\xe1P\xc7y\
+\x05\xcfFk\xf6\xb4\x19~\xfa\x15\x102\x07H^\x18\
+\xd6B\x10\x15\xaf4\x0ag\x06\xd2\xbaz\xc6GT\xe1\
+b\xe3C\x131\x0a\xa8\xc7\x0byJ\x96u\x14]\xec\
+\xean\xbc1N\x9f\xff\xf3\x8d\xf4\x85\xaf\x9c\xd7\x9f\xc3\
+\xe4\x17\x9c\xa8-G\x1e\xa2\xfc\x90Z\x9f:\xb3V\xeb\
+\xe7\x15\xf9\xe1\xdf_\xf5~ev\xab\x8c\x1e\xce\x1a\xef\
+\xbd\xb1\x97\xb6\xde\xd7AJ\x8d0\xef\x15\xa9\xb6\xc2w\
+\x0f\xbe\x04P\x82\xf2_\x8cd\x87gy\xae\xe6\x91\x1b\
+ `1q\xed^\x9b\xa6\x07\x1e_H\x7f\xf0\xec\x03\
+\xe9\xc4\xe9%\xfd%Z\x1e\xc6`KR\x99\xe0\xf9\x22\
+K\xdb\x94d\x98\x1eg\xcf\xaf\xbag\xbf\xfbWW\xd2\
+\xaaV'\x8f\x82\xd2\xf8\xca\xb9I~\xf0\xe1\xb54\xdc\
+\xddI\x07\xda01Qv\xfd\xd2+\xdaq\xb0hV\
+\xde\x06\x04Q\xd3rCZ\x0c-O\xb4R\xe1\xbc4\
+d[\xd7`\x99\x17\xe4\xc4\xf5\x9f\x8f\xd3\xe3\xbf\xa3#\
+\xf7\xc9E\x1d\xb9\xe3O^\x98\x07:_\xbd>\xf8\xc0\
+\xd2K}\xf3+s\xc6\x8d\xf4K\xf1p8J\x1f{\
+hU\xb7F:4i\xd7\x0a\xde\xbfZ\xcb\x0e\xae\x1c\
+\x1e\xb2c\xed\xa5\xe3\xf7,x\xeb\xed\x06\xb4\x8f\xf8\x0a\
+\x86eP\x0f\xea\x22\x16j\x83\xd1\x06T\xd3\x11$p\
+\x0b\xcd\xc5\xb6<\xeb\xae\xb1R\xca\xdc\xc1\x91\xfb\x86\xce\
+\xf7eR\x8d\xc6Fk\xfb\xa5\x0e\xbf\xf4T\xde\xd6\x17\
+\x0cU\x0b\xfa\xbb\x22\xae\xe7\x87\xf9o\x00\xd0g\x19\xf1\
+\x9a{\x03\x95\x0f\xb5g\xf1\xa4Y\xa9\x09\x9b\xcd\x1c`\
+/\xad\xbb0\xb2\xf50\xde\x08\xe2\x0e~\xea\xc9'\xe7\
+\xae4\xdd\xf2\xc0\xd4\xd8\x82aCs\xfa\xf1~\xfa\xc9\
+\xdf\xdeLO|z3\xfd\xc6\xd3\xa7=\x91zo\x80\
+\xee*q\xf1\x12\xd7a\xf5\x0b\x10\x00\xf0\x07\x0a\xec\xbf\
+~\xb4\xe9\xc9\x97?\xb2\xe2Om\xcb\xb4\xc3\xa4K\xd0\
+\x9b\xd7\x86\xe9\xc6;\x87i\xa0I\xb7\xddJ\x87\xff\x04\
+\xd1\xfb\xfa\x97^\x0dOK@\xe8\x9f\x1b =a\xa6\
+gt\x0bA7\xd8\xb6\xec\xe0\x0b\xd6\x18`*\x14\xbc\
+\x9c\xe7\xb7\xbf\xc3\xcdiz\xe6\xd9\xe3\xe9\xc4\x99\x057\
+\x02\xda#Y\xd8x/\xa5\x1c\x85\xeb$]4\xc0\x1b\
+\xaf\xec\xa5_\xfex/\xad\xeb\xe0\xc6\xabB3\xd9\x0c\
+|\x959\xccm\xbe\xadV\xd1\xda\xec\x06nV)\x94\
+E<\xbd\xaf\x7f1\x1a\xa0q\x10/\xf94\x0eWe\
+\x18\x0c\xb3\x8c!k\x82m\xf0UC\x99_\xc9\x0b\x03\
+\x8cG\xf4\xf84]}a\x9c\xf6\xa5\x88\xf5\x83\x84\xee\
+R\x82\xe6\xb7\x08\x99t\xaay`NHj\xe3\xd7\xf4\
+\x07\x13\xfa\xc77\xf4\xe1\xb3gz\xd0\x0a\x96}.\xcb\
+\xad\x93_\x0f\xd5Yy\xe4\xe0}\x1f`\x933\x0c\x03\
+\xc1\xe1q\xe1u\x82\x8fz\xd8\x8e*\xe7\x86\x22`\xba\
+\x92\xc7\xb9\x8c1\x1b\x07\x95\xee}Z[j9\xea:\
+\x03(\x87<~\x953P\xe3c\x85\xe1u\x1a\xeb\xd6\
+j\xa0{\x83\xd0\x1dz byV\xce&\x08uY\
+'D`\xc3\x86\x8e\xc3Q\x98et\x84,\x91\x95H\
+\x9f5Xi[\xa6.`Y_\xa1E6<\x005\
+-\x16\x17#\x96\xcb\xf8\xe6\x22%c[\xfa\xa8\xadf\
+k\x9cuZ\xb7\x1e1\x0a\x8a\xad\xec7\x18x\x1d\xac\
+FH\xc7\xa1l\x94\xba\xa6\xc5r\x9di\xeb\x08\xc5-\
+?\x1ck\x14gLC[W`:\xb6l\x040\x09\
+\xaf\x98\xbf\x22\x87\xe6\x1d&i9w*<\x85\xd0\xd2\
+\xd6\xcd#0\x14l\x97\x0a\xeaD\x84\x1f\xb9\x0c\x8c\x8a\
+\x06\xef\x06(\xa0\x22\x04\xa6\x94#?\x1a<\x8a\xcaw\
+F^\x8c0Zd+\xa3b\x98\xa7\xaa\xf2b\xd7\xb6\
+j9\x80\x98\x08;EW\xe4VB\x11\x01}\x9c\xc0\
+S\xceu\x0d\xaf\xd0\x80r\xd9\xf8\xfc\xe8\xdc\x0a\x03\x00\
+s\xc4(\xe0\xa2\xa82\xd2\xe2U\x99\xeb\xc9>\x14[\
+\xf8\x86\xb5rE>\xf2P\x01\xb4\xd5\xd5\xc56~f\
+L\xd0\x05\x83\x5c%\x9b1\xae\xa3\x5c\xa5j+\x9c\x8d\
+\xd6\x82\xd6*t\x13|m\xa0\xf4f\xae\x93vD\xc3\
+p\xd1U\xf03X\xaa\xb3\xcey\xba\xb3\xa69vC\
+_#k{Yw\xa5\xcfn\xe3L6_l\x00\x9f\
+M3s\x80\xd8u\xb0\xa0\x1b\x9ar\xf9v\x8d\xdaa\
+\xf3\xc2b8\x90\xad\x8b0]\xbc\xa1:\xeb\x84a^\
+M\xdbfm\xb7\xd5c\x15\x0d6\x80G\xe4\x05\x0f?\
+\xedU\xe3?\xe8y\xc9# \x94\x88\x9d\x95\xdbA\xd0\
+\x0d]\x97\xe78t\x07l'@0lD\x8c\xd5#\
+\xeb\xaes\xfba~\xd8\xa8\x1b\xea\xa3\x07_d\xb3\x0d\
+\xf4}H\xcas\x80\x10M\xb0v\xb1KS\xe5o(\
+o\xb0\x11N\xe6\x85H\xe1\x91;\xa0\x12\xd5\x9c\xe0\xeb\
+\x00\x03&\xfdy\xd7S\xf3:\xc1;\x18\xe96.\xfc\
+9\x8a\x05\x84\xc3wO\xff\x0f\x94L\x1c\xe8z,#\
+\xf3\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x16.\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x84\
+eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\
+\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
+\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
+\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\
+\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x03\
+\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\
+\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\x09\
+pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x01YiTXtXML:com\
+.adobe.xmp\x00\x00\x00\x00\x00<\
+x:xmpmeta xmlns:\
+x=\x22adobe:ns:meta\
+/\x22 x:xmptk=\x22XMP \
+Core 6.0.0\x22>\x0a   \
+<rdf:RDF xmlns:r\
+df=\x22http://www.w\
+3.org/1999/02/22\
+-rdf-syntax-ns#\x22\
+>\x0a      <rdf:Des\
+cription rdf:abo\
+ut=\x22\x22\x0a          \
+  xmlns:tiff=\x22ht\
+tp://ns.adobe.co\
+m/tiff/1.0/\x22>\x0a  \
+       <tiff:Ori\
+entation>1</tiff\
+:Orientation>\x0a  \
+    </rdf:Descri\
+ption>\x0a   </rdf:\
+RDF>\x0a</x:xmpmeta\
+>\x0a\x19^\xe1\x07\x00\x00\x13\xafIDATx\x01\
+\xedZy\x8c\x9d\xd5u\xff\xbd}\x99\xf7f\xf1x\x1d\
+/\x80\xa9\x0b\xc6&\x80Y\xea\xb0\xa8T\xa0P(I\
+\x0a)\xb4i\x8b\xaaTU\x12\xb5\xff\xa0\xd2FIJ\
+\xe5g\xb5\xaah#\x926R\xaa\xb4R\xd2*M\xab\
+\xb4E%\x94\xd4P\x82Z\x8a\x8b1\xd0`lV\x19\
+l\xbc\x8c\xc7\xb3x\xf6y\xfb{\xdf\xeb\xefw\xeew\
+\xdf\xbc\x99\xe7\x00R\xfe\xa2\x9d\xfb\xf9}\xcb\xbd\xe7\x9e\
+{\xce\xef\x9c{\xee\xb9w\x0c\xac\x94\x15\x04V\x10X\
+A`\x05\x81\x15\x04V\x10XA`\x05\x81\x0f\x8e@\
+\xa1U\x88\xa2\x85\xc8\x87\xe3\xd7\xa2\x9c\xadH\x8b?\x93\
+\xf7\x83\xaby\x1eJ\xaf\xf4y\x9a>\xacU\x91\x0f,\
+8\x95/\xec-D\x0a\x85B\xf0\x89#\xbf\xf1\x85(\
+\x22w\x04\xadV)\xa2\x22`\xf4\x8f\x10/\x96\x08\xa2\
+\xfc\x88X\xbdj\xa3\xf6\xed\xdb\xad^\x04\x01i\xa2\xbe\
+\xcd\xf1p}\x16{.\xef\xdbf\xe9\x99u>)\x02\
+Y\xb2\x046\x22\xa5\x13y\x10iE\xb2M\x04\x07\xfe\
+\xee\xf2o|\xd9<A\xfe\xc0\x12\xd7\xed}\x8b\x94\x87\
+S\xfe\xceC\xbf^\x88eb{Z\xcd\x00\xb1H\xa8\
+\xa2\x0d\x22\xe1;\x15v\x5c5<\x9b\x97\xb4x\xd5:\
+\x9f\x8e\xc4\xf3X\xe4\xe3k\x8c\x8fx\x91\x93$w<\
+\xc5\xb7\xb3H\xab\x16\x92\x88Q\xf9PC~G\x88H\
+\x22\x97Bi\xaah\xc4\xa2\xf1c\xbf?\x00^\xf9H\
+!\xb8\xe3\xd0\xaf\x16b=\xf1=\xf5b-\xd0HB\
+W\xc5\x98\xf1u\xf1\xcb\xb3w\x02\xe9k)\x08\xbe\xbd\
+S\xd1\xc5\xde\xc6\xb3\xcd\xbb=\x82\x1f\xc9\xc63j\xe1\
+\x1f\x8e\xaa7_\x9aA\xdd\xbc\xaa\x15\xb4\x10\xa3w\xd1\
+S\xf9\x86\x04\xe3@I4n$G\xfd\xde\x00,W\
+>\x1b\xdf\xd3(\xd5\xc9L\xba\x9b\xf9\x8d\x8b!\xaa\x18\
+c\x9c\x1d\xba\xa6\xb4\x0d\xe6@hQ\x025\x8b\xa6S\
+\x00\xb3\xa6\x93e\xc9\x9d\xc2\x124\xf6U\xbfv\x07G\
+\xed\xfbD\x02\x0f\xec\x92\xae\xd6!h\x05\xd6?\x90\xb4\
+\xbc\x02\xba\x01\xeb\x0c\xb2N\x09~<\x00\x1d\xca\xff\xfc\
+\xa1_)D\xb2\xd1=\x8dr]\x96\x97\x0a\xfcI2\
+7\xb0\x94\xd5 \xaeJ\x95\xfcb`\xf0P\x880\xac\
+5\x1ak!\x0b_\xdb)\xbe\xefe\xcc\xa5}X\xbc\
+\xd2\xcb\xbf\x19\xde\x11]\xb4\x85o\x0ey+\x12\x04\x88\
+G\xe3\xbc\x13\x84v\xeb\xe2\xcb\xf9\x01X\xa6|\x94s\
+^\x96g7\x89\xed\x94\xe7\x10m+\x85\xaaz\xb6&\
+6o\xa2\xf4&t\x0ax\xa5\x0d\x22\xd7\xa4Nm\x8e\
+\xee\xc3\x81\xa0\xf7\xb0\x18C\xbe\x93\xe1\xf26}\x9b\x97\
+X\xf3\x22\x7f\xdfU^\xd4\x08\x1aHD\x12\x04\xca\xd7\
+.>\xbb\x01\xe8P\xfec?\xba\xb7 \xe5\x9b\xe5\x86\
+s{J \xa5%\xb0\x8a\x86\xb3o\xf7\xd9\xae\xf7\x9f\
+\x94M\xff@gp\xc5\x14\x0d\xfd\xc2\xe6\x8b\xc4g\x09\
+\xdb\xfd\xf4\x10{S\xccFp]\xed\xee\xf9\xe8\xc3d\
+P\x85@\xa1\xbb\xabB\xde`\xe1\x8f\xb5\x86\xbe\xf5b\
+<0b\xf7\xb1\xec\x1e\xce\x89\xb0V\xb2\xede\xc4g\
+\xc03\xe5\xb3\xb1=\xf5R\x8d\xd3\x88\x93\x8dmme\
+9\x90\xde\xe5^NPw\x8fR\x03\xc5\xdf8\xef\x09\
+\xde\x13\x11\xbe\xd1=M8\x0e\xa1>\xfeZ\xda\xd7\x8d\
+o<9w\x19\xb4H\xe7t\x94B\xe2\x11\x8f\xc4\xda\
+?\xb9\xbc[8\xbd\x01D/\x07\xd5\x9d\x8b\x9d.\xf2\
+i\xcb\xeb\xd8\x9f\xf7\xde\xe9\x01\x0e\xa6\x02\x82[_\xfa\
+\xa5\x02\xd2\x11\x17\xf0\xa8\xb8\x8a\x98\xab,\xb1\x12\x05\x15\
+\xf0)\xbaW\x83\x03N\x07\xf3XhUPD\xcdh\
+%t\x1e)\xe4\xa3Y\xf4Es&P\xa3\xd5$'\
+cj4\xeef5m\xa0T\x97 \x88\xd5V\x1d\xf3\
+\xady\x94[U\xd4MA\xd8\x12\x97\x8e$\xf9\x8cS\
+\xc4\x94\xfdLq\x93\xc5\xc9\xa8\xfe\x1eB\xae\xff\xb4\x9c\
+\x80\xb2J5-)m\x00\x98\xde\x9a\xe5\xaf\x7f\xee\xce\
+/Ds\xb1=A\xa9IC(\x85\x94\x8aN}\xc1\
+ w\xe6\x1a@\x86\xca\x03bf\xf1\x97\xea\xc7qA\
+l\x15\xaeM\xef\xc4\x96\xd4F\x0c\xc6\x07\xd8)JP\
+\x1a\x18oL\xe0\xdd\xeai<[}\x15}\x9146\
+\xc5\xd6\xa0\xcez\xef\x0d\xe6\x1d6\x82\x13:N\xafi\
+\x12\xa4W\x1b'\xb1=\xbe\x197dva(\xb9\x0e\
+\xb9h\x8f\x01T\x0e*\x98jNc\xa61\x87\x91\xfa\
+8N4\xce\x22K \xf2\x91\xacy\x8e\xf8)\x00;\
+\x96\xd2\x9a\xdf\xfcy\xcfX\xa2=?\x16\x01@\xc1\xe0\
+;;2zG\xcfB\x06\xb9dO+\xd3\x93\x89\xc6\
+b1\x13\x96\x5c\x1c\x8a\xe2LT\xa4|5\xa8a\x14\
+\xb3\xf8\x93\xb5\xbf\x83\x9b\x07o\xc4Pf=\xd7]M\
+\x82\x98\x09 +\xc8!k\x8d\x1a\x8e\x97N\xe0\xb1\xb1\
+}\xf8\xf6\xdc\x0fpy|\x0b\x1al1aIc\xc6\
+\x930\xe49\xdf,\x22\x19M\xe0\xe1\x0d\xbf\x8f\xab\x07\
+\xae\xc2@\xb2\x8f\xc1\xcb%6\x12\xdex\xca\x8b\xd8i\
+\xbeQ\xc4dm\x0a\xfb\xc6\x7f\x88\xc7\xe7\xff\x13kb\
+\xfd\xe6\xfa\x92\xd5\x5c\x93\xb2\x8a^\x22\xbbU\xc0\x1a\xd4\
+\xd8.m\x00|M\xab\xd5,\xcd\x15\x170==\x87\
+L\x22\x85\xde|\x1e=\xb9\x1e$\x93\x09\x0b,\x1a8\
+\xda\x8a\xa2J7W*\xf0\xf7[\xbf\x8a\xab\xfa?b\
+\xdd5\xef\xdc\xdct\xdc\xa4`\x8c\xb4\x99X\x0a;{\
+\xb7\xe3\xb2\xdeKp\xd9\xc8%\xf8\xe2\xe8\xd7\xb0=\xb6\
+\x89n-\x10$\xaa\xbb\x8a\xb4\xee\xeax?\x1e\xda\xfa\
+\x07\xd8\x92\xddlL\xe4\x0d\xa2\xf1E\x94\xf2\x12U\xae\
+J\xf6\xdbohv=ff\x8bX\x1b\x1b0\x85E\
+k\x8ak\xbe\x86E\xdf\x02ay\xe9\x02 \x12\x8bE\
+\x12\x09\xda\x90\xa9n\xbdQ\xc7\xd8\xe4\x04\xe2\xd3S\xc8\
+\xf7\xe4\x90\xcf\xe7\x90\xc9f\x10\xa7W\xbc]\x1f\xc3?\
+]\xfc5S^\xcb\x8c\x05&\x022\xdfX\xc0Xe\
+\x02\xb5V\x0d\xb9X\x0f\xd6\xa7\xd7\xd2\xa2I\x9b\x0e\x9a\
+0w\x0d\xdd\x89\x05\xd2\x14&\xbeIO\xb8\x80 4\
+L&\x85\xca\xb3\xc14\xbe\xb2\xf9AS\xbe\xcel\xce\
+\xa6\x18\xad_\x09\xaa\x98\xa9\xcd\xa2\xda\xacY@L\xc5\
+\x92\xc8\xc6\xb3t_\x06\xdaX\x02\xc5f\x89\xf5rs\
+]\xb2\xb8\x14\x97\xca\x86\x93\xf1\x97\x97\xb9@i\x9f\xed\
+[\x17\x00\x8c\xe4\x9a\xea\xd63\xca42E\x97\x96e\
+g\xe6\xe7\xec7\x98\xee\xc3\xe1\xcc)<|\xe1\xef\xe1\
+\xda\xc1]tE&\x1a\xb4H\x9d\x01\xeb\xb1\x91}\xf8\
+\xde\xb9\xc7p\xaa9f\xc1pu$\x8f\xcbR\x17\xe3\
+3C\x9f\xc65tg\xc5\x04\x09\xfd\xc9\xa1_\xc0\xbf\
+\xcf>\x8b\xb3\x8c\x0f\x0ahr\xf0\xd3\xc18>\xdd{\
+\x1bv\xf6]f1@\xca\xcb\xc3\xfecb?\x1e\x99\
+x\x1c\xa3\xa4-1\x18\xaa\x7fO4\x8d^\x82\xdb\x17\
+\xed\xc5\xfa\xe4Z\x9c`\x8cY\x1d\xe95\xfe\xce\xc6\xdd\
+\x966\xe5\xcf\x93\x09-]\x06\xa57\xd5\xef\xfc\x09L\
+\x01\x91\x88'\x88v\x1c\xd5Z\x15\x988\x81\x9d\xf9\xed\
+\x18\xaf\x9f\xb3y(\x9a\x7f<\xf3(\xee>\xf5qL\
+\xd4'\xd1\xdbJcsd\x90\xf1?\x8e\x97+o\xe0\
+\xdaw\xee\xc3\xa1\x99#\x0e(Z\xb67\x9e\xc7=\x83\
+wb\x7f\xf3\xa4-\x95Q\x8ey8\x98\xc4\x8d\xfd\xbb\
+\x09\x05-\xa9\xa9D\xe5\xf7O\x1c\xc0-'~\x0b\xef\
+\xd4NZ\xe0\x14?\x09\x5c\x0c\xca\x18\xa6\x07\xbeR}\
+\x0b\xdf\x9f}\x1a\xef\xd6\x86\x91\x8e\xa6\x08\x9c[\xfa\xdc\
+2*\x0fX\xbc\xe4\x19\xba\x96\x97.\x0f\x10\x81\x00\x90\
+Pmr\xbd0\xb2\xca*'\x1a\xd3\xb8c\xf0\x1el\
+\xea\xdb\x84\x89\xea$\x92t\xc1\xc3\xd3\xaf\xe1\xbe7\xff\
+\x10\xb7\xf7\xdf\x0be\xdb\x1a\xccG\xfa\xd5\xd1>\x5c\x1b\
+\xd9\x82\xbf9\xf3\x0f\xd8\xd1{\xa9\x9b\xbfdwi~\
+\x1b.\x89\xf6Sh\x85\xc3\x00\xd7\xc76\xd2\xf57i\
+xK]\xcb\xcd\x0a\xbe;\xfe\x08nM\x5cA\x8bg\
+h]Q9\xf7V\x88\xa5\xf3\xdb\x12\xd8GO\x90\xe3\
+\xbbX\xe1\x5c_\xee+\x10\xbc'K|\x9d\xe0\x88n\
+y\xe9\xf6\x00eMT^?\xef\x09\xe2\xa4\xf7$s\
+\xeaJp\x14W\x0e\xecD_\xb2\x17I\xad\xc7\x0cp\
+\xaf\x8c\x1d\x01F\x8ebxx\x04#c\xa3(\x16\x8b\
+\x16\xa5\x95\x81U\x18\x0b\x06\xe9\x9e\xcf\x96\x0e\xe1T\xe9\
+\x8cYV\x96\x18\xcal\xc0\x15\x89\x8b\xcd\xad\xcb\xa4\xb9\
+(>\x845\xa9\xd5lqJ\x9e*\x0f\xe3P\xf5(\
+\x97\xb84j\xf4\x1a7\xbb\x9d\x12\x02BphJ\x09\
+h\x07\xcdb\x9b\xf1\x90\x0e,n\xee\xab\xc6]\xef\x0b\
+\x80\x053\xba\xbcW^l\xfc\xbb2;\x95\xad\xf9\x8b\
+\xc2:!\x0b\x9c\x9a;\xcd\x0c%\x89Z\xb3\x8e\xe9\xd9\
+\x19\x9c\x1e\x19\xc1\xf0\x993\x98\x9d\x99c \xe5\xbc'\
+p\x87[\xa3\x18+\x8fY\x7f\xb9x&\xc6\x9c \xb1\
+\x81\xee\x5c\xb1\xf8\xb1:\xbe\x0a\x09.\x7fjS\x99\xab\
+\xcd\xe1Hp\xce\xa6\x84\x89NM|\xee\xe0\xc1\x10]\
+g\x9b\xb4\xf5\x97\xf8\xf8w\xbe\x18\x10\xaaY^\xba\xa6\
+\x80)K\x93\xeb\xa9b\xdeo/\xb4\x8c\xea\xf8oU\
+\xcf\x00]Pin\x8c\x1b\x8d&\xce\x96\xc7\x81\xd8z\
+p\xc5\xb3M\x87\x04-U*X(\x97\x90d\xec\xd8\
+\x90_\xc3t\xf14\xe6\xeas\xc6S7\xf1\x92\xd2\x15\
+\xe6\x12)\x02\x9b\xa7+\xbb\x11\x1dI\xb9Q\xe6JR\
+\xb6\x0f)\xa2\xa2\xa7\xb2\xba%\xc5\x89dm\xe6;R\
+Vt\xe4\xef\xfbQ\x1b\x9b\x02&\xfc\x92\xce\xce\x80K\
+\xab\xa8\x84\x5cW1@L\x14\x00\xf5\xd4\xb1\x951\xe0\
+\x80\xf9x\xce\x92\x15\x05\x1e\x0d7\xd3\x9aE\x0f31\
+i`\xb4\xa4\xd7R\xa9\xf8\x10\x04\x01\xa6f\xa6\x81\xd3\
+\xd3xm\xfcM\xa6\xb6\x0bV\xa7%q\x90\xeb\xf6,\
+Sg\xcdW\xad$\xea\xeb\x8b2>V\xb4\xad.e\
+\x96_\xe6\x09\xec\xebl\xed\x14o\xd3\x84\x1e\xc0N&\
+\xa3\xa3jz\xf6\xedg\x97\x07(\x911A\xa4tH\
+\xa6oY\xd5\xea\x89C\x9a\xf3\xde6<\x14\xba\xd1b\
+\xeaJ/\xd0\xc9\x8b\xda\x17{I \x22\xcchng\
+'u`\x86\x1e0R\x1dE\xa3\xde\xc4\xda\xf4\x1a[\
+\xd7\xb9Ie\xe0\xe41\x16\xe3Ig\xa9\xd13\x14Q\
+\xa5\x90S\xc2)\xd8\x16\xaa\x93\xd8\x94d\x85\x17\xd8\xda\
+\xf8A\x99u\xb9\xfd\x00\xdf<]G\xdf.\x00\xc4D\
+|L\x91\x90\xa1W\xde\x01\xa3\x94\x951\x98\xf3\xb5\x1e\
+\xa9\xb7\xa3\xba\x12\x91%\x00h0\xdb\x07\xbbz1M\
+p\xca()\xaa\xa3\x84s\x8d)\x8c\xcc\x8c\xe0\xed\xd3\
+\x5c\xc3\x07\xb8w\xe8\xe5,\xe2\xe5#\xb5\x8b\x05\xfc\x92\
+\x85iM\x1b\x9b,%K\xbb\x84\xf2\xb5\xbf\xd9d\x0a\
+S\x96\xe5E\xfd>X\x0c\xa0\xfb\xdb\x14\xe0Scy\
+\xe5\xc5P\xd6\x94\x22\xaaS\x0cp@49\xcf\x93\x8c\
+\xc4N0\x1bZ\x02\xe8%\x94U\xd3I\xdfR^}\
+R|&\x99\xcd\x19\xc8\xa5\xe38WY\x8d\xd3\xf1a\
+\x8c]8\xc1MM\x8fey\xa2\x01\x93+\x09a\x17\
+O$\xbc\x01\xd4\xcf\x14\xd5.\xcf\x0f\xa2\xf1|9\x1f\
+\x10f\x8c\xeee\xb0\xcb\x03\xc4\xc7,\x19\xa2\xa8w\x8f\
+\xbaWDk\xae\xed\xfb\xa9\x8cbR_4\x8f9z\
+\xc3ff\x8dM\xcey\xf18\x1fp=\x0ct\xb6\x93\
+'\x90\xda\xf8\x94\xeb\x0cr\xb1<\x91\xcdc\xbe\xbe\x80\
+s\xdc\xd8\x8c\x05\x13X\xcb\xe5\xb0\xa4\xb6&\x01OQ\
+];\x8e\xa0\xaa\xb2HXL\xae\x0e\xe5;\xc7\x13\x89\
+\x81\xd4A\xef\x93#\xdf\xdf?\xbb\x00\x88\xca\x03\xa8\xb4\
+~2\xa1\x86\xb4w\xbe\x88\xa9*Lp\xd6K\x09y\
+\xc5`j\x90_U{W\xd0\xec\x14\x94\x0d\x96\xbf\xab\
+\xeb\xda\xcc\x1aN\x1d\xe6\x12\xac\xd3\xea1[\xe5\xaa\xc0\
+\x1d\x9cv\x8fU\xa5\xb9\x02\x94\xd7|P\xc4Te\x86\
+\xeb\xebk\x98Z\xbd\x19\xf1\x5c\x82\xab\xacb\x84\xc6\x17\
+\x85\xbbL\x1e\xab\x95\xac\x0et{\xb1v\xaf\x83\xb5\x98\
+L: ]^\xba\x00\xd0\xc2\xa0)\xe0\x1c@Cx\
+7\xe3\x1c\x92\x1b\xc5(Wq\xd8\xf8\xa8M\x87!;\
+\xfb/\x05\xce\x9e\xa2k\xff\x14\xea\xdc\x18\xa9\x98\x85B\
+\x0b\x18\x80\xec\xb7.\xb7\x8e\xf9[\x02\x19\xe6\xf2U&\
+7#\xd51\xf4\xd3\xfaiN\xa7\xb3\x95q\xae\x0eM\
+d\xe2\x19\x03lc\xcf\x10=\x00\x98\x9a\x9cDy\xaa\
+\x8e\x5c\x0fs\xff\xde^\xa43i\xb8-z\xa8\xb0a\
+\xc2\xe9\xa1\xcb\x09M\xf5Ux\xf7\xfa\xb2\xde\x1d\xd2Z\
+\xc3\x92[\x17\x00\xdc\x0c\x92 d\x16z\x81\xf99k\
+\x1b\x11J\x14\xdb\x86#so\xb8\xfd|8\xe0\xe5\x83\
+\x97\x99q2\x5c\x16\x8b\xb4\xa48hl\x09\xa5\xa9\xa2\
+\x93\x9dm\x99\xebqQ\xdf\x16\x8b\x8bR\xf2\xdc\xfc$\
+\x9e.\xbe\x8a\x0b\xe3\xbd2*\x0eT\x8fa\xbe\xba\x80\
+\x0d\xb9\x9c\x1dbn\xcc\x0fak\xf6:4\x1b-B\
+\x16\xc7\xdc\xc2\x02f\xe7\xe7\x91Iq#\x14n\xd1\xd3\
+)-\xc3\x5c,\xb4\xe4\x85\x9e\xb1\x14\x08\x07\x8c\xb5\xd9\
+\xb2\xd8\x1d\x03\xb4\xb8w\x15\xf3\x80\xd0\x0b<C\xa1\xab\
+@\xb7#\xb1\x1e\xcf\xcc\xbe\x88s\xe5IK\x844\xf8\
+\xce5;\xf0\xb9u\xf7c\x7f\xf1\x09\xc6\x83,zy\
+z\xd3\xc7_o,Kk'\xf1z\xe99|\xf9\xe2\
+\xdf\xc6\xc6\x9e\x0d\x16#\xd2\x0c\x9a\xc7\xa7\xdfE\xa5\xf6\
+\x06\xb2\xf4\x06\xd1T\xebo\xe0\xcc\xfc\x08\xb3F\xc6\x11\
+\xc6\x98U\x99\x01|\xfe\xa2_\xc3\xdb\xc5\x97,Q\xea\
+#\xaf\x81\x04\xf3\x8fF\x14\xa5\xc9yL\x9c\x1e\xc3\x19\
+f\x9c\x93s\xd3h4yf@y\x05\xb9\x94\xf5\x80\
+8'pn\xd0y\xefT\xb8\xcb\x03\xd4\x18\xfa\x80s\
+c\xb9\xbdL$k\xf3)\xe5\x9e\xaf<\x89\x83\xa3/\
+\xe2\x17/\xba\xd3r\x80l,\x83\xbd\xbb\xbe\x84\xec\xe1\
+,\xbe6\xf1u\xba\xca\x82w\x01\x06\x8a\xad\xf8\xc6\x8e\
+\xbf\xc6\xbd?}\xb7%@J\x9ej\xcd\x06\xfe\xf5\xf4\
+\x13\x5c\x17/f<\xa83v\x907\x97\xd5\x97F_\
+\xc6M\x9b\xaf\xb7l2\xe0y\xc4]\x97|\x9c\xb45\
+<\xf8\xee7\x81\xfa1\xed\xb2\x16\x0b\xa7\xd4\x96\xe2.\
+\x0c6{17\xcfx\x91\x8e\x9ag\xc4\x13.\xa1\xd2\
+\xdf\x82\xe4\xf6\xeac\xab\x97t8O\x91\xae\xae\x84\xde\
+\xb2\xeb\xe9[\x9e\xe4Q\xf8mA\xb9\xa1CA\x0e\xd3\
+Q\x84\x03/mN\x94\xba\xfe\xcb\x0d\x7f\x8b\x0d\x99u\
+\xa8s\x0f\xa0\x83\x89\x1a]\xfd\xed\x99c\x98*O\xd9\
+FE\xcb\xde\xc6\xdc\x10.\xcco\xb1\xf5]\x09\x93\xf2\
+\x87G\x8f?\x8e\xbb_\xfe\x04v\xa5~\x0e\x0b\xdc\xda\
+J\x08\xb9\xf9k\xf5Wq\xf0g\x9f\xc6\xf6\xc1K1\
+\xc7\x00iY(\x83\xea\xc8\xc2Y\x8c\x17'PiT\
+\xcc\xebl\x19M\xa6\x90\x8a\xf3,0\x9d\xc3\xb7\x8f|\
+\x07\x7f~\xf4!\x5c\x9a\xdb\x8dd6\xc9\x83\x1b\xc5\x8a\
+\x94\x1d\xcf9\xf7o5c\x99x\xacUm>\xf9\xd4\
+\xae\x7f\xbe\x9d\x9e!5\x0c\x91.\x0fp\x01\x90\xed\x1c\
+8*\xd4\xec\x9fnBT\x9f-\xe48\x87\x0fr\x8f\
+\xbe\xf7\xc8\x9f\xe2\x8f\xaf|\x10\xabS\xab\xcc\xf5t\x92\
+\xbbc\x80\x01q\xa0\x034\xbe\xca%U\xb4)zf\
+d?\xee~\xfd~\xecH\xdd\x08f\xfbt,\xcdB\
+\x93\x85\xd3a\x08\x7f\xf4\xcaW\xf0\x17\xd7?\x84\xf5=\
+\xeb\xb1P[\xa0{78u\x86\x0cH;\xd8\xa4\x1c\
+\x92^<\xed\x0f\x1e\xdck\xf4\xf3\xdc\x90\xf8Y\xc67\
+5;\x8b\xe9\xb9Yd\xd3\x19\xf4\x11\x88lO\x16\x89\
+\xf08\x8f\x06u\x03\x994\xee\xd6\x15\x03\xfc\x1e@s\
+\xde~\xede1LuY\xaf-\xee\xee\xe4\x16\xfc\xd5\
+\xf4\x13\xf8\xec\x0b\xf7\xe3\xbfG\x0fb\x81\xc7R:-\
+>_\x11hr\xc3J\xb3\x8a\x87\xdf\xfcK\x22\x12\xb7\
+}\x02\xf5\xa0\x95\xdd85F\x98m\x895\xf8\xb7\xf9\
+\x1f\xe1\xf3\xfb\x1f\xc0\x0bg^\xd4z\xc4\xc3\xd9\x1c\xd2\
+\xb4\xb4\xac\x9e\xe2\xf4\x11\x88\xea\xe7\x7f\xc5F\xc9\xe5\x0c\
+\xac\xd28:\xb4\x11M\x99\x9b\xb13\xe3\xa38\xc9L\
+s|t\x02\xe5R\x19\xcdf\xc0\x0d\xcb\xd2\xd2\xe5\x01\
+\xb6\x0c\x86\xca{R!nG\xcd\xe6\x0d\xa2\x88\x9a\xf5\
+v'.\xc0\xe1\xcaQ\xdct\xe8\xa3\xb8;w\x1fv\
+\xf7_\x83\xed\xb9m\xe8I\xf6\x98\xab\xceTg\xe8\xfe\
+\x17\xe0#\xabw\x9a\xb5\xb4\x05~p\xe7\x03\xf8\xc1\xf3\
+\xd7\xd2\xe5\xb7X>`\x90q<\xa5\xd2\x15N\xa1+\
+\x12\x9b\xf0j\xe58ny\xfef|\xaa\xef>\xfc\xcc\
+\xe0\xd5\xd8\xd2\xb3\x19\x8a\xf8\xb2\xbaN\x98\xb5Z\x9c\xaa\
+\x0ccxa\x04\xc7\x8b'q\xa22\x8a\xad\xe9kl\
+\xb5\x11\x08*\x9a>\xda\xad\xb2O\xeb\xdc\xecTd\xa6\
+1\xcf\x93\xa8\xec>k\xdck\xf0\x19\xe1\xa2\xc9\xc2y\
+q\xdd\x7f\xdd\xf6d4\xcd\x18Pi6\xe91<\x13\
+w\xc8Z\xc7\x8e\xf7pn\xd1\xf3\x98\xdf\xf3>\xca\xb3\
+\xfac\xcdS\xb4\xee\x88\x91\xda\x8d)\xc1\xd5\xb9\x8f\xe1\
+\xa9\x9b\xbe\xc7\xd3\xdb\x81p\xd3\x14\xc3C\xaf|\x15_\
+z\xf7\x01\x5c\x97\xbe\x951@i\x11\x8b\xa6\x98\x1e\xbc\
+<\xcfwx\xee?\xd7|\xdd\x02\x99\xa3\xb1\xbb\x88\xe8\
+\x01r\x9f\xcdX\x17\xe9\xe7\xdf\x0cR6\x05\xc3V{\
+7\xf9\x1c\xd3\x16\xe7\xbf\xd6\xe2\xbd\xc7\xef\xf9\x9f\x02\xfb\
+\xca\x9e*\xe2\xa2\x99\xb3\xb4\xb4]_\x03\xa8\xf0a\x7f\
+Y!\xbd.\xeb\xad\xa9\xc4v[\x1ai\x15\x9d\xe8\x0c\
+\xc4r\xd8\x1d\xbf\x9c\x0c\xaf4\x1a\x09\x90\xe1\x1f,~\
+X~\x14\x8f\x1c\xfb>>\xbb\xfd3\x16\x08\xb5\xe1\xf9\
+\xcdK\xee\xc33\x93\x07p\xacz\x86\xc7])\x06L\
+\xb7M\xd1_a4\xa0Nx\x14\x1f\xb6$xH\x92\
+\xb8\x99=8S\xd9d\x12\xf3\xae\xb4VGdv\xb1\
+\xaf\xce\x02\x97\x17\xcaF\x11H\x98\x8eD\x83rs\xef\
+\x89_~\xb9\x80B\x81\x8c\x0ab\xe3X\xf1\xa5+\x06\
+\x88\x91\x81 5B%\xf9j\xef\xfel\x80\x1f\xed6\
+\xa3\xe1<\xd6\x14\xa91=*r\x7f\xbf\xc0\x83\x8c\x22\
+\x7f\xe7\x82Y|4}\x1b>w\xea~\xbc>\xf3\x96\
+\xad\x00\xe2\x9fO\xe7q\xd3\x9a\xddx\xa79l\xa9\xb1\
+xX,\xa0\xdb\xfa1\xf5\x14\x10Z&\x8bL\xb3\x17\
+\xf8\xe6xW\xb8\x97\xac\xf2\xd2\x81\xba\x9d\x08\x88\xe5\x92\
+~\xec\xab\xb3m\xb3|\xa4\x8aPy\xea\xba\x87\xca\x87\
+\xd1\xdf:\xf1\xd6\xe5\x01\x16\x04\x8d#\x99\xfa\xd3\x17%\
+\x19f\x1d\xdf-|\x0a\xc7\xd0Q\xfc\xab<\xc4\xf9\x8a\
+\xba\x84[\xd0\xd6\x10\xbe\xf5\xf6w\xf0\xc5+~\x17\xaf\
+\x8c\x1e\xc1\xb7N~\x17\x07K\xaf\xe3\xaa\xd46zf\
+\xc3\x92\x18\xb17\xd9\xa8\xb8\xb3O\xc8\xd13\x0eeZ\
+\xb4\xdd\xa2,\x02Kc\xa9\xc8\xeaR>\x9a\x8e\xd2\xf2\
+\x81s\xfb\x82\x94g\xcfe\xca\x8b\xbe\x0b\x00\x1d\x1e\xc9\
+\xd2\xcaY\xddI\x8b\xfa\x852\xf1\xa9\xc1:\x07\x14\x93\
+\xce\xe2\xa7\x89\xa7\xa9Q\xc1\xab\x13\x1b\xf1\xd4\xecsx\
+\xe1\xc0a\x1c(\xef\xc3\x86\xe8.\xfe\xfa\xcd\x8dE\xe7\
+\xb8\x87H\x8a\x990\x10 \xd6D\x8e\xf6\xee\x94t\xf4\
+\x9d#\xfa\xf7\x90\x98]\xa5|\xb3\xd4\xdc\xfb\xce\xa7^\
+\xa4\xdb\xffx\xe5\xd5\xb3\x0b\x80(\xf7\x02\xba4\xba\x04\
+\xd0\xbbGW\x1d\xf4\xee\x85xO\xe3\x84\x8d\x1e\x88\x0c\
+O|\xf4\xb7\xbc\x1bR\xb7[\xb4\xd6\x1c\xd6\xd2\xe8x\
+Kx\x16\x8d\xc7~\x9e\xaf\x9eV\xd4\x1c~t\x8e\xaf\
+\xb6v\x93\x02\x08\xe7\xa1\x02^\xb3\xd4p\xca\xeb\xbf\x0b\
+\xa8\xe7y,\xaf\xbe*]\x00P\xbb0\x22EtR\
+\xe5\xc6\xe5(\x12V\xcb\x90\x07DOz\x1a%XT\
+B\xe3X.`\xb2t*\xe3\xc4L\xf3\x10D9\x84\
+\xf7\x12Io\xfcLF'i\x1b\x01\x0a\xe7z\x85\x14\
+\xa25\x108Jx8\xe2B\x1f\x1bd\x1463\x83\
+\xb5\x80w\xf4\xae\x83\xce\xf2\xef\xa3\xfcy\x01`\x18\xca\
+&r<\xad)\xd6u\x5cg\xc5{@\xd4V\xc5\xb6\
+),\x1a;\x8a\x0e:)\x1fV\xfa~\xfe)A\x95\
+C\xe8)\x1a_\xef\x9f\xd6\xcd\xf7'\x81Q\xe9\xc9:\
+\x15\xf7X|\xb7U#l\x13\xdb\xc6Bc\xef[\x9f\
+<P`GI\xfe\x9e\x967\x86\xbcuy@$\x16\
+=P\x9f\xe5QT\x10\x94\xc8[\x8cX\x84\xb5,\xed\
+\x97\x1b\xc5\x07\x8e`\x9f\xbcQ&\xe76\xa2ue\x89\
+\xb0<%\xf2\xc5\x9dI\x84JX\xb5Wh\x91F\xb4\
+\xddt\xac\xe4\x80m*\x0e`'bZ\x13#\x91l\
+\xd0l\xee\xa3\xf2\x7ffs\xfe\x03*\xefe\xfa\xbf\xf3\
+t6\xd7\xcc\xf9\x09\x8ag\xf2\xa1{\x16Bo\xfd\x09\
+t_\xe9\xba\x82\xc0\x0a\x02+\x08\xac \xb0\x82\xc0\x0a\
+\x02+\x08\xfc\x7fB\xe0\x7f\x01h\xa6\xb8\xa7}\xe0\x9b\
+\xc8\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x000z\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x11kzTXtRaw prof\
+ile type exif\x00\x00x\
+\xda\xad\x9ak\x92\xe48r\x84\xff\xe3\x14:\x02\xf1\x06\
+\x8e\x83\xa7\x99n\xa0\xe3\xebs\x80Y]\xddS\xb3\xb6\
+#m\xa5u2I\x82xDxxx\x80m\xd6\xff\
+\xfc\xf76\xff\xc5_(!\x99\x10sI5\xa5\x87\xbf\
+PCu\x8d\x1f\xe5\xb9\x7f\xed|\xdb'\x9c\xef\xf3\x17\
+\xde[\x9c\xffv\xdd|\xddp\x5c\xf2\x1c\xfd=-\xe9\
+m\xff\xb9n\xbf:\xb8\x87\xc6\xaf\xf8\xad\xa32\xde\x1b\
+\xfd\xf7\x1b\xf5\x1d\xc1\x95?:r\xf7\xe05#\xfd~\
+\x9f7\xf5\xfd\xe1\xdd\xbda\xdf\x0e\xda\xbb\xbcTK\xfe\
+\xbe\x84\xfe\xb6_\xef\x8c\x8f\x19\xf8g\xf4\x15\xca\xef\xd3\
+\xfe\xcby\xc6z32\x8ewn\xf9\xea+\xdfE\x83\
+{\xfd\x8b\xbe\xf9\xc7\xf8\xc4\xc1\xfaB\xa3\xc7\x17~\x87\
+\xf3\xed}x\xed\x851~\xb2\xd1#\xaf|7\xf6\xd7\
+\xaa\xfd\xef7~Y\xe3\xfd\xab\xcf\xb3\xd7\xf3{\x9b_\
+m\xad\xf9\xe3a\xfb\x93k\xbf~\xfd\xe1\xd9X\xde\xeb\
+^\x1d}\x9fv\xfa:\xda\x9f\xae\xdb\xf8\xc7u\xff5\
+\x8c\xfbmFq}\x8d\xec\xbe_/\xd5\xda\xdf\x96Y\
+~\xfd\xdb{\x96\xcd\x9a\xcd\x01n\x0b\x09\xbf\xa4wQ\
+\x9f\xa5\x9c_4\xec\x18\xc6\x9f\xc7\x12\x9f\xcc\xbf\xc8\xef\
+|>\x95O!\x02\x86\x017\x13Pu>\xc3V\xeb\
+\xac\x7f\xb6\x0dv\xdaf\xb7]\xe78\xec`\x8a\xc1-\
+\x979:7\x9c?\xd7\x8a\xcf\xae\xba\x81\xb7\xad\x0f\x06\
+w\x07\xbb]\x06\x1d\x13\xc7;?\xc0\x08\xce\xf7\xeek\
+.\xf6\x8c[\xcfp\xc3\x16\x06\x9e\x96\x96\xce\xd2\x99\xe5\
+\x89\xf31\x9f\x1f\xff\xdf\xcf\x8f\x1d\xed\xad8\xc0\xc0\xe5\
+\xcbV\xcc\xcb\x09WLC\x9e\xd37\xadp\x88\xdd\x1f\
+\x1c\xc5c\xe0\xcf\xe7\xcf?\xc5\x9f\xc7\x83\xf1\x98\xb9\xb0\
+\xc0\xf6\xf4\xdbE\x8f\xf6\x17\xb6\xbc9\x8e\xf64\x8c\x1c\
+o\xc0\xda<\xdf\x0e0\x11cG&c=\x1ex\x92\
+\xf5\xd1&\xfbd\xe7\xb2\xb5\xd8\xb1\xe0\x9f\xc6\xcc\x9d7\
+\xc1u\x5c`ct\x93Y\xba\xe0}\xc29\x84\x1ec\
+\xf3L\xb6\xa7\xad\x8b\xee^\x86\xf8pD$B3\xae\
+\xa9\xbe\xe1\xab\x10\xa2\x182C\x945\xb4\xe8c\x881\
+\xa6\x98c\x895\xb6\xe4SH1\xa5\x94\x93\x18\xb4e\
+\x9fC\x8e9\xe5\x9cK\xae\xb9\x15_B\x89%\x95\x5c\
+J\xa9\xa5\x99\xea`\x85PcM5\xd7Rkm\x8d\
+A\x1b=7\x9en\xa5q\xa1\xbb\xee{\xe8\xb1\xa7\x9e\
+{\xe9\xb5\xb7\x01|F\x18q\xa4\x91G\x19u43\
+\xdd\xf4\x13\xb2\x99i\xe6Yf\x9dm\xd9\x05\x94VX\
+q\xa5\x95WYu\xb5\x0d\xd4\xb6\xdfa\xc7\x9dv\xde\
+e\xd7\xdd\xbe\xbcv\xbcj~\xf3\xd9_=\xf7\xaf\xbd\
+f_\xaf\xe10s|\x16h\xf4\xf1\x1a\x97s\xfet\
+aE'Q>\xc3c.X<\x9e\xe5\x01\x00\xed\xe4\
+\xb3\xa7\xd8\x10\x9c<g\xe4\xb3\xa7:\xa2\x22:f\x19\
+\xe5\x9ci\xe51<\x18\x96uq\xdb/\xdf\xfd\xf2\xdc\
+_\xfcf\x88\xfb\xff\xab\xdf\xdcw\xcf\x19\xb9\xee?\xe1\
+9#\xd7\xfd\xe0\xb9\xbf\xfa\xed\x07\xaf\xcdv\xf2\x9a\xf8\
+\x01bS\x18\xca\xa8\x8f'\xfch\xb0Js\xa5)3\
+\xfe\xa3\xa3\xf9\xa7\x0f\xfc\xb3\x8e\xda\x8cuV\xa6\xce2\
+\xd6\xf6)\xcd\x91\xd3X\x99d\x87_K[%\x0d7\
+\xfb\x1a~\xa5<v\xdfy\x19\xdf\x93\xb7e\xec]f\
+l\xf4b\xe3X\x91\xce\xb0\x0a\xb6\xab+\x95\xa7\xd7Q\
+\xa7\xc5\x82\x89\x9e\xda\xa3K\xe4\xda\xe6z\x9bs\xae\x89\
+\xd7\xdb\x93Lv8=\xc7]\xc7t\xc4\x86\xdaX\xb5\
+Y\x8d\x80\xd7\xd9s\x9ehq\xa00\xb2\xf3j<\x9e\
+\xe5j(c\xea\x8a=W\x9c!\xa9\x7fN\x13\x83\xb6\
+\x86_j\xdfi\xe1\xa6\x9d{g]x\x09J\x1f\xcb\
+O\x16\xab\xbe\xb5\xf8\xb5\x9am\x99\x5c\xe4G\xdfs-\
+\xb3\xa7<e\x87\x16\x88E2=\x11(\x91\x8e\xed\xdf\
+\x1cc\x01Mq\xf7\xb06~\xae\x8c)\x0b\x1a\xcd\xcf\
+1\xf3\x96g\xebyc\xb9\x9c\x16\x86\xcb>\xf6\xf6L\
+Ot4\x1e\x1fO.\x18\xc8U\x92\x88/\x08\x13;\
+\x9e)h\xb7\xc4\xf5\x1e\x9a\xe1\xa1\x87u$\x90L\xfb\
+>S\xe9\xa0^\xfe\x9bne&0\xa4\xb5R\x0d\x16\
+#F\x9b\x11P\xdc#\xf5\xf5\xa2G\xc4\xc6\x89\xc0\xb0\
+&\xec\xb1\x12?\xb8\x9b|`4\x1e\x86\x8e\x1b1\x8f\
+\xa2q\xe80\xda\xcdNOX}A\xbe\xdeV\x9eg\
+2!!\xc2J\x1c3{\xdb\x8aIU+M\x8fl\
+\x8b\xd5\xbb0!\xeb\x02\x89$\xeb\xae\xde\x82c\xbe\xc7\
+\xd1#\x1c'\xc7\xd6G\xf7\xbb\xbb4h\x90\xf6\x9cu\
+\x99\xc9\x03\xae\x01\x19[\xfeb\xd9TW\x0d}/l\
+\x876\xea\xb1\xd6(\x86a<\xcd\xd5U\xe0A\xb2\xbd\
+\x93FD\xb4\xfcx\xc4^lq\xf5 \xb1\xca\x22\x8f\
+\x09\x92l\xd4\x02\x98\x01\x9f\x90T\x98d\xf6\x00<I\
+\x85Y=\x00\xa5\xa8\xf4N\x9bdJ\x7f\x845N\x97\
+\x9a\xe1\x0b\x96\xd0\x03\xf6F&\xa2\x0e!\x15Z\x17L\
+\x8d}\xe2P:k$\xbeU-T\xd02\x84\x07\xb3\
+\xf5R\x0d\xb6\xb7a\xb1\x04\x7f\xdb\x9610b\x83\x99\
+\xda\x0cIfy\x02?2 H8\xbb\x00\x22\xff\x10\
+:P\xe8\xc6\x985\x13\x8as\xf6j\x16\xc1\x19\xda\x88\
+\x8d\xbe\xb6\xc7\x07x\xebi'\x82\xbf\x1dW\xd9'\x08\
+3\x0c\xcd\xb9\xdaF\xe6\x92\x0e\xb6\xb0\xd4\x22D`4\
+\xae\xa7\x04\x93o\x07\x10rf\xcc\xc0z \xc2Mx\
+\xe3\xc1\xb9B\xde\xa9(y\x80P\xe2\xbd\x1dL\xe7<\
+\x08\x05\xf1\xdb\x09\xdaR\x80\x01\x1e\x86\x140uZ\xe3\
+4J\xd8to|\xbcgn~\x0d\xab\xabt\xb3\xb7\
+\x85\x17Y%@\x16\x00go<\xe8v7\xd2v>\
+\xa8\x19\x01Sv\x7f\xf2\xf7\xf3\xa7K\xb7\x89>R\xb6\
+\x84\xb3U\x94\xeeU\x09Wz\x0a\xf9\xd7\x19|\x04Y\
+\xd1\x18\x96\x19blZ?\xea\xa6\x09\xa9e\xa1,~\
+?\x07D#/\xf1\xc8\xc0\xf6\xfb,\x12\x82\xdbf\x9f\
+\xf9\x92\x0f\xa7V\xc0\xcf_\xe7\xa2p\xebO\xd0j\x8c\
+|f\xb4\xdb\x8d\x05\xfa\x84K*\xd4\xb1\xb1\xc3\xdeF\
+\x97tc\xc7u\x16\x82.c$\xd2\xa5\xecbS\x1f\
+\xbe\xaf\xb8w\xa2w\x00\x90\xfd\xcaP\x84l\x97=\xe1\
+3HN\xc9\x0b\x11\xc6\xc6^\x1bz\x02{c\x89\xf9\
+\x08\xf6^\xec\x00\xc0aM \xf3\x0cB\x05\xe3\x93\xa4\
+\xa4;\x88\xd1\xfa\x03S\x19\xa0\x01zvL\xbb\xa8\x8e\
+Y\x0a\x18\xba\xd1W$\xa6\x02j\xdd)Z\x12\xd9M\
+\xca\xe1x\xa9\xe0\x0f\x02\xd6\xe7N\x14\xed\x89\xc7\xbd\x89\
+\x8d(n\x18g\x01\xf8\xa5\xab\xa0\x9e\x05&\xb8\x8e\xf5\
+\x93\x8e+l\xc8\x95}8\xb7_\xce\xed`\xa7\x14\xdc\
+O\x18\xfb\x5cB\x1e\xc6eY\x88\x821OV\xce\xd5\
+5\xe6N\x19\xbco7z^\x0b\xfc\xf7\x09\xa5\xac\x05\
+\x01\xe0\xe1\xb1\x0ei\xc5\x05\xa3\x1e\xa0\xb1<\xfci\x1a\
+L\xbf\x11\x1e\xba\xd0S<\xc7\xc5\x8at$\xd2\xe6\x81\
+\xa7\xb3R\xefJ1L\xdd\x8bG\xe9\x1b\x1c<\x0el\
+\x8f\xa1V\xe6[3\xfa\x8d\xea\x1dj\x00a\xa1\x9c\xb9\
+\xa6\x01\xfe\x91\x1f\x0au\xaby\x9c\xae\x8f\xdcZ-%\
+\xc2\xa6\x9eA\x15\xb4p\xd7F\x10y\xdd\x89\x07\xd3\x95\
+\xaeu\xa3@\xce\x14\x0a\xac\xc5\xb6\x9dN\x17\x8cup\
+\x14\xa5\xeb\x19\xed@\x87\xd1H\x90\xcc\x10\x05\x22\xdc\xb6\
+\xea=G\x86>\x0b\xa4'\xb8\xf5\x01\xc7c?\x1a\xdb\
+\x9d\xd0I\x07wA\x91(S\x92\xd6\x80\xa47pt\
+\xd2|\x01\xff\xc8\x1c\xe5\xcb\xd2\x8fe\xd4x\xfa\xb8\xb5\
+P\xe0@dd\xcc\x8dQ\x0a\x1e\x22\xc2v=\xed\x1e\
+%\xc5m<\x8b'_g\xa1\xce\x9f\x85!\xdf\xf6\x09\
+\x16\xeb\xbeF\x1d\x1au\xdeA1\x0e\x8a\xf8\x0e\x0az\
+y,o[\xcc\xb1\x89\x8b7VqVw{\xd6>\
+^2\xf9\xe1\xd9^\x96c\xfe\x01M\x01N\x95\x11\x13\
+U\x5c\xa6^+\x84i\xaa\x8f\xf2H\x83\xdf\xe1\xcb\x94\
+\xa3\x00^\x9b\xaa\xd3\x0a3\xce\x1c\x1e\x82d\xff$\x8f\
+P\x82>\x16\x90\xdd\xa7\x1eP.\xa0/\x11\xa5\x02\xcc\
+\xaeGz0\x15\x05 \xea\x8e\xe0\xafU\xb1\xcf\xc5\x9b\
+\x9a62\x97\xa1X{:aa>q\xf1\xc0y\xee\
+\x11\xd0\x8eg\xf2:\xf6\xaa\x16\xdd\x89}P\x8e\x02h\
+\xeb\x91d\x0b\x19\xf59\xb3\xf0\x7f\xdaT\x9cC\x82\xc4\
+\x00\xac\x13\xc2Be\xa2GF\x96+\xae\xdf\xd2\x81\xe4\
+\x08D\x0a\x13\x81?\xbd\xc6&h\x89\x9a|\xba\xee\xcc\
+\x18\xf1\xb3%\x22\xdc\x0d\x0a\x14\xf4\x9e\x82\xa6\xc6\x10\x9a\
+`\x8d\xea\x8f#\xc7x.\xae\xd6\x09 \x88:Wi\
+u1\x1f.'\x1ef\xbc^\xabd'\x1d\xd5\xfd\xee\
+q\xaa\x16uK\xd0\xacgN\xfb\xdc`|\xf2R\xc0\
+\xf2\xd4w\xcco\x9eg\xa0P\xcd\xcf\x9e\x8e\x08\xbd\xdb\
+\xd0\xc73\x02\xe5\x09\xe1ry\xa1>\xea\x5c;*\xab\
+\xbcs\x0f\x9a\xfb\xe3\x7f\x0d\xfd \xf3\x0c\x13\x1b\x97j\
+\x9f\xe7\xc6\x19\xa7$\x98\x93\x8e~\xec\x12ao\xfb\xb2\
+\xa4\xbb\x8e.;\x10\xaeC\x8a\xad\x226V\x9c\x87\xb2\
+\x18\x0b\xfd\xa8\xe11\xbb%\xe5<\x17\xeb\xd0\xa2PI\
+\xf2!\xac\xe5\xf1oH\x9f\x07\xad\xe6\x85\xeb$\x1e(\
+\x12\xd6\xa8p\x15\xc9\x96&\xf0\xa8RH\x13_\xdd\x88\
+o\xc4\xa1\x82\x17\x0a&\x09\x9f\xb0<\xbe\x83\x1a\x8a\xd1\
+@\x96\xb9\xf7\xe7u\xf5\xbe\x14\xf9\xbaZ*\xaa\xf7\xd7\
+\xd5\xde2\x06\x8e\x02\xbfC<-f\xfc\x04\xa66Y\
+\xdc5\xf4':\xff6\xc6\xaa\x93\xe4\xb1\x09\xb6V~\
+\xc1d\x99\xb2\xada\x152\x9a\x89q\x08\x10\x99\xe0\xf0\
+\x08!\xc4\x8c\xfd\x9c?\x84G\x0d8\xc1\x17r\xd0V\
+0\x8d\x99\x9e\xa9\x1d=e\xa1o\xc7\xd8M\xd6M\x17\
+\xd3\x19\x02\x22D\xd8P6\x0dIZ\xa5\xa7\xad\x94D\
+\xe6K\xd1\xa9t\xb0\xd2\x1a\xaf\x19\xa8\xee\xf6\xa1`r\
+\x0bB\x8b\xb0\x0b\xe9\xb7lD\xd49*\x11\xac\xc1Z\
+\xb9\x91\x94e\xdf\x908\xd1Fq\xd2\x14NH\xd0\xfe\
+\xde\x86\xb3O\x0b\xee\xc3\xaa\x09\xa9,\x1e\xad\xc5\x0a\x06\
+$\x08B\xac\xa1\xae\x06\xf9\x05\x07\xd4\xfdQ\xf4\x08\xb5\
+\x93\xbc\x16%K\x16\xb1\xeda\x86\xd2\xc1\xb7(\xb2v\
+Y?\xf1\x1a\xf1(5\x07\x9e\xf1q\xa5(\xa1n\xa4\
+&\xb0d\xb9\xb2\x15\xe4yRo\xc3F;9\xda\x19\
+\xaeSo\xf9=\xa2\x84\xb50\x08K\xd1k=\xc8Q\
+.$W\xa4+^\xf0\x1c\xc2\xc2n\x81\xa4g\xbc\xcc\
+\x1c\x5c\xf4*|\xd6\x0d\xda,P\xfbr\xa9\x83u\x92\
+\x86`\xfe\xc3\xf1\xd6iE,) \x03\x85\xb0t\xa5\
+\xfd\x8a\xf8\x5c\x18\xe3^G\xc9\x9a\x0b\xb1\xe0=\x82\x17\
+\x1d\x1d\xb5PT)\xa5\x13#\xab$\xbe\xd8]KC\
+\x01=\xa9\xa2\xc8\x87\xf9x\xe8\x8fP\xe2\x16\xf1dX\
+N\x8c\x9a\xbe=\x22+\xdf$]\x1e\xac\xa1RZ\x17\
+n\x9e\xe8o\x9a\xb0Gn\x95z\x96F\x1f\x08Cr\
+[2X\x087\xf0t\x0a_B\x81\x90\xb5=\x97\xef\
+\xd1\xf3\xf7\xb1\xf3F\x8ea]\xcb\x05\xaa3[}L\
+\x0e\x1d\x95\xe9M5M\xd4\xb6\xb1w\x22V-\x8bT\
+\x9d\x1ar\xa6\xba\x5ca\xf4|\xc9\x02\x15G\xc1\x84H\
+1Mz3p\x09\xd5\xde\xe8&\x84\xfd9_\xday\
+!>\x81x\xa1\x18Pl\x08\xfe\xfd$\x1c2\x8c\x22\
+\x89R\xb9?\x8b:\xd1\xe0\xed\xf9S\xcd)\x8a\xe8\xce\
+\xf5\xa8\xc0\x98*\xd1\x92\xf6:\x906\x0e\xb1\xe3\x14G\
+\x84+\x8f\x96GI)\x1a\xf7=<:\xaa\x17rH\
+=\x16Y\x10\xa4{a\x0f\x97R\xfc\xcd\xb8\xc0[\xf7\
+\xc3\x8e#(\xc03\x04q\x98\x83a\xcd\xb0$)\xd2\
+\xc5S\x10\xa8\x84O$8\xfa\x07\xcfU\xc6\x95\xd2\x83\
+Kj]\x10\xca\xd1\xaaK0%\xb7\xe4o1aH\
+-\x08b2\xb3\xdf\x16\x8bF\xc5\x17\xfe\xa1\xcf\xb1e\
+\xd4]'\xa8\x97a\xd1/\x09\x1a\xc6u\x0f\xb2Q\x0a\
+\xea\x82\xf5\x12\xa2\x19\xf9\x0f\xbc\xa6\xefx\xfd0b\xd6\
+\x93\xcaB_z\xf3\xb4vD>\x8f\x12\x87\xd5d\x89\
+\xce\xfc\x8aNh\x006\xe6\x08\x10\xa7;\x8d\x0f]\xb7\
+\x0f;\xff\xa2\xeb\xcf\xf6I\xf5g\xfb$\x1b\x00\x9e\x93\
+\xc25\x96\xde\xf6\xcd]\xb3)\xb1\xef\x9b\xd9\x15\x0f \
+\xeb\xa1\x02\x960\x1eY5z&*\x0e\xde%F\x0f\
+\xdaU\x1d\xfd\x09\xf7\xfcW\xb4G\x02\xab\xb7'W\xad\
+\x89\x90\x04\xafo%\xc1\x02\xfb\xcc\xdd\x998\xc9\x04D\
+\xc4\xd1\xd8S\x19\xee\xa6i*e\x14\x009\xa2\xe3$\
+\xca\xbbk6\xd6u\xc4\xf6r\x14\x88I\x04\x83K\xb4\
+w1\x0c\x8a\x94<=-\xbcO\x90\x0e1\x17\xc0\x9f\
+\xb6\x81\xdd<\x0a\x9d@X\x84\xfc\xcc\x85i\x91e\x90\
+F\xe8I\xa5H`\xaa\xcd\xc0](\x82\xa6\x01*\x94\
+\xe5\xbe*\xe5\xb8\xfe\xa8\x90A\x98\xd0_\xc0\x94\xc9\x9d\
+['\xa5w7Q\xc0(\xe65S\xc0\x9e\xe4\x95\x16\
+\xb3\x05\xed(\xc6\xda@v\x9a'\xb26\x86\x9c\x9e\xc2\
+v(!\xa5\xa9@Y\xca!\xda\xb9Hg\xb3\xc8\xf7\
+F'\xc0\x18ix\x92\xd87\x1dh^!\x08\x97\xd5\
+6\x06k:\xdb7\x94+\xda\x04\x187\xc9!\xbfU\
+\x8a\xea\x5cwJ!\xeb!\x06\xca\xf7\xb4dN^\xa2\
+%\x11\x16\xa7\xb6-\x8f.\x83\x0c1X\xd4n\xe1a\
+O\x12*Y5DT\xc1\xa2\xcax\x8e\x82\x92\xd7_\
+5R\xb6y\xfd~K\x87\xfe\x5c\xcf\x1fm\x9f\xca\x87\
+\xe9\xca}\xb6\xd8\xc3t\xe5+,\xde\xa8\xc8\x8a\x0a\xf3\
+wa\x01\x9a\xff\x05\x01\xc7\xd6\xfd\xdd\xaf9\x00\x06\xf6\
+\x88Q\xca\x5c\xed\xd8t\xdc%\x8da\x05\xd1\xd0O\xa5\
+\xbc\xf0\xd8\x11D\xb9\xd6o\xa1\x94\xbf\x85\x92^\xa6!\
+\xde=b\x94\xc8\x81dT\xd4T\x97$XY\xc0\x81\
+#\xa0\xd2\x8b!\x02\x9e\xecP\xa0\xf0~\x82\xd6Rp\
+\xbe\x99X\x06\xf0Qi\xf8!\x8bH:\x8dWt\x86\
+}%N+\xa8`\x84\xb9\xbf\x8f\xfa\xa9\xba,\xdc4\
+I5\x0e=n\x18\xea\xf4l\xdd<E\xcd\xaaW\x12\
+\xd3s\x00\x99P\x0f5\xd0\xb1Hp\xb2\x9b\x97\xda\xe7\
+\x1b\xb4\xaa\xcec\x19]U\x98\xf57=A\x84\xb0\xd7\
+j\x1d\x111n\x97\xeb(\xd4z\xc9cV%wx\
+\xc2\xa3\xa1I\xb9\xda{\xa1[D\xa7\xb6\x1d\x15\x1c\x9d\
+\x1e\x97\xadz0\xe1\xb4[\x8aN\xdd\x82\xb1\xc1\x15\xdd\
+j\x97\xf2h\x8f\xb3\xadB\xd2\x1d\xa7:\xa0T\x96\x86\
+\xa8\xc2\x98\x10\xb12VZ\x92\x9c8\xb0\x0e\xc3j\xc6\
+\x9d\x03\x12!+n0:\x86\xcbrW\x1eoq\xd7\
+]\xcc\x95b\xf7\xf1\x13\xc5\xe5n\x5c\xc1\x1e\x5cU)\
+E\x8df:6\xec}\x88\x13\xcb\x8eW\xb5\xf9W\xf2\
+i_\x8d\xc2\xf6$$\xd8\x05\x89\x10\xc8Qd\xb4\x1f\
+\xb6\xaa\xcc|\x1a\xbd\xdcZ+j#J\x9d\x94\xf0f\
+\xc2\xae\xf8\xd2^\x1b\xe8\x22U\x9c4\x99\xb3*\xad>\
+\xec\xbbc\x90\xcf&\x95y\xf5J\xd5J\x9c\x10T\xc8\
+B\xb7\xf8y\xc3D\x04%\xbd\x02\x8a)\x19\x8a\xaa\xf1\
+O\xfa\xe0\xd9\xfe\xe6\x0e\xa3\xa2\xfb\xefb\xe4\xe0\xe6D\
+\x89\xcc~\xe2\xe4W\x94\xd8\xdfS\x83\xf9=7p\x05\
+\xde\xc5\x5c\xeb\x160\x1a\xf9\x91\xca\xea\x9f\xac\xf5\x96l\
+\x7fh\x91M\x05\x09\xa0\x83\xd7\x0ev\xb1\x1fY\x85\xde\
+\xb6\xf5\xfa\xf2\xcc\xe6,\xb27\xf4\x063\xc6\xef@'\
+j\xeb\xae\xee[\xc7e\xeaJ\x03\x9f\xe9\xbd5\x92\x0c\
+\x0a\xb1K\xbd\x8f\x01/\xef\xea\xe7MM\xc0\x16\xd4\xe6\
+0\xf5B\xb6\xb4\x83\xf5|A\x11\x99{O\xc7Cf\
+\x84\xdc\xad'\xee\xe7\xa7\xa1\xc0\x97\xf3\xdb0\xa8{\x1c\
+s\xa0\x7f\xb7bn}Y\x80\x90E\xc3\xe3hf\xd1\
+p?)\xbfK\x87\x96z72\xc2\xad\x0c\x13\x8ap\
+!H\xbb}C\xf3\xee\x04B\xf5\xa7\x9a\x1bRM\xda\
+\x99\x85E\xb5\xc9\x85<N}\xd0\x0d\x0a\xd8e(\x1b\
+\xc5\xa0\x8d\xfe\xca\xf7#\xed\x95E\xdb\x038\xea\x85\x0f\
+\xa9\xe8\xb3=\xff\xfd\x05\xc7\x92>3\x8a\x9d*o[\
+m\xea\x90\xc4\x8b\x12\x9e\xe2\x89Za\x9e\xcd2B\xf6\
+\xec\xdfq\x92\x94N\xb4\xcf;PLZ{\x85,9\
+\x1f\xdb\xb4\xf4C\xad\x03xc\xc0K*\x91\x1e\xac\xa0\
+8\xa8\xda5\x02\x8f\x81\xb8Y\xe7%\xc0CEB\x02\
+A\x139\x82\xf6\xd8\xe3\xf8\xa7\x1d\x1b\x0d\xe0\x7fw\x16\
+\x09\x99\xe9Q\xef(4mG\xc3e\x09\x1c7\xb4\x12\
+\x84\xdb\xaf\xfa\xbe\xb9?B]\xe6\x16\xea\xe1\x16\xc8\x98\
+_\xfbq\x98\x918g\xe9\xf4GZ\xeazW\x98\xb5\
+\xb3\x0b\x10ORP\x22\xd8\x14;\x88\xba\x16\x84\xc4\xfe\
+h\xd7/7)\xf8\xb7#P\x97\xfbT]{\xd4z\
+\xe9Z,\x92\xcf\xb1\x8c\xcf\xe5H\xbd\xdb\x19\x81\xb2\xa7\
++B\x95\x95\x8d\x85;\xa0\xc1\x1c@ 6\x87D\x98\
+6\x88:\xe1\x92D\x11\xe4J\xa7\xad\x1a\xed\x8e\xd2\xc0\
+\x05\x12w/\xb79\xc2\x10\xfb\x85'7\x93\xc0\xa6j\
+P$\xb8\x009\x9f}T\x83\x02\x12\x91\x03\x1c\x12\xaa\
+ \x88\x97T\x12\xf4\x80h\x88g\x7f\x93j\xf2p\x8e\
+\x16\x97\x1eo:\xfe\xd1\x9b\xa0\xd4j\xfc\xa9X=\xfb\
+@\x08\x9f\xea\x9c?J\x22@\xa2\x8d\x9e\x97v_\x1f\
+\xbd9q\xc8oT\xedy\x9b#\x94\xcc\x03\x15\x09\x04\
+\xe1\xbe\x8b$\xc9\xd5\x18\xde\xddh\x22\x96\xcfK\x0c\xef\
+_tI\x7f\xb8\xfbzbLsk\xeaxN\xeeo\
+mG\x9dF8\xd5\xe9\x1d-]\xd2\xc9xO\xce[\
+\x9e\xe5\xf4\xb2\xaaC!\xbdG\xab\xa9\x9b?\xd7\x12\xb4\
+\xdd{\xb4NwD:\xec\x14\xf9#\x81\xe4\xa2H\xa1\
+\x1c?[\x1e\xa0\x11\xd6</\x0e\xf21\x94\x09\xc0\xfd\
+%\xe8\xa4\x05\x89\x9e{}\xf9\xdfY\xdc\xff\xce\xefa\
+N\xf6+)\xd4\xf3JJ\xe6\xafw\x91\xe6P~\xb9\
+\x9d\x7fr\x02\xc4\xf8\xe8}L\xec\xf6\xbcaHR\x1a\
+\xe7\xff\x0f\xbd\xcf\xff\xe0\x16\xf3\xc3\x9a*\xa5\x16\xeaU\
+U\x0e\x10\xd9u\xc9kg\xb1Q\xe1\x0a\x1eO\x914\
+\xcek\x82\xcf\x89\xf9\xedl\xe9Us\x13P\xb5\x03r\
+\xdc\xae\xebS/S\xda\xc18\xe2q\xfexb\x9eH\
+\xcaF\x22\xd1V\xe9\xf7\xd4U!\xbe\xbeI\xff\xfe\xbb\
+Z\xf3\x9fx\xd9\xfb\xefw\xb4\xa520\xe8\xff\x02'\
+HJ\xd9\xc61\x12$\x00\x00\x01\x85iCCPI\
+CC profile\x00\x00x\x9c}\x91\
+=H\xc3@\x1c\xc5_S\xb5\x22\x15A;\x888d\
+\xa8\x82`QT\xc4Q\xabP\x84\x0a\xa1Vh\xd5\xc1\
+\xe4\xd2/h\xd2\x90\xa4\xb88\x0a\xae\x05\x07?\x16\xab\
+\x0e.\xce\xba:\xb8\x0a\x82\xe0\x07\x88\xbb\xe0\xa4\xe8\x22\
+%\xfe/)\xb4\x88\xf5\xe0\xb8\x1f\xef\xee=\xee\xde\x01\
+B\xb5\xc84\xabm\x1c\xd0t\xdbL\xc4\xa2b*\xbd\
+*\x06^\xd1\x81^\x040\x86\x11\x99Y\xc6\x9c$\xc5\
+\xd1r|\xdd\xc3\xc7\xd7\xbb\x08\xcfj}\xee\xcf\xd1\xad\
+f,\x06\xf8D\xe2Yf\x986\xf1\x06\xf1\xf4\xa6m\
+p\xde'\x0e\xb1\xbc\xac\x12\x9f\x13\x8f\x9atA\xe2G\
+\xae+\x1e\xbfq\xce\xb9,\xf0\xcc\x90\x99L\xcc\x13\x87\
+\x88\xc5\x5c\x13+M\xcc\xf2\xa6F<E\x1cV5\x9d\
+\xf2\x85\x94\xc7*\xe7-\xceZ\xb1\xcc\xea\xf7\xe4/\x0c\
+f\xf4\x95e\xae\xd3\x1cD\x0c\x8bX\x82\x04\x11\x0a\xca\
+(\xa0\x08\x1b\x11ZuR,$h?\xda\xc2?\xe0\
+\xfa%r)\xe4*\x80\x91c\x01%h\x90]?\xf8\
+\x1f\xfc\xee\xd6\xcaNNxI\xc1(\xd0\xfe\xe28\x1f\
+C@`\x17\xa8U\x1c\xe7\xfb\xd8qj'\x80\xff\x19\
+\xb8\xd2\x1b\xfeR\x15\x98\xf9$\xbd\xd2\xd0\xc2G@\xcf\
+6pq\xdd\xd0\x94=\xe0r\x07\xe8\x7f2dSv\
+%?M!\x9b\x05\xde\xcf\xe8\x9b\xd2@\xdf-\xd0\xb5\
+\xe6\xf5V\xdf\xc7\xe9\x03\x90\xa4\xae\xe27\xc0\xc1!0\
+\x9c\xa3\xec\xf5\x16\xef\xeel\xee\xed\xdf3\xf5\xfe~\x00\
+\x9f\xf3r\xb9\x03\xc4\xd3|\x00\x00\x0d\x16iTXt\
+XML:com.adobe.xm\
+p\x00\x00\x00\x00\x00<?xpacket \
+begin=\x22\xef\xbb\xbf\x22 id=\x22\
+W5M0MpCehiHzreSz\
+NTczkc9d\x22?>\x0a<x:x\
+mpmeta xmlns:x=\x22\
+adobe:ns:meta/\x22 \
+x:xmptk=\x22XMP Cor\
+e 4.4.0-Exiv2\x22>\x0a\
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a  <rdf:Descri\
+ption rdf:about=\
+\x22\x22\x0a    xmlns:xmp\
+MM=\x22http://ns.ad\
+obe.com/xap/1.0/\
+mm/\x22\x0a    xmlns:s\
+tEvt=\x22http://ns.\
+adobe.com/xap/1.\
+0/sType/Resource\
+Event#\x22\x0a    xmln\
+s:dc=\x22http://pur\
+l.org/dc/element\
+s/1.1/\x22\x0a    xmln\
+s:GIMP=\x22http://w\
+ww.gimp.org/xmp/\
+\x22\x0a    xmlns:tiff\
+=\x22http://ns.adob\
+e.com/tiff/1.0/\x22\
+\x0a    xmlns:xmp=\x22\
+http://ns.adobe.\
+com/xap/1.0/\x22\x0a  \
+ xmpMM:DocumentI\
+D=\x22gimp:docid:gi\
+mp:8f7f6903-da53\
+-4c1b-8aae-10656\
+92962d3\x22\x0a   xmpM\
+M:InstanceID=\x22xm\
+p.iid:e1687cde-2\
+5db-4743-87f2-56\
+c4414cd2fd\x22\x0a   x\
+mpMM:OriginalDoc\
+umentID=\x22xmp.did\
+:b89bd64b-c719-4\
+18e-8d40-c1d1c4a\
+a0cf0\x22\x0a   dc:For\
+mat=\x22image/png\x22\x0a\
+   GIMP:API=\x223.0\
+\x22\x0a   GIMP:Platfo\
+rm=\x22Linux\x22\x0a   GI\
+MP:TimeStamp=\x2217\
+50232915105122\x22\x0a\
+   GIMP:Version=\
+\x222.99.8\x22\x0a   tiff\
+:Orientation=\x221\x22\
+\x0a   xmp:CreatorT\
+ool=\x22GIMP\x22>\x0a   <\
+xmpMM:History>\x0a \
+   <rdf:Seq>\x0a   \
+  <rdf:li\x0a      \
+stEvt:action=\x22sa\
+ved\x22\x0a      stEvt\
+:changed=\x22/\x22\x0a   \
+   stEvt:instanc\
+eID=\x22xmp.iid:1ee\
+b8475-994f-4d7d-\
+be7d-d0915def14b\
+7\x22\x0a      stEvt:s\
+oftwareAgent=\x22GI\
+MP 2.99.8 (Linux\
+)\x22\x0a      stEvt:w\
+hen=\x222025-06-18T\
+08:48:35+01:00\x22/\
+>\x0a    </rdf:Seq>\
+\x0a   </xmpMM:Hist\
+ory>\x0a  </rdf:Des\
+cription>\x0a </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+  \x0a<?xpacket end\
+=\x22w\x22?>O\x9b;\xad\x00\x00\x00\x06bK\
+GD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09\
+pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x00\x07tIME\x07\xe9\x06\x12\x070#\
+\xf0\xa1\xdbZ\x00\x00\x00\x19tEXtComm\
+ent\x00Created with\
+ GIMPW\x81\x0e\x17\x00\x00\x0f\xb8IDA\
+Tx\xda\xedZ\xff\x8f\x5c\xd5u\xff\x9cs\xdf\xcc\xec\
+\xcc\xae\x01\x81\xb3\xb6\x91\x08\x06\xdb\xd9\xb5\x05\xaah\xd5\
+\xfe\x10\x5c~\xa8\xc0\x8d\x04jB\xd5X\xb1\x0c\xc16\
+\x91\xaa6BUZU\x82\xfe\x0b\xfc\xd6/R\x93\xd2\
+\xb4%|\xa7TJ\xfbC\xa4F\xfc\xe48-\x8eC\
+\x94\x90\xb2\xb34\xc4\x80\xdd4u\xec\xdd5&\xbb;\
+\xf3\xde=\xa7?\x9c{\xef\xbbo\xf6\x8b\xd9\x09\xf9)\
+~\xd2hgg\xde\xbc{\xcf9\x9fs\xce\xe7\x9cs\
+\x81k\xd7\xb5\xeb\xdau\xed\xbav\xfd\xea^4\xee\x0f\
+g\x0e\xdc1\xc3D\x9f$\xa6\x19\x15\xd9\xe9\x9c\xbb\xce\
+\x8b\xb4\x9dsNE\x08\x00\xc5\x0b\x00\x89\x08\x98\x98\x9c\
+s\xe4\xc5\x93j|\x92\xbdq\xec **^\x94\x88\
+\xa0\x80\x92}\xa9\xce9\x05T\xbd\x17\x80P1\xf1\x90\
+\x88\xae\x88\xcaO\x8b\xa2xKD\xfe\xe3\xfb\xdf{\xfd\
+\xcd_\xba\x02\xf6\xcd\xeco\xb1s\xc7\x01\xfd\x13f>\
+\xc0\xc4\x10\x11\x10\x13\x10%R{\xaa\xaa\xa2p\x05D\
+\xc4\x16bJ\xdf9vPUx\xef\xc1l[ \x22\
+\xa8(4(\x84\x89mw\xaaP\x05\x9csP(T\
+\x14 \x80\xc2\xda\xce903\x88\xe9-f\xfe+U\
+\xfd\xca\x99\xd3\xaf\x0d?r\x05\xec\xfd\xc4\xec\x9d\xec\xdc\
+\xb3P\xdcILP\x11\x10\x11\x98\x08\xcc\x0cQ\x81c\
+\x86\x06EH\xfa\x9e\xa1* \xb2\xef\x0c\x10\xa6\x09\x22\
+\x02\x91\xdd\xcb\xd9oM\x91\xa6\x0afNk\xb9\xc2A\
+\x0c\x05\x80\x02\xec\x9c)N\x15 6E\x10\xf5\x15z\
+\xf4\xbb\xdf9\xfd\xfaG\xa6\x80\xbd\xfbf~\x07\xc0\xd7\
+A4EL\xe0\xf03f[\x9c\x89\x82`\x80xo\
+\x82e\x16'\x104[\x90\x02B\x88\x08\xce\xb9\xa4\x00\
+\xef\x05Ea\xffG\xa1A\x80\x8a\x82\x1d\x9b\xf5\x01\x10\
+\xb3!B\x14\xec\x5c@\x9c}.v\xcf23\xfd\xc1\
+\x99\xef\x9c\xfe\xc6/\xac\x80={\xf6\xdeI\xc4\xdfV\
+`\x8a\x99\x01h\x12\xd61\x01 8\xa6\xe0\x01\x06a\
+\x0a\xd6U\xd5\xa0$\x83x\x5c\x8c\x98\x82k\x18\x02l\
+#\xa6\xb4\x88\x04\xf1\x1e\x14\xd6C\xfc}@\x0c\x82\xb0\
+\xa6 \x82\x88\x82\xd8\xd5^\xa8\x8a\xca\xfb\x15\x00\xf7\xfc\
+\xe0\xfb\xdf;3\xb6\x02v\xef\xde\xddj\xb7\xda\xaf\x8b\
+\xea\x1d\xc9O\xa1`b\x10\x01\x9c\x09i~\x1b\xa51\
+\x930s\xf2[J\x10\xd7duC\x91K\xcaQ5\
+\x0523\x98\x18\xde{8g\xbe\x0e\x02\x18\x86\x18\x83\
+|D\x9d)\xc0\x9eL\x105\x85UU\x05Qy\xcb\
+W\xfe\xd7\xe6\xe7\xe7V7\x92\x917S@\xe1\xdc\x17\
+T\xe5\x0e\x84\x8d\xd7pW@\x05D\x80s\x0c&\x82\
+s\x5c[)\xa8V4X9!'*\xd1,h\xd6\
+\x16\x8b\x17\xce\x82\x9e\x86\x08!P\x90c(\x85{\x89\
+Al\x06\xb0 X[;\xba\x97\x88\x00\xaa\x10\xb1g\
+\xaa\xe2\x13D\xf4G\x9b\xc9\xb8\xa1\x02\x9cs\xc4D\x8f\
+\xd5A\x0b\xb6-U\x10\x80\xa2(R\xb0\xca\x83\x9e\x06\
+\x04\x18DM\x00\x81B\xc3w\xf1{f\x07\x05A\x89\
+@\xce\xfc_\x22z\xf2\xe7\x10\xdb_\xc7`W\xd8s\
+\x99\x01\x0a\xcf\x8f\x812S\x82!\x04P\x15(\xf4\xb1\
+\x9bo\xbe\x99\xb7\xac\x80[?~\xcb\x01U\xd9\xaf*\
+\x01\x5c\xd1c4\x09BL\x99Ul\xa3\xa2\x02\xaf\x0a\
+Q $@HHe \x86\xc2\x84\xf5\xaa\xf0\xa2P\
+%\x88\x22\xfco+\xe5/\xaf\x0av\x05@\x8c\xb8\x13\
+b\x07W\x14i\x1f\xde{\x88\x08\xbc\xf7PE\xfd\xde\
+\x82\xe9m\xbd^\xef\xae-+\x80\x89\xee\xd6\x001 \
+\xc2Y\x83\xf6)\xc1\xcc\xace\xb1\xa0\x12\xa9\xfd\x90\x18\
+^\x81\xca\x0b\x00\x86\x82P\x89&A\xcdo\x09\x95\x17\
+T\x95\xa0\xc65\xa3\xac|\xfa>*\xc7\xd2\x9c)\xc2\
+\x8b\xa2\x0a\x88\x89\xd1?\xb8>D\x05\x95\xaf\xa0I!\
+\x02\x22\xbe{C7\xdf\xe8\x0b\x05f(\xfa\x17q\x9d\
+\x92\x14\xc9\x97\x89l\x83\x08i\x8eBp\x94\xca\xa3\x8a\
+\xee\x12\xa2\xb4c\xb2t\x18\x9eYU\x92\x9e\x03\x10\xbc\
+\xb7\x00\xa8dA\xd0\x22{x\xb6\x02^\x14\x02\x1f\x02\
+'\xa7,\x22\x0a\xf8\xb2\xb4\xfbDQU\xa5\x19%\xb9\
+\xa6B\xa4\x9a\xd9\xaa\x02\x88\x99wE\x7fW5\x1f.\
+\x5cap\x8e\x10U\x83\x90\x88\x9a\xd5\xbd\x80\xd9A\x14\
+\xa0\xf0\x19\x85\xb4\xe9\xbd\xa4\xfc\xcf1\x1e\x188\xc2\x1a\
+\x86\x1e\xb0\xdd\xebB\xde/\x0ag\x96\x15M\x9fy/\
+\x81(Y`&\xb6\x8c!*f0\x91\xf4]0\xc2\
+\xae\xe4\xbf\x1f\x16\x01\xde\xfbmLlA\x8a)\xf9Z\
+\xb4r\xcc\xfb>`OU\xf1\xc4\xe3\x8f\xe3\xe0\xc1\xbb\
+\xd1n\xb7G\xd4\x99Q\xe5u\xf7\x91\xb3\xc3\xcdy\xc9\
+\x8f\xde~\x1b_\xfa\xd3?K\xe8\xf2U\x05\xef}\x22\
+]1\x0b\xa8\x8ae\x0f\x10\xbc\xf7\xdb\xb6\xaa\x00\x02\xa8\
+\xa3P\x88h\x1de\x89\xcd\x0a\xaa@@\x8715\xc1\
+\x13O<\x8ec\xc7\x1e\x81\x88\xa0\xaa\xaa\x8f\xbej#\
+B\xab\xd5\xc2-\xb7\xdc\x82_\xbf\xeb.\x9c9\xf3]\
+\x88Jd~\x0d\x0a\x1e\x035i\x8c]\xe8l9\x06\
+\x00Z$\xff\x8e\x8e\x0f\x04\xe1,\xd7S`} \xe0\
+\xe0\xc1\x83\x10\x11\x9c8q\x02\xa7N};\xa8\x9a\xc0\
+\x1972&\x19\xe90A\xbc7\x8a\xabF\xaebJ\
+\x03\x14\xcc.\xa5\xcb\xa9m\xdb\xf0\xd4\xdf}\x0533\
+3\x98\x9b\xeb\x9b\xf0!\x08\x8bxHp\xaf$|\x80\
+\xber\xa2\xdcn\x9c X$1#\xc5\xf4\x1e\xce\xb9\
+t\x87\xf9\xb6\x07\x81\xd0n\xb7QU\x15\xbeu\xf2[\
+! \x12(m\xc0\x02\xa49}M\x1f\xcc\xa7\xad\x0e\
+p\xce\x82%\x02tU\x05\x04\xc6\xd4\xe4d\x12\xbe\xdf\
+\x9f\xc7\x89G\xbf\x80*\xc1^\xcd\xc2!\xb0&\xc1\x03\
+;\x8d5\x86Xy\xbeE\x05\x88:p\xd8i\xa0\xb1\
+\xc4l\x81\x8d\x00\x88BHS\x00C\xce\xc6(dX\
+U\xb4\x8a\x02\xad\xa2\x08\x95\x1aR\x14G\xcc\x10*\xa1\
+\xa2t\xa9B\x8cWor\x0a\x7f\xfb\xe5/g\xc2?\
+\x8a\xf7/_\x0eJ\x0f\x04+\x12\x9f\xb4\x0f\x0a\x7f]\
+\x93\x18mY\x01\xaa\x04\x09\xd8\x15M\xb9\xdfJ\x5c\xa4\
+\xa2DE\xd6\xc6\xbb\xb0\x99\xbf\xfe\xcb\xbf\xc1\xa1C\x87\
+2\xd4\x8cw\xf5\xfb}\x9c8\xf1(\x96\x96\x96BZ\
+\xf3i\xddX_\xe4\xef\x89\x08UU\xa1(\x8aM\x85\
+\xdfT\x01\xb1\xf0A\xac\xf2\x14\xc1J\x1a\x0a\x10\x81K\
+\xf9\xb6^DB\xed_\xb4\x0a\x1c:t\x08+++\
+8w\xee\xdc\xda\x10\xbb\xa6\x1e\xd3\xf4\x9e\x99\xb1o\xdf\
+>\x10\x11\xfa\xfd>\x8e\x1f;\x8e\xc5\xa5\xa5\xc0(\xed\
+%\x0d\xc5\xe7A9\x16h\x5c\xd3\xf3q\x10PC\xb9\
+&:\xa2\x02R\x82\x84\xdc-\x81s\xc7H\x1c}[\
+I\xe1\x8a\x02\xce9\x9c;w\x0e\x0f\xfe\xfe\x83\xa9s\
+\x14\xea>\x8b\x09AX\x0e\x1d%b\xc6u\xdb\xae\xc3\
+SO\xfd}C\xf8\x85\xc5E\x0bx!\xfb$\x03\x85\
+B*'G\x94\xd7&L\xd8$\xfemN\x85)\x16\
+\x22\x99\x91\x22\xdd4\x82D#V\xc8\x0d\x5c\x07N \
+\xd0a\x22\xe3\xfd\xa2\x008\xf0\x09\x0e\x9f\x03\x02\xc2\xb6\
+)\x13~vv\xd6\x84?~\x02\x8bKKf\xf1\xd8\
+#\xc8\x9a(\x92\xb9\x81\x88o\xd4\xf6\x14\x9e\xab:f\
+\x0c\x88\xd6V\xa4\x9eD\xc6\x01\x82\xf5#9j\x821\
+\x04\xa6\xa6J\xbc\xb7\xc8\xfc{\x0f<\x80\xdd\xbbw7\
+\x83F\xb8\x0e\xddw_\x08x}<r\xec\x18\x16\x17\
+\x16k\xc8{\x0fUE\xab\xdd\x86xoq \x04\xd2\
+:\x05\xd6\x14\xdd\xbe\xe3\xc0@i\x8c\x18\x10\xa2\xa9\x84\
+b#\x0ak\x9d\xa0\x98\xa6\xa2\xb2\xb2\x18\xe0\xc5*\xb7\
+\xcc-\xaa\x90\xa7?\xfd\xc0\xfdx\xf2\xc9'\x13\x1f\xd8\
+(\xe0=r\xec8\x16\x17\x16\x03\x95\x06\xaa\xa0dU\
+E\xa7\xddBU1\x96\x97\x7f\x9e\x04\x16\xd1\xac\xce\xd0\
+\xa4\xfc(\xf7FH\xbd\x1a\x15N\xc5\x8fq\xebP\x9f\
+\x83\xe0\xd5\x07>\xaf\xb5_\xe4\x08P\x19\xc9(\x86\x88\
+\xdd\xb7\xde\x0af\xc6\x1bo\xbc\x81\xf9\xf9\xf9\xd0w(\
+\xf0\xa9O\xfd.\xba\xdd.\xfa\xfd>>\xff\xc81,\
+,,\xa4\xaer\xa7\xd3\xc6\xf0\xf2\xe5\xe4\x06\x9d\xce\x04\
+\x9c\xab2\xe6\xe7\x1b\xddg\x15\xcd2\x91\xa6\xce\xf1\xd8\
+.`J\xa8\x9b\x93)\x1e\x84\xa0@\xa9T\x8e\xfc!\
+\x94\xc4\x01-\x1aPA\x5c\xc3p~~\x1e\x8f?\xf1\
+\x17\xb8\xe1\x86\x1b\xf0\xcc\xd7\x9eN\xc2?\xfc\xf0\xe7\xb1\
+\xb0\xb0\x90\x84\x99\x98\x9c\xc4D\xa7\x83\xf7/_\xb6\x12\
+W\x81v\xbb\x95u\x92\x09\x22@\x05K\x8b\xb6\x86\x06\
+\x9b\x84\xa2\x09\x84\xb2*\xb7\xae\x00\x84h\x0e\x01\x88\xd5\
+H\x5c*\x895\xc13V]\x19\x7f\x80\x8e\xd4\x1cj\
+Q\x0e\xff\xfc\xca\xbf\xa0??\x8fw\xce\x9e\xc5\x0d\xd7\
+_\x8fg\xbe\xf6t\x0ax\x0f=\xf40\x16\x16\x16\x0d\
+-\x81\xbct\xbb\x13\xe8\xf5z\xf0?\xa9R,\xe8t\
+:p\xccu\x95\xaau+L\x05\x19\xf5\xa6T\xb3\x8c\
+\xc5\x03j\x0e`\xadn\x83?Gl\x85\xac]\x97\xcb\
+9\xdc\xcd/}\xad\xc8`\x9dw\xde9\x8b\xf7\xde}\
+\x077\xdd\xb4\x1d\xcf>\xfbL&\xfcC\xb8\xf2\xfe\x15\
+L\xf6\xbaXYYAi\x0dML\xf6z\x98\x9c\x9c\
+L\x82D\x05\xd4\x1c%\xeb>\x935bD\x01vy\
+\xf9\x8dM\xb3\x00o\xc2\x04mR#\x19\xf9\x88\xa5\xe6\
+H\xf5\x95\x07\x19\xab\xd7}\xc6\x10\xd5\xca\xb2\xc0\xd9o\
+\xbc\xf1\xc6\x86\xf0G\x8f\x1e\xc5\xa5\x9f]\xc4\xec\xec\x0c\
+\xee\xb9\xe7\xb7\xb1\xeb\xe6]P\xd8\xbd\xbd^\x17SS\
+S\x01\xd6V\xe8LLL\xa0\xd3\xe9\x84}I\xa2\xba\
+\x86\x02I\x13\xa7\xb4\x7f\xd5\xf1\xb2\x00\x82\xc0\xa9Ue\
+]\x8eP\xd6\xd5Dh\x14f\x1a\x9a\x12\xf9\x9a*\x02\
+e\xc2\xf6\x9b\xb6\xe3\xb9\xe7\x9e\xc3\xec\xec,>\xf8\xe0\
+\x03\x9c:u\x0a\x87\x0f\x1f\xc6\xd2\xd2\x12\xda\xad\x16\xba\
+\xdd.\xce\x9e=\x9b\x84\x9b\x9c\x9c\xc4\xb6\xa9\xa9\x94\xcb\
+\x15\xc0D\xa7\x13\xe2\x0c6\x80\xb7\xd4\xee\x1a\xbb\xd32\
+V-\x90\x0864\xcd\xfbB)+\xa1\x1aL.\xb0\
+\x96D\x0d\x87\x03\xbc\xf2\xca+8\x7f\xfe<\x08\xc0\xf6\
+\x9b\xb6\xe3\xf9\xe7\x9f\xc7\xec\xec\xacE\xf8\xa2\xc0\xfd\xf7\
+\xdf\x8f\x8b\x17/\xe2\xd2\xa5\x8bX\x5c\x5c\xc2\xc2\xa5\x8b\
+(\xcbaH\xbf\x8a\xa9\xa9)LNM\xa6\x14\x07\x22\
+t\xbb\xdd\xd4\xf00z^7j\xa1\x91a\xd6\x0a#\
+\xf0x\x08P\xbb\xb2\xf9m\x9e\xe6\xb4\xd1\xfb\xa7\x91\x94\
+g\x83\x09\xc5\x17\xbf\xf8\xc7 bLOO\xe3\x85\x17\
+^\xc0\xec\xec,\xe6\xe7\xe7q\xf2\xe4I\x0c\x87C\xac\
+\xae\xac`yy\x19\xcb+\xcbX]Y\xc5\xb9\xf3\xe7\
+0\xf7\xe6\x9b\xa1\xc4\x05\xba\xdd.&'\xa7\x82o\x1b\
+\xd2:\x9d\x0e\x86e\x99|;\xf2}d\xf1(\x9f\xd3\
+\xc6\x984N-\xa0)\x88\xc0\xda\xd71j\xd0H\x1a\
+\x5c\x13d\xb2\xfa\xe6c\xd3\x1fK\xc2\xf7\xfb}\x1c9\
+r\x04\x0b\x0b\x97\xea\xe0\x14\x8a\xa9(`\xcd\xf7\x09\xdd\
+n\x0f\xbd\xc9\x1e\xb2\x9a\x0c\x13\xdd\x09\x0c\xcb2\x15]\
+\xf5\xdaq('\xb1\xb9\x96\x0a\xac\xf1\xca\xe1\xe0\x04\x1a\
+\xe9p\x98\xfbA\xea\xa1\x85\x81M@\xda\xcc\x1eq\x0a\
+8\xbdc\x07^|\xf1E\xec\xdf\xbf\x1f\xfd~\x1f\x9f\
+;r\x04\x17/^l\xa4)\xcd\xa6N\xf5\xcb:\xa6\
+\x9d\x89\x09t\xbb]h\xd6\xcdk\xb7;h\xb7\x07\xe9\
+\x9eX\x145\xbb\x8d5#\xac\xe7\x90[\x0f\x82\x9a\xba\
+,\xd9t7\xabZ3\x0a\xacx\xef\xbd\xf7\xb0\xbc\xbc\
+\x1c\x1b^\x98\x9e\x9eN\xc2G\xa8\xfe\xc3W\xbf\x8a\xb2\
+\xaaP\x0e\x87\x18\x86\xd7\xea`\x80\xe1`\x80\xc1``\
+\x9f\x95%\xaa\xb2\xc4`8\xc0d\xaf\x07\x11\x85\xaf|\
+J\xcb\xedv\x1b\xadV+\xf5\xe7\xb51\xb4A\x9a\x0a\
+\xd5H\xf6\x9b\x8e@\xaf\x1a\x04\x13\xddE\x86\x04\x0d\xb5\
+\x02\x05\xe2A\xc0g>\xf3\xe94 \xdd1\xbd\x03/\
+\xbd\xf42\xf6\xef\xdf\x9fR\xe5\x9e={P\x96%\xca\
+\xb2\xc4p8\xc4`0\xc0`0\xc4`\xb0\x8a\xd5\xa0\
+\x80\xc1`\x90\x94S\x96%\x96\x97\x97q\xe6\xcc\x19T\
+\x81U\x12\x80N\xa7\x83v\xbb\x9d`Mi&Q3\
+\xc00>LF\xfb\x85\x5c \x95\x9b\x99\x12\x88\xec\xfc\
+\x0a5\xca\x00\xab\xca\xa6w\xec\xc4K/\x9b\xf0ss\
+s8z\xf4!,..\x06\x14i\xd6\xbe\xd2\x06\xc1\
+A*b\xea\xcfS\xef/\x13\xa2\xddj\xa1U\xb4\x1a\
+;\x8dY\x82Rj\xa4\xd4\xab\xb8\xda\x10|S\x17H\
+=\x80l\xd3\xb1~\xaf\xcf\x09P8\x0f\x00\xec\xdc\xb9\
+\x13/g\xc2\x1f>|\x18\x17.\xfc,\x8b\xc8k\x1e\
+\xdf\xec(\xa9\xa2\x89\xba\xba\x16\x8f\xc9\xae\xd5n\xa3\xd5\
+ne\xbf\xa5F\x87)\x1e\xb5\xc9\x1b4\x9b\xcd\x1a\xae\
+\xee\x02\xaa\xcdnH\x16\x044\x0b<\xce\xb9\x04\xfb\xb9\
+\xb99\x1c\xfe\xecgq\xe1\xc2\x85\x84\x9a\xf8\x9882\
+\xcf\x88\x06R\x13_\xf3\xa4[\x0f\x5cb6\x9a\x9d\x9d\
+\xc5\xc4Dg\x8d@*\x02%\x8c(\x11\x80\xa4\xb4\xad\
+\xe3\xb8\x80\xcf\x9c\x015/\xa2X\x13%.@\x04\xdc\
+{\xef}8p\xe0\x00\x00\xe0\xf6\xdbo\xc7\x7f\xbe\xf6\
+Z\x9a\xd2VU\x95\xe0\x5c\x96%\xaa\xaaBYV\xa8\
+\xaa2\xc5\x05\xfb\xcc\x02`\xbc\xbf\xf2>M~\xe2\xef\
++\xefq\xf6\xc7g\xd3\xc8-\xc1#\xb8X\xe3\xa0V\
+\xcd\xcc\xfc8\x08(c\xb3\xb1>\xfe\x92\xbbU\xad\x08\
+\x00\xf8\xe67\xff\x1d\xaf\xbe\xfa*\xf6\xee\xddk\x1d\x9b\
+\xc0\xc9G_I\xb8\x0d^\xdeW\xa8\xaaZp\xef=\
+\xbc\xd8\xdf\xd5\x95U\xfc\xf0\xbf~\x88\x7f\xfd\xb7\xaf7\
+\xce\x1dEskn>\xc9\x14\xa0ZnU\x01\xaa\xaa\
+W\x88\x9a,0\xb7x\x1c\x9a ; u\xe4\xc8\xe7\
+\xea|\x9c\xfb\xb86Or\xac\x8fHmv\xa3\xeaS\
+\x08\xeb5,-\xf9E\xff\xa65\x9eS\xf3\x00\x1b\xc4\
+^\x19\xa3!\xa2\x17HG6\xb6N4i\xd2`d\
+T$u\xabk\x125r\xcf\xa6\xa5x\xcd\xe3\x1a\xab\
+\xd5a(\xf6#\xa8\xb9\xceH\xf9\x1b\x0a\xb6\x0b\x1b-\
+\xba\x19\x02~\xb4\xae\xc0\xd9i\xad\x98\x05\xe2\x91\x16B\
+\xd3\x175\x0a\xae\xb9\x8d3\xe1r\xcb\xad\xdb\xbf\xa7\xb5\
+\xbb\xce\xf6d\xc8\xd7\xf5\x0d\xd0|\xd6\xdb[U\x00D\
+\xe44\xb9l\x98\xb9\x06\x8a\x94O\xa4m\xd1Fi\xa8\
+\x0d\x9e\xbe^\xf5\xda\xf8\x7fd|\xae\xeb5ic{\
+!WVv2\x15\xf1\xcc\xc1H\xbc\x12\xef_\x1b\xe7\
+\x98\xdcT\xb7\xd7\xfb\x01\x01\xb7\x11\x8dZ\x9fk\xdfO\
+\xa7\xc2\x02\x143s\xeb\x9a\x8eQ\xb61]\xff\x94\xc0\
+\xa8\x83\xac\x1d\xea\xd3z\x94\xcdp\xa7\xebZ\xff\x7f\x96\
+\x97\x97\x0f\xa8\xea\xfb[=&\xb7\xac\x22\xffX\xb3\xbc\
+\xfa\x5c\x1e2!\xa2\xff\xc5S\x22\xb1\x98K\xfd\xba4\
+\xb9M\x85_\x18\x84\xaci(\x87\xe9S}T\xae~\
+V~\xaff\x012g\x93h\x04\xdd\x0c\xc9O\xab\xea\
+\xcf\xc7:(\xc9\xcc\xbb&&&N\x11\xe1\xb6\xfa\x0c\
+ \xd5\xa1\x97\xa8\x11\xf0F\xfd|\xa3\x86d]1\x8e\
+\xf8o\xa0\xd7#\x87F\x9a\xb0\x18\x81D>\xbf\x5cg\
+\xcd\xf3\xab\x83\xc1'\xbd\xf7\xe76<\x0e\xb8i4V\
+]!\xa2\x1f;\xe7\x1e$\xa2\x22\xa5\xbf<\x10i\xde\
+>\xca6\xb4i\xb4\xd7\xab|\x96\xb5\x9f\x1a\x83\x9a\x8c\
+\xf7G\xb7\xd4\xba9\xdb\xc8\x85\xa0a\xe5\xab?,\xcb\
+\xea\xf4fi\xe7jsk\xf5\xde\xbf\xeb\x1c\xff\x9fs\
+\xee^\x02\x8a|W\xcd\xbc\xaeM&v\x95T\xb7V\
+\xf8\xb5\xbe\x9d\x06\xa9\x8d\x82w\xdd\xdc\x90:B!;\
+\x0d\xbd\xf7\x7f>\x18\x0c_\x00\xb0\xe9\xd1\xf9\x0f3\xb8\
+\xaf\xaa\xca\xbf\xc9Ds\xcc\xee\xb7\x88\xe8\xfa\xc6\xec`\
+M\x84\xd7-\x0a\xbf\xc9\xb9\xa0\x0d\xbcaS\xf4\xa8\xfe\
+\xa4\xac\xfcc\x83\xe1\xf09\x00\xcbW[\xe3\xc3\x9e\x5c\
+(+\xef\xff\xbb\xaa\xaao8\xc7%\x11}\x1c\xc0\xb6\
+\x08\xf7\xa6\xc1\xb5\xe1\xae[\x966\x93\x94\xb4\xd1\xdc\xbd\
+\x1a\x8a~\xeaE\xffiu0\xfcRUU'\x01\xac\
+le\xd9\xadls\x0a\xc0\xceN\xbb\xfd\x9b\xcc\xfc\x1b\
+D\xb4\x1b\x84\x1b\xa1\xe8\x01heJ\xa5\xad\xae\xbcQ\
+\x1a\xcc\x06\x0c\x80\x15i\x95\x9au\x17T\xf4]/\xfe\
+\xf5\xe1\xb0<\x0d\xe0\x7fa\xb4W\xb7\xaa\xf7q\xae\x02\
+@\x1b\xc0D\x10\xbc\xc8\xd2*\xe1\x97s\xd5\xa7\xb6\x01\
+\x1f\xfc{\x10^\xfe#\xf3\xbdk\xd7\xb5\xeb\xdau\xed\
+\xfaU\xb9\xfe\x1f\xcb\x0d\xd3+\x87U1\x05\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x10\xc6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x84\
+eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\
+\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
+\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
+\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\
+\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x03\
+\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\
+\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\x09\
+pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x01YiTXtXML:com\
+.adobe.xmp\x00\x00\x00\x00\x00<\
+x:xmpmeta xmlns:\
+x=\x22adobe:ns:meta\
+/\x22 x:xmptk=\x22XMP \
+Core 6.0.0\x22>\x0a   \
+<rdf:RDF xmlns:r\
+df=\x22http://www.w\
+3.org/1999/02/22\
+-rdf-syntax-ns#\x22\
+>\x0a      <rdf:Des\
+cription rdf:abo\
+ut=\x22\x22\x0a          \
+  xmlns:tiff=\x22ht\
+tp://ns.adobe.co\
+m/tiff/1.0/\x22>\x0a  \
+       <tiff:Ori\
+entation>1</tiff\
+:Orientation>\x0a  \
+    </rdf:Descri\
+ption>\x0a   </rdf:\
+RDF>\x0a</x:xmpmeta\
+>\x0a\x19^\xe1\x07\x00\x00\x0eGIDATx\x01\
+\xed\x9bK\x8c\x1cG\x19\xc7\xab{f\x1f^?\xd6\x8f\
+$\x0e\xb1\x8d\x93\xa0\xe0\x90\x98@ \xc6B\xc8(\xe2\
+\x82r\xe4\xc6\x8d\x84\x0b\x97\x88\x1b\xdc\x10\x12\x11\x97p\
+@9!$$\x10\xe2\xc2\x018!\x14 \x12A\x02\
+\x85\x10\xa1$\xbc\x12H\x22;\xc2\x90\xc4\xb1\xd7\xbb\xb6\
+w\xd7\xbb;\xdd\xfc\xfe_U\xf5T\xcf\xd4\xcc\xee\xd8\
+Nb\x84\xcb\xea\xae\xaa\xaf\xbe\xf7\xf7\xd5\xa3k\xd6\xce\
+\xdd(7<\xf0\x7f\xed\x81\xe2\x1aY\x7f\xad\xf8L\xaa\
+N=)\xc1 \xfe\x95*^\xc2H\x8fJ\x8f\xe7\xaa\
+\x151N\x93\xbf\xa4\x7f'\x90U\xd4z&*\x93:\
+ \x0a\x93\xd1i\x913\xa6y4\xae\xf6\x10\xdf\xf9\xf9\
+y\xa3]\x5c\x5cdxt\x01\xcf9P\x16\xdd\xe2\xa0\
+\x0c\x11\xc9\xd1z4\xb6\x16j\xaa\xa6D\xd99\xda\x06\
+)m\x0c)\x9a\x0e\x0e\xb4\xbb\xf47\x04\xc3\xd2\xa34\
+>\x0b\xf1'\xe8\xde\x8eF{\xa8\xb7\xf1\x08'*A\
+\xb3\x9f\x1aeQ\xe0\x80\xa2\xa8\xeb~\x90\x8abX\xbc\
+`\xb5/f\xc4\x00\x8e\x8c\x17\x03\x8d\xad\xf0,\xf0\xbc\
+\x0e\xfa\xb30\x7fr\xdd\xb9\x17\xe8\xabH\x0f\xe1\x08\xff\
+\xaa\x8b\xb44M\xa7\x9c;N\xe3WXXo\xe5\x01\
+\xb7\xc1C\xc1\xba\x83\xfd\xef\xe4\xd3-\x8a\xdft\xbb\xdd\
+\x13\xc1b\xe9\xac`\x8c-\x96\x96c0\xc4\xc4\xbc\x08\
+\xa7\xc7h\xfc\x10\xc0\x9d\x01\xa6l\xd0X\xf4r\xda\x06\
+\xec\xbd\xa6\x08Z\x143\xd16\xa4\xc9_Q\x8e\xea8\
+\xef\x15m\xe9z\x07\xe9\xf3H\xa7,wTu\xfdK\
+\xfa\xc2\x91\x13Tg\x8b\x88\xc6\x15s@Y\x96\xdfw\
+U\xf50\x881\xad\x94b\x9b\x96\x81\xf4\xdd\x14\xff\x1a\
+ ((\xd2\xb9\x83\xd7\x7f\xdc\xab\xaa\xcf\x87\xbeXg\
+\x9d0.\x03dd\xa5\xc8\xe3\xd5/C\xbd\x06g\xc1\
+Z49\x0f6Q\x97\xd8w\xb7(\xdaRI\x0b\xe4\
+G\xc8\x84\x9d!\x13\xcc\x96\x9c*9\xfd\x85'#\x15\
+\xed\xe3p|&\xb4\x8dy\x8b`0\xadk\xdc4\x08\
+\x83\xf8=(\x8a\xb6\xf4\xef\xb2\xea>HZ<M;\
+\xda\xd4RGF\x8d,\x18\xfb\x98\x06\x89h\xcd\xe3M\
+K\x0d\x94\xc1\xd7gi\xe2\x84\xe2\xdf\x0c*f\x95m\
+\x10\x13;\xe4\x94J[]\xaf(\xfe\xac=\x89~\x1f\
+O\x0e\x00\xd4\x02\x06\x98\xf1H\x1d\x940\xdd\xaci\x02\
+R\xda\xd0\x16\xbc\xd1<8\xdc\xab\xb4\x19G\x1b\xd7\x22\
+Y\x96u\xfdq\xb6\xc8?\xd1\x1e\xca\x82\x5c\x06\x18L\
+\xfb|\x10\xa1\x85\xa5_\x82\x12\x8dG\xa2\xd2\xaac\xbb\
+\x8f\xbdiKye\xb9U\x96V\x17\xaac;\xf0\x8c\
+8V'cF7^\x82\xa6\x81\xe6\xc2C\x01\xadQ\
+;\x92\x8d\x5c\xcd\xc1\xd4!GE\x1a\xfaV0\xbe\xe9\
+{\xe8\xc4o\xe3\x16x\x9a\x11\x91\x7f\xe0\x945LY\
+\x17ip\x82\x95\xcd3\x22\x88*\x8e)k)M2\
+y\x06~U\x8f\xedX\xfb\xa3ZQ\x1c6@\xaa\xcd\
+\x80\xa2\x91`+u\xca&\xf0\xb5yU\xcc\xedr\xc5\
+\x14\x13N\x0aJ\xdd\x22\xe8\x18|\xee'\x9f\x1f3\xf1\
+\x1a\xd6X\xafr\xd5\xd2EW\xf4,\xc8a\xa6\x1a\xe7\
+\xf4\xe5\x1d\xe0\xdc\xe1\x00\xf4\xb6%\x18\xb9\x0c\xb0y\x83\
+\x9c=A\x87\xa8JB6Ys\xd0x\xeb\xc3\xb5\x98\
+\xda\xe6z\x17\x16\xec4#!\xb2m\xb0\xe4`\x11g\
+z\x16\xc7M\xcf:w\x89S1YQWC\xf6\x99\
+\xee\xf0\xd8\x0d\x0d\xc8\xb6=\xb6D\x0d: \x0e\x0aY\
+g\xfb\xab.\xde\xd80\xcf-\xca\xa1=\xb3\xddU\x17\
+\xcf\xbb\xbd\x9f\xfb\x92\x9b\xb9\xed\x10\xd6\xaf\xb9\x02m\x8a\
+N\xed\x1f\xb2\x5c\xed\x92\xc7\x19\xacjf\x9e\xd8\xac\x9e\
+~\xd3\xbd\xf1\xdd\x1f\xa0\xdf\x9a+wl\xe7\xcb`\x15\
+\x02\xfb\x8e\xc8\xe9,[\xa2\x03Z\xe3\x83\x0e\x88\x83\x1d\
+r\xaa\xdbH\x8c\xd0\x09j\x19\x1e\x8do\xc8\x22L9\
+\x5c\xad[&o\xbf\xfb\x98\x9b\xbe\xf9&s@\xc9\xc7\
+F\xd9\x95\x030\xd6j\x1c\xa0\xba[\x05x?\x1f\xe6\
+\xef\xbb\xc7\xed:z\xc4\xbd\xfa\x8do\xbb\xea\xcc[\x84\
+\x8bLX\xf3<\x93]\xc22\x00\xf9\xb23kk\x16\
+\x08\xb2\x08s;\x04\xe0\xc1\x82R\xc54J\xcfa\xb0\
+H\xc2\x16\x09\x07s@\x0b]\x06\xf0\x94\x95\xab\x97\x97\
+\xdc\xf4\xbd'\x98\x06s\xae\xb7\xbcbF\xd7=h\x1b\
+\xc3q\x02\x91\xb7>\xb0ZY\x80#L\x84\xb8\x90\x06\
+s\x87\x0f\xb8C\x8f>\xec^\xf9\xfa\xe3n\x86,\xa8\
+\x16\xfc\xa7v\xe2\x80(]\x8aEgD\x98\xd5\xa3\x1c\
+\xc0G\x9b>_\xadd\x09\xc3\x18~\xe5Kx\x9d\xaf\
+\xd2jmh\x0e\xf7\xe3\xd5`[\xa3\xdc\xb9\xc7pg\
+\x0e\x1e\xc1(\x22\x07\xad\xe6\xb0-\x84\xcaoV\x85\x9a\
+\xefH\x12\xba\x81\xd5\xc0\x0a}[\x86ERJUk\
+k8\xe1\x90\x9b\xb9\xe9\x16\xcb\x82bv\xd6\xd5\xeb\xec\
+\xf8\x13\x94Q\x0e(\x11\xdd\x19o9\x18\xe5v\x04.\
+\xb8\xee\xbe{\x5c\xf7\x96\xa3\x88\x95\xcfd\x80*\xd5<\
+\xa1\xeb\x1b,Ru\xcf\xd5\xe7\xff\xea*\x16\xbf\xe9\x9b\
+\x0f\xd3g\xf1\x12N\xc5\x94A\xaa]\x17\xa8\x8dpk\
+\x9b\xa5D\x1fX\x1d\xdb\x16O\xcdw\xfc1\xd5q\xd3\
+\x07oq+o\xbfE\xc60\x80\xfdBk\xc4\xd2\x1e\
+WF9\x00\x0e\xe2.V\xb9\xc2Xg'\xd7#\x17\
+\xdc\xdc\x03\x8f\xba\x99\x83\xc7\x89\xe4L\x90\xca\x98h\xa5\
+\xbd\xd5\xb4m\x9d\xd7v\x85\x81\xebKn\xf9\x99\xe7m\
+~u\xe7\xf7\xe3\x0f\x8dc\xb0\xd01\xd2\xb4W;5\
+V\xc6\x03\xd3\x98\x1c\xe1\x14\x9e\xa4\xa4\x97,\xd2Y\x07\
+)\xc9\xceL\x85\x84\xca7G:`x\xfe\xf6i\x8b\
+\xeen\xd6\xb0\xf3n\xf6\xc3_p\xdb\xeex\x10\xe50\
+\xae\xe2\xc0(\xbb\xed\xa5\x86YD-e\xd5\xde@\xb1\
+\xc2U\x97\xce\xb8\xea\xdcI7u\xd7\xa7\x5c9;\x0f\
+X\xf3Z\x06\x82\x87q\xca\x02C\x0f\xc6F\xc3\x05\xf3\
+\x19\xc2\x00\xb8\x86g\xde\xea\xeb\xa5\x96\xf4\x96D\xab\xc3\
+\x19\xa1\x8d\xd1\xee)\x99&/\xa41j\xb8\x99\x03\x0f\
+`\x1f\xf3U\xc6g\x941\x98\x10\xad\xa0\x96t_>\
+c\x0aN\xbd\xefnRv\x9be@M\xb8-\xfa\x16\
+i\xdfV\xdf?\x10\xcb\x22\xf3g\x1f\xcf\xa7\x88\xe7\xdc\
+\x88\xf0]Y\x1f\x1c\x1f\x01\xa3\xeb\x91\x190\x92Dk\
+#\xa9\xdf\xd9q\xc0VpE\x98\xb8\xf5\xd1c\xdaK\
+i+^{T\xc7\x88u\xd7[:m\xd0\xee\xbe\xdb\
+\x81\xe0\x7fEVi-\x9dc\x16h\xa1\xb3>\xa8\xe6\
+\x08j\x89 \xd1\xf80\xf5\xce\x22S\x04RQ\xb4c\
+\xdb\xfa\xbc\x1a\xf1\x02\x8c)\x93; \x8a\xd2\xa9%\xb6\
+%\xc0R=\x15\xab6O\x84+57V\x5cu\xf6\
+e\xa3\xea\xec\xba\x95>F\x08\x1ePm\x0a(\xd2L\
+\x09\xb3\xc0\x9cC\xd3R\x1ev!\x0bT\x1bn\xdc\xa7\
+\xe8\xa6\x0e\xd8\xca\xdc\x87\xc4\xca\xe4\x0e0mE\x9b\x1a\
+\xeb\x99\xf9\xa1hM\x82\xa3\x89\xac\xf9\xbf\xba\xe4\xaa\xb7\
+_q\xdd\xf7\x1fc\xfe\xef&\xfd\x81\xb3\xd7\x14\x8a\xbc\
+,\x903B\x16h\xbb\xa3K\x1fx\x9a\x05\xf4\x0d\xbf\
+\xc7`\xe3\x80\xd4|\xcf\xc7{U:\x8c/\x13;\xc0\
+VX-\xe8\xd9\x82!f\xbf^*\xd6\xc16\x1f\xe9\
+\xea\xd2\xdb\x06\xe9\xdez/\xbb\xc6\x1c\x0e\xe0\xe4fF\
+\x83\xaa\xd5H\xe8\x18\xab\x1d\xc1\x9c!\x98\x19\x1c\x1c\xd1\
+8\x05\x83m\xcb\x94\x87\xe4\xbb(\x0f|\x15EB\xde\
+\xdbB\xb92\x07\xb4\x18G\xe1\xb1\x8e\x83\xf4Q\xc4+\
+\xa7-\xa9\xc7\x87\xcfiS\xb5\xb3\xf7N\xfa\xdc[\xd6\
+\xeb~>\xc7\xa8J\xe7\xe8\x10\x19 \xb8\xcdy\xe0j\
+k\xb7\x90\x18\xdaMVh\xfd\xb8\x8a2\xb1\x03$\xab\
+%\xd2\xec\xb6\xcd/\xa8\xd1v\x84FtD\xae7\x96\
+\xd9\xfe^\xb5@\x97;n\xf3\xa9-Ff\xbc\x22L\
+G}\x83A\xa3u\x80\xe9`\xebA\xc4Q\xe6\xe1\x10\
+\xe1\xd8\xc2\x09\xdcv\x90 \xb9U\xf9\xf9\xd8\x02\xe5:\
+\x139@\xe9\xaa\x22\x13\xfb-\x03y`h\xb6+)\
+\x8c\x03._t\xd5\x9b\x7fq\xe5\xfe\xfb\x98\xff{\xfd\
+\xfe\xaf\x93[\x12a\x9b\xf7\x96\xf6DZQ\x0eY\xd0\
+\xe0D\xc3\xc1\xd1Z\xd1\xdf&\xbd6-\xb9A\xd7\x16\
+,\xd3\x99\xc8\x01>\xff\x86\xb9\xb4c>0\xaeHp\
+2\xeb-\x9f\xf5\xe9\xbf\xff\xa3,^\x1c\xa1\x99\xffv\
+\xc3\x13\xe6\xb9\xe3D\xd8\xac\x07\xb2\xc7\x16\xc6\xb0@*\
+\xf5\x95\x05fx\x7f\xacY \x91\xd1\x0f\x0a\xe32\xfe\
+\x9d\xc8\x80\x01\xd3\x06\xbaR!uE\xe8\x9b2\xba\xbd\
+\xf9\x8f\xe1\x97{\xee\xa0\xe6k\x9b3\x81\xa5\xbd\x0c\xb3\
+\xb4\x0eQ\xc7p\xfb\xe2\xd3\x940\x83\xa9-\x1b\x14q\
+H\xe9\xf6\xcf\x0d\xf4\xc1\x93\xad\x92&6V\xb6h\xbc\
+p'\xcb\x00\xcf>\xa4\x7f\xe8\xa4U\xb09\x05\x15X\
+Q\xf7V]o\xe15\xa3\xeb\xec\xd4\xfc\xe7\xf8\xcb?\
+\x8bj\x9c\xe7\xa2\x95\xf12(\x18\xda\xcf\x02\xc6p$\
+\xebh?\x0bt\x10\x8a\xb8\xd1p\xd0\xe2\x19 \xd6\xa9\
+.\xb9\xf6\x159@\xf2\x08D\xbf$\x0a\xf4\x81\xa1\xa5\
+\xab\xaa\x15\xe6\xff\xbf\x9fs\xe5\xbe\xbb\x5c9\xb7\x17C\
+\xf9\x22Tf`h>\x0b\xa0\xb5o\x02\xdc\x04\x9a\x9d\
+\x0d\xb4(\x22\xc7>\x9e$<F^u\xaa\x8d\xa6C\
+x\x86t\xc9\x004\x03sE1\x18\xb9\xdbK~+\
+\xdbS\x0e6\x98\x00\xc8\xe7je\xc1\xd0\xcb\xfd\x1f\xe3\
+\xf8\xcc\xf5\x95B\xa94\xb5\x08B G\x84\xef\x01?\
+\xaf\xa1g\xcc\x8f3\x16\xda\xd1a\xd6\x97v\x82\xab\x8e\
+\x17\xf7!\x10[\x8d\xbe\xb4\x1c\xe7\x80l\x5c\x95\xbe\xfe\
+\xee1;,\x9e\xa1\x04O\x80\xd6\xbb\xf0\x86\xc1:{\
+?@\x0a\x93t2\xde\xa2\xe4\x8d\x93Af\x94X\x86\
+\xb6\xc1\x0c-q\x84\x9c\xa4\xefd\xc3\x81\x16\xf57\x96\
+W\xdd\xe5\x97\xd8]\xb6q\xed\xd7\x8b\x9e\x88:l^\
+\x8fr@\xd0\xbe\xcd@\xfa\x99w\xd5P\xb1:v<\
+\xa8\xf5\xd6\xf6\xc7j_\x9d?i\xe0r\xd7\x01\xe8\x95\
+\x5c\xc6\x09C\xf4%IO\x09\xa1G\xed\xa6\x0f\x8e\xa2\
+\x1b\xe1\x01G\xbb\x85\xbfC\xd0\x0f\xc0]\xb7\xf4\xe2\x0b\
+>Ug9Y\x8a\x9fI\xda\xfak\xd4\x1a\x104\xcc\
+1\xca\x89\xc8\xc1\xb4nu\xb9\xb6Zt\xbd\xd3\xbfu\
+\xe5\xee\xc3\xdc\xa1\xdc\x0a\x0c\xa7t\xb8\xfdl\xe6-1\
+\xb0]@<\xb0>\xb4\x0b\x9d\x87\xd5\xd6Z`0\x16\
+N\xeb\x03\xe7NQ\xd7aK/>\xeb\xce\xfc\xe8{\
+nj'\xf7\x0a\x17\x16Cp\xf2\xba\xe4,\x11l\x94\
+\x03R|qL2\x224m\xafJ\xd1\x02V\x94\xaf\
+\xba\xec\xb8\xde\xcay\xady\xae35\xefV_\xfa9\
+\x8b_\xb8\xeb\x8b\xa4\x9a\x0e\xb0\xb4\xebp\xe5\xa3V\xf7\
+h4\x1f;j{\xc3\xc1\x13\x5c0\xd2e\xf5\xe4\xcb\
+n\xf5\x1f\xcf\xbb\xee\xdc\x0e\x16\xd9K\x9e\x9bM+\x09\
+\xdez\xd9\x8a\x03\x12\xe3a\x8c\xf0\x9a\xfb\xeb\xea\xc2)\
+\x02\xa6\x0b\xc8d8#{\xe3\xdc?\x15WW\x9fy\
+\xd1\xad\xf3\xa4E\x94\x91z\x90t\xb3\xbe|5\xb5g\
+\x1fzp\x13\x1c\x0c\x9fd\xf1\x8bz\x8cr\x80\xe4\x0f\
+\xea\x10hH\xc5\xce\x1e\xa6\xefY\xb7~\xee57{\
+\xe88>\x897\xb1\x90(\xa2\xa1\xe8\xb0\xd3\xddw\xc4\
+u>\xf9U,\xf5\xa6j\xd3\xb2\x1b^p\xea\xdee\
+\xb7\xfa\xb7\x9f\xb1\x8as-n\x97\xd0J{O\x1c\xd0\
+C'\xf0\x8c\xde\x12\x8f5\xce\x16\x8b\xfa\x1b)\x89\xec\
+\xcb\xf4\x04[\x7f\x8fs\x80\x02\xa7\x22\xee\x8dh5\xeb\
+\xde\xa2\x01V\xfe\xf08\xa7\xdao\xb9\xee\xee\xdbA\x01\
+\xdd\xf4\xe0\xd5(T\xbb\xa9\x9b?\x04\xae\xc8\xc5N8\
+B\xc2\x89L\x8f\x0dn\x87\xea\x0b\xffr\xc5\x0c\xbf\x5c\
+UK\xc0\xc7\x97\x96\xa1\xf0i\xf5\xc7\x93J\xb8i7\
+\x886\xca\x01\xba\xab\xdd\xe0\xaf+\x9a\xc8\xb5\x08\xb9\xe0\
+t\xe5\x0c\xab\xeeew\xf1\xa9\xaf\xb8\x99\xfb\x1eq\x9d\
+]\x07\x83\xa1ANp\x82W2\xcaV\xcd\xa3\xa5\x9e\
+i\xb4q\xee\x95\xc0\xd6\xc3\x8d\xc4N>\xf4c\x9d\x08\
+\xce\xfc\xf6\x97\x8cf\x9bb,\xefk\x7f\xcc\xee\x91I\
+d[\x0ct\xb1\xfcw\x06?\x88\x22\xf2\x9e\xa6\xdc@\
+\x91\x92\xfc\x22\xc4?9\x22e\x14\xa5\x0e\x10d\xbb\xfa\
+e\x88\xab\xa2~\xd2d\xb1<p\x82\x88G.Q\xf7\
+\x93\xbd\xba>\x02P\x7f;$U\xa5\xa2\x95\x5c\x06\xc8\
+X\x9d\xb1\x16\xc2\xbcm\x90\x03M\xa8\xc0\xe0\x07M\x1d\
+F\x8a)~\x1d\x22\xa5\x8d-`\xf3V\x22\xa6\xef\x90\
+\x94\x95\xa6\x12\x86o\x5c\x84\x1f\x14\x86\xcfx\x88|\x8a\
+\xd9\x96;Q\xcf\xd8\xf0:\x0f\xd5\x90\xf1\xe24\xd2\x01\
+\x8c\x9d\xe29\xce3F\x17oe\xbd!\xfe\x99\x12\x9c\
+ \x06\x91\x89@\xde\xb1\x01\xa2\xed\xd4\xe6s\xa0\x0fS\
+'\xf4\xae\xb62!\xc8|=0Rlt\xbcj\x8a\
+\x00\xd9\x02\xe5\x1f\xc3@\xd4=\x8b\x97\x03\x8a\xc0\x1e^\
+\x83\xc4\x1e\xae\x05\xcc\xec\xb6\x85l\x10'\xc7\xf3\x0aa\
+\xc6\x9a{\x86\xe7\x02\xbd\xf9?\xe5\x95s\x80\xe6\x8dR\
+\xe3IC\xd4\xcf\xe4\xff\xbb\xc5\xee\x8d\x8b\xaa\xfaE0\
+a\xc8\xd7\xa3\x1cP2a\xf4\x17bO\x91\xae\xf2Z\
+v\x05\xbd\xce\xfd\xb2\x81\xfe\x9c\xbb\xeb\xdfsJQ\x06\
+\x0c\xa5\xbf\xf4\xcf9@p?U\x9d\xfb\x9a:\x14\xf5\
+}\xdeZ\xf7\xfa~i\xb7\xb0\xc7+\x9e\xda0\xa4\xb8\
+\xa5\xc8\x10\xd4O]\xfe\x1c\xc1\xbd\xde\xe1\x0a\x13\xf3?\
+\x0dG\xfe\x86\xc5\x8ek\xfdy\xa4\x89l\x09\x92\xe1\xf0\
+.\x81r[#Z]FI\xfdI\xcc\x13\xacx\xdf\
+\xa1\xd64n-~Q\xbdQ\x0e\xd0\xb8\xe6\x0b\x87\x80\
+\xfa\xd7\xa5+9\x0f\xb8\xfbq\x82\xd6\x07}\x96\xb53\
+g\x12'\xa4NS[%G\x1f\xf0r\x06z\xa2\xec\
+[SU[\xf84\xe7\x93\x9f\xa0\xec\x17\x03V\x104\
+L3\xce\x01\xc2\xb6h\x93P?\x05q\x1b\x8a\x9e\x00\
+\xc6\xc6o\x87#\x09\x0b\x9fjB\x1dX\xf0\xa3\xa1\xb1\
+6\x94\xf0J\x0dN\xdb\x838\xd1A)\xdc\xb7e\x90\
+\x1e\x1f\x10\x1f]\xe9*{\x14\x9c'\x12\xe3\xd5\x1f\xe9\
+\x00\xc66-bl\x8e \x8fNp\x0d\xf1\xf4\xc8\xff\
+\xf4\x80 ~\xeak\xff\xa7\x08\x83%\xffQB\xfdA\
+\x18\xdf\xbb-\x9e\x8c\xa3\xf5\xc4\x0fJ\xfe\x0e\x1d?\x93\
+X$\xe3\xc7\x163l,\x86\x1f\x14\x9e\xbck\xbb\x01\
+\xd7\x19\xf73\xa1\x1e\x02x\x0c\xd7\x1e\x06\xceQ\xd0\xcd\
+\xb2ah\xaeub\xda\xda=\xff\xe8(\x82\xaa\xec\xc7\
+c\x19\x9c\x18\xb2\xa8\xa0\xfa\xa1\xad_\x0c\xa4\xc7\x0a\x8f\
+N`\xa7\x80?G\xc4\xb5m\xc7\xb3K\x9c\xf3\x91\x0d\
+C\xf9\x12\xf9\xe7G\x87\xa1r\x82\x98*\xf5\xd2\xa2+\
+\x1e\xfeF\xa6I\xc1t\xecZ\xb7%_\x0e\xd0\xd1V\
+OZ\x14q\xd9\x94]\xf0R\xc4\xd8\x9e\xd4\x01\x91N\
+\x8e\x10mt\xc6\xa6\x9e\x8e\x84\xd7\xb8\x96\x0e\xd1h\xe9\
+\xb0e\xc3\xa3\x1eW\xea\x80H\x1f\xebk\xc5'\xf2\xdb\
+j\xfd^9~\xab\xfa\xdd\xc0\xbb\xe1\x81\xeb\xdd\x03\xff\
+\x05Zz9\xe5\x8f\xf3\x89\xe9\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00@!\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x14\xfbzTXtRaw prof\
+ile type exif\x00\x00x\
+\xda\xdd\x9aYv\xe58\x92D\xff\xb1\x8a^\x021\x03\
+\xcb!\x08\xe0\x9c\xdeA/\xbf\xaf9(\x85\x14\x19Q\
+Y\x99Y_\xa5\x17!>q\x00\x1c>\x98\x9b;\xe8\
+\xd6\xff\xfd\xefv\xff\xc3OI\xb1\xb8\x94k+\xbd\x94\
+\x8b\x9f\xd4S\x0f7_\xdau~\xba\xfd\xf6W\xb2\xdf\
+\xf6\x93\xdeK\xfc\xfd\xed\xbc\xfb\xbc\x108\x159\xc6\xf3\
+g\xbd\xdf\xfb?\xce\xfb\xcf\x01\xce\xe1\xe6[\xfe2\xd0\
+\xc7\xe4~|\xbf\xd0\xde\x0b\xa1\xfd4P8\x87(\x89\
+\xf4\xfdy\x07\xea\xef\xf5\x18\xce\x05\xff\x8a\xd8\xdf\x1b\xc6\
+\x87\xc4\xed\xc7\xff\xd4\xbeK\xa7\xbf\xdd\xb7\x13\x15-\xcd\
+\xccx1\x84\x15{\xec\xfcn\x9a$\xea\x7f\x8e7\xc7\
+\xc2o\x1f+\xf7\xf8\x18\xf9\x1e\xb8\x8f\xdf.\x96\xa3\xd4\
+\xbd^M\xfe\xa4\x8b\x9f\x95\xfd\xf9\xedge\x7f~\xfd\
+I\xd9!\xbc\xe7\xe3O:*\x9f\xc7o\xe7\xdd\xc7\x05\
+\x9f\x7fz ~\xce\x1f\xbe\xcel\xca?\x13\x7f;\xef\
+v\xf1\xf5\xfa\xfa\xf3E\xa9{\xcf\xb6m\xcd\xac\xe2N\
+\x05\x0d\x96wQ\x1fK\xb4o\xdc7XZ\x8a\xf6X\
+\xe1S\xf9\x9f\xf9^\xed\xd3\xf9\xb4\xeb\xbe\x1e,91\
+\xf3\xe0\xf3\xf8\xee\x83\x8f\xd7\xf6\xc9O\x7f\xfb\xed\x97\x1d\
+\x1f\xe7\x1fdLa\x05\xec\x10BxB\xf4\x0f\xe7\x1a\
+v\xe9\xe1\x89\xb2M\xd2\xc7\xefP\xb1\xcf\x8c\x0d;=\
+X3r6H\x16\x13\xc5;\x9b\xb7\xdb|\x8fo\xcc\
+<=\xb7\x06\xcf`\x9eG\xfe\xed\x8f\xfb+7\x7f\xfd\
+\xec-\x8f\xf5\xfe:\xca\xf7\xee\x188\xc8\xd9\x11C\x96\
+\xd3on\xc3\x22~\xbfJ\xcd\xa6\xe0\x8f\xcf\xcf?\xb2\
+kt\x980\x9b\x9a\x1b\x0b\xbc\xafq\x86\x18\xd9\xff\xf0\
+\xadh\x86\x8e\xdc\x979\x9e\x10\xf2u\x9e\x01\xe4\xc6L\
+\x9d\x1d\xc2\xf8\x88\x09\xae\xe2c\xf6\xc5_5\x84\xea=\
+\x8al\x18\xe8F\xf4\x10S\x18X\xc0\xe7\x1c&B\x86\
+\x14c\xc16-hj\x1e\xa9\x9e[\x9d\xbfC\x0e\xe7\
+<X\x84%2\xd1T\xb1\x0d\x11\x84\xb1R\xca\xf8O\
+M\x0d\x1f\xbas\xcc)\xe7\x5cr\xcd-\xf7|\x97X\
+R\xc9\xa5\x94Z\x9a\x03\xd4\xee\x1ak\xaa\xb9\x96Zk\
+\xab\xbd\xde-\xb6\xd4r+\xad\xb6\xd6z\xbb{ ~\
+S\xcf\xbd\xf4\xda[\xef\xfd\xbe\x99\xf3f\xe4\x9b\x87o\
+n\xb8o7\xc2\x88#\x8d<\xca\xa8\xa3\x8d>\xee\x07\
+\xf7y\xd2\x93\x9f\xf2\xd4\xa7=\xfd\xb9g\x98q\x02\x0b\
+\xb3\xcc:\xdb\xec\xf3^~\xe1J+\xad\xbc\xca\xaa\xab\
+\xad\xee\xd6\xbd\xf1\xb5\x1dw\xday\x97]w\xdb}\xdf\
+\x9fV\xf3o\xd8\xfe\xfc\xf9\x0bV\xf3\xaf\xd5\x82Y*\
+\xf2\xbf~Z\x8d\xb3\xb5~\x0c\xe1\x05'\xd9\xc9fX\
+,$\x8f\xc5\xabL\x80C\x07\xd9\xecj>\xa5 \xcb\
+\xc9fW\x0fDE\x0e\x08\x99e\x9b\xe9e1,\x98\
+\x96\x0fy{w\x8c\x87\xed~X\xeeo\xd9\xcd\x95\xf6\
+K\xbb\x85\xbfj9'\xd3\xfdM\xcb}\xb3\x9b[\x1d\
+\xbb\xfd\xc2j\xf3\xb6T\x13\xcdB\x8aB)\xf5\x8aD\
+\x1f\xf7\xdc\xa1\xf1\xef\xba\xbe\x1c\xdd\xcf'\xfe\xee\xf1\xbf\
+f\xa0\x95\xf7S\x08\x13\xd2\xe1\x13\xf6\xf0u3\x10\xca\
+]\xb5l\xa9\x11\xdb\x0e\xfcj\x8e\xf5\xd4Y\x06\xe1\xb8\
+\xe3\xdc\x0d\x8c\xdf\x8a\x14l0\xca\xd4\xf7\x11\xa0\x09\xb8\
+A\xdd\x0f \xa33n&.\xf3\xa5g\xb2\xca\x9a\xb8\
+\xd3{\xcd.hp]\xb8..\xe596\xa9b\xe4\
+\x1d##\xd6U\x9f\x12\x9f\xb6lh\x97g\x18\xb9\xae\
+\x106\x82\xec%\x98]\x8f]j\xbdn\x9dB>\x93\
+\xf7\x19e\x87Q\xca3Y\x02\x7f\xd48\xb8~\x9bh\
+}\xbb\xdf\xce\x9f~\x88\xfd\xb3\xd4y\xc5}\xb7rG\
+\x1co\xdb\x1d5\xbb\x11\x09\x94\xddF\xec\xcf\x8as\xcc\
+{\xccv?\xbaH\xbc\xec\x91\x97\x0d\xd1\xee\xbb\x962\
+\x1f\x06\x7f\xe2\xe6^%\xb4\x84\xcf\xae:\x9e4\xb6o\
+.\xb2\x1c\xd65\x94_RC\xcb{\xa5r\xe6\xafc\
+\xee1j\x89dn\x0fv\xe5Ug@\x8eU8E\
+\xd4>\x9a\xc8$.\xf7v\xcc\xf9\x8cta\xc23w\
+\xeaz\x1a3\x85\x87y\x9eR\xe7\x9e\xeb^\xa3mr\
+\xf0~\xf2\x18\x1b\xd8\xba6\xc1_\xd6V\x98\xa5-\x03\
+#\x11\xebn\x93\xc1\xaf\xb1H\x12\xdb#[\xdc\x0f:\
+f\xb09\xca\x8a\xbe\xef]\xd2\xbe\x15\xadE\xc9\x1a\xe5\
+\xf1\x17\xc45\x03\x15\xbd1S\x89\xce\x8c\x84\xb6\x9e-\
+)\xa7 2\x87a\x0a\xcf)\x9a\xcf\xe4i~t.\
+^\x97]>\x17\xb9T\xa5\xfa\xb6\xd1\x91]\xbczA\
+\x11\xe8+\xd4\xb1K\xde#\xca\xa4;\xac>v-\xcb\
+\xbc\x80u\xc6\xb2\x17\xba\xc0\x9fc\xdfWD\xf5\xc1\x83\
+\x19Z\x93\x93d#b\xd3\x85\xf1\x9eqaN\xb9\x8a\
+\x9e\xf4\xcf\x02\xe8VO\x97\x9f\xfb\xf7\xcep\xfc\xc4\xfd\
+\xda\x87\xbb_W&6\xb2\x0c\xb6\x8f\x15[GL\xa2\
+\x09\x04\x95\xf7d\xec\xb9\xa2\x5c\xe4R8\x01l\x8f\xbe\
+\xee\x19\x13\x0e@\xca\xbc\xe2\xaa600k\xc6\xbd{\
+\xb6\x81\x82B\x0e`\x1cX\xb01\x80\x8f\x8a\x04x\xc9\
+\x9aH\xe3l&Q<\xbc`e\xad\xee\xd9\xbd\xcb}\
+LJx\x5c\xf4\xa3\xeeL\xf8\xde\xbb\xad!\xc1M\xcc\
+H\x8c\xec\xf2FZ~\xdc}\xa7MJ\xc3\xe4Qr\
+1\x023dy\x0a\xa0.\xd0\xb8E@\xff\xfc\xe8~\
+y\x01\xa9\x88c\x81\xc4\x13,l\x19\xfd\xc1\xb3[\xc6\
+\xbb\x09\x08L\xbf\x8a\xb7\x85\x17\xf9[I7K\xdb\xac\
+\xf5\x9a\xb5m\x0b~\xb9=\x03$Y\x12OP\xa8K\
+?\x935\xcf>pFF|\xad\x99WF\xf4\xd5\xcc\
+\xdb\xe0\x90\xa9N\xe2x\x86*\xf8 $\x00\x1do\xde\
+\x83\x15\x88\xa7I\x8c\x94\xbb\x93\xa9\xeeU\x19yw|\
+\x18\x95&\x94E\xbc4\xee$\x9bn\x07`\xa2\xbd\xc4\
+\x8c,\xa2U\x1b\xfd\xd2$<\x89`\xf8\x97\x09\x06\xa7\
+\xc5\x9b?\xe4\xaa\xe6\xf1\x09\x9a\xcb4\x86H\xc9\xd5\xe5\
+\xdb&\xd2\xe5\x9f`\x08nP\x0dD\xe20\x07%\xda\
+\xf0\xe8\xb5k\xc4\xa5\xaf\x0a\xd8=5\x9f\xc9\xcc9y\
+p\x05&(\xae\x11\xa1L\xf0\x8c\xcaTr\xb1=\xbb\
+\x1ez\x1e\xe4\xc1'\x9b\x8c\xdd9i\xa1\xe4\x11;\x8e\
+g\xed(\x01WTH\x0f{\xc4-A\xf0P\xd8\xde\
+a\xdd}\xfb\x0c\x1e\xa7\xf1\xe0\x93\xe6\xca\x95\xfb\xed\xa1\
+\x03}\xf2\xb8\xa2\x94\xd0C\xc2c<\xf1\xe7\xd3sC\
+\xb46\xf1qa\xe8\xd27\x93\xae>\xc94\x1d\x13\x92\
+Q\xf4$J#d\x86\xd4\x10}\x9e\xd8\xa8\xe3\x17\x98\
+\xae\xb0\x92=\xafm\xd2\x15\xf3\xec\x070\x18\x06a\x0d\
+\x94)3\xc3\x1b\x90<\xc4\x03\xf9i\x0e\xb3\xa0\xc1\xff\
+X2C\x81@\xf0\x0f\xd5+a\xb0\xbe9\xa1~S\
+.\xb8k\xda\x17\x03de\xae*\xa5\xaf\x902x\xae\
+\x11\xc0\x5c\x89\x86\xad\xcf\xbar\xbf\xb0\xe5\x94X(\x12\
+\xd3\x99\x1f\xed\x9cy\xbeg\xf4\x8f\xd1\x8fI\x1a\x9a\x1f\
+f\x8e\xa1\x07G\xb2\xe1\xca\x1e6\xf94\x9f\x04\x16\xf1\
+\xbd&\x84\x81\xe3-\xef\x18\x8e\x8a(\x1e\xb3P\xab\xf2\
+\x18n\x10\x95\xdaz-\xc7\x92\x0cS\x90\x09'\xc0\xe7\
+\x98\x0d%\xb5V\x8f\x13(@D<\x1d\xba^Sa\
+|\x5c\x0e\x8b\x96I\xe8n\x99\xb4\xef!\x7f#w\x0c\
+O\xcea\xfc\xbe\xe23\x00\xa3yR\x92@\xe6\x1e\x0b\
+\xc0\xf3n\xd5v\xe0La\xb6\x9e\x17\xc2\xba\xd6\xb6f\
+\xff\xd7\xb0\xd9Q\x05Sv!\x9d\x13\x22.\x13\xb3\xf4\
+\x1c\xeas%\x83\xd1.\x00\x9f\x16\xd9d\x0f\x84\xf5\x9e\
+L?\x0f\xbe7YNypH]\xc2\xf8X\x1d\xcb\
+\x19\xf5 \xd9\xc9\xaf\xe9\x03\xc9p\xc1\x05\x9f\x06J\x1e\
+\xcb\x22E\x186\xb2a\xa8\xa8\xe8w\xa6\xe3\xfe25\
+\xc2\xc1\xc8\x83\xfb$\x80r\xa60~D\x18\xb06\x83\
+\x92\x05\xd5\x9d\xa2*X]\xf1\xb6\x06\x98s)d\xb0\
+\xb7rO8\xf0\xbb\xdf\xe8\x97p\xe0t\x8b\xfe\xbe\x5c\
+U\xda\xddg\xf5\xa0.\x01\x9b\x848\x02\xb3\xc7\xa0\x06\
+}\x83\xf6\x18\xf7FK\xf9\x80R \xc2\xf1\x18o\x01\
+2lX\xe7\xd7\xb4\xc4G\xba\x17\xc0\xaf\xdd<\xc8\x22\
+\x06$m\xc3\x07\xd0\xa828\xde(\x8c\x88\x8a&t\
+\xba\x96r\x10\xda\x8aU\xdcbD\xa7\x9c\xbfk\xc5i\
+\xe5'c\xc9\xe3\xc5L\xd0G|\x84[\x95\x8c\xfc\x94\
+0\xa8&:0\x8a\xba#\xc3\xce\x93\x22q<\x1c\xfd\
+R\xac\xe1\x16\xd0\x9e\x9bz\x02\x8epr\xfc\x88B\xcb\
+\xd9\xe4\x82\xdc\xd6\x87\x92\xe2\x5c\xca{/\xd0m\x03:\
+\x5c\xe9\x9e\xcb\x17\xe9M~d\xd0H\xf2\x0db\x85\xbb\
+#&Zo\xa6u\xe5\xd1\xa45\x8c\x00\x89\x89R\xf9\
+3\x94Q'%\x17\xbce\xacp\x08\x80\xdfN`\xc9\
+)B\xb3\x88\x04\x9c\x18k\xaf+\xf7\xaf9cG_\
+\x86\xbf\xcd|\xc9#\xe0\xa2\x161^\xb6 \x15\xee%\
+e0\x9fh(>\xef\x9b\xa1\xa5`J\x1b\x915K\
+\xdf\xf8B\xa2\x04*P\x94y{\xb0\x0f\xe5+\x0f0\
+\x93bFY\xa4\x0a(\x9a\x01\xf4\x22\xe5\xad\xe7\x12\xa7\
+!\xcd\x1e\xfa\xbdL\xa9\xe50\x06\x7fl5\xf3X\xa6\
+\xcd\x87:p\xf7\x93\x06\xdc\x93\x84\xb0b\x18\xccP\x15\
+\xee\xebA2\x18jCr/:\x13 \xed\xc6\x81L\
+\x9e\xf8(\xbd[n:@Q\x0d\x16\x04\xfe\xabf\xd8\
+\xd2\x9d\x09o\x05}\xd9\xcf6\xae+*m\xe8g\xe0\
+\xd7:\x80\x03y\x98\x02x\xf4\x9a\xba\xe5\x939\x8f\xf3\
+\xba-\x91\xdb\x879\x17N\x8d\xa8\x0f\xe4\x89\xf8^\xea\
+C\xa5\xa4i\x09r\x15\x18J\x0aTx\xd4\x7f\x0d7\
+G'\xe6\xd5\xe4\xc5!\x1d\xc5\x03\xf2\x8f\x16%\xd6)\
+\xde\xa3\xa4\x8a\x05\x87&\xc7\x17U\x9f\x88\x8d\xa2Xp\
+\x86\xbaqa[\xc4\x85I\x8d\x10 \xa3\xd0\xe3b'\
+1\xf6S\xab\xa5\x9f\xbdn\xe3\xbf\x09\xeeNZ\xfb\x81\
+$\xe5p!\x90d<\xd5OV\xaf\x84\x85\xf2IO\
+\x97\xfb\xc5m\xbf\x06\x9c?9\xba_\x00\xceQp\xe9\
+\xf7\xc1\xca<N\xf4\xea\x1c\x84|R\xf8+9\x82\xf4\
+d\x9c\x18d5l\xed\x04\xc3Z\x09xI\xda$\x0a\
+1f\x957\x17pGZ\xd9^\x8e\x7fJ+J(\
+\xc1\xd5\x19v-\xa5\x05\xdcX\x9e\x93\xdda\xf1\xf5!\
+\x93\x90\x9fD\xc4\x84\xd3\xf3\xa0\xb8\x95-~\xa9$\x98\
+\x91\x12\x11*7\xc9\xec\xa8\xa6\x9eY\xf2\xc4<8<\
+0\xa2\xb8\xc6s\x14\xd3\xaa\xbfLAT5\xb0\x90\x15\
+\xe5\x84\x09\xd1\x87\xaep^@_\x0e\x11\xf9\x03\xce\xbb\
+\x97\xb2\xde\xa0\x0cntYjj\x09\xb1\x86\x88\x22\x88\
+ \xf4\xc45{=\x8e\x17_\xaae\xb8\xf0\x12-\xd5\
+\x1fN<\xe6\x89r\xa5&\x10\xb5d$\x9e~BA\
+\x1e\xd5\xa1\x84\x9a\xbc\x0a@4'\xb2y\x96\x95\xf2\x99\
+\xd4\xcc0\x9crS\xc8VPP,w\xbbH\xe2\x5c\
+E(8\x0e+\xcb\x02cR\xa1X\xf3\xc2ql\xed\
+p\xa9K\xcc\xc9\xab\xf3\xfc\xc0\x8f,\xb3\xde\x1f\xd5k\
+\x95\x09\x86x&\xfe\xa6\x9c/\xd5N\xe5JPlp\
+_\xe7\xb1\xa0 2'iY\x8cN\xd3;\xd1\xb9n\
+\xf5\x04\xd1s@\x83\x8a\x03\x1d \x91p\xed6r\x87\
+&D\xeaf\x04Zo&\x82BO%\xfd\xb3fE\
+\x84\x8b\xcc\x02\xec\xb6IEc\xb5D\xb5\xe2@\xfa\xda\
+\x9b\xdc\x93\xc5\x00\xf0\x00y\x11\x0f\xd7]\xad\xf2\x9a\xa7\
+\xec\x8a\x19\xb0\xdd\xfe\x0e\xa4l\x14: 8\xd2\x03a\
+\xbbOe\xb1\x94Cn\xb4AJ\xa3(\x14\x99\x00`\
+\xacbc\xf1\xc4*\xd2\x10\xb0\xa4\xf5'd+O\x9c\
+\x18\xb8\xd4\x00\xe8\xabxU\xb5\x85\x03F\xb0\xd7\xf2\x08\
+s\x1c\x19N\xe0<\xb1\x9dL,\x86\xcbjO\x19\x03\
+\x99\x8e\xeek%\x03%&\xfb\xdd\x06\x9dE\xf8E\x09\
+\xb5\x0c\x9b\x0f_\xf1\xe5d=\xab\xeaA\x93\xaf\x14\xc3\
+\xfdk\x8e\xf1\xef\x1f\xdd\x97\x907\x8et\x8b8}\x04\
+\xbcI\xf6#\xe0\xc5\xa5\xa2y\xdag\xd0\xdb9E\xbd\
+\xa0v\x86\x13=\xfba\x9d\x16\xc0\xf9\x97\x01\xbc!\x19\
+`0\x90{\x08\x97\xdf\xc6\xf6\x0bN\x9e\x80\x91\xde\x8c\
+OO5\x15\xe0\xf3,\xb1\xc9\x1e^e\xe6n\xf2\x99\
+\xf2\xd9q\x90\x01\x05\x01\xfd$\xa91\xcc[%\xd5\xe3\
+\x8c\xb1t\x11\xf0\xd5\xf7\xdd\xf0\xcb\x88\xce\xe7$\xefR\
+B\xad\xa0\x1a\xa1\x8b\x12YQ\xd9\x87\xfaO\xde\x9f(\
+\x83\x03\x81\xf2T\x0b ;l$\xae\xb7\x09\x95\x7f\xd4\
+\xf8\x97\xea4&\x10\x07\x9f\x9f\x0f&5\xa8\xce\x83r\
+\xee\x8f\xe6\x95q\x12\xf7\x99\xe1\x9e%\x06>V;\x84\
+\x93\x85#\xd0|leO\xbaIl\x10h#\xb9\x94\
+]\xc6\x07\xf0\xf5\xc8\x13\xf3\xe2\xce\xe8\xc6\x84C\xabO\
+\x0c\xbb!\x07\x11v\xf5\x84\x10\xf1\x85\x85\x92\xdfr\x0c\
+\x9f-\xd1\x99\x15O\xf2\xc2\xbf\x1e\xe0W\xbe\xd9+a\
+\xe1\x08I5\xa6\x94\xa1\x8a\xba\xa3sP&A\xc7I\
+\xbd\xa8*\xc7<\xad\xc3%\xc2\xe4\xcf\xb3*4\xe4\xdf\
+^\x1e\x82\x0cp\x07\xb2\x9b[\x8f\x91\x8be\xf9\xb0\xbf\
+\xdam'\x04 \x931\x8fi\x92\x0c\xb5\xd3\xb6\xcc\x0f\
+\x19\xbf\x01F\xb8\xba\x817t>\xdd\xab\x01\xfe\xe4\x0f\
+\x7fY?\xaa[#\xd0*l\x11\xdbr\xc8\xc2@w\
+\xac\xf5\x0c\xa7&R5\x16\xee\xefv\x05\x18Yn\x8a\
+\xe7\xc7\xa9\xcc\x11\xa5j/\xd3\x91\x8b \xa9\x0fQ\xed\
+\xad\xaar\x10h\xa2\xa8A\xd0\xc3\x94\x80\x1d(k\x02\
+\x5c\xe0\xb6h\x05\x8f\xeb\x1d\x0e)\x142X\x1fb\x98\
+\xd0\xdfV\xa9\xe90\x9a\xe5\x90 \x00\xb0\x01B\xee\xaa\
+\xb6qM\xf9\xa0\xd08\xa3\xbc~*\xda\xfe\xb8u\xca\
+.\x00\xe9\x12\xd9\xab\xe3w\xf5\x08\xd0\xc7\xc5m\x17\xbf\
+\x5c\xc2\x8e\x06\x9en\xaag\xeeS\xd66\xe6\xdf<Z\
+@\xbb\xdfG4y\x07\xff\xacj\xf5\xe0\xc8\xab\x1cO\
+\x1e*\xacp`\x91\xa9IeN\x8azK\xd1\xcf \
+\xc6\x5c\xa6-\x8b\xe2\xf9\x86ig\xacN\xb4\xaa\xabf\
+\x0b\xf9D\x08JP\x9d\xfd@\x08\xf7#\xc7\x87t=\
+\x93@Lj\xc0\x9f\x14/Bh\xc5\xad\x1a\x1e\xd0&\
+\xb5\x04[0W\xb9\xacui\x04\xad\x8a$\xbb\xf4\x11\
+z\xf14V\x0eA;\xfaW\xcbP-\xbfl|[\
+iBu\xcc<\x85\xfe)b\xe2\xe93\x8f\xe2f\xa2\
+\x86\x09\xa7\xa5\xaal`\x1d\xaf\x18\xab\xb5\x1ffTO\
+3\x9e\x10Z\x90\xb00U>\x13$\xb7\xaalx\x84\
+\x0a\x1eK\x08TG\xdb\x22f\xa8\xf0\x82n[\xcam\
+P\x0bo\xf4S\xed\xa3\x09\x84\xf5|'\x9c\xa3d(\
+C\xf3*\xe1\xf6I\xa7\xaa\x7fU\xdc\xb8C\xf8::\
+\x1bV8\xab\xa0\x8b\xb6\xb2\xb6n(\xed\xbe\x12\xe53\
+O*\xd1\xd8\xbd\x9e\xc0\x09\x0a\xbcp\xda\x9eM\xcd\x80\
+\xe1\x86\x11\x94\x83+TE]\xecX@\xb3\x04\xd5\x9e\
+\x9c\x19e\xa1\xb7\xb9\xa9\xee\xbb\x88@\x17+\xc9\x0dJ\
+\xaf\x9d\x10E\xd6BG\x97\x97_\x11\xe9\x16W\xea\xe4\
+R(\x8aI\xf8N\xe2G\xc8\xf5$\xf1\xdee\x99X\
+\x0b&\x91\xc3\xe13\x81\x09\x812NR\x96\xab*\x8f\
+&\xf6\x15\x00\xd6\xd3J\x89\x88\xa0\xee\xb6\xea8\xb5q\
+s\xaf\x95\xd2\x97\xc5[f\x87IPm\xc4\xef\xc4\xd9\
+}2gH\x14X]\x8d\x08\x98\xae\x16\xd8\xae\x8ao\
+\x1c\xb65\x0d\xcbNU\x13\xffX\xc8\xbb\xffD\x96\xd5\
+\xd1\xfd'\xb2\xac\xf8\xb7\xbb\x86\xb5V\xb6\xea{\xa4\xd6\
+\x86\xc3\xdb\x89\x89\x97XA\x19\xef>\x08\x15\xef\xbc/\
+\xcb\x22?r2\x0fz\x8dP<\x15\xe4wV\x1d\xa9\
+\x87I\xb0\x06\x93)@\xca\xb5\x85a\x95\xec\xaaC\xcc\
+Z\x04\x8c\xdf\x8d\x91\xfb\xac\xe3\xed\x10\x18\xf5\xdb\xd6{\
+a\x9e\x06>\x9fn\x03Uk\xb5\xbeP\xebz@=\
+\xb0\xfe\xd2\xd4\x93E\x95[\xac\xdb\x09\xd7\x22;\x8c\xea\
+\x88\xb0Z\xcf\x86\x02\x933w$\xc0\x8b\x941D\xb6\
+\xb3\x91m\x85\xc9\x16\xf1\x0dV\x81\x0d\x81\xc8x\x1b\x1b\
+E\x5c\xff\xa1\xa6U\xdd\x1b\xc9\x7f\xda\x09/\xb9\x1e\x04\
+W\x9b\x1a\x97~>\xea\xc3x\xca\xc3\x93 \x0f/m\
+jl\x0cB\xd6\xca\xf7\xec\x88\xc7Y\xe49\x98\xa2z\
+#\xa9\x90\x07o\xd9;\x8c\x06:\xa9\xe3\x89j\x93u\
+\x02vS\x1b\x0d\x98.\xb7\xd2\xc8g\xf2\x8c.\xbe\xd9\
+s\x93F\x0c3\xb4\x0f\x22\xc7\x82A\xaa\xbb\xa2Q\x9e\
+aE6&\xbdI\xabx\xb8hE\x93\x9a\xaa\xa5#\
+\xf0n\xa9\xee\xdf\x1f|\xc7\x18\xef#\x9a^\x89\x02\xe8\
+D\xa6\x8c\xee,*aN\xf9]I=P\x95\x10\xac\
+\xb0j5\xb0\x1b\xd60\xd2\xf1\xb8\xd3_\x8b\xb7\xb8\xf9\
+\xc1\x17\xb5E@\xcf\xfaV\x01\x8a\xb1]\xad\xf37\xeb\
+Gm\xab\xea\xfe{\xd2ro\xd6\x82\xa3\xaa\xe5\x83\x9c\
+x\x87\xd9\xc8Z\xbc\xaa\xf7l\xed\xd6\xad\xd5\xd2\xe5w\
+\x8aZR\xf3'5\x163v\x7f\xbb\xc9\xff\xd3\xd1\xbd\
+M\xfe\xdf\xe6/(\xd2%t\xd5\xa6\xc5|7\xaaZ\
+R}]\x0e\xf8\x9d\x0e\xd9\x14\x87\xf4x\xc8H\x1f\x01\
+\x94\xb3\xca\x06\xeaZ9\x04X_D\xdb\xd49\xe27\
+\xb8xE2^[j\x1a\x9a\x8fm\x9f\x96<\xdd\xa9\
+\xb7P\x8d\x1aR\xb5\xaaM\x02\xc78\x1b;'Ev\
+\xfcA\xdb*\x9aU\x9bO^\xa1Lmc\x81\xa4\x96\
+>EVM\xbe:\x1cl\xa8\xbe\xd9]M5\x1b\xe5\
+\x8ca#0\xe0\xbd\xba\xa78\x99\xb0\x0d@F\xf1\x17\
+N\xa8\xc2\xee\xb4\x9b\x81\x14\xe2\x7fNZOJ\xd1\xb7\
+\x84*o\xc6O\x0a8\x1cw\x17)\x87\xdaN\xbdb\
+\xed<XE\xa2\x0e\x87\xb9\x0dUV\x8b\x07\x9b\xf4\x92\
+\x8e2\x92\xc5\x91\x95X\xb7\x16\xb1\xb1\xc1\xbe\xde\xbe\xdf\
+}\xb6\x7f\x9e\xd3P\xb9\xa7\x80aK\x7f2x\xdcg\
+\xf3\xd0\x09\x83\xde\xeaR-\xf5\x96\x04\xdb\x0a\xf2\x80\xcb\
+\x90R\xa0|F\xac\x182\x97\x97X\xddjJs[\
+\x85\xeb\x03\x0f@\xd3\xf6\x0e1\xd4\x91\x1c\xd9\x8ad\xa8\
+q\xed\xfe,\xc1\x08\xf5\xe94\x1d\xf6H\x1c\x07eJ\
+\xdb\x1aP\xf7\xdb$\x04=*9R/\x0e\x1c\x0eM\
+\xde\x87v\xca\x91-\x87\x5c\xc2\x0du\x99m\x87b\x92\
+\xae#\xd9\xcc6r\x825\xf9\x89\x03,T\x94\xac\xb6\
+o\xc3\x89\xa2\xb4\x97'\x9e\xfdU\xdb\xf79;j\xbb\
+~V\x15\xcf\xf5\xee\xfe\xa8\xfa\x87\x1ah\xff\xd3v\xd7\
+\xa0\xc7\x22\xc2\xce\xb0\xa0\xe4\x97\x09\xbf\x8d\x8a\xf9\xbd!\
+\xdd*V\xbc\xd4I\xb5\x8d\xd3\xd5\xd5H\xd5M\x08d\
+[\x1e\x10\x11K\xd9\x0fJ\xb9\xc0F\x88\xb0\xd4h\xbb\
+\xc7\xbf\xeee\x8f\xa8\x8d\xe2;X/2K\x80M!\
+\x82\x01\xba\xf3\xe6\x5c\x0dB\xc4\xc2\x1b \xa9-\xe2\x09\
+\x98\x85p\xb2z\xb0-,kt\x9c\x86\xf5go\xd9\
+\x1a\x8a\xeat\xa8E\x81\xd5\x90\xe0o\xe4\xd6\xb7]E\
+\x01\xa0H\xbf\xb3\xd3\xcbO\xea\x85\x82J\x06%\xd7/\
+n\xfazO\xfcv\x1a\x03\xdd\xa7\x8f\xe3\xbe>\x7fJ\
+\xc0\x96\x0f\xac\xe5K\xbb\x5c\xbd\x9fR3\xb4\x7fu\xed\
+\x8an\x92`\xfe\xd9\x10g\x04\xf7\xcf\x878#\xb8\x7f\
+>\xc4\xb9\xcb\xfd\xbd!\xcev\xbemY\xb5T\x81\xa4\
+a\xe9\x08\xb4\xac\xd6\x0b;\xe0\xa9\xe6\x87\xf6\xad\x94\xfe\
+\xc8\x9d]\x1b\x89\x07\x11c\x220f\xbaO\xa9\xa1&\
+4`\xa5\x8a8].\x1f\x1e\xf5\xdb\xdb\x80A\x82\x1b\
+\x88\xbc_\x96\xa2F3r\xdc\xf5m\xaf?\xa7y%\
+\x9e}\x12>e \xd1\x9e\x8c\x80\xe1r\xe3\xb1\x0d`\
+5\x9cg:\x80\xa1\x16\xa0\x00\xe52g\xfa\xe9\x8a{\
+/\xf1W\xf2\x7f\xfd\xf1\x1fO\xbb\xf3\xb8\x95\xc4\xdb\x1b\
+4\xf8y\xde\xd9\xc8\xaa\x8e\xde\xddW\xc1\x9c\xf6\xa3\x11\
+\xde\x06I\x0f\xc1M\x82>J\xb9`\x97\xee\xbc\xe5\xd0\
+\xec-\x87\xa1\x08\xb7\x1d\x04\x95\x87Um\x85\xe745\
+\x9f\xa0&\xc8L\x87\x1d$\xeb\xb1\xab\x8b\x22\xfazz\
+{\xce6]\x96\xde\x94|\x9b{\x801\xe4#[\xa1\
+\xf9\x8b#\x15/\xe6a\x18}\xf9r\xc1\xfd\xf6\x89\xbf\
+xtY\xb5cS\x91\xfe\x04%\xc8\xb7\xa1S\x95\xd7\
+1\xa4\xd0|\xc4\xb3+\xfavsH\x95\xea\x22\x1c\x9a\
+\xbf\x8cp^\x8fa\xb6\xdc\xad\xdc\xb6\x97\xfe\x96Y\xda\
+Y\xca/;\xb2\x1e\xe9i\x8b\xcf\x1f]\xd2y\xfd\xe9\
+\x8e\x1f\xb4\x87TKZ\xd4\x97\x7f\xd4\xaa\xff\xed\x9ea\
+R.D\xe8x^b\x18\xda\xbe\xc0@\xb5#\xfd\x0d\
+Bb14\xd0\xee\xd3i\xd3+\x1d\xdd\xd8\xe8x\xfe\
+|\xec\x13\xda\xcb\xf7\xeeP\xe9}v\x88\x9e\xfb\xbch\
+R\xe6}\x10\xf3\xbc.aXpj\xfe\xac:\xf79\
+\xad\xea\xf5\xac\xf6\xf5\x9a\xfb\xe9\xe2\x98\xfe\xdf\x18b\x9c\
+\x17*Z)\xef+*\xe3\xc0H\xd0>\xf6\xa4\x18`\
+I\xb7U\xfc\x87H}\xbd\xf1\xeb}\x88r.\x9d\x0b\
+v\xdaI/?F\xd0nM\xa2@V\x8b\xd3\x07o\
+;dO\xe6L\xd1\x0b\x00\xf6\xcaC;})t\x99\
+\x00\xb9H2Y\xe4\xc6\xe6\xfc\xfb^\xc6\xb6f\xf5\x0a\
+w\x12\x9f\xec\xdb6\x10\x9fj;_,\xeb.\xadF\
+U\xa1\xed\xfe\x5c\xf9Y\xb7\xadZ\xfbkZ\xf8\xc7\xb2\
+\xff \xf0wyO\x0f\xf9\xd7w9\xbd\x02\xa97\x17\
+\xcej\xe0\xbfC\xbb\x9f\xb6\x1aA\x885\x1e\xdb\xd9\x87\
+0\xd9Y\x8f\x01\xc8\xf0\x0a1\xaf\x0a%\xa4\xdd\xbc\xd3\
+\xd5~\xd9{\x03g]\x10\x02\xff\xbeZ\x85\xc6\x0e#\
+\x90\xc2KS\xef\x85\xec\x0f^5_\xcf\x8bI]\xa0\
+\x0b\xd9;d\xd4\x8aK\xa6\x9d\xef\xb4L*8\x19\xd7\
+\x99\xf3t\x03\xae[\x8c\xf1V\x1d\xd5\xc3\xbb\xcd1\xeb\
+u\xae=o\x16\xc9\xdaxYYV\x19e\x1eX\xd3\
+\x8bw\xc0>\xe5\x8d\xda8\x90\xcfWf\xeb\x8b\xf4\xb7\
+ \x84QY/R\xf5Z\xd2\xbb5\x8f\xbd\x82e/\
+\x80'\xdd\xd3\xd3[\x8c\x0f\xab \xac\x07k\x1a\xfa\xdd\
+]c:s\x02\xf3\x81?\xf3\x00\xd3\xd37\x1f\xf8\x11\
+iu\xbb_EZR\xb9\xa5\xd7\xb0J0J\x18\x8a\
+\xf6!\xd6\xd9S\xb5\xd7\xed\xb4\x0f\x5c\xef\xb5~\xd4H\
+\xee\xef\x15U\x7f<\xfew\x0c\xb4\x85}\xee\xff\x01'\
+\x05J]8l\x9c\xb4\x00\x00\x0a:iCCPP\
+hotoshop ICC pro\
+file\x00\x00x\x9c\x9d\x96wTT\xd7\x16\x87\
+\xcf\xbdwz\xa1\xcd0\x14)C\xef\xbd\x0d \xbd7\
+\xa9\xd2Da\x98\x19`(\x03\x0e34\xb1!\xa2\x02\
+\x11ED\x04\x15A\x82\x22\x06\x8c\x86\x22\xb1\x22\x8a\x85\
+\x80`\xc1\x1e\x90 \xa0\xc4`\x14QQy3\xb2V\
+t\xe5\xe5\xbd\x97\x97\xdf\x1fg}k\x9f\xbd\xf7=g\
+\xef}\xd6\xba\x00\x90\xbc\xfd\xb9\xbctX\x0a\x804\x9e\
+\x80\x1f\xe2\xe5J\x8f\x8c\x8a\xa6c\xfb\x01\x0c\xf0\x00\x03\
+\xcc\x00`\xb223\x02B=\xc3\x80H>\x1en\xf4\
+L\x91\x13\xf8\x22\x08\x807w\xc4+\x007\x8d\xbc\x83\
+\xe8t\xf0\xffI\x9a\x95\xc1\x17\x88\xd2\x04\x89\xd8\x82\xcd\
+\xc9d\x89\xb8P\xc4\xa9\xd9\x82\x0c\xb1}F\xc4\xd4\xf8\
+\x141\xc3(1\xf3E\x07\x14\xb1\xbc\x98\x13\x17\xd9\xf0\
+\xb3\xcf\x22;\x8b\x99\x9d\xc6c\x8bX|\xe6\x0cv\x1a\
+[\xcc=\x22\xde\x9a%\xe4\x88\x18\xf1\x17qQ\x16\x97\
+\x93-\xe2[\x22\xd6L\x15\xa6qE\xfcV\x1c\x9b\xc6\
+af\x02\x80\x22\x89\xed\x02\x0e+I\xc4\xa6\x22&\xf1\
+\xc3B\xdcD\xbc\x14\x00\x1c)\xf1+\x8e\xff\x8a\x05\x9c\
+\x1c\x81\xf8Rn\xe9\x19\xb9|nb\x92\x80\xae\xcb\xd2\
+\xa3\x9b\xd9\xda2\xe8\xde\x9c\xecT\x8e@`\x14\xc4d\
+\xa50\xf9l\xba[zZ\x06\x93\x97\x0b\xc0\xe2\x9d?\
+KF\x5c[\xba\xa8\xc8\xd6f\xb6\xd6\xd6F\xe6\xc6f\
+_\x15\xea\xbfn\xfeM\x89{\xbbH\xaf\x82?\xf7\x0c\
+\xa2\xf5}\xb1\xfd\x95_z=\x00\x8cYQmv|\
+\xb1\xc5\xef\x05\xa0c3\x00\xf2\xf7\xbf\xd84\x0f\x02 \
+)\xea[\xfb\xc0W\xf7\xa1\x89\xe7%I \xc8\xb03\
+1\xc9\xce\xce6\xe6rX\xc6\xe2\x82\xfe\xa1\xff\xe9\xf0\
+7\xf4\xd5\xf7\x8c\xc5\xe9\xfe(\x0f\xdd\x9d\x93\xc0\x14\xa6\
+\x0a\xe8\xe2\xba\xb1\xd2S\xd3\x85|zf\x06\x93\xc5\xa1\
+\x1b\xfdy\x88\xffq\xe0_\x9f\xc30\x84\x93\xc0\xe1s\
+x\xa2\x88p\xd1\x94qy\x89\xa2v\xf3\xd8\x5c\x017\
+\x9dG\xe7\xf2\xfeS\x13\xffa\xd8\x9f\xb48\xd7\x22Q\
+\x1a>\x01j\xac1\x90\x1a\xa0\x02\xe4\xd7>\x80\xa2\x10\
+\x01\x12s@\xb4\x03\xfd\xd17\x7f|8\x10\xbf\xbc\x08\
+\xd5\x89\xc5\xb9\xff,\xe8\xdf\xb3\xc2e\xe2%\x93\x9b\xf8\
+9\xce-$\x8c\xce\x12\xf2\xb3\x16\xf7\xc4\xcf\x12\xa0\x01\
+\x01H\x02*P\x00*@\x03\xe8\x02#`\x0el\x80\
+=p\x06\x1e\xc0\x17\x04\x820\x10\x05V\x01\x16H\x02\
+i\x80\x0f\xb2A>\xd8\x08\x8a@\x09\xd8\x01v\x83j\
+P\x0b\x1a@\x13h\x01'@\x078\x0d.\x80\xcb\xe0\
+:\xb8\x01n\x83\x07`\x04\x8c\x83\xe7`\x06\xbc\x01\xf3\
+\x10\x04a!2D\x81\x14 UH\x0b2\x80\xcc!\
+\x06\xe4\x08y@\xfeP\x08\x14\x05\xc5A\x89\x10\x0f\x12\
+B\xf9\xd0&\xa8\x04*\x87\xaa\xa1:\xa8\x09\xfa\x1e:\
+\x05]\x80\xaeB\x83\xd0=h\x14\x9a\x82~\x87\xde\xc3\
+\x08L\x82\xa9\xb02\xac\x0d\x9b\xc0\x0c\xd8\x05\xf6\x83\xc3\
+\xe0\x95p\x22\xbc\x1a\xce\x83\x0b\xe1\xedp\x15\x5c\x0f\x1f\
+\x83\xdb\xe1\x0b\xf0u\xf86<\x02?\x87g\x11\x80\x10\
+\x11\x1a\xa2\x86\x18!\x0c\xc4\x0d\x09D\xa2\x91\x04\x84\x8f\
+\xacC\x8a\x91J\xa4\x1eiA\xba\x90^\xe4&2\x82\
+L#\xefP\x18\x14\x05EG\x19\xa1\xecQ\xde\xa8\xe5\
+(\x16j5j\x1d\xaa\x14U\x8d:\x82jG\xf5\xa0\
+n\xa2FQ3\xa8Oh2Z\x09m\x80\xb6C\xfb\
+\xa0#\xd1\x89\xe8lt\x11\xba\x12\xdd\x88nC_B\
+\xdfF\x8f\xa3\xdf`0\x18\x1aF\x07c\x83\xf1\xc6D\
+a\x921k0\xa5\x98\xfd\x98V\xccy\xcc f\x0c\
+3\x8b\xc5b\x15\xb0\x06X\x07l \x96\x89\x15`\x8b\
+\xb0{\xb1\xc7\xb0\xe7\xb0C\xd8q\xec[\x1c\x11\xa7\x8a\
+3\xc7y\xe2\xa2q<\x5c\x01\xae\x12w\x14w\x167\
+\x84\x9b\xc0\xcd\xe3\xa5\xf0Zx;| \x9e\x8d\xcf\xc5\
+\x97\xe1\x1b\xf0]\xf8\x01\xfc8~\x9e M\xd0!8\
+\x10\xc2\x08\xc9\x84\x8d\x84*B\x0b\xe1\x12\xe1!\xe1\x15\
+\x91HT'\xda\x12\x83\x89\x5c\xe2\x06b\x15\xf18\xf1\
+\x0aq\x94\xf8\x8e$C\xd2'\xb9\x91bHB\xd2v\
+\xd2a\xd2y\xd2=\xd2+2\x99\xacMv&G\x93\
+\x05\xe4\xed\xe4&\xf2E\xf2c\xf2[\x09\x8a\x84\xb1\x84\
+\x8f\x04[b\xbdD\x8dD\xbb\xc4\x90\xc4\x0bI\xbc\xa4\
+\x96\xa4\x8b\xe4*\xc9<\xc9J\xc9\x93\x92\x03\x92\xd3R\
+x)m)7)\xa6\xd4:\xa9\x1a\xa9SR\xc3R\
+\xb3\xd2\x14i3\xe9@\xe94\xe9R\xe9\xa3\xd2W\xa5\
+'e\xb02\xda2\x1e2l\x99B\x99C2\x17e\
+\xc6(\x08E\x83\xe2FaQ6Q\x1a(\x97(\xe3\
+T\x0cU\x87\xeaCM\xa6\x96P\xbf\xa3\xf6Sgd\
+ed-e\xc3esdkd\xcf\xc8\x8e\xd0\x10\x9a\
+6\xcd\x87\x96J+\xa3\x9d\xa0\xdd\xa1\xbd\x97S\x96s\
+\x91\xe3\xc8m\x93k\x91\x1b\x92\x9b\x93_\x22\xef,\xcf\
+\x91/\x96o\x95\xbf-\xff^\x81\xae\xe0\xa1\x90\xa2\xb0\
+S\xa1C\xe1\x91\x22JQ_1X1[\xf1\x80\xe2\
+%\xc5\xe9%\xd4%\xf6KXK\x8a\x97\x9cXr_\
+\x09V\xd2W\x0aQZ\xa3tH\xa9OiVYE\
+\xd9K9Cy\xaf\xf2E\xe5i\x15\x9a\x8a\xb3J\xb2\
+J\x85\xcaY\x95)U\x8a\xaa\xa3*W\xb5B\xf5\x9c\
+\xea3\xba,\xdd\x85\x9eJ\xaf\xa2\xf7\xd0g\xd4\x94\xd4\
+\xbc\xd5\x84juj\xfdj\xf3\xea:\xea\xcb\xd5\x0b\xd4\
+[\xd5\x1fi\x104\x18\x1a\x09\x1a\x15\x1a\xdd\x1a3\x9a\
+\xaa\x9a\x01\x9a\xf9\x9a\xcd\x9a\xf7\xb5\xf0Z\x0c\xad$\xad\
+=Z\xbdZs\xda:\xda\x11\xda[\xb4;\xb4'u\
+\xe4u|t\xf2t\x9au\x1e\xea\x92u\x9dtW\xeb\
+\xd6\xeb\xde\xd2\xc3\xe81\xf4R\xf4\xf6\xeb\xdd\xd0\x87\xf5\
+\xad\xf4\x93\xf4k\xf4\x07\x0c`\x03k\x03\xae\xc1~\x83\
+AC\xb4\xa1\xad!\xcf\xb0\xdep\xd8\x88d\xe4b\x94\
+e\xd4l4jL3\xf67.0\xee0~a\xa2\
+i\x12m\xb2\xd3\xa4\xd7\xe4\x93\xa9\x95i\xaai\x83\xe9\
+\x033\x193_\xb3\x02\xb3.\xb3\xdf\xcd\xf5\xcdY\xe6\
+5\xe6\xb7,\xc8\x16\x9e\x16\xeb-:-^Z\x1aX\
+r,\x0fX\xde\xb5\xa2X\x05Xm\xb1\xea\xb6\xfah\
+mc\xcd\xb7n\xb1\x9e\xb2\xd1\xb4\x89\xb3\xd9g3\xcc\
+\xa02\x82\x18\xa5\x8c+\xb6h[W\xdb\xf5\xb6\xa7m\
+\xdf\xd9Y\xdb\x09\xecN\xd8\xfdfod\x9fb\x7f\xd4\
+~r\xa9\xceR\xce\xd2\x86\xa5c\x0e\xea\x0eL\x87:\
+\x87\x11G\xbac\x9c\xe3A\xc7\x11'5'\xa6S\xbd\
+\xd3\x13g\x0dg\xb6s\xa3\xf3\x84\x8b\x9eK\xb2\xcb1\
+\x97\x17\xae\xa6\xae|\xd76\xd797;\xb7\xb5n\xe7\
+\xdd\x11w/\xf7b\xf7~\x0f\x19\x8f\xe5\x1e\xd5\x1e\x8f\
+=\xd5=\x13=\x9b=g\xbc\xac\xbc\xd6x\x9d\xf7F\
+{\xfby\xef\xf4\x1e\xf6Q\xf6a\xf94\xf9\xcc\xf8\xda\
+\xf8\xae\xf5\xed\xf1#\xf9\x85\xfaU\xfb=\xf1\xd7\xf7\xe7\
+\xfbw\x05\xc0\x01\xbe\x01\xbb\x02\x1e.\xd3Z\xc6[\xd6\
+\x11\x08\x02}\x02w\x05>\x0a\xd2\x09Z\x1d\xf4c0\
+&8(\xb8&\xf8i\x88YH~Ho(%4\
+6\xf4h\xe8\x9b0\xd7\xb0\xb2\xb0\x07\xcbu\x97\x0b\x97\
+w\x87K\x86\xc7\x847\x85\xcfE\xb8G\x94G\x8cD\
+\x9aD\xae\x8d\xbc\x1e\xa5\x18\xc5\x8d\xea\x8c\xc6F\x87G\
+7F\xcf\xae\xf0X\xb1{\xc5x\x8cULQ\xcc\x9d\
+\x95:+sV^]\xa5\xb8*u\xd5\x99X\xc9X\
+f\xec\xc98t\x5cD\xdc\xd1\xb8\x0f\xcc@f=s\
+6\xde'~_\xfc\x0c\xcb\x8d\xb5\x87\xf5\x9c\xed\xcc\xae\
+`Oq\x1c8\xe5\x9c\x89\x04\x87\x84\xf2\x84\xc9D\x87\
+\xc4]\x89SINI\x95I\xd3\x5c7n5\xf7e\
+\xb2wrm\xf2\x5cJ`\xca\xe1\x94\x85\xd4\x88\xd4\xd6\
+4\x5cZ\x5c\xda)\x9e\x0c/\x85\xd7\x93\xae\x92\x9e\x93\
+>\x98a\x90Q\x941\xb2\xdan\xf5\xee\xd53|?\
+~c&\x94\xb92\xb3S@\x15\xfdL\xf5\x09u\x85\
+\x9b\x85\xa3Y\x8eY5Yo\xb3\xc3\xb3O\xe6H\xe7\
+\xf0r\xfar\xf5s\xb7\xe5N\xe4y\xe6}\xbb\x06\xb5\
+\x86\xb5\xa6;_-\x7fc\xfe\xe8Z\x97\xb5u\xeb\xa0\
+u\xf1\xeb\xba\xd7k\xac/\x5c?\xbe\xc1k\xc3\x91\x8d\
+\x84\x8d)\x1b\x7f*0-(/x\xbd)bSW\
+\xa1r\xe1\x86\xc2\xb1\xcd^\x9b\x9b\x8b$\x8a\xf8E\xc3\
+[\xec\xb7\xd4nEm\xe5n\xed\xdff\xb1m\xef\xb6\
+O\xc5\xec\xe2k%\xa6%\x95%\x1fJY\xa5\xd7\xbe\
+1\xfb\xa6\xea\x9b\x85\xed\x09\xdb\xfb\xcb\xac\xcb\x0e\xec\xc0\
+\xec\xe0\xed\xb8\xb3\xd3i\xe7\x91r\xe9\xf2\xbc\xf2\xb1]\
+\x01\xbb\xda+\xe8\x15\xc5\x15\xafw\xc7\xee\xbeZiY\
+Y\xbb\x87\xb0G\xb8g\xa4\xca\xbf\xaas\xaf\xe6\xde\x1d\
+{?T'U\xdf\xaeq\xadi\xdd\xa7\xb4o\xdb\xbe\
+\xb9\xfd\xec\xfdC\x07\x9c\x0f\xb4\xd4*\xd7\x96\xd4\xbe?\
+\xc8=x\xb7\xce\xab\xae\xbd^\xbb\xbe\xf2\x10\xe6P\xd6\
+\xa1\xa7\x0d\xe1\x0d\xbd\xdf2\xbemjTl,i\xfc\
+x\x98wx\xe4H\xc8\x91\x9e&\x9b\xa6\xa6\xa3JG\
+\xcb\x9a\xe1fa\xf3\xd4\xb1\x98c7\xbes\xff\xae\xb3\
+\xc5\xa8\xa5\xae\x95\xd6Zr\x1c\x1c\x17\x1e\x7f\xf6}\xdc\
+\xf7wN\xf8\x9d\xe8>\xc98\xd9\xf2\x83\xd6\x0f\xfb\xda\
+(m\xc5\xedP{n\xfbLGR\xc7HgT\xe7\
+\xe0)\xdfS\xdd]\xf6]m?\x1a\xffx\xf8\xb4\xda\
+\xe9\x9a3\xb2g\xca\xce\x12\xce\x16\x9e]8\x97wn\
+\xf6|\xc6\xf9\xe9\x0b\x89\x17\xc6\xbac\xbb\x1f\x5c\x8c\xbc\
+x\xab'\xb8\xa7\xff\x92\xdf\xa5+\x97=/_\xecu\
+\xe9=w\xc5\xe1\xca\xe9\xabvWO]c\x5c\xeb\xb8\
+n}\xbd\xbd\xcf\xaa\xaf\xed'\xab\x9f\xda\xfa\xad\xfb\xdb\
+\x07l\x06:o\xd8\xde\xe8\x1a\x5c:xv\xc8i\xe8\
+\xc2M\xf7\x9b\x97o\xf9\xdc\xba~{\xd9\xed\xc1;\xcb\
+\xef\xdc\x1d\x8e\x19\x1e\xb9\xcb\xbe;y/\xf5\xde\xcb\xfb\
+Y\xf7\xe7\x1flx\x88~X\xfcH\xeaQ\xe5c\xa5\
+\xc7\xf5?\xeb\xfd\xdc:b=rf\xd4}\xb4\xefI\
+\xe8\x93\x07c\xac\xb1\xe7\xbfd\xfe\xf2a\xbc\xf0)\xf9\
+i\xe5\x84\xeaD\xd3\xa4\xf9\xe4\xe9)\xcf\xa9\x1b\xcfV\
+<\x1b\x7f\x9e\xf1|~\xba\xe8W\xe9_\xf7\xbd\xd0}\
+\xf1\xc3o\xce\xbf\xf5\xcdD\xce\x8c\xbf\xe4\xbf\x5c\xf8\xbd\
+\xf4\x95\xc2\xab\xc3\xaf-_w\xcf\x06\xcd>~\x93\xf6\
+f~\xae\xf8\xad\xc2\xdb#\xef\x18\xefz\xdfG\xbc\x9f\
+\x98\xcf\xfe\x80\xfdP\xf5Q\xefc\xd7'\xbfO\x0f\x17\
+\xd2\x16\x16\xfe\x05\x03\x98\xf3\xfc6\x1c\x0f\xd2\x00\x00\x0d\
+\x16iTXtXML:com.ado\
+be.xmp\x00\x00\x00\x00\x00<?xpa\
+cket begin=\x22\xef\xbb\xbf\x22\
+ id=\x22W5M0MpCehiH\
+zreSzNTczkc9d\x22?>\
+\x0a<x:xmpmeta xmln\
+s:x=\x22adobe:ns:me\
+ta/\x22 x:xmptk=\x22XM\
+P Core 4.4.0-Exi\
+v2\x22>\x0a <rdf:RDF x\
+mlns:rdf=\x22http:/\
+/www.w3.org/1999\
+/02/22-rdf-synta\
+x-ns#\x22>\x0a  <rdf:D\
+escription rdf:a\
+bout=\x22\x22\x0a    xmln\
+s:xmpMM=\x22http://\
+ns.adobe.com/xap\
+/1.0/mm/\x22\x0a    xm\
+lns:stEvt=\x22http:\
+//ns.adobe.com/x\
+ap/1.0/sType/Res\
+ourceEvent#\x22\x0a   \
+ xmlns:dc=\x22http:\
+//purl.org/dc/el\
+ements/1.1/\x22\x0a   \
+ xmlns:GIMP=\x22htt\
+p://www.gimp.org\
+/xmp/\x22\x0a    xmlns\
+:tiff=\x22http://ns\
+.adobe.com/tiff/\
+1.0/\x22\x0a    xmlns:\
+xmp=\x22http://ns.a\
+dobe.com/xap/1.0\
+/\x22\x0a   xmpMM:Docu\
+mentID=\x22gimp:doc\
+id:gimp:4750d804\
+-3e35-4754-94a5-\
+a69d8bac5447\x22\x0a  \
+ xmpMM:InstanceI\
+D=\x22xmp.iid:b2dd4\
+c27-750d-4b02-bb\
+7b-f660cf52196f\x22\
+\x0a   xmpMM:Origin\
+alDocumentID=\x22xm\
+p.did:d8b73615-2\
+132-45be-ae18-ae\
+7168dbd00a\x22\x0a   d\
+c:Format=\x22image/\
+png\x22\x0a   GIMP:API\
+=\x223.0\x22\x0a   GIMP:P\
+latform=\x22Linux\x22\x0a\
+   GIMP:TimeStam\
+p=\x221750163366345\
+334\x22\x0a   GIMP:Ver\
+sion=\x222.99.8\x22\x0a  \
+ tiff:Orientatio\
+n=\x221\x22\x0a   xmp:Cre\
+atorTool=\x22GIMP\x22>\
+\x0a   <xmpMM:Histo\
+ry>\x0a    <rdf:Seq\
+>\x0a     <rdf:li\x0a \
+     stEvt:actio\
+n=\x22saved\x22\x0a      \
+stEvt:changed=\x22/\
+\x22\x0a      stEvt:in\
+stanceID=\x22xmp.ii\
+d:80c513d5-a3ac-\
+49f2-bf43-55d2ed\
+b7356b\x22\x0a      st\
+Evt:softwareAgen\
+t=\x22GIMP 2.99.8 (\
+Linux)\x22\x0a      st\
+Evt:when=\x222025-0\
+6-17T13:29:26+01\
+:00\x22/>\x0a    </rdf\
+:Seq>\x0a   </xmpMM\
+:History>\x0a  </rd\
+f:Description>\x0a \
+</rdf:RDF>\x0a</x:x\
+mpmeta>\x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+       \x0a<?xpacke\
+t end=\x22w\x22?>\xb0\x90D\xf6\x00\
+\x00\x0a:iCCPPhotoshop\
+ ICC profile\x00\x00H\x89\
+\x9d\x96wTT\xd7\x16\x87\xcf\xbdwz\xa1\xcd0\x14\
+)C\xef\xbd\x0d \xbd7\xa9\xd2Da\x98\x19`(\
+\x03\x0e34\xb1!\xa2\x02\x11ED\x04\x15A\x82\x22\
+\x06\x8c\x86\x22\xb1\x22\x8a\x85\x80`\xc1\x1e\x90 \xa0\xc4\
+`\x14QQy3\xb2Vt\xe5\xe5\xbd\x97\x97\xdf\x1f\
+g}k\x9f\xbd\xf7=g\xef}\xd6\xba\x00\x90\xbc\xfd\
+\xb9\xbctX\x0a\x804\x9e\x80\x1f\xe2\xe5J\x8f\x8c\x8a\
+\xa6c\xfb\x01\x0c\xf0\x00\x03\xcc\x00`\xb223\x02B\
+=\xc3\x80H>\x1en\xf4L\x91\x13\xf8\x22\x08\x807\
+w\xc4+\x007\x8d\xbc\x83\xe8t\xf0\xffI\x9a\x95\xc1\
+\x17\x88\xd2\x04\x89\xd8\x82\xcd\xc9d\x89\xb8P\xc4\xa9\xd9\
+\x82\x0c\xb1}F\xc4\xd4\xf8\x141\xc3(1\xf3E\x07\
+\x14\xb1\xbc\x98\x13\x17\xd9\xf0\xb3\xcf\x22;\x8b\x99\x9d\xc6\
+c\x8bX|\xe6\x0cv\x1a[\xcc=\x22\xde\x9a%\xe4\
+\x88\x18\xf1\x17qQ\x16\x97\x93-\xe2[\x22\xd6L\x15\
+\xa6qE\xfcV\x1c\x9b\xc6af\x02\x80\x22\x89\xed\x02\
+\x0e+I\xc4\xa6\x22&\xf1\xc3B\xdcD\xbc\x14\x00\x1c\
+)\xf1+\x8e\xff\x8a\x05\x9c\x1c\x81\xf8Rn\xe9\x19\xb9\
+|nb\x92\x80\xae\xcb\xd2\xa3\x9b\xd9\xda2\xe8\xde\x9c\
+\xecT\x8e@`\x14\xc4d\xa50\xf9l\xba[zZ\
+\x06\x93\x97\x0b\xc0\xe2\x9d?KF\x5c[\xba\xa8\xc8\xd6\
+f\xb6\xd6\xd6F\xe6\xc6f_\x15\xea\xbfn\xfeM\x89\
+{\xbbH\xaf\x82?\xf7\x0c\xa2\xf5}\xb1\xfd\x95_z\
+=\x00\x8cYQmv|\xb1\xc5\xef\x05\xa0c3\x00\
+\xf2\xf7\xbf\xd84\x0f\x02 )\xea[\xfb\xc0W\xf7\xa1\
+\x89\xe7%I \xc8\xb031\xc9\xce\xce6\xe6rX\
+\xc6\xe2\x82\xfe\xa1\xff\xe9\xf07\xf4\xd5\xf7\x8c\xc5\xe9\xfe\
+(\x0f\xdd\x9d\x93\xc0\x14\xa6\x0a\xe8\xe2\xba\xb1\xd2S\xd3\
+\x85|zf\x06\x93\xc5\xa1\x1b\xfdy\x88\xffq\xe0_\
+\x9f\xc30\x84\x93\xc0\xe1sx\xa2\x88p\xd1\x94qy\
+\x89\xa2v\xf3\xd8\x5c\x017\x9dG\xe7\xf2\xfeS\x13\xff\
+a\xd8\x9f\xb48\xd7\x22Q\x1a>\x01j\xac1\x90\x1a\
+\xa0\x02\xe4\xd7>\x80\xa2\x10\x01\x12s@\xb4\x03\xfd\xd1\
+7\x7f|8\x10\xbf\xbc\x08\xd5\x89\xc5\xb9\xff,\xe8\xdf\
+\xb3\xc2e\xe2%\x93\x9b\xf89\xce-$\x8c\xce\x12\xf2\
+\xb3\x16\xf7\xc4\xcf\x12\xa0\x01\x01H\x02*P\x00*@\
+\x03\xe8\x02#`\x0el\x80=p\x06\x1e\xc0\x17\x04\x82\
+0\x10\x05V\x01\x16H\x02i\x80\x0f\xb2A>\xd8\x08\
+\x8a@\x09\xd8\x01v\x83jP\x0b\x1a@\x13h\x01'\
+@\x078\x0d.\x80\xcb\xe0:\xb8\x01n\x83\x07`\x04\
+\x8c\x83\xe7`\x06\xbc\x01\xf3\x10\x04a!2D\x81\x14\
+ UH\x0b2\x80\xcc!\x06\xe4\x08y@\xfeP\x08\
+\x14\x05\xc5A\x89\x10\x0f\x12B\xf9\xd0&\xa8\x04*\x87\
+\xaa\xa1:\xa8\x09\xfa\x1e:\x05]\x80\xaeB\x83\xd0=\
+h\x14\x9a\x82~\x87\xde\xc3\x08L\x82\xa9\xb02\xac\x0d\
+\x9b\xc0\x0c\xd8\x05\xf6\x83\xc3\xe0\x95p\x22\xbc\x1a\xce\x83\
+\x0b\xe1\xedp\x15\x5c\x0f\x1f\x83\xdb\xe1\x0b\xf0u\xf86\
+<\x02?\x87g\x11\x80\x10\x11\x1a\xa2\x86\x18!\x0c\xc4\
+\x0d\x09D\xa2\x91\x04\x84\x8f\xacC\x8a\x91J\xa4\x1ei\
+A\xba\x90^\xe4&2\x82L#\xefP\x18\x14\x05E\
+G\x19\xa1\xecQ\xde\xa8\xe5(\x16j5j\x1d\xaa\x14\
+U\x8d:\x82jG\xf5\xa0n\xa2FQ3\xa8Oh\
+2Z\x09m\x80\xb6C\xfb\xa0#\xd1\x89\xe8lt\x11\
+\xba\x12\xdd\x88nC_B\xdfF\x8f\xa3\xdf`0\x18\
+\x1aF\x07c\x83\xf1\xc6Da\x921k0\xa5\x98\xfd\
+\x98V\xccy\xcc f\x0c3\x8b\xc5b\x15\xb0\x06X\
+\x07l \x96\x89\x15`\x8b\xb0{\xb1\xc7\xb0\xe7\xb0C\
+\xd8q\xec[\x1c\x11\xa7\x8a3\xc7y\xe2\xa2q<\x5c\
+\x01\xae\x12w\x14w\x167\x84\x9b\xc0\xcd\xe3\xa5\xf0Z\
+x;| \x9e\x8d\xcf\xc5\x97\xe1\x1b\xf0]\xf8\x01\xfc\
+8~\x9e M\xd0!8\x10\xc2\x08\xc9\x84\x8d\x84*\
+B\x0b\xe1\x12\xe1!\xe1\x15\x91HT'\xda\x12\x83\x89\
+\x5c\xe2\x06b\x15\xf18\xf1\x0aq\x94\xf8\x8e$C\xd2\
+'\xb9\x91bHB\xd2v\xd2a\xd2y\xd2=\xd2+\
+2\x99\xacMv&G\x93\x05\xe4\xed\xe4&\xf2E\xf2\
+c\xf2[\x09\x8a\x84\xb1\x84\x8f\x04[b\xbdD\x8dD\
+\xbb\xc4\x90\xc4\x0bI\xbc\xa4\x96\xa4\x8b\xe4*\xc9<\xc9\
+J\xc9\x93\x92\x03\x92\xd3Rx)m)7)\xa6\xd4\
+:\xa9\x1a\xa9SR\xc3R\xb3\xd2\x14i3\xe9@\xe9\
+4\xe9R\xe9\xa3\xd2W\xa5'e\xb02\xda2\x1e2\
+l\x99B\x99C2\x17e\xc6(\x08E\x83\xe2Fa\
+Q6Q\x1a(\x97(\xe3T\x0cU\x87\xeaCM\xa6\
+\x96P\xbf\xa3\xf6Sgded-e\xc3esd\
+kd\xcf\xc8\x8e\xd0\x10\x9a6\xcd\x87\x96J+\xa3\x9d\
+\xa0\xdd\xa1\xbd\x97S\x96s\x91\xe3\xc8m\x93k\x91\x1b\
+\x92\x9b\x93_\x22\xef,\xcf\x91/\x96o\x95\xbf-\xff\
+^\x81\xae\xe0\xa1\x90\xa2\xb0S\xa1C\xe1\x91\x22JQ\
+_1X1[\xf1\x80\xe2%\xc5\xe9%\xd4%\xf6K\
+XK\x8a\x97\x9cXr_\x09V\xd2W\x0aQZ\xa3\
+tH\xa9OiVYE\xd9K9Cy\xaf\xf2E\
+\xe5i\x15\x9a\x8a\xb3J\xb2J\x85\xcaY\x95)U\x8a\
+\xaa\xa3*W\xb5B\xf5\x9c\xea3\xba,\xdd\x85\x9eJ\
+\xaf\xa2\xf7\xd0g\xd4\x94\xd4\xbc\xd5\x84juj\xfdj\
+\xf3\xea:\xea\xcb\xd5\x0b\xd4[\xd5\x1fi\x104\x18\x1a\
+\x09\x1a\x15\x1a\xdd\x1a3\x9a\xaa\x9a\x01\x9a\xf9\x9a\xcd\x9a\
+\xf7\xb5\xf0Z\x0c\xad$\xad=Z\xbdZs\xda:\xda\
+\x11\xda[\xb4;\xb4'u\xe4u|t\xf2t\x9au\
+\x1e\xea\x92u\x9dtW\xeb\xd6\xeb\xde\xd2\xc3\xe81\xf4\
+R\xf4\xf6\xeb\xdd\xd0\x87\xf5\xad\xf4\x93\xf4k\xf4\x07\x0c\
+`\x03k\x03\xae\xc1~\x83AC\xb4\xa1\xad!\xcf\xb0\
+\xdep\xd8\x88d\xe4b\x94e\xd4l4jL3\xf6\
+7.0\xee0~a\xa2i\x12m\xb2\xd3\xa4\xd7\xe4\
+\x93\xa9\x95i\xaai\x83\xe9\x033\x193_\xb3\x02\xb3\
+.\xb3\xdf\xcd\xf5\xcdY\xe65\xe6\xb7,\xc8\x16\x9e\x16\
+\xeb-:-^Z\x1aXr,\x0fX\xde\xb5\xa2X\
+\x05Xm\xb1\xea\xb6\xfahmc\xcd\xb7n\xb1\x9e\xb2\
+\xd1\xb4\x89\xb3\xd9g3\xcc\xa02\x82\x18\xa5\x8c+\xb6\
+h[W\xdb\xf5\xb6\xa7m\xdf\xd9Y\xdb\x09\xecN\xd8\
+\xfdfod\x9fb\x7f\xd4~r\xa9\xceR\xce\xd2\x86\
+\xa5c\x0e\xea\x0eL\x87:\x87\x11G\xbac\x9c\xe3A\
+\xc7\x11'5'\xa6S\xbd\xd3\x13g\x0dg\xb6s\xa3\
+\xf3\x84\x8b\x9eK\xb2\xcb1\x97\x17\xae\xa6\xae|\xd76\
+\xd797;\xb7\xb5n\xe7\xdd\x11w/\xf7b\xf7~\
+\x0f\x19\x8f\xe5\x1e\xd5\x1e\x8f=\xd5=\x13=\x9b=g\
+\xbc\xac\xbc\xd6x\x9d\xf7F{\xfby\xef\xf4\x1e\xf6Q\
+\xf6a\xf94\xf9\xcc\xf8\xda\xf8\xae\xf5\xed\xf1#\xf9\x85\
+\xfaU\xfb=\xf1\xd7\xf7\xe7\xfbw\x05\xc0\x01\xbe\x01\xbb\
+\x02\x1e.\xd3Z\xc6[\xd6\x11\x08\x02}\x02w\x05>\
+\x0a\xd2\x09Z\x1d\xf4c0&8(\xb8&\xf8i\x88\
+YH~Ho(%46\xf4h\xe8\x9b0\xd7\xb0\
+\xb2\xb0\x07\xcbu\x97\x0b\x97w\x87K\x86\xc7\x847\x85\
+\xcfE\xb8G\x94G\x8cD\x9aD\xae\x8d\xbc\x1e\xa5\x18\
+\xc5\x8d\xea\x8c\xc6F\x87G7F\xcf\xae\xf0X\xb1{\
+\xc5x\x8cULQ\xcc\x9d\x95:+sV^]\xa5\
+\xb8*u\xd5\x99X\xc9Xf\xec\xc98t\x5cD\xdc\
+\xd1\xb8\x0f\xcc@f=s6\xde'~_\xfc\x0c\xcb\
+\x8d\xb5\x87\xf5\x9c\xed\xcc\xae`Oq\x1c8\xe5\x9c\x89\
+\x04\x87\x84\xf2\x84\xc9D\x87\xc4]\x89SINI\x95\
+I\xd3\x5c7n5\xf7e\xb2wrm\xf2\x5cJ`\
+\xca\xe1\x94\x85\xd4\x88\xd4\xd64\x5cZ\x5c\xda)\x9e\x0c\
+/\x85\xd7\x93\xae\x92\x9e\x93>\x98a\x90Q\x941\xb2\
+\xdan\xf5\xee\xd53|?~c&\x94\xb92\xb3S\
+@\x15\xfdL\xf5\x09u\x85\x9b\x85\xa3Y\x8eY5Y\
+o\xb3\xc3\xb3O\xe6H\xe7\xf0r\xfar\xf5s\xb7\xe5\
+N\xe4y\xe6}\xbb\x06\xb5\x86\xb5\xa6;_-\x7fc\
+\xfe\xe8Z\x97\xb5u\xeb\xa0u\xf1\xeb\xba\xd7k\xac/\
+\x5c?\xbe\xc1k\xc3\x91\x8d\x84\x8d)\x1b\x7f*0-\
+(/x\xbd)bSW\xa1r\xe1\x86\xc2\xb1\xcd^\
+\x9b\x9b\x8b$\x8a\xf8E\xc3[\xec\xb7\xd4nEm\xe5\
+n\xed\xdff\xb1m\xef\xb6O\xc5\xec\xe2k%\xa6%\
+\x95%\x1fJY\xa5\xd7\xbe1\xfb\xa6\xea\x9b\x85\xed\x09\
+\xdb\xfb\xcb\xac\xcb\x0e\xec\xc0\xec\xe0\xed\xb8\xb3\xd3i\xe7\
+\x91r\xe9\xf2\xbc\xf2\xb1]\x01\xbb\xda+\xe8\x15\xc5\x15\
+\xafw\xc7\xee\xbeZiYY\xbb\x87\xb0G\xb8g\xa4\
+\xca\xbf\xaas\xaf\xe6\xde\x1d{?T'U\xdf\xaeq\
+\xadi\xdd\xa7\xb4o\xdb\xbe\xb9\xfd\xec\xfdC\x07\x9c\x0f\
+\xb4\xd4*\xd7\x96\xd4\xbe?\xc8=x\xb7\xce\xab\xae\xbd\
+^\xbb\xbe\xf2\x10\xe6P\xd6\xa1\xa7\x0d\xe1\x0d\xbd\xdf2\
+\xbemjTl,i\xfcx\x98wx\xe4H\xc8\x91\
+\x9e&\x9b\xa6\xa6\xa3JG\xcb\x9a\xe1fa\xf3\xd4\xb1\
+\x98c7\xbes\xff\xae\xb3\xc5\xa8\xa5\xae\x95\xd6Zr\
+\x1c\x1c\x17\x1e\x7f\xf6}\xdc\xf7wN\xf8\x9d\xe8>\xc9\
+8\xd9\xf2\x83\xd6\x0f\xfb\xda(m\xc5\xedP{n\xfb\
+LGR\xc7HgT\xe7\xe0)\xdfS\xdd]\xf6]\
+m?\x1a\xffx\xf8\xb4\xda\xe9\x9a3\xb2g\xca\xce\x12\
+\xce\x16\x9e]8\x97wn\xf6|\xc6\xf9\xe9\x0b\x89\x17\
+\xc6\xbac\xbb\x1f\x5c\x8c\xbcx\xab'\xb8\xa7\xff\x92\xdf\
+\xa5+\x97=/_\xecu\xe9=w\xc5\xe1\xca\xe9\xab\
+vWO]c\x5c\xeb\xb8n}\xbd\xbd\xcf\xaa\xaf\xed\
+'\xab\x9f\xda\xfa\xad\xfb\xdb\x07l\x06:o\xd8\xde\xe8\
+\x1a\x5c:xv\xc8i\xe8\xc2M\xf7\x9b\x97o\xf9\xdc\
+\xba~{\xd9\xed\xc1;\xcb\xef\xdc\x1d\x8e\x19\x1e\xb9\xcb\
+\xbe;y/\xf5\xde\xcb\xfbY\xf7\xe7\x1flx\x88~\
+X\xfcH\xeaQ\xe5c\xa5\xc7\xf5?\xeb\xfd\xdc:b\
+=rf\xd4}\xb4\xefI\xe8\x93\x07c\xac\xb1\xe7\xbf\
+d\xfe\xf2a\xbc\xf0)\xf9i\xe5\x84\xeaD\xd3\xa4\xf9\
+\xe4\xe9)\xcf\xa9\x1b\xcfV<\x1b\x7f\x9e\xf1|~\xba\
+\xe8W\xe9_\xf7\xbd\xd0}\xf1\xc3o\xce\xbf\xf5\xcdD\
+\xce\x8c\xbf\xe4\xbf\x5c\xf8\xbd\xf4\x95\xc2\xab\xc3\xaf-_\
+w\xcf\x06\xcd>~\x93\xf6f~\xae\xf8\xad\xc2\xdb#\
+\xef\x18\xefz\xdfG\xbc\x9f\x98\xcf\xfe\x80\xfdP\xf5Q\
+\xefc\xd7'\xbfO\x0f\x17\xd2\x16\x16\xfe\x05\x03\x98\xf3\
+\xfc%w\x16u\x00\x00\x00\x06bKGD\x00\xff\x00\
+\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\
+\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\
+tIME\x07\xe9\x06\x11\x0c\x1d\x1a\x91nI\xb2\x00\
+\x00\x00\x19tEXtComment\x00C\
+reated with GIMP\
+W\x81\x0e\x17\x00\x00\x08\xd4IDATx\xda\xed\x9a\
+\x7fL\x94\xf7\x1d\xc7_\xcfs\xc7\x8f\xd3Cd\x95A\
+\xbb\x0a\xe8Fq\xa0\xd0\xaeA\xe9\x9cJV\x7f\xb4\xd1\
+\xa846\xe9\xe2j:fS\xe7f[\x9c\xba\xc6l\
+\x90u+\x0dn\x11u\x86u\xb1\xb3\xebl\xa35\x9d\
+\xd0\xc6J;\xc5\x11\x8be\x1a\xf4\xd2Y\xbbz\xa9\x88\
+8\x8e;@zp\x83\x03\xee\xc7g\x7f\xf4\x0b\xbbC\
+@\xba\x1d\xed\xd9\xdc;yr\xf7|\xbf\xdf\xcf\xf7\xd7\
+\xf3\xfe\xfc\xf8~\x9e\x07\x22\x88 \x82\x08\x22\x88 \x82\
+\x08\xbe \xc4\xc7\xc7k_\xe4\xf8\x9f\xf7\xe0:`\x04\
+b\x01\x13\x10\xad\xca\xfc@?\xd0\xa7.\x0f _\x9a\
+\x0d\xd04M\x17\x91I\xc0W\x8f\x1d;6/++\
++\xdfl6g\xc4\xc6\xc6&i\x9af\x14\x11o_\
+_\x9f\xdd\xe5r\xfd\xd3b\xb1\xd4\x14\x14\x144\x00\xed\
+\xba\xae\xbb\xfd~\xbf\xdc\xea,\x8f\x06\xa6744l\
+\xee\xe9\xe9\xb1\x8a\x82\xd7\xeb\x95\xb6\xb66imm\x95\
+\xf6\xf6v\xf1\xfb\xfd\x83U\xe2r\xb9.\xd4\xd6\xd6\xae\
+\x07nW\x8c\xb9e\x11\xbbe\xcb\x96{:::\xfe\
+:\xb8\xe8\x86\x86\x06)++\x939s\xe6HZZ\
+\xda\xd05w\xee\x5c\xd9\xb5k\x97\x5c\xb8pah3\
+Z[[_\xcb\xca\xca\xbaKm\xe2\xad\xf7\xe4\xb7o\
+\xdf~oOO\xcf\x07\x22\x22V\xabU\x0a\x0b\x0b\x83\
+\x16=\xda\xb5m\xdb6iii\x11\x11\x91\xce\xce\xce\
+\xday\xf3\xe6\xdd5QL\xd0&H\xe7\x0d\x22\x92\xe2\
+t:_\x89\x8f\x8f\xff\xf6\xc9\x93'),,D\xd3\
+\xc6?\x5cbb\x22\xfb\xf6\xed#''\x07\x87\xc3\xf1\
+zrr\xf2S\x06\x83\xc1\xee\xf3\xf9\xfc\xb7\x82\x11\x9c\
+j\xb5Z\xb7\xa7\xa7\xa7o\xad\xab\xab\xe3\xd1G\x1f\xbd\
+\xa1\xc1\xec\xd9\xb3Y\xbcx1\xd3\xa6M\xc3f\xb3Q\
+UU\x85\xcdf\x0bjc4\x1a9z\xf4(\x19\x19\
+\x19\x9c9s\xe6\xc9\xbc\xbc\xbc\x97\x80\x7f\x87;\xf5\x8d\
+\xcf<\xf3L\xae\xc7\xe3\xe9\xb2\xd9l\x92\x99\x99\x19D\
+\xef5k\xd6\xc8\xf9\xf3\xe7\xc5\xeb\xf5J \xfa\xfb\xfb\
+\xe5\xd4\xa9S\xb2h\xd1\xa2\xa0\xf6\x0f>\xf8\xa0tw\
+w\x8b\xdb\xedn\x02\xd2\x95\xdb\x0ckL\xb9|\xf9\xf2\
+N\x11\x91\xd2\xd2\xd2\xa0\xc5l\xd8\xb0A\xba\xba\xbaD\
+Dd``\xe0\x13\xbb\xdd\xfeVSS\xd3\xcb\xed\xed\
+\xed5^\xaf\xb7G\x19>Y\xb9re\x90\xdc\xc1\x83\
+\x07ED\xe4\xdc\xb9sE\xc0\xa4\xb0]\xb9\xc1`\xd0\
+\x80T\x97\xcbu\xb1\xad\xadMRSS\x87\x16\x91\x93\
+\x93#\x0e\x87CDD\x1c\x0e\xc7\xdb\x85\x85\x85\xf3\x80\
+$ \x01\xb8\xe3\xf9\xe7\x9f\xbf\xbf\xab\xab\xeb\xbc\x88\xc8\
+\xa5K\x97n\xf0\x10n\xb7[\xae_\xbf\xfe7%\x13\
+\x9e\xd04\xcd\xb0y\xf3\xe6\xfb\xfc~\xbf\xbf\xb6\xb66\
+h\x11\xaf\xbe\xfa\xaa\x88\x888\x9d\xcesS\xa7N\x9d\
+\x15\xe8\xda\xe2\xe2\xe24 v\xe3\xc6\x8ds\xddnw\
+\xb3\x88\xc8s\xcf=\x17$\x7f\xf1\xe2E\x19\x18\x18p\
+N\x9a4iV(\xd5 \xa4\xfa$\x22\x86\xd5\xabW\
+\x7fS\xd34\xed\xda\xb5kAu\xb9\xb9\xb9\x00X,\
+\x96?:\x9d\xcef``\xb0\xce\xe5r\x09\xd0WQ\
+Qq\xa9\xb1\xb1\xf1 @~~~\x90|ss3\
+QQQ\xf1eeew\x86\xd2x\x87\xda\xa0\x18\xe2\
+\xe3\xe3o\x07p:\x9dA\x15\x09\x09\x09\x00\xb2n\xdd\
+\xba\x06]\xd7\xfbGa\x90\xdbj\xb5\xbe?\xe8\x06\x03\
+\xd1\xdd\xdd\x0d@vvvR\xd82\x00\xd0\xccfs\
+\x1c\x80\xdf?\xa2\xbb\xd6rrr\x8c\x22\xa2\x8d\xc2 \
+-::\xda8\x92\xfc`\x0c!\x22!=\x1b|n\
+.\xa5\xbd\xbd\x1d\x80\x92\x92\x92\x05\x22b\xba\xc1uL\
+\x99\xa2\x01\x93322\xf2\x00\x1c\x0eGP\xfd\xb4i\
+\xd3\x00\xa8\xaf\xafoU\xa7\xc7\xf0\xdc\x80\xd1No\xa7\
+O\x9f\x06 33\xf3\x89\xf5\xeb\xd7\xcf\x02L11\
+1\x9a\x0ax\xb4\xee\xee\xee\xc9;v\xec\xb87%%\
+\xe5\x11\x80\xea\xea\xea \xf9\xd4\xd4T<\x1e\x8f\xb3\xb8\
+\xb8\xd8\x16\xca\x0d\x085&Y\xad\xd6R\x11\x91\xdd\xbb\
+w\x07Y\xf1\x993g\xca\xd5\xabWED\xa4\xbb\xbb\
+\xfb\xc2\xfe\xfd\xfbW\x033\x80;\x80oTVV\xae\
+\xeb\xed\xedmR\xfe>H\xb6\xa0\xa0@\xbc^\xaf\x5c\
+\xbf~\xbd&\xd4n\xd08\x01\x0c\xf0+]\x1d^\xce\
+\xd6\xad[\xd9\xb3g\x0fIII\xb3\x1f{\xec\xb1\xd7\
+\xd7\xacYs\xa9\xaf\xaf\xaf\xddd2\xdda6\x9b\xd3\
+\x01\x1a\x1b\x1b)**\x0a\x92\xdd\xb8q#\x06\x83\x81\
+\xc6\xc6\xc67\x80\xee\xb0\xb6\x01c\x19\xa9\xb3g\xcf\xf2\
+\xf0\xc3\x0fs\xe2\xc4\x09\xdcn\xb7!...31\
+1q\x91\xd9lN\xef\xea\xea\xa2\xaa\xaa\x8a\xe5\xcb\x97\
+\xd3\xdc\xdc<$\xf3\xc0\x03\x0f\xb0p\xe1Bz{{\
+\xad\xb9\xb9\xb9o\xa9\xccQ\xd82@\xfc\xa3\x98\xffA\
+\x5c\xbbv\x8d\xc7\x1f\x7f\x1c]\xd7Y\xb5j\x15\xf1\xf1\
+\xf1\xd8\xedv\xaa\xab\xabo8-\xce\x981\x83\x92\x92\
+\x12\x8cF\xa3\xb7\xa6\xa6\xe67\x80=\xd4\xfao\x9c(\
+#\x18H\x04\xa3\xd1HBB\xc2\x90'\x18T\x89\xca\
+\xca\xca\x1b\xdc\xdc \xb2\xb3\xb3\xd9\xbbw/\xc9\xc9\xc9\
+x<\x9e\xfe\xd6\xd6\xd6\x9e\x898\xbd\xea\x13e\x03\x02\
+a2\x998|\xf80K\x97.\x1d\x8f\x0aQTT\
+\xc4\x81\x03\x07\x98>}:\x00QQQ\x93\xd7\xae]\
+\xbb\xa3\xb4\xb4\xf4n\x95P\x0d_\x06\x8cf\x03\xd2\xd2\
+\xd2\xa8\xa8\xa8\xe0\xc3\x0f?\xa4\xbe\xbe\x9eS\xa7NQ\
+WW7\xb4\xe8\xfc\xfc|\x96-[\xc6\x82\x05\x0b\x86\
+\x16\x1e\x88\x98\x98\x98;7m\xdaT\xd1\xd8\xd8\xf8\xfd\
+\x17_|\xf1\xa3\xc0P:\x9c`\xb2X,?\x17\x11\
+)//\x1frcs\xe6\xcc\x11\x11\x91\x9e\x9e\x9eN\
+\x8f\xc7\xd3;\x98\x03\xf0\xfb\xfd\xe2v\xbb\xc5\xe7\xf3\xc9\
+x\xd1\xd1\xd1q\x02\x98\x09\x18\xc2\xda\x0b\x8cD\x84\xce\
+\xce\xces+W\xae\x5ca\xb1X6\xb7\xb4\xb4\xfc\xb9\
+\xb3\xb3\xb3\xa6\xbf\xbf\xff\xefN\xa7\xb3\xd6n\xb7\x1f>\
+s\xe6L\xb1\xcdf;>V\xff\xb7\xddv\xdb\xfd\xad\
+\xad\xadO\x031a\x1d\x07\x8c\x98%\x8d\x8e\xee\xad\xae\
+\xae\xfe\xa0\xba\xba\xfa=\xb5\x80\x18\xfe\xfbb\xc4\x03x\
+\x97,YRy\xe4\xc8\x91\x03f\xb3\xf9\xee\x91\xfa\xe8\
+\xef\xefo9{\xf6\xec1\xc0w\xcb1@\xc1\xc7\xa7\
+o\x7f\xba\x806\xe5\xda\xda\x80O\x00\xd7\xf1\xe3\xc7?\
+.//\xffq__\xdf\xbf\x86\x0b\xba\x5c\xae\x7f\xec\
+\xdc\xb9\xf3\x91U\xabV\xbd\x1b*\x1b\x10\xf28@]\
+\xe4\xe5\xe5\x91\x92\x922\xa2\x8b\xbb\x09\xfa\x8a\x8b\x8b\xdf\
+\xcf\xc8\xc8\xf8\xc9C\x0f=t\xc0h4\xc6\x01tt\
+t\xbc\xb3i\xd3\xa6-\x87\x0e\x1d\xfaXm`X\x22\
+\xc6b\xb1<=\x86\x01\xfb\x0b0\xf5\xa6\x96\xd4d\xd2\
+\x80\xf8\xd3\xa7Oo\xf0\xf9|\xfdW\xae\x5c\xf9\x83:\
+7D\x85<\x83\x1b\xe2\x94\x98\xb7\xa9\xa9\xa9F\xd7\xf5\
+\xa7<\x1eO\xd0\xdb\x1c]\xd7}\x03\x03\x03\x17\x01\xf7\
+\xcd\xfaq\xbb\xdd\x02\xb8\xe6\xcf\x9f\xff\xda\xd1\xa3G-\
++V\xach\x04:C\xa5\xf7As\x9e\x88\xbc\xa0\x88\
+\x18G\xe8[\x00\x9f\xae\xeb\xbe\xf1\xbe\xf0\xd4u]\x13\
+\x11M\xd34\xf92\xbc$\x8d \x820\xc4g\xb1\x01\
+\x0b\x81\xac@[\x05\xbc\xa9\x8cS\xa8\xb1\x14\xf8z\xc0\
+}\x0f\xf0\x86\x8a\x1d\xc6\x83\xef\x00\x85\x80K\xd7\xf5m\
+~\xbf?$9\x84\x17\x80\xf9\xc0=\xeaZ\x04\x1c\x19\
+6\xd1P\xe10\xf0\xad\x80\xb1\xbe\x0bT\xa9\xf4\xd9x\
+\xf0&`\xd4u=\xa4\x81\xde\x0b@\xdc\xb0\xb2$`\
+\xff\xff\xc9\xc0\xc4\x11\x98xx\x84\xb24\xe0w\xc3\xca\
+&\x03\xe6ae\xb1j\xae\x9fK\x1c\xe0P\x93\x008\
+\x04<2\xac\xfe%\xe0\x07\xc0b \x05\xc8V\xee\xb0\
+H\xb5\xcd\x07\xacjq\xe7\x81?\x8d1V\x13\x9f~\
+2\x03\xf0\x15\xe0W@\x87\x8a\x0dnW\xf76`\x07\
+\x90\x07\xfcV\xb1\xa6n\x22\x190\x03\xf8}\xc0S\x1b\
+\x8e\x97\xd5\xef\x12\xe0$\x90\xac\xee\xef\x03J\x86\xb5}\
+\x12X6\x06\x03\xb2\xd4\xe2\x06\xfbM\x0e\xa8\x9b\x0a\xbc\
+\xa2\xfe\xc7\x05\xcc)\xe4\x0c\xf8^@\x1cn\x02\x96\x03\
+O\x8cS\xb6J\x1d|\x00\xd6\x03O\x0d\xab\xdf\x0b\xec\
+\x03\xdeQ\xf7\x81_U\x98\x15[\x9eP\x9bn\x0b\xe8\
+\x0b\xc0\x09\x9cS\x0c\xbb2\x91\xa1\xf0U\xa0W\xfd\xf7\
+(\xfd\xf7\x8cS\xb6'\xe0\xff\xd7\x80\x9f\x8e\xd0\xe6\xa3\
+a\x94\x17\xc5\x84_*v\x0c\xa8dH\xce\x08\x0c2\
+}\x86\xb9\xfc\xcf\x1b\xf0\x1e\xe0\x1a-\x150\xec>\x9d\
+\xd1?v<\xafl\xc6\xa51\xc6z7@\xbe\x0c\xd8\
+\x06\xfc\x1a\xb8\x0c\xb4\xabM\x19\x09q_T>\xc0\x13\
+\xe0\x12\x93\x80\x1f\x8dqf\xdf\x03<\x0bL\x09x\x10\
+\xbb\xc7pso+C9K\xd1\xfd2P\x10P\x9f\
+\xa3\x8c\xe0\x84\x9e\x06\x1bnB\xb1\xed@)\x9f~\xc4\
+d\x07\x8a\x03h\xee\x18v\x92\xb3\xab'\xfa\x8b\x80y\
+\xbc\xact\x1b\xa0~\x04\xf6\xfc\x0cX\xab\xd4\xe4Y\xe0\
+\x87@\xb9\x9aS[\xc0\x06x\x15\xc3\x22\x88 \x82\x08\
+\x22\x88 \x82\x08\x22\x88 \x82\xd1\xf1\x1f7\x02\x82l\
+\xc9\x1b\x1bg\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x16\xd8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00'\x08\x06\x00\x00\x00\xbf\x98N<\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00'\x00\x00\x00\x00\x9ey\x84\xee\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x14\x88IDATh\
+\x05\xd5Z\x07tU\xd5\xb6\x9d\xe7\xd6$7=\x01B\
+ $\x84^\x04\x01\xb1\xe3SP\x14\x14\xbf\xa8`w\
+\xa0\xe8\xb0c\xafO\x9f\xcf\xaf\x8ea\xf9\xeaG\xfd\xa8\
+(\x96o\x17?\xa2\xd8A\x01;\xbd\x09\x82\x80\xd4@\
+\x12\x12\xd2\xef\xcd\xcd-\xfb\xcf\xb9\x93{\x0dR|\xe3\
+\x8f\xf1\xc7xo3N\xce9\xfb\xec\xb6\xd6\x9ak\xae\
+\xb5\xf7\xc5\xc1\xef\xc5\xe1\xa3\xd9\xb1c\xc7\x92\xe5\xcb\x97\
+\x1f\xe18N\x98\xef\xee\xdf?\xff\xeb>\x19\x838E\
+\xf3\x1d~\xf8\xe1+\x8a\x8b\x8b\x87\x1eL\x12)\x00\xdf\
+\x7f\xff\xfdr\xde\x0c\xafX\xdb]\xcf\xff\x92\xd7\x08\xae\
+{\xc8\xb0\xdfe\xf9\xe6\x9boVQ\x96}\x8ag\x9f\
+7\xbe\xf8|>[\xf5\xd2K/\x99\xce\x9d;\xa3\xa5\
+\xa5\x05D\xc3\x1f\x9b\xd9w\x0b\x99\x03~\xf9\xe7\xa8t\
+q\xdd^\x9f\x17\xe5\x15\x15\xe6\xb2I\x97\xc1\xef\xf7\xcb\
+\x90\xfb\x94\xfd\x14`\x88\x17\x95\xbe}\xfbb\xc1\x82\x05\
+hnn\x86\x06R\xb1\xdf\xf4\xec\xa8\x8dC\xd5\xb6\xd6\
+;m}l\xa3\xb6?\x07SZ\xfb6\xff\xdf\xcf\xb1\
+x\x1c~\x1at\xe4\xc8\x91v\xaa\x84l\xed\xe7=\xa8\
+\x02\xf6\xee\xdd\x8b{\xef\xbd\xb7\xb5m^\x07\xa0z\x0f\
+\xd0\xad\x18\xd8\xbe-\xd9\xbf7\x9fZxmM\xd6\xfc\
+s>\xd0\xf7\xed\xc2\xfe!\x05$Dp\xbb\xdd\x18<\
+x0b\xb4\xae/=\x1d\xc1\xc6\xce\x888.\xd4\xc6\
+cH\x8d\xa4\xc1\x1bk\x81\xdb\xa9G\x0ay\xb2\x90\xa8\
+\x88\xb3\xbd&\x90\x0b\xb5\x84\xc3\x88D\x22p\xb9\x5c\xad\
+\xa8\xe1\xa0\xc2\x8a\x8b\x16\x81\xd7\x9b\x98\xc2\x92\x8c^\xfe\
+oL\x9b@s+\x0a5N\x9c\xe3WUU\xe9\xd1\
+\x96\x9c\x9c\x1c\xe4\xe5\xe5\xc1\xe3\xd9\xcf\xce\x89&8\xf8\
+\x176\x11\xfc)\x01\x22\xc1 \x04'\xc4b\x88\xd5\xd5\
+ag\xc3Nt\xefY\x8a\xdf\xf6\x02\xe1\x9a*t/\
+)\xa1\xe0~\xec-\xdb\x89\x8c\xac,\x04\xd3\xd2\xe0g\
+[)\xc4C\x81cTF\x8cJ*\xe3\x1d\xbbwS\
+\x1b\x5c4\xbf\x95p\x0e=nI\xc8\x92\x5c\xd6\x9f?\
+\xf8\xbd\x9d\xb9\x9cfD\xe35\x1cC\x8a\x8eC\x02_\
+r\xc9%\x08\x04\x02\xa8\xe3:\xdf~\xfbm\xa4\xa4\xa4\
+\xd8u\x1cl\xc4C*@\x02\xe8\xa2\xe8pS\x8b\x86\
+\x97C\x81D\x8e\xe9\xa9\x01\xe4\xfaC\xa8b]]c\
+#J\x0a3\xb1\x81(\xd8\x93\x9a\x86~.\x07-m\
+\xd6\xf7\xb2=\xc5\xa6y(e\xb8\xb1\x8d5(?\xab\
+RxQ~[t\xffG\xf5\xe0ve\x22\x1c\xa1\x22\
+Y<\xae,8\xeeF\x22\x0e\xc8\xcf\xcf\xc7\xb8q\xe3\
+\xac\xe1~\xfd\xf5W\xe4\xe6\xe6RI\x0af\x07/\xae\
+\x83\x7f\x92u\x1c\xc8\x15\xbc\x14\xb2\x91B\xcaj\x1e\xbe\
+W\xed\xd9c\x15\xa3xQ\xc2\x95\xf7\xcd\xcc\x80b\xe7\
+-\xa9n,D\x1d\xb6S\x01\xe9n\xc7\x92\xa7\xc6\x10\
+\x89\xe6\xa5\x03\x01W\x08\x1dH'\xa99n\xe4\x16\xb8\
+\xd0\xd8\xd1\x8dr\xbf\x1b\xbe\xe2\xb4\xa4\xf0\xde\x02?R\
+z\x06\xe0\xeb\xe1\x85\xa7{\x00\xc8\xe6\xe5v\xc1\x15(\
+\x82/\xad\x14\x99\x19\xfd\x88\xc6zL\x1c\xf7\x01N\x1b\
+\xf6\x08\x11P\x87t_\x91\x15CP\x0f\x12\xad\x9b7\
+o\xc6\xa6M\x9b\x90\x91\x91\x81h4z(\x11\x0f\xed\
+\x02\xea)\xbf\x12\x0a$\x88\x06\x97E\x0b\xbat\xb1~\
+\xbb\x9b&ki\x89cc\x88T\x98\xe1B1\xa3\xc3\
+\xa0\xb4&45\xe6`U\x8b\x0b}SZ\xdd B\
+x\xae\xf8\x99`\xebX\x84\xa6\xcaJ\x8eZ\x8b \xff\
+\xd2\x83\xd0\x93W\xcd\xb6\xa0E\x82+\xd7\x83H9\xf9\
+\x03\xca\xc1T,v\xf8\xcd\x8dx\xd3\x0eK\xb8\x22]\
+\x95\xee\x81\x01(Ok\xfd\x1e\x8c\xd18,.*\xbe\
+\xa6\xa6\x06\x22p\x15\xadYk?T9\xa4\x0b\xa8\xa3\
+\x10\xa0!\xd2\xa9\xcd09a/}\xab\x88\xa4\xb8\xcd\
+\xe3\xc5\xb9\xa6\x05S\xbay\x10pv\xe3?\x9bRP\
+Ck6\x1a/Fg\x85\xd0\xdb\x1f\xc6\x1b\x95\x01\xe4\
+y\x5c(\xe0\x003\xa67\xe0\xc9\x0f\x0c\x8e\x18\xd1\x09\
+k\xb7\xe6c\xd0\xe1.\xc4\x1bR\xf0\xf0\x02\x07\xe3\xae\
+\xea\x8f9g\xbd\x8d\xd8\xde(Nza<\xf2\x86\xe7\
+\x22\xd4\xb2\x03{\xeb;a\xcd|/\x1a_{\x19\x03\
+F\xbd\x8b^\xeeRxC\x15\x98\xf9\xee\x19\xf0\xd71\
+?il\xc2\xe0\xec3\x11!\xb2\xd65\xcfEs(\
+\x82\x8a\x8a\x0a\xeb\xff\x09\xa3\x1dJx};\xa8\x02\xa4\
+\xbdP(\x84T\x92H\x9f^\xbd\xb0\xe4\xa7\x9f\xb0\xbb\
+\xb6\x16WO\x9eL2\x8c\xe2\xf9\x19/\xe3\x8an\x01\
+\x14\x85\xc2\xa8\xa0\xc1\x1e-\xdc\x81\xd9a7\xb2zD\
+1\xbdO\x08\xb9\x9e0v\xcf\xca\xc1\xffl\xf4\xa1 \
++\x8c\x91\xa74b\xc8\xd8(\xaa\xf2\x8b\xf0\xca\x92b\
+\xb8\xabv!kX\x1a\xba\xfb\xd3\x90;\xa8Sr\x9d\
+\xe1\x86\x10\x82UA\xc4\xfdM\xf0\xf6\x1f\x82\xf0/\x15\
+\xe84\xf4~t\xe91\x12\xb5+\x16\xa2kq\x7f\x14\
+\x9fx3aS\x8fa\x1dF\xe3\xd8\x8e\xff\x86\xadu\
+\xcb\xb0\xee\xa7\xb90->k\xfd\xf6\xc9\xdb\x9f)\xe2\
+\xa0\x1c`\xc9\x89J\xd8\xb0\xb3\x0cKk\xeb\xb0\xbb\xba\
+\x1a\x97]|\x11\xf2\x0b\x0b\xb1`\xcb6:~?\xf4\
+\x0d\xa4\xe2\xf1\xd2#0\xb4d(!\x1dF\xcf\xcc \
+\x5c\xc5-\xf8\xeb\xbc\x16l\xaes0\xfe\xd8\x1a Z\
+\x81@\xffZT{\xa3pe\xe4cs\xb8\x04\xd5q\
+7^\x9f\x1b\xc1\x86\xdc\x9e\x18|t!*V\xb7\x12\
+Z\xa0o&~\xb8\xeds|:\xfam\x94m,\xc6\
+\x8e\xd5~Dn|\x14\x9eT\x0f\xd2\x9a\x9bP\xd8\xe2\
+\xc0\xb3x1\xb6-|\x0a\xf1\x960\x82\xe1\x1a|\xbd\
+\xe198\xe1V\xa2kl\xa9FCC\x83\x85\xbd\x5c\
+W\x8a\xf8\xb3r@\x05dff\xc2!\x8b\xdb\x12l\
+\xc2.^\x97_u\x15\xba\x97\xf6\xc0C\xff5\x0d\xeb\
+\xbf\xfe\x0a\xfd\xc8\xb0\x19\xd1:z'U\xc5\xa6\xae\x5c\
+\x86\xf8\x1e.\x943\xa8\xbf\xb9\x8c\xf9@\xaeA~A\
+\xeb\x10iY\xf4m\xaeqUY\x1e\x16Tv\xc4^\
+O\x0e6L[\x8a\x9a\xc6Td\xf7\xce\xc7\xae\x1f\xb7\
+\xda\x86\xd1\x98\xe2\x0d0\xe4\x89\xc3\x916\xf40l\x99\
+1\xd7\xbe\x97W\xceB\xe5\xb6o\x91\x92U\x88\xe3\x0a\
+\xce\xc79\x85w\x93\x94\xf7`\xd1\xe6\xf7\xf1\xce\xd6\xbf\
+\xa2\xb9\xb6\x0ay(AM\xb0\x9c9H\x8b\xcd?D\
+\xda{H\xd6\xcaEt)\x1f\x10\xaa\xffX\x0e\xe8\x02\
+\xa5\xa5\xa5\xb6\x93\xa1\x16;\xb2\xe3\xc4\xa3\x8fF6\x05\
+\xfe\xdb\xfd\xf7\xe3\xa6)S\x10`\x9c\x7f\xf8\x91G\xb0\
+cp1n]\xb4\x04\xe7\x9d\xce\x90\xd6\xd9\x85\xad\xd5\
+q\xf4OWp+@JI\x15|\x1128\xb5\xe3\
+s\xefFm\xca@lC\x1f\x04\xbd\x018\x81V\xcb\
+\xecY\xb9\x15i\xc5\xbd\xb0\xe5\x8d\x8d\x0c\x11\x8c\x92\x1b\
+\x1b1\xfc\xa9\xc3\xd0a\xd2\x19\xf8i\xbe\x0f\xa5\xae\xb1\
+\xc0\xa9\xc3\xd0\xe7\xa8\x11(\xdc\xc9\x84f\xf1\x124\xe7\
+\x16\xa0\xa59\x8c\x98\xaf\x11\x1e*\xb5\xd8;\xa8U\xc8\
+6ovH\x841*R\xc2\x0b\x01B\x82\x04\xe7.\
+\xf0\x8f\xb2\xdb\xf7\xfd\x10 mu\xed\xda\xd5\x0e\x1a\x22\
+\xe9\x15\x16\x15!\xc8\x81\xe6\xce\x9bg;\x14\xd0\x05\xf2\
+;v\xb4\xcfG7y\xb19\x0f\xc8a\xbet\xf3\xb2\
+8>\xde\x04,\xdf\xc5\x17.f\xf9\x1e7\xd6\xee\x95\
+E}\xa8\xaa\x06\xe6-\xf1\xe3\xb3e\x0e\xaa\x96\xedF\
+\xcd\x9ar\xdb\x9fkC\xd3\xcez4\x94\xedEj\xb7\
+\x0c[\xe7\xc9\xce\xc0\xeeEd\xf2]\xe4\x9f>\xdd\x91\
+\x15\xef\x86\xe5\xcf\xdf\x8eh]%\xba\x14\x1f\x83M5\
+\x8b1\xa7\xfaI\xecn\xda\x88\xb2\x86\xb5\x08\xc5\x83(\
+\x0f\xfe\x86f:\xa1\x9b\x09\x91\xdb\xedASS#*\
+\x19m$\xb8\x22\x97\x88\x5c\xb9\xcb\x81\x10`'m\xfb\
+c\xf1\xb1t\xe9\xd2\xe5\x93'O6_\x7f\xfdu\x94\
+\xae\xa0\x00\x90\xbc\x88\x8c\xe4s\xd7\x82N\xa6S^\x9e\
+AQ7\x83\xdc\xae\xac\xf7\x0a\xf3\xbc\x17\x99\xe2\xc2l\
+\xde]\xbc\x0aM\xcf\xd2B&\x0f\xf4\x87v\xe3$\x9e\
+'.\xbd\xd6\x9c\xfe\xf1%\xf6[J\xf7t\xe3\xcaQ\
+\x9f\xd6\xf9\xb8\x98\xe4s\xa2.q\xf79\xfb\xae+Q\
+\x9f\x96\x9afN9\xe5\x14\xc3\x14\xdeh\xed\x0c\xd9v\
+\x0c\xc9r\xf9\xe5\x97\x1b\xca\xb6\x92m\xf7)\xfb\xb9\x80\
+\x92\x09\xf9\x8b\xb4&\xed\xa9(\xa1PQ\x9e?`\xe0\
+\x00f_\x1eTW\xeeEVv&J\xdc^8i\
+\x06\x9bI@9\xe9\x01dwJAe\xa3\x0f\xdd\xb2\
+\x9b\x91\xd75\x0ba\x12^Q\x87\x1a42d\xc7r\
+\xb2Q\xbf\xb1\x16\xc7>z\x1a\xfa_\xca\x8d\xba+\x8e\
+\x9f_\xf9\xd1\x8e\x1d\xad\x0b#^\x13\x87+\x9b\xa0\xa4\
+\x8b\xc5C\x1c\xb7!@\x07\x8a\x92\xd4\x1a\xe0\xf7\xe4!\
+\x85!6\x16mF}\xbc\x0c~'\x8b\xfb\x14\xba\x02\
+\xc97\xc5\xc9A\xb3\xa9A0\x14\xc4\xdc\xb9\xad\xbc\xa1\
+\xf5'\xb2@=+K<\x10\x02\xf6S\x80\x5c\xa0#\
+!\xae\x84GY\x94:)\x1c\xeay\xfd\xfa\xf5v\xb1\
+H\xe3-\x9f\x97\xf6\x1d\xd2\x8d\x90N\xe4\xef\x09o\xb6\
+w\xe5/\xee\x1c/\xb6W\xff\xc2\xdc\x9f\xdf:\xd3)\
+R\xbc$L\xb9\x07\xb0m\xfeF..\x8a\xda_\xab\
+\xb1\xe1\xd5\x15\xf0\x16\xf9\x10\x0dF\x98\xf91\xd56\xdc\
+X50\x9ax\x98|u\xa9El'\x8d\x18\xe3\x1a\
+bM\x08\xd9\xde\xad\x7f\xc2\xa6.\xf9\x162\xad\x89\x8f\
+*\xda\x0bn7ft_\xc9\x22\x99$\xdb\x1f\xcb~\
+\x0a\xd0\x00\xf2\x17uR\x91\x02\xfe\x98N\xfa\xbb\xf9\x91\
+\xda!\x15\xe1\xea0<y\xdc#\xc4\x0c\x1a\x1b\x1a\x91\
+^\xc4|\x97sD\x83Q\xf8\xb2|\xf0\xba2\xe0\xc9\
+\xa7%\xd3\xb97\xe0\xbf\x18Y\xcb\xdf\x91\xa1m{-\
+V\xdd3\x0f\xcd\xd9\x5cp\x17/\xfc\x19>\xe4\xe4f\
+\xd3S<\x88J1{j\x91\xe9\xcf\x84/\xdb\x87\xc6\
+P\x13\xea+\xeb\x90\x16\xe0\x06\x8b\x1b.YU\x0c/\
+rK\x18K\xa1\xaf\xa9\xa9\xc9\x0a/\xb4*\xf6k\xcd\
+\x890(TK\xa6\x03\xed\x0a\x93\x0a\xf8\xfb\xdf\xff\xee\
+\xf0\x92\xdf0_\xef\x90T\x80\xa0\xa3\xad\xad&L#\
+4u\xc2\x12\xaa\xe0&h}\x15\xfc\xfc\x97\x95\xcf\xcd\
+\x08\x997#\x90\x81\xfa\xc5\xf5\xc8\xa4[\x18\xb7Ah\
+u\x08\xd56\xd9\xddW\xe7\xb9\xfe\x5cT\x86\xc9\x8a,\
+\xf9)\x1d\xb8\x83\xacBcY\x04\x8d\xfc\x97(\xd9\xa9\
+\xd9\xa8\x0a\xfd\xbe\xad\xd5\x8e.\xd8\x14\xb4W\xa2\x0dO\
+w\x10\xe6\xb6\xbb\xbc\xbc\x95P\xb5\x13T\x1a\x5c\xcbd\
+-Q\x0aI\xd8\xbbv\xed\xb2\x82\xb77*\xbf{\xa9\
+$nP\x9d\xd6\xb8\xcb\x97$6\xb6n\xdd\xbab\xf1\
+\xe2\xc5f\xe5\xca\x95\xdaEXB\xe9\xd7\xaf\x9f\x194\
+h\x90%\x16\xd5\xe9*)\xedn2\xb3\xf6%\xa3~\
+\x03\xfa\xefC\x5c\x13&N0_}\xf5\x95\xf9\xfc\xf3\
+\xcf\xcd\xe8SOM~\xbb\xf1\xc6\x1b\xcd\x95W^i\
+\xdf\xc97\xf6\xce\xad\xab\xf9\xe2\x8b/\xcc\xc8Q#\xed\
+\xfb\x93O>i~\xf8\xe1\x07\xf3\xfc\xf3\xcf\xdbw\x1e\
+\xce\x18\x9eW\x9a7\xdf|\xd3\xbek\x0dT\x8c\xb9\xef\
+\xbe\xfb\xcc\x981cl\xdd\x11G\x1ca>\xfd\xf4S\
+;\xe7\xc5\x17_l\xeb\x9e~\xfai\xb3}\xfb\xf6\xe8\
+\xfc\xf9\xf3u\xe0\xbb\xcf\x99 \xe5v<\xfa#M\xf0\
+\xde\x95\x83\xd6\xb2Q\xb3\xf2\x00Y]E\xbb*Y^\
+q\xf5\x89'\x9e\xc0QG\x1d\x85\xa5K\x96\xe0\xa6\x9b\
+oFo\xa6\xc83^\x9aa\x11#M_x\xe1\x85\
+x\xe3\x8d7\x90\xc53\x01mK\xa3-\x11P(\x1e\
+\x01\xecF\x9f\xde\xbd\xf1%\x9f\x1fz\xe8!t\xef\xde\
+=\xe9V/\xbe\xf8\x22f\xcc\x98\xa1\xc3X\xfc\xfc\xf3\
+\xcf [s\xc7\xe9\xb1\xbcs\xd1E\x17\xe1\xea\xab\xaf\
+F\xcf\x9e=\xade_x\xe1\x05Kfg\x9ey&\
+>\xfa\xe8#\xbb\x1e\xa1C\xdf5\xbfP\xf0\x13S\xf6\
+\x0d\x1b6@2\xa8\x0c\x1f>\x5c\xebr4\x16\xd7\x1e\
+\xe2^\xe1\x1a\xcav6]\xe5)\xca\xfd)w\xaa\x8e\
+\xa1\xff\x8c\xa1\x05\xb6\xd3RK\xb8\x87\xee\xc6\xb0\xa1\x81\
+\x5c\xea$\xdf\xd2)\x8b\x8e\x95t\xc8\xf0\x1fTB3\
+IQe\xf4\xe8\xd1XBe<\xfb\xec\xb3\xa0\xe2p\
+\xea_\xfe\x82\xd5\xabW\x83V\xc7E\x17\x5c\x80\xaet\
+%\xb9\xd0\xba_\xd6c\xd0\xc0\x81\xb6\x8f\x84\xd7\x22?\
+\xfc\xf0C\x0c\x180\xc0\xd6\x0d\x192\x04\x1b7n\xc4\
+\x02\x9eA*\x079\xe1\x84\x13@$b\xcb\x96-\xa8\
+\xaf\xaf\xb7\xcaR}\x22\xbd\xed\xdf\xbf?zQ\xf9\xfa\
+\xc6\x90m\xdb\x8a\x0f\x94\xecH\xe0w\xdf}\x17=z\
+\xf4\xc0\xc8\x91#\xf1\xddw\xdf\xd9K\x06Mey\xed\
+\xb5\xd7n}\xf0\xc1\x07O\xe6y\x81]\x90\x85>\xb5\
+r\x95\xb4\xf4\xea\xab\xaf\xf6\xe5iJ!\xb5k\xc6\x8f\
+\x1f\xefh\x10\x15\xa2\x03G\x1ey\xa4\xddi\xcd\xfe\xe0\
+\x03\x9b\x15\xaa>\x87\xd9!\x8f\x9aAxA\x07\x10\xa5\
+\x5c\x98\xb4O\x98b8\xb3\xc7\x93\xc6\x8c\xb1}\x96-\
+]\x82\x00\xc9\xe9\x11f\x8fR\xe8/\xbf\xfcbC\xad\
+\x04\x99:u\xaaU\x9eB\xaf\xfc\xb4\x9a{\x8e\xb1c\
+\xc7b\xdb\xb6m\xa0\xdb\x81\xf0\xc6\xacY\xb3 %)\
+\x0ai\xaf/!O:\xe9\xa4$\x8a\xa4\x0c\xf59\xf1\
+\xc4\x13\xb1l\xd92-\xcdr\xd8y\xe7\x9dg\x95 \
+\x85\x0a)\xaa&\x896k\xbb<p\xe0\xc0$\xff\xe9\
+\x04e\x8a|\x92\xfe\x12\xa6\xb0\xf1O>\xf9\xc4\xfa\x8f\
+\xee\x9c\xc8\x9cJ\xff}\xf9\xe5\x97\x0dI\xc5\x14\x15\x15\
+\x99\xd7_\x7f\xdd<=u\xaay\xe0\x81\x7f\xb7\xed\x88\
+\x143s\xe6L\xf3\xfe\xfb\xef\x1b\x22\xc5\xd6=\xf7\xdc\
+s\xe6\x9ak\xae\xb1\xcf\x5c\xa0\xbd\xd3\xf2\xe6\x9e{\xee\
+\xb1\xcf\x5c\x8c\xb9\xfd\xf6\xdb\x95p%\xdfU\xa7\x04\x86\
+\x164\xd9\xd9J\xa6`N;\xed43m\xda4C\
+\x04$\xdb\x1ds\xcc1F\xc7\xf6\xd3\xa7O\xb7u\xc7\
+\x1dw\x9c\xf5\xfd[o\xbd\xd5\xbe\xf7\xee\xdd\xdb\xde\xe9\
+Zf\xca\x94)\xc9~t\xb7\x08\xe7\x14\xb7\xc5\x88\x04\
+\x8ajn\xb5\x08 \xa3\xce'\x81(\x89\xf00|8\
+\x89\xb0'(\x9f{\xee\xb9\xd6\x12J0\xe4g\xb2\xa0\
+\xce\xdd\xa2\x0cG\x99<\x09Ry\xef\xbd\xf7\xb0j\xd5\
+*,\x5c\xb8\x10$O\x9d\xbf\x83\xc2\xdb\xa4D| \
+x\x0b\xfa\xdf~\xfb\xad\xf5w\xf5\xe1\x22u\xb3\xdbW\
+q\xc7\xa4I\x93,\x84i\x08\xc8rD\xab\xfd.\x96\
+\x97\xe5w\xee\xdci\xdfeM\xc5t\xf5_\xbbv\xad\
+\xad\x13\x7f\x08%\x0a\x91W\x5cq\x85E\xe3\xf9\xe7\x9f\
+o\x91E\xa3\xda6\x1a\x93c{\x1e\x7f\xfcqn\xd7\
+\x10\x93k\x10\x09Yz\xd1\x84\x0f\xbd\xf3\xce;\xc3(\
+H\x9c\xf0r\xbd\xf2\xca+v\xd2\x1f\x7f\xfc\x11}\xfa\
+\xf4\xb1\xb9\x80\x04_\xb3f\x8d\xcd\x0a\xf5,r\x13\xec\
+up\xaaxK\x8b\xd9\xb8,\xa8\xeaP\x82V\x01\xa3\
+\x89\x85\x9e\xc2\x95\xc6\x91\x1bib\xb9\x94\x88Q\xefR\
+\xfc-\xb7\xdcbIV<\x22\xa8j\xb1\x8a\xedz\xbf\
+\x8a\xbbP\xf9\xbe`/\xc1e\x08\x09w\xf2\xc9'\xdb\
+vZ\xff\x05\xe4\x1b\xadC~.%\xc8\x18\x22T\xf5\
+U\xec\x97\xa2\xc4c\xea\xaf<\x87Fq\xd1u\x1d\xa6\
+\xcd\xfd]l\xfc&\x99\xf9JA\x82\x84\xe5~\xe6\x99\
+g\x92\x09\xc3\xa5\x97^j\xc9Fd$\xffT\xd1&\
+\xe3\xdak\xaf\xb5\x82\x08\x1d\x9a\x98.\x82\xa3\xe9\xf3\x8a\
+\x16\xe4\x11\xbb\x90\xcf>\xfb\xcc\xb6O\xa4\xd1\xb2\xac\x9e\
+\xcb\xca\xca\xacB\xe9J6\xa20lY\x12U\xbd\x8a\
+\x10\xc3\xb0k\xa3\x82P\xf0\xe5\x97_Z\xe5\x8ag\xe4\
+\xff*\x5c\xb8\xf5u\x8d\xa1\x22\xfe\x18:th\x92H\
+UGw\xb0\x88\x12!\xaa\xc8\x00\x22mq\x0c\xa3\x85\
+\xdd\xf7\x10\xe9y.\xe6\xfb\xc3\xdfz\xeb-\xb1\xb5Q\
+\x86%\x0d3\xfe\xdaNb^%\x16\xb2\xae,\x92(\
+]x&8g\xce\x9c\xa4\xa2D<\x22\xb6\xd3O?\
+\x1d$O\x8b\x00\x85C\xfao\x12\xbar\x8d6\x22\xb2\
+c\xe9\xc4V\xca\x141\x0a\x11m\xc5\xfc\xf6\xdbo\xf6\
+QB*\x05\x97\x90\x0a\xa9\xf4{\xac[\xb7\xce~\x93\
+k\x8al%\xb4\x8a\xa2\x90\x22\x80\x0c\xc3\x98o\xeb\xa4\
+\xbc\xf6\xbf\x110/H\xce\xdf6\x9f!J\x5c.Z\
+n\x04\xc9\xab\x81\x8d]\xb4\xa6Q\x5c&C\xdaA\x14\
+\x0e\x13\x0b\x10\x0a\x12E\x93\xc8\x0d\x12a,\x11&u\
+W\xd8SQ\xde 8\xb6\x15\xb3b\xc5\x0a\x9b\xc2j\
+a\xd7]w\x1d\x0e;\xec0\xebB\x12L\x96U\x98\
+%\x99:\x0c\xa3Fm\xa4d\x15\xf1\x0ewq\xed\xf3\
+x#W\x94\xd5\xe5n\x22L\xe5\x0a2^\x82\xbb\xd4\
+O\xf9\x86\xf6\x02w\xdey\xa7^m\xd6XRRb\
+\x9fite\x80\x0e\xe5\x5c\xaf<\xa0\x82\x90\xfb\xbe\xed\
+\xe7\xa3\x98Ra\xf9/\x8b\x11k\xcbR\xb2nB0\
+}\x90\xaf\x09\xaa\x0aU\x89\xa2\xd0\x22$h!*\xfa\
+._\xd6o\x8c\xe4\x0bGY\x5c:\x0fS\x05o\xfd\
+p!D\x09\x11\x5c\x94Q\xcc'\x096<\xfc\xf0\xc3\
+\xbf\xb2\xab\xc3\xefq\xb9\xd6\x07\x0c\xb92\x80\x90\xc06\
+FB\x91\x9f\x1cr\x8c\x11\xd1RQ\x86\x11\xc6\x195\
+j\x94\x11\xdf(\xf5\x1d1b\x04\xe8~F\xcaQ\xde\
+\x92P\x8a\xd6\xa5yY\x94\x19\xba\x18\xaa\x1b\x88\xd0\xb1\
+.\xc2\xc1\xc5\x1c\xba\x8b \xca\xe2\xd2dJ\x8e\xb4h\
+\xed\x0fHZFY\x95H\xeb\xb1\xc7\x1e\xb3\xec+\xf2\
+R\x12\x22\xe5\xdc\xcc\x8c\xf0~\x9e\x14\x89\xe9;u\xea\
+\x94\x84\xb3\x08GV$\x83\x87\xb9\x985\xc3\x86\x0ds\
+(\xb0x\xc6\xfa\xa2\x94'N8\xe7\x9cs\xcc\xec\xd9\
+\xb3\x15%*\x09\xe3\xbb\xc9\xd2\xe2\x11\x17I\xd9B\x5c\
+\xdcB$\x19*\x8e\xa7t\xaer\x92\xe6f\xba\xa8\x94\
+\xa4\x5c\xde\xe1\xda\xd73\x22\x84d$\x911#\x8d\xe1\
+\xfa\x9cDv\x98p/)[\xdb\xfb\xbb\xee\xba\xcb(\
+\xe20\xdc\xd6S\xde2\x85\xc1\x14j\x9b?W\xb4\x16\
+2\xae\xe1\x84\x0e-\xf7\x1b\x13\x91*\x86!MfD\
+BLA\xcd\x19g\x9ca\x95!n\x90\x15%\xa4\x18\
+9q\x16/t\xc8\xf2R\x88\x94\xc9\xe2\xa2\xb5\xbe?\
+\xeb\xac\xb3\xb0h\xd1\x22G\x96$\xf4\xa2\x5c`\x84,\
+\x1f\xa5b#\xca8\x89\xc0\x99\x94g\x16\x95=\x97.\
+\xa9~\x11\x0a\x14\xa3\x0bDii\xbbi\xa1\x95\xeb9\
+\xdf\x22\x91.\xd7\x15\x95a\x98\xaa\xff@\xc5\xbf\xa3\xc4\
+\x88r(\x7fw\xc8\xfc[\x8e=\xf6\xd8&\xa1/Q\
+\xc4\x1f\xbaD\x86r\x1f\xb6U\x04\xf4\xd9<@\x8b\x16\
+\xec\xa55Z!.K\xd2\x877u\xeb\xd6m\x85 \
+\xc8\xff1\x22g6\xfc\xee0\x1c\xc5I\x94q\xbaJ\
+\x8c\xe9l\x94\x03\xc5\x89\x86(\xfbE\x08\xc7(w\x92\
+QZ B\x05D\x18F\xe3\xf4\xc1fj{&\xfb\
+\xd60\x05\x8d\xb7\xfdd\xe5a\x88\xf2\x12\x9e\x9e\x1bn\
+\xb8\xc1?a\xc2\x84\x06\xce5M\x8b\xe5|\xb3\xc5C\
+,^\x92\xa4\x9b\x8c\xeda\x1f\xb7vz$\xd8\x9d|\
+\xffP\x19\x22\xefLEb\x8a<\x1d\xe8ZUJ\x85\
+\x89\xb6\xe8M7\xdd$\xeb\xfe\x8dYf\x858\x89\x08\
+\x88)\x89\x92L\x12\x5c\x88P\x0e\xc1\xf66A\xf2P\
+\xebA\xc2|+!Z@\x8bX\xdf\x12\x9c\x08\xb5f\
+vj\x11y\x91\xf1=\xcc\xa8\x14Cwp\x90\x22E\
+\x091\xae\x12\x22fd\xf2;\x97\xc8L<\xa2\x85\x1e\
+\x7f\xfc\xf1\xf8\xf8\xe3\x8f\xed\xaf\xcb\xac\xd3i\xc5\xa2\x82\
+\x82\x82j\xbaT\x0e-\x13\xa1\xc2\x1e j\xca\x09\xeb\
+\x1e\x13'N\xbc\x82d\xfa\x18\xd7\xb1CRS\xc1s\
+x\xa4\x95\xc9\xb0;\x99$\xf6\x13\xd9\xbb\x82\xa1\xf2j\
+\xa2-\xc09x\xea\x88\xa5\x22PZ7 XSI\
+\xc3\x88\x90\xef\xe4\xa2\xbc\xa7^\x7f\xfd\xf5\x0aW\xb3\xe8\
+\x9e\xd7\x93\x13J\xe7\xcd\x9b\xe7\xa6\xe2\xb5\x13\x8c\xb0\x8d\
+Ce8r\x15\x1a\x15g\x9f}6O/Y\xd8p\
+\x13;\x1cM\xbf4\xec`c>\xdf\xb3\xd8p\xa9P\
+\xc1\xbdA\x88\x96]\xc1\xa6+\xe9\xab\x13\x186\xe3\xb4\
+\xc2w\xf4\xe7*\x0e2\x81\xda~\x89BW\xd0\xa2>\
+\xe6\x0eV\x89\xec\x17'\xf4uv4\x8f\xc25q\xac\
+\x8b\xd9\xe6,\xc2\xf3\x1b\xbe\xb7&\x09\xfcH\x8b\xdc\xc7\
+w\x1b.\xf8\xccG\xab\x88G\xf8\xfcx\xbb\xfa\xff\xe6\
+\xd8\xe7\x10\xa9\xd3YW\xc6\xe7\xf3\x99\x5c\xf5\x92\x159\
+\xcf\x0e\xdeW\xdcv\xdbm\x97s=\xb3\x88\x8c\xaf\xd8\
+&\xc8\xfe\x93\x98[\xdcMt\x8d\xe2\x9a\xbb0\x19\xf2\
+*\x9c+\x93\xe4\xa6\x0f4\xac\xdc\xca\xfe\xfa;\x9e\x1a\
+\xdeF\xe8\x99;\xee\xb8#\xc6\x8b}\xcd[\x0cs\xe3\
+x\x1f\xcbx[\xc5\xbb\x0d\xb8\xb4\xa0\xb6\xcf)\xbcZ\
+\xf3\xd4V\x01$\xe4!\x0b\xdb[WK4\xe2\xbb\xc6\
+\xf10\xf3\xb4\x99(\xc7M~g=\xff\xc3\x89Il\
+TD\xc4\x89g\xdb]\xdf\x13\xe3\xb4\xbf\xb7\xeb#\xa5\
+\xdaq\xf5]\xf5\xbc.gDx\x90F\x98\xca\xe7*\
+\xba\x9d\xe1yC\x0d\x9f3\x14\xd2\xa6\x12\xae\xcdd\xe2\
+(\x13\x830\xa1\xc1z\xd3\xaf\xad\xb3NN\xf4#\xf0\
+\x81\x8a\x16g\x17\xce6n\xc6j\xb5\xb5\x82\xb5\xbb\xab\
+.\xd1F\x11G\xef\xc9\xc5iP\xbe\x1fL\xa0d\xbd\
+\xc6h\x1b\xdf\xd6i\x0c^\xed\xe7\xb2\xf5$j\xd5\xd9\
+\xf1\xd5G\xd7\x1f\x17N%\x0cf\x843\xdc\xc6\x7f\xa4\
+o\xff\x0b\xb3uU\xd07\xb3\xb2*\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00$F\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x0cMiCCPICC Prof\
+ile\x00\x00H\x89\x95W\x07XS\xc9\x16\x9e[\
+RI\x08\x10\x88\x80\x94\xd0\x9b \x22%\x80\x94\x10Z\
+\x00\xe9E\x10\x95\x90\x04\x08%\xc6\x84\xa0bG\x17W\
+p\xed\x22\x82eEWA\x14; b\xc3\xae,\x8a\
+\xdd\xb5,\x16TV\xd6\xc5u\xb1+oB\x00]\xf6\
+\x95\xef\xcd\xf7\xcd\x9d\xff\xfes\xe6\x9fs\xce\x9d\xb9\xf7\
+\x0e\x00\x8c\x0e\x81L\x96\x8bj\x01\x90'\xcd\x97\xc7\x86\
+\x04\xb0'$\xa7\xb0I]\x80\x004\x01\x13\xd0\x00S\
+ T\xc8\xb8\xd1\xd1\x11\x00\x96\xc1\xf6\xef\xe5\xcdM\x80\
+\xa8\xdak\x8e*\xad\x7f\xf6\xff\xd7\xa2-\x12+\x84\x00\
+ \xd1\x10\xa7\x8b\x14\xc2<\x88\x0f\x02\x807\x0be\xf2\
+|\x00\x882\xc8[L\xcf\x97\xa9\xf0\x1a\x88u\xe5\xd0\
+A\x88\xabU8S\x8d\x9bU8]\x8d\xaf\xf4\xdb\xc4\
+\xc7\xf2 ~\x02\x00\x99&\x10\xc83\x01\xd0\xec\x81<\
+\xbb@\x98\x09u\x180Z\xe0,\x15I\xa4\x10\xfbC\
+\xec\x9b\x977U\x04\xf1|\x88m\xa1\x0d\x9c\x93\xa1\xd2\
+\xe7\xa4\x7f\xa3\x93\xf97\xcd\xf4!M\x81 s\x08\xab\
+c\xe9/\xe4@\x89B\x96+\x98\xf9\x7f\xa6\xe3\x7f\x97\
+\xbc\x5c\xe5\xe0\x1c6\xb0\xd2\xb2\xe4\xa1\xb1\xaa\x98a\xde\
+\x9e\xe4L\x0dWa\x1a\xc4\xef\xa4\xe9\x91Q\x10\xeb\x00\
+\x80\xe2\x12Q\xbf\xbd\x0a\xb3\xb2\x94\xa1\x09j{\xd4V\
+\xa8\xe0\xc1\x9c\x01\x16\xc4\xe3\x14\xb9q\xfc\x01>V$\
+\x08\x0c\x87\xd8\x08\xe2\x0cind\xc4\x80MQ\x86$\
+Xe\x03\xf3\x87\x96K\xf2\xf9\xf1\x10\xebC\x5c-V\
+\x04\xc5\x0d\xd8\x9c\x90O\x8d\x1d\x9c\xf7f\x86\x9c\xc7\x1d\
+\xe0\x9f\x0b\xe4\xfd>\xa8\xf4\xbf(s\x12\xb8j}L\
+'K\xcc\x1f\xd0\xc7\x9c\x0a\xb3\xe2\x93 \xa6B\x1cX\
+ I\x8c\x84X\x13\xe2HEN\x5c\xf8\x80Mja\
+\x16/r\xd0F\xae\x8cU\xc5b\x09\xb1\x5c,\x0d\x09\
+P\xebce\x19\xf2\xe0\xd8\x01\xfb\x9dy\x8a\xc1\xd8\xb1\
+\x13Y\x12~\xe4\x00\xbe\x9a\x9f\x15\x1f\xaa\xce\x15\xf6D\
+(\xe8\xf7\x1f\xc6\x82\xf5\x88\xa5\xdc\x84A\x1d\xb1bB\
+\xc4`,\x22q`\x90:v\x9c,\x96&\xc4\xa9y\
+\x5c_\x96\x1f\x10\xab\x1e\x8b\xdb\xcbr\xa3\x07\xec\xf1\x00\
+qn\x88\x8a7\x878^Q\x1078\xb6 \x1f.\
+N\xb5>^,\xcb\x8f\x8eW\xfb\x89Wd\x0b\xc2\xa2\
+\xd5\xfe\xe0{A\x04\xe0\x81@\xc0\x06JX\xd3\xc1T\
+\x90\x0d$m\xdd\x0d\xdd\xf0N\xdd\x13\x0c\x04@\x0e2\
+\x81\x188\x0e0\x83#\x92\xfa{\xa4\xf0\x1a\x07\x0a\xc1\
+\xef\x10\x89\x81bh\x5c@\x7f\xaf\x18\x14@\xfe\xf30\
+V\xc5I\x868\xf5\xd5\x11d\x0c\xf4\xa9Tr\xc0S\
+\x88\xf3@8\xc8\x85\xf7\xca~%\xe9\x90\x07\x89\xe0\x09\
+d$\xff\xf0H\x00\xab\x10\xc6\x90\x0b\xab\xaa\xff\xdf\xf3\
+\x83\xecW\x86\x0b\x99\x88\x01F98#\x9b1hI\
+\x0c\x22\x06\x12C\x89\xc1D;\xdc\x10\xf7\xc5\xbd\xf1\x08\
+x\xf5\x87\xd5\x05\xe7\xe0\x9e\x83q|\xb5'<%\xb4\
+\x13\x1e\x11n\x10:\x08w\xa6H\x8a\xe4\xc3\xbc\x1c\x0f\
+:\xa0~\xf0@~\xd2\xbf\xcd\x0fn\x0d5\xdd\xf0\x00\
+\xdc\x07\xaaCe\x9c\x85\x1b\x02G\xdc\x15\xce\xc3\xc5\xfd\
+\xe0\xccn\x90\xe5\x0d\xf8\xad\xca\x0a{\x98\xf6\xdf\x22\xf8\
+\xe6\x09\x0d\xd8Q\x9c)(e\x04\xc5\x9fb;|\xa4\
+\xa6\xbd\xa6\xdb\x90\x8a*\xd7\xdf\xe6G\xedk\xfaP\xbe\
+yC=\xc3\xe7\xe7}\x93}\x11l\xc3\x87[b\xdf\
+c\x07\xb0s\xd8I\xec\x02\xd6\x8c5\x006v\x1ck\
+\xc4Z\xb1\xa3*<\xb4\xe2\x9e\xf4\xaf\xb8\xc1\xd9b\xfb\
+\xfd\xc9\x81:\xc3\xd7\xcc\xd7'\xab\xca\xa4\xc2\xb9\xd6\xb9\
+\xcb\xf9\x93\xba/_<#_\xb5\x19ySe3\xe5\
+\x92\xcc\xac|6\x17~1\xc4l\xbeT\xe84\x8a\xed\
+\xe2\xec\xe2\x06\x80\xea\xfb\xa3~\xbd\xbd\x8e\xe9\xff\xae \
+\xac\xd6\xaf\xdc\xc2_\x01\xf09\xde\xd7\xd7w\xe4+\x17\
+v\x1c\x80}\x1e\xf0\x95p\xf8+g\xcb\x81\x9f\x16\x0d\
+\x00\xce\x1f\x16*\xe5\x05j\x0eW]\x08\xf0\xcd\xc1\x80\
+\xbb\xcf\x00\x98\x00\x0b`\x0b\xe3q\x01\xee\xc0\x1b\xf8\x83\
+ \x10\x06\xa2@<H\x06\x93\xa1\xf7Yp\x9d\xcb\xc1\
+t0\x1b,\x00\xc5\xa0\x14\xac\x00kA\x05\xd8\x0c\xb6\
+\x82j\xb0\x1b\xec\x07\x0d\xa0\x19\x9c\x04g\xc1%p\x05\
+\xdc\x00w\xe1\xea\xe9\x04/@\x0fx\x03>\x22\x08B\
+B\xe8\x08\x131@L\x11+\xc4\x01qA8\x88/\
+\x12\x84D \xb1H2\x92\x86d\x22RD\x89\xccF\
+\x16\x22\xa5\xc8*\xa4\x02\xd9\x82\xd4 \xfb\x90\xc3\xc8I\
+\xe4\x02\xd2\x8e\xdcA\x1e\x22]\xc8\x9f\xc8\x07\x14Ci\
+\xa8.j\x8cZ\xa3\xa3Q\x0e\xcaE\xc3\xd1xt\x12\
+\x9a\x89NC\x0b\xd1E\xe82\xb4\x1c\xadBw\xa1\xf5\
+\xe8I\xf4\x12z\x03\xed@_\xa0\xbd\x18\xc040\x16\
+f\x869b\x1c\x8c\x87Ea)X\x06&\xc7\xe6b\
+%X\x19V\x85\xd5aM\xf09_\xc3:\xb0n\xec\
+=N\xc4\x998\x1bw\x84+8\x14O\xc0\x85\xf84\
+|.\xbe\x14\xaf\xc0\xab\xf1z\xfc4~\x0d\x7f\x88\xf7\
+\xe0_\x08t\x82\x11\xc1\x81\xe0E\xe0\x13&\x102\x09\
+\xd3\x09\xc5\x842\xc2v\xc2!\xc2\x19\xb8\x97:\x09o\
+\x88D\x22\x8bhC\xf4\x80{1\x99\x98M\x9cE\x5c\
+J\xdcH\xdcC<Al'>&\xf6\x92H$\x03\
+\x92\x03\xc9\x87\x14E\x12\x90\xf2I\xc5\xa4\xf5\xa4]\xa4\
+\xe3\xa4\xab\xa4N\xd2;\xb2\x06\xd9\x94\xecB\x0e&\xa7\
+\x90\xa5\xe4\x22r\x19y'\xf9\x18\xf9*\xf9\x19\xf9#\
+E\x8bbE\xf1\xa2DQD\x94\x99\x94\xe5\x94m\x94\
+&\xcaeJ'\xe5#U\x9bjC\xf5\xa1\xc6S\xb3\
+\xa9\x0b\xa8\xe5\xd4:\xea\x19\xea=\xeak\x0d\x0d\x0ds\
+\x0dO\x8d\x18\x0d\x89\xc6|\x8dr\x8d\xbd\x1a\xe75\x1e\
+j\xbc\xa7\xe9\xd0\xeci<Z*MI[F\xdbA\
+;A\xbbC{M\xa7\xd3\xad\xe9\xfe\xf4\x14z>}\
+\x19\xbd\x86~\x8a\xfe\x80\xfeN\x93\xa9\xe9\xa4\xc9\xd7\x14\
+i\xce\xd3\xac\xd4\xac\xd7\xbc\xaa\xf9\x92AaX1\xb8\
+\x8c\xc9\x8cBF\x19\xe3\x00\xe32\xa3[\x8b\xa2e\xad\
+\xc5\xd3\x12h\xcd\xd5\xaa\xd4:\xacuK\xabW\x9b\xa9\
+=F;J;O{\xa9\xf6N\xed\x0b\xda\xcfuH\
+:\xd6:A:\x22\x9dE:[uN\xe9<fb\
+L\x0b&\x8f)d.dnc\x9eav\xea\x12u\
+mt\xf9\xba\xd9\xba\xa5\xba\xbbu\xdbt{\xf4t\xf4\
+\x5c\xf5\x12\xf5f\xe8U\xea\x1d\xd5\xeb`a,k\x16\
+\x9f\x95\xcbZ\xce\xda\xcf\xba\xc9\xfa0\xc2x\x04w\x84\
+x\xc4\x92\x11u#\xae\x8ex\xab?R\xdf__\xac\
+_\xa2\xbfG\xff\x86\xfe\x07\x03\xb6A\x90A\x8e\xc1J\
+\x83\x06\x83\xfb\x86\xb8\xa1\xbda\x8c\xe1t\xc3M\x86g\
+\x0c\xbbG\xea\x8e\xf4\x1e)\x1cY2r\xff\xc8_\x8c\
+P#{\xa3X\xa3YF[\x8dZ\x8dz\x8dM\x8c\
+C\x8ce\xc6\xeb\x8dO\x19w\x9b\xb0L\xfcM\xb2M\
+\xd6\x98\x1c3\xe92e\x9a\xfa\x9aJL\xd7\x98\x1e7\
+\xfd\x8d\xad\xc7\xe6\xb2s\xd9\xe5\xec\xd3\xec\x1e3#\xb3\
+P3\xa5\xd9\x16\xb36\xb3\x8f\xe66\xe6\x09\xe6E\xe6\
+{\xcc\xef[P-8\x16\x19\x16k,Z,z,\
+M-\xc7[\xce\xb6\xac\xb5\xfc\xc5\x8ab\xc5\xb1\xca\xb2\
+Zgu\xce\xea\xad\xb5\x8du\x92\xf5b\xeb\x06\xeb\xe7\
+6\xfa6|\x9bB\x9bZ\x9b{\xb6t[?\xdbi\
+\xb6U\xb6\xd7\xed\x88v\x1c\xbb\x1c\xbb\x8dvW\xecQ\
+{7\xfb,\xfbJ\xfb\xcb\x0e\xa8\x83\xbb\x83\xc4a\xa3\
+C\xfb(\xc2(\xcfQ\xd2QU\xa3n9\xd2\x1c\xb9\
+\x8e\x05\x8e\xb5\x8e\x0f\x9dXN\x11NEN\x0dN/\
+G[\x8eN\x19\xbdr\xf4\xb9\xd1_\x9c\xdd\x9cs\x9d\
+\xb79\xdf\x1d\xa33&lL\xd1\x98\xa61\x7f\xba\xd8\
+\xbb\x08]*]\xae\x8f\xa5\x8f\x0d\x1e;ol\xe3\xd8\
+W\xae\x0e\xaeb\xd7M\xae\xb7\xdd\x98n\xe3\xdd\x16\xbb\
+\xb5\xb8}v\xf7p\x97\xbb\xd7\xb9wyXz\xa4y\
+l\xf0\xb8\xc5\xd1\xe5Ds\x96r\xce{\x12<\x03<\
+\xe7y6{\xbe\xf7r\xf7\xca\xf7\xda\xef\xf5\x87\xb7\xa3\
+w\x8e\xf7N\xef\xe7\xe3l\xc6\x89\xc7m\x1b\xf7\xd8\xc7\
+\xdcG\xe0\xb3\xc5\xa7\xc3\x97\xed\x9b\xe6\xfb\xa3o\x87\x9f\
+\x99\x9f\xc0\xaf\xca\xef\x91\xbf\x85\xbf\xc8\x7f\xbb\xff3\xae\
+\x1d7\x9b\xbb\x8b\xfb2\xc09@\x1ep(\xe0-\xcf\
+\x8b7\x87w\x22\x10\x0b\x0c\x09,\x09l\x0b\xd2\x09J\
+\x08\xaa\x08z\x10l\x1e\x9c\x19\x5c\x1b\xdc\x13\xe2\x162\
++\xe4D(!4<te\xe8-\xbe1_\xc8\xaf\
+\xe1\xf7\x84y\x84\xcd\x09;\x1dN\x0b\x8f\x0b\xaf\x08\x7f\
+\x14a\x1f!\x8fh\x1a\x8f\x8e\x0f\x1b\xbfz\xfc\xbdH\
+\xabHidC\x14\x88\xe2G\xad\x8e\xba\x1fm\x13=\
+-\xfaH\x0c1&:\xa62\xe6i\xec\x98\xd8\xd9\xb1\
+\xe7\xe2\x98qS\xe2v\xc6\xbd\x89\x0f\x88_\x1e\x7f7\
+\xc16A\x99\xd0\x92\xc8HLM\xacI|\x9b\x14\x98\
+\xb4*\xa9c\xc2\xe8\x09s&\x5cJ6L\x96$7\
+\xa6\x90R\x12S\xb6\xa7\xf4N\x0c\x9a\xb8vbg\xaa\
+[jq\xea\xcdI6\x93fL\xba0\xd9pr\xee\
+\xe4\xa3S\x18S\x04S\x0e\xa4\x11\xd2\x92\xd2v\xa6}\
+\x12D\x09\xaa\x04\xbd\xe9\xfc\xf4\x0d\xe9=B\x9ep\x9d\
+\xf0\x85\xc8_\xb4F\xd4%\xf6\x11\xaf\x12?\xcb\xf0\xc9\
+X\x95\xf1<\xd3'sufW\x96_VYV\xb7\
+\x84'\xa9\x90\xbc\xca\x0e\xcd\xde\x9c\xfd6'*gG\
+N_nR\xee\x9e<r^Z\xdea\xa9\x8e4G\
+zz\xaa\xc9\xd4\x19S\xdbe\x0e\xb2bY\xc74\xaf\
+ik\xa7\xf5\xc8\xc3\xe5\xdb\x15\x88b\x92\xa21_\x17\
+\xfe\xe8\xb7*m\x95\xdf)\x1f\x16\xf8\x16T\x16\xbc\x9b\
+\x9e8\xfd\xc0\x0c\xed\x19\xd2\x19\xad3\xedg.\x99\xf9\
+\xac0\xb8\xf0\xa7Y\xf8,\xe1\xac\x96\xd9f\xb3\x17\xcc\
+~8\x87;g\xcb\x5cdn\xfa\xdc\x96y\x16\xf3\x16\
+\xcd\xeb\x9c\x1f2\xbfz\x01uA\xce\x82\x9f\x8b\x9c\x8b\
+V\x15\xfd\xb50ia\xd3\x22\xe3E\xf3\x17=\xfe.\
+\xe4\xbb\xdab\xcdby\xf1\xad\xc5\xde\x8b7\x7f\x8f\x7f\
+/\xf9\xbem\xc9\xd8%\xeb\x97|)\x11\x95\x5c,u\
+.-+\xfd\xb4T\xb8\xf4\xe2\x0fc~(\xff\xa1o\
+Y\xc6\xb2\xb6\xe5\xee\xcb7\xad \xae\x90\xae\xb8\xb9\xd2\
+oe\xf5*\xedU\x85\xab\x1e\xaf\x1e\xbf\xba~\x0d{\
+M\xc9\x9a\xbf\xd6NY{\xa1\xcc\xb5l\xf3:\xea:\
+\xe5\xba\x8e\xf2\x88\xf2\xc6\xf5\x96\xebW\xac\xffT\x91U\
+q\xa32\xa0r\xcf\x06\xa3\x0dK6\xbc\xdd(\xdax\
+u\x93\xff\xa6\xba\xcd\xc6\x9bK7\x7f\xf8Q\xf2\xe3\xed\
+-![\xea\xab\xac\xab\xca\xb6\x12\xb7\x16l}\xba-\
+q\xdb\xb9\x9f8?\xd5l7\xdc^\xba\xfd\xf3\x0e\xe9\
+\x8e\x8e\xea\xd8\xea\xd35\x1e55;\x8dv.\xafE\
+k\x95\xb5]\xbbRw]\xd9\x1d\xb8\xbb\xb1\xce\xb1n\
+\xcb\x1e\xd6\x9e\xd2\xbd`\xafr\xefo\xfb\xd2\xf6\xdd\xdc\
+\x1f\xbe\xbf\xe5\x00\xe7@\xddA\xab\x83\x1b\x0e1\x0f\x95\
+\xd4#\xf53\xeb{\x1a\xb2\x1a:\x1a\x93\x1b\xdb\x0f\x87\
+\x1dni\xf2n:t\xc4\xe9\xc8\x8ef\xb3\xe6\xca\xa3\
+zG\x97\x1f\xa3\x1e[t\xac\xefx\xe1\xf1\xde\x13\xb2\
+\x13\xdd'3O>n\x99\xd2r\xf7\xd4\x84S\xd7O\
+\xc7\x9cn;\x13~\xe6\xfc\xd9\xe0\xb3\xa7\xceq\xcf\x1d\
+?\xefs\xbe\xf9\x82\xd7\x85\xc3\x179\x17\x1b.\xb9_\
+\xaaouk=\xf4\xb3\xdb\xcf\x87\xda\xdc\xdb\xea/{\
+\x5cn\xbc\xe2y\xa5\xa9}\x5c\xfb\xb1\xab~WO^\
+\x0b\xbcv\xf6:\xff\xfa\xa5\x1b\x917\xdao&\xdc\xbc\
+}+\xf5V\xc7m\xd1\xed\xe7wr\xef\xbc\xfa\xa5\xe0\
+\x97\x8fw\xe7\xdf#\xdc+\xb9\xafu\xbf\xec\x81\xd1\x83\
+\xaa_\xed~\xdd\xd3\xe1\xdeq\xf4a\xe0\xc3\xd6Gq\
+\x8f\xee>\x16>~\xf1D\xf1\xe4S\xe7\xa2\xa7\xf4\xa7\
+e\xcfL\x9f\xd5<wy\xde\xdc\x15\xdcu\xe5\xb7\x89\
+\xbfu\xbe\x90\xbd\xf8\xd8]\xfc\xbb\xf6\xef\x1b^\xda\xbe\
+<\xf8\x87\xff\x1f\xad=\x13z:_\xc9_\xf5\xfd\xb9\
+\xf4\xb5\xc1\xeb\x1d\x7f\xb9\xfe\xd5\xd2\x1b\xdd\xfb\xe0M\xde\
+\x9b\x8foK\xde\x19\xbc\xab~\xcfy\x7f\xeeC\xd2\x87\
+g\x1f\xa7\x7f\x22}*\xffl\xf7\xb9\xe9K\xf8\x97{\
+}y}}2\x81\x5c\xd0\xff+\x80\x01\xd5\xd1&\x03\
+\x80?w\x00@O\x06\x80\x09\xcf\x8d\xd4\x89\xea\xf3a\
+\x7fA\xd4g\xda~\x04\xfe\x13V\x9f!\xfb\x8b;\x00\
+u\xf0\x9f>\xa6\x1b\xfe\xdd\xdc\x02`\xef6\x00\xac\xa1\
+>#\x15\x80h:\x00\xf1\x9e\x00\x1d;v\xa8\x0e\x9e\
+\xe5\xfa\xcf\x9d\xaaB\x84g\x83\x1f'}N\xcfK\x07\
+\xff\xa6\xa8\xcf\xa4\xdf\xf8=\xbc\x05*UW0\xbc\xfd\
+\x17\xee#\x83\x06~\xb4ao\x00\x00\x00xeXI\
+fMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\x00\x03\x00\
+\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00R\x01\
+(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\x00\x04\x00\
+\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00H\x00\
+\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x02\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xfa\xa3\xa7\x01\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x02\x04iTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22\x0a  \
+          xmlns:\
+exif=\x22http://ns.\
+adobe.com/exif/1\
+.0/\x22>\x0a         <\
+tiff:Orientation\
+>1</tiff:Orienta\
+tion>\x0a         <\
+exif:PixelXDimen\
+sion>584</exif:P\
+ixelXDimension>\x0a\
+         <exif:P\
+ixelYDimension>5\
+64</exif:PixelYD\
+imension>\x0a      \
+</rdf:Descriptio\
+n>\x0a   </rdf:RDF>\
+\x0a</x:xmpmeta>\x0a\x9a$\
+\x8a'\x00\x00\x15\x0bIDATx\x01\xcd[y\x8c\
+\xdc\xd5}\xff\xcc\xcco\xee\xd9{\xd7\xc7\xfa\xc0\xb7\xc1\
+8@\xb9\x0a\xb1i \xa4\xa2V\x80&U\xa2\x90\x06\
+\x9aFM\x1b\x11\x12*\x8azHi%Z5\xe2\x8f\
+Hm\x0eUU\x9b\xa0\x1c\x8a\x04\x8d\xa2T\x80\xa2\xa4\
+\xa98CCL\x1c\xc0e9l6>\xb0w\xbd6\
+\xde]vgg\xe7\x9e\xe9\xe7\xf3\xde\xef\xed\xfcvv\
+g=\xf6\xae\xa5\xbe\xdd\xdf\xef\xf7\xee\xf7>\xdf\xeb\x9d\
+\x13\xea\xee\xee\xaec\x11W\xaf\xd7\xa1'\x14\x0a\xc1\xf3\
+<\xf3\x84\xc3a\x13V\xdc\xff'\xe7\xfa\xe9\xfa\x5c\xab\
+\xd5P\xa9T\xcc\xe3\xd2Z\xf5\xd7[,\xc1\x15J&\
+\x93\x88\xc5b\x88D\x22\x8be[\x918\x92y\xae\x9e\
+\x10V\x96\xb0\xd5j\x15\xa5R\x09\xc5b\x11\xf2/\xc6\
+\xb8\x05\x04\x10\xf5\xe2\xf18R\xa9\x14\xc4q\x11Cq\
+\xfa\xae\xac\x93t\x85\x11\x09\xc7Y\xad\x80\xd7Q\xad\x95\
+\xd9N\xc5\x0f/\xaf5\x81U\xff\xc5D\xe1\xc9\xe7\xf3\
+(\x14\x0as\x12\xec\xf0\xcc#\x80\x80\xa6\xd3i$\x12\
+\x09\x03XT\x93Se\x8bQ\xef\xc2\xbbXG8\x14\
+S\xc5\x98-\x8d\xa0\x5c\xcd\xc1\x0b{H\xc660>\
+\x8ej\xbdD\x92,_\x1a\x84GN\x84\x10.\xa9\xf2\
+\xcc\xcc\x8c\x89\x13\x1e\x11!\xac\x90\x02\xca\x9c\xc9d\x0c\
+\xc5\x04\x5c\xe1\x95\x07N>\xd7k\x86\xeb5r\xfa\xe8\
+\xf80\xde\x9d\xcd!\xee\xf5#[\xaa\xe0\xd8\xbbGQ\
+\xa9\xe5\x11\x09E)\x0f\xb6\xf3\xa6\xb7\x17\xf8r\xfd\x17\
+Pa\x92$tvv\x1a\xe0\x0e\xb7\xa7LJt\xa2\
+\x22\xe3\xa1\xb8\x8b\xe1\x04>\x1aI\xa1T\xcd\xe2\xc4\xe8\
+(\xf6\xdd\xf89\x5cw\xf9\x9d\xe8H\xf5\x22_\xcca\
+h\xf8\x19\xfc`\xff\x97\xb1\xa5g;\xc2u\x11ae\
+\xd4\xc1\x81\x15\xceh4j\x18\x9d\xcdf\x8dm\xf3D\
+\x1d\x89\x86\x08\xe0\xb8~\xb1\xc0\xc7\xbc\x0cE~\x0c\xa3\
+''q\xcf\xed\x0f\xe3\x96\xeb\xefA*\xd1\xc1v\xab\
+\x14\xd3\x086\xaf\xbb\x02\xa9X?\xbe\xf3\xe4\x03\xb8t\
+\xfbo1\xef\xf8\x0a(B\x03\x8d\x18+\x8c\x92\x04\x19\
+G=\x11Z\xf9\x87\xa4\x1f\xb2\xf4\x22\xc6\xc5\xe0\xbe,\
+}<\xda\x89\xf7\xf2o\xe0\xf4\x99\x02\xee\xfd\xd8\xbf\xe2\
+\xe6\xeb\xee\xa6*DP \xe7e\xfcJ\xe5\x82\xe9\xc3\
+@\xe7e\x98\x9a,\xe3\xf5\xe9\xc7\xd1\x1f\xdbJ\x95\xc8\
+\xb2OFS\x1bHV\xc0'\xbc\x1a\x1d\x22\x04\xff\x90\
+,\xfe\xc5\x01\xaf\x91#\x84\x04\xc1\x8fN\xbd\x8e\xa9\x22\
+\xf0\xe0\xc7\x1f\xc5\x0dW\xfc>\xd5\xae\xcc\xa7B\xd0Q\
+\x1a\xbe\xb0\x91\x00j*P\x8b\xa0/\xb1\x1b\x13\x93\x87\
+p2\xfb?\xe8\x8ao!\x11fH\x84\x95\x1d\x8ae\
+\x18%\x0da\x8d\xf3\x17\xc3\x89\xeb!D\x0c\xe7\x0f\x8f\
+\x0d!\x13\xed\xc2\xdf}\xe2\xc7\xb8\xf6\xf2}\xe4v\xde\
+\x18C\x89\xbd\x86?\xe78p\x91^\x15t\xa4{\xb1\
+\xef\xea\xbf7\xd1\x85\xca\x19\xda\x0d\x19\xae\x95\xb3\x07\xae\
+=\xd9\x83\xf0\xc5\x98\xe4\x18KOK\x1e\x8b\xa6qx\
+\xf85\xec\x1a\xbc\x0e\x7fq\xd7\x93\xb8|\xdb^\x8a\xbc\
+\x86!\x0d\xab\xad\xc4:L\x8e\x17\xb0\xa6w\x1b\xfeh\
+\xcf\x8fp\xe2\xcc)\xe6\xf5(!q\x92j\xf9#\x83\
+\x03/\x89\x17vJ\x82\x9d\xec\xb8\x84\xe5~\xeb\xf5*\
+\x8dj\x82O\x9c\xe0\x87\xb0\xe7\xda;q\xdf'\xfe\x0d\
+\xdb6]\x85By\x1a!\xb6\xb7\x94\x9d\xa9V\xd9\xb1\
+0G\xa6z\x11;\xd6\xbf\x1f\xf7\xdc\xfc5\x0c\x1f{\
+\x0d\x09\xaf\x87]kH\xcbr\xfb\xa9\xf2\xc2\x1e\xe1Z\
+\xe0\xa1\xa5:t>\x0d\xd5\x08>\x1e\xcd\xb0H\x1d\xc3\
+\xbf9\x84\x0f\x7f\xf0\xb3\xb8\xe7\xce\x87\xb0\xba\x7f\x13f\
+g9\xecp\xb2\xb3\x14\x06\x8d\xbe\x85\xd9\x1aj\x94\xf6\
+\x08\xb3JH\x06\xfb/\xa5\xa7\x8a_\x1e\xfeO\x0c\xf6\
+\xecD\xb1\xf2\x9e\x91\x88\xf3\xe9W\xab\xbc\xc2=o&\
+\xd8*c;\xf1\x12\xfbd\xac\x13\xc5\xf2\x0c\x8e\x1f\x7f\
+\x07w\x7f\xf4op\xe7\xad\xf7\x22\x9d\xe8\xc1Ln\x1a\
+\xd1X\x14\xd52\xc1\x11\x14\xe9\xb4\xa8\xa3MB\xb9H\
+\x09\xf0\xa8\x22\x94\x02\x84j\x88y1|\xe8\xda\xcfc\
+t\xf2 \x86\xcf>\x87\x0d]\x1a\x1eO\xdb\x99\xe4R\
+\xd4\x5c\xb4\x85\x85\x91\xad\x14qa\xce%b\xa4OQ\
+/\x89\xec\xeci\x03\xfe\x0b\x7f\xfc\x15\xdcu\xc7\x03\xe8\
+\xec\xe86\x04\x89Fc\x86\x9b\xa1\x88\xe6\xe7\x02\xb6\xb0\
+2q\xbf\x98\xe7\x9a\x83D\x08\x93\x00\x94N\x1a\xa80\
+\xc7\x85\x12\xba:\xfa\xf1\xf1\x0f<\x8c\x02\x097[:\
+\xc3\x99c7j\xf52+Y\xa4\xa2\x85U/\x19\xb3\
+\x22\x04\x905/W\xf285:\x8e/\xdd\xffM|\
+\xe4\xb6?\xe5d#\x81\x12\xe3\x04\xde\x80\x11 \x82\xb7\
+\xcf\xc2>\x89\xfb\x12\x7f\x81\x17\xf7]\xbe\x08\x89 \xa3\
+\xb8n\xf5N<x\x07\x8d\xe2;#L\x8br\xed\xc0\
+\xf5\xca\x0a\x18\xc5\x15!\x80\x17\x89\xe1\x9dwN\xe0o\
+\xff\xfc\xdf\xb1\xef\xd6O\x91sZ\xd9\x159\x0aD\x09\
+\x86\xc3![\x11(\xfb\xb5\x84\x082O\xdc/\x15-\
+\xf7#\x92\x12\x86\x95\xd7\x12\x8e\x83)\xe3\xaa$\xc2\xae\
+-7\xe1O>\xfaU\x1a\xd7\x83H\xc4h\x14%.\
+\xcbt\xcb&\x80\xb8?\x99=\x86\xeb\xaf\xbe\x05\xb7\xec\
+\xbd\x93\x5c\xa9\xd0\x82W\xcc\x9c\xdb\x82\xf0\xc59\x00\xc8\
+\x10\x22 \xbd\xd4 \x14g\xb92#\xd09\x22q\x8a\
+ \x95\xd1\xfcG\xd2 \x22q\x96\x84\xf7_\xf91\xdc\
+~\xf3}x\xf3\xe8\x01$\xe3\xfd\x9c\x1f\xb40(m\
+\x12f\x99\x04 w(\x8e\xe3g\x8a\xb8j\xf7^\xa4\
+8\xa5\xae\xd6J\x04\xef\x11\x88\x05$P\x06\x00[\x9a\
+\x03\xe7\x8b\xb8\xfah\xb9Oa&\x0ec\xfc\x08T\xf3\
+#\xab\x06\xf4\x1bi`\x1dT\x85:'IR\xad}\
+{\xee\xc3\xa5\x9b\xaeD\xae0\x06\x8f\x8b\xab%\x87\x96\
+s\x10bY\x04P\xe7\xedl\x0eX3\xb0\xce\x007\
+\x22,\xb0\x06\xb8\xcf=\x86%\xce\xf3\xd5@\xe8m\xef\
+J\x05\x9f\xfb\x06l\x03\xbc\xad\xdf\x97 \x12E\xf6@\
+\x04\xee\xebY\x8b\xdbn\xb8\x1f'O\x8cq\xe4\xe96\
+\xb3\xcas\xe0l\x99\xbc\xeca\xd0\x8a&\xb0z\xd5:\
+N~8\xc9\xf1\xc5Ub]7\xa0-\x114\xfc\x85\
+)\x15\xfaj\xfc5\xe0h+*\x1c\xf6\xaa\x15\x7f\xe8\
+3\x04\xf5\xd5\xc0\xf9\xa5\x02\x8e0\xe6\xcb686\xac\
+\xea\xdd\xd0\x12\xd4\xf9$,\x8f\x00\x02\xe9\x1b\xa2\xfe\xfe\
+\x01\xa3\xaf\x92\x80ZM\x5c\xe3j\x80=\xaf\x9b\xaf\x95\
+\x00F3\x9e\xe9\x8c\x93:D\xea!\x14\x08^\xceJ\
+\x88\xb8o\x01\x1b\xb51\xfa\xef\xd2,\xd1\x0c\xe1H\xe8\
+\x88\xc7D:;\x12\xb0\xe2\x0bt\xcb#\x00\xdb5\xcb\
+\xd8$\xd0\xd3\xdd\xcb.p\x18#\x01\xc4\xdez\xcdY\
+\x7f+\xd2V\xff\x19g\x93\xed\x97\xc4\xe0\x82\xd0\xd7y\
+?\x9f\xd2%%\x22\x84y\xac\x0a\x988\x93\xa6p\xc8\
+\x18Yaf\xd4\xb2\x1c\x9b\xb8p\xa7\x05\xcd\xe4\xf4I\
+\xfc\xf6\x15\x1f4[M\x9a\xb9I\x02\xa8\xaa\x86\x10A\
+\xbdg\x9f)\xca\xbex3\xdd\xa9J\x8d\x842\xdcV\
+\x9a\xf2(\xcd\xcfg\xca\x98\xbc\x8a'pVl\x88B\
+\xe6\xc78\xbf\x90\xabQ\x02\x973\x95g\xf5\x17\xee\xb4\
+\x8e\x9f\x9a\xa8`\xd3\xc6\x1df\x17\xd9I\x80\xb5\xe0\x16\
+\xac@\x18\xee\xf9@\x04\xd2\x01T\xcb\xd2 \xa5\x8b\x95\
+\x0e\xbc\x01i\xf2\xfbu\xb0\x12['\xf3\x10\xbc\xf2k\
+4\xd0\xea\xb9R-\xb1\xb0*\xb80wA%5\xf5\
+\x95\x91\x0bkqC\xb7~p\x0bER\xbb\xbcT\x01\
+q\x8a\xb5\x1a\xa0\xa6\xe3\xbe_\x5c5\x8f\x0b\xb3 A\
+\xcb9i\xb0e\x14V\x1e[\x8f\x91\x0e\xd5\xe9\xdb\x03\
+\x93\x976$\x99La\xe3\xfa\xf5\x9cjg)Yv\
+7\xcb\xd6v~\xef\xf3&\x80\xc0\xcb\xa9\xb3\x1a\x96\xe4\
+\xb6m\xdd\x8cLG\x9c\xc6\xaf\xa1\xf7sD\x10\xc7\x05\
+\xa8\xd5\xa3\xf4\xb9GD\xb2aS\xde\x10\xd0\x11\x82\xf1\
+fhU\x1e\x12 \x91\xc4%k\xaf\xc6\xd9\xecq\xf6\
+#F\x86\x88)\xf61\x9dj\xf3u^\x04p\xe0U\
+\xb7\xfc\xdcd5\xee\xf4\xc9\x18\xa6\xa7\x0a\xe8\xe8\xe2\xa6\
+\x05\xe3\x0d\x08q\xcd\x00\x10\xa0\x06\xb09?K6\xd2\
+-hI\x84+\xeb\x08a\xc3\x8c7\xf5\xb1\x0c\x87N\
+M\xb2\x12\x22\xc0\xe0.\xccN\x82;F:\x5c\xb1\x8c\
+Q\x87\x82\xfdTx)\xd76\x01\x16V\x1a\xc6l\xf1\
+$.\xdd\xba\x17/\xfes\x12\x8f}\xeb\x10\xc6Fg\
+\x90\xceh;\xdb:u\xde\x81r_\x07LH\x8d\xae\
+k\xd4P\xb69\xf0\x04)\xbf!\x1e\x09\xd7$9\x8e\
+hZ^oZ\x7f\x99)\xab\xcd\x17\xf2\xde\xf8\xddk\
+a\x7f]\xca\xfco[\x04XP\x19\xdb\x0a\xd5c\xc8\
+\xd7\xa6\xb1&\xf2a\xf4\xed\xee\xc5\xcf\xbf5\x81\xef|\
+e\x18G\xde\x9e\xe0\x94\xd8kH\x02\x919p\xf2\xc8\
+\xeft_\x04\xd0\xc6\x87\xdc\x9cd8B\x04\xbe\x1a=\
+D\x14\xa7\x16\xa6\x1c#6m\xb0\x040\xeb\x01J\xde\
+\x5c\xc5\xa6\xc6\xf6^fGh\xa9\xac\x0b\xc03\xb3\x9a\
+\xaa\xa1\x80xh\x00\xdb\xd3\x9f\xe5^@\x0c}\xdb\x22\
+\x18{\xae\x827\x86\xa6\xb0qw\x1c\x03\xab\xd3\x5c\xde\
+Z\x1d\xd1<_\xcb]Y|\xd9\x09}\xb5\x86\x11\x97\
+\xcb%\xaaR\x993\xc1\xa8\xe5\xb68l\x0d\x9eU!\
+\xe3\x97\xee\xcb\x08\x1a\x1b\xe0\x08\x01\x1ewu`b\xea\
+\x0c~\xf1\xf2O8\x15\xbf\xc4,\xc9E\xc8\xa0k\x0e\
+7\xa7\xb5%\x01\xc1B\x22H\x08<l\xac\x8db}\
+\xfc\x93Hz}<\x86.\xa3\xf0^\x1d\xab\xf7z(\
+\x8c\xd6\xf1\xbd\x7f<Fu\xc8\x1aI\xa8q\x8f\xcfZ\
+u\xd6b\xb8\xaa\x97\xf5\x8bi\xd1x\xa3\xc3\xea\xbby\
+\xd4 =6l\xf3\xbb4\xa3\x02R\x9bp\x0d\xa9d\
+\x1a\xb7\xfd\xce'\xa1\xdd\xf4t\xb2\x8bC\x22\xf7\xdd\x9d\
+x\xa9\x0e\xba\xc5\x18hS\xec;\xbcT\x86\xe64\x17\
+\xd6\x927\xca\xf2\xab\x13\xd7S\x1a4\x90\xf3\x9f\xa4,\
+L\xd5\xd1\xb3;\x82\xd97k\xf8\xd1\xb7\x8fs\x07\xb8\
+\x0c/\xcaU\x1c\xb3\xc81\x9bq\xfa\x0a\x90f\x8b\xb1\
+\xb8\xbfI\xea'*\xde\x81w\x05l\x9c-\xa3v\x8c\
+\x94\xf0\xab~\x5c\xba\xedj\xdc\xf6\x81?\xc4+C<\
+C\xc8\x0c\x9a\xf3\x06\xdbJ{o\xaa\x97\xdfrS~\
+\x07\xd6E\xbb\xb0\xe5\xfeQr\xff\x0bH{k\xfc\x93\
+\x5c+H\xea\x5cq\xba\x8e\xbe\x1b=\xbc\xf5d\x1e\xfb\
+\x7f>\x8axB\x07\x10\x1a\x19\x9a\xdaaPj\xa1\x99\
+\xa3\x17S\xc0\x02T{\xc1\x9c\xae\x98\xbe\xf6\xf1%\x83\
+\xaa\x22\xe2'\x13i\xfc\xc1\xbe{E\x0dn\xc8\xf2\x80\
+G\x1559\xd7\xf7\xa6h\x13\xb4=_,\xa5U\x1c\
+\x1bR\x07\x07\x137\xf1\x1d\xec\xaa- \x22\x94ru\
+\xac\xbd&\x8a\xa7\xbe>\x8e\xb3gsH$=C\x04\
+eW\xba\xb1\xf0sE)\x05I.\x90\xa8\x0fF\xbc\
+\x15\xef\xd2\xdc\xd7T\xed\x02\xb2@\x0dW\xa9\x94\xb0u\
+\xe3\xfb\xf0\xb9O}\x19\x07_\x7f\x11\x03\xdd[\xb8>\
+\xc91\x83\xcb\xdf\xc8\xbb\x98oQ\x15h\xa6X#\x1c\
+E\xa1>\x8c\xc1\xe8\xa7\xd1\x11\xdd\xc8N\xeb\x1c\x7fq\
+\x1a\x8a[\xdc\xc1\xc6\xab\xfb\xdf\xe5\x8e0\xfd\x95\x1a\xc5\
+\xb3J\xa3g\x9fJI\xe1:\xb4\x17\x10\xa5\x04T\x99\
+^bZ\xa5\xe2\x8e\xe6\x9b \x18+/\x9d\xf6\x1f2\
+Z\xaaU\xa5t)\xe7\x87\xf6\xdc\x85-\x9bw\xe2\xd4\
+\xd9!t\xa6\xd7\x9a}\x83 \xe0\x06\x86`,\xd5i\
+~pa\xa8QP\xc6\xcf\x03\x0d6\xd6%o\xe6\xb0\
+\xc4\xa1Nr\xd7\xc2\xf1\xe8\x0f\x9dWD\xf0\xca\xcf\xa6\
+0\x9b/q\xad\x103\xa7\xb2\x9d])t\xf5\xf0\xe9\
+M\xf2\x89#\xd3\x153\x13\xa8\xdeU)tt&\x99\
+/i\xce\x0f*\xdcB\xafV\x1b\xe2\xac\x96\x82\xe0\xa5\
+>\x1a]\x14W.\x97\xd1\xd5\xb9\x0a_\xbc\xfb_p\
+\xe64\x0f_(fa\xdd1\xf0\x89\xd6\xa2\x8b&\xda\
+\xdc\x0fX*C#\xcdC\xa9v\x18k\xbc;\xd0\x15\
+\xdb\xd6\xd6-\x0e\xcePq\xf6@\x15#'\xb2\xd8\xba\
+\xbd\x17\x13#\xefa6\x97\xc7\xf4\xf4,\xb2\xd9<\xb7\
+\xc1\xcb\x10\xd0:\xf7\x05\x22$\xa8\x0ei\xbb:3\xdc\
+N\xef\xe0\xb1y\xca\x10\xa0T.!&\xbd\x91\xce\x8b\
+\xeb\x9c\x06\x8b,\xfc\x18g\xe2\xe8/\x95x\x92\xb4\xe9\
+\x1a\xdc\xff\xe9o\xe0\xeb\xdf\xfd\x22v\xed\xbc\x06S\xb9\
+Qs\xd9\xc2a\x10A\x9am\xd1\x82\xfd\x80\xc5\xa9&\
+\xee\xc7)\xfe\x5c\xf8$\x7f\x0f^(\xc9\xad\xea\xbc\xa1\
+\xb4\xab\xbc\xf1\xf5{\xc6\x1ej\xac\xef\xd8\x1e\xc6\xfe\xa7\
+O\xe1\xf5\xa1!\xbc\xfd\xfa8r\x93%dO\x97Q\
+\x1c\xabr\xf4R\xbd\x04\xc5'\x9a\xe6}\x9e\x81\x08:\
+\xfa\xe3X\xb5\xae\x13\x9b\xb7\x0cb\xf3\xe6\x0d\x5cfw\
+\xa1@\x09\x92\x0aEc\x11c89\xae\xcc\xc9\x9e\x98\
+l\xa5A\xcb\xe2\x08n\xb8\xeav<\xf3\xd2\xa3\x18\x9b\
+|\x15\x1d\xc9\xf5\x8b\xce\x0d\x1a}\xc5\xd2'C\x0db\
+H\xf4\x7f\x83\xfe\xc8^\xf4\xc5wY\xddw\xe69X\
+\x9b\xbaeXc\x89\xa0\xf2\xd1L\x08\xa7\x0f\x170\xf4\
+\xcc(N\x9f\xcd\xa3S{\xfa\xbd!\xa47\xf2\xbc@\
+g\x00\xa2\x00\x9f\x1aw\x86*<\x189s0\x8f\x91\
+\x033\x18J\x8ea\xd3\x0dGp\xed\x8d;\xb1s\x07\
+%\xae\x1c\xa6\xfd(\x93\x08\x1e%\x83ET\x8eN\x04\
+\xd0p*)\xaa1\xc1\x9c\x19\xf0\xc8]\xdb\xe8\xa6b\
+C*?\xb3)1\xff\xb5@\x02\xe6'\xdbP\x08\x9a\
+\xf6VpY\xe6#\x88\x86;P\xa9\x93\xfb\xf3\xccG\
+\x00\xb8/\x9bZ\xb1\xc9\x99\xb1>\x13\xc1\xe0U]\xf0\
+FH\xf1h\xc4\x18<'\xba\x06\x01\xf3y\x9c\x0fD\
+\x93a\xa4\xfa\xd9Y\x16-\xe6\xaa\x18~f\x12\xc7~\
+\xb1\x1f7\xdd=\x8e={\xaeA\x94\x17\xabD\x84\xe0\
+\xdc\xc2\x10\x80/\xb3\xabL\xe2\x0e\x1dz\x81s\x82\xe7\
+p\xd9\x8ekxR5\xd6BJM\xd7\xcc\xab\x0d\x02\
+h\x88\x9aA&\xbc\x01\xbd\xb1]\xec[\xf39\xbd\x03\
+O\xcdd\xdf\x0d\xf09\x22\xb0\x0d\xe1\x91\xc1\xa2\xf5,\
+fi\xe1\xb9\x8f\xa1N\x1b\x9e\x98\x97\xed\x8c\x936\x09\
+\xb7\xa2E\x8c\x81\xddI\xccr\xc3\xe5\xa7\x8f\xbc\x85|\
+\xae\x88[\x7f\xf7F\xdf@V\xc8i\xda\x05\xd6\xc3\x7f\
+S\xbf\x8c\xf2\xf8\xe4)|\xed\xb1\xbb\xb0zM\x0f\x0a\
+\xa5\xac\xad\xb8\xe9\xadv\x82v`\xd1ap~\x19\x9d\
+\xcf\x8d!\x15\xde\xce\xe3\xa8\x14\x89\xc1\x0b\x87\xb6\xfb6\
+\x9b\x01\xeb\x837\x9b\x9dj@\xb35\x11\xc3\xd8.\xb3\
+\x90Q\x91ys\x00\xa1\x0c:\x85\x95\xc7\xff\x8a`%\
+\xaaD\xa2\xdb\xc3\x9a\xed)<\xfb\xd8Q<\xfb\xccK\
+f9\x5c\xe7\xd6\xb2\xa6\xd8V\xf7I26\xaf\x11\xe3\
+\xa9\x17\x1fEv\x02\xe8\xeb\xdc\x8abi\x8au\x9ds\
+\x90\x9b'\xc7\xc1\xee\x04\xfc\xdc\xe7\xc3 r\xb5W\xac\
+\xe1c\xa81\xdbb\xcbf\x0a'p2BM\xe0E\
+\x04>Z\xc8X=\x0dT{.\xafO\x8c\x0a\x8f\xcc\
+4qZ\xbb#\x8d\xa7\xbf?\x8cW^\x1d\xe2\xedU\
+\xcf\x8c\x1e\x9aa\x8a\x10\xbasx\xf8\xc8\xcb\xf8\xfe\xe3\
+\xff\x80\xcb\xb6[\xeb\x1f\x0e\xdb=\xc3s5\xd3r*\
+\xdc(\xa8\x06\x12(\xd4&1\x92\x7f\x9e~\xa75\xe2\
+\xba\x95e\x0b^\xdcv\xd3T\x0bznU\xe7\xe9\xac\
+\x90\xaaCCu\xbeN\x12!\x03\xa9\xef\xc0\xe6$\xfe\
+\xeb\xdb\xafadt\xc4l\xc1U8q\xd2\xdcd\x8a\
+l\xff\xee\x13_B\xaa\x9b\xb6\xa3<K\x06I1\xda\
+sm\xa8\x00;\xc0\xdb\x1a\xc9\xf0%8<\xfb0N\
+\xe4\x9e\xe20HE6\x8d4\xb8.\xbd\xb2\xc7a\x04\
+O\xae\x9b\xdda\xce\xf3u\xdc\x15\x89R\x9cy\x11\xd2\
+\xea^\xfb\x9d\x9b\x83 \x22\x90\xd3^\x8c\x13\x1c.\x9b\
+\x9f\x7f\xfaUs\xc3\x8b\xad\x18\xe3\xf7\xfc\xaf~\x887\
+\xdf\xfe\x15.\x19\xb8\x8e\x9b4\xef\xfaLj\xaf\x9ds\
++\x89\xe9\x85*\xe3L \xdc\x8fW\xb2\x7f\x8d\x93\xb9\
+gi\x8c\xb8\x0de$@D\x10\xf7\xc9%\x89;\xc5\
+U\xa0\x0d\xf7\x05\xde\xf8+f\xd2\xa3aO\x06\xf0B\
+\x9d\x88\x90^\x15\xc3\xf0\xb3g\xf1\xd6\x9b\xc3H\xc5\xd3\
+x\xfb\xe8\xcbx\xe4\x87\x7f\x85\xed[\xae\xb4\x13\x1fs\
+\xf7\xb8\xfdF\xda$\x80\xba\x5c\xa6\xc1\xe8\xa41\xec\xc6\
+\xaf\xa7\xff\x12#\xb9\xe7y0II\xf0\xf5\xde\x81w\
+\x1b\x17\x11\x9d\xdeP\x02\xa2\xe4\x9a.9\x14s\xba\x12\
+GJ\xb5\xdf\xb7E\xe9$\xbd\xcfl\x8c\xe3\x7f\x0f\x1c\
+\xc5\xf1\x93G\xf0\xc4s\xffd\xf2\xe9\xae\xa1\xbd4\xb1\
+h\xb1\x96\x91m\xd8\x00WV\xcbO^f\x0c\xf5\x92\
+\x08\x9d80E\x22\xcc\xbc\x80X\x84\xc7B4\x84\xce\
+\xd8i\xd7\xc6\x88\xbf\xcf}mx\xe82dE{\x15\
+\xe7An\xd7j\xf0+\x15\xd2YD\x22\x1dCa\xa6\
+\x86\x1f<\xfe\x08~9\xfc\x13\x5c\xb2\xfer_\xf4\xb5\
+K\xb1\xb4\x0b\x0e\x81\xca\xd9V\x97\x1a\x858\xfc@\x97\
+\x99\xfbh\x13:\xb0\x7f\x82D\xc8\xbe\xc8S\x9a\xa4\xd5\
+\x7f\xd6&\xf0\x12u\x89\xbe\xae\xe0F\xa25d\xa7g\
+\x18\xaf\xa1\xe0\xc2\xd8ons\xb1|D?\xdc\xe0\xd1\
+\xbb.d\xd4\xbd<^8\xf2U\xac\xedX\xcb\xdb\xe6\
+Z\x009\xe3\xbc4\x01\x9aS\x97$@\x03\xb8-&\
+]\xd7\x0cP\x92\xe0\x85\xfa\x91\x0eg\xf0\xc2\x99\x071\
+2\xbd\x9f\x97\x99xNOu\xb0\x12\xa0\xc3\xcb0w\
+{xu\xa6\xca\xc5\xcf8\xf3s\xa6w\xbe\xf8\xd5\xbe\
+\x08g\x1e\x81\x17A\xf9\xe8\x10&[>\x8eT'g\
+\x90!\x1e\x8fS\xc5471\xfd\xd3\x8b\xce\xf5\xdd}\
+-\x82\x85\xef\xb6F\x81E\x8aQ\x12\x08\x8aF1\xe3\
+\xa5\xf1\xec\xe8\x03$\xc2K\x88\xc7\xd2\x94\x04\xce\x1b\x0c\
+\xf7#f\xa7grj\x02\xda\xaa\xf3\xfb\xb5\xb0\xaa\x16\
+1\x86\xeb>`\xc3yC\x80\x087`u\xbb\xb3\x8e\
+\x89\xe2\x1b\x88p$\x16x\xa3\x7f-\xea9W\xf4\x02\
+\x02\xb4\xa2\x98\x8b\xd7\xd7P\x9a\x14\xd7\xf0\xe8qg8\
+\xc3\x1bb?;v?F\xa6\x0e\xf0\xeeN\x86\xe9\x1c\
+\xb24\xe7\xe7\x86\xc9\x99\xd1I\xee\xf8\xf8;B\xe7\xea\
+\x0d\xd3U\xbf\xe3\xb8\xbe\xe2\xba\xc7\xa3p=\x11\xee\xa1\
+k\x07\xbaJ\xe2\x9f-\xbe\x80\x947HF\x14}\xee\
+\xab_\xf3\xb9\xdf\xdc\x9cKw\xf1\x9a\x16\x1b\x024'\
+\xb8\x0c\xfa\xb6JS\xbc\x1e\xce\xf0\xb9@Z\x85\xceh\
+\x02O\x1e\xfa<F&\x7f\xcd}\xba\x8cY\xba\xbe{\
+v\x0c\x85\xe9\xb2\xb97\xa0{\x04v\x82\x22;\xb0\xb8\
+-P}\xcd\xe0u\xfc&\xe0z,1\xa2\xdc\x97\x98\
+\xc2Dy\x82\x12\xc8;\xc4$\x07{\x12\xec\xf2\x9c\xbf\
+U\xdf]\x06sYZ\xdbT\xcd\xaeUA\x17\xef\xbe\
+*'\xbf\xc40\x16^\x8d.\xde\x0a\xfb\x8f\x83\x7fF\
+\x22\xbc\xcc\xa9j\x15\xa7\x8eO!\xc5_\xa1\x84\xf8\xe3\
+\x07\xed\xd0\x10\x0a\xbb*\xb3\xa32\xfa\x13Q\xb4!b\
+\xe7\x12\x02\xcf\xcb\xcb\x96\x08\xe6k\xc1\x07\xa5@\x92 \
+\x02hgJ#\x82j\x12~\xd7'\xf7m\xc6\xd4\x1c\
+V>a\xf7\xf4\x0b\x91s\xdd\x187 }\x0b\xe6\xfc\
+\xae!\xb7\xba\xd2\xfe`,\xb2\x16\xdd\xb1w\xf0\xe3\x83\
+\x9f\xc1\x96\xae\xcf\xa0\x96\xef\xe3U\xf9\x0e\xf6/jv\
+f,\x11x\x81\x8a\x16;\xcc)\xac\x16+\x86{\x9a\
+K\x983?\x92\x87\x13)3\x99\x0a\x10\xc2\x86\xb5}\
+.\xe3\x1aA\xbe2\xce\xfa\x04I\xe0\x1b\xa2\x1f\x04\xe9\
+\xfa\xe7\xe2\x9a\xc3\xea\xb7\xb6\xd2B===u\xf7\x83\
+\x22E\x06]\xabp0^~\x17\xd6W\xe04,e\
+\xcbSHkX6\x9cJ\x10p\x0f\xf9\xdfI\x9b\x91\
+a\xe7\xd3<U\xea\xe1\xcc\x92\x04\x8a\xf4\xf1*\xfdj\
+^v\xea\xe5p\x9a\xe2\x10G)\xf1\xaf\xd08BH\
+*\xe4\xd7p[\xae\xce\xe0\xbf\x0f=\xc8=\x89Y\xd6\
+\xa33A7\xc5nH\x8104\x03n\x0eK\xfc\xf5\
+\xb3\x193x\xea\xe7d\x22B\xbbN\x959\xd0\xcd\x15\
+s\xff\x97\xa7\xb5\x1d\xe8\xe5<\x81?_$\x01\xb4\xf1\
+%1\xcfs.)\xd1-r\x19\xab8M\x9f\xd8Q\
+>\xd1B/:\x22\xefCO|'zR[\xd0\x95\
+\x1c\xe4\x89S\xb7o\xf1%\x11\xdc,\xa1\xf1\xab\xd4\x0b\
+x\xe3\xd4\xe3\x98,\x1f\xe1\xce\xd4N\xaeN\x1b\xbf&\
+\x09\xf6#\xe8\x17\xa6\xe6\xb0\xe2\xf4k\x11\xb9P__\
+_]\xd4\xd0O\xe5\xf4[\x1a\x07\xcc\xa4\xf2\xb5T8\
+\x98\xe6\xfc\xeek\xa0\x11eC\xa6l\xa0\x11\x9ek\x81\
+yJ\x1c1\xc6\x8d^\x8b ]\xd1+0\x90\xbc\x0a\
+\xfd\x99\x1d\xe8N\xe9\xfa]\x12y\x1a\xbd\xb7\xcf\xfc\x14\
+G\xa6\x9f@\x8f6e1K\xe2\xd9iL\x10`\xd0\
+\xaf\x16\x16\x0b\xeb\xb7B\xb9\x1c\x7f\xaa\xc7\x11\xc6\x10@\
+\x19E\x04\xf7K\xd1\x06\x08\xa5\xb4O\x84`\xde\xf9u\
+HMLU\x81\x97Qb\x86\xf5U\xa2\xac\x81\xf5W\
+\xf1\x1e\x8a\xb5\x9c!\x087\x86\xa86]\xc8U\xa7h\
+h\xc1\xa1o\xb3!\x98-7\x1f`3X5\x16\x8c\
+\x93_6\xcf\xfdvP\x925G\x00eV\xa7%\x09\
+2\x8aA\x00A\xbf\xf2\xc95\xc7-\x15nN\xb35\
+,\xf6n\x10\xc5\x19H\x9a*\x02\xe6\xd5\x1bnz\x88\
+@\xf2\x8b`A`\xaa\xa99\xdc\x1c\xa7t\x19=q\
+^N\xe0\xe5\xcc\xcf\xe6\xe4Q\x06=\xfa\x89\xa9\x86\x07\
+\xa9\x832\xa9\xf3\x8ao\x06\xa189\x17\xdf\x9c'\x98\
+\xee\xfc\xa6\x80\xffr\xe5\x5c\x9c_\x9dK\xe5\xd7Z\x08\
+musv\xc0\xb0\x1d8\xcf\x17\xbc\xda\x96tK\xe7\
+e\xeb\xe4\x82\xfd\x99;\x18q\x19\xf5UfQKD\
+\x90\x9e\x88\x10\x8e\x18\xa6\x86\xc0K\xf9\x1d\x18W\xb1\x0b\
+77\xa6\xb0Ksy\x03U\xcdy\x97N\xb3\x9cS\
+\xe6V\xf9\x14\xafv\x04\x5c\x22/\x9d\xd7W\x18\x82e\
+\x94\xc7\x10@\x9e`\xc7\x94Q\xceQ\xcc\xfc\xba\xca'\
+\x82Ih\xf1\x0a\xd6\xe1\xfc\xcdY\x15\x1f\xecDsz\
+;\xe1s\x95\x17pI\xb1@\xbb~4\x83w\xed\xfc\
+\x1f\xb4\xf5*\x8e\xdc\x0a_\xbd\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x1c\xdb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x1a\x8bIDATx\
+\x01\xbdZg`\x5c\xc5\xb5\xfe\xb4\xea\xd5M\xb6,7\
+\xdc\x9b\x5cp/\x02\x8c\xc1\x10\xc0\x06\xf2\x0c\x18\xfcL\
+OB(\x8f\x04^p()@ \xf4\x84\x84bz\
+h\xa1\x13\x9a1\x06;\xb8\x17\x5cp\x97{\xc5M\x96\
+\xd5\xad\xb6\xd2J\xfb\xbeo\xee\x9d\xdd\xbb\xeb\x95p\xfe\
+\xbc\x91\xeeN;s\xce\x993g\xce\x9c)q\xe5e\
+eA4\x17\xe2X\x11\xab\xd6\x96+\xb6\xc1\xc2\xd92\
+o\xde\xa6\x05k\xdbz\xd3\xb6\x8d\xc5\xa58\xba\x8d\xb7\
+\xcc\x8b\xc3\xdb\xa6\xa5\xb4mci\xb9\xf8}\xa16\xb6\
+\x22T\x10\x95P\xbd\xfd,s6\xb6\xa0\xaaW\x99\xb7\
+\xdc\x9b\xb6\xf5\x16^\xb1-\xf3\xc2y\xd3\x82Q>\xba\
+L\xe5j\xab`c'\x17\xfeU\xb9\xb7Ni\x8b\xcb\
+-O\x88\x00\xb0M\xbd\x8dTf\xf3jl\xd3\xb6\xdc\
+\x96\xa9\xdc\xa6\x15\xc7\x0a\xd1\xe5?\x96\x8f\x85Ce\xb6\
+]t\xac:\xcb\x87\x17Ni\x05\xc1{\xf9g6\xe1\
+\xa4\xc2(\x00\xb5;\x09\xc6\x14z~,#\x96\xb8\x8d\
+= \xcd&\xa3\xe9Y&-N\xdb0\x1aN\xe5\x16\
+\xd6\xa6\xbd\xb1\xd2\xa7\x10|\x11\x12S\x03/a\x9b\xb6\
+\xc4\xbdqtZy\xcb\x90\x8d\x85\xcf\xc2)\xad\xa0\xbc\
+-\xb3m\x04oi\x09\xc6\x9bV^\xc1\x0b\x13\xab\xde\
+\x81\x0a\xfd\x06\xd9 \x18\xfc\x11@\xd2\x0f\xdb\x80P\xd3\
+(b\x96Io}t\xfaG\xe8D\x83G\xe4\xad0\
+T(<\xde\xbc\xca\xa2\xf3*\xb3\xa1\x99:u<!\
+>\x1eIII\x16\xd2\x89c\xc0G\x0a \x06@\x88\
+)1\x17\xddQo\x99\xadS,<\xde\xbcC>\x5c\
+n\xebTn\xd3\x96\xb6\xcd\xdb6\xb1\xf2\x16\xbf\xea\xec\
+\xe7\xc2k\xe4\x13\x93\x12Q^Q\x89\x1f\x0e\x1eD\x5c\
+\x5c\x1c|>_X\x1b,\xbc\x1b\xb3&\xd4\xd2\x92t\
+b\x11\xb1L\xd9\x1aK\xd8\xe6\xa3bI\xbe)\xd8\x84\
+\xa6&~\x8a\xa3\xbe`\x93%\xe66\xf4f\xbd\xe9(\
+\xbc\xa1\xac\xe5G\xb06mc\x16\x89^RR2\x0a\
+\x0a\xb6\xa2\xdb\xf8s0`\xc0\x00<\xf3\xfc\x0b\x08\x04\
+\x02F\x10\xa1\xbe\xaa\x8d\xdb.\xae\xbc\x9c~\x80Eh\
+\x99\xf0 \x0d\x11\xb70\xa1\x82p\xa2\x89\x1d\xa3\xa0\x91\
+\x98\x90\x88x\xaa\x9e\xa4nQ\x85\xa1\xc8 \x05#f\
+\x1a\x1b\x1d\x86\x04gB,`\xdbP \x96v\x0bp\
+\x06\x84\xb0\x12\xf2u\xb7\xdc\x8e\x8c-\xef`\x5c\xfe\x85\
+\xb8\xfd\xe5\xb9X\xb2d)F\x8d\x1a\x81\xda\xdaZ\xf8\
+\xe2\x5c\xa5wI;\xab\x80\x97\x98\xd2\x96\xa0M\xdb\xfa\
+\x18\xb1\x08&''\xb1sA\x14\x1d?\x8e#G\x0e\
+\xe3x\xd11TTT\xa0Q\x92\xf7\xc5!==\x03\
+m\xdb\xb5CNNG\xf3eee\xa2\xa1\xbe\x81\x82\
+h4\xf5\x11h]\xc6B\x12\xf4\xf2\xe2\x15\x86\xe5\xcd\
+-\x0br\xf4\x93\x93S\xb0u\xeb6|\xf1\xc1;x\
+\xee\xe7\xe7\x22\xd9WoP'$$\xb0O\xae\xf4\xbc\
+\xf8\x99v\xfc\x00\xb7.\x82\x11K\xc0\x16F\x13g\xb9\
+:\x9f\xc4\xce\xef\xdd\xbb\x0f\xef\xbd\xfb6f\xbd\xf16\
+\xca\x8f\xa6\xb2\xa6\x17pZ+ 9Q\xc3\x0e\x94\xd4\
+\x00eE,?\x8c\x0b.\xe8\x8f+\xaf\x9c\x8e\x0b/\
+\x9cL\xc1\xa4#\xd0\xd0\xe0\x08\xc1\xf2`c/]\x9b\
+Vl;\xe0M\xbb\xbc)Z\xbej\x0d\xf2\x19g\xa5\
+&\xa0`\xcf>\x9c{\xc9T\xf4\xe9\xdd\x13\xf5\xa2c\
+5\xce\xb6%-\x8a\xc6\x13\xbc\xc4\x95\xb6\x9d\xf6\x80\xd8\
+\xa43\xf2\xc9\xd8\xbce\x0b\xc6\x8c\x19\x03\x8c\xfb\x05F\
+N\x7f\x14\xe9i\x19\x0e\x8fV\xd5L\x03\x22\xe3\x085\
+\xd4\xd7cW\xf11\xdcp\xc3\xc3\x98q\xf5\xbf\xf1\xd4\
+\x93\x7f\xa5\x10\xd2\x1cM\x88\xe8\x99\xa5\xc2\xd8\xf2\xa1\x22\
+\x9bV\xac\xe0\xf2\xa79\x9c\x10\x9f@\xad\xab\xc4\xbb\x9f\
+|\x8e\xf3.\xcd3\xd5\x0b\xbe\xda\x89\x9b^\xbf\x0f\x99\
+\x99\x99\xa8\xf1\xaa\xbfj]\x1c\xce\x84\x10\x22\x05\x1b;\
+\xb9\x10\x90\xcdZ\x82j,\xd5\xae\xf3\xfb\xf1\xf4\xd3O\
+\x02\x17\xdf\x8dI\x17^\x8a\x86\xea\x0a\x94\x97\x16\xa1\xba\
+!\x80\xaa\xbaZ\xf3U\x9b\xd8\x8fj\xaa|=\x85\xd2\
+!\xb7\x1b.\xb8\xff)\xbc\xf3\xcf\x8d\x98\xfd\xc5\xe7H\
+\xa0\xdd\x08\xad\xd7\xd1\xf4-a\xdba\x9b\xb7p*g\
+Z\xede\xf9\xb7\xed\xdc\x89U\xdf~\x8dn\xb9\xb9(\
+\xab\xaa\xc5\x1aV\x8f\x1b=\x12\x8d\xd4\xc2\xb8\x93:\xe7\
+ s\x04 D\xf6s\xca\x1da\x88\x90%\xa6r\x97\
+\x11\x11\x94\xc4KKK\xf1\xfe\xfce\x18\xd3\x7f0\x8e\
+\x1d\xd8\x8eC/\xfd\x1a\x85s\xff\x8a@\xcd\x09\xc4\xb1\
+\xde\xa8\x1c;\xed\xa8\x9e\xe1\x94ZP\x87\xca@\x10\xb9\
+\xd7\xdd\x80\x05\x0b\xe6\x1b\xc3\x14\xef\x8b'j\x22w\xf1\
+[\x16\x22b\xd5\x89\x17\xc5\x16\xce\xe5M\x9d\x93=\x99\
+\xbf`1\xa6\xf5\x06R\x93\xa8\xfe\xdb\x96\xe0\x97\xbf\xba\
+\x13]\xbbt1\xf6&\xa4\xfe\xde\xb6l\x1f^\x06#\
+\xa8y\x08\xd9\x066\xb6pl\xdc\xd4\xd4\x08\xf8}\xc6\
+\x00R%\x8c[\x15\x17\x9f\xec2\xca.E\xb7!\xa3\
+q\x84\x0brDRR\xd2PQ]\xe7\xd8\x00\xef\xdc\
+\x14~\xb7c\x96T(\xef\xc5'\x18\xe6\xcd\xe8'&\
+\xe2\xd8\xb1\x22<\xf2\xdc\xab\x18>j,\x1a\x1a\x9b\xf0\
+\xf2w\xc0\x94\xf3'!\x99\xcb\xa2\x96\xc7P\xb0\xb8\x85\
+\x8b_\xa4\x0dp\x91\x1a\xe0\x18i\x113\x7f\x8ai\x00\
+e\xf9\x91@o\x8b\x04\xd2rNC\x97\x9b\x9f\x87\x8f\
+\xf9\xc4\x8c\xd6\x08\xca\xc2sI4F0D\xddI\x88\
+\xb6\xd07\x06\x1a\x8dz\x8aA\xe1\x0b\xc6\xa9Fu\xd2\
+\x1a&\x9cl86\xb5\xee\x8f[g\xb41!\x1e\xdf\
+o\xd8\x80\x8c\x92\x1f\x90\xd3\xb6?\x8e\x16\x97\x22w\xe0\
+0\x0c\x1d<\x08\x0d\x01\x8f\xf1\x13\xce\xa8\x10^\x05\xbc\
+\x04-\x90\xdb@\xccI\x85d\xf1\xadW\x95\x94\x98\xc4\
+QLa\x07\xa9~\xfe\x1aJ\x99\xd3\x225\x93\xcc\x06\
+\xcd\x140(\xd8&>\x9106xh\xc43-\xcb\
+\x9c\x9a\x92L\xc3\xe9\x1aB\xc2\xabC~\x1a\xcb&\x8e\
+\xa2\xec\x8c\x11\x82\xcbGH \x16\x1fc\xf1S[W\
+\x87O\xe7|\x8d\xeb\xce\xcaFb\xbc\x0f\xab\x97\xad\xc5\
+\xad\xb7?\x81\xec\xecv\xf0\xfb\xeb\x9d)\xe8\xc5a\xd3\
+\x8c#\xfd\x00\x0fbKX\x9d\x97\x81i$C\xfb\xf7\
+\x1f@YY\x89\xe9\xa4\x9c\x9e\xa2\xe3\x5c\xda*\xf7\xe1\
+\xd8\x9c\xc7\x9c\x91\x0c\xd4\x1a\x15\x87\xa6\x01\xc7\xb1\xc9_\
+\x82\xce\x97?\x85\xa4\xacv\xec\x10}\x82\xa0CY\x83\
+\x97\xc8\xa9PYY\x81\xb9\xf3\x17S\xb0)T\x14G\
+Ms\xb2\xdb`\xe0\x80\xdeHKM7\x82\xf0y\x85\
+`\x19wG_\x9a\x93\x92\x94\x82\x1d4~\xef\xfd\xe3\
+\x15<\xfb\xb3\xb3Q\xedo\xc0g\x87\x81\x99g\x9di\
+x\x91\xc6F\x18@\x8bC}%\x9e\xc8)\xa0B\x1b\
+\x08h;\x7f\xf4h!\x9ey\xe6i<\xfb\xec,\xd6\
+\x8e\xe0G\xd5\x06\xe7\x7fr*\xbaO\x98f\xe6\x98\x83\
+\xc8\x8b]\xed5\x0dX\xc3Q\xf5\xd6h\xe6\xa4Q\x05\
+\xd6\xae?\x82o?\x98\x8a.\xed\x01*\x03G\x13\xf8\
+~\x1b\xb0\xdfw\x09>~\xf1\x11t?\xad;\x85\xe0\
+7\xa3l\xd9\x8a\xd6\x02M\x95\xa5+\xbf3k\x7f\xab\
+4\xba\xc1{\xf6r\x19\xbc\x1c}{\xf7\xa2\x86yF\
+\xdf\x15\x9aa\xc4\xa6\x894\x16\xdf\x86\x96T1\x9es\
+Kk\xeb\x8d7^\x8b\xa5\x85\x9dq\xc6\xcc\xb7\xe1\xa3\
+QQ\x90T\xa5\xf6u\xd4\x0c\xb7\xc0\x8d\x9c\xae\xaa=\
+\x87\xc0t^FO-lPq\x92\xd6\x9f\x80\x0f\xf7\
+\xddr!z\xf6\xa0\xf3\xe4'\x8c*8\xff\xdf\x9b\xfd\
+\x09\xf2\xa6\xd7\xe1\xd8\xfc79E8=$H\xb5W\
+\xb5>\xa2\xd6\xc8\xca\xc3+/\xaf\xc0\x1b\x1f~\x82\x8b\
+.\x1ddd\xf3\xf5W\xbb\xf0\xab7~\x8f\x8c\xcc\x8c\
+\xb0\xeb\xab\x0e\xab\x9d\x82M+f\x88\x5c\x06\x9d2\xf3\
+kF\x9f\xf3|\xf1\xa2\x85X\xba\xf4\x04~2c\x06\
+\xfc\xf1I\xa8\xe5\x1a\xaf\xaf\x86CVGWW\xa3+\
+#h\x8c\x1d;\xaa\xcej\xe4\x9d2\xc5.%\xcb\xbc\
+\xb0\xab\x89K\xab\xde_\x07p\x0e72n\xf2\xd7R\
+\x15\xaa1\xfd\xe2\xcb0%s\x1e\x96\xad\x5c\xcb\xe9\xe1\
+\xfa\x09\xb6\x03j\xc7\xb4\x04\x9cH\xeb\xbfu\xfb\x0e\xac\
+[4\x9fk\x7fG\x94V\xd6`#\xab\xb5\xf6\x1b\x1b\
+\x22@KW\x04-Q\xe1P`\x9d#\x00'\xeb\xf9\
+\x0d\xc2Gc\xa2\xcd\xc3\xbcys\x91<}:\xaah\
+\xb1i\xb6\x9dV\x06\xb1\x90\x0b\xbb\x82\xa5\x12\x95W\xbd\
+\xadr\x00\x9d_\x95Ih\xa8\xe2\xc7\x0c\xb9\x10\xa8\xa6\
+;\x17\x0f&\xeaq\xd3U\xad\xf0\xe5\xb7\xab\x9c\xfd\x84\
+*-\xf3nGd\x94\xb5\x8a\xcc[\xb8\x18W\xf6\xe3\
+\x94JN\xc0\xe6\x82\xa5\xb8\xe5\x8e\xdf\xa0K\xe7\xcea\
+\xf5\x8f\xd5q\x0f\xaeH\x01\x90\x8e\x82\x06M\xeaUR\
+R\x8c7\xe6\xae\xc1\x90\x8e\x9d\xb9\x9c\x903\xad\xf5\xcd\
+\x05\xb7m\x98S!\xd2\xc7\x1f\x13;imZ(]\
+\x04*\x8bYP\xce\x1d$\xed\x89\xea\xdd\xa0\xbeJ\x0a\
+\x03{\xe5\xe1\xabUkq\xe2D\x95\xd9aJ\xe5-\
+\x9c\x19}\x1a\xe1\xc2c\xc7\xf0\xf8\xdf_\xc6\x88\x91\xe3\
+\xe0oh\xc4?\xd6r\xed\xff\xc9$s\x10b\xa6\xa0\
+E\xaa8\xc4\x9f[\xa8<\xbf\xc8\x1e\xb9\x8c\x88\x98\xbc\
+\xb3\x22\x12@Q\x06R\xb9L\x19\xb5n\x0e\x11\xe15\
+eL\x90\x90\xd4\x8b\xd0\xe7\xc9\x13\xa7/1\x15\xf1\xfe\
+*\xec_\xb7\x10c\xc7\xf5@\xc7\xb6\xacot\xb6\xd3\
+\x06\xbd\x18\xe34\xcan\x93\x89\x84\xf2U\xa8\xa8\xa4\x00\
+d\x1d=Br\xe6?\xd7\xfe\xf5\x1b\x90Sy\x04\x1d\
+\x08{\xb8\xa8\x04\xa7\x0d\x1b\x83!\x83\xf2hP\xdd\xfd\
+\xbf\xc3\x91\xf3\xebio\x0a\xdc|\x0b\xab@\x1c\x0d`\
+9\xb7U\x9dh\x85e\xf5\xa5\xfen\x10\x936p\x84\
+e\xe9\xe3\xd9\xe1\xa4\xa6\x06\xf8\x82\xce4\x11\x93\x02\x93\
+\x028\xdc\xb3\x846#PY\x82\xc2\x0d\xdf\xa2h\xf3\
+j\xbc\xf9\xcap\xa4g\xd0\x93\xf4s\xcayqR\x98\
+\xa9T\xe9\x9e\x99e\xa8\xae\xa9\xa1,\xc3\x95Z\xfa|\
+\xccks\xf3\xaf/\xe7\xe2\xca\x899\x14P\x1c\x96\xcd\
+Y\x87[\x1f~\x1a\xed\xda\xb65{\x94\xd0\xbe\xdf\xf2\
+\xd9L\xdc\xbc\x00\xd8\xa0\x81\xcb\x08\xb2\xe8\xc8x\x18\x88\
+\xc0\xa3\xde\xc5s\xcb[U\x82\xe2=\x1b\xb0\xfb\xab}\
+\xac\xa6!3A=\xf7~\x9a\xf3\x15\xfc\xb6\xa1}\xdf\
+\xae\xf8\xf2\xc5a\xb8`l:\xbd\xa1\xf0\xe8\x9bf\xee\
+\x8fF=\x93\x8bC}\xbd3\x9aRi9=rm\
+\xe5\x83l\xda\xbc\x05\x1f\xbe\xf9\x1a\x9e\xfb\xd9DT\xd6\
+\xd4c\x1e\xc9>|&7\xc2\xcd\xf1\xeaE\xae\xb4\x19\
+\x1d\xb3\x0c\x8a\xc9\xb0\x84\xbdp\xf1Z\xc3k\xb9@\xdb\
+\xe0\x01\x13Cq\xec|\xb0\xf4\x10\xd6\xbc\xf40\xe2;\
+\x94\xe0\xb9?\xe6\xa1k\x07\x09\xccm`b'\xa3\xe3\
+\xe7\xd4\xe46h\xd7\xe6\x1c\xf4\xe8\x98\x80V\xad\xa9U\
+\xec|s\xd4\xcd\x12K\xd2\x89\x89\xdc(\xa9\xf34\xca\
+\xf2\x1c\x0b\xb6mC\xf7n]\xb1`\xc9\x12\xfc4\x07\
+h\x9d\x9e\x84\xb5\x05\x05\xb8\xe8\xf2\xe9\xe8\xd5\xb3G\xe4\
+\xc6\xc7\xf2mc\xb1\x22\x82\x0an\xdc\x82\x06\x04\x91\x95\
+\xc5C\x8d\x92\x12\xceo\x8d\x9e'\xb0\xb165\x09\x81\
+:\xac\x9c\xf3\x11\xa6^\x94\x89\xe7~;\x0a\xb99\x9a\
+*-\x056\x14a\xcey\xa9\xbd\x06\xcb\x11OT\x1b\
+V\xd4\xf9\x038P\x99i\xdcdy\x89\xb2I\xaf\xbf\
+\xf3\x16\xee\xbc\xe3\xd7\xe8G\xa3\xb7\xa3\xa8\x0a\xbf\x18<\
+\x14'\xea\x02\x98\xf3\xed!<\xf6\xe9\x95\xe6\x80\xa5\xa6\
+\x86\xc7^\xb2\x19\xb1\x82\xdbio\x15\x05p2\x0b\xc6\
+\xc9\xa1\x83\x93\xdd\x9e.Z\xdbj\xaa\xa1\xdft\xd8\xb1\
+\xac\x8e\x185\xfaM\xa5\x07\x81C+\xf0\xe7\x17'!\
+7\xd7\x87\xc6\xea\x18\xc6\xc7K\xcdM\xab\xe3\xde9o\
+\xf92\x98\x99\x89\xe3h\x17\x97\x97\xc3\x9f\x95\x8fVY\
+<`\xa1\xb0KJ\x8b\xf1\xe0_\x9e\xc4\xe3W\x9fE\
+~j\xb1-=\x0e_\xee\xaf\xc7G\x87J\xb8\x96\x00\
+)\xdc\xa7\x04\xb8Ri\xff\xe0\xd8\x9f\x93\xfb\x15\x83\x95\
+\xa8U\xc0B\xb0m\x80k~\xbbv\xd9\x98rFW\
+\x1c%3\x1a\x81P\xa0J&\x10\xa6\xa0\xac\x0aS\xcf\
+\x07zv\xe2\x8e\xb0\x8e\xc6\x89\xc4\xd51\x0d\x80\xf9\x94\
+\x8e\xf1\xb1(\x22(o\xcb\x8c\x909\xf56\xef\x5c\x8f\
+\x8b\xc6\x8fAFF:\x12\x12\x13\xb0\xf6\xfbu(?\
+x\x88\xbbM\x1f:\xb7K\xc1\xf9\x03[\xe1\xbe\xfc\xd6\
+\xb8\xb9\x7f\x02\xae:g\x0c&_t\x11>\x9f\xfde\
+h\x09\xb4B\x8d \x14#\x13SW\xa4\x01:`\xc8\
+\xcc\xc8\xc0\xc43\xc7c\xff\xae]<\xde\xe3|7S\
+\xc1\xce\xdb \xaa\xa8\xca\xd9\xad\xb9\xe3S/\xbd\xc1\xa5\
+\xaeH\xabc\xecOG\xe8\xb6\xceI\xcb\xab\xe6\xe0S\
+\xfa\xf1\xf8\xcb?jp\xc9y\xe3\xe9\xd2f\xd1\x13]\
+\x8e\xcb\xa6N\xc5\xad\xd7\x8f\xc0\xcc7\x8e\xe2\xc6\x17\x8a\
+\xb1r{\x15w#A\xf4\xcdM\xc1\x94\xbcLL\xed\
+\x09l\xdc\xba\x8dSL\xab\x8fq\x9c\xbd\x1c\x9d\x9cv\
+\xa5\xde\x82\x0dp\xda\x9c}\xce$n\xadF\xc27f\
+\x14\xd2\xd2\xd2\xe9\x10i\x99\xa3\x1b\xaas\x00:K\xce\
+\xb4\x88\xc2O\xe4\xe4\xc3\xf8Mq\x1c1g\xe2\xbbQ\
+HV6!\xcdRZ\x0d\x18'\xa4\xf0\x5c\xef\x0b\x14\
+\xb7\xbe\x02\xe7\x9e\x9d\x8f\x95+Vb\xd2\xa4s\xb1\xe6\
+\xc331r`&\xee\x9a\x9e\x85\xef\x0aj\xf0\xc1\xa2\
+*\xbc\xf4f5:s;3\xe3\xa7\xed\xf0\xc9^\xe0\
+\x1b\xee\x00\xb5d\x07\x83\xee&\x88XO\x0a\x96,\xc9\
+)\xc4\xc5z\x1f\xe0\xcc!\x87m\xf9\xdb\xef\xbe\xfb\x0e\
+n\xba\xe9f`\xdaC\xe8\xc4\x11\x91QJ\xe7\xb5\xd3\
+\x9e\xed\xdbqS\xc7\xf70\xeb\xde\xd1\xdc\x1fr\x0f \
+\x84\xfcL\xcc~W\xd54\xe1`Q\xbd\x99\x1a\x92\x88\
+\xb7^\xc4\x05\xd9\x18(c\x15\xf7\xfe\x9c\xe7\xb5<c\
+\xfcb\xc1\x0e<\xf4\xf2\x00\xfcp`.\x8ai\x80\x87\
+\x0f\x1f\x81U\x1f\x9c\x85\xd1C[!X\xcb\x8ei\x17\
+\xc5\xff\x86\xda&\xec=\xec\xc7\xd2M\xb5xqN\x11\
+\xb5\xa1;\xe6|\xf4\xb69\x00\x95\x8b\xec\xf5\x1d\x1cZ\
+\xb1\x7fcj@X\x81x\xb8\xc1\x11\xd71v\xb7n\
+\xa7\xe1\xab9\xb3q\xa4p\x83\x11@\x22\x8d@\xeb&\
+\x1e\x84\xf8\xb8\x16\xb1\xf3\xa1\x9e\xab[R\xc3D\x1f\xd6\
+\xed\xaa\xc1\x84k\x8e\xd2B\x91L\x9d\xbaoE 1\
+\xc9\xe9O\xc3\xc4\xa9#\x90DM\xd2\xf1Z\x1aO\x94\
+'\x8e\x99\x89\xe2\xe3\x97\xa0\xb0\xb0\xd0t~\xc5{\xf9\
+\x18=$\x0b\x81\xeaz\xba\xc4\xdc\x81\xd6;+R\x22\
+\xd3\xfd\xb8\x8b\xec7 \x13#\xfb\xd6\xe3\xba\x17;\xd0\
+GHr<R;\xca\xa4\xf0c!\xa6\x00l#\x09\
+B\x9d\x09\x06\x1b1\xe1\xac\x09\x187n<\xea9J\
+Z\xa3Sx\x92\xb3y\xcbv\xfc\xed\x81\xb1\x94vO\
+6\x09\xfb\x0bF\xfa\x5c\xe3\xc7\xe5\xa5\xa3dy\x8f\x90\
+l\x92(4\xcd{yi\xbb\x0f\x15\xe3\xd7\xafv\xc5\
+\x07\xb3\x1eA2q\xe9\xc0E\x1e^\xab6\xadQ\xb0\
+\xa5\x00\x83\x06\x0f\xc1\xa2\xb7\xc6a\xdc\xe9m\x89\xba\x1e\
+\x09\xc9<K\xe4a\xaa`\x14\xc8\x02\x1a)\x8c\x848\
+^\x87q?Q\xcb\x812\xfb\x0cUK\xce!a+\
+\xdd|hQ\x00j\xe6hC\x90\xc7N:\xedq\x8e\
+\xc5\xe4\xf7K\xda\xba}\x8dv\x11\x9c6\x0e\x83\x1a\xa5\
+\xb6Y\xf4\x14\x15\x98.:\xee7\x06\xb3]\xc7$\xb4\
+)\xe7^\x9e\x8ef\x1c\x97\x8b\xb88\xd9\x01\xe2LI\
+E\x01=\xbcACF`\xde\xab#0aT6\x95\
+\xab\x01\xebv\xd4\xa2\xae!\x88\xf1\xa7gD\xb8\xcdF\
+\x184\xc0\x1a\x109Z\x8e\x1a\x8a\x98\xc2\xa9\xa9\x01g\
+\x93\x1bZ\x84\xd7\xf2&\x12$\xc6\x1e{?j\xaf\x13\
+\x8c\xd4\xc3I3\x10\x1a\xa5\x803=v\xed\xafE\xce\
+\x84\x83\xc8\xbe\xf6\x10J\x8e\xc9\xaf\xa0#\xc8\xf3Di\
+\x98V\x9c\x94\xd4\x14\xfc\xf0\xc3~v\xfe2|\xfe\xfc\
+@\x9c\x97\xdfY~0w\x83\x8d\x18qE!\xe9\xbb\
+t((\x91R{S\xc6L\xa8\xca\x82\x9c\x14{\x98\
+\x8b\xaa\x0b\x0b \x1a\xa6\x19\xac\x12\x824A\xe0\x19\xe9\
+\xa9\xd8Y(\x9f\xc1\xe1Bj\xa9`\x9a\xf2G\xb1I\
+\x93JU\x8d\xe6<\xbf}<L\xa1\xcf\x90H\xc9\xa9\
+H\xc2LMM\xc5\xe1C\x07\xd1\xaf\xff5x\xff/\
+\x09\xb8\xe4\xdc\x1eh\xaa\xe5A\x09\xed\xc8\xa3o\x17\xe3\
+\xf1\xbb30vX\x86q\x9dE[\x9do \xcd\xda\
+\x06G\xb8\xd1\xac\x8b\x87\xc8`\xb8\x88,rsa\x01\
+DW7\x87\x95\xb8\x0c\x03\xf4\xcb\xbbt\xee\x88V\xdd\
+\xaf\xc7\xa25[$\x0d\xe3\xfc\x84\xd6v\xf2&\xd5T\
+\x90\xdb;\xb4w\x1aV\xbe\x9b\x8b\x0d\xff\xea\x84\xae\xbd\
+Za\xfd\xf6C\xc8\xeb\x94\x836m\xda\x98\xce\xf7\xe9\
+{\x0d^\x7f\xa4\x1cWN\xee\x87F\xb9\xb3\xbc\xdb[\
+\xb1\xfe\x04\x05P\x83\xff\xb9\x9cS\x81S@\x1d6\xcb\
+.\xed\xc1\xa7K\xca\xf1\xe1\x02\xfa\x80\xc9\xd2J\xd2\x89\
+\xeacs\xecGw\xb3y\x01\x082\x0a\xa9il0\
+;SAw\xf1\x7f\xfd\xe3\xed\xf8\xc9/\xf7\xe3\x93\xd9\
+\x0b\xc9`\x22|<*\xf7\xa5&\xf3\xe3\x11z\x8a\xf2\
+\xf6K\xc2\xd8\xb1\xed1tP;\xacX\xf1\x03&\xdf\
+z\x00\x0f\xdd\xf5s\x94\x95\x96\xa0W\x9f\x19\x98u\x7f\
+!\xae\xff\xafAf\xe4\xe3\xe9;TV4 \x7f\xc6\
+q\xacz\xa5\x03\xd2Z'\x98%\xef\x9a\xc7\x8e\x98\x91\
+\x97\x05\x5c\xb8\xae\x16\xb9m\xed\xfc#gQ=\x8e\xc5\
+\xba\xe1?\xea\xc7\x83!\xaaF\xd9(\xa4^\x08\xd9\x04\
+\x9d\xb9\x0f\xe8\xdf\x0f\x9b6m\xa2\x9f\xfe\x1an~\xe2\
+\xef\xb8\xe5b`P\x1f\xa0cvw\x1em;~|\
+C\xc0\x8f\xd2\xf2\xc3\xd8u\xa0\x0a\x9f/\x04\x16TL\
+\xc2\xb2e\xcb\xa9A\xb9\xe88\xe8z<1s\x1fn\
+\x99\x96\xcf\x83Q\xaa\xbd\xa4\xce\xd5\xe2\xd1\xb7\x8e\xe3\xc1\
+;\xd20z0U\x9f\xa3\xff\xe9\xa2J\x0c\xed\x9a\x88\
+\xe4\x8cx\xd4T\x06\xb0fo\x00w_\xcd\x03Z\xcd\
+,wJz\xf9s\x98\xffq1\xc4\x10\x80\xed\xf5\x8f\
+7\xb6\x17\xa4\xbdz\xf5\xc4\x1b\xcf<\x88=\xfbn\xc4\
+\xfa-;\xf1\xdd\xf6=\xd8\xb7\xe5(J+N\xf0\xa8\
+*\x80V\xbc\x01\xee\x9a\xdb\x1e\x03{w\xc7\x1f\x9e\xec\
+\x87\x0fx\xee\x9fI\x87\xea\xda\x9b\xef\xc2\xa3\xd7\xcd\xc7\
+\xcc_N\xe3\xb6\xbb\x92^&\xa7}\xba\x0f\xcb\xd6U\
+\xe2\xb1Y\xb5\xa8\xfc\xae\x9b\xe9GIY\x03\xeez\xac\
+\x0a\xbb\xe7v2\x96\xefhI\x00r0s\xdap\x85\
+\xa1-\x901\xd4\xb4\xf4\x06\xf5\x22\xaa\xc8TG\x97\xc7\
+\x10\x80c\xe0b5\xf6\x12p\xb0\x89\xb84AV=\
+\x0e}\xfb\xf4\xa2F\xf41kz\x80WR\xb2\xee\x9a\
+\xb3rO\x13\xb9\xa1\xd1\xf9\x82\xf2\xda\xd7\xeb\xc057\
+;\x0b\xabW\x02\x8b\x07o\xc4\xe9\xfd{\xa2U\xbbT\
+T\xf0-\xc1\x993\x8ea\xf9;9\xdc\x8bpy$\
+#\xf3W\x9d\xc0\xf5W&\xa3W\x17\x8dx\x10{\x8f\
+\xf81\xb6O\x12\x8d'\xeb5\xff\x19\x5csc\xd2\xfa\
+i\x8e\xff\xe8\xdeE\x0a@\xad\x88\xaf\xb9\xc6\x11\xd8\x0d\
+]\x07RB\xd0\xe2\xa4\xebr3mXl\x96Mv\
+\xdc@\x10V';A\xd7YR\x99\x84\xf1\xbb\xbb\xef\
+\xc4\x92\xe5\xf9x\xe2\xe3y\xf8\xea\x86g\xf1\xdc\xbd\xc0\
+\xa6}\xdd\xf1\xa7\xdft\xc1\xf814|\x9cb\xfe\xda\
+\x00\xa6?Z\x8e\x95\xcfv0\xbe\x84\xf0o\xdc\xe5\xc7\
+\xe8\x01\xdc\x8b\xc8}p\x16\x02\x87\xf1\x10\x83!6<\
+%6\xe9\xf0ls\x91F\xd0t\xcaV\xb5\x10\xc7\x80\
+\xd3\xf2\xa8N\xeb0B\xb1\x82F\xdb|\xe4Z\x1ab\
+\xeaY'\xbf_\x97\x1d\xc9\xc9\xc9\x98r\xc1\xb9x\x7f\
+\xd6\x9f\x8c\x1d\xa9\xef\xfc\x1a\x96\x1f\x1c\x8c/f/\xc3\
++o\x7f\x86\x92\xb2\x00\x96on\xc2\x05#\xd31\x96\
+^\xa5N\x90\xe4\x0a//\xf0c@w\x9e<\xb9|\
+8Qd\xc7\xc4\xcf\xa9\x84H\x0d8\x95\x16.\x8cF\
+<LD,\x88\xa0\xc3\x8a\xcd\x85\xeb\xa3\x11;m\xe5\
+\x03\xe8\x04G\xb6Dv\xa4o\x9f\xde\xb8\xfa\x8a\xc9\xd8\
+\xb2u\x07>\x9c\xbd\x087]\xfe\x1aP\xf8\x03~\x7f\
+[[\x9e\xfc\xe4\x22\xb3U\x22j\xcak\xb1\xf8@\x80\
+Go\xd4\x00\x1aG\xa3\x05D/\xaf\xd3\x1bb\xf3g\
+!,\x87\xe6L\xd0\x16\xfeg\xb1\xed\x9c\x97\x90\x15I\
+$+\x16o\x98\xa8\x9dd\x06\x87\xeb\xce\xc9\x8eH~\
+\xc9\x5cF\xc7q\xeb=f\xd4p\xcc\xbcu\x066r\
+\x85\xf9\xe4\xcby\xc8\x1a\xfd\x22\x9e\xfc_\xa0}\xfb<\
+\x5c1\xac\x0d\xb2;P#t\x03\xc5\xd3c_|*\
+Jy\xb5f\x0c\xa1\xc8\x98\xe0\xe5\xc2\x9b\xf6\xf2AN\
+bm\x87-\x8aS\x89#\xd1\x85[4W\x1e\x86\xf0\
+\xa6\xc2\xd0\x12\xa8\xf6\x1a\x9a2\xc6p\xd2c\xac\xe3\xd5\
+\xd9\x81\x03\x07\xf1\xed\xd2\xd5x\xe2\xad/pl\xcdl\
+<s\x0f\x90?|\x08\xef\x0e3\xf0\x87GW`\xf0\
+\xe4\xc71\xf3\x8e[i6\xf4\x1e\xc0\xc1m\x07\xc9K\
+):\xdd\x8c\x00\xc2\x0c\xa9\x81\x1d\xe5\xc8\xd2hTa\
+Hg*8\xe4\xd5Fy\x87'\xefH\x98\x0a\x83\xdb\
+I\x85\xf5\x22T\xc3\xc6\xce*\xe23W\xf4:y\xaa\
+\xac<\xc1\xeb\xf0\xdd\x98\xbbp\x15\x16\xac\xde\xc8wH\
+\xf5\xb8j\xd2h\xdcp\xcd4\xae\x1a\x99f\xe5\x91\xf0\
+\x14,\xdf\x0e>\xfbk{\xe1p\xd6\x8c\x00\x1c`]\
+B\x08\x99\xfe\xbc\xc6Lib7\x1c\xab^\xf9\x10Q\
+\x8d\x1e\x19\x0dw\xdfm\xab6\xe4+\x04g\xdaX\x1b\
+\xec\x8c\xbae\xd1\xb6\x8f\xa6)\x9b\xa1+;\xdd\x0dh\
+\x8b^\xab\xfd\x02\x19\xd1\xfb\xc0\x00\x97\x5c-\xbb2\xc2\
+\xe1[*\x87\x9e\xc3\x8b\xc5\x1e\x19\xb7(\x00\xbd\x08i\
+\xe0\x9a\xad\x9bV]\x95\xeb\x15\xa8\xd2:%RGd\
+\xc9U\xaf\x8b\x0a\xdd\xe3\xabL/Gt/o\x84\xe2\
+\x0aNm\x1d\xa6\xb9TR\x9d%\x08\x03\xc7\xdd\x9e\x19\
+%\xb5\xe3\xd6Z\xcc\x8bY\xd9\x03\x1d\xca\x9a\x97\xa7l\
+k\xec\x03\xf9\x16\x8c:Y\xcfv\xc2'z\x1a$m\
+\xac\xb4\xb2\x08W=\x97N\x8bK\xfc\x19\x1f\xc5\xf4Y\
+Z!\x08\x91w4D\xc51\x04\xe0\x80\xa8\x03[x\
+\xe1\xd0\xb3'\x1d\x94VY(..\xc1q\xbe\x04\xd5\
+\xe6e\xc7\xce\x1d\x86P{\x1e\x9b\xf7\xe8\xd1\xdd\xbc\x1c\
+\x192x\xb0!\xb6\x93\x07\xa8}z\xf7v\xcf\x0a\x1a\
+y\xa2\x9b\xc8W%\xe5X\xb5j\x15\xef\x19\xb20\x96\
+o\x0a\xc5\xd4\xae\xdd\xbb\xf9\x96\xb7\xbf9m\x96\xc0\xf4\
+\xbe\xf7\xc4\x89\x13\xa6\x83\xc3\x87\x0d\xe3\xf3\x96l\x1c<\
+x\x10\x85|uz\xfa\x90\xa1\xa6\xb3\xdbx\x04\xd7\xbe\
+}6\x8f\xe0s\xb1{\xd7nN\x8b$\xee\xc1\xd2y\
+K\xb4\x99\x03P\x8f,\xbe\x07\xcc\xcb\x1b\x88\xcd<S\
+(\xe7KU\xdd\x12+\xdfD\xa1\x19\xa9\xf37\xa4\xba\
+&M\x7f\xc5\x8d=\x91#U\xbd\xff\xf9\xe2\xcb9X\
+\xbdz\xb5y\xea\xfa\xcd\xbc\xf9(\xd8\xba\x15\xdb\xc9\xc4\
+\xebo\xfe\x93\xf7\xf6\xf4\xca\x18\xf4\x80\x22??\x1f\xdb\
+w\xec0\x1ar\xd7\xbd\xbf7\xa3\xac\xd1\xf1Qct\
+\xbb\xfb\xdb{\xef3\xde\xdfw\xc4\xf5\xe2\xcb\xaf\x98\xfb\
+\xbe\xfb\x1f\xfa3;K\xcd\xe21p-\x97\xc2;\xef\
+&\x8c4\x82\x82\xd7\xbb>i\xdb\xbf>\xfb\xcc\x9cD\
+\xa93\xf2\x19\xde\xfa\xe7;\xc4\xf5;#\xdc%\xdcK\
+l\xe1#\xcd\xc3G\x8e\xe0\x89\xa7\xffn\x0eh\xc4\x8f\
+\x84x\xcd\xcd\xb7\x9b\xe7\xf2\xaf\xbf\xf96\x96/_i\
+\xa6\x884\xc5\x09\xe1\xd1W\xde\x11@d\x99\x81#\xff\
+\x98\xfa\xd3K\xb1\x9c\xcfO\xfcT\xdb\x15\x8c\xcf<\xe3\
+\x0c\xa3B\xa3\xf9\xf08o\xe0\x003\xd2\x9a\xaf#\xc7\
+\x9f\x89\x97^}\x8d7\xb9\x15\x186d\x90\x11\xb6:\
+\x225\xdd\xb0q#\x06\xe7\xe5\xe1\xbf\xf9\xc6\xe0\xf6\xdb\
+n\xc3\xc4\x89\x13\xcc\xb4\xe9\xd9\xa3;\xe9P%\xa5p\
+\x0c\xc3\x06\xe7\xa1\x7f\xff\xfe\x90&\xe9\x82SW\xdf\xda\
+\xe6\xbe\xf4\xf2\xcb\xbc\x13\xf8\xdeL\xc1\xee\xa7\x9d\x86\x8f\
+?x\xdf<~\xee\xc4\x07\x11\xd2.\x09:\x7f\xec\x18\
+\xf32\xbc?7f\xb2\x11\xe7\x9f5\x1e\xe7\x9fw\x1e\
+&N8\x8b7\xc8\xeb\xcc\xb5\x9aa\xdc!\x15\xf1\xeb\
+\xbal\x11e\x06\xa9TJ\xce\x89\xe6\xd4\xba\xf5\xeb\xcd\
+\xa1E'\xaa^\x80;\x96\xf5\x1b6\xe2\xebo\xe6c\
+\xff\x81\x03\xe6\x91\xc2\xd4\x8b'\xe3\xd2)\x93\xf1\xfc\x0b\
+/qYJ5FH\x06KB\xa8\xae\xaeF\xc7\x8e\
+\x1d\xcd{@\x8d\xf6\xa0\x81y\x06\xbf\x0c\x95l\x89\x96\
+:\xcd\xfd\x92\xb22,Z\xbc\x18\x8b\x96,1\xcch\
+\x8a\xe8!fNN\x0e\xe6\xcd\xff\xb798\xd1\xe8~\
+3o\x1ea\x96\xe2[>\x8c\x90\x96\xaa\xad\xae\xc9\x05\
+\xb3u\xdbvjN\x02\x0e\x1e>\x82\x9bn\xbd\x0dO\
+??\x0bW\x5cv\x99\xd1,\x09*V\x881\x05\x1c\
+#!c\xa37\xb6\xa38\xda\xe3\xc7\x8f\xa7*\x9e\xc1\
+c\xabT\xce\xadr:)#q\xd5\xb4+\xd0\xbb\x17\
+\x1f\x22QP\xfb(\x08\x9d\xddkn?\xf5\xe4\xe3|\
+O\x90\x8a4\xee\x00e\x8c\x06\xf2\xcd\xfe{\x1f}\x8c\
+cEE\xe6F\xf7\xc1\x87\x1f6\x028D\xd5\xd5\xc9\
+oa\xe11\xd3Ng\x8c\x17O\x99\x82\x8b.\xbc\xd0\
+\x18\xb6\x85\x0b\x17\x99[\xa1r\xdeJ\xad\x5c\xb3\x0e\x87\
+\x0f\x1f6\xf3\xbc-m\xd0\xb4\xcb/\xc3s\xcf\xfc\xcd\
+\xa8\xb9\x8c\xea\x88\xd3\x87b\xda\x15\x97c\xe8\x90!\x9c\
+~\xb5\xe8\xc6\xb9\xff\xd0\x03\xf7\x9bK\xd44\xf2\xe2Z\
+\xbeX\xfdG\xfc=\xf7\xdc\xf3\xc0\xc95\xae\xad\xa4z\
+\xebv\xa8\xac\xb2\xdatXFF\xa3\xb0l\xf9\x0a\xac\
+\xa4Q\xd3\xe8J-\xab\xaa\xab0\xfc\xf4a\xe8\xdf\xaf\
+\x1f\xda\xf3I\xbc4E\xb6b\xf7\x9e=d\xa2\x1bz\
+\xf5\xe8\x8e\x178\xf7w\xee\xdc\x85\xeb\xaf\xbd\x86\x86\xb4\
+5_\x98\xef\xe5\xa9r\x01Go=w\x90\xfd9}\
+*\xb1\x9c\x97 \xab\xd7\xacE\x87\x0e\x1d\x8c\xe1\xfc\xf9\
+\xcfn\xe4I\xf4X\xb4\xa5\x11\x16G\x19|\xa8\xd1\x96\
+\xd3c\x10\xa7Tn\x97.\xc8\xa5feg\xb7\xc3\x82\
+\xc5K\xb0n\xdd:>\xd5?Bw\xba/J\xcbJ\
+1\xf1\xec\x09\x5ci\xf8\x94\xaf\xe8\xb8\x99\xaa\x11\x0f&\
+=\x1d\x8e\xb1\x0a\x84k\xb5h\x98\x0d\x0cUW\xcb\x9f\
+\xf38A\x9b\x19m*\xc9\x92\xf9w`\xec\x1a\xacQ\
+\xd7\xbb\xbdM\x9b6\x1b\xf5\x1c;v4\xbau\xed\x8a\
+\xaa\xaajs\xc7\xa7;FY}\x199\xdb^SE\
+t\x9cE\x8a\x1e.\xa7\x87\xa6\x8bp*\xadib\x1e\
+=q@\xd4\xc6Y\xfa\x12\xcd\xda\xaf\x82P[/?\
+\x5c\x02e\x0ftI\x22\xbc\xde\xa5/\xdc\xc3\x98\xcb\xa0\
+\xb7Z\xe8\x89\xd5\x0dBb\xf3a\x84N\x89\xadSg\
+$\x04\xcdo\x05\xd9\x10\xf9\x0a\xba\xdf\x97\xc5\xe3\x7fX\
+\x80.^\x1b\x85f\xa9\x04,@\x06\x8b\xd7\x1b\xab\x5c\
+\xf5v^\x8b\x83P[\x97\xc7\x10\xbc\xe6\xbeP\x85\x01\
+\x9c\xbc\x900\xb4\xa8\x01\xa6Q\xb8\xffN\x8b\x16\x7f\x1d\
+Jb.\xd4\x01\xd7+t\x98\xf4r\xe1 \x8a\xe6\xed\
+dn[$\xf8\x9fWZ\x16\xdc~5\xbf\x1d\x16\xe0\
+\x7f\xd4y\xf1\xe2`\xd7\xc8\xd8\xd1\xb1\x1cjDb\x85\
+\x93K\xc3%\xcd\x09-\x16\x9eS.\x8b\xeaS\xd4*\
+\xe0\xa9\xf5$O\x19\xb9\x07\xb0\xa5\xe6\xb1\xeb\xa2K\x1d\
+\xb5\x96\x10N-\x9c*\x1c\xb1\x85e\x1c\xed\x09zj\
+N\x8dj\xb3P-a\x8a]\x17]\xaa|sz\xe3\
+!\x1bj\x16Jx*\xa3\x92\x16\xc4#\xab(\x0d\x88\
+j\xf0\xff\x92\xf5p\x13\x93\x9e\xe5:f\xe5\xa9OS\
+\xa1\x89A\xea\xff\x00m\x0dj\x22_\x01>X\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x1a\x8c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x18<IDATx\
+\x01\xed[y\x94T\xc5\xb9\xaf\xdb\xfb\xde\xd3=\xfb\xb0\
+\xcc\xc0\xb0*\x01\x5c\x22ID\x16#FY\x0c\xca\xe2\
+\x12\x11\x8cF4\xfaL\xd4$nI\xc4\x17\xf5\xc5\xc4\
+$j\xd4H\xa21y'Q\x02\x98\x87k\x8e\x08\x22\
+`\xa2,\x22\x86E\x18fa\xf6}\xeb\xe9\xe9\xbd\xfb\
+\xbe\xdf\xaf\xba\xef\xd0\xcc\xc6\xe2\xe0y\x7f\xbc\xef\x9c\xdf\
+T\xdd\xaa\xbaU\xf5-\xf5\xd5Wu{\x84\xf8bI\
+\xa7\xaa\xaa2\xd0\x90\xabV\xad2\x0cTw\xa6\xca\x07\
+\x9c\xcc\x19\x18P\x8f>\xe3\xecw\xc6\x85\x93\xaf8\x7f\
+\xda\xa5\xf3\x8d&[\x81P\xd4`[S\xf9\x9e?\xbc\
+\xf8\xd7WPu\x14\x02\xd2)\x8a\xa2\x22O\x9cq\xfa\
+\xa2\x04@\xcd\xc6\x80\xac\xbb\xef\xb9\xf7\x7f\xdc\x9e\xe1\xd3\
+\xe3\xc2.\xf2\xf2\xf2\x84\xcd\xee\x14:\xbdAt\xfbj\
+\xe2[7\xfd\xed\xc15k\xd6?N+\x01\x91\xf93\
+.\x84/\xc2\xe44\xe6\xbd\xf7\xde\xf7\x93\x1d\xc1\xb0y\
+\xb4\xdb\xe5\x8e,\x98\x7f\xb1.;\xcbC.\xd5\xc6f\
+\xbfz\xa8<\xd3x\xe3\xadS~\x9e\x9d[\x98\x0d\xe6\
+\x7f\x90\xb2\x843.\x843-\x00\x8dy\xd7\x8f~t\
+\xff\x87\xe5\x15\xcd\xa3\xe7\xcd\x9d\x19Y~\xc35&r\
+\xa6\x91\xd3i\x13\xb99\x0eu\xfb\xce\xba\xd8\x82\xabn\
+\xbbG\x8dG\xa3\x10\xc2\xfd\x10\x82\x1ei\x02\xed\xce\x98\
+%\x9cI\x01h\xcc\xdb\xef\xba\xeb\x07\x1f\xee?X1\
+\xee\x8a\x05s\xa2\x1a\xf3\x89\x04\xf9\x12\x22\x1a\x8b\x8bX\
+4.\xf4:\xbdr\xee\xd9Y\x86\x1d{\x9bb\xdf\x5c\
+\xfa\xbd\xfbb\xb1\x18\x85\xf0\xd3/B\x08r\x22C\xfc\
+G\x13\xac\xe5\xf6\xdb\xef\xfc\xf4\xe2\xaf\xcfW\x9fy\xe6\
+\xf90\x98\x91\x04\xe6\xd5x<\xae\x86\xc2\x11\xd5\xef\x0f\
+\xa8\x9d\x9d~\xb5\xbe\xa1U\xadkhS\xcb\x8e6&\
+\xfe\xfe\x8f\xc3\xb1M\xdb\xcb\xd4\x1bo\xba\xe9\xa7\x9c\xd7\
+\x96-*\xfb\xfb\xa2\xfc\xd5\xe7\x16\x05\xbd=\xc9\xb4r\
+\xe5\xad\x1f_8\xfdb\xf5\xa9\xa7~\xdb\x97\xf9PX\
+\xed\xea\xeaV\xdb\xdb}`\xbeE-\xaf\xa8SKJ\
+k\xd5\xb2\x8a\x06u\xffg5\x89W\xdf.\x91BX\
+\xb6l\xd9\xfd\xec,%\x04f\x87\x944M\x0dU\xa7\
+\xdaV\xa7\xbf\xf9\xe6\xefl\xdf\xf3\xc9\xbes\xaf\xbbv\
+I\xe4\xce;\xef\x90k\x1e\xea\x17P\xbe\x88F\xa3)\
+\xc4\x90\xc6\x04\xac@D\xb0\x0cX\x17\xc7Fi0\x18\
+\x95\xc2\x02\xa3\xae\xb2>\x16\xbf\xe1;\x0f=\x16\x0e\x87\
+#\xb3g+\xbf\xda\xa2\xaa\x86\xd9\x8a\xc2\xddd\xc8h\
+(\x05\xa01/n\xbc\xf1\xdb\xef\xef\xd9\xb3\xef\x82\xeb\
+\xaf\xbf:\xf2\xfd\xef\x7f/\x8d\xf9\x84d8\x12\x89\x88\
+H\x04B\x88\xc5DwwP\x22\x16'\xf3\x09\x91@\
+\x9c\xa4\xaaaa0\x9a\x94\x1c\x8f\xaaklS\x127\
+\xdf\xfe\xd8\x13\xd1p8\x0a\xe6\x9f^\xbd{\xb7q\xe5\
+\xf9\xe7G\x87J\x02C\xb5\xaez\x98_\xb6l\xf9{\
+{\xf7\x1e\x98\xbd|\xf95\x91{\xee\xb9\xa7\x17\xf3Q\
+0\x1b\x101\xa89\x06\xe7\x17\x0a\x85EG\x87\x0f\xda\
+\x8f\xe19\x01\x01\xd0B\xe8\xf2\x15\xa1(\x06a\xb6X\
+D0\x94P}A\xb3\xea\xb0&t\xbf\xfe\xaf\xef\xde\
+\xf6\xce;\xef>?\x94B\xd0\x0d\x81${\x98\xbf\xee\
+\xbao\xbd\xb3\xfb\xe3\x7f\xcf\xfe\xd6\xb7\x16\x1f\xc7<M\
+\x9fZ\xa7\xe9\xbf\xfb\xee{\xa2\xb3\xa3SD\xf1\xcc\xb4\
+\xbb\xbb[\x04\x02A\x11\x80`\x98'\x82\xc1\xa0hn\
+i\x15\xe5\x15\xb5\x10DB1\xe9\x03\xc2\x1f\xd2\xabw\
+\xdf\xff\xec\xeff\xcc\xf8\xeaM\xb4\x00\x0aa\x08\xe6.\
+>\xaf\x00\xf8\xbe\x0co\x17-Z\xfa\xd6\xee\x8f\xf7_\
+z\xf5\xd2\x85\x91{\xef\xbd\xb7G\xf3d>\x14\x0aI\
+\xf3\xae\xae\xae\x11\xbf\xf8\xe53\xa2\xad\xad]t\x07\x02\
+\xa2\x1d\x02 \xf3\xdd\xfen\xe1\xef\xf6K\xe6\xbb\xba\xfc\
+(\x0b\x88\x86\x86&\xb1q\xf3NQr\xa4\x12&\x11\
+\xd3\x85\x03\xedjg\xc0\xa0>\xf0\x9f\x7f~a\xea\xd4\
+\x09\xcb\x87J\x08\x9fG\x00|Wn\xe6\xf3\xe7\x7f\xf3\
+\xb5\xd2\xd2\xa3s\xe7\xcd\xfdz\xe4\xc1\x07\x1f<\x8ey\
+80AD\xa2\x11\xb1u\xdb\x07\xe2\x93=[Ee\
+e\xa5\xf0u\xfa\xc0x\x92\xe9`0 \x97\x03\xad \
+\x14\x0a\x0a\x0a\xa1\xb9\xb9\x05V\xe1\x13\xbb\xf7|&\x0e\
+\x1d.\x17\xe1P\xb7\xae\xba\xaaJ\x0d\x84\xcd\xe2\xb1_\
+m\xf8\xd3\xe8\xd1\xfa\xeb\x86B\x08\xa7\xeb\x03z\x98\x9f\
+3\xe7\xd2u\xd1\xa8\xba\xd8\xe1\xb0F\xd6\xacy\xd9d\
+\xb7\xdb\xb1\x8e\x13pdI\xb3\xd7\xb4_WW/\xee\
+\xba\xfb>\xd1\xd8\xd0,\xe6\xcd\xbbD\xcc\x9c9St\
+\xfa\xba\xd0N@\xf3A\xb1w\xef\xbfEMM\x83\x98\
+2u\x8a\xc8\xca\xce\x11\xfb\xf7\x1f\x11\xd5u\xed\x22;\
+'[X\xacN\x91\x99\x95-\x5c.\x8f\xb0;\xdc\x89\
+\xc2\xa2\x22\x9dA\xe9\x12W]r\xd6\x92\x88\x10\xebW\
+\xaf\x86c\x5cyz\x8e\xf1t,\xa0\x87\xf9\xe9\xd3g\
+\xfe\xd5h\xb2,~\xff\xfdw\xa3\xd7^{\xadd\x9e\
+\x8c#\x82\x83SKnq\xf4\xf4tz\xdb\xb7\x7f \
+\x0e\xec/\x07\x136\xf1\xd1G\x1f\xc1\xf9u\xc86e\
+\xa5\xa5\xe2\xa5\x97^\x12\xcf=\xfb\x1b\xf1\xd6\xc6]\xe2\
+\xd9\xd5k\xc4\xb6m\xff\x145\xb5u\xd0:\xd6\xbe\xcf\
+'BA\xbf\xe8lo\x13\x9d\x9d\xed\x22\x18\xf0\xe9\xaa\
+\xaa\xaa\x12\x09]\x86X\xbfq\xff:X\xe17\xc9<\
+\x85p:>\xe1T-\x80\xe7y\x1e\xd5\xd4\xaf|\xe5\
+\xc2\x97,\x16\xdb\x8a\xea\xea\xea\xe8\xe5s\xe7\x1aAb\
+\xf8\xb0\x02\xa17\xe8%cq\x86\xb8d\x1e\xa0\x03\xfc\
+h\xc7nL\x9e\xce\xadY\x1c)\xd9'\x1e}\xf4q\
+Q^^.^|q5\xe6m\x10\xc3G\x8c\x13\x8a\
+\xce(Lf\xab\x08\x86ql\xcc\xf4\x08\xa7\xcb-O\
+\x8b\x0e\x87[\xe6\x9d\xce\x0c\xe1\xca\xf0\x8a\x0c\x8fW\xa0\
+,^8j\xb4>\x16l\x12\x0b/\x9f<\x0f\x9d\xbc\
+\xbdj\xd5Z\xd3\xaaUKa\x14'O\xa7\x22\x00%\
+\xa5]\xf5\xbc\xf3.\xf8\x83\xd5f\xbf\x19N-:\x7f\
+\xfe|\xa3\x1e\xc7Y:\xae\xf6\xf6\x0e\x11\x08\x86\xa0\xb9\
+\x88t|a0\x1eB>\x82\xed.+\xcb-}\xc1\
+\xbf\xf7\x1d\x90Am\x0c[\x9fP\xbb\xc1X\x8e\xd0\xeb\
+\x8d\x88\x09\x840\x83y\x82\xcb\xc8d\xb6a\x1b\xb4#\
+\xef\x80\xd9\xbb$\x9c\xae\x0c\xb4\x87\x10\xdc\x1e\xe1\xf1d\
+\x0a\xbb\xd3\x1d/\x1aU\xac\x0f\xf9\xeb\xc4Us\xa7|\
+\x03lo<U!p\x0b;\x19Rp[\xa3\xcc\x9e\
+=[\x9d:\xf5\x9c\xe7\xccf\xdb\xca\xaa\xaa\xea\xe8\x82\
+\x05\x0b\x8c\x88\xda\xe4\xb6\x85\xd8\x1e\x11\x9cA\xa0@\x98\
+L\x06a\xb1\x98\x84\xc5l\x126\xabY\xd8lf\xb9\
+\x05\xd674`\xebk\x81\xa6\x0d\x02\xb7\x1erM\xfb\
+\xb1\xfe\xa3\x08\x8a\xb8l$!A@\x08\xe2Rb\x9a\
+,\x97\xf5\xc8\x22B\xd0J`m:]0\x18\x8ag\
+\xe7\x15\xe9\x16^u\xed\xb2\xb5/\xaf\xde\xfe\xfe\xfb\xeb\
+J)\x04\xa4rwb\x0f\x83\xd1\xc9\x08@2\x0f\x01\
+$\xce>{\xf2\x93`\xfe\x8e\xca\xaa\x9a\xe8\xc2\x85W\
+\x18M&\x93\xdc\xc6\xe2\xf1(\xb4\x0b@\xdb\xf4\xf8\x0c\
+p\xa4\xf7GJ'\x88H\x16\xe1n\xb74y\x9d\x01\
+\x9b\x04\x18\xd4\xe9\x14\xf9\x0e'\x87\xf0G:\xcdc\x13\
+M2-9e\x16\x92\xd0\x18O\x0a\x0aO\xb2\x89\x02\
+\xebI\x0a!\xaf\xa0X7\xff\x8a%\xcb\xd7\xaf\xf9\xfd\
+f0_\x81\xf9B\x08\xef\x9fP\x08'\x12\x80\xb2d\
+\xc9\x12\xdds\xcf=\x97\x18?\xfe\xec_`}\xde]\
+YY\x1d[\xb4\xe8J#M\x95\xde[c^\x0bt\
+\xb4\x94Ze^\x86\xbc\x08\x80\xea\x1b\xeaa)\x010\
+\x9e\x8c\xbe\xe9\xfd\x8f\x11\xc3_U\xee\x08)\xbez\xaa\
+4\xc3\xa00\xd2\x99\xef\xc9\xa3\xa5\x0eR\x08\x04\x83\xf1\
+\xe1#\xc6\xea\xe6-XD!\xbc\x03\xe6\xabV\xaf^\
+m|\xf3\xcd7\x93\xe7\xee\x9e\x1e\x8f\xcf\x0c\xba\x0b\x90\
+\xf9u\xeb\xd6\xc5\x8b\x8b\xc7>b0\x98~XQQ\
+\x15[\xbc\xe8J\xbd\xc5B\xe6\x03'\xc5<\x9d`\x97\
+\xdf'\xdaZ[`\xb2\xa6^\x9a>~2\x89\x04\x9c\
+&\xe2\x05F\x89\xd1\x08b\x87H\x08\x16\x14\xc4.\x80\
+\xf8 \xc0\x88\x91AR\x17\xc6\xee\x82E\xf9$\xba\xba\
+:\x85\xcf\xd7\x81\x98\xc2\xa7/\xaf(\x8f\xe7\xe4O\xd0\
+\xbf\xb2a\xf76\xf4|\xde\xca\x95+\xa3\xb7\xdc\xb2z\
+\xd0\xdda@\x0b\x985k\x96\xe1\xed\xb7\xdf\x8e\x0f\x1b\
+6\xf2~\x8b\xc5\xf9\xf0\xd1\xaa\xda\xd8\xb5\xd7,\xd1\xdb\
+\xec\x0e\xe5d\x98\xa7\x050\xf4\x0d\x83\x91\xda\xba\x06\xec\
+\x06q\xac}\xa9\xdf\xe3\xb9\xee\xf5\xa4\xaa\xe9\x0aK\xb5\
+\xd7\x12.\x05E\x97\x84\x8ei\xf2\x19\x99\xe42\xc1r\
+\xe8\x0e\x86bEE\x13\x8cs.\xbb\xe2\x86\xbf\xff\xed\
+\x857>\xfe\xf8\xcdz\xf2r\xf4\xe8\xd1\xf4\x8e{F\
+\x1dH\x00|!f\xb3\xd9\xe6y3s_<RR\
+\x11_\xb6\xec\x1a\xbd\xcb\xe5\x02\xf3\xdd\x22\x0e\xad\x86S\
+&N&{\x9b\xbdd\x1c\x9a\xa4\xf6\xb9\xdfw\xb4\xb5\
+A\xfbP\xc4qf\xdf3\x87\xe32l\x22\x85\x90j\
+\x9b\xe4=\xf5W\xa7\xc7\x12\xd2\xa7\x09\x00B\x80 z\
+\x04 \x05\xa2\xe8\xfc\x81`l\xcc\x98/\x99.\x9a1\
+g\xe9k\xaf\xbe\xf4g\xf0\xd2\x85ni\xed}f\xd0\
+\x9f\x008\x9a\x94\xd6\xf0\xe1\xa3^+/;\x94\xbd\xf0\
+\xca+\x13yy\xf9z:\xb2\xe4\xbe~\x8c\xe9\xfe\x98\
+\xd7\xd6=\x1d cz\x04\x0e\xe8\xf2\xe4\x88-\xe1\x0d\
+\xd2\x96\xca\xb1w)D)\x00\xa9\xfd\x94%\xd0\x22`\
+Y=>!i\x15\xf0\x09\xa1\xc8\xc4\x89S\x9d#\x0b\
+G\x8c\xdc\xb2\xe9\x8d\xf5kq\xdd\xbe\xee\xe1\x87\xfb\x08\
+\xa0\xbf\xfb\x80\xe4\x1c\x84\x18\x87\x0b\x8a\xf1\x98O\xc2j\
+\xb5\x1a\xc88\xb7:M\xe3\x1a\xe3\x1a\xb3r\xddJk\
+H\x9a=\xdbw\x22\xde\xe7\x9a\xd6I\xed\xf7\x19{@\
+\x89\x80\x1d\x88\x80\xc7c\x1e\xfb\x93\x02\xd0\x81\xe9X\x1c\
+A\x15\xfa\xd3cY\xb1O\x0aD\x8fm\x97\xd7\xea\xdc\
+Z%\xf4\xd0)\xac\x04\x224\xd6\xd6;\xc4\xb0\xc2\x89\
+s\xd1I\xceREiJuv\xdcD\xfa\x13\x806\
+1_ \xd8\x1d\xcc\xcd+\xb2o\xdd\xba->e\xca\
+d\xc5f\xb3C\xd0:\x85\xa1-\xe3}\xaek2\x1a\
+Ky{N.)\x98\x98\x8c\x0d:p\xda\xd3a\x82\
+\xd2\xbdk\xbd\x9edJ!$\xe8\x0f(\x04\xec\x10\x06\
+\xb3E*\x00w\xa5R\x08:\x08\x81\x01\x18\x99\xd7!\
+\x90J\xa6X\x1e\x10\x14\x85\xc5\x88\xbc\xad\xb5Y\x84\xbb\
+\x83\x16\x0c\xe9\x04NZ\x004\x7f\xae\x97\x86\xe6\xa6\xba\
+\x9f{\xbd\xb9\x0f\xe9,6\xc3\x96-\xffB\xf8iA\
+dfMXpQa2\x99\x15#\xae\xae\x92\x83\xe1\
+\x9a+%\x0cZ\x08\xaf\xb9\xa8}\x9a2\x199]\x92\
+\x96\x00!\xc4\x13\x08\x94\xa0\xd5x\x22\x9e\x12\x02Cl\
+\x8e\x93\xb4\x86\xa4\x15\xc0?@\xd8\xb4\x0a\x05V\x80\xd7\
+b\x09\x8f\xcb\xf0\xe9\x9e\x0fj0~]j\x0e\xc7i\
+\x9fe\xfd\xf9\x80T[\x99l\x0b\x06\xbb\xf7\xfa\xbb:\
+\x8c\x19\x19n\x97\xd1dt`R\xba\x08\xae\xed}>\
+\x9fR[_\xafVUV\xa8M\xcd\xed4W\x85\xda\
+\xe7\xbd\x1e\xf6dlM\xd0>\xcd\xb1\xcf\x90\xe9\xdd\x9f\
+ \x0f\xd9qk\xb4\xe2\x0c`0\x9a\xa5\xf3c\x9f\xd2\
+\xf1A\xb0\xb2k\x08\x86\x96@\xa6i\x95\xf1X4a\
+D\xd0\xee\xb6\x9b\xf5\x07\xf6}(\xfe\xf8\xfc\xcf\xbe\x8f\
+Qv\x03\xe4\xb5\xcfN0\x98zX\xa7M\x9f/\x9f\
+\x05L#\x5c\xee\xccs\x9cN\xd7\x18\xab\xc5\xea\xa6\xc4\
+\xb93\xd4TW\xa0\xca\x80\x89Z\xa0\x056We\xb8\
+\xcb\x0e\x18\xf6\xc619ZFO\x8f(\x1f\x90R#\
+\x93y\x9b\xcb\x8b\xe3\xb0Cz\xfa\xe4\x0e\x80P\x1bq\
+\x88\xcb\x8ds\x81\xd3\x85\xf3\x82U\x98\xf4\x06\xd5j6\
+\xa9v\x9bMq:\x1c`?!JJ\xf6Um\xdf\
+\xb2\xe1!\x8c\xf1' \x9d\x97\xe3\x86\x1dL\x00ZC\
+r\xd3;\xa4\xccE\x19\x05r\x91\xc9d\x9f7b\xe4\
+\xc8)\x06\xbd\xd1TV^\xa9\xc4\xa2!\x14\xe38\xd7\
+\x0f\xb9\xdc\xd9\x0c]\xb1<\x02\xd0\x22\x86\xc6BMp\
+\xb1\xa6/\x13\x08+\xb9\x0d&\x84=#[\x98\xad\xf6\
+dO\x90\xa4\x01'Nw\x86G\xe0\xd3\x9a\xb0Z,\
+\xaa\xd3nQ=.'\x96\xa6\x03+Q\x0f\xab\xf3\x89\
+\xea\xda\xaa\xaa\xad\x9b_\xdb\x80\x97~\x07\x1c\x02\x06d\
+\x9e\x1d\x9f\x8c\x00\xb4vlK\xf4\x16\x06\xeb\xef).\
+\x9e\xf8DYY\x89\xea\xcd\xcaS\x0aG\x8c\xc0\xa9\x0e\
+\x1e\x1a\xa2\x03\x7f\xc2h4\x89\x86\xc6Fq\xf8\xd0~\
+\xb6\x05\x139p\x92\x11\xb9}\xb3\x9ew\x06\xda6\x96\
+\x80\xd3c\xc4\xe8\xf4d\x0b#\x1c\x1f\xeb\xc9\x1c/H\
+\xadV\x8bj3\x19\xd5l\x8fC\xe4\xe5f\xeb<^\
+/\xeaU\xd1\xd8\xd8\xe8/))\xf9t\xef'\x1f\xbe\
+\x85\xee_\x07p\xe4\x94D_\xd6\xc7\xecSu29\
+Y\x01\xf4zg\x09:\x96\xa7-CN\xce\xb0\xeb\xb2\
+\xb3s\x7flw8\xc6:\x1cv\xd5\xed\xcePxH\
+\xca\xc4y\xde\xe3\xc11\xd6f\x11\x19\x19\x19r\xa2,\
+?p\xe0\x80x\xf2\xc9'\xd3\xfb\x13\x06\x93[\xee(\
+\x22\x11\x11f;\xce\xfa8\xf3\xf3\x88\xcc\xe5B\xc7\xc6\
+\x9dF\x8d\x87\x13\x05Y.%?/G\xe1q\x19~\
+(\xd4\xd2\xd2tp\xc7G\x1flEg\xef\x00;\x80\
+\x8eT\xc7\x9a\xb2\x06e\x9emOU\x00l\x8fia\
+_qf.\x9f4i\xd2\x8f\x11\x1a\x8fq:\x9dx\
+v\xaa8\x01*tDD\x92h\xce<&\x0b1\xac\
+ O\x8c\x1aU$\xbc\xd0\x1a4&F\x8e\x1c)v\
+\xed\xda-^\xf8\xe3\xcb\xf2\x14\x19\xc7\x1eoqza\
+\xf2\xce\x945\xc0k\xe1E8a\x11\x0f\xb4\xe1\xb2%\
+\x0fVeF\xfc\xdfUz\xa4\xe4\xe0{\xe8\xff\x1f\xc0\
+\x87@#\xa0\x115N\xd2&\x90|\x1a\xe4\xef`q\
+\xc0\x80\xaf\x19\x8d\xaeWp@\xba&\x03\x9a\xaa\xad\xad\
+\x8bbR\xfax<WG\x0d\xeba\xf7\x04M\x93[\
+b\x10\xd7;<\x1e\x97\x95\xd5\xe2Zl\xa7(*\x1a\
+&&N\x1c\x0fsn\x16\x85\x85#EA\x9eG\xd4\
+6\xf8\x85;3\x1bk\x0b\xc1\x0e\x1c%\xdc\x80\xdc\xf6\
+\x12\x887B\x9dM\xa2p\xc4\xb0xSc\xe3\xfe\x96\
+\x96\xfa5\x98\xd4z\xa04mrT\x8af\xead\xfc\
+\x94\x94z*\x8d\xd9\x96\xda7;\x1c\xde}6\x9bs\
+\xac\xc5j\x91A\xc7\xd1\x8aJ\x0c\x1cS\xf2\xf2\xf3\x15\
+\xfe\xe8\x81&\xef\xc0M\x0e5\xc8\xe8\x91w\x03\x8c\x14\
+)\x88\xf6\xf6.QS\xd7*\xb2\xb3p\xa2Dh\xad\
+\xb38\x85\xdb\x9b%\xe3\x08\xee\x12\xb4\x1e\xfa\x03\xae{\
+\x08P\x0d\xb7W+Y\xd9Y\xb1#%\xfb/\xc5\xd8\
+[\x00\x12\x15\xa7iY2=k\xd6,\xfd\x96-[\
+\xe2xW]\xbbv\xad\x1eGx\x05Gbl;\x83\
+\xd3\xa9\x08\x80=iB\x98\x8c\xfc\xf56\x9bg>\x96\
+\xc0\xc4\x0c7\xef\xeel<\xba&J\x0e\xefc\x1b\xc0\
+\x84{\xbe\x11\xf0\x05Yr\xbb\xe2V\xc8\xb3\x01\xa3\xc7\
+(\x82\x98n|\x070X\xdd\xc2\x08\x93g\xfc\x90\xfc\
+Z\x04^\xe8\xf5\xe4\x89\x0fB\x80%u\xf9:\x12\xe6\
+x\xa7\xcen\xb56\xb5\xb5\xfb\x1eim\xad\xf9-'\
+\x02\xd2v'M\xfb\xc9\xd2c\xe5\xb4B\xc8C\xfe\xdc\
+F\xab\xeb\x93\x9e\xaa\x00zw0\x12\x05\xf31\xe6b\
+\x8f'kZVv\xb6M\xa7`;\xea\xeaR[[\
+\xdb\xd5H\xb8]\x0aC\xd19\xc4\xb8q\xc5\xc2\x85}\
+\x9b\xb7C\xe1pP(F\xab\xb0f\xe4\x82\xf9\xa8t\
+r\x5c.1|\x1b$\xc9#/\xb7I\x08\x0d\xbf\x1b\
+\xe0\x91ZU\x22~\xc5\xa2DqK\xdc~\xa0\xbe\xb1\
+\xf1\xdb\xd8;v\xa2)-\x81Zv\xcc\x9c}\xf9\xdd\
+\x0b\x17\xce\x9b\xd7\xd6\xda\xe1\xc6\xd5{]YY\xd9s\
+\x9b7\xbf\xb9\xfeDB8]\x01\xf4v6\x88T\xc4\
+,`)B\xb29^oN\x9e\x09\x91\x1b\xf7x\x9c\
+ U\x5c\x98\xc2\x1b\x06Dq\xf1$\x5cn:\xe0\x17\
+p\x99\x82\x88Q1\xd9pRdd\xc7\xf0\xd5(\xad\
+\x80\xc6\x93<\xdd%\xcf\xfb\x0c\xb5\x19\xe7\xf3\xbbi$\
+\x1c\x8c\x1b\x13!c\xb0\xb3Q4\xd7\xd4N\x83\x87\x81\
+\x10Fz2<\xea\xeb\xe7\x9c3i\xfa\xe8Q\x85\xa2\
+\xb5\xad\x03\x9a\xd7\xe1\x12& \xde\xdb\xf4\xc6r\xec\xda\
+\xff\x8dyi\xd6\x82\xec\xf1\xc4\x8a\xd3!\xfa\x02\x82\x82\
+\xa0\x10\x19\xf9\x94`\xed\xbd\xfe\xc9'{6\xd7\xd6V\
+\xb5\xfb\xfd\x1d\x1e\xf0\x9f\xedr\xb9\xa1P\x1d\xac!\xa4\
+X\x10\xd4\xd8lV\xe9\x1c\x19\xc7\x07:\xdb\x84\xbf\xbd\
+Yt6\xd7\x8b\x04\xcc\xdebw\xcb\x90\x96\xeb\xdf\xc0\
+\xf0\x16\xcc\x87y\xc6\x00\xf7V\x8b\x19\xbe G\xef\xc9\
+\x1d\x16\xc0\xf5\xba\xb1\xa5\xa9\x8cA\xce\x87\xf9\xf9\x9e\x99\
+\x08\x9c\x1e0\x22\xfaljnB(\x1c\x81\x9fiS\
+[\x9a[\x15\xfc\xfe\x00~4\xb4\x16\xed\xc8g\xd2\xbc\
+\x90I\xa7\xd3\xb5\x80\xe3\xfa\xa0\xc7\xef\xbd\xd6\xb0-f\
+vuu-\xd2\xeb-\xcb33s\xbf\xd6\xd4\xd2\xa2\
+N\x1c?\x9e\x87I\xe9\x14i\xfa\x12\xf2\x04\x09\x9f\xd0\
+\xd5(rG\x9f'2\xb2\xf2\xa5#\x0c\xe3\xf7\x026\
+8\xd9\xec,\xaf\xea\xc0\x16\xab\xc0R\xe87\x1ak\x8e\
+\xea*\x0f\xed\x09\xb8\x9d\xea\x05\x0d\x0dm2\xe0\xc1-\
+\xf4}\xc5\xc5\x13\xbe\x5cXT\xe85`\xc0\xf6\x8e\x8e\
+h\xe9\x91#-\x8d\x8d\xf5\xcf`\xa2\xef\x01T\xd4\x19\
+\x11\x00\x05HK\x10s\xe6\xcc]1\xeb\xe2\x99\x8b\xab\
+*k\x0a*\xca+\x8fn\xdc\xf8\xfa\xc3(\xfeT\x88\
+\xdc[2\xb3M\xabM\x06C<77O\x1f\xc4\x1d\
+_\x92\xf9\xe4\xd1\x99\x0e\x90\x9f\xc7C\xd8\xef-N\x8f\
+(\x183\x05'M\x93\xc8\xcf\xcfe\x88\x0b\xb3\x0f\xeb\
+x\xacm\xac\xad\x165%\xfb\xb1\xab\xf8\x9am\x16\xfd\
+\x03\x81P\xfc\x85\x9bn\xb9\xed\xba\xfc\x9c\xbc\x11\x8f<\
+\xf2\xd0\xe3\x9c\x03(\x03\xd0\xcc\xdd\x87<\x99\xee\x99#\
+\xf2}\xe8\xb4\xe2\x80>\xbd\x08\xf1Jm]\xfd5\x87\
+?;$JK\xcbE(\x1c=\xc7`\xca\xd8\x13\x8b\
+t\x1c\x185:\xf3a~\xee\xee\xf2w\xc3\x84\xe32\
+>`\xacO\xaba\xca\xd3c\x02&\xce\xb5\x1e\xc4G\
+Q\xb7\xdb\x85\xdf\x0f\xe6\xabpvb\xef\x8eOuU\
+\x87\xf7`\xb8H%\xfe\xec\x03v\x1am\xee\xb7\x02\x81\
+N\x16:\xd4\xb8\xfaK\x08\xb0\x00\xf9\xab/\xb9\xe4\x92\
+\xd9\x9b6m\xd2\x22A\x14I\x1aP\xf3Z\x83\xcf\x93\
+\xb2sR\xbe\xc5\xe2\x86\x15\xc8\x9f\xb3\x85L\xe6LZ\
+D=0i\xcc\x98\xb3>\xf8\xf2\x053\xd4q\xe3\xa7\
+D3\xb3G\xa8\xb8\x5ca^-,\x9a\xa0\xe6\xe5\x8f\
+V\xbd\x99\xc3a\xde9\xaa\xd9\x96\xc5w\xd4\x11\x13\xa6\
+\xa9\xb3\xaf\xba-1v\xf2\x0c\xf9\x8c\xb2\x9dF\x9d\xb8\
+\xc3\xe4\xf0\x9e5f\xcc\xe5f<\xf7\xd0\x8a\x15+x\
+\xd1Qu\xd6\xd9S\xd5\xcb.\x9b\xc7\xf6w\xa4*\xf9\
+u\x9aZ'NH\xa7\xeb\x04\xd3;\xee\x8e\xc5\xc2\xe7\
+\x16\x0c+\x1a?e\xcaT|\x1cRk\xdb\xdaZ\x96\
+\xa0A!\xf6\xba\x1f\xe0\xf4\x17\xc2\x05\x8a\xd1\xeb\xf1\xf0\
+0\xa3\xf0\x92\x14\xca\x97\x16 o\x93\xe0\xe4\xe4o\x83\
+bAQ0j\xb2Z\x7f\xf4\xb0r\xf4\xd0G\x01\xb3\
+\xdd\xfd\x94-g\xd4mA_\xcb\xd6x$\xd8\xdc\xd6\
+V\xcaC\x98\xe6t\x95\xbd{\xf7\xf2\xbe\xcc\xf7\xa5/\
+M\x1a\x8d\xde\x8e\x94\x97\x97\xfd\x11\xcf\xb5\x80&<d\
+OL'%\xa5A\xba\xe1\xfb\x1c\x90\xc7\xe3\xeb\x01>\
+\xbf\x0d\x1c\x04\xbe\x8e\xe5\xb8\x11E\xd8\xcfL\xc2j\xb3\
+\x89QE#U\xc6\x02\x95\x95U\x0a\xbf!r\xfd\xf3\
+0\x1c\x0a4\x8b\x9cQ\xe7 \x846\xc4\xeaKw\x19\
+\xf4\x96\x8c\xbf\xc4C\x1d\xcb\xd0\x07\x89J\xd2\x98b\xda\
+\x9b2Q\xc03x7\xa0\xcd\xa7w\x9b\x01\x9f\x87\xc2\
+\x028\xa8\x1f\xe0\xc1\xe4_@3@M\x95c\xde\x07\
+\xb1\xb4\xe3:]\x22\x80\xcbQCSS\x8d\x13\xdf\x19\
+\x94\xe1\xc3\x87\xc3\x01\xe0\xa7/\xf8v\x18\x91NQ\x11\
+\x05\xe3\xa6$\x0fB:\xa3\x12hk\xf4X\xdcc6\
+\xc4\xc2\xad\xda\x9a\xee\x8fq\x0c!\x19\x0e \xd5nO\
+\x07j\xc7\xb6\xfd\xd2P\x08\x80\x1dS\x08=\xe6\x89\xbc\
+\xb6\xe5\x1c\x84\xb3{\x15\xcen\x83\xcdfy\x03\xd1^\
+3\xcc}\xda\xd8q\xe3\x8cv\x1c\x9dq\xa3\xa4x2\
+\x5cb\xdc\xf93\x85\xc7\x9b\x8dp\xda\xaexr\xf2a\
+\x18\x11ogc)\xe6\x16\xe7\x89\x8f\xfd\x0e\xc6\x18\xc7\
+>e\xcd\xe3\x1dIC\xb5\x0bp\x82\xfdM\x92\x93\xa7\
+0Zpm\xd6\x82to}}\x95\xbe\xb3\xb3\xe3\x01\
+\xaf73\x86H\xd7\x901|\x1cnL\x1c\xc2\xdf\xd5\
+\xa9v\xe1\x1e\xb1\xa5\xa1\xda\xd4\x5c[\x81\xa6aF\x97\
+$\xad\x8f\xe4S\xdf\xbf\xfd\x8d\xdb\xb7\xd5\x00%\x94\xdc\
+\x99&m\x0c\x0a\x9b\xa6Z\x84\x03e\xf9\xe8\xd1\x85\x8a\
+5#_U,\x19J[s\x83hin\x14\x91\x8e\
+\xa3\xa8\x16\xed\xc0\x06\xe0\x11\x00\xcb\xe8\xf4\xb5\x8bw\xff\
+\xcf\x91&\x8cg1\xb3 \xc0\x10\x9a\x0e\xac\x09\xd8\x85\
+X\xe07\x06\x8b\xe7\x22\xe45\xd2\xdak\xcfC\x9e\x9e\
+h\x00\x9a\x1fI[\xd3\xf4\x19\xcc\xa7\x9b\x1d\xfb\xd0\x9e\
+\x99'\xb4\xf6\xda\xfae=\xdfe\x8a\xba\x02,\xf7\xce\
+\xaf\xe2\xae O1\xd8\xc2\xf8\xaf\x91\x06\xbdj>\xec\
+\xf7\xe3\x17TIJk+\x0b\xfa\x1b7}n\xb4.\
+\x8eIp|\xd6iw\x97\xcck\xf3A\xf6\xe4I\x1b\
+\x80o0\xcf\x8e5\xd2\xea81\x8d\xd2\xf3l\x9b\xfe\
+\x9c\xeek\x18\xa8\x0cD\xfc\x82\xa3\x916\x9e6\x16\xcb\
+\x07+c}\xfa8Z[\x96\x93z?\xcb\xc2\xf4I\
+\xca\x82\xb4\x86\x9c\x0c/\x1f\xa6\x03\xef\x02\xfc!\xd2\x13\
+\xc0[\x80v\xef\xcd\xd8\xfby\xc0\x0b0<\xfd\x0d\xb0\
+\x10`\x1bJ\xfd\x97\x00Mz3p>\xb0\x1c\x98\x04\
+\xfc\x07\xb0\x1b`\xbc\xce\x89}\x1b\xb8\x10\x18\x03\xdc\x09\
+\x9c\x05l\x07p3*5\xb9\x12\xa9\xb6T\x90\x15\xdc\
+\xfb9\x97\xb9@1\xf0\x1d\xa0\x14\xe0\xfd\xe0C\x00\xdb\
+\xe7\x01\x1c\xfb\x87\x00\xce$\xa2\x05\xa00i\x85'$\
+\x0eLz\x12xU\xe6\x92\x1a\xfd\x0cy\xee\xf5$M\
+\xda\x9c\xf0,\x16\x808\xd8N\x99\x13\xe2\x5c\xa4\x14\x80\
+-\x85]H\x8b\x00\x12\x05;V\xe6\x84x\x11\xe9-\
+\xa9<\x93\x19\xc0\xd3\xa9gM\xfb\xd5x~,Uf\
+M\xa5\x8f\x22e\xd0E\xba\x0f\xe8\x909!.G\x9a\
+\xbc\x7fO\x16p\x0e\x13Ru}\xac@\x1b U\xdf\
+\x93hR\xa2\x86\xe8\x95I\x0e\x80\x1a.\x01^\x07x\
+\x13C\xea\x02\x18\x8c\x90\x98\xb2\xde\x05,\x06(\x10\x96\
+\xf1]j\x97)\xe9~\xe0\x08p50\x02\xf8=\xc0\
+\xb9\x10\xdb\x80\xbb\x00Z'\xadh\x01\xf0\x040\x1b\xa0\
+b\x22\x00\xa9\x13\xe0\xfcH?\x07\xc8\x1c\xad\x81\xf3m\
+\x024\xfa)2\x87S\x0f\x1a_Z\x9d\x1c\xb0\xe7\xa1\
+\x9f\x0c'A\x90\xf8r\x16\xb0\x02\xf0\x00\xcf\x00$\x1e\
+R4A\xd2\xb3\xd3\x94\xa9\xd5\x07\x00\x12\xd7<'\xf4\
+3\x80\xcb\xe4V\xc0\x0f\x90\xe6\x03;d.\xd9\x07\x19\
+&\xc5\x01-O\xed=\x05\xd0\xbc\xaf\x02XGJ\x9f\
+\xdbw\xf1\xcc\xbe\xcb\x00\x0b0\x1c\x98\x09<\x08\xcc\x02\
+8w\x8d\x0fd\x8f\x916\xf1c%\x03\xe7\xd8\x89\xd6\
+\xfe\x22\xe4\xa9\x99e@5\xa0-\x07\x0e\xbe\x1b\xc8\x01\
+\x1e\x07\xd2\xe9\xd7x\x98\x05<\x04\xbc\x0b\x90\xf8\x9eW\
+\xe6\x8e\xf5\xc11\xa8i\x8ew\x1epn*\xa5pW\
+\x00\x1aQ\xe3\xf4E\xe3\x01\xf6s\x05@b9\x9f\x9b\
+\x01\x0a\x9a}\x91X\xde\x87\xb4\x89\xf7\xa9H\x15D\x91\
+j\x12\xe7\x84\xe8\x884\x9a\x86\x0c\xfd\x01\x19&S$\
+\x0eR\x09,\x01\xd8\xf6\x08\xf0\x02\xe0\x02(\x1c\xb6\xcf\
+\x07\xea\x81o\x00\x7f\x01\xd6\x01\xb7\x03Z\xdf\xd4\xbc\xa6\
+\xfd\x8b\x91\x7f\x03 \xd1\xe2\xd8\xd7(\xa0\x02\xe0\x12\xa4\
+\xb0h\xde\x9a\x89#+\x05G\x8b;\x98\x02\xcb\xdc\x00\
+\x97L\x1fb\x07\x83Q.*\xe9\xe9Id`\x18@\
+\x89\x12\x0d\xc0\x22\x80\xccj\xd2\xcdB~\x1c@\xfa2\
+\xf0\x07`\x1e0\x11x\x1a\xd0\xe8\x13d\xd8\xdf[\xc0\
+v\xe0\x00@\x81\xf2}j}10\x06\xa0)\xbf\x0c\
+|\x0c\xfc\x13\xd8\x05\xfc\x04 Q\x90lO\xe22\xd4\
+\x94\xc9\xf9r\xde,#\xdd\x00p\xe9\x90\xb46\xc9'\
+\xfc\xedo]\x90\x19j\x80Z\x9b\x0e\xb4\x01tlN\
+\xa0\x18h\x05\xa8A\x13P\x0b\x90\x01>\xfb\x81\xaf\x02\
+Z=5@F) j\xb1\x08\xe0\xd2\xf9\x1a@\x86\
+^\x01H\xb4\x02+p+0\x07\x18\x09\xfc\x1d\x98\x09\
+P\xe0\xb40:R\x12\x9fi\x01;R)\x1d\x1e\x15\
+\xc1\xf1I\xb4\xd2+\x81n \x0f\xf8\x0a@\xc1r\x0c\
+\xb6%\xb1\xcdI\x91\xa6\xd5\xfe\x1aku\xe9\x02\xecm\
+M}\xa4\x8d\x8e\xec\x005\xaf\x91\xd6\x8f\xf6\xdc_\xaa\
+\x8d\x91\xde6=\x9f\xfe\xce@\xe5l3X]z\x1f\
+\xc7\xe59x\xfa\x04\x98\xef\xddQzYz{v\xc4\
+g\x0a\x82\xef0\xafQz\x9eel\xa3\x09\x90u\xcc\
+\xf3\x9d\xdec\xa5\xf7\xc3v\xc4@m\xb4\xf7\xfbk\x83\
+\xd7\xfe\x9f\xa4\x04\xfe\x17\xaeVF\x81\x99~Y\xf6\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x18J\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x15\xfaIDATx\
+\x01\xe5\x9by\x8c]Ev\x87\xeb\xbe~\xbdx\xb7\xf1\
+\x02\xd8,m\xc06\x01\x0c\x04\x08\x0a3\x7f\xc4\x01\x05\
+\x94\x11\xabXE\xc0\x10\x860\x08\x01\x22\x22\x0c\x13\x08\
+\xc30a\x91\xc6l\x09\x10\xc0\x03&l\x01\x81\x11\xab\
+ \x22\xc3f\x04\x22\x80\x19vl\x8c\xc7\x0b6\xb6\x01\
+/\xe0\xb5q\xbfw\xf3\xfbN\xd5\xb9}_\xbb\x9f\xdd\
+\x13\x8d2\x13M\xb5\xef\xab\xaaS\xa7\xceV\xa7N-\
+\xf7:{\xff\xfd\xf7G\xac\x5c\xb9r\xe3\x90!C*\
+\xcb\x96-\x0b\x9eV\xaf^\x9d\x8d\x181\x22\xa7N\xd9\
+\xe1\xff\x1f\xf2\xb2\xdc^.\xcb\xbd\xe3\x8e;\x86/\xbf\
+\xfc\xb26r\xe4\xc8\xc1\xe1\x91G\x1ei+7\xfe1\
+\x95_z\xe9\xa5\x8e\xeaN;\xed\xd4\x82\xd2y\x9eg\
+J\x7f\x14\xfaK\xd7 ]s\xbc\xbe\xda\xd5\xd5en\
+\x0e\xe0\xb7\xd0\x1eKU\xf4dS\xa6L\x09/\xbf\xfc\
+rP\xa6d?\x14\xfe\x17\xe9\xe5\x10\xf4\x0f\x12\x22g\
+IE\x03\xc5Z\xd3_\x97\xbb.\x0c/7E\xa6\xc1\
+G\xda\xa6<n\x90\xb0\xfb3\xfc-R\xb8\xbaU\xea\
+\xbf\xc7\xc6$\x9by\xf46\xc40]\x9f~\xfa\xe9\x81\
+\xfdU\xc6G\xbc\xc6hwvv\x0e\xafT*\x13\xc4\
+d\x8c\xac\xd9Z\xab\xd5\xcc\xf2F\x8c\x9fn=\xd5\xfe\
+\x92\x8e\xa2vww\x07\xef\x1a!\xfd\xfaE\xaeMz\
+\x96o\xdc\xb8q\x9ed[O/\x0c\xa1rM\xc5m\
+zD\x7f\xa4\xc4\xa2\x10\xabI\xf1)--\x95\x0b\xb2\
+\xac\xf2\x17\xaa\x8f\x94\x11\x94\x85\xd0\xd2\xd2\x22\xb7\x22\x8e\
+\xe0^\xca#\xd8\xca&\x02bzB$\x90,\xf5\xc8\
+W\xa9\xb4\x19$\xfe\xa6\xe6\x86\xcc:\x0a\x92G\xad\x8a\
+\xaey\xa8\xd7\xf30h\xd0\xa0\xe5\xe3\xc7\x8f\x7f\xbe^\
+\xaf\xff\x8b\x94\x7f'uu\xd9\x1b(\x95+\xdb2\x80\
+\x11\x18;v\xec\xc0\xf6\xf6\xf6\x19R\xf4d\x8d\xb8\x14\
+\xad\xa3\xacx\xd5\xc4ZI?\xa8T\xc8T\xe6@Y\
+\x8d\xd6^F(u(\x15{\xf7L\xf5\x9e\x8e\x18\xb9\
+\x9c,x+\x1ee\x95l\x87J\xa5e\xaa\xe4\x9b\xba\
+\xeb\xae\xbb\xfe\xdb\xa2E\x8b\xce\x17\x1e\x03\xb7U#T\
+\xbf\xfa\xea+\xf8\xf7\x95\x5c\xf9QR\xfe\xb5j\xb5e\
+b\xadV\xc7\xb9Y1*\x04\x12\x09\xd3\xa2\xf1\x90E\
+\xf4\x83a\xa2\x09\x8a\xba0\x15Y\xb3\xa0\x1fs\x0e\xcb\
+,\x00C\x02B\x85\x93\xf4\xd6\x0b6%\xbb\x88\x87\xb1\
+\x05\x5c\xc0\xbd\x9d\xe8\x9d\x87Z^\xcfB\x9d\xb9X\xa9\
+V\xab\xe7\xed\xb2\xcb.\x07/\xee\xea\x9a\x12V\xac`\
+Z\xe0\x93\x04\xc9\x86\xf4\xc5\x17_\x84\xea\xe8\xd1\xa3{\
+\xd9\xd4p \x8e\xf5*mmm\xbf\x92\xabO\xec\xde\
+\xdc\xcdr\xd1\x9e(H\x81\xa2\x9b\x15JuPd\x9c\
+\xa4b4K!\xac\xda\x1aP\xd59\x11\x8a\x864{\
+EK\x16\x0c\xe8\x03\xd1\x98\xcc\x8c6\xd3\xac\x8e\xb9c\
+\xc2\x10\xad\xb0\xeb\xce\xeb\x9b4U\x0f\xda\xa9\xb5\xf5\xbf\
+\x96\x84\xf0=5\xa3\xbc\xcb\x90\xd0cVY\xb8pa\
+\x03\x80\x8a\x82\x08\xa3\x1fv\xdey\xe7i-\x95\xca~\
+\xb5ZwW=\xcf\xdbQJ\xc94P\x8e\x92\x94\xc9\
+\xbdL\xddS/X]\xf5:\x7f\xe4<\xcc\xa1\x5cO\
+\x16\x1fZs\x95\xad\xbb\xf7-\xe5\x9av\x86\x1b\xc9\x0b\
+-$|\x8b\x01\xc4\x01{\x80\xd7\xf3\x8e\xee\xeeZ\x97\
+\xbc\xf6\x10M\xdf\xeb\xd0E\xc9t\x8a\xc5\xf8\xfb\xed\xb7\
+\xdff}\xc5\x80\x8a\x82H\xf7\x981cv\x97\x99/\
+\xea&\xc2\xe7y\x9b\x9bY])\xf6\xb6f\x19F\x9b\
+\x92\xb4\xd1\xc4\x1c6lX.\x0fB\x11'\xe1yD\
+\x8b\xbf\x0ek\xc8e\x98\xf0\xcd7\xdf\x98\xa1D4\xba\
+z\xe4\xed}\x1d\xdf\xe5\xf1\xba\xf2\xbc\xad\xbb\xdb\xe6\xd8\
+?\xec\xb0\xc3\x0ew._\xbe|\xa1:5L\x85\xed\
+\xb7\xd7b\xe5\x94<\xd7\xe8c\x80zkk\xeb\x19\x0a\
+*\x15\x09\xb1Y\xc4Z\x19\xec\x84\xe3\xcc<\x07\x5c.\
+c0\xe9^\x09Z\xdar\x9d5\x9ct\x19\xc7a\xe4\
+N\x97r\x19\x87r\xd0^>\x0c\x1928S\xfc\xa1\
+J*\xe3GH\xf1[j\xb2\xe0\x136\xcb\xf8Z\xa6\
+\xebg\x0a\xe5gz\x1a\x0c\xb0b\x85\x0c\xd0\xfb\xa0\x83\
+\xf2B$:\x1d.\x97\xc3\xa5\xe9\x84R\xce\xd9\xb9x\
+\x8e\xd4Vv\x80\x98\xe6\xda\x1b@&\xdcs\xcf\x8c0\
+v\xec8\xd5\xbb\x85'Lfo$g\xed6\x99\xe9\
+\x98\xc0\x04S\x1e\xad\xeb\xb9d\x0b\xb7\xdezkX\xb8\
+p\x81\x96\xb9\xc1\x12\xa7\x86\x18\xa4\x88mE+\xc7\x12\
+\x01\xd9\x88[\x15\xa7\x93\xec\x88\x1f\x0e\xd7\xf33=\x85\
+\x15U\xb6\xd4\xdb\x03 P\x1f5j\xd4\x101\x1a\xcf\
+<\x13\x11`\x22KDw\x1b\x14L\x11\xc7\xc57,\
+\xa4\xd7\x1e;\xff\xe8\xa3\x8f\xc2m\xb7\xdd\x16\xce<\xf3\
+o\xa5\xc0\xc2 \xa3@\xcb\x1e3\x82k\x22e\x81{\
+B\xf9\x0d\x1b6\x84=\xf7\xdc\xd3\x0c\xf1\xc2\x0b/\x84\
+w\xdey'\x1f1b;\x8c\x027\xc9a\x1d\xcaF\
+\xf0\xeeQ\xc4H\x0ey\x89/\xd0\xdfM\x08\x83\xf5\xac\
+\xd3\x13\xf5I=\xfa2\x00\xddA\x1e\x94\x04\xa6Cy\
+\x0e\x97\x193^\x98\x06^\x86\x077\xe6<\xf4u\xec\
+\xccW\xadZ\x15\xc6\x8f\x1fO\xb5\xdc\x8f\xba'\xc3U\
+%\x8a\xad\xc2\x9dw\xdei\x06\xc0\x80\x0f>\xf8`6\
+i\xd2\xa4\x5c\x01\xcb\xf1\x0dOl\x1c\x9f\xdci\xc4<\
+\xb6\x99P\xa9\xd3 \xc5\xb4A:\x02c\x80\x86T\xed\
+\xeb\xbc\x8c\x0ez\x8cX\xe2#&\xb6L!\xa53\x86\
+k\xc4b\xbe\xc5Q\x81xa,\xa6\x01\xbbD\xd2\xe3\
+\x8f?\x9e\x1f~\xf8\xe1\xc4\x05\x1bYF:\xa5\x82\xde\
+\xa6M\x9b\xb4\x83\xae\x86\xe1\xc3\x87\x87\xbb\xee\xba+\x9c\
+\x7f\xfe\xf9\xd9^{\xed\x95\xeb\xbeB\xe8\x0c\xa8'\x93\
+\xa5\xb0\x80\xa0\xde\x96\xf2\xd8\x0e\x5c\x00\xe4\x09\xeb\xd7\xaf\
+/\x18:\x95\xa1C\x87\xe6[\xc4\x00\x1a#3\xa7\x19\
+\xc9\xa8\xe6\x80D\x08\xb2e\xbd#Y\xe9U\xe0\x95\x85\
+>\xf4\xd0C\x03\x01\xf1\xa9\xa7\x9e\x0a\x83\x07\x0f\x0ek\
+\xd6\xac1C\xd0K\x01\xd7\xea\xe7\x9csN\xd8w\xdf\
+}m\xeaH\xf9p\xc0\x01\x07\xe4K\x96,\x89\xca\xf7\
+LA\xe7\x8fv\x94\x0b~\xa52\xe2\xaa-\xca\xd73\
+\x88p\xebI,\x83\x16!z@=%L\x17\x9f\x18\
+\xfc \x92\x1ee$\xda\x0d\x16G\x1c\x80R\xca\xac\x18\
+\xeb\x11N\x10\xfc\xf0\xc3\x0f\xc3u\xd7]\x17>\xfe\xf8\
+\xe3\xa0\xedj\x187n\x9c\xe5\xd20\x1cv\xd8a\xa6\
+\xfc\xed\xb7\xdf\xce\xc8\x87\xfd\xf7\xdf?\xac^\xb5*\xeb\
+\xe8\xe8\xb0\xbdBdg\xfb\x0d\xe3\xee\xec\xc4\x11\xa6&\
+C\x92'\xc9EV\xc8\x8c(}\xa6\xde1\xa0\x84D\
+gU!\xe2Px\xc5Z\xd9\xf2fj-|\xa9\x03\
+]b\x0f\xcb\xc1T\xd2\xba\x18\xb4\xab\x0c\x93'O\x0e\
+3f\xcc\x08\xdf}\xf7]\xd8\xbcy\xb3\xe5\xdb\xb3 \
++\xdd9}z8\xef\xbc\xf3\xa4\xfc\x9f\x86\xc5\x8b\x17\
+\x85]v\xd99_\xbf~CX\xbbv]\xde\xdaj\
+\xc1\xd2Eq\xfe)\x8fB\xaa\xb1\x0c\x87dtRJ\
+M\xd2V=\xc0\x95/,\xe9\xa6\x10\xa0\x80\x19\xef\xa2\
+\xceH$\x95\xb5\x9c(\x02{\x17\xf8o\xea\xea\x0a\x07\
+\x1f|\xb0)\xfe\xbd\xef\x7f?l\xb7\xddv\xd9+\xaf\
+\xbcb\xa2\xddr\xcb-\xe1\xdc\x1f\xfd(;\xf0\xc0\x03\
+5\x1d\xec\x0e2\x1b>lX\xe8\xe8h7|!\xd9\
+\x5cN|a\x88\xa1\x95\xd8!\x9a\x07\xa4\xba\xc3\xad\x91\
+\xd1\x88O4\x8e\xf1*\xff4\xf1\x80\x0d\xea7\x84a\
+\x83\xa8\xe1{^\xea\x5cX;\xa2\x18\x1e?&h\xca\
+cgU\xe8?\xa0\xa3#\xdc}\xf7\xdda\xe0\xc0\x81\
+\xe1\x03\xc5\x83'\x9ex\x22?\xe6\x98cl\xce_x\
+\xe1\x85\x19\xde\xd1\xa5@\xc8\xe6g\xcd\xea59\xc1p\
+\xfd\x86\x0d\x19\xb7V\x03\x07\x0ep\xda\x05\xcd\x92,\x0e\
+s\xde\x86\x0b[\xf4\xeeCv\xebJ\x10\xec\xd3\x036\
+X\xb3Y\xd2:'\x02P\xa2\xee#\xa1b\x03N\xb4\
+\x831M\x04,\x8b?\xe02\xd7\x952F[\xca\x07\
+\x94\xa7L\xb4'\xe0}\xf0\xc1\x07\xf9\x88\xedFh\x15\
+\x18\x166wo\xce\x86\xc9\x00\x03\x06\x0c\x90\x07|G\
+ \x84\xb7+&\xcd\x0a9\x90\xa7\x90I\xf4\x0d\x09\xc9\
+`F\x17+P\x89\xa9\xf0\xd0\xe6AP\x16\xa0\xbbu\
+\xd6O\x91\xc7\xd1\xa5\xde\xc341\x12m$tA`\
+b\xe5\xc4\xd4\x22=1\x80\xa4\xab(S\xfe\xfa\x1bn\
+\x08\x8c\xfc\x0f~\xf0\xd7a\x8f\xdd\xd9\xab\x840t\xc8\
+Pm}\x87\xe45m\xa3\x87\x0e\x19\x12t\x14G\xfe\
+\x1ee\xe0.>X \x82#@\xbf.\xaf\x0d\x94Z\
+\xe1O\x8a\xca\x18\xf5-\x7f\x9aL\x81\xa8|\x1c0#\
+\xe4\xee\x8e 6\x14\x16nl\x8e \x06\x5c\x22D\xbf\
+\x85\x85an\x02\xa8M[\xda|\xda\xf57\x84\x993\
+g\xe6G\x1eydx\xe6\x99g\xc2\xdc9\x9f\x84+\
+\xae\xf8'\xfa*\xe2\xaf&\xd3.rp\xaes\x04n\
+\x1f\x06\xab,\x03\x18\xef$\x0b\xf4\x5c\x16\xe7c\xbc\x13\
+\x1f\xa3\x05\x1d=\x067\xcf\x81r\x93\xd4\xd4\x00\xe0G\
+\xe3\xb9r\x8c\xae\x115\xc2h\x1d1\xa2\xc2&\x8d\xad\
+\x04=\x06\x809[`H]v\xd9e\xd9\xccG\x1f\
+\xcd\x8f?\xfex\x8b\x033f\xdc\x1d\xf6\xd9grX\
+\xb0`\xa1\x05\xcbE\x8b\x16\x82\xa7\xa07 T[\xab\
+0\xcd\xb4\xffg\xe5\x88\xfc\xe2\x80\x1a\x8e~Xr(\
+\xa7,V\x80\x03,'G(\xc3\xca\xe5\xa6\x06\x88\xfa\
+\xc1AD\x93y\xe9\x98\xe0I(U\xa5\xa4\x9b\xdb,\
+\xa6\x0aGzpm\xa9\xeb\xd6aR\xe9\xc9'\x9f\xcc\
+\x8f>\xfah[\x02\xcf>\xfb\xecp\xc8!\x7f\x9e\xcd\
+\x9a\xf5J\xbaO\xcc\xf2\xc1Rv\xff\xfd\xf6\xcd\x87\x8f\
+\x18\x1e\xfc \xc5\xfcom\xb5i\xa3U6\xeaV\xe2\
+ot\xcb?IY\xe3\x0d\xdc$+je\xcc\x9er\
+S\x03\x146\x8d\xba\xa08\xf3\xae\x9c\xa8\x99q\xac\x10\
+\xb7\xaa\x86\xc3\x06F\xeb~~\xef\xbd\xf7\x863\xce8\
+\xc3\x02\x1e\xca?\xf1\xc4\xe3\x01\xa5\xff\xf9\xe7W\x85\x9a\
+n\xaf\xaa\xd5\xd6\xa0\x0b\x97\xc0\xd1YwlF\x9e]\
+\xe1\xdc\xb9s\x83\x0ed\xb96A\xf2\x80V\xe3\xe9\x06\
+@\x90$Daw\x0d\x8b{\xa7\xcbg\xd6\x12ja\
+8o\xe8\x9d77\x80\xf1q\xab\xa3\xa8uu\xe6T\
+\xd4h\x9e\x1a\x99EC\x19\xc3\xcd\xda\xefO\x9a41\
+\xbc\xf8\xe2\x8b\xd9\xc3\x0f?lK\xdd\xb5\xd7^\x1b.\
+\xbf\xfc\xf2\xd4\xaf/%\xa0\xd7\x00'p\xe6mmv\
+\x0b'\xfd\x0b\x1d\xa3P\xc6\xdb: \x9b\xcbE^\xa6\
+c\xf5\x9ef\xd87\xa6\xa6\x060}\xfc\xfc\x91\x94\xb3\
+\xaeD\xd7\xc8/2\x13\xfb$Ql\x16\xee\x98\xd1\xa3\
+\xb39s\xe6\xe4\x0f=\xf4P~\xf2\xc9'\x87\xf7\xde\
+{\xcf\xd6\xfe\x07\x1ex\xc0.ILZ\xe1i\xa6\xa4\
+\xa2]1\xb3\xe5\xb5\xc3\x92\xa6N\xde\xad]\xe2\xb8\xb1\
+\xe3Bk\x9b\xb6\x80\x0c1.\x10\x19'\xa5\x80\x1aK\
+~\x1aDHP\x83\x95fo\x81\x5c.45\x80!\
+\x89AIY\x04\xf6\xbe&\x84*hafB>O\
+\x8e\xc7\xc9\x8ec\xac\xee\x16\x03\x07\x1d\xe0\xde\xe6e\x94\
+\xd6\x9a\x1fj\xdd\xb5\xf0\x9d\x94\xee\xda\xd4e\xe7\xfeM\
+\x9b6\x86y\x9f~\x1af\xbd2+oko\x0f:\
+)\x1aO\x93 \x121\xc3$\x9e.\x180\xe4\xb1\x7f\
+Q\xa2\x1e\xb9\x5c\xber\xde\xd4\x00(^\x0e\x22\xaa;\
+%\x98y\xd9\xf3\xa8\x98\x8c\x00@\xe7n\xdd\x02\x8d\x0d\
+'\x9ex\xa2\xb5\x8f\x1c9*\xac\x5c\xf9uYH/\
+#\x0b8^\xf7r9\x0f\xba\xb9f3\x04\xaa\xf0L\
+\x0e\xa3\x9b\xfa*+\xe4\x81\x8e\xda@\x8b\x98\x09\xd1\xf1\
+\xc1mHM\x0d`\x22\xa5n\x91j\x96\xb7T[l\
+\xc9\xaa\xe9\xdaUM\xb4&\x86F\x93\xe15\xf1X\xfa\
+6\xe8\xf6\x86\x13\x1f\xb7;:\xf4\xe4\xda\xf7\x1br\xe1\
+\x02\x85\xd0\x99\xee\x00x\xb3d.\xa4\xb1\xcd\xb5\x14v\
+\x90\xdbF\x06/bO\xa0\xb3\x13\x0b\x0e\x1c\x9d'\xb9\
+'k\x11\xc01</\xb88b\xef\xbc\xb9\x01\x84\x89\
+0$\xa8\xc9U3No(\xe7k{j\x02\x85\xe4\
+L-F(\xaa\xe7k\xd7\xae\xb5e\x8e\xc8\xae>\x99\
+>H\xc8\xe5\xca\x99nzs]\x94\x98\x92\xeagL\
+\x98\x0a\xf0\x93\xc2\xd9\xe7\x9f\x7fn\x04u&\xc8t/\
+H{\xa6U\xc1\x0fEQ(\xe7\x17s\xf0\xe1_N\
+&\x8f#\x97\x1b\xca\xe5>o\x84\x22\x82\xf1\xa5h\x82\
+J\x81\xbcMkrw\xad\x9b{\xb6\xa2\x91v\x1b\x1a\
+\x8c\x95\xa6@\xea\xa3,\xcb\xb5\x22dU\xdd\x0a\xad\x91\
+\xd2+V\xac0\xa1\xb8\x07X\xb7n]\xa8\xc8\x08\xa2\
+\xce\xe8\x1b\x13n\x8f\x84\x93\x9fp\xc2\x09\x19F{\xee\
+\xb9\xe7\xf2\xd3N;\x8d\xab\xf1\x9c\xed\xb3\x0cH\x90\x8c\
+\x86\x16u\x18\xe8\xc1n\xca\x11\xa0H=e\x93\xab\x80\
+oQh\xea\x01\xd6Odu{\x93-^\xbc8\x9c\
+u\xd6Yvpy\xfe\xf9\xe7\xf3\xe3\x8e;\x8eck\
+.\xc1\xf0\x5c\x5c\xd5\xbcBs?\xaf\xc8\x9dG\x8d\x1c\
+\xad\xcd\x8c\xbdE\xcbZ\xb5\x93\x9b\xff\xd9|\x9d\xf1\xf7\
+\xe3\xd0\x93ku\x08,\x89\x8a\x11\x99N\x85xBF\
+\xd4\x97\xdbk;P\x09_\x7f\xfdu\xb8\xe1\xc6\x1bt\
+\x0e\x18\x1a&L\x9c\x10~\xf9\xcb\xe9\xe1\xd3O\xe7q\
+~\xc8\x88+L'\x1d\xab\xb3v\x9d+\xd8h\xe9\xbe\
+\x9fc\xb5N\x8b\x03\xb1\x84]\x82r\x0f\xa9\xcdT\xcf\
+\x1e\xa0\xc7\x1c[\x1a\xa0\xf7\xb5x\x19\xc3\x15\x03\xc6\xae\
+\x0c&\xc3\x87\x8f0\x94\xd9\xb3g7\xa0\xaa\x92\xed\xa0\
+oo\xd6\xaf[\x97\xcf\x9d;\xc7G\xa9`\xfd\xd6\xdb\
+o\x85\xd3O?=p\xfe\xc7\x00zY\x91\xeb\xb6\x17\
+\x1a\x05N*\xcbc\xaav7\x88g\xd8fIF\xa5\
+\xed\x13\x19O\xcb#\xb4I\xd6o\x8f=\xf6\x08\x9f}\
+\xf6Yo~|\xdfd\xab\x8b\xde\x9aF\xec>~\xed\
+8,\xc4\xb2\x00\x05Z\x8c58VlV\xe0\xb3\xb6\
+\x0d\x1b\xd6\x87SO=5\xff\xcd\x82\x05\xe1\xb1\xc7\x1e\
+S\xfe\x9b\x9c/-\xee\xbb\xef\xbe|\xf9\xb2e\x99\xe6\
+}\xc6\xb6\x97\x95@\xeelw\x80\x93\xf7\x9d\x1c\x18y\
+\xd2A\x07\x1d\x140\x1e\xca\xdft\xd3M\xba\xf9Y\xac\
+\x15be\xf8\xe4\x93O\xf2K.\xb9\xc4p\xa2CG\
+\xbe\xf0\x8fkK\xc8N<\xe1\x84\xf0\xee\xbb\xefrI\
+\x9a\xcf\x9f??\xfc\xf4\xa7W\xa0|\x98>}z>\
+g\xee\x1c\xb6\xdbAw\x88\xe1\xa4\x93N\xe2\x9dB\xc6\
+\xf6\xda\x13\xde\xe1\xe5r^\xd9\x9a\x07$D$\xb1\x00\
+L\x9d}:\xd1}|gg\xe0\x96w\x9e\xdc\x13!\
+\x19\xdd\x8b/\xbe8\xbf\xe7\x9e{l\xcf\xff\xc6\x1bo\
+\x04\x9d\xef\xc3QG\x1d\x15\xa6\xfdbZX\xbad\xa9\
+\x91\xc3m\x11\xf2\xb2\xcb\xfe1\x5ct\xd1E\xb6\xe6\xeb\
+\x84h\xf7\x83W_}58\xb9\xde\xba[\x5c\xb0\x0e\
+\x12\x9b\x00L\x99k\xf2\xddw\xdf=\xcc|\xec1\xd5\
+\xb2p\xd5U?\xd7\x0d\xd3\x9f\x05\xae\xd4&M\x9cd\
+\xf2`x\x82\xaf\x92m\xac(4K\xcd\xef\x03\xe8!\
+\xb5\xd3\xe8\xc3<\x0e\x87\x0a\xb8\xa5\xbd\xa0PY\x1e\x10\
+\x8e8\xe2\x88\xec\xca+\xafT-\xd8E&\xaeG\xe2\
+\x9d\xde\x1dw\xdc\x11\xae\xbf\xfe\xfap\xff\xfd\xf7g\xdc\
+\x0a\x93\xde~\xfbm\xbb\x0b\x98?\x7fA\xa6\x91\x0b\xcf\
+>\xfb\xacy\xca\xa7\xda\xf4p_0u\xeaTm\x8a\
+\x14?Le\xbd\xd7\x91\x0b\x13#\xce=\xf7\x5c\xbd\x1c\
+\x19a\xbb\xcaez\xad\xfd\xeb_\xc7o ~\xfc\xe3\
+K\xcd\x83\xa0\xfd\xaf\xba\x5c\xd1\xc5J6{\xf6;\x04\
+\xcc\x8c%x[\xa9i\x10\xdcZ\xc7\xb4\x0c\x16\x86 \
+>\x90t\x91\x11\x8e=\xf6\xd8\xf0\xe6\x9bo\x06\xa27\
+\x0f;A\x5c\x14\x05I\x8e\xdb\xde\xdeF0%\x80\x05\
+\x82\x16\xeb=\xc9r\x19\x99?\xb7:Kdgg\xa7\
+\xb5O\x980\xc1^\x9a\xe0I\x0b4\x0dY2\xf9\xee\
+\x8f\xf4\xd9\xbcyd\x5c\x9fe\x0a\xa6\x16\x04\xd3 \x02\
+\xef3U\xb6\x15\x03\xbc\x97\x13J\xaf\xcb\x0c\x8c7(\
+\xd9\xb55\x05\x84\xba\xe6\x9ak\xcc\xf5iCA\x8c\xa5\
+\xd1+\x5c\x9a\xed\xaeR\x86q\xd8\xe1\x9dr\xca)A\
+om2}\xac\x05\x5c\x17\xa7\x9bl\xb3\xe5\xfb\x02r\
+\x12\xd1\x9e\xc4\x09\x93=\x01+\x02\xd7\xeco\xbd\xf5\x96\
+\xefK8<!Pf\x1b\xb5(\x9b\xf5\xd9\xda\xcfV\
+c\x80\x8d@\x22\xe4#\xd4\xa1}yUk4)]\
+qej\xf3\xc1\xd2)p\x92-\x99\x08w\xc1\x05\x17\
+\xd8K\x90\xa5K\x97\x9aW\xb0\x91\xfa\xcb)SX\xd2\
+\x0a\x8f\xe0=\x81\xa6\x85\xc5\x0dh\x0e\x1b\xcaMp\x87\
+y\x0aGd\xf6\x03z\xc5\x1en\xbe\xf9f\xbeX\x0d\
+\x04\xcaW_}\xd5\xb6\xdb\xc4\x17\x1d\x96\x5c\x8e\xd0\x12\
+\xe5\xb0\xcfW\xa0\xe5I\x83\x97&\x94Cz\xf2\xa6\x1e\
+`\xfe\xa7\xe0\xf6]\xfa\x8ep\xc9\xd2%\x16\xb99\xd9\
+-^\xb4\xc8\xe6\xa2\x227\x94r\xdc\x90\xc8\xbeP/\
+A\xb5\x89\x09\x9c\xfaX21\x86\x8e\xc4\xe1\xeft\x10\
+\x22\xdd~\xc7\xedr\xd9\xc5\x8c\xb8\xbd\xfc\xd0{?\xee\
+\xfcB\xbb\x14&\x1e0uV\xae\x5c\x15^\x7f\xfdu\
+\xdd\x1b\xccR\xc0\xad\x9b\xb2ok\x09U\xca~x\xd6\
+\x0f\xc3k\xaf\xbd\x16:5\x1d\x08v\x97\xfe\xe4'\xe1\
+\xde\x7f\xbf7\xcc\x93\xeb\xc3\x9f\xe0J\xf2o\x1f}%\
+\x937\x16\x03d\x08\xe5\x9f\x1bo\xbc1N\xe0\x18v\
+l\xd1\x94\xf0ce\xf5\xf5|\xdc\xa0y\xcd\xdbb\xfc\
+\x90\x07B^\xb6\xba\xbe4-\xd7\xeb\xa9\xde\x1b\xaf\xae\
+ov\x1a`\x89f\x03\xacD\xdf\xe0\xf0v\xd8n\xbb\
+\xed\xe6|\xbc\x0fy\xae}@\x81C\x9d\xed\xf6\xc0A\
+\x03\xeb\xda\xc0\xd9\xc3\x1d\xe3\xa0\xc1\x83\xd6K\xa7\x18(\
+\x14W\x85g\x1e1m\xda\xb4AM\x83 \xd6\xb3\x09\
+\xa59\xccKK\xb6\xa1ZnxK\x9bq4e\xde\
+\xe2\x92_\xeb\xc5\xa5\x94\xc95\x9f\xd9\x03\xb0;\x0c\x13\
+'N\x14\x0fI#\x0fb\xa7\x07\x9e>\xc6\xca\xa5\x84\
+\xb9\xb4\xa6B\xc6\xdaO@\xd3\xe8\xc0&g\x8b\xcb\xfd\
+\x1f\x1fm\xe9}\x80\xed\x10\xb5\xbf\xc8\xf1\x22\xc5\x96\x8c\
+\xd1\xe5m3\x83\x02.g\x09\xe4b\x1f!\xa33P\
+\x19\xdbh\xadP\xb4\xd9A*\xca\x00uJQi+\
+\x95~\x9a\x1a\x80N\xb1\x9f\x0c\xa1\xc9H\x80\x13\xb3b\
+{\xe9\xe5\xd6xZ\xe3\x00c\x16S\xf4\xce\x10\xdc\x83\
+\xa6\xaap\xd6\xf5W5\xc3\x08\x09\x0e\x1d\xc3+\x09\x06\
+;\xac\xe1g\x06\xeb\xaa\xf8abh\xd5\xd0\xf9a\xad\
+\x19Y(Q4Q&\x0e\xe9E\xab\x1d\x9a\xb0%A\
+\xd7\x99\x94\xf4lZlf\x00\x18\xe8\xb1\xb3\x0a\x9d\x8d\
+a\x1c\xac\x86\xb2M.\xccM\x1b\xca\xa5y\xa7\xaa\x0d\
+\xac\xc1\xcc\xf6\x89\x94\xa0\xb6\xc2%C\xb8` \x93\x5c\
+\xb3X\x8eNHY,\x8c\xaf+\x1e\x89\xc7Q-\xcb\
+f\xfdD\xc6\xdb\xe9\x9a\xfa\xf7\x1d\x08{\x9f\x06\x8d\x98\
+\xac\xbaQ;>>A\x1d\xa4G0u\x960\x89;\
+Y!0e\x83\xf7D\xdaTM\xd8\xb4\x17E#\x96\
+~L\xa12\x1d\x91*\x12=JJ\x18njtb\
+\xd6\xec\x15h\x16[\x87d,\x10\xea\x1a\x07\x06c\xd3\
+\xc6V]P\xe8\x03\x13\xa5\x9e>\xaa\xf4^\x06\xadQ\
+.\xb5F\x06\xb7\x85\x17wB\x81\xd4\x8b\xcc\x05K \
+hFX\x1a$\xb5{\x13\xb9\xa9\x0f\xcc\x1f\x01q\x87\
+>\x1f\xdc\xc8\x1c\xca\xd8z9\xe2\x03\x87\x9a\x19T\xe5\
+\x94[\x1d&4\x03C>\x921\xb7B\x9e/\x09\xdf\
+\x86U\x06\x8d\xf0T\x8c\x11\xb1\xa8\xa4\x82M\x0b\xbdq\
+\xfd\xefT'\xcaB\x14\x82)/\x94\xd1\xe8'\xd6x\
+\x80\x15\x91\x04Az\x04D4\xc1xR\x9bQv\x9a\
+T([\x1d&Jd\xde\x0e\x0b/{[_98\
+\xe5D\x1d\xd9a\xfczj\xd8b\xca\xdb\xb2\x97\x1a=\
+K2\x84G\x13`\x0b\xc2\xe8\x91\xda\xa2\xfeQX@\
+=\xf0\x88`\x82\x0bHn\xe5\x84\xe3e\xf2r\xf2z\
+9/\xe3R\xf66\xfay\xd9q\x80\xb9\x0cE\xbbv\
+\x93\x0fSQ*\xb7\x19\xa0/\x03\xf0}[\xa6oj\
+\xfeS\x1dgk\xfe`5n7\x9cI\x1atQ+\
+\xb9\x9b(;qr\xc7U\xd1\x120\x87\x03H\xb8\x0e\
+\xa6n\xe5\x04\xc0W\x22\xa0@-\x10\x92\x1f\xc5)\x95\
+\xfa\x19\xae\x1b\x03\xfa*\xe7\x9b\x91]\xa3?K\xcb\xe5\
+\xcb\x82\xa1k\xfcvO\x05O}\x19\x806\x83+\x10\
+\xfe}B\x84\xb8M\x05\xd3>\x02\x11\x92\xe4yY\x80\
+\xd8\x12\xdb\x80\xa76\x13\xde\xbb0_mj\x08\x8dv\
+H+\xb7\xb22M\xa1\x04\x8f<m\xda\x81\x85\xe1\xe3\
+\x13\xb9\xa4>@-AK\x8af\xfa\xb8\xd3@|5\
+N\x02\xde\x90\x9a~\x1f ,,U\x95\xe5^\x95\x17\
+\x5c*Kr%#z9\xe7T\x089\xb12\xd3r\
+Y(\x86\xe3x\xd4I^WN\xd00\x00\x19\xb2\xb2\
+\x9a@#\x96\x15Q@\xc2( X\xa2\x95Xo\x91\
+\xdd\xda\xd5D7{\x1c\x8d\xd3V\x8bd\xa6\xcbTy\
+\xf2\x07\xca\xf1\xe2-F\x1f\x84-\x82\x02\xc0\x94p\xfb\
+\x16\x11\xf8\x85\xfe3B\x8b6C\xd7\xc2Y\xd2\xd9q\
+Nmx\x09\x5cx,\xd8('!f\x93\xe4:\x92\
++\xa5L%\xed#\xbc\x9f\xc8Y|\x87,\xba\x15\xf0\
+4\xe1\x8a\x91.\x13\x80\x1e2h\xcb\x16G^r\xfe\
+\x8dd\xff\x0f\xc1|\x0a\xab\xb8ej~\x18\x8a\xb8F\
+T\x84\xae\xd3\xaa\xf0W\x02}\x04\x83\xf4\xc8\xca2\x02\
+V\x89\xc6\xc0 \xfdx\xec\x92.\xe1Qf\xa8,\xa7\
+lp\x91\xe4K\xcbT\xf7\xb6H;\xb6\xf5\x82\xc9C\
+\x91I\x92p\xd7\xfe\xbc\xb6\xda\x7f\xd2\x1f\xe5Q\xb1\xaa\
+\xd1E\x81f\x09\xcb\xf2TE\xf0W\xca\xf7\xd1\xa1\xe2\
+\x181;^\xe5\x03\xf5\x8c\x11\xd3\xaa\xea*\x0a\xb1a\
+p\xcc_\x043\x13\x99\xbb\x97\x9b\xadC\xe3\x0fD\xe2\
+(\xc3\xb1\x9fIsd\x9d\x06G{\xf4\xfc5\xf9\xc0\
+L\x9d\x05\xdeL]\xb7:\xf2N\x1e\xc5\xfa\xc3\xce\xa6\
+\x83:\xd5t\xcd\xf4\xa4r\x1e\xd20\x1dB`d\x16\
+H\x86(\xd1\x93\x11\xb0CJ\xc9N\xd4\xc0\x89\x0a\xa7\
+\xbe\x09%f\x85\xdb7@\xb7\xac\xe8\xeeO\xb7\x7f\xdc\
+{\xc5=^\xc4\x88\x9f\xa6\xc6\x95k\xcb>\xbd \xe5\
+\x18P\x12\xbc\x17V\xacz\x10\xf1>\x18\xe5\x9bt\x01\
+\xd9g\x87\xffC\xa0M\x1d\xf1C\x07\x97s\x9b\xec\xb9\
+U\xaavvv:\xa2\x8f\x88\xd7\x9b\xe5(\xee\xa9\x18\
+]\x07\xfc\x9erbU9\x10\xf7[\x8c\xe2?M1\
+\x7f}.\xf7\xbbw\xb4\xf8o\x81\xfe\x87\x81Z\xd6\xb5\
+\xc2\xcd\x09bI\xf9mM\x81?\x0c\xe9\x7f\x07R\xb8\
+\xae\x0a\x989\xf3\xb9]7\xb25\xbd\xc4h\xe1u\x15\
+\xf4\xf9\x98y[\x89\xff\x10\xb1\xb5\xc4ms?^\xba\
+4\x90\xd8{\xef\xbd\x03t\xf7\xd6\x1f\xff\xca<\xfc\xf6\
+\xba/\x9a\xce\x8b\xfe\xdbJ\xfa\xfc\xdePt\x83U\xd7\
+\xcdR\xdb\xff\x00\x05@.\x163\x9a\x97\x13\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x11\xa5\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x04\x0eiCCPkCGColor\
+SpaceGenericRGB\x00\
+\x008\x8d\x8dU]h\x1cU\x14>\x9b\xb9\xb3+$\
+\xce\x83\xd4\xa6\xa6\x92\x0e\xfe5\x94\xb4lR\xd1\x84\xda\
+\xe8\xfee\xb3m\xdc,\x93l\xb4A\x90\xc9\xec\xdd\x9d\
+i&3\xe3\xfc\xa4i)>\x14A\x10\xc1\xa8\xe0\x93\
+\xe0\xff[\xc1'!j\xab\xed\x8b-\xa2\xb4P\xa2\x04\
+\x83(\xf8\xd0\xfaG\xa1\xd2\x17\x09\xeb\xb93\xb3\xbb\x93\
+\xb8k\xbd\xcb\xdc\xf9\xe6\x9c\xef~\xe7\xdes\xee\xde\x0b\
+\x90\xb8,[\x96\xde%\x02,\x1a\xae-\xe5\xd3\xe2\xb3\
+\xc7\xe6\xc4\xc4:t\xc1}\xd0\x0d}\xd0-+\x8e\x95\
+*\x95&\x01\x1b\xe3\xc2\xbf\xda\xed\xef \xc6\xde\xd7\xf6\
+\xb7\xf7\xffg\xeb\xaePG\x01\x88\xdd\x85\xd8\xac8\xca\
+\x22\xe2e\x00\xfe\x15\xc5\xb2]\x80\x04A\xfb\xc8\x09\xd7\
+b\xf8\x09\xc4;l\x9c \xe2\x12\xc3\xb5\x00W\x18\x9e\
+\x0f\xf0\xb2\xcf\x99\x912\x88_E,(\xaa\x8c\xfe\xc4\
+\xdb\x88\x07\xe7#\xf6Z\x04\x07s\xf0\xdb\x8e<5\xa8\
+\xad)\x22\xcbE\xc96\xab\x9aN#\xd3\xbd\x83\xfb\x7f\
+\xb6E\xddk\xc4\xdb\x83O\x8f\xb30}\x14\xdf\x03\xb8\
+\xf6\x97*r\x96\xe1\x87\x10\x9fU\xe4\xdct\x88\xaf.\
+i\xb3\xc5\x10\xffe\xb9i\x09\xf1#\x00]\xbb\xbc\x85\
+r\x0a\xf1>\xc4cU{\xbc\x1c\xe8t\xa9\xaa7\xd1\
+\xc0+\xa7\xd4\x99g\x10\xdf\x83xu\xc1<\xca\xc6\xee\
+D\xfc\xb51_\x9c\x0au~R\x9c\x0c\xe6\x0f\x1e\x00\
+\xe0\xe2*-\xb0z\xf7#\x1e\xb0Mi*\x88\xcb\x8d\
+Wh6\xc7\xf2\x88\xf8\xb8\xe6\x16f\x02}\xee-g\
+i:\xd7\xd09\xa5f\x8aA,\xee\x8b\xe3\xf2\x11V\
+\xa7>\xc4W\xa9\x9e\x97B\xfd_-\xb7\x14\xc6%=\
+\x86^\x9c\x0ct\xc80u\xfc\xf5\xfavW\x9d\x99\x08\
+\xe2\x929\x17\x0b\x1a\x8c%/V\xb5\xf1B\xc8\x7fW\
+\xb5'\xa4\x10_\xb6t\x7f\x8f\xe2\xdc\xc8M\xdb\x93\xca\
+\x01\x9f\xbf\x9f\x1a\xe5P\x93\x1f\x93\xed\x5c>\xc4\x15\x98\
+\x8d\xc9@\xc1\x84y\xec\x150`\x13D\x90 \x0fi\
+|[`\xa3\xa7\x0a\x1a\xe8h\xa1\xe8\xa5h\xa1\xf8\xd5\
+\xe0\xec\xdf\xc2)\xf9\xfe\x00\xb7Tj\xfe\xc8\xeb\xe8\xd1\
+0B\xa6\xff#\xf0\xd0\xaa\xc2\xefhU#\xbc\x0c~\
+yh\xabu\xd0\x09fp#\xd41I/I\x92\x83\
+\xf8\x1c\x22\x93\xe40\x19!\xa3 \x92'\xc9Sd\x8c\
+d\xd1:J\x0e5\xc7\x96\x22sd\xf3\xb9\xd1\xd4y\
+\x01#R\x9f7\x8b\xbc\x8b\xe8wA\xc6\xfegd\x98\
+\xe0\xb4\xcf\xc5J\x9f7\x10\xd8\xcf\xd8\xcfk\xca\x95\xd7\
+n^:}nW\x8b\xbbFV\x9f\xbb\xd6s\xe9t\
+$g\x1aj-t\xc8\xda\xd4\x9dr\xcf\xff\xc2_\xe7\
+\xd7\xb0_\xe77Z\x0c\xfe\x07~\x03\x7f\xeb\xdbV\xb7\
+5\xeb4\xccV\x0a}\xbao[\xc4G\xf3=Nd\
+>\xa5-Ula\xb3\xa3\xa2Y5V\xfa\x02\x1f\xcb\
+\x00}\xb9x\xbb\x08g\x06[\xfc\xe4\xf7\xc9?\x92k\
+\xc9\xf7\x92\x1f&\x7f\xe3\xde\xe4>\xe1\xces\x9fr\x9f\
+q\xdf\x80\xc8]\xe0.r_r_q\x1fs\x9fG\
+j\xd4y\xef4k\xee\xaf\xa3\xb1\x0a\xe6i\x97Q\xdc\
+\x9fBZ\xd8-<(d\x85=\xc2\xc3\xc2dKO\
+\xe8\x15\x86\x84\x09a/zv7\xab\x13\x8d\x17]\xbb\
+\x06\xc7\xb0od\xab}\xac\x80\x17\xa9s\xecn\xac\xb3\
+\xd6\xe1?TF\x96\x06'|\xa6\xe3\xef3\x03Nn\
+\xe3\x84#I?\x19\x22\x85m\xbbz\x84\xed\xf5\xa6v\
+~K=\xda\xaf\x81\xc6s\xf1l<\x05b|_|\
+4>\x14?\xc2p\x83\x19\xdf\x8b\xbeQ\xec\xf1\xd4r\
+\xe9\xb2\xcb\x0e\xe2\x8ci\x9d\xb4\xb5\x9a\xea\x8a\xc3\xc9\xe4\
+\xe3b\x0a\xaf2*\x16\x0c\xe5\xc0\xa0(\xeb\xba\xe8\xbb\
+\x1c\xd1\xa6\x0e\xb5\x97h\xe5\x00\xb0{28\xc2oI\
+\xfe\xfd\x17\xdby\xa5es\x9f\x068\xfc';\xf7Z\
+\xb69\x0f\xe0\xac\x03\xd0\xfbh\xcb6\x80g\xe3\xbd\xef\
+\x00\xac>\xa6x\xf6Rx'\xc4b\xdf\x028\xd5\x83\
+\xc3\xc1WO\x1a\xcf\xab\x1f\xeb\xf5[xn%\xde\x00\
+\xd8|\xbd^\xff\xfb\xfdz}\xf3\x03\xd4\xdf\x00\xb8\xa0\
+\xff\x03\xff%x\x0b\xc5c\xd6\xcb\x00\x00\x00xeX\
+IfMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\x00\x03\
+\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\
+\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00R\
+\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\x00\x04\
+\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00H\
+\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x02\xa0\x02\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\
+\x00\x01\x00\x00\x00@\x00\x00\x00\x00\xfa\xa3\xa7\x01\x00\x00\
+\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\
+\x9a\x9c\x18\x00\x00\x02\x04iTXtXML:c\
+om.adobe.xmp\x00\x00\x00\x00\
+\x00<x:xmpmeta xmln\
+s:x=\x22adobe:ns:me\
+ta/\x22 x:xmptk=\x22XM\
+P Core 6.0.0\x22>\x0a \
+  <rdf:RDF xmlns\
+:rdf=\x22http://www\
+.w3.org/1999/02/\
+22-rdf-syntax-ns\
+#\x22>\x0a      <rdf:D\
+escription rdf:a\
+bout=\x22\x22\x0a        \
+    xmlns:tiff=\x22\
+http://ns.adobe.\
+com/tiff/1.0/\x22\x0a \
+           xmlns\
+:exif=\x22http://ns\
+.adobe.com/exif/\
+1.0/\x22>\x0a         \
+<tiff:Orientatio\
+n>1</tiff:Orient\
+ation>\x0a         \
+<exif:PixelXDime\
+nsion>144</exif:\
+PixelXDimension>\
+\x0a         <exif:\
+PixelYDimension>\
+144</exif:PixelY\
+Dimension>\x0a     \
+ </rdf:Descripti\
+on>\x0a   </rdf:RDF\
+>\x0a</x:xmpmeta>\x0a<\
+\xd7\xf1\xbb\x00\x00\x0a\xa9IDATx\x01\xed\x97}\
+\xac\x96e\x1d\xc7O\xf6\x8a\x16**/\x11;\x90\xf6\
+\x22\x90\x11EJ\xad\xd4j5\xb2ea\xab\xb5Uk\
+\xab\xd5l3+\xc9\xb4\xf5G3Z\xa5\xd3\x1a\xb6d\
+\xcb\xc8i5\xb0LLS\x9cS\xd6\x88,\xc1^$\
+A\x81\xc6\x01\x14$_J%\xc5\xde?\x9f\xe7\xb9\xbf\
+tyws\xcey\xce9\xc8a{\xbe\xdb\xe7\xbe~\
+\xd7u\xdd\xd7\xdb\xef\xfa]\xd7\xfd<==]u=\
+\xd0\xf5@\xd7\x03]\x0ft=\xf0Lx\xe0Y\x0cr\
+H1P\xf2\xa6\x91v\x99O\xf9A\x99f\x81N\xbe\
+\x5cTY\x9e\x85\xe9\x98\xbas\xd2\xae,\xcf\xfb\xa3>\
+-\x17\xfc\x9cj\xb6G\x92\xf6\x163\x1f\x8b}Y\xad\
+l\x0a\xf9\xa9\xa0\x9e\xdbNZ\xcf\xb2\xbf\xa2xt\x99\
+\xee\xd4\xb3\x8b)\x1d\x86\x9d\xc5[|!\xfc\x1b\xe6\x98\
+A_\x83\xff\xc05f\xd0$x\x08n0S\xc9\x85\
+\x8fI\x86\xb4>FQu`\xcdr\x87\x0e\xad\xa6r\
+9\xe9*\x98\x0c\xee\xe6=\xe0\x82\xd7\xc1\x02x\xa4\xca\
+\xff\x93\xf4KpK\x95\xb7|\x1a\xd8\xe6Z\xb8\x1e\xd4\
+\x0b\xdaI\xebY\x8eW\x14\x1fX\xb3>\xa9,x3\
+\xd3\xba\x0a\x5c\xfc?\xaaT\xbb\x89\xa7\xaar\xa3bM\
+e?I\xea\xf1\x89\xea\xe3\xa4\xfc\x80\xa4\xeeR.\xa9\
+3\xb1W\xc2\x9b\xe0u\xb0\x13\x0c\xf9,\xf4_\xd8\x7f\
+\x87\xddU\xd9Z\xd2s\xe1\xae*o\xb9\xf5FD\xda\
+\xe80\x1d0\x0f\xa6\x83\xd1\xb0\x10\xa2\xe7\xc5\x18\x0d\xe9\
+w\x99\x84\x13\xff\x1b\xec\xa8l\xf3.\xc0\xc5\x95\xce\xb0\
+\xfc5\xa0tV\x16\x9c\xd4>\x9e(\xcauf\x8e\xcc\
+J\xec\xf2\xae!;te\xf7\x86\xda\x83g\xf5\x85U\
+\xe3]U\xeaY\xf5Bs\xc1\xee\xbay/DC\xf7\
+\x0e\xf8-\xa8\x93\xdaI\xcf\xec*]O\xea\x9d\xa1\xbc\
+G\xbc\xfcl/\x13!\xc7@gX\xa6\x13\x8e\x83g\
+\xfcH\xe4f?\x8a\xc1\xb7\x80\x13Z\x0a9\xf3{\xb0\
+s\x96\xdd\xd1\x0dp\x01\xcc\x05'm\xd8\xde\x0a\xd6m\
+\xadRw\xf5E\xa0f\xc2\xf9p/\xf8\x8ex4\x8c\
+$\xedm\xf0C\xb0\xfeQ\x98\x01*\xf3j\xe7\xf6\xe3\
+3\x1e7\xcd\xa2\xcb\x89&\xd4\xffL\xfd'\xa1)\x5c\
+\x9fO\xf9J\xb0\x9d\x17^\xfa\xc4\xdc+\xef\x97\x8fB\
+\x1f\xa4\xff\xfa%\xfa8u\xe3A5\xf5\xd1\xae\x19\xa1\
+g\xd3\x00\x8b\xe9\xdb\xc9=\x05\xe5\xe5\xf5s\xf2\xd3@\
+\xb93\x86\xb4G\xc1\xdd\xf78(#\xe84\x88\x83|\
+\xc7z\xdf3\xfc3\xdeX\xec%\x10'\x18\x0dF\x99\
+\xf9\x9b\xa1\xae\xb4\xab\x97\x0f+_\xde\x15\x9f\xa2\xa7e\
+\xf0M\xb8\x1b\x9cH\x16\xef\xc5u\x16\x8c\x94r,\xec\
+\xefLHt\xc5\x01}\x94-\x02\x8f\xc4B\xd0\x89*\
+Nm\xe7\xfay\x0e\xd6[:\xc0\xc1\xd5\x8d0\xafe\
+\xb5\x1f\xb9\x90\xcc9\x89/\xc3\x04p7\x9dh}\x0c\
+\xf3\xf6ed\x88;\xaa\x13#\xeb\xedsWU`\xde\
+\xa8\xf0\x0e\xf80\x5c\x09\xcav\x8e\x11\xf9{\xe3\x04\xf0\
+=\xfbuS\x06T}r\xfd5\x18C\xa5\x9d\xfb\xf9\
+\xba\x0d\x0e\x07'\xe1yV\x0e\xb8\x1d|\xcf\x1d\xb0\xae\
+\x8c\x1c\xb2OS}\xd1VZf\x1b\x1d\xb7\x11\xfc\xee\
+\x7f\x07t\x98G\xc7\xcf\xe3\x02\xb8\x08\x94c\xb8\x06\xdb\
+\xbc\x0f\x96C\xe6\x8992*\x9d\xe4\xc2f\xc1V(\
+C\xdf\x09\x9a\xdf\x1f\xac\xa6\xdf\x97\x83\x8a\xb3\x0dy\xc7\
+\xca\xa5\xe8\xd7\xe0\xcd\xe0\xceG\xe5\xbcS\xd6q\x9a\x1d\
+\xb4c\x7f\xe8\xb8\xc3;\xc0\x05\x8b\xa1\x9aE\x9b\xf72\
+t\xf7L\xf7\x85\xf5M\xd4\xdfww\xed\xd3\xfe\xb7\xc1\
+T\x88\xc6a\x18!\xd6\xe5\xfey\x00\xdb\xf7\xae\x83c\
+@\xb9a\xc3R\x1c`'?\x85,\xb6L3\xc9\xb2\
+l(vS?.N\xc7\xd8\x9f\xe3G\xcek\x0d4\
+\x8d\xf3{\xca=.j\xd8\x0e\xb0\x93\x84\x95\xbf\xf8\xee\
+\x80\x0c\xfa\x17\xec\x87\xab|B1uMi\xd3\x02\x07\
+\xf3\x9e\x91\xe0{\x8f\xc1kAy\x19Z\xa6s\xbc\x97\
+\xd2\x8f\x11p,\xa8\xf2\x82l\x974<\xb3\xb8\x86\xaa\
+V\x91\xe7(\xb7\xa9\xe9]0\x07\xee\x85w\x81\x93\xba\
+\x1d\xfc\xfc\x9c\x01G\xc3\xb7a\x0a\xf8~\xfa\xf7\xa8\xb8\
+\x1bk\xe1bP\xd6\xc5)\xd6\xbd\x17\xe6\x83cZ\x9e\
+\xe8K\xea'q\x02\xa8\xb3`'\xbc\x0d\xdc\x98\xa50\
+\x0d\xfe\x00\x8f\x80\xca\x05\xa9s\x86$'\xa2\x8e\x00o\
+\xdd\xcd\x903\xbf\x0c;Z\x82\xe1 \xd3\xab\x82MU\
+>\xa1k]v\xd1\x89\xf6'o|\xdf/\xdb\xeaH\
+\xcbd&\xcc\xa8\xec\xef\x91F?\xc6\xb0\xde\xf9yG\
+-\x86)\xa0\xb2\x8ev\xae\x83g\x1aN\xa6M\x16\xee\
+\x0f\x1d\x07\xda\x0d\xe7\xc3\x17\xab\xbceo\x01\xbf\xd7\x7f\
+\xaa\xca\xcaE\xc4\x01WS\xd7\x9f\x9c\xb8}\xe5}\xed\
+\x84\xb8?\xba\xd4<\xb0\x5c\xce\x86\xcf\x81\x9f\xc7\xf2]\
+m#U%\x82\xda\xb9\x0e\x9fq\x82g\xcf\xcb\xc5\x8e\
+\xeb\xe7}\x05e\xef\x04u$\xac\x07\xdf+\x1d\x90]\
+\x5cG\xf99\x15\xe7\x92.\x80\xcf\xc3B\xb8\x09l'\
+qx\xda\x99\xd7\xc1J'\x7f\x10\xd6@\xde7\xcd\xbc\
+\xfa\xb0O\x03\x95\xf9\xb7sCx\x96\xde;\x8f\xf6\x0e\
+\x14o\xdf\x89=\xbb\xd6\xe78\xf2w\x83\xef\x95\x0e0\
+\x9f\xf3\xae\xdd\x1fy/\xa9\x97\xed\xe9\xa0\xfc\x83\x149\
+\xb7\x93a\x15\xd8_\x22\xc5;(\xca\x1d\x94|Gi\
+\xbc\xe7\xe5s\x11\x18\xf6\x0e\x14\x07|\x0b;\xf2\x12T\
+\xfb\x8a\x80,\xd8E\xb9\x9bu\xdci\xc3>;\x9f\xc5\
+[6\x17Tnu\x17\xee\xa5\x19}\x1a\xc3\xfe\xf7\x14\
+\xe9\x15\xd8\x93@e\x1d\xed\x5c\x07\xcf\x0c\xf2\x0d\xda\x94\
+\x0b\xc8@\x97T}\xf9^&7\x90\x03\xd2O=u\
+\xe1Yt\xea\x92\xf7h\xb8\x09*s*\x17\xf5\x09\xca\
+m\xa3\xb3\xd2\xc6|yQ\x93\xed\x5c\x19\xc4K\xf0\x0a\
+HH\xe7\x22\x5c\x5ct\x99\xd0\x1c\xc8\x01\xee\xb4\x91$\
+F\x92i\x1c\xea\xa4\x13\x01u',\xa1N\x19\xd29\
+\x96\xaf\xc0~\x0f\xfc\x00|\xdf;@\x07\xc8\x0d\x90\xaf\
+R\xd6AQ\xe7\xca`\xb6\xf4\xf2r\xa0\xc7\xaa\xf4\x1a\
+R\xe5\xee\xfb-V\x13`\x03\xf8^\x1c\x96\xc9\x99\xde\
+\x06'Tx\xb1\xbe\x1a\x9c\xa8G\xccz)\x9d\x10[\
+G\x1d\x0f\xea\xa8v\xd2s\x1ei\xd9&\xe3]V\xd5\
+\x9b$b\x8a\xa2\xce\xcc8\xa0\x97f\xbf\x00\x07L\x04\
+x\x09\xd6e$\xfc\x11|/\x13\xd2\xceg\xad\xbf\xb0\
+\xbc\xb4\xa1]\x1c`\x1f\x1f\x07\x95\x8b\xedBl\xcb\xf3\
+\xa5\xc8W\xc0\xf1u\xae\xca\xfc\xdb\xb9\x0e\x9f\x09\x9d\xf1\
+\xb4{\x18\x1c\xccp5\xc4\xb4\x9f\x84\x13\xc1\xb0\xef\x05\
+\x7f0\xb9K\x1b\xc1\xfa,\xba\xb4\x97S\xae\x93\x8c\x9a\
+\xc3\xc0\x7fwc@\xcd\x81\xfabl\x1b'\x18=/\
+\x01\xdb\x9f\x04\xdb\xa0\xac\xd7.\x8f\xd3,\xf2j\xc8N\
+\x88\x03\x8e\xa6\x13\xcf\xd9\x83\x90\x01\xe3\x84\x87(\xbb\x0f\
+v\xc0\xfd\xe0\xcf\xd3\xecD\xde\xb1M\xec]\xd8+*\
+n%\xd5!\xf6\xaf&\xc2&\xa8/$m-w\x8c\
+5\xb0\xbbz\xaf\xac\x8b\xa3\x1e\xa5\xee&p3T\xd6\
+\xd1\xceu\xf8,\x1bO\xa1\xad\xe7\xde\x89\xe4\xc2\xd1n\
+\xa2\x9cX\xea\x9b\xca\xac\xeb\x05\xe5y\xd59\x96\x95;\
+i\xde\xb6\xf5\xf6\x89\x16\xeb\xe3\xf4_a\xe7\xf2\xc3\x1c\
+x\xf1\x03\x85\x87\x9d\x1brj;x\x1c\x94\x93\xd19\
+\x0el\xa8\x8bg>ao\x9dmKYf\xbb\xb4\xb1\
+\xfe\xaf\xe0B\x94;\xb8\xaee\xb5\xfbN{\xd3l\x84\
+m\x1d\xc76\xe5\x05\x97w'PnT*\x8fW\xca\
+[\x05Cyd`\xdb^\x05vXz\xde|Iv\
+j\xa04\xe1\xfa8\xed'A\xf4F\x0c\xdb\xda\xa7\x0b\
+m\xea\xa7\x1c\xaf\xb4u\x8e\xf9_B\xee\x95\xd2I\x14\
+\xff\xbf\x06\x8a\x808\xc0(\xb0s\xffj\x1a\x9e\xca|\
+\x14\xdb\xf7\x07C\xc6\xf5\xf3\x19\xdb\xdb}5\x5c\x00\xca\
+\x8b\xb2\xa9\xafVe\xc3\xc3\x8d\xf1g\xb3Q\xe5\x05;\
+(e\x81\xfd\xbd\xec;\xe5\x02O%\xff#0\xdc\x1c\
+\xd4\x89\xeb\xfdE\xb0\x01\x0e\x05?\x95\xb6s'\xc4\x9d\
+\xac\xcb\x85\xbb\xcb\x97\x83?\x8a\xec\xc7\xfe\xd4\xfb\xe1e\
+\xe0o\x0e\xfb\xf2]\xfb\xf5}\xc7=\x1b\xfc\xfad|\
+\x8f\xdeG\xe0'`t\xa9r\xde\xed\x92a>\xfd\x17\
+\xa6\xfc\xf1b$\xe8\x14\xa3!!\xbb\x04[y\xf6\x0c\
+\xe5\xf9\x906\x98\xfd\xca\xc9\xaaDC;\xd7~\xce%\
+9\xb6(\xf8\x0a\xb6c;\xae\x0b\xd7\xf9.\xfa\xdd\xa0\
+\x12\xfe\xed\xdc\x08=\xcb\x89\xddH\x9fN \xb8\x0b\xb1\
+\xfb\xb0\xdd\xb1\xe4\x97a+\x1d\xa1c\x9a\xc8\xe2}O\
+\x99w\xb7\xd5\xf7!}\xed\xc4\xfeM\x91\xcf\x85\x9b\xfa\
+{\xa8\xb3\x7fe4\x0dJ\x83~\xb1\xe8\xed\xd7\xd8\x0e\
+\xb4\x15N\x85\xa9\x90K\xad\x17\xfbgp-|\x15N\
+\x06w\xe4I\x18\xac\x5c\x90Ntno\x07\xcf\xf5%\
+0\x0f\xde\x00:\x5c'y/\xed\x82\x9ba<l\x82\
+l\x94}\x8c\xb8\x1c4\xca\xed\xba\x98\x02\x07\xf3\xc7\x87\
+\xe9zH\xd8\x7f\xa6*K\xf8\xea\x08\xdb\xd9O\xd9\x17\
+\xd9\x96,s\x01\xb9\xc0lg\x9f\x9f\x05eT\xb8\xcb\
+\x96\xe9\x14S\x17_WS\xdf\xf5w\xf6\xe6\xe3\xb1\xbd\
+\x05\xfd\x18\x0e\x18\xe5\xa29\xb1*\x18[\xa5\x93IO\
+\xa9l\xef\x0auF;iEA\x22\xc5\xbe\x9c\xa8\xbb\
+\x1c\xa7X\xe6\xb9\xf6BT\xa7\xb4\x9e==\xaf\xaa\xd2\
+\xd7\x93N\xac\xec#\xaat6i\xec\xaa\xa8\xe5\x98\xd8\
+\xfb%5\xf4\x94?a=\x97\xfe\xf0\xb8\x1e\xfa\xc0E\
+xs\xdfW\xd9\xe6]\xf4\xedp\x0e\xcc\x00\x8fO\x93\
+t\xc6q\xf0!\xf0\x17\xa7\x8e\xb0\xbdl\x86\x5c\xbc\x8e\
+y\x1dl\x81=0\x13T\xe6\xd5\xce\x0d\xf2\xd9Q\xb8\
+4\xf49\x8d2\xff(\xb9\xe8\xaf\xc3\x17\xa0\x94\x93/\
+\xc7\xf0\xfc\xde_\xb1\x9d\xf4\x01\xd0!\x9e\xe1\xe3\xe1\xa5\
+U\x9e\xa4\xa5z{\x0b\xaf\x86\x0f\x80\xbf\x13^\x0c\xdb\
+\xc0\xc8\x19\x92\xf4\xfap\xe4.D~\x97\x95\x9f\xa5'\
+\xe0pp\xf1\xe6\x9d\xa0\xa1\xeex\xbd\x15$\x8d\xf2]\
+\xdb\xd8\xd6E*\x7f\xdch{\x0f\x8c\x03\xeb\xfc\x0a\xf4\
+\xc1\xb0t\xc8\xb0Z\xff\xef\xfc\xda\x8d\xce\xd8\x08\xf3\xe1\
+tx\x10\x94\xa1\xe9.\xeb\x00\xe5\xe2\xfc*\xf8\xa3\xc6\
+E\x98\xea0\xed\xc8\xf7]\xb0\xc7\xc7\xf2\x8f\xc1[a\
+-l\x00#C\x0dw\x03\xdb\xbd\x8c\xd0\xd3IK\x94\
+\x1b\xdb\xf3{\x0b8i\xcf\xac\xe9\xbe\xd01\xd6\xad\x82\
+\xdfU\xb6e\xb9\xe8\xdcy\xbf&\xa3NN,\xcag\
+\xecJ\x0aV\xc3d\xf0+\xb1\x05\x5c\x5c\x1f\x5c\x0c\xfe\
+\x11\x8a#\x16a\xdfY\xe5\xbdO\xa6\x83\xce\x5c\x0e\xf9\
+\xd4\xe5\xf3J\xd1\xd3\xee\x15\xf3\xa3B\x86x\x19\x92\xde\
+\x09eD\x5cJ\xde\x05\xbf\x03\x94\x8b6\xbf\xc2\x0cz\
+%\x18\xf2FK\xe4\x11\xcd'\xd62\xc7\x90Q\xaf2\
+\x22r\x91Md\xd6\xb3\x8a\x99\x1f\x83\xbd\x14\xdc\xed\xc8\
+\xcf\xa4\x8ePi\xa7]\xf6g\xfe\xa0P\xb9[\xe5\x02\
+\xb4\xeb\xbbh\xbe\xbc\x90\xf3\xbee\xf5w\x0f\x8a\xc57\
+M\xd2E5-2\x8b\xb5\x8d\xf5e\xde\xb2\xae\xba\x1e\
+\xe8z\xa0\xeb\x81\xae\x07\xba\x1e\xe8z`\xffx\xe0\xbf\
+\xfb2\xef\xf2]\x87\xbc\xb5\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x13\x99\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x11IIDATx\
+\x01\xcdZ\x0btT\xe5\x9d\xff\xeek&\x93\xc9\xcc$\
+!\x81`\xb0\xbb\xae\xb5\xb5\xae`y\x16Q\x9e\xd6]\
+\xb1\xf4hw\x1bNO\xcf\xb1\x82\xed\x1a\xd6\x82\x0f\x08\
+\x01\x11d@\x88\xbc\x02B+\x8a\x85\xca\xbag\xd7.\
+\xe9\xb6\xae\x82\xabe\x15\xd8\x9e] \x12\x83PB\x15\
+uK%H\xf3\x98<&\xc9\xcc\x9d\xb9\x8f\xfd\xfd\xbf\
+;7\x99!\x132\x93dR\xbf\x9c\xdc\xb9s\xefw\
+\xff\x8f\xdf\xff\xf9}w\x18\xfbs\x0d\xbf_\xecfm\
+\x9aB\xf7\xf90\x9f\xc8\xc3\xcc\xcfbg\x9a\x22\x13\x04\
+\xe3\x1b\xfe]^m\xf4\xb4P\x8d D\x19\x81 \x08\
+\xe6p\xcb\xd3c\x85\xe1\xe2\xec\xb7\x94'v\x9f\xde2\
+i\xef'\xed\xe7W\xc6X\xffY\xbc`x\x01 +\
+\xfb\x05\x83\x14\x1e\xf5V\xdds\xcc\x9ds\x9b!\x88\xdf\
+\xf7l\xdc\xfb\x10y\x04\xf3\x1f\x19v\x8f\x1cN\x00\xc8\
+\xc2\xdc\xca\x85\xffQ\xfb$S\x94y\x82n\x06\x04Q\
+\xec\x10]\xd9e\xde\x8d/\xcde\xfe\xd9\xdap\x830\
+|\x00\x1c1%\xb2r\xe1k5\x0bE\x97{!\x13\
+\xc4&\xf8\x83\xc2L\xfc\x09bH\xc8ro\xcc\xf6\xff\
+t\x02\x07\xe1\xe1=J,,2\xfe1<\x00\x1c1\
+e6[\xd0\x0a\x7fUs\x8f\xe8\xf6,\x87\x1f\xb42\
+\x03\x80\xf0\x81\x9c`\x9a\x1a<A\x92\xbd\xf9\xcf\xb9\x9e\
+\xaa\xbc\x9e\xbdT\x1ae~\xff\xb0\x84CL\x88\x0c\x02\
+m+\xff\xea\xb1\xf1\x827w\x97(IQF)_\
+\x14E3\x1aezs#c8\x87\x1fDD&\xe6\
+\x8aN\xd7\xed\xea\xf5y\x07\xd9\x8e\x1daVr@b\
+uU\x19\xad\x0c\x99\xf5\x80#Hjd\xf9\x97\x8f\x14\
+\x89\xf9\xa3*\x05Y\x96M\xc3\xd0\x18\xd4O\x84\x1cy\
+Q\x10dDC\xbb )_\xf5\xdd<{;\xbf_\
+5_\x87'\x5c57\xf1\xc9\xc1~\xcb\x1c\xf1\x03\xb0\
+\xdel$\xb5\x07\xca\xdcBQ\xe1\x8bL\x92F\xc1\xf0\
+]\xb0v\x12\xaf#18\x08\x88}\xb3\x85)\xf2L\
+\xcf\xe6\xfd\x15\x5c\xb9\xb5k\xc9\x032V\x223\x03\x00\
+Ym>\xac\x871\xea\xfb\x0bw\x8a\xb2\xf3kP\xbe\
+\x9d\xac\x8c\xd8\xe7z%\x1e\xa82\xda  _\x98,\
+ *\xce\x12o\xc5\xcf\x1f\xc53&;p 3r\
+\x82k&\x90\x15\xa0,\xb9\xb4Y\xf8\xc6\x07\x15bV\
+v\x09\xac\xda\x84\xef\x0aW\xde\xd6S\x12\x99\xde\xd5\xc9\
+\x22\x1f\x9d\xb3t\xe7\x00\x10,\x00\xc3\x84\xd2\xa0\x82\xf9\
+>=\xa2\xae\xeexra\x15\xe3\xe1\x04\x8f\x1a\xe21\
+\xf4\xc8Zm\xaeY\xf8\xfa\xfbK\x90\xd0H\xf9f\xa8\
+B\xae}\x0d\xd1m1\xc8\x130\x04\x81@\x14\x10.\
+A\xc9\xe1\x5c\xe3Y\xbf{:\x0f\xa7=C_\x1em\
+\xce\x16\xe3\xc1\x1e)\xe3\x0b\x82^\xf8\xda\xfb\xdfE]\
+_\x0c+\xb6@\x1b\xa9\xdb\xb8\x09\xf4\x09\x10\x93\x02?\
+\xa65\xdd\xb4\xc5\xa1\xcb\xa2\x00\x0f0\x00\x82.\xba}\
+\xdb<\xcf\xec\xfe*+\xa5\xf2\x88\xc4:\x84\xc3\xe68\
+x\x92{N)\x94\xf1\x0b\xaa\x8e\xcf\x12]\xae\xb5(\
+sAnE\x01\x96\xa4Aj\xda\xdc\x04\x8a\x11\xd1\x80\
+\xa3\xbb\x11)Y\x98\xc7\xf3\x855\x89\xcf\xb6\x1e\x10Q\
+-L#\x02Z\xd9\xa2\xcb\xfb\xbc{\xf9\x96\x22\xde(\
+Q\x82\x1d\xa2a\x8b48r\x14\x9f\xa5\x93\xa2\x05\xbf\
+\xf8\xedW$o\xee&&\xc9(u\x06\xac\x07W&\
+\xc5\xe3\x95\xe7\xf1-\xc0\xb6z.\xfe\xb7\xe9\xa1\xf0A\
+xM\x01@@\x7fp\xb58\xdc\x13$\xc0\xd5\xc9D\
+\xa9X\x1e9z'\xa8\xc9<\xc1\x0eQy\x1c|\x12\
+<\x80\x8en\xbe\xa0{*\xfei\x84\xeb\xeb\x93_\x15\
+\x9c\xcah\xa6\x1bV\xb9\xb33~\xbc^\x06\xd3\x10\x1a\
+#\xcc\x8e\x8e\x17\x1b\xbe3\xa1\x12\x0aI\xde-\xfb\xf7\
+\x0a\xb2s\x1a\xce\x03<Yr\xc4\xf0\xad{\x80\x00\x01\
+$\x08\xf9fT}\xbb\xbd\xfc\xc1G\xf9\xad!XB\
+\xc7\x8b\xd6\xcd.\xe5\x13Z\xdaBy\xcc\x97\xb3\xc7O\
+\xfe\xa9\xa0\xc8\xd73\xdd\x84\xb5P\xeb\x93)o2R\
+b\x84\x19V\xff\x85+O\xe01\xa6\xb7\xff\xfa\xd0#\
+L\xd7\xce\xe0<\x17\x8a\x22\xd3_-\x16y\x02\xaa\x88\
+i\xb6\x08\xb2c\xaeo\xd3\xcb\xab\xb8\x8cUUWO\
+\xe4\x97\xd39\x0c\x9c@\xfc\xd2\xf6\xd0\xd9J&+\x13\
+\xc1\xb8\x15no\xd5z\xa2L\xff\xe4\xfeTmIy\
+&\x14\x98\x11\xf5\x8d\x86o\x8f\xf5\xd3UV\x82\xbb\x14\
+\xcf\xc7\xabB\xe6\xe5\xc6RS7>\xc5\xae\x88\xa7O\
+\x10L$Y\xf2\x12G\xd6\x02\xbe\x84\xa6^c\x90I\
+q\xe0\x00TYf*|\xbdv\x15S\x9c\xf7B\xb0\
+f\xe8\x99P\xeb\xad\xd8'\xe5)\xbe\x85\x11F$|\
+\xb4\xe1[\xb7.%\xddq\x8dv\x85L+\x9e\x8f\xc8\
+\xed;\x96\x06\xa2\x9d\xcd\xa5H\x1d\x0d\xa8\x82\xee\xa4 \
+`\xc9\x80A\x876\xf4\x17e\xdeu\xbb\xad%\xf4 \
+\xca\xe3\xc0\x00\xa0\xa4\x07\xd7/x\xa3\xf6G\xa2+g\
+\x01\x04\x0a@`k\x09\x1bO\x11\x95\x8c\x94G*\xcc\
+3\xa3\xe1\xea\xc6o\x8d\xfd1\xe62nu\xda\x00\xb1\
+Gl\x1f \xe4\x7f\xf4\x92\xd1\xfcy)\x96\x0bm\x00\
+!V\x1d\xe2\x09\xe2\x01\xea\x11\xa8I\x12\xb1\x84\xce\xc9\
+\xdd\xe8]\xff\xd2\xe4\xc1\x94\xc7\xab\xa8\xdb\x12]\xe3\xf3\
+\x14\x95\xbb\xd9(w'\xe7I\xce\xeceL0[\xf1\
+\x8f\x85\x5c\xec\x19[-R\xde@<\x0b\x82\xd7\xd4\xb4\
+\x0b\x91\x0fO-\xc6\x8c\x08\xef\xe8bmr\x02\x17\x02\
+\x01\x96\x0c>\xbb\xec#!\xd0\xf2\xb8\xa9\xeb\xe8\x06y\
+8\x81b<qb\xc0\xcb#\x96\xd0\xe81\xdc\xee\x1d\
+Y\xab\xb7\xde\xc0\xcb\xe3\x00\xc2!\xbdzJ\x96\xbf\xe3\
+\x0e\xad\xf0\xd7\xd5_\x17\xdd\xde\xe7\xf8\xd2\x96oh\xc4\
+Vw$\x1b\x97\x95\x947t\xc8\xe9f\x86\xfe'\xbd\
+\xfe\xa3\x87\x02\x8f|\xaf\xb1\xdfv\xf6\xe0A\x83@P\
+\xcb\x1f\xb9$\xcf\xbc\xf7cI\x96\xe7Q#\x04/\xa2\
+M\x13r\xa7\x18f\xf8Ds\x80\xaf\x11\xb4\x0a>Q\
+qMU\x8bn|\x9d\xed*UYI\x09\x96\xd0u\
+\xf6\xc4\x04\x8c\x93}\xb1\xa1Mv/\xf1Z\xac\x17\xcf\
+\xff\xd9\x9bc\x04\x97w\x97 K\x92iY\xd8\xa2a\
+[\x9e\x12\x1e)/\x8aNS\x8f\x06\x8d\xcb\x7f\x5c\xd4\
+\xf4\xc3\xfb.3\xde(\xa5\xd0\xcb\xc7\xba\xbd\xce\xa7~\
+\xf4\x8e\xae\x86\xd6\xa0\x9fp\xf3\x5cA t{\x02\x89\
+\x06\x86\xf6\x12Zq\xdc\xe4\xbbm\xdc..pUU\
+ZKhH\x9b\xc2\xa0r\x87\xcd\xccQe[\xdd\xe6\
+]\xf7\xfe\xab +_\xc6S\xc1\x98\x8bZrq\xeb\
+\x93\x91\x0c\x03M\xbc\x8c86\x8d\x86\xc6\x7fhz`\
+\xc6\xfb\x5cy4J)p\xea\x99B\xd5\x01\xa1\xe2\xd9\
+\xb8o\x01:K\x94=\xa1\x05\x9e\x90\xd8Vs\x9e\xc0\
+\x9fW\x18\xb3\xc0\x88\xaaU\xc1\x15\x0b\xac\x12\x89\x07@\
+\xac_O\xe8\x1f\x80\x9efC\x1c\xf5\x9fu/\x09\x8a\
+2\x1d:\xb6\xc0\xc2\x89K[+\xe1Q\xf5\x97\x04\xd3\
+p\xe8\x1d\xed\x8b\x9b\xfen\xca\xb1\x01)o\xc1`-\
+\x88\x90,\xbd\x1b_~L\xc8\xcaZ\x02\x07hB^\
+\x91\x13\x1c\x81\xe6Z\xe0\xa3\xfbd#\xf4\xa8\xfa\x93\x8e\
+\x15\x0bv\xb1\x98\xd1,R}\x1f\xfb\x0f\x81X\xb9\x9b\
+\xf7\xee\xf9\xc7#\x924\x07\xa4\x9a\xcd\xf8\xa5-Q\xa0\
+\x7f\xc4\x03\xf9$\xa4\xce\xd2C\xa1\x95\x5cyZ\x1c\xa5\
+k\xf9\x1eY\xc9z\xc80\xa6\xd0\xfe\xd4\xc2\x9dL\x8f\
+\xfc\x1c\xcb\xe4\x11\x88\xfd\xb8\x969&>>\xd0\x5c\xa3\
+\xfff\x01\x8f\xe2\xfc\xf1\xdf\xfe\xacj:ylI\x0a\
+k\x86\x18\x85\x1e\xae\xbd\xce\xea\x8er/\xf1J\xc6M\
+\x1e=\xea\x03\xd8=nE\xc8\xd3\x88\xf5\xf7\x10\xd6\x07\
+\xcboh\xbao\xfc!+\xe1\x09\x83[\xbfS\x9f\xb0\
+n\x1d\xe7\xdfV\xfe`\x05\x5c\xfc\xdf\xc1\xa3\x10\xff1\
+\x10l\x01 \x03r\x22\xea\x86\xa1D:\x8b\x1d\xcc\x18\
+Cb5\x16\x16\xf6\xeb\xe1\xfd\x03@\x940`\xdfH\
+\x8e\xc4\xf2\xddZ$_\x17\x04\x8dWcz\x9a\xcb\x80\
+\xd5\x9c\xc9\xf2\x8d\xae\xce\x9dM\xdf\x99\xfc*\x04\xb4\xb6\
+\xc3\xf8\x93\x83<\xf8\xfdxa\xe2\xe7r\x06W<\xb8\
+\x92\xe9\xd1w`\xef\xfc\x1e\x10\xba\xe9\x1b\xceP{\xb1\
+\xa0kn\xe4 \x95_=\xd6}\xaf\xcf\x93\x94\x01 \
+\x0a\x94\x88\xddz\xb88G\x8b\xe6j\x02\xd3\xf8\xbe\x8d\
+@\xfd=+0\xd4\xd0\xcb\x8d\xf7\x8f\x7f\x1e\x93\xa8Q\
+\x893M\x9f\xbcS\xbfA \xd0\x0e1F[\xf9\x0f\
+\x96\x98\x9aZ\x83h\xcb\xe3  \x1e\x91vt)\xd4\
+Q$E\xd5\x11<j\xb0\xd2N\x95x\xca\x00P\x80\
+[\xde/\x989zx\x8c\xcb\xd0s\xb0\xdaU%f\
+\x8e2\xc2\xe1_6\xce\xbb\xcd\xda\xc4\xe4\x9c\x01\xcdP\
+\x0f\xda!\xb6b:\xd2\xfe\xd9\xff-2u\xedC\x08\
+\x94\x8f\xf6 ,\xaa\x1d\x85r44\x12\x9b\xcd\x08\xb9\
+\x94u\xe7\x12\xa6\x0c\x80\xa5\x0f\x88S\x1b\x8ac^4\
+T\x1c0\xcc\xc2\xcbQ\xedW\x0d\xf3\xc6=\xc9\xef[\
+/>\x87^y\x8b9\x8b\xed\x03\xc8\xec'\xfevG\
+C\xfd?\xaa\xa2x\x8e\xa9\xe11J\xa8s\x14:\xa5\
+\xd8\xa6\x8a=9\xb5\xcf4\x01\xa00\xc0\x1e\x97\xc9\xf4\
+\x80(e\xcd\x0e~\x9e\xe7?\xfc\xfc\x8b\xe4\x1a\xfe\x03\
+\x07\x1c\xf6\x8b\xcf\xd4X\x0fp\x96\xdf\xaf\xfd\xe5\x02\x7f\
+V\xd3\x96\x15\x97\xff\xea\xc4o~\x99\x1d\x0c|I\x97\
+e\xf8<I\x96\xa6\xf9!BZ\x00\x90iiQ\xde\
+&\x8a\xca\x97\xd5\xae\xe07\xeb\xcf\x5c\xc9\xbb\xee\x86m\
+?\xf4o\xcf\xf7\xcf\x9f\x1f\xf1\x0f\xc3\xeb\xac\x89\x13'\
+*\x7f\xd8\xef\x0f\x8f\xbf\xeb\xae\xdb}\x1f\x1e\x7f\xac\xe8\
+w'\xeaD\x9d\xbfk\x11\xb1\xd3\x96\xb6\xf7\xa5\x05\x00\
+^\xeb\xb0NA\x12\x8b\xb4\x88z\xcfg\xa7\xeb\xb3\xa2\
+\xa1 s8\xbevK\x8e\xb6\x1b\xd88\x01\x80VB\
+\xbdx\x86\xc6\xacY\xb3\xe4\x9a\x9a\x9a(@\xb8\xd9\x19\
+\xee\xdcaz\x0b]\xae\x8bg\xda\xaf;_s\x89\xb2\
+.\xf2!w\x04\xde\x8c\xa6(C\xca\x00\xd0\x16OX\
+\x92Q\x05\xa2\xfa\xbc\xfa\x0f.z\xd4`$\x22e9\
+\x98\xae\x07\x14I\x19\xbfu\xf3\xe6\xe7\x89g\x15zq\
+\x00\x912\xdd\x14\xe5d\xa4\xfc\xd1\xa3G\xb5['\xdf\
+z\xbd\xe2t\xbcH\x1b\xa5h\x8e\xbat\xefH\x87\xe7\
+\xc3\x13\xed\xa3/\x9c\xad\xd7i\xc1D\xf5\xd9\x14S\xf6\
+\x84\x94\x05U\xb12E\x8de\xf7\xd7\xff\xeeb~G\
+s8\x22;$\xd1D\xeb\x81p\x00\xf2\x01\xa7\xc31\
+\xb3r\xeb\xd6\x1d\xa4\x10\x000\x86\x12\x04[\xf9\xb1c\
+\xc7\xe6\xe58<{\xa0<5C]PU\x86\xfb\x9b\
+\x9a\xafH\xf2\x9d}7P\xfc\xc9\xb9+:\x8c$\x08\
+C\x0a\xc01n\xa4l#\xe2\xb8\xaf\xfe\xfc\x95\xa2\xe0\
+\xe7\x1d\x11%\x1b\xca\xc7\xe2\x8d>\xb0\x19\x02\x10\x9a\xf0\
+\xee\xf3\xdb[\xb6ly\x9a\x1eX\x8bwz\x18\xe9\xd5\
+$\xce)\xf1@!E\x96\x1f3f\x8c+\xdb\xe3~\
+\x01^~\x03\xba\xaf )o\xcf\xa4\x1c\xa0\xfb\x8a\xe4\
+\xdc\xf7^\xffS\xfe\xa5\x0b\xadhL\xb3\xf8\xbd\x99\xf6\
+\x8c\xbe?\xfb\xf5\x80\x92s\xe7\xb8;\x8d\xff\xc3\xd9\xdf\
+\xfeE\xdb\xa5\xa0*\xbb\x15n\xf9\xabiZ;BM\
+NE\xf9\xc1\xa6\x8a\x8a\xa5\x10\xd4\x5cg\xb5\xb1\x03\x06\
+\x81\x94\xa7\x90\x02+\xb1\xf8Kcv\xe3-\xfa\x04\x10\
+k\x8dW\xde\x12\x03\x22\x1a\xba\xce\xf2\xc7\xb8\xbc\x1f\xfc\
+\xf7\xa7\x8e\x8b\xbf\xff\x80\xae\xcf:v\xac\xdf\x86,%\
+\xe1\xc8\x92\xa4\x10\xac\xbb\xda\xa1(\x0f\xe2\xbc\x89\xacn\
+1\xef9\x82\x18\xf9\x031\xcd\x0b\x87B\x9bW\xacZ\
+\xb5\xef\x00\x9a\x97\xf9\xc9v\x80z\x1e\xeb\xeb\x8c\x8c\xc3\
+\x15\x982m\xea.I\x12\xefA{\xd5\x8ck\xbd\xf8\
+\x82'\x95@\xda\x9a\xf1\xa8\x11m\xf9\xfb\xd5\xd5\x07\xe3\
+\xc0\xeb\x8b>\xbf\xde\xaf\x07\xf0Y\xd4mb\x94\x97\x97\
+o\xd0\xa2\xd1\xb7\xa1&Ve\xf8i[\xec:\xbf\x89\
+\x03\x04\xa1\x16\x90h\xb6:]\xae\xe5\x9b+*\xbeK\
+\xca#\x1ft\xbb\xab=\xb7\x9fObh+\xbf\x01\xca\
+\xcf\xedK\xf9\x18\x1d\x03\xccsuM\xabLGyz\
+6%\x00\xc8\xb2vR++/\x7fB\xd7\xf5Z\x80\
+\xe0\x83g\xd0\x9e_L\x06\xeb\x03\xdf\xf8\x05\x1c:\x9c\
+YY\xeb\x9e}\xe6\x99\xbf\xc1\xb3\xda\x9e\xd4wn\x05\
+\xcc\xe74\xa6L\x9dR.\x89\xe2\xf7\xc0+\xa9\xe5c\
+\x8ci\xa3%O\xd3\xf5\x7f\xae>Q\xbd\x97\xe4D\xd8\
+\xf4\xeb\xfa\xb6\xd0\x9c\x91\xfd\xa5\xbfO\xdb\x9d\x97-[\
+VP<z\xf4\xbfa\xcfn$\xb6\xbf\xac\xb7@\xf1\
+=\x08\x81b\x9a\xb4\x22\x91t\xc3\x90\xda\x82\xc1E\x10\
+\xec\x04\x81PJ[^\xd7\x18\xb6\xebN\x9a2\xa5T\
+Q\xe42\x00\xdc\x0c\xef\xee\xcb\x83\xa2\xf0\xb8\x11\x08\xff\
+wO\x1e?\xb9(F\x96t\xc2\xe5\xd4FJ\x1e`\
+\x93\xb2\xdd\xb9\xb2\xb2\xb2)\xd4\xd1\xf1\x18vnC\x10\
+\xd0A\xca\xdas\xf8'\x81a\xd5\x22\x0d\x1b\xa7\xa6\xcf\
+\xe3\xd9\xb9f\xcd\x9a\xbf&\xe5\xaf\xe5\x09T\xee(\xe9\
+M\x9e:y\xbe\xec\x90\x97\xc2?\xf1v\x99\xbf=J\
+ O_\x10\xf0\x1aj\x8c\xcf0\x8c3\x9f]\xfc\xcc\
+z\xd7\xe0\xe7\x1e\x9d\xb2\xf2D'\xed\xae\x0d%\xc9 \
+%\x9e(+\xbb2\xed\xce;?r:\x9d\xf3\x80\x22\
+\x1a\x02\xee\xfb\x89\x1e\x05\x10\xe0!\x1a\xb2\xb7\xcb\xe5t\
+\xdeu\xe7\x8c\x19G\x96.]\x1a\x807PS\x93\x00\
+\x1a\xb5\xb8\xc7\x8f\x1f\xd7&M\x9d4W\x91\x95g\x91\
+\xe9;\x88$\x08&\xd2\xc4E\xf0\xc2\x8e\xb3\x90\x8d6\
+\xe4J\xa8\xa3\xeb\xa1\x8f?\xfe\xb8\x95<\xa7nw]\
+\x02ML\xedw\xa4\x0d\x00Q<\x88\xedk\x02\x01\xa1\
+\xf0\xe9\x9cY\xb3\x02\x92$\xdd\x83\xca\x10N\x0a\x02\xfd\
+\x02\x8c1,\xdc\xc4\x5cl$\xcf\xbc}\xda\xb4\xb7\x00\
+@G<\x08\xa4<\xb5\xb8\x93&M\xbaCv(;\
+\xa0|\x04jS\x08\xf5\xf2P8\x97\x81{\xe4u\x91\
+\x88\xa1>|\xba\xe6\xf4E\xf2\x9c7\xdf|s@\xab\
+\xc1\x01\x01`\x83@9\xe1\xe1E\x8b\xce\xce\x9e9S\
+\x96\x14e\x06\x04\xee\xc4\xbd^B\xf3p0\xcd0@\
+\x18\xe9\x90\xa4\xa9(\xaa\x87\xf6\xed\xdb\xa7\xd2\xf3\x8d\x8d\
+\x8d\x12Y~\xc2\x84\x09\xe3\x1cY\x8e\x17\xb0\xc7@\x16\
+\x8f\xe2\xd0K6\x00\x8cGA\xdfd\x0e-\xa2=Q\
+S]s\xca\xf6\x1c\x92i \x83\x98\x0df\xf0\x05\x18\
+\xf5\x08h\x837)\xb2\xfc\xf7\xf0\xc1f|\xc7\x0f\x9d\
+\xc8\x1f\xe2\x06\xd7\x8b^\x90\xb2\xbcH$rryy\
+\xf9C8\xe7V\x1b7n\xdc\x0d\xd9\x9e\x9cW\xf0\x9c\
+\x17:\x86\xfbR\x1e\x96G\xe1a>-\xaa\xaf=u\
+\xf2\xe4/\xec\x169\x8eK\xda\xa7\xbdPN\x97\x02\x84\
+\x16\x11\xcf\xe6o\x0e\x1f\xfe\xafo\xde}\xf7\x04\x84\xc3\
+M\xa0\xd1\x09\xab\xf7\xa6m]\xebD(|e\xce\x9c\
+97\x1f>|\xf8\xd0\x8d7\xde82\xaf o?\
+,_\x08\xe5y\x7f\x9f\x5c\x06\xdaw\x14\xf2\x0d]{\
+\xe1\xbd\x93\xd5{)\xe6\x07\xea\xf6\xf1\xf4{\x0b\x19\x7f\
+7\x85sR\x9e' \xbc\x8e\xf2\xf9|\xef\x14_w\
+\xdd,\xd4\xee\xd1\xb0U\x98\x5c?\x09\x09\xec\xa7\xb0N\
+x\xcb\xad3\xa6O\x1f}\xee\xc2\xefK\xb2]\xd9\xb7\
+\xa0\x90\xb4\xf7nq\xbb\x9f\xa6\xa6\xab\x00\xe5\xee5\xd4\
+\xfa\xf5\xb8*\xd4\xa5\xf1\xfa\xab\x9bJ\x92\x93d\x02&\
+\x99v\xedK\xb1%0\x95\xb0\x8e\x88\xa6-6L\x93\
+~\xe9\xe1\x02\x08\x94\xad\x93=,#\x1f\x044]\xbb\
+\xdfC?\x997\x0d\xf4\xf7x\xd1\x92|\xf0\xb015\
+\xe3\x7fP\xeb\x97\xc7\xa6\x10\xd1\xabb,\xf9\xc3\xfd]\
+\x1d\x12\x00\x88\x09\xb2:\xef\xf6V\xae\x5c\xf9\xc7\xd6\xb6\
+\xb6'\x0cM\xa3,N\xb9 yi2\xf1\x06I`\
+A(\x1f\xc6\xef\xa8\xe0\x89\xbd\xf5\xe1\xb5\x9e\x09^\xc3\
+0/456\xf1\x9f\xc5\x90\xb7\x81]r\x9a\xfdi\
+\x9b\xe4\xfe\x90\x01@\xb4\xa9\xd19\x82\x97\xa8\x00\xe3\x94\
+\xaai\xab\x91\xb1\xb2\xc9\x03\xa0Zo\xed0\x1fk,\
+\x80\x904L\xe8\x01$H\xd1\x05\xfcZ\xd4Px1\
+j}\xbb\xdd(%\xd1c\xc0\x97\x86\x14\x00\x92b6\
+~;@5\x1e\x9ep(\x1c\x8dn\x83\x96\xb9P2\
+\xad\x1a\xcdk=\xf7\x1e\xc3P\xa3\xe1\xc7kkk/\
+R\xb9C\xbe\x19\xdc\x9b\xa6$0\x0d9\x00\xc4\x03\x00\
+\xf0m\xb1\x15+V\xecSU\xf5\x15x\x02^X\xe0\
+\xd7a)\x0c\xee-\xc8\x86\xf0\x0f\x17v\xdfV\xd7V\
+\xd7\x9e\x22\xcbS\xa3\x94\xc2\xe3iOI\x9a\xa1\xd2\xa6\
+\x92\xe4\x01(\x0d\xc3[/H\xb6m\xd9\xf2\x1c\xf6\x11\
+\xe6\xe2J\x00S\x15*\xe62~H\xd6\xd2\xd6\xca\xde\
+x\xeb\x10\xce)\xffYQ\x82\x85\xbd\x86\xd8\xcf\xd3\xb5\
+\xe8\xb3\xef\x9dxo\xffP\xd4\xfa$\xe2u_\xca\x88\
+\x07\x10uR\x1e\x9e\xc0\xe9c\x09\xbd,\x1a\x8d\xd6\x00\
+\xed\x5c(\x8f\xb7j4\x92\xa6\x05X\x19\xef\xf95\xed\
+\x15R\x9e\x12^&\xdc\x9e\xb3\x8f\x1d2\x06\x00\xd1\x07\
+\x00\x06\xb5\xbb8\xd5?ohx\x1ck\xf6z\x94\xbf\
+l\x94\xc9\xc4\xf2h!b-m\x0d\xe3m\xd4\xfa\x8d\
+\xf4|:\xebz\x9a?\x90\x91Q\x00H {\x09\xbd\
+m\xdb\xb6\x86@K\xcb\x12l\xa6\x84\xe0\x1d\x09Kh\
+D\x04_\xda\x22\xe3\x9f>\xf9\xbf'\xac\xa5\xad\xb5\xa6\
+H\xea&\x03Q\xb4\xafg2\x0e\x001\x86'\xf0\x1e\
+a\xc3\x86\x0d\xe7\xb1\x8fP\x8e%2\xdf\xbbF\x85\xa0\
+t\xa0\xc3\x01\xe8w\x81\x97\xbb\x82]\xf4K2u\xa8\
+k}_\xca\xd3\xf5a\x01\x80\x18\xd9=\xc2\xaa\xa7\x9f\
+>\xd6\x11\x0am\x80\xe6\x1e\xec\xef\xa32`K\x1dk\
+\x00\xb5K]r\xe6\xcc\x99\x86L\xd4z\xe2\xff\x85\x19\
+\xb1\x9c\xc0\xb6o\xdf\xfe\xc8\x86\xf5\xeb?\x99\xf8\x8d\xc9\
+\xa7\xb1\x09r\x07\x09H\xb5\xfe\x0b#h\x06\x05\xa1\x94\
+\xc7\xd3^Y\xd9\xd2Ms\xee\xbe\xfb\x01\xe2E\x96\xcf\
+ \xcf/\x16i\xb8\xbf\x95\xf7{\xc4\xba\xfa{\xcf\x9d\
+\x0c\x9f\xfd?o\xd8\xc8\xd6!%jY\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x11\x02\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x84eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\
+\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\
+\x00\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\
+i\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\
+\x00\x02@\x00\x00\x00\x01\x00\x00\x02@\x00\x00\x00\x01\x00\
+\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xc3d\x18\xce\x00\x00\x00\
+\x09pHYs\x00\x00X\x95\x00\x00X\x95\x01\xd9m\
+7\xd3\x00\x00\x01YiTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22>\x0a \
+        <tiff:Or\
+ientation>1</tif\
+f:Orientation>\x0a \
+     </rdf:Descr\
+iption>\x0a   </rdf\
+:RDF>\x0a</x:xmpmet\
+a>\x0a\x19^\xe1\x07\x00\x00\x0e\xb2IDATx\
+\x01\xedZ{\x8c\x5cU\x19?\xe7>ffwg\xba\
+maJK\x02\x04\x83\x88]DH\x1b%\x18e\x1b\
+\x0d\x01\xaa\x82\x85Y\x92\x02\x15\xc4((J\xab\x12R\
+@:\xd5X\xde\x82\xc6Z[$\x0a\x09\x8f\xech\x80\
+@\xc3\x1f(]\xb5&\xbeZ\x08\xd0\x92P1&J\
+iY\xa1\xfb\xde\x9d\x99{\xcf\xf5\xf7;\xf7\x9e\x99;\
+\xb3\xb3\xafa\xfb0\xee\xd9\xbds\xef=s\xee9\xe7\
+\xfb}\xbf\xef;\xdf\xf9\xee\x081W\xe6\x10\x98C`\
+\x0e\x819\x04\xfe\x7f\x11\x90\xc7\xb4\xe8\x81\xa8\xceO\x8a\
+\xe0\x98\x9e\xeblM.\x1f\xe4\xad|\xb0\xc3\x09\x82\xa0\
+*<:\xe7}~G\xde\x99\xadqL?\xb3\xde\xa1\
+\xe9x\xa6\xe7\x5cw\xb7\xdd\x91\xdb\x1b\xe4e^\xe1Y\
+\x95\xc7\xc7\xd6`\xab\xbb\x0b\xe7\x13\xf7.\x90(%\x5c\
+z84\x18\xb8\x9f\x15F\xd4\xa0\xcc\xce\x8fF\xe9\x0e\
+\xba\xed.\xd9\xe5s\xec[\x87\x1e?K*q1\xd8\
+\x7f.d<\x8d\xc4'\x22\x98\xe8? \xf9\xaf6\xb5\
+_\xf9(\xdbi\xa6\x84`\xf1\xb6\xe9r\xb4\x01\x90y\
+R[Ju\xeb\xa1\xc7\xce\x16\xb6\xbc\x03\xfa\xbd$\x95\
+I[\x01\xc4\xf6KP8g\x08\x10\xec\x84\x83KK\
+\x14\x07G\x9es3\xe9+\xf2\xf2s#4\x8b\xf7\xcb\
+\x84\xa3j\x02\xd0\xa2\x16~}\xdfc7\x08K\xfe4\
+\x99i\xa5\x80blp\xd8\x83\xcc\x12\xb2W\x14\xe4\x95\
+<\x05\x81\x83t\xa6\xfd\xb3\xc3C\x03\x0f\x01\x96+7\
+\x8a\x8d\x11<M\x13\xa0:@\xf3]4\xf7d\x0e\xb4\
+/\x80\xf6\xb7\xf6?ySr^\xf2\xc1\xd2\xf0\x98\x08\
+T@\x1b\x9fL)\x01-\xc2M%lo\xa4t\xc1\
+\xa6\xf9\xab_0\xfd47\x0b\x01N\x1d\x85BoN\
+\xe1o\xe9\xed^)\x1d\xf7\xc1\xb1\x01\x0a\xafh\xea\x93\
+\x09\xcf\x99\x92\x15\x81\xed\xc2\x1cly\x1d+:\xc4^\
+`\xd2|\xa9P\xac\xf9.f\xf6\xa4q^7\x1d|\
+\xfc\x84\x84L\xbc\xe2\xa4\xacE\x81_\xf2-K\xd9\xd3\
+\xe1#\xa4\x0dl\xc7\x96\xcaS\xbd\x81(}\xf8\xcey\
+_|\xf7\xfd\xf8\x82#\xce\x80=b\xa9\x06\xdd\xf6S\
+\xf7$2\xe9E^\xc9/\x07J\xda*\x98\xdeT$\
+PR\x9e/,[f\xa5\xb2\xcf&\xfc]\xa20\xbd\
+\x87\x1b\xe8\xaa\xe9\x07\x1b\xf45e\x15\xd7zR\x7f\xdd\
+\xbf\x9e\xfd\x18\xfc\xfa\x9a\xd1Cp\xe4\xcar\x94B\x98\
+\x17\x1dSv\x22t\x80\xe4%Z[D`Y\xcb\xd8\
+\xbeCd\x9bf\xf2\x11\x05\xa0#\x97\xd3\xf6\xeay\xc1\
+-vK+\x96u\xcbW\xbe\x90\x00A\x03\xa0\x81\xa8\
+\x0d\x00'\xc4\x83L\x90Ap*\x1b,\x15\xb0\x86&\
+\xcbTN\xa7\xc9n\xc7?F\xedc\xbd\xf7\xbf\xfe\xc6\
+\xf6\x8fc]_U\xec\x1f\xa5#\xb3-\xf8a\xae\xf9\
+\x0a\xeeM_#\x0a\x92\x88\x02&\xf3\x07\xfc\x16Q\x02\
+>\xad\xe38RN\xe4\xe8@\x9b*G\x8e\x01\xb9p\
+~\x81\x12\xd7\xbamih\xdc\xf2\x02\x1f\xb1\x1e\xa8\x1f\
+\x9a@\x95\x05\x0a\x8c\x98\xac\x90\xefX2\x09\xd2B\xb6\
+\x8b\x82\xa1\xa6\xcc\xe0\xc80\x00\x11[\x01\xda\xff\xc6\xbe\
+\xdfg\xcb\xde\xc8\xaa\xe2P\x11\x12P\xfb\xb0}.l\
+d\x01t\x0a\xdd#\x1e\x8a1\x82LhPX+-\
+<\x17\x04}\xfc\xfa\x98_\x05\xf2==6':6\
+Z\xbc\xd4mMg\xb1\xea\xf9\xd0\xbc\xb6}j\xbb\x11\
+\x0b\x8c_\xe0s\xf5\x85\xa2\xd3`P\xfa\xf9\xd1U8\
+\xc6W\x81\x0d\x9d\x9dz\xa3\x03As>b=8\xbf\
+\x98\xd0\x5c\x01x\x1f\xaf\x8b]O\xe0\x14\xe9\x04\xc1\x03\
+\x0d@Gv/o\x9a*\x87\xdd\x04\xf2\x90\x166\xaa\
+\xbe\xb4\xfb\xc5\x8f\x22\xd6\xfbLih\x0c\xce\xcf\xd2\xea\
+\xb3@z\x9a\x00=\x18\x1a\xc1\x19B\x8e\xb8\x09D\xa6\
+\xd1\xc0)\x86\x0c\x08\xd4!J\xbd\xbfsI\xd3\x00L\
+\xeem\x9a\xc2\xb4\xf6\xa1\x9e\x9e\x1e=\x86\xf2\xedk\xdc\
+\xd6\x0ci_q~!\xf5Cm\xd7_\xc7\x19\xd1\xc0\
+)Z\x9e(\x03+\xab\x97\xa3\x9d(No\xec,j\
+\xa7\xd2\xf0\xee\xb02\x80\xda\xc7\xd2\xe7\xad\xd9\xb9\xf3d\
+\xe5\xab/S\xfbp\xd9\x15\xe7\xa7\xa0a\x0b\xce\x8f\x9a\
+W\xd0|\x95\x11\xd5\xfa\x1aF\xc4\x9d\x22V\x01\xec\x8c\
+\x98$A\xf9]xj\xe2\xf3\xb02`\xff\xae]\xda\
+\xf9!p]\xef\xb4d\xd2\xbe\x17x\xd0t\xb4\xf45\
+\xd6\xbcq\x8a\x131\x22.#\xe2\x87\xa6\xa9o\xfa9\
+<\x0c\xc0\xb2\xf7\x95]\xbb\x9cm\xcb\x97\x97\xafx\xf1\
+O\x97H\xcb\xbe\x1e\xfb|D\xae\xc2\xa1\xcd\x87\xb6\x0e\
+g\x08\xcd\x07\xd0<s>\xa1/\xa8j\xbe1#\xd0\
+\x96\x81\x12\xb3aZ\xf4\xd0\x97\x08q\xbe\x91g\xc6\xe7\
+Y\x07 \xd7\x1d \xde\x97\xfe6!\xca\x97\xff\xf6\xaf\
+\x17\xc1\xbd?\xa1\x90\xde`\xb0\x02\xbb\x96\x0a\x02p\xdd\
+'\xf5i\x02\x14\x88\xf1@c\x81\xeb\xebCg)\xec\
+@9\xd2\xb5Krt1%\xde\xbf\xeb\x8d\xa6\x990\
+k\x00\xe4\xf3\x81\xb5g\xa9\x90\x85.\xa9\x97\xbcU\xdb\
+_Z/U\xb0I\xc0\xe2\xfd\xb2\xa7\xb0{C\x8cS\
+\x17\xe8`\xf2\xf5\x8c\x98\x0e\x10@\xcd\xf2\x19\x0a+y\
+&\x018q\xd9\xdbzL^\xcf\xb44\x8d\x5ce \
+\xd0\xbdsc\x8f\xdd\x93_\xa13\xb6+\x9f~\xe9<\
+[\xca\xfbS\x99\xd6s\xfd\xe2\x90\xc0>\x9f\x9b]\x08\
+\x0fM\xc3\x89Y6c}\x5c\xdb\xb8\xc6\x19\xdf\xc5\xea\
+\xc3\xef\xc3\xfa\xf0\xfb\xb0}m=\x9e\x0f\xdc\x14(\xe5\
+y\xbd\xbe\xef|\xf0\xee\x85]\xfd\xcdF\x83\xcd;A\
+\x0a\x9e\xdf\x81\xd4\x8c\x0c(\xfc\xc5O\xbe~\xfa\x85\xbf\
+~\xed\x17R\xb8\x7f\xb4\x92\xad\xe7\x16\x87\x86}\x88\x8e\
+D\x0fVq\xdf\x04;\xa0\xb4\xde\xf6\xc6\x02\x9d\x9a\x00\
+\x88\xed\xd8fr\x07\x09\xcdK\xaf\x18\xf8n\xba%k\
+9\xde\x0dT\xc6FQp\x99l\xa9(f\x9a\x173\
+g@\x9d\xc6?\xd9\xbd/\x9b\xf0\xfc\x9b\xa1\xa9\x1b\x93\
+\x99t\x8b?\xdaO\x8d\x22\xc3\x13\xd865\xae\xb5\x1c\
+i3v\x1d\xd7|\xbcMm=|\x87f\x08\x99R\
+\xcb\x08\xd4\x07\x8e\x0b\xe7!\xfd2 ^\xb9)\xbd\xfa\
+\x05\xca\xcc\x14{\x01\xe7\x82\xe8\xc2C\xf0\xb3S\x94\xe9\
+\x03\x00\xc1s\x05a\x19\x1b\xbf\xe0\xd1\x03m#b`\
+\xad-\x83\xb5\x89t\xfa\xf8\xa04\x84\xf1<\x0f\x82;\
+\xa1\xe0\x9c\xb0\x11\x1cgM\xfd\xf0<\x91\xc036\x0d\
+:C\x97\x9e\xd4c0qg\xb9X\xfc\xc9\xbd\x8b\xae\
+=`df\xeeqC\xe7\x06\xec9'~\x8925\
+\x00pn\x9d\xa2\xc726\xbel\xeb\x9b\xed\x96m]\
+\xe3Xj\x1d\x04?%(\x0f#1Q\xa6\xe0\x08p\
+\xb9\xc5\x8blZ\x0b\x1f\x02@@\x18\xce\x12\x04-|\
+\xfc\xba\xa1/h\xec#\x08h\x0d#\xc2\xfe\x90S\x0a\
+\xac\xd4\xbc\x94(\x0d\x8epw\xf8\x14\xb6\xdcO\xeck\
+w^d\xf6\x89`\xc4_\xbc\xf0>^&\x07\x00K\
+\x9a\x88\xbc\xfaY[\x0e,\xb2T\xf1k\x98\xc4W!\
+\xf8b\xe9#\xaaSc1\xc1Ca9\xc9\xf8Q\x0b\
+\xc8x*W@y\x7f@ \x9cP`\x83\xb4\x99*\
+\x03\x13\xf8R\xe5u,1\x0f\xc1<\x1f\xce\x1fw\xd5\
+\x80N\xc7u\x85\x80L\x0f\x00h^\xe4\xa5:\xf3\xfe\
+\xb7N\xf2\x1d\xb9\x0e\x82\x5c\x85DFVz#\xd08\
+\xb3\xb8\x18\xd3R\x16\x85\xadR>\xd2>\x18gS \
+\x9c\xa9\xf1\x0a \xc6\x8ec\xbe`VM\x03~\x01l\
+\xf7a\xf86\xde\x1dH\xa6\xcf\x8bC#\xffF\x04r\
+\xe3\x0f\xe6]\xf9\x8c\xc9HO\x0d@$\xfci\xf7\x1d\
+\xbc\x1a\x01\xcbf7=/\x03~\xc1\xd8h\xe3JS\
+=\x14J\xc5\x84\xaf\x0a[\x05\xa4Q]\x8c\x05\x87\x09\
+\x88\xc8\xe4\x19q);\xe9:\xb6k\x8b\xe2\xf0\xd8\xf5\
+wfVo\xad\x7f\x912\xde\x04\x22\xda\x9fz\xd7\xc1\
+5v\xaa\xed\x11\xa9\xc6 x\xb9\x0c\xc1\x9dP\xeb\x14\
+\xcah\x1d\xda\xd5Z\x0e\xeb\xa8\xedZ\xe1C\x00j\xeb\
+\xe2\xf6m\x00\x8a\x81Bgi\x98b\x1c\xa7\x06*\xf6\
+\x1c\xee\xa7\x8a#\xe0\x91u\x01\x1b\xc0V\xf4\xc8\x14\x9a\
+\xf2\x97m\x9a\x7f\xf5\xeeh\x93\xa6\xf3\x88\xb5\xeb&5\
+\x0f\x9b?\xf9\xaew;|e\xff\xdc/\x15\x99\x83\xe7\
+z\xee\xe2\x90\x5c\xc3\xc3u\x9cg\xf4\xc7{\xec\xccy\
+`\x91\xd0\x87\xb9\x9f\xa8N\xd7\xc7b\x01\xbd\xeeG\x09\
+\x12\xf6Q\x1b\x03\xa0O\xb6e\xdf\xf1x\xc1$TL\
+\xbd~\xce\xb4\xe3\xb9*\x16p\xa0\xf0\xe5T\xa6\x0d\x8e\
+\xd8ZKT\xf6\x14\x0a\x15\xc57\x0c\x85\xfd\xb2\xf8\x9e\
+\xdd\xda\xee\xaar?6\xdd\xd2\xd5\xab)&\xc2\xc2O\
+\x0d\x1dsy\xfa\x22Vg`\xaf\xb4\x03\xeauu\xf0\
+\xe3\xe61\xb0\x87\xd7\x93m\x80\xb8ab\xc6\x18m*\
+g\x86\xcf\x0d\xf2\x87ha\xea9$\xf7\x17:\x91\x82\
+\x19`\x16Ni\x0c\xaf\xdf\x84\x5c\xb1.\xe8ny@\
+v\x8djTa+U\x00\x22\xbb_\x92\xef[\xaeT\
+\xb0J\x8c\x0c\x90\xeaXe#\xc1q\xd6o&)\x13\
+\x0f\x02\x02\xa0\xb9\xc2\x92]\xba\x0e\x9a\xe0\xb9Z\x17\xde\
+\x8f\xab#p\xf8\x0a;#\x5c\xe0\x91)\x81\x08s\x06\
+|\x86\x00\xb2=\x077\x02\xd7$Rk\xea1\x06&\
+\xc3\xd6\xda\x04\x84X\x90\x1a\x12i\xdc\x8er\xca\xac\xaf\
+\x02\xa0\xc5\x01\xe3\x03\xf1\x05;5_\xa8\xe2!\xc4\xf6\
+\x16\xbe\xd7C\x02\x7f6\xaf\x16\xe6\xe4\xd8ID\x02\xfd\
+\xc5\xf8\xba\xf0\x19~\x86\xed\xa2a\x09\x1c*\xb4\xf6\xf1\
+i4<= \xc0\x05t\x182\xa2\xfa.\x81\xf3k\
+\x04\x84f\x01\xdas\x0eP`\x90\xf4\xdd2'\xcb{\
+\x16\x03\x80\xc4\x92\xa773\xb0\xb5\xf3T\xd9\xd3\xdd\x01\
+\xb6H\x9bh\xce\xb9GG\xa8\xe1\xfa:\x905b@\
+\xb5\x1d@\xd2\x82\xea\xb1\xf0A\x88\xc2n*\xc0A\x9b\
+\xf0ix\x84\x9a\xa5\xedN\x95\x1b\x80\xf0xF\xeb\x15\
+\xed\xeb_\xaa\xd4\x03A\xa8\xb0\xd42BC\xa0\xaa\xde\
+\x11}}\x08`XB\x08\x22oA\xc9\x848\xe1;\
+A\x1bNg(\xaf,\x02\xa4q\xc2\x8d\x09\x1dSx\
+h\x87\x14]\x9b\xba\xaaS\xac\xb6\xab\xa9\xa3\x83\x8a\x0e\
+\xed\xe4b\xf7U\x87H\xa0\xe2cL\xbe\x19\x0a\xdb\x9a\
+6<\x9bk\xf6\x13^\x87s0\xf5\x96r\x93I\xca\
+\xbc3\x7f\xea\xb5c\x0c\x8a\x887e6\x0c\xe0\xb5(\
+\xa7\xdf\xb3-\xdf\x01\x08\xa0e\x8d6\xa194\xaf\xda\
+:\x1a\xe3{\xd6U\xfc\x02y\x89R\xab\xe1\xb0\xce\xd4\
+\x8f7#\x8ed\xda\x98$\x09\xee\xf1\x1f\xbe4\x99\x09\
+#&6\x0d\xf4'\xf1\x0b\x13J\xfc\x14\xe7\x92\xc3[\
+*n\x98Xj\x00\x08\xabBd\xf8I\x14YH\xdc\
+\x0ae\xa3F\xe3\xea\xc0\xb0\x89A\xa2y\xa0\xc7\x00d\
+\x877Bdf\x80\x83\x1e\xb4w\xd5\x14\x08\x9d\x22\xb4\
+\x16yy\x03\xc4\xf4|\x841\x0d:\x18\x9a\x94\xf1-\
+\x02*u\xed\xe2\xc8\xd8_\xee^\xb0\xfaiN\xdf\xfc\
+ \x8b\xd7\x91\x09\xf0\x12\x0b\xa6X\x08\x91e\x91\xc2\x99\
+RC[C\xd3\x08\x1c\x02d\xe8n(l\xea\x18'\
+\xa0\x8e\xf9\x00\xfc\xb8\xc7B7\x09)\x13m\xb6\xdd\xd2\
+\xee\xd8\xad\x0b\x1c\xabe\xbec%36~\xfdDS\
+c\xa2\xd4C[\xa4\xcdL\x9fq*k|\xeab\x04\
+Co\xb6\x8f_\x87m\xd9\x0f\x0e\x9d\x8f\xe0\xcb\x18\xe9\
+;\xb7Q&F\x82F6\x9e#\x06\x84\x02\xf7\xe6\xe5\
+\xd0\xf1w\x0c\xbc.\x9dd\x16\xeb\x01\x95nk\x8a\xa3\
+3\x16\xfa\xa8\xca=\xa1\x03\x10U\xadk\xd8u\x1d\xe1\
+\xc7V\x01\xf1\x08~\xca\xd1\xd2\xe2p\xc7\x08\xbfr\xc0\
+S\xa5\x97U1\xd8\x8f}\xc5 \xd2c),\xb3Y\
+D\x89g\xc2\xa9\x9d\x86p\xdbQ\xa5\x110\xa5\xe4a\
+\x8b\x81X\x10\xd9C:H\xfc\x19F\x80+\xe8\x1a\x82\
+M\xcbY\xea\xd8\xc1K\xcd\xcf\xb8\xe5\x81\xa1\x1f\xde\xb7\
+\xe4\xb2\xdf\xd4\x87\xc1\x94\xc9\x98@ \x98\xddaZK\
+\x89\xe7\xe06?\x15\x8a\xc7&\x14\x9ah\xd2^M\xc1\
+L\xf8__\xa7Wv\xb4t\x1cG$]\xe1\x17\x07\
+\xff#\xd4`\x01\xa1(^\xdey\x7f\xfb\xc35g\x0c\
+\x9a\x1e\xcc9\xd7\xbd'\x81\x0d\xf5\xd2\xe2\xd0P\x17~\
+\xf8r]23o\x91?:\x08A\xe1\x86\x91N\x0e\
+\xa9\x5c\x0b\x04\xc7\x9e\xc2G\x80s\xcaK.lw\xc7\
+\xde\xeb{\xee\x81\x93V}\x9b\xe3\x15\x1a\xbcFGW\
+Q\xa1\x94`\xe2\xe2\xf5\x83Y\xdfQ{\xb0\x9f\xca\x06\
+~\x992W\xcc\x84{\x80p\x1f\x80\x15\xbcf\xdb\xab\
+\x90\x0c\x10>6\x1d\x8e\x0do+\xcb\x03\xff\xc4&\xea\
+\xc7H\x86>\xfe\xda\xda\x0f\x1c4C\x00J\x99\xeb.\
+X\xbd{\xb32\xbb\xb47(\xe4\xf0^\x9f\x91JT\
+.\xea\xde\x9du\x12\xd6z$\xbb\xd7%ZSB\x95\
+\x87=D\xf1\xd8|\xc1\x0b\x98\xfd\x00\xc7\xd5{\x84\xf8\
+~ \xdaS\x84\xf5\xe0\x8f\x12-\x0b\xd2Vix\xe0\
+y\xc7\x1e\xbd\xec\x81\x93\xbaF\x1b\xed\x049l\x15\x00\
+\xdeE\x1b\xa1\xe3\xbe\xdb\xbf\xc6J\xce{$(\x0e\x10\
+\x00NP\xdb\x0d\x1b\x87\x82W\x00\xc0\xcc\x98\x95\xb1\x1d\
+'\xd5\x22D\xb1\xaf\x17\x93\xbf'\xe1\xc9-\xaf\xdc\xbc\
+x\x18\xcd\x05\xd3\xe4\xc4\xbe^X~\x17\x16\xfcP\x12\
+\xbc\xe6+\xb4\x9e\x15ab\xf5\xf3\xcf\xbc\xba\xdc\xb2\xbd\
+-\xc9Lf\xb9?:\x00\x22\xf8\x1e\xf6\xfbN\xe3\x0d\
+P\x08\x04\x13\xa50-\xdfi\x01\xfd\x92\xd0\xc6\xe8\xf0\
+\xe6\xcd\x1fZy#\xc7\xc8\x87o\xa8\xaa\x04\x8eF\xe6\
+\xa9\x16\x00\xd6D!1@\xf8>@\xb8]xE\x90\
+\xb1\xc8\xcc\x0a-^+\x8c\xda\xb0\xe0\xbel\xd7\x95N\
+\x02\xebk\xe9\xd0;\xd8\x15n\xb1Z\xd4\xe6\xbf\x7fs\
+I/\xbba\xc2\xb4g\x03\xde\x0a\xc74\xcc\xfaIK\
+>ou\x9e\x7f~\x04D /}\xf6\xe5\x0d\x00\xfc\
+\xf6D\xa6\xc5\xf6\xc7\x86\x02h\xd6\x07\x08V\xc8\x80P\
+\xebL\x84\xe0^\xdaI\xdbN\xa6\x13\xa2<4\xf0\x96\
+\xe5\xaao\xfd\xec\x8c\x0b\xbb9\xd6D\x9a7\xf3\x18\x0f\
+\x00h\x0aA5-\xb3\xb7\xf5]\x81U\xean\xe9\xb6\
+\x9e\x22a\xd6t\x80,\x0c\xc5-\x0f)oQ\xda\x07\
+'\xf6h\x22\xe9m{\xf3\xe6\xc5\xef\xf0\xbb\xa6\x04\xe7\
+\x83\xb1\xa2_\xaeD\x99\xa8\xdc\xf6W>\xe2\x8b\xf2=\
+N\xca\xb9\xd0mKB\x19\xd8\x9e\xe3\xd5\x03C\x5c\xdb\
+\x09\x04\xea\xa1\x9a\xb2P\xa5\xe1\xb7\xa5\xed?$\x5c\xef\
+G\x0fw\x5c\xf8\x9e\xce\x00\xd5\x99Xl\x88\xcae\x03\
+\x00\xf8\x1d@\xc8C\xddy\xa9N\xb87hS}\xfd\
+\x17+[~\x02.z\x9e\x04\x1f\xf1\xd0\x9b\xb6\xf4\xff\
+|\xe0\xc0\xfc\x9db\x9b\xd4\xb1\xf5l\x08^\x99\x95\x9e\
+\x02\xd2\xee\xf8a\x851\x8b\xcb\x9f\xdf\xfdiiy\x97\
+I[\x9c\x83\x8dy;\xf2\x800G\x7f\x00\x0b\xc2\xab\
+\xb6\xeb\xf7`\xc3\xbe\xfd\x97\xe7\xac\xd0\xbf\x18\xe9\xdc\x01\
+\xf6E\xe6T\xd3\xe7\x8co\xb4\xfdN\xf1\x14\xdb\xd0\x81\
+\x1e\xa6B\xfb\xad\xe9\x1fcA\xbb\x09\x1e5\xf5\x18\x9f\
+\xcb\x1c_\x90\xccd*\xd3hL6\xf0'.\x9d\xec\
+W\x89=`F\x07\x8e=\xf0\x09\x05\xae\x8cU/>\
+\x93\x81g\xdaV\xc7\xef\xf8=\x98I\xcb\x9b\xe7Y\xdf\
+\x9b\xcd\xca\x1e\xfe\x0ae&\xfe&\xea`\x1a\x00\x98\xa1\
+\x8e\x993\x82\x92\x983\x0aW\xa9cfrs\x13\x99\
+C`\x0e\x819\x04\xe6\x10\xf8_B\xe0\xbfBb\x1b\
+\xbe\xef\x95_;\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00$\xbb\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x0cMiCCPICC Prof\
+ile\x00\x00H\x89\x95W\x07XS\xc9\x16\x9e[\
+RI\x08\x10\x88\x80\x94\xd0\x9b \x22%\x80\x94\x10Z\
+\x00\xe9E\x10\x95\x90\x04\x08%\xc6\x84\xa0bG\x17W\
+p\xed\x22\x82eEWA\x14; b\xc3\xae,\x8a\
+\xdd\xb5,\x16TV\xd6\xc5u\xb1+oB\x00]\xf6\
+\x95\xef\xcd\xf7\xcd\x9d\xff\xfes\xe6\x9fs\xce\x9d\xb9\xf7\
+\x0e\x00\x8c\x0e\x81L\x96\x8bj\x01\x90'\xcd\x97\xc7\x86\
+\x04\xb0'$\xa7\xb0I]\x80\x004\x01\x13\xd0\x00S\
+ T\xc8\xb8\xd1\xd1\x11\x00\x96\xc1\xf6\xef\xe5\xcdM\x80\
+\xa8\xdak\x8e*\xad\x7f\xf6\xff\xd7\xa2-\x12+\x84\x00\
+ \xd1\x10\xa7\x8b\x14\xc2<\x88\x0f\x02\x807\x0be\xf2\
+|\x00\x882\xc8[L\xcf\x97\xa9\xf0\x1a\x88u\xe5\xd0\
+A\x88\xabU8S\x8d\x9bU8]\x8d\xaf\xf4\xdb\xc4\
+\xc7\xf2 ~\x02\x00\x99&\x10\xc83\x01\xd0\xec\x81<\
+\xbb@\x98\x09u\x180Z\xe0,\x15I\xa4\x10\xfbC\
+\xec\x9b\x977U\x04\xf1|\x88m\xa1\x0d\x9c\x93\xa1\xd2\
+\xe7\xa4\x7f\xa3\x93\xf97\xcd\xf4!M\x81 s\x08\xab\
+c\xe9/\xe4@\x89B\x96+\x98\xf9\x7f\xa6\xe3\x7f\x97\
+\xbc\x5c\xe5\xe0\x1c6\xb0\xd2\xb2\xe4\xa1\xb1\xaa\x98a\xde\
+\x9e\xe4L\x0dWa\x1a\xc4\xef\xa4\xe9\x91Q\x10\xeb\x00\
+\x80\xe2\x12Q\xbf\xbd\x0a\xb3\xb2\x94\xa1\x09j{\xd4V\
+\xa8\xe0\xc1\x9c\x01\x16\xc4\xe3\x14\xb9q\xfc\x01>V$\
+\x08\x0c\x87\xd8\x08\xe2\x0cind\xc4\x80MQ\x86$\
+Xe\x03\xf3\x87\x96K\xf2\xf9\xf1\x10\xebC\x5c-V\
+\x04\xc5\x0d\xd8\x9c\x90O\x8d\x1d\x9c\xf7f\x86\x9c\xc7\x1d\
+\xe0\x9f\x0b\xe4\xfd>\xa8\xf4\xbf(s\x12\xb8j}L\
+'K\xcc\x1f\xd0\xc7\x9c\x0a\xb3\xe2\x93 \xa6B\x1cX\
+ I\x8c\x84X\x13\xe2HEN\x5c\xf8\x80Mja\
+\x16/r\xd0F\xae\x8cU\xc5b\x09\xb1\x5c,\x0d\x09\
+P\xebce\x19\xf2\xe0\xd8\x01\xfb\x9dy\x8a\xc1\xd8\xb1\
+\x13Y\x12~\xe4\x00\xbe\x9a\x9f\x15\x1f\xaa\xce\x15\xf6D\
+(\xe8\xf7\x1f\xc6\x82\xf5\x88\xa5\xdc\x84A\x1d\xb1bB\
+\xc4`,\x22q`\x90:v\x9c,\x96&\xc4\xa9y\
+\x5c_\x96\x1f\x10\xab\x1e\x8b\xdb\xcbr\xa3\x07\xec\xf1\x00\
+qn\x88\x8a7\x878^Q\x1078\xb6 \x1f.\
+N\xb5>^,\xcb\x8f\x8eW\xfb\x89Wd\x0b\xc2\xa2\
+\xd5\xfe\xe0{A\x04\xe0\x81@\xc0\x06JX\xd3\xc1T\
+\x90\x0d$m\xdd\x0d\xdd\xf0N\xdd\x13\x0c\x04@\x0e2\
+\x81\x188\x0e0\x83#\x92\xfa{\xa4\xf0\x1a\x07\x0a\xc1\
+\xef\x10\x89\x81bh\x5c@\x7f\xaf\x18\x14@\xfe\xf30\
+V\xc5I\x868\xf5\xd5\x11d\x0c\xf4\xa9Tr\xc0S\
+\x88\xf3@8\xc8\x85\xf7\xca~%\xe9\x90\x07\x89\xe0\x09\
+d$\xff\xf0H\x00\xab\x10\xc6\x90\x0b\xab\xaa\xff\xdf\xf3\
+\x83\xecW\x86\x0b\x99\x88\x01F98#\x9b1hI\
+\x0c\x22\x06\x12C\x89\xc1D;\xdc\x10\xf7\xc5\xbd\xf1\x08\
+x\xf5\x87\xd5\x05\xe7\xe0\x9e\x83q|\xb5'<%\xb4\
+\x13\x1e\x11n\x10:\x08w\xa6H\x8a\xe4\xc3\xbc\x1c\x0f\
+:\xa0~\xf0@~\xd2\xbf\xcd\x0fn\x0d5\xdd\xf0\x00\
+\xdc\x07\xaaCe\x9c\x85\x1b\x02G\xdc\x15\xce\xc3\xc5\xfd\
+\xe0\xccn\x90\xe5\x0d\xf8\xad\xca\x0a{\x98\xf6\xdf\x22\xf8\
+\xe6\x09\x0d\xd8Q\x9c)(e\x04\xc5\x9fb;|\xa4\
+\xa6\xbd\xa6\xdb\x90\x8a*\xd7\xdf\xe6G\xedk\xfaP\xbe\
+yC=\xc3\xe7\xe7}\x93}\x11l\xc3\x87[b\xdf\
+c\x07\xb0s\xd8I\xec\x02\xd6\x8c5\x006v\x1ck\
+\xc4Z\xb1\xa3*<\xb4\xe2\x9e\xf4\xaf\xb8\xc1\xd9b\xfb\
+\xfd\xc9\x81:\xc3\xd7\xcc\xd7'\xab\xca\xa4\xc2\xb9\xd6\xb9\
+\xcb\xf9\x93\xba/_<#_\xb5\x19ySe3\xe5\
+\x92\xcc\xac|6\x17~1\xc4l\xbeT\xe84\x8a\xed\
+\xe2\xec\xe2\x06\x80\xea\xfb\xa3~\xbd\xbd\x8e\xe9\xff\xae \
+\xac\xd6\xaf\xdc\xc2_\x01\xf09\xde\xd7\xd7w\xe4+\x17\
+v\x1c\x80}\x1e\xf0\x95p\xf8+g\xcb\x81\x9f\x16\x0d\
+\x00\xce\x1f\x16*\xe5\x05j\x0eW]\x08\xf0\xcd\xc1\x80\
+\xbb\xcf\x00\x98\x00\x0b`\x0b\xe3q\x01\xee\xc0\x1b\xf8\x83\
+ \x10\x06\xa2@<H\x06\x93\xa1\xf7Yp\x9d\xcb\xc1\
+t0\x1b,\x00\xc5\xa0\x14\xac\x00kA\x05\xd8\x0c\xb6\
+\x82j\xb0\x1b\xec\x07\x0d\xa0\x19\x9c\x04g\xc1%p\x05\
+\xdc\x00w\xe1\xea\xe9\x04/@\x0fx\x03>\x22\x08B\
+B\xe8\x08\x131@L\x11+\xc4\x01qA8\x88/\
+\x12\x84D \xb1H2\x92\x86d\x22RD\x89\xccF\
+\x16\x22\xa5\xc8*\xa4\x02\xd9\x82\xd4 \xfb\x90\xc3\xc8I\
+\xe4\x02\xd2\x8e\xdcA\x1e\x22]\xc8\x9f\xc8\x07\x14Ci\
+\xa8.j\x8cZ\xa3\xa3Q\x0e\xcaE\xc3\xd1xt\x12\
+\x9a\x89NC\x0b\xd1E\xe82\xb4\x1c\xadBw\xa1\xf5\
+\xe8I\xf4\x12z\x03\xed@_\xa0\xbd\x18\xc040\x16\
+f\x869b\x1c\x8c\x87Ea)X\x06&\xc7\xe6b\
+%X\x19V\x85\xd5aM\xf09_\xc3:\xb0n\xec\
+=N\xc4\x998\x1bw\x84+8\x14O\xc0\x85\xf84\
+|.\xbe\x14\xaf\xc0\xab\xf1z\xfc4~\x0d\x7f\x88\xf7\
+\xe0_\x08t\x82\x11\xc1\x81\xe0E\xe0\x13&\x102\x09\
+\xd3\x09\xc5\x842\xc2v\xc2!\xc2\x19\xb8\x97:\x09o\
+\x88D\x22\x8bhC\xf4\x80{1\x99\x98M\x9cE\x5c\
+J\xdcH\xdcC<Al'>&\xf6\x92H$\x03\
+\x92\x03\xc9\x87\x14E\x12\x90\xf2I\xc5\xa4\xf5\xa4]\xa4\
+\xe3\xa4\xab\xa4N\xd2;\xb2\x06\xd9\x94\xecB\x0e&\xa7\
+\x90\xa5\xe4\x22r\x19y'\xf9\x18\xf9*\xf9\x19\xf9#\
+E\x8bbE\xf1\xa2DQD\x94\x99\x94\xe5\x94m\x94\
+&\xcaeJ'\xe5#U\x9bjC\xf5\xa1\xc6S\xb3\
+\xa9\x0b\xa8\xe5\xd4:\xea\x19\xea=\xeak\x0d\x0d\x0ds\
+\x0dO\x8d\x18\x0d\x89\xc6|\x8dr\x8d\xbd\x1a\xe75\x1e\
+j\xbc\xa7\xe9\xd0\xeci<Z*MI[F\xdbA\
+;A\xbbC{M\xa7\xd3\xad\xe9\xfe\xf4\x14z>}\
+\x19\xbd\x86~\x8a\xfe\x80\xfeN\x93\xa9\xe9\xa4\xc9\xd7\x14\
+i\xce\xd3\xac\xd4\xac\xd7\xbc\xaa\xf9\x92AaX1\xb8\
+\x8c\xc9\x8cBF\x19\xe3\x00\xe32\xa3[\x8b\xa2e\xad\
+\xc5\xd3\x12h\xcd\xd5\xaa\xd4:\xacuK\xabW\x9b\xa9\
+=F;J;O{\xa9\xf6N\xed\x0b\xda\xcfuH\
+:\xd6:A:\x22\x9dE:[uN\xe9<fb\
+L\x0b&\x8f)d.dnc\x9eav\xea\x12u\
+mt\xf9\xba\xd9\xba\xa5\xba\xbbu\xdbt{\xf4t\xf4\
+\x5c\xf5\x12\xf5f\xe8U\xea\x1d\xd5\xeb`a,k\x16\
+\x9f\x95\xcbZ\xce\xda\xcf\xba\xc9\xfa0\xc2x\x04w\x84\
+x\xc4\x92\x11u#\xae\x8ex\xab?R\xdf__\xac\
+_\xa2\xbfG\xff\x86\xfe\x07\x03\xb6A\x90A\x8e\xc1J\
+\x83\x06\x83\xfb\x86\xb8\xa1\xbda\x8c\xe1t\xc3M\x86g\
+\x0c\xbbG\xea\x8e\xf4\x1e)\x1cY2r\xff\xc8_\x8c\
+P#{\xa3X\xa3YF[\x8dZ\x8dz\x8dM\x8c\
+C\x8ce\xc6\xeb\x8dO\x19w\x9b\xb0L\xfcM\xb2M\
+\xd6\x98\x1c3\xe92e\x9a\xfa\x9aJL\xd7\x98\x1e7\
+\xfd\x8d\xad\xc7\xe6\xb2s\xd9\xe5\xec\xd3\xec\x1e3#\xb3\
+P3\xa5\xd9\x16\xb36\xb3\x8f\xe66\xe6\x09\xe6E\xe6\
+{\xcc\xef[P-8\x16\x19\x16k,Z,z,\
+M-\xc7[\xce\xb6\xac\xb5\xfc\xc5\x8ab\xc5\xb1\xca\xb2\
+Zgu\xce\xea\xad\xb5\x8du\x92\xf5b\xeb\x06\xeb\xe7\
+6\xfa6|\x9bB\x9bZ\x9b{\xb6t[?\xdbi\
+\xb6U\xb6\xd7\xed\x88v\x1c\xbb\x1c\xbb\x8dvW\xecQ\
+{7\xfb,\xfbJ\xfb\xcb\x0e\xa8\x83\xbb\x83\xc4a\xa3\
+C\xfb(\xc2(\xcfQ\xd2QU\xa3n9\xd2\x1c\xb9\
+\x8e\x05\x8e\xb5\x8e\x0f\x9dXN\x11NEN\x0dN/\
+G[\x8eN\x19\xbdr\xf4\xb9\xd1_\x9c\xdd\x9cs\x9d\
+\xb79\xdf\x1d\xa33&lL\xd1\x98\xa61\x7f\xba\xd8\
+\xbb\x08]*]\xae\x8f\xa5\x8f\x0d\x1e;ol\xe3\xd8\
+W\xae\x0e\xaeb\xd7M\xae\xb7\xdd\x98n\xe3\xdd\x16\xbb\
+\xb5\xb8}v\xf7p\x97\xbb\xd7\xb9wyXz\xa4y\
+l\xf0\xb8\xc5\xd1\xe5Ds\x96r\xce{\x12<\x03<\
+\xe7y6{\xbe\xf7r\xf7\xca\xf7\xda\xef\xf5\x87\xb7\xa3\
+w\x8e\xf7N\xef\xe7\xe3l\xc6\x89\xc7m\x1b\xf7\xd8\xc7\
+\xdcG\xe0\xb3\xc5\xa7\xc3\x97\xed\x9b\xe6\xfb\xa3o\x87\x9f\
+\x99\x9f\xc0\xaf\xca\xef\x91\xbf\x85\xbf\xc8\x7f\xbb\xff3\xae\
+\x1d7\x9b\xbb\x8b\xfb2\xc09@\x1ep(\xe0-\xcf\
+\x8b7\x87w\x22\x10\x0b\x0c\x09,\x09l\x0b\xd2\x09J\
+\x08\xaa\x08z\x10l\x1e\x9c\x19\x5c\x1b\xdc\x13\xe2\x162\
++\xe4D(!4<te\xe8-\xbe1_\xc8\xaf\
+\xe1\xf7\x84y\x84\xcd\x09;\x1dN\x0b\x8f\x0b\xaf\x08\x7f\
+\x14a\x1f!\x8fh\x1a\x8f\x8e\x0f\x1b\xbfz\xfc\xbdH\
+\xabHidC\x14\x88\xe2G\xad\x8e\xba\x1fm\x13=\
+-\xfaH\x0c1&:\xa62\xe6i\xec\x98\xd8\xd9\xb1\
+\xe7\xe2\x98qS\xe2v\xc6\xbd\x89\x0f\x88_\x1e\x7f7\
+\xc16A\x99\xd0\x92\xc8HLM\xacI|\x9b\x14\x98\
+\xb4*\xa9c\xc2\xe8\x09s&\x5cJ6L\x96$7\
+\xa6\x90R\x12S\xb6\xa7\xf4N\x0c\x9a\xb8vbg\xaa\
+[jq\xea\xcdI6\x93fL\xba0\xd9pr\xee\
+\xe4\xa3S\x18S\x04S\x0e\xa4\x11\xd2\x92\xd2v\xa6}\
+\x12D\x09\xaa\x04\xbd\xe9\xfc\xf4\x0d\xe9=B\x9ep\x9d\
+\xf0\x85\xc8_\xb4F\xd4%\xf6\x11\xaf\x12?\xcb\xf0\xc9\
+X\x95\xf1<\xd3'sufW\x96_VYV\xb7\
+\x84'\xa9\x90\xbc\xca\x0e\xcd\xde\x9c\xfd6'*gG\
+N_nR\xee\x9e<r^Z\xdea\xa9\x8e4G\
+zz\xaa\xc9\xd4\x19S\xdbe\x0e\xb2bY\xc74\xaf\
+ik\xa7\xf5\xc8\xc3\xe5\xdb\x15\x88b\x92\xa21_\x17\
+\xfe\xe8\xb7*m\x95\xdf)\x1f\x16\xf8\x16T\x16\xbc\x9b\
+\x9e8\xfd\xc0\x0c\xed\x19\xd2\x19\xad3\xedg.\x99\xf9\
+\xac0\xb8\xf0\xa7Y\xf8,\xe1\xac\x96\xd9f\xb3\x17\xcc\
+~8\x87;g\xcb\x5cdn\xfa\xdc\x96y\x16\xf3\x16\
+\xcd\xeb\x9c\x1f2\xbfz\x01uA\xce\x82\x9f\x8b\x9c\x8b\
+V\x15\xfd\xb50ia\xd3\x22\xe3E\xf3\x17=\xfe.\
+\xe4\xbb\xdab\xcdby\xf1\xad\xc5\xde\x8b7\x7f\x8f\x7f\
+/\xf9\xbem\xc9\xd8%\xeb\x97|)\x11\x95\x5c,u\
+.-+\xfd\xb4T\xb8\xf4\xe2\x0fc~(\xff\xa1o\
+Y\xc6\xb2\xb6\xe5\xee\xcb7\xad \xae\x90\xae\xb8\xb9\xd2\
+oe\xf5*\xedU\x85\xab\x1e\xaf\x1e\xbf\xba~\x0d{\
+M\xc9\x9a\xbf\xd6NY{\xa1\xcc\xb5l\xf3:\xea:\
+\xe5\xba\x8e\xf2\x88\xf2\xc6\xf5\x96\xebW\xac\xffT\x91U\
+q\xa32\xa0r\xcf\x06\xa3\x0dK6\xbc\xdd(\xdax\
+u\x93\xff\xa6\xba\xcd\xc6\x9bK7\x7f\xf8Q\xf2\xe3\xed\
+-![\xea\xab\xac\xab\xca\xb6\x12\xb7\x16l}\xba-\
+q\xdb\xb9\x9f8?\xd5l7\xdc^\xba\xfd\xf3\x0e\xe9\
+\x8e\x8e\xea\xd8\xea\xd35\x1e55;\x8dv.\xafE\
+k\x95\xb5]\xbbRw]\xd9\x1d\xb8\xbb\xb1\xce\xb1n\
+\xcb\x1e\xd6\x9e\xd2\xbd`\xafr\xefo\xfb\xd2\xf6\xdd\xdc\
+\x1f\xbe\xbf\xe5\x00\xe7@\xddA\xab\x83\x1b\x0e1\x0f\x95\
+\xd4#\xf53\xeb{\x1a\xb2\x1a:\x1a\x93\x1b\xdb\x0f\x87\
+\x1dni\xf2n:t\xc4\xe9\xc8\x8ef\xb3\xe6\xca\xa3\
+zG\x97\x1f\xa3\x1e[t\xac\xefx\xe1\xf1\xde\x13\xb2\
+\x13\xdd'3O>n\x99\xd2r\xf7\xd4\x84S\xd7O\
+\xc7\x9cn;\x13~\xe6\xfc\xd9\xe0\xb3\xa7\xceq\xcf\x1d\
+?\xefs\xbe\xf9\x82\xd7\x85\xc3\x179\x17\x1b.\xb9_\
+\xaaouk=\xf4\xb3\xdb\xcf\x87\xda\xdc\xdb\xea/{\
+\x5cn\xbc\xe2y\xa5\xa9}\x5c\xfb\xb1\xab~WO^\
+\x0b\xbcv\xf6:\xff\xfa\xa5\x1b\x917\xdao&\xdc\xbc\
+}+\xf5V\xc7m\xd1\xed\xe7wr\xef\xbc\xfa\xa5\xe0\
+\x97\x8fw\xe7\xdf#\xdc+\xb9\xafu\xbf\xec\x81\xd1\x83\
+\xaa_\xed~\xdd\xd3\xe1\xdeq\xf4a\xe0\xc3\xd6Gq\
+\x8f\xee>\x16>~\xf1D\xf1\xe4S\xe7\xa2\xa7\xf4\xa7\
+e\xcfL\x9f\xd5<wy\xde\xdc\x15\xdcu\xe5\xb7\x89\
+\xbfu\xbe\x90\xbd\xf8\xd8]\xfc\xbb\xf6\xef\x1b^\xda\xbe\
+<\xf8\x87\xff\x1f\xad=\x13z:_\xc9_\xf5\xfd\xb9\
+\xf4\xb5\xc1\xeb\x1d\x7f\xb9\xfe\xd5\xd2\x1b\xdd\xfb\xe0M\xde\
+\x9b\x8foK\xde\x19\xbc\xab~\xcfy\x7f\xeeC\xd2\x87\
+g\x1f\xa7\x7f\x22}*\xffl\xf7\xb9\xe9K\xf8\x97{\
+}y}}2\x81\x5c\xd0\xff+\x80\x01\xd5\xd1&\x03\
+\x80?w\x00@O\x06\x80\x09\xcf\x8d\xd4\x89\xea\xf3a\
+\x7fA\xd4g\xda~\x04\xfe\x13V\x9f!\xfb\x8b;\x00\
+u\xf0\x9f>\xa6\x1b\xfe\xdd\xdc\x02`\xef6\x00\xac\xa1\
+>#\x15\x80h:\x00\xf1\x9e\x00\x1d;v\xa8\x0e\x9e\
+\xe5\xfa\xcf\x9d\xaaB\x84g\x83\x1f'}N\xcfK\x07\
+\xff\xa6\xa8\xcf\xa4\xdf\xf8=\xbc\x05*UW0\xbc\xfd\
+\x17\xee#\x83\x06~\xb4ao\x00\x00\x00xeXI\
+fMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\x00\x03\x00\
+\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00R\x01\
+(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\x00\x04\x00\
+\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\x00H\x00\
+\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x02\xa0\x02\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\
+\x01\x00\x00\x00@\x00\x00\x00\x00\xfa\xa3\xa7\x01\x00\x00\x00\
+\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\
+\x9c\x18\x00\x00\x02\x04iTXtXML:co\
+m.adobe.xmp\x00\x00\x00\x00\x00\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 6.0.0\x22>\x0a  \
+ <rdf:RDF xmlns:\
+rdf=\x22http://www.\
+w3.org/1999/02/2\
+2-rdf-syntax-ns#\
+\x22>\x0a      <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a         \
+   xmlns:tiff=\x22h\
+ttp://ns.adobe.c\
+om/tiff/1.0/\x22\x0a  \
+          xmlns:\
+exif=\x22http://ns.\
+adobe.com/exif/1\
+.0/\x22>\x0a         <\
+tiff:Orientation\
+>1</tiff:Orienta\
+tion>\x0a         <\
+exif:PixelXDimen\
+sion>138</exif:P\
+ixelXDimension>\x0a\
+         <exif:P\
+ixelYDimension>1\
+36</exif:PixelYD\
+imension>\x0a      \
+</rdf:Descriptio\
+n>\x0a   </rdf:RDF>\
+\x0a</x:xmpmeta>\x0a\xef\xac\
+N\xbe\x00\x00\x15\x80IDATx\x01\xb5[i\x8c\
+d\xd7U>\xb5tw\xf5\xbeLOO\xcf\xe6\xb1{\
+\xc6&c\xc7\x9e\x893\xd8r\x82\x89\x8d\x15\x02\x22l\
+r\x08\x9b\x12\x84\xf8\x13$\xc0`!!\x84\x04\xfe\xc1\
+\x8fHH(\x01\xf3\x0f\x0b\x09\xa4  \x09\x90(\x12\
+V\x14l\x08\x89\x95D\x89q&\x19{\x16bf\xf3\
+\xf4,\xdd=\xbdU\xd7^|\xdfw\xee}\xef\xd5\xd2\
+3=!\xbe\xdd\xf5\xee\xbd\xe7\x9e\xf3\x9d\xe5\xae\xef\xd5\
+\xab\xdc\xdc\xa3\xcf\xb4m\x9b\x94\xcb\xe5\xccrykT\
+\xca\xd6\xa8Vlhl\xc2\xc6\xe6\x0e\xd9\xf0\xcc^\x1b\
+\x18\x1e\xb7\x5c\xa1\xe0\x92B\xc0%\xe4\xed\xae\x5cL\xdd\
+4\xb1\xeb\x120\xc4\x00\x88H\xf3<\xad\x13\xbe\xbb\x0d\
+\xa2P\xd6jT\xad^^\xb3\xca\xdaU\xabm\xdc\xb0\
+v\xabe\x85\x81\x12L/\xa0\xb9\xe5\xf8\xdb\x5c\x8b\xdb\
+\xd0%\xdc\xacU\xacY\xab\xd9\xf4\xddGm\xd7\xe1\xe3\
+62{\x17\x1c\x9f\xb2\xfc\xc0\x90!44\xc7r0\
+\xa0\xad\x0f\x91h \xeb^&\xddmv\xba\x04pq\
+z7_Z\x0f\x00\xe2\x8b\xbcB\x0cxl\xe7\x9fr\
+e\xa8\xb5\x9a\xd6\xac\x96\x11\x88\x9bV^>o\xebW\
+\xdeP\xb908\x0c#a\xad\x1bE\x98\x8e\xd4'\x00\
+98\x9f\xb3\xea\xc6\x9aM\xee_\xb0}\xc7\x9e\xb2\xf1\
+\xbd\x87-_,II\xab\xd1\xb0V\xbd*\xe3\x12\xe7\
+e\x0cq\xe9DpZ\x0aC\x19t\xe7%\x8b\x1b\xef\
+\xf6\xa4\xfc\x91\x9e\x93\x88\xd3\x89\x15\xebT\x11\xf1\xb3t\
+\x95\x1dV\x1dS\x9a\xdag\xa5\xa9\xbd\xb0\xf9~\x05\xe1\
+\xe6\x85o\x995\x1b\xb0\x7f\x10*zGCg\x00B\
+\xa4j\x9be;\xf8\xc3?n{\x1e\xf8Q+\x96\xc6\
+\xe1p\x0d#\xa1\xe2Qd\xd7#\x91UF\xa1 #\
+c]\xad0\x1ct9\x09\xba;\xc1\x06x!\x1di\
+\xa7\xb8\x98\xd3\xc9\xe7C\x0b\xf2*\xc4:s4\xca\xfe\
+\xd0\x12\xf4)\xf3h\xaa\x83\xda\xed\xba\xd4\x14\x06G0\
+rOXi\xfa\x80-\x9f\xfb/\xab\xae-bZ\x0c\
+\xf7\x04!\x0fhO2\xacm\x0d\x0c\xf9#O\xfd\xa2\
+\xed\x7f\xf8'4\x8f\x9a\xd5-\x00\x86\xc8E\xa7\xa8\xb0\
+\xc5\x9eDB9\xc9I\x8f\xc6\x84\x5c\xed\x81N>\x8d\
+\x90\x98\x83\x1e\xebY9g\x17\xaa\xb7\x93\x90\xd1\xe7j\
+]W\x94\x8f9#(=\xcd::\x0e\xeb\xd6\xf8n\
+\x9b{\xe0'mt\xf7\x11tb\x19\xf1O]&N\
+Rc$\x1b\xd5\xaa\x1d~\xdf\xd36{\xef#XX\
+\x1a\xd6n6COf\x8cq\xed\xa9\xd3\xb1\x1e\x9c\xf4\
+\xaa\xf3\xd3)\x19\xc6\xb6\xc0\x97\xb4\xc7\xb6>\xf4l0\
+T&o\x1f\xbe\xe8t\xcc;\xf51\x10\xf8`\xf4\xe6\
+\x0b\x836s\xf8q\xaca\x0b\x98\x0d\x95\x8e (\x00\
+\xb9|\xdeje\x1f\xf6t\xbeY\xe30\xeat\xda\x95\
+\x80\x86\x156\x1a\x93\xe4\xe4\xed\xe2\xef4f\xfb\x9e\xcf\
+\xd3LF\xdf\xcdU\xffa\x09Js\x96\xf1\xa1\xa1\xdd\
+t\xafS\x16\x89A\xeag\x07\x84[\xcd\x1av\xac\x01\
+\x9b\xbe\xe71\x1b\x1c\xdd\x85:\xfc\x83\x06\xa6\x22\x87\x04\
+\xb7\xb8\x19\xac\xf4sG\xdf\x8bF\x0c\xf7.gR\xe7\
+\xd3\x9e\xf8A8\xdf\xc6\xb0\xae6\x83\xe1\x08\x80\xd4\xfa\
+%)'\xbaAw\xb3<\xd8,\xb3\x8d\xfd\x5c@$\
+4\xf0\x9dAty\x87\xba\xcb#\xcc\x08Bap\xcc\
+&\xefz\xc4n\x9c\xfe\x22\x9a\xe5\x81\x15\xc1\x82\x08\x17\
+m\xfe\xc1'\xac04\x8a\xad\x84C\x04pY0\x96\
+\x09F\xd4l\x1e\xe8Nv@\xb5w\xf1'\xed\x94e\
+\x1b\x12\x9d/b\x09\x9e\x1a\xf5Y(t\xa9a\xbb\x0a\
+\xcaxq\x11\xa79t\xe0\x01g\x0b8\xeb\xe5\xa65\
+\x1a\x0c\x06\xb8\x03~\xb4#\xa9\xa3\x95#\xa14\xb1\x17\
+\xeb\xc1}\xb6\xb1xJ\xbbF\xb1Q\xd9\xb2\xdd?t\
+\xc2Fq\xc0\xe1j\xdf\xe3|0\x86*\x05\x1as\xb7\
+\x84\xb5\x1e\xa5\xe4\x0b\x0d!\x8b\xc6;}\x00+\xfa\x99\
+\xad\x96\xfd\xce{\xc7\xec\xd7\x9f\xda\x8d\x05\x1et\x1f\x91\
+.\xb7\xdd5\xc0\xb2\x99E\x8a4 \xfb\xfc\xbf\x5c\xb4\
+\xe7\xbfr\xd3\x8e\x8e\xe7\xad\xded\xa3\x07:q^\xf6\
+@Bz\xda\x08\xc0\xbd\xb6\xb5\xf4&\xaaM\x9f\x02\xd3\
+\x87\x1e\xb4|~\xd0\x9aX5cra\x08eV_\
+\xe9\x0f\xe0\xd1\xc9\xac\x12\x95\xd9N\x10)e\xe6\x8a\xb3\
+|\x9c\xd3+\xc0\x1d\x19\xcc\xd9\xecx!\xf8\xbe\x93\x08\
+D\xebb\x8e]\x0b3\xb6\x04\x9cUL\xdd\x5c\x1b\x18\
+\xc1\xbe\xac>\x105\xe2(\xd5\xc2\x99\xa0X\x9a\xb4\xa1\
+\xc9\xfd\x08\xc29\xcb\x0f\xcf\xcc\xe1h\xbb\x0f\x0c\x0d4\
+\xcbt7\x9a\xe5\xb7\xc1y\xc2\xd2\xb8\x22\x8dr\x15\xda\
+eI\xbb\xd3\x8f\x9b\x88\xa3p\xd8\xa5\x09\x181\x14\x22\
+*\xa0\x1e\xf8\xc1\x14\xdbxD\xe6T \xb58\x8a\xe3\
+mqhL\x91\x89L\x0a\xc4\xdb\xe1<\x14h\x0f\x81\
+a\x9c\xbb2\x88J\xd9\xf9\x18\x16w2\x06\xe4\x92\x1c\
+$\x00jt\x9e\xa5HS\xde\xe9<9\xc9\xcb\xed\xbd\
+8<)\xbf\xf3\xc3S\xf3\xd8'\xd1\x1f\x04p\xd4\xb7\
+\xa7\xe7\xa9\x1a\x0at$F\xb9\x0a]\xdc\xc6\x0at<\
+8\xef6\xc8\x08Z\xda7E\x1e\x05\x0bry}\xc0\
+\xca^v\x07B\xde\xc7y\xb6\x8b\xade\xf9\xc1Q\x04\
+a\x02\x0b\xf1\xd0\x88\x0c\x930Q\xbf\x8f\x9e\x97\xa5A\
+9\x0d$\x96r6\x04z\x0byr\xef\x00\x96),\
+\x84eD\xe1\xe6f\x03t\x0c\xc5b\xce\xc6J\xbc{\
+sY\x06\xa5;\xb1\xcd\xc99[\xdb\xc2=\x09\xb6P\
+.\x82[\xd5\x96\x0da3\xa1\x0e\xd7\xd7\xeb|\xb4\x8b\
+\xed\xfc\xcb\xe5\x0aV(\x0ea\x11D\xef+,\x0c\x0d\
+\x8f\x00\xd4*\xa6\x90'\xa0$\xab\xd5\xdb\x03=\xf2\xbb\
+\x18j\x94\xcd\xf0\xf5\xa3\xd7`\xf8\xe1\xe1\x9c}\xe1\xd5\
+5\xfb\xfa\x99M\x8c\x82\xb6\xd5!\xfa\x91\xf7M\xdb\xcf\
+<:\xab\x91A\xb9\xee\xc4\x90T\xc1\xf8O\xffq\xc5\
+\xfe\xe1\xcb\xd7m\xa8\x90\xb3\x1a\x16\xbf\xc5\xb5\x86\x1d\x1d\
+\xe1\x0e@kz\x9d\xa7M\xc9\x87\xa0\xb2\x0f#\x0fk\
+\x81\xdf\x0c\xa9\x9d\xc2PA\x07\x02S\x125\xc9\x88\xea\
+\xed\x010\xf29;j\x94\x15\xb8\x04H\xf6z\xe0\xcf\
+\xd6\xe9L\x05\xce\x9c\xbd\x81\xad\x17\xe5\x8dZ\xcb~\xef\
+s\xd7\xed\xd8\xc2\x98-\xec\xe1M\x8b\x96\x05\x8a(y\
+=g\xa7\xdf\xda\xb0\x8f|\xfa\x8a\x1d\xc1\xfdI\x11\x8f\
+#\xb8\x96\x8c`\xf4\xf0 \xd4\xcf\xde\x84\x16\xecb\x9d\
+\x9f8\x928\xf9\x83\xe1t\xff\x07\xef|b\x00\xdcH\
+\xca4\x02u\xf6\xfc\xd8\x80\x1b?\x86\x05\xa1\x8e\xee\xa8\
+\xd6\xe3\x92\xee\x8ew_\xab\x08\xd4\xe1!\xb39x\x80\
+\xb3\x8f\xa6>\x83\x90\x0e\xff\xa0\xa7K\x1fq\xa4\x9f\x9a\
+\xf5O\x0b\xb0\x1b\xc9\x7f\x144?\x19\x16\x1a\x17\x82\x92\
+\x0aI\xba\x83N\xbe\xa4=\xca8\x01h\xaeD<Y\
+>\xd13A\x06\xbf\xd6\x06\xe4\xdc\xaa8\x9f\xfb\xcd}\
+\xc2\xc6\xc4E\xaf\x02\xde:\xb0\xfc\xcc\xe3\x8et\xd8\x03\
+\xe6\xc4\x87\x0e\xfdr\x8f\xad\xfe\x8f6\xc4<TbN\
+\x81.!\xd6\x13\xc0\x08\x1e\xf3\xd8\x86z\x94s\xfe\xb4\
+\x9eD\x1e\x86\xd3\xdc\xc8\xd7\x8d\xa9\xbbn1\x90\xa9\x7f\
+\xa2\x0c`4[e;\x10\xb3\xfb<\xa5\x12\xdc.?\
+\x22\x9d9\xfb\x9aS\x8f\xe7\x11\x098\xaf*\xc4p\x10\
+/\xa4\x80\x19z\x16\x8cl`R\xe6\xab}Z\x17\x1f\
+\x95l\xe3\xbc\xdai\x09E\xc8\xb7\x83\xa4\xe1\x1ex\xbf\
+\x1f\xe7\xddVW\xaa\x9b!\xaa\xd6'\xe8w\xa3I\xba\
+\xb3\x9e\xef\x0e\xca\x8e\x9c\xa7\xc3\x0c^\xfc\xb0~\x9bD\
+\xdc6\xd6\x0f\x8a0E{\xa3\xfe\xd8\xd0M\x8fu\xc9\
+\x84pk\x17\x90n\xf4P\xf6F\x88 \x11Pz\x82\
+\xb6\x84\x96jO\x8d\x10\x90[\xe5\xcaP\xbeU\xcfg\
+\x8c\x87\x1b\xc1\xee\xe0\x95P\xfb_\xa4:kO\xc4\xe9\
+\xd1\x1f\x82\x03z\xe2<\xcb\xf8S\xff\xa3\x9c\xec\x02T\
+\xd5\xc1\x14\xc0v\xea|\x0cL\x8a\xf3\xf69\xdf\x94m\
+\x0a\x19\xd5\xd1\xf0\xf4\xa3\xaa\x071\xda\x94\xf5\x8bR\xfc\
+\x8fI\xbb@\x02\xd0\xb5\x0b\x88\x8f\xe0H\xfd\xc1R\xba\
+02|\xb1\x8e-:Yp\x1c(n]\xbc\x95\x0d\
+\xf2\xae\xc0u\x88\xe9V\x17\xef\xc1\xe8T\xb4+\xea\xeb\
+\xa6\xc7z\xd2\x0eh\x7f:\x1c\xd6\x00T\x93?\x1eI\
+#\xe0N\x9d\x8f\xfc\xee\x03\xa5\xf0\x84\x06\xd8\x03\xd8\xd7\
+k\xb8W]\xc4}\xffe\xec\xed[<\xa5q\xf9f\
+@\xd1\xbe\x07\x93o\xdfP\xce\x8a8\xc2*\xc6\xea\xc5\
+[9\x9e\xb6i\xb7(P\x17\x92\xe4\xbc\x1c\x9d\x8d6\
+\xc5\xba+\xa0eA?\xc5\xbc\x96\x9e\x04\xe5|`\x10\
+\x9c\xac\x22\xbe\x0b\xf5\x80E\xc5\x19>>\xdb\xc1\xb9\xc6\
+\xae\xe2\x09\xcd\xeb\x9b-[\x98\xc8\xdb\x93w\x0f\xda\x81\
+]\x836;Y\xb4\x12\x1a\xeb\xe8\xf6\x15\x9c\xff\x17\x97\
+jv\xf2\xd2\x96\xadUp\xa2\x83\x8c\x8e?\xc2\xa4W\
+\xdb'\xda\xe6w\x94\x81'\xa3\x9f\x94m\xed\x8d\xce\x83\
+\x9f<<~\x91\xe4k\x00\xa3\x11\x80\x04\x9b\x05\x0d\x02\
+\xdd\xf4\xa8\x88tnK\x83\xf0\xbe\x82S\xdaW6\x9a\
+\xf6k\xf7\x96\xecOOL\xda\x03\xf7\x8c\xda\xfe\xd9!\
+\x1b\x1e\xc4C\x0f\xe8\xc3?u\xea\xf8J\xc2g\xbe\xbc\
+h\xbf\xf4w\x97\xecG&\x0aV\xa1\x1e\xb5\x12\xf1\x16\
+I\xfdA\x14\xda\xec|\xd1\xf6hS\xacG\x06\xe1v\
+\xf8\x11\xf1\xfd\xb9\x84\xf3\x91!\xac\x01l\xde\x16\x8cZ\
+\xe3\x07|t\xbe\x04\xe7/\xc0\xf1=p\xe4\xf3O\xcf\
+\xd9\x13\xc7\xa6m\x8c\xb7gJ4\x142\xe1F\x8bA\
+\xe0\xa9\x93\x0f2\xa7F1\x0f8-\xe88hdc\
+\xedv):D\xbe\xe8\xec\xb6\xf6&\xd8\x8e\x1c\xf9\xa3\
+\x0e?\x07`R9\xa8\x93\xb7\x03\xd3\x01DV:\x18\
+\xeb\xc3\xf0\xf3\xe4Z\xd3~\xe1\xe8\xb0\xfd\xfe\xcf\xef\xc5\
+\x8dLI\xce4\xf9\x88\x0a\x01U\xcf\xeb\xe2#\x80\x1a\
+r\xe1\xb8\xafC\x0c\xa1\xe4\xbc\x0a\x18%\x8e\xed\x96\xf4\
+\xbb\xa2\xddY)(\x86\xed\xec\x8d\x81\x8aN;\x9f\x8b\
+\xa9\x0dEM\x81\xe8\x93\x0f\x00*@3\x89L!\x8f\
+J\xb2u\xf6\xfc\xa9\xf5\xa6}\xf4\xf8\x88\xfd\xd1\x87\x0f\
+\xd8\x0cz\x94\x8e\xe7\xd1\xbb\x85B\x1c\x01\x0e\xd3\xf7\xaa\
+9\x11\x9c\x90\xaahV_n\x11\xc9\xcdmP\x7f2\
+U\x97^{\x19\x9c\x8c\x1f\x89?\xd2\x83\xce\x89k\x00\
+\x01=\x92tZ\xad=`\xdd=O0.\x5c\xd7\xb1\
+\xd8}`a\xc8\xfe\xe0\xe9\xfd\xee<\x1e\xce\xd1\xf9\xdb\
+\xdd\xd0He\xa2\x96z\xdd\xd8\xd0\xa1I\xf3v\x05?\
+\x070\x04H\x19'\xdd\x01z\xe3x\xd1\xe9\x98;Y\
+R\xce\x03\xf1p/@\x1c?\x1d\xa5\xcc\x8111.\
+\xad\xb3\xe38wW\x11\x85g>\xb8\xc7\xe6&\x06\xd4\
+\xf3\xb7\xeauI;\x04\xa5\xd3\x14\xf1i\x9d>iS\
+\xdfRp8\xe2\xf5\xd8\xeb^zP\x89H|&d\
+*\x07y\x8d\x00\x901N\xd5\xa2\xc7R)\xb3\x0b\xb1\
+\xe7\xa3\x900\x04\xc6\xdeo\xdb\xd7\xb1\xe8=\xfb\x9eI\
+;\x86\x95\x9e\xf7\xe3\xec\xf9~)>\xfcd\xab\xaf\x07\
+\x9e\xa7xA\xca\xcd\xe8\x07\xd1Ck\x11\x8c\xb6\xc8\x9e\
+Pf\xb6\x03\xe7\x05F\xf7\xe8\x1b\xfe\xb0\x08\xa6\x15-\
+S\x01\x94\x8e\xc7gx\xce\x22)\x05\xaa\x89C\xcd\x81\
+\x91\x9c=u|B\x0f5\x19\xa8\xeeaOyB1\
+0<\x03\xad\xae\xd7l\x0d\xfb\xff\x10\xf6\xcb\xf1\x91\x22\
+\x9e\xff\x15m`\x00\xf1G\xf0\x9c\x17L\x14\xd8A\x8a\
+\xfc\xe2\x0e2tFN\xc5z\xc4\x12\xd9\xdb\xa2\x1f\xe2\
+\x8dk\x80\x84\x18\x0b\x08\xc4>\x94C\xa8\x93\x16\x85\x18\
+_\x1a\xcbo\x97\xafW1\xf7\x8f\x8e\xda\xc2<\xde\xbe\
+\xc0\x0er+\xe7\xcf\xbdU\xb6O}\xe9\x8a\xbd\xf4\xfa\
+\x86-\x95\x1b6\x8cc\xe2\xc1\xe9\xa2\xfd\xdc#\xd3\xb6\
+\x825d\x0c_j4\x80\x1b\xed\xd8\x81\xffT\xa9\xbe\
+\x92M(\xde\x89\xf3\xd4\xa3\x8f\x14\x85s\x00}\xe3I\
+PAa \xb6q\x9e,|+\xe8\x0c\x9e\xe5={\
+\xb0\x84\x03\x0e\xbf\xdb\x85\x18\xc7v&Q\x07{\xfe\xd4\
+\xc5\x0d\xfb\xf0\xf3\xe7\xec\xbb\x8b5;\x8e\xaf\xad\xd8\xe1\
+U\x1c\x8f_\xbdP\xb7\xcf\x9c\xda\xb0\x11<\x18=\x8a\
+\xad\xa4\xceQ@y\x0az)\x83\xd6[tnI\x80\
+\x1by\x8f\xbd\x0e\xa3\x0e\x14&Y\x226$X\x96\xc9\
+8\x8aK!\x01\x02\x90g\x01<\x0ae\x0cT\xa0\x80\
+\x7fhn\xd0\x87?GE\xa7\xff\xaa\x97kM\xfb\xfb\
+\x97\xae\xdaw\xaf\xd5\xec\x89\xb9\xa2\xad\xe3\x94HCy\
+\x9f0S\xca\xd9\xfcpQOqk\x90G\x5c\xdc\xa8\
+hc\xaf\xcf\x09\xc5MrFYI\xdbE\x8cN\x12\
+,\xe2\x89#\xb4\x8bH\x13<9P\xd8\x05H\x22\x90\
+\x0f\x011DP\xcd\xd1\xd0\xae\x0c\x06\xd3\xe2I\xcc\xe3\
+~\x89\xb8\x1c\x11\xab\x98\xef\xff}~\xcb\x1e\xc2Ii\
+\x13\xces1T\x02\x03\x87<^\xbf\x90\xa1\xd2\xcb\x00\
+\x06\x83\xfaa\x06Ad!\xd2\x14\x15\x7fo~;\xe7\
+%'Y`\x01'=\x09\xca>]\x12pXM\x9e\
+`\x5c\xc85\x042\xbd\x1el\x22[wj\xe0P\xe4\
+\x08\xd1p\xc7wgS\xe3\xa3\xf31F\xdd8\x9du\
+`\x04\xe7\xdd\xb8,N(w\x04\xc7\xf9IJ\x83F\
+D\xb7E\x93\xd8\xf9\x9d\xe0L(w9O\xba\xa6\x09\
+eqG\xb7Y\xe13\xd9>I\xbe\xb6\xb5\xda\x1f\x98\
+\x1e\xb0u=\xe6\x96vZ\x80\x05\xcc\xcf\xc1\xa91l\
+\x03\x8eXX\xb8M\x12\x8b\x98\xe5P\xc4I\xe4\xdd\x99\
+\xe0l\xe4\xa3\xea\x80\xad<\x94\xa1\x0a\x83\x99\x15\x18F\
+\xe3b#\xbaB,AHt\x96I\x0f\xf9\x95e\xbc\
+*\x07\xc9\xee\x01\xc0:}\x9c\x1e\x1d\xb0\xc7\xef\x1f\xb7\
+\xf3\x15\xdc)\x82(|G\x0dz\x82Q\xc4\x0b\x9f\xdb\
+\xdf\x07\xd0R\x9a\xab+\xca\x9e3KlT3\xe9n\
+\xabCG\xbe`\x7f\xd0G\xf9|(;2+\xdb8\
+\xef\x0e\xf0\x1cn6\x8bip\xfar\x05\x8b\x18\xcf\xd4\
+\xfd\x13\xe9O\xbek\xd6~\xec\xee\x92\xdd\xd8l\xe2k\
+,\xa8\xd0:\xe8\xc6$\x06Sgp\x84\xb3K\xf4\xfe\
+\x90\xa2J_\xe4\x0b\xa2\x09\x16\x91\x22\x9e\x1c\x8bu5\
+$A\x22\x0f\xff\x98|\x04d\x84DV=\x08\x939\
+S\xe79\xfc \xba\xf4\x957\xcbv\xedf\x8d+^\
+\xd2.D\x82b\x0b\xe4\xa2wp\x16\xcf\x05~\xf9.\
+;\x0d\xda\x16\x1e|\x8c\x0c8Gbp\xc4\x05\x99\xfc\
+s\xa3\x05\x9b\xc0\xc8\xb9U\xe2\xba\xc2NRB\x96`\
+\x81\xe0v\xba\xbd\x84\x8ev\xa3\x90\xf0\x05\xc9\xa4\x8d;\
+\x10EEPc4\xca\x11\x12\xc6\x08FCG\x11\x80\
+/]\xaa\xd8k\xdf[\x97\xb4n\x96TJ/\xdc\x1a\
+9\xdf\x1f\xbb\x7f\xc6^\xfa\xad#v\x13\x87\x80W\xae\
+\xd7q\xfb\xcc\xef\xf2\xf0V\x07FD\x09{\x22s\xdc\
+J\xd8\xc9\xc5\xba\xfd\xd4\xbb\xa6l\xef.\xbc\x91\x0a\xdd\
+\xdd[kD\xe6\x89\xd2p\x80\xe2yDz\xb3\xf6\xb2\
+We\xf7-\x9cG\xbb|\xa1\xb3\xf8\xe0\xa1h\x1a\xb1\
+8\x07\x9d!0\x92/(!8\xcb|-\xe50\x9c\
+\xf8\xe7W\x96\xec\xf1wN\xdb\xc4\xb0\x7f\xad\x9d=\x10\
+\xb1L\x1d-\x04\xe1\x89c\xb3\xf6\xc5?,\xd9\xdf|\
+\xe1\x82}\xfc?\x970\x1c\xb0\x802\xf4>\xe6\xe1P\
+\xcb>\xf6\xfeY\xfb\xe8\x07\x0e\xe9\x9c\xc0\x0e\xee\x9eZ\
+4\x01\xda\xed\xd2\xb5M3\x9e)\xf0\xf56\xedar\
+\xfb\x82\xbd\xe4\x0bt\xb6\xab\xcc\xdc\x19\xc9\xad\xffp\xf1\
+s\x00i<\xfd%\xc39\x0a&\xe0*$`|\x9a\
+;\x8f\xc3\xcc\x0b\xdf^\xb7\x9f\xfd\xf6\xb2\xfd\xf4\xa3s\
+r\xb4\xc0SN&\xc5\x800\x08\xf7\x1d\x18\xb3?\xf9\
+\x8d\xa3\xf6\xab\xef_\xb3o\xbe\xb1l\x17\x16\xcbV\xc3\
+ai\x04\x07\xa2w\xbfc\xda\x1e{h\xb7\x8d\xa3\xcc\
+\x11\xd6\xdd\xfbt\x02\xaf2\xda\xd2z\xdd\xbe\xfa\x9de\
+\x1b\xc5\x09\x9c\xa7G\xa6\xe8<\x9d\x95o\xcc\xbd!\xb1\
+W\x94@\xf7\x8c\x01\xf1\x0e\xea:\x09\x0a1\x80F\xf0\
+\x0c-\x01i\x1b\x06\xa2\x1dG\x10>\xfe\xafo\xd9\x03\
+\x87\xc6u_\xd0\x84\xa3\x05Z\x9aI\xd9 \xf0\xfb\xfc\
+w.L\xeaC\xa3\xf8a\xc8b\xd8\x18(\xf2G\x99\
+\x08C'\xf9>\xe3\xd9\x8b\xab\xf6\xb7\xaf\xad\xda\x83X\
++\xf8.@\xd6y\x9a\xe6u\x02\xf7\xeb\xf9\xd0\x1e\xda\
+\xa2^\xec\x02\x8c\x06\x052\x82*\x92\xa0\x82\x03\x8b!\
+U\xc2;\xc2a<\xe5}\xfdj\xd5>\xf9Y\xbc\x9e\
+^i\xc8\xf9f\xe8\x19\x17\xf6+\x1d\xca\x87\xc0\xb0\x87\
+\xe9(\x1f\x87\xe9\x9e\x039\x03G;\xc8\xd3\xcfy~\
+#\xbc\x89\xd1\xf2\xd9\x7f\xbf\x88\xe9\x837J\xb8\xc8\xba\
+\xc1\xc1\xd9\xd4\xae\x9d8\x1f\x9c\xa5s\xd8\x06\xf1\x9e=\
+\xbb\x82\x03\x22F0\xe6Y0\xba\x92\xa5S\xa8\x82\xc5\
+\x80\xef\xe6\xfd\xc5\xd7V\xec\x13\x9f~\xd3\xca\x98\x9b|\
+\xd8\xc9\xc7b\xfd\x92\x07\xc2\x83\xc1\x9d\x22\xd69j\xba\
+\x1d\x8f\xfa\xa4\x13\x01x\xf9\x1bW\xec\xcf^\x5c\xb4c\
+\xb8\x93\xa4^\x19\x8d 0\x0eY\xbbT&\xdd\x01d\
+FBS\xd0H\x82\xb7\x94C\xe0\x8b\xcd\xfaV\x06\x84\
+\x0d\x12%\xaa\x97C\xbd\x9b\x1e\xeb[X\x10\xde3U\
+\xb0?\xfe\xb7k\x9a\xbf\xbf\xfb\xa1\x05\xdd'\xc4g\x83\
+\xfd\x1c\x93U\xb7\xb9\x10\x9f\xa3\x85O\x99\xbeuf\xd9\
+\x9ey\xe1\xb4\x1d\x19\xc5\x97-4\x8f6\xd1>\x15{\
+\xed\x15%k7yC\xdd\xe50\x01\xd0\xf1|s4\
+_\xdbXF\xc1_\x1e\xee`\xa2@\x16\x84\x06\x07\xa0\
+n\xbe2\x82\xf0\xd8t\xc1\x9e{\xf1\x9a=\xfbW\xa7\
+\xec\xf4\xc5u\x19\x8e\x8e\xf3\xe1\x1e\x95\x13\xe36\x89\xd8\
+\x9c\x12Lr\xfe\xf4\x92}\xec\x93\xafYy\xadfC\
+\xd8Ju\x0e\xe0hE{\xb7\x1d\xee\x9c\x1a(\xee\xed\
+\xc1\xe6@H|j5\xb6\xf0fl\xd9\x0a#{\x1f\
+~\x8e\xef\xd2\xe7\x8b\xd8\x8c\x83b\x01\x07\xa3\xbb\x95d\
+\xeb@K\x00\xb9*\xdf\x83\xf7~_\xc2\x1d\xe0?~\
+\xed\xba\x1d\x1c\xc5W_s#62T\xd4\xf0\xe6\x9c\
+'$\x0dO\x97=Up\xf16\xcekN\x8d<\x16\
+<\xbeH\xf5\xe2+\x97\xecC\x7f~\xd26V\xaa\xb6\
+{\xa4\xa0g\x09>U\xa9\xd6\x91\xe4\xb4\x80=(R\
+B\xc4H\xcb\xf0Q\x1bu\xf0\xdd\xe8fu\xc9\x9a\x95\
++V(\xcd=\xf4\xdc0~f28:\x8d\x17\x08\
+u\x93Ji\xf2:\x88\x17T\xce*E\xab\x16\xb2,\
+\x1fW\xe6y<\xe0(a\x0d\xf8\xcb\x97\x97\xec\xec\xb9\
+e+\xe1~sr|\x10[\xd7\x80\x9c\xe3\x94\xe0\xc8\
+\xe8\xfc\x84\xf5\x00\xc42^y;\x09\xb9O|\xeau\
+\xfb\xed\x17\xbeg\x87\xf05\x03\xbfd\xe1\x83\x94\xff\xaf\
+\xf3\xd9\x9f\xcc4\xca\x17\xad\xdd\xd8\xb4\xdc\xec\xbb\x7f\xb3\
+=\xbe\xf7\xa8\xed~\xc7\x93p\x08\x01@Oe\x9db\
+0\xe8x\xa7\xf3p?;Z \x10#N~t\xa2\
+\xbe-\xba\x8c{\x80\x8b\xabM{\xf0\xe0\x90\xfd\xca\x89\
+)\xbb\xff\xf0\x84\xdd\xb3o\xcc\xe6gJ6\xc0W\xbc\
+\xc0G\xfe-<b\xbbxu\xd3\xce\x9e_\xb5\x97_\
+\xbda\x7f\xfd\xd5\x15\xb4\xb5\xed\xe1]E+\xc3q\xee\
+,\xb7r>ko\xb4\xa3\xc7^\xf9\xc0\xa9\x85C[\
+c\xc3\xaa+\xaf\xa1\x8c\x1f\x84\xe8gsh\xdc\xf3\xd0\
+\x07\x8d#\x81?3\xa1:%\x09u;\xdf\xdb\xf3t\
+\x22*\xa6\x1c\xcb\x0c#\xbf;\x18\x84#|:\xf4\x9d\
+\x15\xec6|\x19\x10\xd3\xe4n\xec\x1c\xf3\x18\xd2<\x17\
+l\xa0\xed\xcd\xf5\x86-\xaf\xe2]e\x04\xcc\xd0\xf60\
+\xbebC\x09;\x1e\x0c\x06\x16.\xca\xb2NE}\xea\
+.\xf1\xb8^2f\xf9 \xacz\xe4\xe7C\xcd\xfa\xfa\
+Ykn]F\x90\x07p\x12\xc4\xb0\xe3\xd0\xe7\xaf\xab\
+\xf8k\x0a=\xf5\xcc\xf4n\x0fX\xd7\x08I\x80\xb3F\
+\xb8V=\xf9\xa9\x83\xcey}bwQ\xa7\xdf:\xb0\
+k\x8d\xa6\xddX\xc6\x9b\x9el\x03\xef<\x06\xc3]3\
+xssWAs\x7f39\xe4\xc8z\x053kG\
+\xd4yg\xce#\x98\x9a\xfb+p~Qe\x06\x16\x0f\
+D\xd0\xdfX\x00\xb7\x96\xce\xdb\xda\xe5\x93\xf0\x7f \x89\
+XV\xa9z!\x13\x18\xfaH\xd9\xe4\xa3\xaaL\x92<\
+\xe9Q\x9e\xdb\x19\xb7\xcb\x0d\xf4(\x7f!\xc2\xa0\x0f\xe1\
+\x105\x8c\x9b\xaaA\xe4\x1cqj\xc79\x82\x8b\x9f\xcb\
+\x11\xdb\x9f'E\x9c\x04\x93z\x99B\xae\xf6\x8c\xbe,\
+\xdd\xdb\xe8<\x86~\xabj\x8d\x8d\xff\xa1 >>\xca\
+\xfd\xdc\x0a\xe1<\xde\x9b\xbd\xf9\xbf\xdf\xb0\x8d\xab\xa7U\
+\x8e\xa0\x02#x\x9f\x9eOxd\x8b\x1b\x15i\xcaA\
+O\x8c\xa1\xd2`${\x9e\xf3Zw\xb6\xb0\x8d\xf5\x84\
+\x8f\xe5\x84\x97d\xc7\x8d\xb2\xcaw\xa2\x0frn\x8b;\
+O\xb9\xfa\xdaY\x8c\xf6\x0d\x05C:\x80\xd3\xf1d\x93\
+\xef\x0d/\x9dyY\x0b\xdc\xe8\xdc}`\xae\xa1\x8c\xd9\
+\x98\xd8\xe0\x85\xe8$A\x99\xa2\x91\x91\x1e\xebI{\xe2\
+P'\xbf\x93A\xeb\xc2a\x9d\xa4,N\xc4\x0e\x0aS\
+\xbd\xe2u\xdc,\x8eV|\x82`\xd8ca\xb3\xda\xda\
+\x19k\xd5\xae\xa3\xce\xe7\x0d\x81\x1f\xa5L\x00H\xc4v\
+\x84\x17\x88\x19\x84\xc6\xd6\xaa\x8d\xef\xc3/I\xf0\x93\xb3\
+V\x03\x81\xe0p\x8crn]j\x04!\x03-k4\
+\x19\xe0\x0a\x1b\xbd=\xf2yC\x22\xa3\xaa\xc0#o\xc0\
+\xf3\x86\x84O\xea\xc5\xb7\x9d>\xbf\xcf\xa0\x18\xef\xb7\xe9\
+K\xb3\xbe\xea=\xdfX\xedq\x9e\x5c\x99\x00\xb0J\x15\
+8\x88\x0c\x0c\xda\xea\xc5oZe\xf5-\x9b\xd8\x7f\x1c\
+?>\xf4\xdf\x14\xb40\x1a\xf4\xcb\x12=\xdb\x22wp\
+\xcc-\x0b\x86:\x8e\xdb\xc9\x86\x94\x87\xfc\xfa\x17\xd9\xdb\
+\x9cDz/_*\xebr.,j\x07\x7fJg\x07\
+\xb2\x87\xd1\xe9\xf8Auc\xeb\x825\xca\x17\xd0\xcci\
+\xd0\xd9\xf3b\xc2\xa5+\x00$\xbb2\xfe\xcc\xb4\xb6q\
+\xdd\xae\xbf\xf1\xa2\x95&\x0f\xd8\xc8\xae\x05\x1b\x18\x9d\xf5\
+_ecT\xd0A=C`A\xdef\x8dDYP\
+\xcc\x9d\xce\x91\xc1\xe5\x8e\xff\xe2g\x8eJ\xc4\xe1\x8b\x8f\
+\xfe\x8dT\xc0E\xdde\xc4\xc5~\x91\x1c\x83\xa83\x01\
+\xc5\x09\x06>fm\xbcu\xd1\xc6\x91\xbe]_\xc7\xcf\
+\x00\x97\xac\x85\x95\xbe\xd5\xdcB@\xe0\x22\x1f\x9e\x90\xa9\
+O\xea\x13\x00\xe7\xe2\x90\xa70Ol\xd5\xd5KVY\
+9\x8f_Y\x0c\xe3\xd7\xe33\xfa\xb9\x09\x7fL-\xab\
+\x84\x9b\x01\xa71\xb2(js'\x13\x03\xe0q*\xe2\
+r\x8a_\x22\x13\xb0\x22\x0ea\x9c!f$\x84\x7f\xf2\
+\xe2\xa3\x91Y\xc5T\xdf@\x106\xc1\x17l\xd7h\x08\
+<\xc4\xe9\x93\xfe\x0f\x9b\x9dd$(@\xe7\x96\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00&\xb2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x90\
+eXIfMM\x00*\x00\x00\x00\x08\x00\x06\x01\x06\
+\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x01\x12\x00\x03\x00\x00\
+\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\x00\
+\x00V\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00^\x01(\
+\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\x00\x04\x00\x00\
+\x00\x01\x00\x00\x00f\x00\x00\x00\x00\x00\x00\x00H\x00\x00\
+\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x03\xa0\x01\x00\x03\
+\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x00@\
+\x00\x00\x00\x00\xfd\x0b\x92\x97\x00\x00\x00\x09pHYs\
+\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x03\
+HiTXtXML:com.ado\
+be.xmp\x00\x00\x00\x00\x00<x:xm\
+pmeta xmlns:x=\x22a\
+dobe:ns:meta/\x22 x\
+:xmptk=\x22XMP Core\
+ 6.0.0\x22>\x0a   <rdf\
+:RDF xmlns:rdf=\x22\
+http://www.w3.or\
+g/1999/02/22-rdf\
+-syntax-ns#\x22>\x0a  \
+    <rdf:Descrip\
+tion rdf:about=\x22\
+\x22\x0a            xm\
+lns:tiff=\x22http:/\
+/ns.adobe.com/ti\
+ff/1.0/\x22\x0a       \
+     xmlns:exif=\
+\x22http://ns.adobe\
+.com/exif/1.0/\x22>\
+\x0a         <tiff:\
+Compression>1</t\
+iff:Compression>\
+\x0a         <tiff:\
+ResolutionUnit>2\
+</tiff:Resolutio\
+nUnit>\x0a         \
+<tiff:XResolutio\
+n>72</tiff:XReso\
+lution>\x0a        \
+ <tiff:YResoluti\
+on>72</tiff:YRes\
+olution>\x0a       \
+  <tiff:Orientat\
+ion>1</tiff:Orie\
+ntation>\x0a       \
+  <tiff:Photomet\
+ricInterpretatio\
+n>2</tiff:Photom\
+etricInterpretat\
+ion>\x0a         <e\
+xif:PixelXDimens\
+ion>1024</exif:P\
+ixelXDimension>\x0a\
+         <exif:C\
+olorSpace>1</exi\
+f:ColorSpace>\x0a  \
+       <exif:Pix\
+elYDimension>102\
+4</exif:PixelYDi\
+mension>\x0a      <\
+/rdf:Description\
+>\x0a   </rdf:RDF>\x0a\
+</x:xmpmeta>\x0aN\xb9T\
+\x00\x00\x00\x228IDATx\x01\x9dz\x09\x94\x1d\
+Wy\xe6W\xf5\xf6\xd7o\xed}\x95Z\xea\x96[-\
+[\xb6\xbc\xc9\x96\x8dm\xc0\x06\x02vp\x08\x93\xc5\x09\
+\x93e\x02d\x9b9\x1efNr 3\xd9 !\x81\
+\x84\x9c\xe3sB\x16\xc89\x90\x04\x83\x03\x18B\x82\x81\
+a\x89\x8db\x9b`[F\xd6\xbe\xab7\xb5z\xdf\xdf\
+\xbe\xcd\xf7\xdd[\xd5\xfd$\x99\xc1g\xaa\xbb^\xdd\xba\
+\xf7\xd6\xbd\xff\xf7o\xf7\xbf\x7f\x953=~\xbe\x81\xa6\
+\xc3q\x9c\xe6;\x96\xafh\xc6\x95\xedM]\xbd\xa2i\
+o46\x9f\xfaQ\xfd\xf5\x98?\xa3fR\xff\x06\x9f\
+\xbf\xfa0}\xf8\xa3&\x91\xf8*]\xae~\xe45\xdd\
+\x07\xaf\xee\xb590'!)W4\xbf\x160\xafF\
+\xbc_\xd7\xfc\xbc\x01\xeb\x8d^\xf7@YN\x5c9\xa7\
+O\x80\xa9}\xf5&\xbf\xcb\xff\xd7\xf5\x1a\x06\x18\x89\x93\
+\xc5\x86\xe3MC\xea\xde\x001\xec\xb7Rhj\xfe\xa1\
+E=\xe3\x13\xaf\xb2\x1ew\xf9\xe3\x8a\xc1\xde$~{\
+\x9d\xedb\x86\xeem\x13\xe9\xf0\xfa4O\xb0)\xa4\xe6\
+\xcak\xca[\xa3\x5c\xd3\xd4T\x11l\x9a\xcd\xab\xbe\x16\
+\xbc\x1a\x0c\x91\xbc\x8a\x1eA\x22\x94k\x98\xa4~\xfe!\
+\x22\xd5+@\x04\xa1\xa0\x8b\x00\x11k\x8cj\xad\x81J\
+\xb5a\xaeU\xa1\xe5(\x01\x0e\x1ad\x9f`\xc0E8\
+\x04\xdb\x97\x03\xd4\xaau\xf6\x03\x99\xd2\x80+\x8e\xa97\
+/\xaf\x8d\x01\x9a\xefGQ\xc9y\xafE\xc1\xc7\x0c\xda\
+\xad\x09\xcd\xcc\xde\x8f\xaf\xce\xa6\xd3\xab\x88G\xc4\xea\xc9\
+p(`\x80\x14J5L\xcd\x1711W\xc4\x85\xd9\
+\x12\xc6\x16+\xb8\xb4^\xc3R\xbe\x8e\xd5\x0aAr\xae\
+\x04\xc1e#\x01t\xb7\x041\x90\x09b[g\x18\xdb\
+;#\xe8\xed\x08#\x9b\x0c\x22\x1atP\xa9\xd4\x0c3\
+D\xdb\xabL\xbbI\xa2\xd52Q\xf0\xff\x06\xef3'\
+h\xc1\xb23G\xbdrp+\x9d\xcd\x91Y\xf8a\x0e\
+J}\x8c\x94\x08=\x16\x0e\xa0V\x07A\x17p\xe8\xcc\
+\x1a\xbesj\x1d\x8fO\x94\x01\x826\x94\x87H\x5c\xc8\
+\xb5e\xce\x99\xe24\xe4\x03\x0a\x15\x0eR\xe2Y\xf0N\
+\xb6\x8dt\x07\xf1\xd0h\x0cw\xefM`\xef\xae\x16\xb4\
+\x939\x22\xb2T\xe6\x04<^\x8d\x11\xd6\xcf\xf8B\xb4\
+\xb8Lg\xfel\x0a\xcf\xab0L\xb84vNHy\
+X\x89\xfb\xc5\xad\xbbk\xed\xf0JF\x88quDB\
+A\xc3\x84S\x13k\xf8\xea\x8b\x8b\xf8\xc8\xe1u`\x83\
+\x84R\xaa\xfdQ\x17-\xd4\xf3:\xe7\x10\xa3b\x1c\x9c\
+,\xc0j\xcd\xc5x\x997\xbc\xa2A\xe6\xb1n\x88\x18\
+S\x8e\xd4\x1f\x98\xd9\x00\xc6\x978\xc6J\x03\xa3\xbbB\
+x\xcf\xfdi<pg\x06\xdbz\x22\xa8V\xab\xd4\x0a\
+\x014\x14\x1b\xe1\xd8\x92\x05\xea\xd3\xe8_\xfd\xb6\xab\xaf\
+\xce\x16\x03\xbc\x81\xc4\x08o\xd0k:\xfb\xb3\xb1A\x03\
+\xd7i\xc3\xb2\xcd0%zqz\x03\x9f}f\x1a\x1f\
+{\x81\xc0\x09\xb6\x9f\xaa\x1b\x0f\x00\xf9\xba\x83\x221H\
+\xbb:\xdc\x06\x96\x1a.\xe6r4\xf42AG\xabx\
+s\xb2\x8a\xf6\x08Y\xc3\xf6\xa5b\x10__\x8c\x00\x8b\
+\xe4B\xb0\x8e\x91L\x15\x19\x8eQ\xa9:X\xcd7p\
+~\x9c\x5ci\x0b\xe0/~&\x8b\xb7\xdf\xdf\x81\x8el\
+\x00\x85\x22\xebD\x0fOI\xf2G\x01V\xdf\xe6\xe3\x1a\
+\x06h\xa8&\x9c\xcd}5\xfa&o\x04Hv^\xa6\
+m>\xf5\xfc%\xbc\xe7\xab\xb3\xb4\x03\x07\xbb\xa8\xa6\xf4\
+q\x94.\x1f\xe5UD%\xf9\x1b&\x85\xe7ra\x04\
+BU\xfc\xd9\xe8,\xee\xde5\x86m\xdd\xe3H&\x96\
+\x11\x0c\xd7\x0c\xe1\xd5z\x04k\x856L\xcc\x0e\xe2\xd9\
+cC\xf8\x9f\xff\xdeE\xe9\xbb\xb8\xb9\xab\x822q\x86\
+\xc5t\xaa\xff+G\xaa\xb8\xf1\x960>\xfc\xeb\xbd\xb8\
+\xeb\xe64\xb5\xa5j\x9c\xaa+E\x12\x85\x22\xee5\x1e\
+\xce\x14M\xc0\x0a|\x93\x87\xe6\xd1Wg\x82e\x8eQ\
+\xe3p\x103\x8b9|\xf4\xc9\x0b\xf8\xf4\xa1\x0dl\xef\
+&8N\xbeH\xafFA\x9beN\x8c\xe8\xa4h\xcf\
+J\xc5i\xdb\x9f\xdcw\x11\x0f\xdf\xf2]t\xf4|\x05\
+\x88u\xd3\x17\x8cR\xd2\xbd<\xdb\xa854\x007l\
+\xb4\x07\x8dy\xa0x\x093\xd3\xbdx\xf2\xbbw\xe3\xbf\
+>\xd1\x87\xbe\xf6\x0a:\xa9\x15y\x9aL\x9a\xdc\x5c]\
+\xab\xe1\xf43\x15|\xe4\xb1n\xfc\xe7\x9f\xecE8X\
+\xa308\xb7\x05\xf3\x1a\xe1S\xa6W\x9b\xc0\xd6\x93\x1e\
+[\xae\x18P\xf6N\x1b\x8e\x06qzl\x09\xef\xfc\xbb\
+\xb3\x98^o`O6\x84\x99\xb2\x1c\x8f\xe1\xbfQ\xe7\
+\x1a\xcb\xdd\x04\x7f\xaa\xe4\xe0@ \x8f\xbf{\xd3\xd3\xd8\
+s\xdd\xa7\xa9\xf6\xbd\xa8E\xf7\xa2\x11\xed\x84\xe3FL\
+_\x87&\xe2\xb0\x7f\xc3\x8d\xa2\x11nG=\xd2\x0e'\
+H\x86:sd\xc4!\x1c~\xe5&\xbc\xfb\xaf\x0e\xe0\
+\xd0\xb2\x83\xdbi2kE\x07\x11\xf24AKz\xfe\
+\xa9\x22\xde\xf3?Z\xf1\x81\xdf\xdc\x81t\x9c~\xb4\x5c\
+\xdb\x5c2\xb7\xb0\xd8\xd2\xd6\x0a\xd1t?u\x91N\x90\
+ \xaf\xc0i\xda\xaf\xac\x91F\xd4I\xa8\xc0\x1f;;\
+\x8f\xfb>~\x86:\x19\xc4.:\xb8\x19r\x9e\xb4\x18\
+\x10\xb2\xe5:\x9db;\xcf3\xa5\x06\xde\x19^\xc6\xc7\
+\x1f\xfc,\xba\xb6=\x8fjd?\x9cD+\x81\x07\xe1\
+\x16W\x81\xb5K\xa8\xad\x5c@\x99\xc5\x1aW\x80\x00\x15\
+ \x94\xa4B\xb4\xb2\xd0\xfa&\xd4\xb2\xfb\xe9D;\xa9\
+YG0w\xb1\x81\xdf\xf8\x8b\x07\xf1\xe4\xb9 \xf6\xd3\
+7\xe4\x8a\x9a\x0fHSq\x9e\xfb~\x09\xef|G\x0a\
+\x1fy\xff\x082\x89\x065\xa1n\x82-\x0b\xd3\x03\xab\
+\x0b\x99\xac\xc3\xfa\x09\x95\x08\xfd\x873\xc0t\xd5\x8f9\
+\xc4\xbd0\x97\xb8S\x17\xe6q\xefcg\x10\x8a\x87\xd0\
+\xcb\xf5y\x99\xb6.\xf02vG\x1c\xe2\x99h\xd40\
+F\xa3\xbd\xaf\xb6\x8c\xc7\x1f\xfa\x07\xf4\x0d\x1eF5q\
++\xdcT\x0aN\xa5\x04gq\x02\xab\xe7\xa70\x7f\x82\
+<\x18\x0f\xa3L\xa7\xd7\xa0\xa6\xb8T\xedpk\x00\xe9\
+\xc1\x0a\xda\xaf\xcb#9\xc8q\x07\x1eB\xad\xe7\xcd\x0c\
+\x92\xc6\xb08\xbe\x8aG>\xf80\x8e\xcc\xbb\xe8\xa7\xe3\
+\x94_hp\xcdM\xc7\x1d<\xf7R\x11\xef\xfa\xa9V\
+|\xf8\xfd\xbb\x11\xa5\x9f\xa9y\xab\xaeG\x9a\xa5\x8fB\
+\xd4\xd2GJY\xf0\x98a\x18\xa0^\xcd\x07\xdb\xf9\xcf\
+\xc3\xfeJ\xa2\x8a\xd2\xa6g\x97q\xdfc\xa7\xb0\xd1\x08\
+`;\xd7s9::i;8\x07t\x09\xde\xe5\xfa\
+\x15\xa78/\xd0?\xbc\xfc\xe6\xa7p\xd3\xdeo\xa3\x96\
+\xbe\x01\x81L\x12n9\x8f\xd2\xe4\x18\xce\xfd[\x0e\x8b\
+\xcf\x02\x11J+\xdeI\xedi\xe18\x1c\xa8N3*\
+\xaf;(,\x84\x08\xc0E\xe7\x1dq\x0c\xdc\xbe\x88\xd0\
+u\xa3\xa8m{\x84\xcer\x1c\xe7\x8ef\xb1\xeb7_\
+\x8f[{*\xa8V,\x90\xba\xc7\x84g\xbfU\xc0\xff\
+\xfe`\x1f\x1e}\xf70\x97I\xc6\x1e\xa2_\x10<\xb0\
+\x22\xf5\xea\x83\xeb\x8d\x0e\x8f+\xf6\xc6\xdcZ\xfeX\xbb\
+V\xf5\xda\xda:>\xf2\xc4\x19l\xd0\x99\x0dSM\x17\
+\x18\xa6n\x81\xe7<ur\x83\xe0\xb3\xf52N.\xe5\
+\xf1\x89\x1d\x87\xb1{\xe0\xdb(\x87v\x1amq\xaby\
+\xe4\xc6.\xe1\xc8\xdf\xe7P\xbf\x5cG\xe7\x8d\xd4\xee\x0e\
+J<\xcd\x108\x16\x80\xab\x00\x89\xd1A\xadPEa\
+\xa6\x84\xb5\x09\x07s\xcf\x16QXLa\xb8v\x12\x11\
+\xe7\xf3\xa8\xf6\xbf\x1d\xc3\xbb\x8f\xe1K\x8f\xf6\xe1'\x7f\
+{\x08w\xdf^6\xf4\x88\x8eu\xc6\x1c\xf7>\x10\xc6\
+\x1f\xfd\xde8F\x87\x13x\xdb\x03\xdd\xc8\x17J\x1c\x91\
+\xce\xe2\xeaC\xf6\xec1\x85\x0c\xb0PM\x9fMn\xa9\
+\xa0>\xdc\x9c\x98\xddI\x05\xff\xf2\xdd\x8b\xf8\xfc\xb1\x0a\
+F{B\xb8\xcc\xa5(\xa0\xe7\xf8\xaf\x9eR}\x97:\
+\x17\xa9Up\xb2\x98\xc7\xeb\xeb3x`\xd7\xff\xa1C\
+k\xa1t\xe9\xcc\x18\xe7\x17\xe7\xd7p\xf8S\xab\x08,\
+p\xdd\xdf\xe3\x22\x92\xa1\x06d\xe8\xcc\xb8\x96\x87\xe8\xcd\
+\x02\xf1\x08\x5c\xfa\x137>\x80T5\x8d\x96\xa3\xcf#\
+\xdcR\xc1\xd2\xd9u\x8c\x85\x93\xd8\x199FFmg\
+0\xb1\x13o\xb9\xebY<|_\x0f\x8e\xce\x04\xd0\x1a\
+f\xd0$'Jb6r\x0d\xdc\xf9\xba0~\xfe7\
+\xce\xe0\xe5o\xa5\xb0} \x82\x12C\xf1kV\xb4&\
+\x8dhb\x8f\x00\xf14\x87,E;3\xdd\xd7p\xf2\
+\xece\xfc\xd67\x96\xb1\xa3#\x88y\x0e\x18b\xbd\xab\
+ \xc8\x03.\xf0\x0e\xc1'\xaaT\x8f\xa5u\xfc\xe2\xb6\
+\xb3\xc8ff\xe8\xe9\xb3p#th4\xa1\x89\x83\xeb\
+\x88\xceU\x90\xdeIis\x9d4k\xb6a.\x89\xe7\
+\xda\xe52\x98\x0aD\xc3t\x92.B\xbbnE\xf6\x9e\
+\x07\xd0s\xa0\x8e\xec\xae0VO\xe50w4\x0a\x5c\
+\xfe\x1e\xaa\x85\x1c\xe2\x99u\xfc\xca[/\xe2\xc2\xf7]\
+\xc4\xb9\xfc9\x1c_'\x096`CN\x19\x7f\xff\x99\
+\xb3&\x80\xba\x06\xbc\x87\xd0\xbf\xb8\xc2hN\xd6\x08\xee\
+\xe6=\x07\xab\x13\xe0\xda\xda\x1a\xfe\xe9\xe9K4R:\
+*\xaa\xb9\xa3IXoN\x03\xbc\x0a\x97\x81H\xb0R\
+\xc1j!\x8f\xbe\xfa\x12\xf6\xf5\xd0\xbb\x11w0Fo\
+\x1f\x09\x22G\x95n\x9c\x9aC\xebM\x94|\x8c\xda\x13\
+\x91\x0aZ\xcf_-\xd4i\xfb5\xd4+U\x8eOy\
+\xd4fy\xdd@\xa3\xe7&$n\xdc\x8e\xee\xfd!\x9a\
+\x0a0\xffJ\x0d\x85\xa9%\xb8\xebS\xe4X\x1a\xb7\xed\
+9\x81\x8e\x1b*(R\x1b-\x03H\x17\x99P*\xd6\
+p\xe0\xc6\x10\x1e{l\x06/\x1d\x9aG\x84\xf3\x1b-\
+\xf6\x117aTU\x93\x06l\xf5\xf0\xa5_\xa7#9\
+zj\x1a\x9f:Z\xc5\x10\x97\x9b\x0d\xc5\xde\x92\x1a\x19\
+\xa0Sv\xefx\xd2o\xa1\xf4/\xad\xe7\xf0sm\x8b\
+hO\x9cB#\x94\xa1Ti\x9d\x0c\x8b+s9J\
+\x921\xfe\x8e\x00\x12}\x8c\xf9[i\xfbI\x07\xc1(\
+\x03+v\x91\xa9i<1\x18\x0d\xc6\x06\x85sd`\
+\x12\xf5\xf6{\x90\xda]F\xfb\x8d1T\xb9'X>\
+K\x1aW\xa7\xd0\xa8\x86\xd0\xd5>\x89_\xd8\xbf\x82C\
+\xf3\x1c\xcb\xd5sb\x045\x8bg\x99\xb1\xf705\xed\
+sO\x9cG._\xa5\x83\xb5\x1b\xbdf\x84\x92\x80\xe6\
+\xb5\x0c0\xb6\xcff\xd2a\x94\x9f\x0d\xf2\xac\xab\xabk\
+\xf8\x1676 \x90\x1a\xef\x8d\xba\x08\xb8\xca\x86\x01\xd6\
+\x0c\x1c2*X\xa1\xfa\xe7\xf3\xb8\xb9c\x0e!J\xdf\
+\x092.\xe4\xca\xa1\x08A&\x92\xd8\xe6\x221\x10E\
+\x8a\x9cL\xed\xa4T\xfb\xb8\xcdm\xe7\xfe?E'\x18\
+\xa7\xa60\xbep\x94\x0c\x082\x18\xa2\x06\xa0\xca\xe0 \
+5\x04dw\x22{}\xc4\xac\x16+\xe7\x1dT\x17\xa9\
+!\xa5<5+\x87}\xd7\xad\xa0\xa6p$`\xa5\xef\
+3\xa1JA\xf5\xf5\x06\xf0\xf8\xe7Vp\xf2\xe4\x02B\
+\xa4\xdf0Y\x10\x89M\x1e\xc3?\xec*\xa0:\x03\xdd\
+\x5c\xd8\x89\xf3\x13\xd4\x85\xf1Y|\xeal\x1d\xfd\x5cg\
+\x8b\x04\xad\xc0\xc3\xd8\x1a\xbb\x19\x06\x88\xeb\xd2\x80*c\
+\xf52#\x13\xeeg\xb7e\x16\xb8\xeb\xd3\x14\xea\xccQ\
+\xdd\x16J,\x82`\x0b\x97\xd26\xaa\x91L\x89M\x0d\
+jR\x83L\xd4\xe12\xa0r\x22\xb4\xf1h\x8c\xd7\x04\
+\x19\x9eb\x1f.c\xa1N\xd4c\x83\x88t/\x1a&\
+L\x1f,\xa2\xb8\xb8\x81D\x89\x1b\xaex\x85\xe1\xf12\
+\x9f\x1e\xa0`D\x9b5+\xa3\x05\xac\xads\x03\x15\xa7\
+|\x0f\x1e\x9c\xc6\xbe\x9b:5\x8d\x07\xde\x94\xcc\xbd~\
+\xa8\x01F\xe6\x86(\xd1\xac;\xd9~!\x9f\xc3+\xa7\
+\x97\xb8\x15\x0b\x22,B\x0dxqZ\xe0u\x959p\
+b\xaam\x80\x0ep\xbe\x5c\xc6\x1d\xd1\x22212@\
+\xb8\xf8\xd3\xa0_\x90\x83+\xe5\xa2\xc8]\xa0y/\x97\
+\xcd3\x81x\x18A\xc6\xad\xa1\xf64\x82\x9d\xedp\xdb\
+\x18\x16\xa7\xdb\xe0\xc4\xb94\x84\xc8\x80 \x03\x03\x91\xe6\
+\xf0\x0cs\x9f\xc0\xfe\xa9\x1dd\x10s\x06\xc5U\xfeP\
+8\x1a\xbf%\x98\xd3D\xa4M\x0c\xb0\xeao\xe8b\xb9\
+Bg\xbd\xef\xe6\x00\xbe\xf1\xcf\x8b\x98\x9f\xcfyZ\xc0\
+\xee\xde!!\xe8\x08\x9a\xabw\xa3\x0aI\xa6\xc6<\xd4\
+\xd2\xd22^\xbe\xc0\x89\xb8\x94)u\xa5\x0d\x8e\x98 \
+N\xf9\x93\x992\x19\x10\xe2\xb9\xc2]\xe1p\xaa\x8cx\
+l\x91\xe6\x12b\x84F\xc7V$`\xee\x82\x96[\xa2\
+\x18{\x1f\xb5\xf9\x1d\x1b\x88eW\x91\xe8\x0a \x96\x09\
+\xf1\x0c\xd3\xd4\xc3T\xff\x10\x9c\x18\x99\xc2`\xc9i\xa1\
+\xee\x90\x01N\xa3\xc21\xf2\xd4\x98\x08\xef\x13\x88\xb4V\
+\x10Lq\x17] \x11\x8c4\xcd\xa9\xa4\x01W)\xeb\
+\x04\x8d\xc2Y\xe5\xf6h\x8dqo\xf0\xfc\x0f\xa8\xc9\x17\
+\x96\xd1\xdd\x9d\xa0\x96\x92v.\x0bj\xb6\x1d\xc9\x00{\
+\xa7\x1aa\xa3\xfcy\x96\xcb%\x5cf\xd4\xf7\xbd\x85\x00\
+\xfah\x965#q\xd3\x83\x93\xf1Y\xc3\x04=\xa0\xb2\
+\xb8H\x82\xe8\xc9;#%j\xf1\x06\xca\xa5\x18c{\
+22/\xbfP@\xcf\xf5a\x9c\xdb\x06\xcc\x9dc\xf8\
+\xba\xc2\xf1\x98\x1dr\x83Un\x08\x0bH\xb3\xbem\x80\
+\xa1\x7f?\x05=\x10Gt{\x0f\x02mT\xe7P+\
+\xc1K\x13(an\x9a\x82-\x5c\x1e\xb3rf\xda\x91\
+\xb2\x9dZW,(\x04\x12\x03<\xe9[\x12\x0dM*\
+\xea\xd1\x04\x91\x9e:\xb1\x84;\xee\xe83U\xbe/0\
+\x1c\xe00^$\xe8\x81'\x22-\x19\xa5R\x91\x0c\xd8\
+\xc0R)\x88\xa1P\xc3$4\xd8\xd7\x0c\xec_}\xf0\
+\x9a\x5c\xdb`\x1a;2\xcceD\xa9\xc14\x0a\xd4\xb8\
+\x1c\xd5+.\xca\x0b\xcbH\x0d\xf6c\xcfo\x0db\xe2\
+}c\x08\xbd%\x84\xcaF\x85LuL\xd6ge\x9a\
+Q\xe58Sc\x5c\x1d\x86\xf6\x95\x90\xad^FLc\
+j{\x1c\xa0\x089\x11\xe5\x06\x97\x9e\x9c\x0b\x03c\x05\
+\x92L\xe7J\x1d\xc7\xe2\x22\xfbp6\xb3\xfeK\x18\xfa\
+\xf3\x04$\xb4un\x9dwu\xb88sb\x1dE&\
+N\x94xUl#\x0cf\x5c2\x93\xa3I\xea\xa6F\
+Ev\xb0\xf6\x7fy\x81\xdb\xb3\x06\x03\x13O\xfd\xcdC\
+\x9b\x93h\x22\x99\x82\xc6Q\x8a[\x0c\xa0Zs}\x0f\
+\x92\x09\x11:\xba*AV\xe9\x17\x03\x1b+\xa8/g\
+\xb1\xfd\xfe\x9d\xa8\xbco\x06\xcb\xffZ\x84\xbb\x83\xe3r\
+\xe9r\xe9\xbd9<\xb14\x90_\xab\xe3\xf4\x0b.v\
+\x07i6\xa1Y\xe6\x16\xa3\x14|\x9b\x86\xe7\xa1\x1fJ\
+\x99\xc2\x08\xa5(S1`\x83\x1b\xaeKdP;\xe3\
+\x08JZ\x8am\x83\x9a-A\x897\xe9N\x07\x17\x8f\
+1\x0c\xdf(#\xdb\x1a\xa3sTg3\xa8\x90S{\
+\x05B\xf4\xf3*\xf5\x90\xfd\xe7\xb9\x9c\xcd\xaf\xb2BN\
+\x88\xa3\x9b\xfd\xba\xba\xa9\x8a\x0fY\xe0\xfe=\xc3W\x87\
+|d2#\xcaeL[\xdaX*\x82J\x809\xbb\
+\xb5\x22\x9d>}\xf1\xdc$w\x92Q\x0c\xfd\xd2\xbd\x98\
+\xdbv\x02\xcb\x07\xa7\xb8\xca\xf0y\xfa5m(*\xdc\
+\xd4\x04\x99(\xccq\xce\xc9\xd3\x0dD\xd3\x5cV\xb3\x0b\
+\x0c\x95\x17\xcd\xaa`V\x0b%Z\xc8\xb0H+\xd5\x80\
+\x91^a%\x8bC\xe7\xe2\x18\xed\xa8\x9b\x8d\x93|\x94\
+O\x9b\xe0\x19m w#\x14\xca\xd4\xcb\x15\xac\xaf\x17\
+\xd1\xda\x1e\x17\xf5\xe2\xe5\xe6a\x9c\xa0\x01\xc4Z\xc3\x00\
+:\xafB\xa1\x88U9X\x8dd4@\xc3\xd9\xe3\x0a\
+f\x98\x81\xa4\x01d\x14U6\x12\x89\x1b\x0d\xa81\xae\
+\x0f\xa7\xc3\xa8\xe6*\xa8\x17\x96i\xf7\xbc\x96\x8e\x22\xd2\
+?\x82\x9e\xb7\xecA\xc7-\xfd(N\xcc\xa3\xb4ZB\
+q)\x87\xfc\xec\x0a\xf2\xf4\x0d\xe2\xe3:\x13\xa0+3\
+L\xba\xf4\xe7\x10.\x93\x88 \x97\xc8:M\x86&E\
+\x7f\xc8\xed2=a#\x87\xd9\xd9~<\xfeb\x14\xaf\
+\x1f!\x03\xc8@\x1f<)1\xb4Z\xbf\xc0\xc7i:\
+9\xaaB>\xc7m\xb8 H\xd2J\x1b\x19\xda\xa9\x01\
+\xaa\x14p\xdd\xeb\xacy\x0cP\xc2!\xad\xce\xd2\x18^\
+4\x81\x1eV\x7fs\xaaN\xfa\xc9\xd3\x11\xe5\xdc\xcf\xba\
+\xa1\xa8Q\x1a-}\x8a\xeb\x83\x19.k\xf1\xbd\xa8L\
+Ma\xe5\xa5\x93p/\xbe\x84\xc4\xcenD\xfa\xfa\x91\
+\xb8\xae\x0b-\xb4\xb2\xd2\xc2*\xc2\x09\x06V\x13\x5c\xdb\
+y\x94X\x97_#=J}\xd7\xa9&\xb5\x22\xe3\x8c\
+\x12\x99Y5~1\x98R\xdag\x12'.\xdeEn\
+1\x90\x22bE \x0a\xb9D\x97a\x80h\xe2\xbd\xcb\
+_\xb9Im\xdcJ^\xf2TX\xad\xc0\xd9\xc0\x83\x94\
+7\x1dl\x14\x03\xca\x5c\xd3\xab\x0c$B\x02O\x0d\xb0\
+\x0c\xb0\xc0\xb7\x98\xc0I4\x91\x18\xa1x\x96\xa0\xeb\xdc\
+\x00\xd0\x85p\x85\x22\x00\x06GL\x02\xd0\x91\xb7r\xd9\
+\xbe\x88s\xdf\xa6\x83L\x86\x90<5\x83\xf4\xd0\x0cZ\
+\xfa\xe9\xd9\x93i\x0e\x17D$\xcd\x0c2\xb3\xbd\x92r\
+NA \x93\x89N\x98~\x82\xd1dC\x11f\xa5\xcc\
+\xacQ\x11\xd1\x81^\x06\x8a.\xaa3A\xfc\xdb\x0f:\
+\xd1;\xc87G\xa4S\xe0]\xd2b\xcd\xc0\xd2)\xba\
+,S\xe4\xa4\xc9G\xf2\xb2\xf9\x90l\xe5\x0a\xe87X\
+\xd2\xc1\xab\xd1\x041A19m\x9f&g\xed\xbf\x89\
+\x11\xe2\xaa\x01m\x18#\xae\xab\x86|\xa7W\xaf\x93\x08\
+1\xa0\xceTM\x9dD\x9b}*\x9bf\x17\xca8s\
+\x90+[\xb2N{w\xb1|&\x80%n\xad7.\
+\xd2<\x96V(\xed\x22M\x87\xcb\x1cc\x00\x0d\x15\x8c\
+\xd6\xd9\x97\xcb\x89\xb6\x8c\xc55J\x9c\xcf\xd1,c\x03\
+\xdc\x15\xd5V0>1\x8a\x8f}+\x81\xd16\xf9,\
+\x0b|S\x03H\xb3$.\xd0b\x88\xea\xb5\xd6\x1b?\
+m\x80\x1a\xa8\x86KB\xce\x19X\xa1\x93?\xbaj\x99\
+\x90\xd3\x09:b\x02\xfb\xb1\xd2pV\xd26\x8c\xd0\xbd\
+'}\x826f@\x16\x98\x115\x8e\x18\xc0\x9c\x9c\xd2\
+\xd7\xf5<\xf7\x11\xach\xe9\xe95c\xe7K\xdc\xbef\
+\xb9J\x90p1\xab\xb8\x5cgh[1\xcb\xa2\xbc3\
+y\xca\x8d\x8c\x83\xb6\x9d\xd4\xbe\xb6VJ\x9f+B\x99\
+q\xc5*w\x9cIF\x8eY\xc6\x05\xcc#>s\x88\
+;\xabZ\x90\xc0\x0c\xeb\x0d\x08\x03\x96\xb4[m\xb0\xc0\
+\xfc2w\x17\x082\x9e1 y1\x87\xc0\xf2\xf4\x22\
+A\xef\x8e\x17\x03\x85?1\x06*u\xaa\xb2\xc3\x91\xc5\
+\x04\x1d\xe2\xa2\x91\xbe\x9e\xe4d\xa6\xaf\xf7\x8c4\xc0\xd4\
+\x88\x01\xdc7\xd4\xdc*\x97+Fs\xcb\xd3h\x1d\xc8\
+\xa2\xeb\x01\x86\xc4t\x86\xc1\x11\xbe3\xa4\xa4\xb5\xaek\
+\x98:7.\x0a\x9a\xa4\xe9s\xe3\xccw\x0c\xd7\xd0\xb5\
+o'\xf3\x02i\xd4W\xe7\xe1\x94*(\xcd/!\xb2\
+s\x17\x97\x7f:\xbf\xf1Q\xfc\xe57:q\x0f\x9d_\
+\x85a\xba\x914i\xb3\x1ap\xa56\x18\xfa\xc8\xd5\x16\
+\xb6Fc!#\x5c\x03\x84\x13\x1bH\xfc\xe1s\xa6\xe8\
+i\x00\xcbD\x19\xa4\xe7m\x890\xb1([\x94X\xa4\
+\xee\xfe)\xe0\xe6dW\xb5\xe9y\xfeK[\xaa\x04n\
+n\xa9A\x0d.\xa7\x8d\x0a\x95qc\x0e\x8d\x95\xcb|\
+5\x16AL\xfb\x1c\x82\x0f%l\x16\xc8\xd5\xeb\xb4b\
+\x03\xb9\xd9*\x16&\xab\xe8\xdc[\xc3\xc8\xdb\x86\x10\xec\
+\xeeG}\x83N\xb1\xb0\x86\xca\x12\xbdbK\x0b\xc2\x9d\
+T\x9d\xe53\xf8\xfas\xfbpx*\xc2}\x80e\xa0\
+\x11\x08\xe7\xf7\xd5\xddH]\x0ca\x9d\x98\xa3\xfdC\x96\
+\x89\xd6\x16f\xa6\x14\xe4Y3g\xbdh\xe6a\x9c\xa0\
+)\x8b]<\x14\xd4\x84\xb8\x9fM3\x1de2=\x02\
++\xd5g\x9bBP\xaf\x9b\xbd\xf2As\xcfv\xa9\xba\
+\x9c\x97\x18\xa0J\xbd/\xd4\x92\xe02A\xbaz|\x1a\
+-\xb4\xf3\xb6Q\xday2@B\x98\xfch\x94\x10\xd0\
+\x8a\x96\xe2Fgg;z{R\xcc\x80g\x99G`\
+\xb0\xb2\xbe\x8c\xfa\xd2e\xa3\xe6\xe5uJ\x7f\xe4F\x04\
+\xcas\xb8x\xfcv\xfc\xb7/\xf5\xe2\x8d\xa3t\x0be\
+j\x12\xe9\x919\xfaZ`\xccU\x18,\x09`\xe0\x87\
+\xcaJ\x1d\xdd\xb7\x86\x11O\x90\x01\x14\xd0\xd5\xc7\xd6*\
+`DG\x1b\xa2\xe3\x09sk\x9a\xe2\xd2\x94\x80\xb24\
+Z\x87\xc9\x04Nf\xd1\xb1lF\xf1\xae$\xc0\xd8\x85\
+\x18\xc0\xfd\x80\x8e\x00\xd3[\x0e\xc1\x07\x22!\x94\x98 \
+]=\x96C'wf-=\x16|\xb4\xb7\x0d1f\
+z\xddT7\xfb)\xa9\x22\xd7_f\xccPDca\
+\x1a\xb5\xd5\x05\xd6G\x19H-#40d\x92\xaa\x95\
+\x8b3\xf8\x9b\xaf=\xc4\xf7\x12!J\x8d\xe3\x90\x0a9\
+\xe9Mg\xc7\xb2\x05n\xeb\xc5\x0c\x06\xa4\xc8M\xd6\xd0\
+\xff\x13)\xc4h\x02fOC\xfa\xccR(<T\x03\
+i\x8a\x07L\x05\x0eB\x06D\x22LZ0c\xd3\x19\
++\xd2\xceXg\xb4@\x9a\xa0\x93x\xcd\xc9'u/\
+\xc6\xf1J\xf6\xa2F\x06h<%7\x94\x0d\x0a\xa6\xb2\
+(\xe6\xa4\xf2\xf4)]\x0c\x8f\xd9\x9a\xd8\xd9\x85\xe4\xee\
+\xed\x08\xa4\xb99\x09wr\x05\xa0\xa0\x97\x97\xb9\xb4M\
+\xa16}\x1e\x95\xc5\x05\x0e\x10g\x08@\x7f\xd1\xde\xc5\
+\x8d\x11\xb7\xc9s/\xe2\xeb\x07\x1f\xc4G\xbf\xd9\x86\xdb\
+\xb8Q\xaa2e\x1e \x83\xa5\x8f6\xe0\x91\xf3\x13\x9d\
+\x04MzL\x99\xf7\x0a\x82\x18Bapw\x8a\xcc\xa0\
+q\x88N\xef\xf0M\xc1\xf8\x00U\xfb\xa7\x82\x98hL\
+\x0c\x88\xa3'\x93\xa3\xaaY\xc7\xe2\xfb\x01\x03\xd6\x80\xb6\
+\x8c\xd0\xbdMl0\x82\xcc\x93\x01dN@\x09\x0e:\
+\xc1\x06\x91Gz\xba\xc9\x0c\xaa,\x1d]r\xb0\x95\x8c\
+\xc8\x90W\x5c\x98r\x94\xf2\xfa\x05F=\x93\x14\xd3\x1c\
+m~\x8d\xf5\x04\x96\xe4\x9b#\xe6\xf1\x02\x994\xdc\xf6\
+N\x04\x97\x8e\xe3\xc4\xa1\xd7\xe1\xe1\x7f\x1c\xc6\xfd\xd7\x07\
+P2\x8e\x8f\xe0\x0dX\x82&\x13\x04X\xda\xe03A\
+\x023\x8c\xa0\x13\x8f\xb3}\xfb0MK\x00\xbd\xc3\x16\
+\xed\xaf5\x01\x95\xbd\x0e\xf2\x01\xd1H\x04\x89D\x12\xbd\
+\x9dS8<\xc6\x08Bj.\xeeyjc\xb9%5\
+\xd0s\x5c\xd2LE\x15+\x0c}\xb5\xfc\x87\xe8\xa0\x1a\
+5\xaa\xf0\xc2\x1c\xc3\xdfAt\xde\xcfw\x81\xb9E\x84\
+3q\xb3n;.;9y\x0e+\xaf\x98a\x22\x84\
+a.7A\x0a{\xe99\xcd<\x0d\xbe\x1b\x0c.\x8f\
+a\xf6d7\xfe\xfb\xe7\xf6\xe3\xe6\x1en\x8e\x184\x11\
+*\xc1y\x11\x1eI\xf2\xa5\xdd|\x15Y\x01\xd2P\x9a\
+\xaac\xe8'\xe2\xe8\xa4\x7f\xd1\xe76\xa2W\x927\x87\
+\xc1\xa2e\xd0\xdc\xebG6\xcd\x1el\x880\x95\x9dL\
+e\xd0\xd16\x89\x9ed\x0e\xcb\x85\x14\xd3\x82\x92\xae\xed\
+gG\xd0#\xf6^\xb1C\x84\xb6\xbc\xb0\xc1\x90\xb3\xc0\
+\xa8\x8e\xf7\x0a\x8b+\xcb\x97\xa8\xca5\xee\x0b\x12|\x96\
+\x91\x1e\x03$G_\x87\xf0\xdd\xa0\x13 A\x22_{\
+\x5c%@j\x8c\xfb\x95V\xa7M\xe8\x99\xc0\xd2$_\
+\x9f\xd5\xf1\xfb_\xb8\x1f/\xe5\x93\xd8\xcfh\xb1Z\xa5\
+Y\x91>m\xbfM\xe4\xc7\x11ly\xcb\x04\x0c#H\
+\x96\xf2\x92k\x0b\x15\xdc\xf8\x86^D\x99Q\x12\x03\x02\
+\xdaEz\x87\xcf\x88\xad\x1a\xd3 &\x90\x1e.O\xa9\
+t\x1a\xd9l\x0a;\xfa\x96Q\xa0\xfajy\xd1\xffV\
+\xee\x8d\x1duO\x1c\x5c\xf5\xd0\xcb\xc2\x04\xf3\x98\xf9\x8d\
+4\xfbp\xab\x1b\xe5\x8b\x8eH\x8a\xb9\xcdy\x14.]\
+Dy\xa3\xc4\xe0\x88\xd2\xf5=\xb1\xb6\x8d\xdaD\xe9\x0c\
+\xd0F\x5c%Q\xe9\xdc\xd8\xee.N\x22w~\x0d\x1f\
+~\xf2!\xfc\xedX;_\x86\x86\xf8\x1e\x90f!\xc7\
+J\xe9\x8bh9?S&\x0d2\x03\xdf!\x1aS\x10\
+\x08n\x102\xdd.F\xf6\xd1\xcfHP\xcd\xd2g\xb3\
+\x7fp,\xbbt\x19a\x1a\xf8\x1c\x90\x5cN$Z\xc8\
+\x80v\x0c\xf4\x14\xd1\x1e\xdf \xf7ew\x1ch\xf3\xe4\
+\x10^Y\x0cH\xd1\x03=\xbb\xe4`i9c#8\
+\x9aQ\x88\x92WH\x1b`\x96Dk\xbe\xc3p\xcc\x9e\
+\x04O-0&U\xa3\xd4\xf9\xdaL\xc9\x83\x1as\x07\
+\xee\xecE\xe4/\xac\xe2O\xbf\xf4\x0e|\xf4x\x0f\xde\
+\xdc\x11b\xee\x9f\x9e\x9f\xfb\x8d\x00\x93.\x16\xac\xa7\x05\
+$A\x8cP4\xb7\xa5\x15L\x9c0\xdd\xbeq\xa2\x82\
+\xdb\xde\xdb\x81\xb6\xce\xa4\x91\xbex\xc2n\x86\x19\x96l\
+\xdd\x91\x0c{\xe1\xafz\xb0\x8b\x96/\x9dQJ\xb0\xad\
+\xbd\x1d\x1d\x1di\xec\xde1\xcf\xcc\x16\x1d\x8b\xfa\x10\xac\
+\xd1\x02\x99\x83q\x80v\xd0\xb0\xbc_\xc1\xc1\xe4L\x86\
+R_\xa4\x0f\xa0$\xe3\xdc\x1e\xf3\x8dp(\x9dD0\
+AF\xf0\xded\x7fi\xdf\x92\xbcbG\xd9\xbcSY\
+\xe3\xd27\x8b\xc0\xec9\xac\x9d\xad\xe2\x83O<\x8c?\
+>\xda\x8b7\xf1\xa3\x8bb%\x8c\x90\x01\xef;;{\
+5\x1e\x9f#4;?\xb3\x07\x90\xa4)\xfd\xe46\x07\
+7\xdf\xdbK\x82E\xb4=\xf5\xbb\x89WerB\xda\
+d\x0e5\x1a\x89\xb0\xa0\x95@\xd1`6\x9bFGg\
+/\x06\x07*\x18h[fZI\x12 P\x81\xd7H\
+\xda\x0b\xe81\x96\x95\xe2\xa2\x1a\xe0\x85\x89V\xe4g\x18\
+\xa6\xf2%\x89&v\xe2\x94~K\x8a'\x13\x9e\x0a\x05\
+\xc365\xae\xa4f\xa3\xc2\xf5\x9f+@uq\x1a\xa1\
+\xf9\xb3\x98;\x93\xc4o?\xfec\xf8\xb3s}x\x80\
+N\xaf\xc0tz\x88[mn\xb4\xedi\x9c\x9f\x95\xbe\
+5\x01\xa9\xbf5\x05\xdd\xcb/\x84\x99\xc2\xcf\x9d\xac\xe0\
+\xeeG\xbb\xd0\xde\xcd\xf4\xba\x04f\x1c\x9e\x85\xcenW\
+\x1c\x86\x01jjnV\x82#@\x9b\xd4r\xd8\xc9\xb4\
+uGg'n\xd8=\xcft\xb8\x9c\x945\x05\x13\x0e\
+\x1b\x09\xda\x87K\xac\x1fM\xba\xf8\xd3\xc3\x19\x9c\x1f\x1b\
+F\xf5\xd2\x0471\x0cg\x19\x01\x9a7>\x86\x08\xf5\
+e\xb0T\xe68\xf9%4VgP\x99\x9fAh\xf6\
+,.\x1c\xdd\x86_\xf9\xd4\x1b\xf0\xc9\xd9n\xdc\xdf\x11\
+3\xe0\xc3\x8e>\xbb\xb1\x7fb\xbdUs\x01\xb6\xa0-\
+x\xcb\x04iD\x90\xd9\x9f\xd2\x0f\xea\xd8\xf9\xd3Q\xec\
+=@\xe9\x8bV\x0f\xbc\xc1(\xdd\xbf\xea\xb0Ya\xbf\
+\x9eW\xc9\xb4!\x91\xf2\xc1\x10\xb5 \xc3\xf5\xb8\xbb\xbb\
+\x97\xfb\xf4u\xec\xdb3\x8d\xef\x1f\xde\xce(\x91\x12\xd7\
+F\xc9\x0c\xc6\xab\x9e\x97t\x94\x18\x09G\xf0\xf1\xe7w\
+\xe1C\xc9\xcb\xc8T&P\xe1Z\x1ef\x18\xea2*\
+t\xe5\x85\xd9\xb7\xce\xcd\xb9\x1c\xa2\xc3\xacKpm\x01\
+\x87\x8e\xdf\x80\x9f\xfb\xcc>\xcc%\xda\xf0\xfa\x8c\x07\x9e\
+\xc1\x83@\xdb?O\xd5\x8d\x06XI7K\xde\xc4\x04\
+\xb2O\xaa~\xb0\xbf\x8e\xd7=\xd2\x87x\x0b5\x8d\x18\
+|\xbe\x1bY\xb1\x8b\x04'r\x85T\xffZxE\xbd\
+\xadb\x85\x0e\xd9\xb8>\x7fk0*\x8c\xc6\xa2\xe8\xea\
+\xea\xc0\xc6\xfa\x06?I;\x8f\x8d\x8di\x9c8\xdb\xeb\
+1\xc1\xf6\x17x)f\x89I\xd4\x1bR!|\xe6t\
+\x06\xf1\xd0=x\xf4\xc0\x11t/M\xa3\xcc\xef\xe5\x9c\
+(\xd7q:B\x97\xd4j\x8f\x11\xe0\xc7\x12\xf9\x958\
+\xbes\xe2.\xfc\xec\x93C\xb8n0\x8b\xbdL\xa9\x95\
+\x18?\x84\x1d\xe6\x16\xcd\x9f\xf5\xfa\xbe\x83\xf3\xd5|\xd3\
+\xee\x0d\xad\xd4\x06\xd2*z\x0bg*x\xe3_\xb5\xa3\
+\xab\x8f\x1b'i\x0c\xeb\x0cJ\x8f\xccM&4\xdd\xcb\
+\x15\xdb>\x86\x07\xfa\xd1\xbd\xa4\xabA\xad)hE\xe8\
+\xed\xeff\xae\xb0\x80=\xa3\x93\xcc\x18\xcd\xf2\xb5Y\x17\
+\x12-L}\x9b\xf0_\x9c\xe6;>J-W\x8d\xe2\
+\x86\xae\x1a>q*\x8b\xe7gn\xc3\xfb\xf7\xcf\xe0\xa6\
+\xaei$\xa3\xfc\x1c\x8e\xdb\xd9:_~\xe6\xcbI\x9c\
+_\xd8\x89'\x8e\xf6\xe1\x1f\x8fw\xe1\xb6\x91\x14\xdb\xe2\
+\xfc\xbc.J\x9b'x9=\xc9\xdeH\xdcsz\xa4\
+\xacy\xe3#\x0d\x90\xe4I\xa2\xd9Z\x17\x8fUq\xdb\
+\x87\x12\x18\xbe\x81\xdf\x14\x91\x8e\x80\x1a\x84\xe5\xea\xc3\x83\
+\xe8\x0b\xddj\x80\x07\xde\x5c\xfc\xc7\xa4>\xe2,\xd56\
+\x14\x0a\xf1}\x7f\x06\xfdLIU\x98\xce\xdd{\xfd\xb4\
+\x01>y\xa9\x13\xf18\x13\x195\xab\x01\x01\xae\xe7\xe9\
+d\x0c\xab\xebU\xec\xe1\x1b\xad\xd9J\x02\xef\xfa\xd2 \
+\x06\x19\x0e\xdf\xdbU@\x8a\xdf\xeel\xf0\x03\xc9\xc3\xfc\
+\x18\xf2\xf0\x14s{\xbd\x09\x1c\xd8\x9dd\xbc\xae\x17 \
+Q\xbeUb2\x95c\x08\xbe\xbe\x19rL\xbaK\x0c\
+hb\x02\xcbV\xae\xa2MLqQ\x22\xf8\xeb\x7f'\
+\x84=wt!B'\x1b\x92\xa6\x19\xe9o\xa9\xbbY\
+q<f\x18\xe35\xfe\x80\xce\xde\xf7\x0b>x\xcb\x19\
+M\xe1i\x81\x1c\x22ss\x11\xae\xeb\x1d\x1d\xed\x8c\x07\
+$\xf5\x06nl\xcc\x91\xb0yL^j\xe3\x92i\xb9\
+]\xe7\xce\xf10\x89\xd95\x18\xa598\xc8\x04+\xe8\
+\xdd\x11\xe0k\xb3 \xfea\x826\xc9\xed\xb2\x8cn{\
+K\x08\xb7\x0d\xc7L(\x5cn\x90`~\x1e'\xe0\xe7\
+\x0eU0Nv\xc8\xee\xefM\xc4\x90\x1db\xdc\xa0\xcd\
+\x18\xc91f\xc0\xab\x91:Y\xa0W\xde\x0e\xf7)\x15\
+&;w\xffN\x00\xd7\x1f`\x92\x95+N\x98Q\xac\
+\x89\xf8\x8c\xf1[fy\xb8\xb7.\x06\xac0\x1ar\xb6\
+\xea=W`*L\xb3&\xe4@fU\xa0C\x8ci\
+U\xa0?\xd0\xcbS\xad\xa1\xf5\xda\x1a\xd5u\x15\x93\xd3\
+\xcc\xb9p\xef\x99L\xc5\xf0\x87\xbf{+\xfe\xf9\xcb'\
+\x99\x87\xe7w\x00t~U\xbe\xc2j\xe1K\x90[\x92\
+\xcc\xfc0U\x16\xe1N\xb1P\xa0\x83\x8b\xb7\xd0\x9b3\
+Z\xa4\xdf\x083*l0\xd0\xfa\xf5\xdf\xdb\x89\xbe>\
+&R\xa9u/\x7f\xef2N}{\x05\xa9.fr\
+\xf8ey\x88\x1e\xbe\xc1O`B|E\xe6\xe8\x9d\x0d\
+\xa3S\xa4\xea\x18\xfd\x99\x08FniC:\x956\xb1\
+KP_[I{\x89\xc2\xf0@%I\x997\x06\xb7\
+\xeaM\xc9 \xb4\x09\x11#u\xd3\xaa\x1f5luu\
+\xe4\x0f\xf8\xb0\xb1)2\xa1\x85\xc1LW\x17\xdf\xe6\xea\
+\xcfa\xd2\x82\x81L\x9cD}\xf1\xa92\xfe\xe0w\x07\
+\xf1\xbf>\xf06j\xc9\x17\xf1\xa1?9\xcaq\xb8\x08\
+\x9bS\x1aRA?\xdf\xccL-\xf1;\xa3\xfe$^\
+8\x0f\x0cR\xae]\xc3d\x06\xed\xf5\xf2\x99*\x1e\xf9\
+\xf2\x9d\x18\xbf\xb8@\x06\xe9-N\x84~\xa6\x88\x9e\xf1\
+\x1a\xda\xae\x0bc\xf1X\x19\xbdw\xc7\xb0\xf4\x5c\x19\x99\
+\x91\x10\xc2\xbd.v\x1c\xe0\xcb\x96\xebS&^\x89\xc7\
+c&v\x91\xd9\xea\xcfG\xc2\x89yl\x81\xbf\xaa\xc1\
+_\x05L\x1f\x82\xb1\x5ca\x7f[6\xcePk)\xd3\
+\x0fd\x82q\x8adB\xbc\x85L\xe8\xee4\xfe\x81\x19\
+\x0c28\x88\xe1t\x05w\xee\x1f\xc0\xbf?{\x12\xf7\
+\xde\xb3\x1b\xf8\x93\xb3x\xfa\x9bo\xe72\x1ag:*\
+\x8aO\x7f\xfa\x19tsW\xf6\x86\xfbn \xa1!\x9c\
+81\x85g\x9e>\x8f_\xfc\xa5;\xb9\x83\xac\xe1\xab\
+_>\xc6\x15\xa6\x88\xc3/O\xe1\xe2\xe9e\x8c\x1f\xc9\
+\xe1\xaf\xbf\xf1F\xb4\xb7'p\xe2\xc8e\xda\xb5\x8b\xc1\
+\xa1\x0eL\x8d/\xe2\xcb\x1f;\x8em\xb7$\xd0?D\
+3iK\xd2\x0f1\xe2$]\xf2W\x02/\x01n1\
+aK\x98l \x0e\xfd\xea\xb0\xf5\x12\x8d=\xcc\xbd\x9c\
+\x86q\x11\xa6\xce\xef+\xf0\x9b\x0c\xe0$\x9aL\x1c\x97\
+O\xd86\xd8\x81V:\xbc\x1f\x7f$\x83\x91\x91\x1e\x8c\
+\x91\xc0\xdd#}\xb8\xf3\xd6^\x0c\x0ct\xe1\xb9\xe7\xa6\
+\xf0\x85/\x1c\xc1O\xfd\xa7\xbb0\xb2k\x80\xcbi\x05\
+\xbf\xfa\x0b_\xe3j2\x80\xb7\xfc\xd8\x1ed\xd2-\x98\
+\xbe\xb4\x8c\xa91\xbe\x09b\x1e\xe1Mo\x1d\xc5#\xff\
+\xe5\x16t\x0d\xc514\xdc\x85\x17\x9e\x1b\xe3\x97*E\
+\xdc~\xf7\x10\xce\x9c\x9c\xe1u\x18\xf7\xbc\xab\x0f\xad=\
+A\xb4\xf7$\xc9\x5c\xfa\x10\xbd\x92#]\xda\xc3\x88\xce\
+M\x94\xc4\xe4\xc3\xf7\x0b\x9b\xf7\x1el\xfb>\xd1\xab\xd5\
+\xc5\xf2\xcfk5w\xb6\xf2j&\x04hk\xda/t\
+t\xb6\xd2/\xc4\xf0\xd6\x07G\xccl\x1d\xfc\x0aD\xf9\
+\xc0\xf7\xbew\x88\x1fX\xe517\x97\xe7\xfb\xf9<\x09\
+\xa4g\xa7\xc7^e\xdd\xc1W\xd6\xcd\x0as\x99\x9f\xd8\
+\x7f\xf1\xf3\x871\xba\xa7\x1fo\xff\xe9\xddL\x9aT\xf1\
+\xc9\xc7^\xc4\xaf\xdd\xfb4\xd6\x17\xf8at\xae\x8c\xcf\
+>z\x9a\x9a\xc7\xac1\xbf?X\xe5\x17h\xa7OL\
+\x22\xc2\x95\xa7g{\x82;\xd6\x187>tz4\xa1\
+f\xe0V\x0b\xc4\x08\x8b\xc7Gc|\x01\xfd\x81\x5c\x82\
+N\x1d\xce\x99\xe3GUe\xef\xf4\xdbT\xd4\x8d\xb9\xe5\
+\x8f\x9c\x9eq|\x04g>\xa2`0Sa\xbeL\xe7\
+\xdc\xdc\x12\xa5?\x82\xffx\xee\x04>\xf1\xc7\xcf\xe2\xdd\
+\x1f\xb8\x1b#\xa3\xfcx\x99\xd2\x95\xa6hI\xfa\xdaS\
+G\x19Q&q\xe0\xc00\xd6\xd6K\xb84\xb9\x80\x97\
+\x0fM\xe0\x0d\xf7\xef6\x00\xfe\xe3{\xe7p\xdb\xfe\x1d\
+h\xe5\xcbO\xe5\x17\x0e~\xe7$v_\xdf\x8d\xaf|\
+\xee\x106\x96\x8b\xf8\xe5G\xefadJ\x7f\xc1\xad\xdf\
+\xd8\x85\x09\xb3\xcbk\xe1\x92\xab%O\xcc\xb5\x0c  \
+i\xc1&\x1ai\x84\x85\xb4U\xb7\xd9\xc8\x02\xdb\xcf\x1c\
+?\xe23\xa3\x09\xbc`\xeb\x11\xcb-=\xe23\xc0\xbf\
+j%0\xaf\xd1\xc8\x80\xdcF\x1eK\x8b+&Z,\
+\x95\xcaX[)P\xfa\x15\xfc\xf2\xbb\xdf\x89\xef|\xf3\
+\x05:\xb6E\xbcxp\x09\xbf\xff\xe7\x0fbe%\x87\
+\xafP\xea\x0a\xa0\x0a\x1bUt\x0f\xc8y\xb9\x988\xbb\
+\x8a6jR\x94\x9f\xd6\x05\x99\xcd\xa91'\xa8HN\
+\xc9\xcc\x10\xbf!\x8e\xc5]\xa6\xb6:\xf8\xb9,?\x8e\
+lg\x06\x99\xcb\xa4]\xef\xa9\xfar|B\xaa\xc3\xbf\
+\xaa\xe8\xb3\xc2o2\x1d\xae\xfc\xf1^\x8c\xf8\x95W\x88\
+\x7fS\x19\x8c\x1ep\x10;\x8e\xf7\xcb\x89l\xa4(\x9f\
+\x10@&\x9bD\x9a\x9f\xb8(ZLg\x0a\xb4\xdbu\
+\xcc\xcc\x5c\xa6\xba\xf2\xcb\xd0\xce:\xde\xf8\xe3I~\xd0\
+0K5\xe7w\xff\xfc\xce7\x9dQ\x96\x88\xaf\xd1\xa9\
+\xdaZ)n\xbe\x8by;\xee2\xf5\xc2Dk|\x98\
+{\x0a}\xe3\x17\xe6\xb2\x19\xe3\x87\xd91fu\xa2T\
+\xf7\x14s\x0c\x11\x9a^\x80\xcb\xae\xf1\xf8\x1e`+2\
+\xd2\xe6\xc9\xceR\xe9\xe1\xf2`y\xfal\x99\xe4\xd59\
+\xa7\x8f\x1d\xf1\x8a>\x13\xfc\xebfw3\xa8\xb9cO\
+]\x8d\x16\x90X}La\xcd@y~\xd6\xb3\xaeL\
+\x8d(2\xbd],\x16\xf9\xa9L\x85\x12\x8d\x18M)\
+\xf1{\xa1\x22O9+In3GO\x00\xe6\xcfg\
+(\xd5Y\x19)1U\x11h\x90\xd9e\xf5W9L\
+g'\x07,\x95\x17\xf3\x8d\xba\x1b\xa4\xfc\xb1\xff$\xde\
+B\x17_\x04\xccj\x81-\xf9\xc8\xfc\xab\xfax\x9b\xa1\
+\xcd*\x16\x0cTS\xa1\xa1|\xfb0e\xde7\xab\x95\
+6M\xda6\xbb|G-\xbb\xad\xd3/\xd8u\x989\
+9\x81\xc8rx\x1e\x0a\x9f\xa3\xd1\x0aZ\xbd\x15\xc4\x8c\
+\x22\x02I\x97\x88\xb0@8\xf2&\x13\xa8\xd6\x04i\xc6\
+&P\x81\x95\x9a\xdbk\x13p\x11u\xcda\xc1\xeaw\
+\xeb\xf0\xa9W\xcd\xd6C\x9a\xdf\x84\xc2\x86[\x86\x98+\
+\x1f\xf3\xc1\xeb1\xd3\xe2\x8f\xe3]E\xb0\xf5\xeeT]\
+1\x80\xf7\x06\x04\xaf\x0dFy\xfea$\xceP\xda\x00\
+0\xcb\x95@\xd8\xd6f\xf0*\xabAM\xea\xabCW\
+\xbf\x8f\x1a\xfc\xb2zI\xeb\x9a\xf0x\x12\xd7S\xacW\
+L\xc3\x7f\xbf\x8f\xc6\xb4\x87\xc5\xa8_\xd5)\xc9j\x0f\
+\xd3\xd9+7_\xd4\xee\xcd\xd3\xcc\x10K,\x07\xe1D\
+F\xfd\xd9\xe8\x13'\xe9\xb1\xd22M\xb4\xf0\xfb!\xcd\
+f\xbe$\xf1\x00:\x02\xc6\xa1\xed8\x16\xb4\x99\x96\x95\
+\xba\xf3\xc7W\x9d\x19\xd7\xaf3\x9d\xf4\xa3\xf96o\x0c\
+\x8d\x1a\xd0\x07\xd6\xd4b\x8a\xaa\xf7\x0f3\xaf:\xb3\xb7\
+u\x82~\xcb\xab]\xbd'\xcd\xc0\xfe\x04\x02\xad(\xd1\
+\xbfz\xc4\x89\x11f\x07)\xf0*\xf3\xef\x9a\x89=\xaa\
+-\xb34\xa1\x08\x11H\xf3\xeb\xdf\x9agM\x83\xd7\xb6\
+9\x0e\xfbyO\xd8f\xdd\x18\xe2\xfczU\xdb\x1e\x12\
+\xc2f\xf9\x8a\x12\x1f1m\xf2\x01\x9b#{=\x9a\xef\
+Y\xe5\x8fne\xe45\x8a\x88&\xf0~\x1f\xcd\xeb\xd7\
+_3\xae\x19^\x1d\xcc\xa0\xbcxe\x7f\xc8&q\x1a\
+\xe9\xdbn\xb6?\xfb45\xfb-\xf6\xdaD\xaf_\xf4\
+\xa6\xd8\xec\xa7{\xb5\x99\xf6\xe6N,\xff_\x94vL\
+\xdf\x08J\xd7^\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x1f\x89\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x01\
+heXIfMM\x00*\x00\x00\x00\x08\x00\x08\x01\
+\x0e\x00\x02\x00\x00\x00,\x00\x00\x00n\x01\x12\x00\x03\x00\
+\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\x00\x01\x00\
+\x00\x00\x9a\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x00\xa2\x01\
+1\x00\x02\x00\x00\x00\x11\x00\x00\x00\xaa\x01;\x00\x02\x00\
+\x00\x008\x00\x00\x00\xbc\x82\x98\x00\x02\x00\x00\x00I\x00\
+\x00\x00\xf4\x87i\x00\x04\x00\x00\x00\x01\x00\x00\x01>\x00\
+\x00\x00\x00Based on Krit\
+a icon by Timoth\
+\xc3\xa9e Giet, 2013\x00\x00\
+\x00\x00\x0c\x00\x00\x00\x01\x00\x00\x00\x0c\x00\x00\x00\x01w\
+ww.inkscape.org\x00\
+\x00Wolthera van H\xc3\
+\xb6vell tot Wester\
+flier and Timoth\
+\xc3\xa9e Giet\x00CC Attr\
+ibution-ShareAli\
+ke http://creati\
+vecommons.org/li\
+censes/by-sa/4.0\
+/\x00\x00\x00\x03\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\
+\x00\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\
+\x04\x00\x00\x00\x01\x00\x00\x00@\x00\x00\x00\x00\x05\x18\xf1\
+\xc0\x00\x00\x00\x09pHYs\x00\x00\x01\xd8\x00\x00\x01\
+\xd8\x01\xfa\x5c\xa6r\x00\x00\x05MiTXtXM\
+L:com.adobe.xmp\x00\
+\x00\x00\x00\x00<x:xmpmeta x\
+mlns:x=\x22adobe:ns\
+:meta/\x22 x:xmptk=\
+\x22XMP Core 6.0.0\x22\
+>\x0a   <rdf:RDF xm\
+lns:rdf=\x22http://\
+www.w3.org/1999/\
+02/22-rdf-syntax\
+-ns#\x22>\x0a      <rd\
+f:Description rd\
+f:about=\x22\x22\x0a     \
+       xmlns:tif\
+f=\x22http://ns.ado\
+be.com/tiff/1.0/\
+\x22\x0a            xm\
+lns:dc=\x22http://p\
+url.org/dc/eleme\
+nts/1.1/\x22\x0a      \
+      xmlns:xmp=\
+\x22http://ns.adobe\
+.com/xap/1.0/\x22>\x0a\
+         <tiff:Y\
+Resolution>12</t\
+iff:YResolution>\
+\x0a         <tiff:\
+XResolution>12</\
+tiff:XResolution\
+>\x0a         <tiff\
+:Orientation>1</\
+tiff:Orientation\
+>\x0a         <dc:c\
+reator>\x0a        \
+    <rdf:Seq>\x0a  \
+             <rd\
+f:li>Wolthera va\
+n H\xc3\xb6vell tot We\
+sterflier and Ti\
+moth\xc3\xa9e Giet</rd\
+f:li>\x0a          \
+  </rdf:Seq>\x0a   \
+      </dc:creat\
+or>\x0a         <dc\
+:title>\x0a        \
+    <rdf:Alt>\x0a  \
+             <rd\
+f:li xml:lang=\x22x\
+-default\x22>Krita \
+icon - 2021</rdf\
+:li>\x0a           \
+ </rdf:Alt>\x0a    \
+     </dc:title>\
+\x0a         <dc:ri\
+ghts>\x0a          \
+  <rdf:Alt>\x0a    \
+           <rdf:\
+li xml:lang=\x22x-d\
+efault\x22>CC Attri\
+bution-ShareAlik\
+e http://creativ\
+ecommons.org/lic\
+enses/by-sa/4.0/\
+</rdf:li>\x0a      \
+      </rdf:Alt>\
+\x0a         </dc:r\
+ights>\x0a         \
+<dc:description>\
+\x0a            <rd\
+f:Alt>\x0a         \
+      <rdf:li xm\
+l:lang=\x22x-defaul\
+t\x22>Based on Krit\
+a icon by Timoth\
+\xc3\xa9e Giet, 2013</\
+rdf:li>\x0a        \
+    </rdf:Alt>\x0a \
+        </dc:des\
+cription>\x0a      \
+   <xmp:CreatorT\
+ool>www.inkscape\
+.org</xmp:Creato\
+rTool>\x0a      </r\
+df:Description>\x0a\
+   </rdf:RDF>\x0a</\
+x:xmpmeta>\x0a\xe8\xc7s\x97\x00\
+\x00\x18aIDATx\x01\xed[\x0btUUz\
+\xfe\xcf\xf3\xde\x9b\x9b\x07\x09!\x10\x08\x0fyCxD\
+`DF\x1ca\x10\xab\xe2{\x19\xc6gk;\xd3\xe9\
+\xd4\xa1\x8e\xb5\xf3jm;\xb7:X\xd7\x9ai\xd7\x1a\
+GW\xdb\xd1N\xad\x8eO\xac\xa3K\xc4\x17\x02\xceT\
+\x11\x15\xe4aH0\x08\x81 \x81\x84\xbc\x93{\xef\xb9\
+\xf7\x9c\xb3\xfb\xfd\xfb\xdc\x9d\xdc$7\x18\xc4\xae\xd5\xb5\
+\xeaf\xfd\xd9\xfb\xec\xb3_\xff\xf7?\xf6\xbf\xf7\xb9\x10\
+}\x99\xbeD\xe0K\x04\xfe?#\xa0\x0db^=\x8b\
+A\xf5_\xe8\xa3 \xa1\xe6\x190\xaeF\xda\xff\xea\xbc\
+\x03&\xcb\xf1\xa0\xab\xba\xea\xeajC\x95\xcf6gf\
+A:\xc8\xccPN\xe6y\x9eL[\xd5\x8e\xfb\x0c\xdb\
+\xf6l\xd7\x95\xb3\xff\x82\x05\x0b\xa2x\xa1\x80\xe0\x5c\x95\
+s\xb6?]%\x16/\x99\xce\xd5\x06\xef,P\x04\x94\
+\x9f!.[\xc3\xb4e@>\xf7:r\x8d\x99]\xc7\
+\x08\xf3\xe0\xfe\xa2E\x8b\xd6\x1a\x86\xf10\xca\x07u]\
+\xbfg\xc7\x8e\x1d/r\xc3\x15+V\x98\xdb\xb6ms\
+\xb9<\x92\xf4,\x09\xa3\x1a\xc2\x84:\xfb\xdc^.>\
+D\xd3=\x8d\x96\x1b\x82\x16\xa2b\x1a\xaa'\x83\x0aP\
+\xce\xe76\xa4Q\x0f\xfev\x83\x8e\xa0\xfc\x09\x96S\x0b\
+\x9e\x7fO)\xda\xaf\xcc\x22\x03\x82\x86g\x8f\xbb|Q\
+\x89\x01`\x12K\x96,\xd9bY\xd6J\xcf\xf3\x08\x00\
+\x10\xf2\xa7\x91\xff\x00@\x1c\xe360\x0b}\xc3\x86\x0d\
+\xc3N>x\x81\x90\xed\x1c_\xa7\xeb\xc9\xa7\xeb\xd0\xbf\
+\x12(\xe7\x940\xde\x0d\x93\x04@\x17\x1f\x91\xee?O\
+\xbe\xf9\x9c\xd6\xa3\xd5rC\xcc\xc3\xe6\xd9\x07\xf00\x9d\
+G\x5c\xad3c\x99\xd6\xbf\x11B\xfa\xa0\xb4\xef\xfb\x1e\
+\xc0\xb8\x01\xf5{\xce?\xff\xfc\xef \x17\xcc<k\x03\
+\xcaC\xecr+\xec\x9b%\xce\xd2I\x95\x8a\xc5N\xa9\
+x*\x1d\xa2=\xbaM\xf7\xe8a\xaa\xa2\x10Y~\x08\
+\x98\x86\xc8\xe5\x1c\xe4\x8b\x80\x04\x850iH\xf8\x14\xf2\
+\x99<\x0ay.\x08\xb90)\xacW\x91m\xdeC!\
+w\x8f(u\x9e\x15%\xf1\xf3y\x0e\x9e\x0b@\xf0Z\
+\xce:)f\xa4\x16\x9cw\xdey\xeba\x06\x7f\xc3\x00\
+`d_\xd34\x0b\xcf\xac\x0d\xdbP\xbek\xfb\xf6\xed\
+\x1f\xf2\x8c\xca,\xb0\x08\xee\xa7\xf3\xa2z\xca\xc4X\xc3\
+\xa4\x9f\xc2\xf0\xbfe\x03\xd24\xb0\x04kl::7\
+\xc0\xa3\xa6\x90\xe61\xb8\xa3\x06y\x06\xe5 g\xf9\x06\
+\x89\xad\x87}'\xf8\xc4:H\xd3L\xd2\xa0@\x22\x8d\
+j\xefQh\xc5\xddZc\xf4\xb8\xa0g\xa1\x0d\xd5\x0c\
+\xbc\xea\x98\xe9?\xf2l\x00\x00\xdcm\xe9\xd2\xa5?\x03\
+\xd3\xdf\x07\xd3\x0c\x02\xf8\xd6\x84i\x9a\x06?\xa3\xfc\x8f\
+\x9d\x9d\x9d\xf7\xd6\xd4\xd4\xa4b+\xb6\x9a\xb1m+\xa5\
+o\xe8\x99*n\xc22\x1f\x88\xea4:\x8e\xb5\xc3P\
+]\xf0b`p\x14\x83\x140\x8c\x8a\x01\xcf\x22\x03\x82\
+\xca\xf9%\xf3\xa2\xa8\xef\x99\x1bx@\xd4 =O#\
+\xbf\xa7\x0d\xb0\xdf\xa1\x1d\xca\x7f\x22h!\x18c\xe9s\
+\xf8\xf9L\x92Z\x0f\xf7\xe1\xb2D\x12 \xfc\x02L\xdf\
+\x91\x01A\x07\xe3\xac\x0d\xc0EjCm\x98\xc2wn\
+yg\xcb\xeb\xdc\xe9\xd4\x5c\xef\x97\x05\xbe\xbe\x8e\xd1\x82\
+|\x5ch\x00\xdb\xa8d\x5c\x0d\xce\xf9P\x0a\x98f-\
+P\xd4\xcf\xb8\x02@.\x07\xbd\xb3\x9e5\xf6\x0dfF\
+#z\x1e\xd2\xeaJ\xd6\xa1\x01\x89\xeag\x0dm\xc3\xda\
+a}\x14\xb7\xc9\x95\xd4\x1a\xd5;\xd6R\x89$l\xff\
+_\x00\xc2w2 \x18\xac\x09x\xe7\x19\x06j\xc9\xa4\
+\xad\xb4\xe5\xc1\xba\xee\x96\x89\xb3\xa8\xf4\xeaV\x8f\xfb\xf8\
+\x10\x0ak{.f\x07\xd7\x09\xd2\xb3\x18W\x00\x04&\
+\xc1\xd3g1\x9c\xab,\xe034\x18\x98>\xca \xbf\
+\xf5\x15\x8aw]\xab\x1d\x9c\xe1|\x1e\x10\x06\x03\x80\xc9\
+\xb1\xb6\x0c\x08\xcb\x96-{\x04\xec~\x13 \xb0\xaa\x9b\
+\x00\x01Z(|0\xaa\x19\x96\xa1M\xf3\xe6\xd0\xb5\xe9\
+\x9b\xbd\xaf\xb8\xcb\x0d\x1b\x0dX\xef\xb93\xb7\xe3\x81e\
+\x99\x9f\xb3h0\xe3\xfd\xcf\xe0I\x82\xa24y0\x10\
+\x83\x9e\x81\x01:\xa4\xc9(\xb0\xc8\xeb\xf8=\xb5\x8f_\
+\xad\x1d\xd4\x1c\x11\x839\xc4Fn\x0e\xb9\x00\xc0r\xfb\
+A\xf8\xeaW\xbf\xfa\x18@\xb8U\x81\xc0/\x03\x06u\
+\xaf[o\xa7\xdd\xb4\xcf\xb8[\xac\xa7\xeb\xc4\xad\xd8\xdc\
+'\xb2\xe3\x83.@\x1b\xe4\xbf\x80\xf9l \x02\x86\x03\
+f\x15\xf3:\xda+\xe6\xb9.\xc0?;\xcf.g\x03\
+\xc1e?Mf\x91En\xfb+\xda\xdb\xe7\x5c\xce\xeb\
+c\xe7<R\xc78\x1c\x00<N\x9f&\x00\x84\xa7l\
+\xcb\xbe\xc1u]^)\xd7K\xce\x0c\x98\x82\xad\x85\xe8\
+\x10}HE\xda8\xfa\xae\x16\xa3\x95\xfa\xa5T\xa8E\
+\xc8\xc5\x9a\x99)\x03\x7f\x95\x06\x0cf\x98\x9f\x15\xf3A\
+\xce\xc0\x05`\x04 (f?3O\x93\x05\x10Rm\
+\x0fi[g\xad;\x13S\x08\x98\x91\x1c\x0d\xf9\xe3\xc7\
+b1\xf9\xfe\x9dw\xde\xb91\xe5\xa6\x9e\xf1\x0d\x17\xcf\
+\xd2!J\xb6\x044\xcd\xa1\x04\x9d\x83\x00\xaf\x88F\xd3\
+]\xe2:\x8a\x89;h\xb7\xbe\x97\xb0\xcf\x93\x1e\x82\x8e\
+\xda\xd8\x0bA\xd8\xfb\xc9\x0bq\x9eM\xd0\x15\xf9\xcc\xb9\
+\x8f>*\x87/\x0b\x0d&X\xa1\xac\xe3|\x10\xd9\x9e\
+Iz\x8bOQ\xeb\xbb\xe2\xf2\x9a\x9b\xd8\x19\x0a\xecR\
+C8\xcaQq:\x0d\x90\xcdc+b\xd8\xeeb\xee\
+\xb7g\xc6f\x9f(\xa9\xdf\xdfl\x1f\xd0l\x11\x85\xa6\
+\xf3\xc6\x10t\x0fLB\xa3\x90\x16\xa6vj\xc6\xbfZ\
+\xfa\x96u?]\x16\xbe\x9e&\x9a\xe3\xa5Y\x08\xe1\x05\
+\xdbCF\xeaJ\xfa,qE\xd8\xdf\xfa\xca\x88E1\
+\x7f\xb6\xe4\xa5\xbag\xeaTY\x99\x06\x9e5v\x8c\x08\
+aE\xaa\x15q\xc2|\xed\xf9%M\x02\x02\xd4b1\
+n<l\xfaL\x94\xc0\xbc\x1c\xe0\x9c\xd2\x05w\x1b\xdd\
+\xa6\xe6\xeb\xae\xd7j\x1e\x82\xd3\x8b\x82\x15\xcc\x99\x01\x81\
+\xf5\xdc\xa1$\xd4\xbf\x84F\xd1E\xf4h\xfa\x1ez\xd5\
+{\x86\xbe\x19\xf9\x11]\x98w1\x8d\xd2\xf3`\x16.\
+\x9a\xf1pY\x0b\x97\xcf\x5c\x170\xcfc\x0a0\x1f\xf8\
+\x11\x05B\xf0\xbe\x1f\x90\x9c\xf5\xd0N8k+:\x9a\
+\xdc\xee\xf5\x18\xf0O\xa8f\xeeg\x0a\xf8\xb4\x0d\x9e\xad\
+\x16\xc6\xda\x0d\x9a\xf7\xce\x1f\x8a\xf3\x1c\xdf\xdb\xf1\xde\xa7\
+\xaf\xd0\xde\x96\xb7D\xe7\xa8F\xad\xddh@p\x9f7\
+\x10\x04\xcc\xaa\x00\xb1\xa1\x0d.N3\x07\xe8MZe\
+\xfe)\xddT\xf8g\xb4 \xafJj\x81/\x1c\x99+\
+\xc9#\xba\x18 \xf9\xa0\x9e\xeb<\x00\x96\x8bY\x06$\
+\xbb\x9e\x01\xe5gv\xc1\x1c)#s\xd3K\xb5'W\
+\xbd\xf7Y\xfe\xe0t>\x80\xaa+\xa5\xa8\xa8\xdb\xa6\xbb\
+\xc2\x85\x06-\x9e\xb6\xc6\xad\x1c\xbfB+\xe8\xae\xa0\x22\
+1\x09S%\xb1\xc0\xfe!\x14\xf3\x9c\xa7\xa1\x0f\x9c\xcf\
+\xd7\xd6\xd0Ao\x1f\xdd\xde\xbe\x8a\xfe\xbd\xf3\x01j\xd1\
+\x9b\xc9\x0c\xdb\xf0\x0b\x1e|B`\xf3*\xf7a\xe3\xec\
+\x0b8\x17\x19\x1aj\xf7\x08\xb7BL\xca\x0fp9\x95\
+\xa9K\xc1\x0eS.E\xa1\xd8y\xee]@\x04\xc7\xb0\
+jFg\xd84\xac\x06\xc4\xb0\x9f\xc6\xb0\x9fn\xbc]\
+\xcc\xc1\x08{\x10\xe1X\x18\x16\xb7\x1bB\xfb\xe0\xc8k\
+\xb4\xe7\xc4\xeb\xd4Yp\x84\xe2t\x12\xd2\x84\x87\xcb\x84\
+\xe3\xd9 \xa8YM\x84\xf2\x06b\xf9\xc3\xfe>\x9ac\
+\x9dG\xeb\xc6\xfd\x90\xe6\xe5W\x92\xef;R\xca\x88f\
+\x06\xe4,\xf9@+8g\xb3Q\xd2\x1e\x9cgk\x82\
+z\x87\xf3\x03\x9f\xcb\xc8K\xa1\xe3B\xed\xc1+\xebN\
+\xe7\x0b\xfa\xc5\xa7V\x9b\xc9/\x0a\xb6AJ\xd8t\xbd\
+YHV\x0aBK\xdaBK\x875:w\xe6\xa5\xb4\
+p\xd2\xa5T\xd0;\x91\x22Z)\xdc!\xa4\x80\xd9\x14\
+\xf3\xd9Cq\x1dd-5b\xaa1\x9f\xda\xbcf\xfa\
+\xde\xb1[hK\xf7\x1b\x84\xcer\x17p3\x92\xf7d\
+\xceZ\x10\x90\x80\x94\xb9\x1cH[I\x9dsE}\x92\
+W\x1a\x80\xdc\xd1\xc8v\x5c*0m\xb2\x92\xd7\x07k\
+\xb9hX>\x87\xd1\x00>\xe5q\xac)\xb4'~D\
+\xbb\xc2\x16U\xb9X\x0b\x82|]G-BBi\xc3\
+{\x0eo\xa6]G_\xa4\xee\xc8\x11J\x89.\x84\xc2\
+\xecS!\x00\xbc\xe748\x07F\x88\x1c\x10\xc6\xe3_\
+\xad\xf7!\xfdx\xc2z\xbaj\xc2\x95\x98)\x0dr1\
+.k\x82+\xa5\xcf\x92\x0f\xb4\x80sWjH`\xe7\
+,i%mU\x1e\xf2\xec\xe3\xb8\x80\xa1\x12\x1f\xd2\xfd\
+\xb7,f\xa7\x00-\xe6U\x0d1\x87\x9c\xc8\xc4b\xbc\
+T\xa2_\xc5hV2D\xf3z\xc0y\xda&\x0dZ\
+@i\xec\xed\x0e\xf6\xf5\x14\xb4~\xde\xec\x8b\xa9j\xda\
+5\x94\xe7L$\xdbP\xbbB0\xe4\x10\xe6\x19\x10\xfc\
+cm\xf0\xc1\xe8<k\x09\xddw\xeco\xe9\xe5\xe6\x97\
+H@\xab\xd8\xf6=\xf8\x05\xdf\x86\x0f\x909Z\xda@\
+=S\x166\xa4>\x80 }\x9b\x89\xebUY\xe5i\
+H\x08\x97L\xb63\x8fb\xbf\x9a\xc5\xbc\x10\xecY\xe6\
+\x83\xfe\xb0\xc8r%\xe6\xc2O[\xb8\xc6\xb2\xc9tR\
+\xe4\xa1\x02gA\xfc\x91\xc4\x8c@\x13\xc0P\xe5\x9cU\
+\xe4\x99>\xed\xfcd\x03\xd4\xaf\x91<\x01\xd3\x1bp\xf2\
+\x0f\x86\xcf\x06\x04\x9a\x05\x93H\xd3\xc2\xd0\x12\xba\xbf\xe1\
+>*\x88\xe4\xd1\x8a\x09\x17\x90\xeb9@I\xd9u \
+]>Y3\xb1fp>P\x0b\x06?\xf7i\x04\x98\
+\xc5\x9d\x86mX\x94N]\x80Nu \xc9S\xb0\x9a\
+\xfe\xbf\xc3\x01 [$\xc24\xdf\x8c`\x7fGL\xcb\
+\x8cs\xe3! @\xb1*\xe7\xad\x86\xa4\x88v\x1ex\
+\x8a\x84}\x1c\x9b\x11/\x84}\x82\x1cf\x88)(0\
+\x5c04\xcb\x9eE\x0f\xd4?D\x15\xa3\xc7\xd1\xf4\xa2\
+\x0a\x80\x00)\xe2\xda\x8f!\x0e(`\xdc\x93\x00\xc0T\
+F\x04\x82\x04FP\x1e\xd44\xee\xcc\x0fV\x91\xfbo\
+N\x00b1\xcc\x8e\x04\xa77]\xc7e\x17\xae\xb24\
+f\x9c+\x15\x00\x01\x18x\x97\xf1\x09\x95\xf3WC\x13\
+\x04\xed\xac}\x9c|\xab\x05 \x04\xe66\x18\x04\x1eW\
+%\xd6\x04\x03#\xe3\x96\x83^l\xd8H\xb7/\xb9\x8d\
+,\x0b\xa6\x00\x005\x8d\x99\x08\x98WZ\xe0\xe3\xd9\x80\
+\xe6p}\xbf&\xe4*\xcb:\x8dL\xe4\xa1\xc449\
+_,&y\x92\xe5\xac?\x81\xc1fU\xf0N\x07\x11\
+\x88\xeaX\x8d\x9d0\xbds\xe2\xe0\xd4\x81\xfd\x83\x00\x88\
+,\xf3s\x1f\xa5\xb2|B\xe5\xc2Kh\xd1\x82[H\
+K\x97\x04\xf7`\x92\xfb\x81\xa6\xa7\xa4\xafr\xbe<\xb7\
+\x1d\x93\x9e\xa8\xf9-\xd5\xb5}LZ\x1e\x94\x1d^\x9e\
+\xfd\x01\xfb\x00\x95\xfb\xb2\xcc>A\xd9<\xcc\xc5fb\
+\xbbW\xe5\x019\x00\x88\x93k&\xa6~\xf0o\xdf\xb6\
+\xb0\x0a\xe9\x08\x07\xb0\x8a\x87\x9c\x1a\xc0\x8d\x8a\xa9\xd8\x04\
+\xc3E\x04fI\x17\xd8\xc5\x03\xcf\xaf\xb4\x80s\xee\x1c\
+\xe4\xac\xac\x82x\x96\xb9\xe7\xae&3j\xd3\x07\x1f<\
+\x069\x1d\x03\x10&ff\x10\x86\xee\x0e|\xc3\xd4\xd1\
+\xd1A\xcb/XN7\xce\xbd\x99R\xb8Htt\xc4\
+\x06\xec\x10\xe5\xc8l\x06\xca\x04X\xfd\x01\x0c\x88s\xa6\
+`v\x96\xb6\xd2\x82\xfe2\xbc\x0c\xdf$b\xdad\x11\
+5\xca\x1bi\xee0$\x0d\x05\x805\x17\xebu'Z\
+\x86\x13\xd6#\xfc\xb9B\xc7\xed\x9eb\x98\xa7P\x8c\xab\
+:\xce\xd1\x0cW\xbdX8\xfa\xceX\xf05\x8a\x16\x8f\
+\xa2\x0f\xde}\x92\xda\xdaw\x92\x15\x82\x0dAy\xd9,\
+\x94I0\xf3\xb8_\xa4\x95+W\xd2\xaaU\xab\x10e\
+\xe14\xeb\xa5\xe9TW\x82J\xbby>\xcc\x043P\
+\x00p\x1e0\x0f-@\x88\xddo\x0a\x83\x99\x0f@\x90\
+\x00\xc1^\x0d=\x15\x99<\xd1e\xcbe\x19H\xded\
+9\xf3g(\x00Yo\x93a0\x85\xae:\x1c3\xcc\
+[2\x9e\xcd<3\xae@\xe0#\x0c\xdc\x85\xb4_l\
+fT>s>\xad\x18\xb3\x8e>\xda\xf5\x0a\xd5\xd7\xbc\
+\x04\xc6\x13\x00\x22\x0f=x3$J\xa5R4i\xd2\
+$Z\xbe|\xb9t\x92I'\x09m\xd1\xa9\xab\x00\xf7\
+J@\xb34\x8e\x91\xa5/\x80\x16p\x9c\x90\xd1\x04_\
+j\x01\xef\x0a\x1c\xe8)\x7f\x100\x1dhB\xa6\xcc>\
+\xc4\xc0\xaa4\x84\xc7\x89,\xa6\x06\x15\x87\x05\xe0X\xdb\
+q\xbf\xa4$?\xe5G\xc2\xb0i\xa87\xa6\xe3\xc6L\
+,m\xc5|\x90\xf3\xf9\x8d\xebxk\x04h\xb2\xecP\
+\xde\xd82:o\xf57h\xc2\xf4\xd9T\xbb\xebuj\
+:\xfc6\xb4IP$ZH\xdd=\xbd\xb4\xea\xe2\x8b\
+)\x1a\x8d\x92\xe3@\xed\xc1<'\xb8\x04\xea\x06\xf0\x1e\
+\xe2\x982\x04t\xcc<\x8f\xac\xd4^\xe5\x0c\x84\x81\xf3\
+\xc6\x00\xa6\xa5)0\x00i\xac\x04\xa0\xe1\x03\x5c\xcaK\
+8\xbb\xda\xdaxI9\x13\x0bc`b\x83\xe5\x0b\xd0\
+e\xcb\x22W\xfe\xe8\xd5\xda\xfc\xe2\xc2\xc9z\x0a\xdff\
+\xb06\xc5<\xe7\x8a\x18\x0c\x13,\xc3\xd2en\xc9\xb2\
+\x0f\x90|2\x10\xddY\x18*\x0cfR\xbdmt\xe2\
+h-5\xd4\xbeG-\xc7\xea\xe8D\xe3\xc7t\xee\xa2\
+\xc5t\xf5\xb5\xd7Q4?\x9f\xd2i,8c\x1f\xbc\
+(f9\x02\xe6\xcb\xdc6\x0a\xe3\xd0eak4\xf8\
+\x14)\xb8\x9c\xc2\xf8\x0e\xe6\xe3\xb3\x04\x9c\xa0d<[\
+\x1bd\xd9'[\xe8\x9d\xed\xbd\x0d\xa3\xaeyq\x0e\x1a\
+%\x81-\xcf\xc0\x86\xd0\x97\x98\x8f\x81I\x19\xe9\xf6\xed\
+\xa9^\xbf\xe7\x94\x99\x07\x00\x989\xd4sc\x96t6\
+\xf3\xd2\xf9\xc9\xfa\xe0$\x1f\x9c\xe6\x832\xb7\x93~\x01\
+\x8b\x0c\x15\xe5\xd1\x94\x85\x8bh\xca\xdc\xd9\xd4\xdb\xd1L\
+\xc9\xaeV\x1cWz\xa9\xe6`#M./\xa1\xb1c\
+\xc7\x12\xae\xdc\x82\xed\x13s\xc1c\xe0\xa0e\xd2\xa9\xc8\
+\x18\x1a#\x8e\x03\xa0n\x8a J\xb4!U/\x95\x06\
+\xe3\x0c\x18\x9b\x01N\x9d(\xcbK\xf9, \x04\xdf=\
+\xe4a\x8c\xd6\x9e\x16\xbcd\x94\xd0nh\x1a\x0a\x00\x10\
+B\x8204/a\xf9G\xc3QZ\x8cq\xf9\xdb\x97\
+T}V0\x96\xba2\x03\x0b\x0b\x0d@\x18\x983\x10\
+\x8a\x18r\xfeH\xc4\xffl\x0cT\x18-\xa3\xd2\x89\xa5\
+\xb8O\x84\xafw\xba\xe9\xf8\xa1\x03\xd4s\xf8\x10M\xae\
+\x98D\x86\x89\x13\x80\xcb#b\x0b\xb7,j<\xd9L\
+\x8f\xbf\xb9\x8d\x1a>\xdeM\xb3\xce)\xa7\xebW\xcf\xa4\
+y\xd3\x0a\xd1&\xf0\x01\xac\x01\x81)(\x0d\xc8\xe4\x02\
+v\x8bo\xdd\xbe\x19o\xc4P~\x86\xa7\x01\xd2G\xbd\
+\x14&\xe7\x03\xd2Z\xa8;*\xbcx\xb2\xb3\xc6\xd6+\
+\xae\xd5\x11\xab3\xc3\x92y\x0c\xc1\xc1\x8f\x0b)\xd9P\
+o\xd6\x88\x00\x84\x00\x14\xc5tv\xceP\xf0s\xf0\x0f\
+.\x12\xd2\xe1P\xd8\x01\x85\xc2\x82&/\x98A\x1d\xcd\
+\x9fR\xfd\xa7\xf54\xa1x\x02\xe5\x17\x14\xe0vK\xa3\
+c\xc7\x8eQ\xec\xef\xff\x8e\x0e\xd4\x1f\xa4\xc9Sg\xd1\
+\xcbo\x1e\xa7\x7f~d'm\xfc\xf5%\xb4\xf2+c\
+p\xe7\x91\xc2\x01\x8c\xb5\x81\xb5 \xdb\x14\x02\xa7I\xba\
+GmN\xbc&`n\xad\xe4)(\xf7\xff\xcd\xa5\x01\
+\x84\x0f\xa1\xb2E\xf3\xee\xad\xbb\xcd\xca\xb9d\x855\xdd\
+\x05\xd3\xec\x08\xa5\xb3\xc3\x1f\x8b\xb7<\xec\x10\x16\xbc\x96\
+\x07P\x18\x84\x80iv\x82\x816d\x83\xd0\x0f\x80\x02\
+\x22\x10\x06_\x91\xf98?\x14U\x8c\xa6\xfc165\
+\x1fm\xa4\xde\x96\x12*\x1dUJ/\xbc\xf8\x82d~\
+\xf1\xa2E\x94H$hqU\x09\xc5\x93.]\xf1\xdd\
+\xb7i\xef\xcb\x17\xd2\xf4\x0a\x9c\xd1\xd3\xf0\x030\x05\x13\
+\xd7q\x81\x19d\x1c\xa0\x96\xd6\x05\xb6\xd5\xad\xbb\x9b\xe5\
+\xf7L\xc5S?\xebA)G$\x88\x17\xfb\xf7\xcb\xd5\
+5\xad\xff\x8b\xbd\xdd\xbd\xad'\x93\xf9\xa4\xc5m\x12\x09\
+\x84\xd6\xb8\x1f\x90\x11a\x12\xb6\xe8`\xf1Ix\xf5$\
+nv%\xe1\x94\x18\x94\x11)\xa2.7a\x17G\xa0\
+\x93M\xe9\xb0O\x09\x03R\x8c\x1aT^9\x9e\x22\xb3\
+:\xe9@\xf3^\xda\xbb\xf3\x10\xcd\xad\x9cE\xbd`\x1e\
+:L=`>\x8aH\x91\x12.\xbd\xb8\xe50\xa5,\
+xg\x195r\x8e\x1d!\x84\xfd\x8e\xc9N\x08*p\
+\xb4S\xbd\xdd'\xbf\xb7\xbei\x1f\xb3\xba\x7f?\xa4\x92\
+#\xe5\x06\x00\xd7A\x99\xb6\x07{Z\x8e\xbe\x9f\x80-\
+\x81y\xc1\xccK\x10\xb0MqX\x8c\xb3\x02\xe1\xae\x10\
+\xd8\x03\x08~F=\x1f\x95\x07\x12\xae\xce\xf9\xf8\x0c\x07\
+\x16\x90*\x07y\x9a\xeb\x11\xff\xa7\x01X:\x92B\x9b\
+$uj3iw|1\xf5:\x1c\x03\xb0\xce\x05\x89\
+\x9dX<\xe9\xd3\xd4slz\xed\xadS\xd4\xee\xf4\x92\
+\xc8\x83g\xc1\x95\x98\x87\x90X\xa0/\x98g\x10p\x10\
+J\xd0\x91S=\xef\xa1\xcb'\xdc;\x16;\x13\x00\xd8\
+g\xe1J\x0c\xfdD\xc7\xbbon\xea\xc1~\x9c\x88 \
+\x94a\x10X\x0b\x18\x00\xe4\xeaL\x90\xf2\xc0\x84\x03F\
+\xe1\x13\xa4\x06\xe0\x07/\x9cK\x0d\x18\x02H\x00\x90\x04\
+\x835\x01\xd2\xf7\xa2\xf0\x09\x914\xb5&\x22\xb4\xb3n\
+:\xbd\xb1s\x12%\xb4\x094n^\x159]\x87\xe0\
+\x0f\xfa-\x15\x8a@\x11| \xae\xa9ISS\x07\x00\
+@?\x17\xe7\x03\x0f d\xb4@h\x91\x84\xe6&\xbb\
+i\xf3\xf6\x8eM\xcc\x83\x88I\x9f\xa6\x84\xcax\xf4\xa5\
+\xfe\x91\xfb\xaaT\xe1\x1fd!~\xcf\x0f7[\xd7\x5c\
+S\x977\x7f\xc6l\xb7W\xe0\xd4\x8bs\x1aD\xc1\xf6\
+\xef\xa7`\xf7\x80\x89\xa3E\x1f \xf8\xbd D_\x1e\
+\xb6\x1f\xf9\xc1\x03\xe1\xa3\x0fP\xfa\xed?\xf0\x0a\xea\xb8\
+\xcbGv\x98)uuD\xa9\xa3\xa9\x8cN5E)\
+\xed\xe8\xd8\xea \xf5P\x98\xca\xce]C-\x9b~M\
+v\x09\x90\xe7\x86\x99\xc41S{\x1b\x84\x00\x07\xe8\x85\
+x\x93N\xe1\xb34\x1c\x22rM$\x85\x1eM\xe9\x87\
+\xf7\xc5k\xff\xfa\xde\xf8f\xee\x12p\xa2z\x0f\xcc\xb1\
+\xf4a\xd2\xb6m\x0a\xb1vo\xc6\xf4\x09\xf4\x95\xa5\xcb\
+y/\xf4\x0d\xdc\x8b2\xc3\xd0\x00\xfc\x80A\xee\xad|\
+\xa2\x93\x18\x83Y\x01 \x08j\xea\xc7Qf\x80\xf05\
+\xcd\xc7=%\x93\x87w\xccG:\x8e\xe8\xb4\xd3\xa2\xce\
+\x13aj9\x5cH-\x8d\x05\xd4\xdb\x15\x92Q\xa2\x81\
+\xb1|(\x1f\xb7\x0f\x15\x8d\xc3\xe1H\xa3\xee\x9a\xe7\xc9\
+(\x9c\x88I\xe1\xf1\xf1\x0c\xe7O\xe3*t\xfa\xc6\xb7\
+\x8b(\x7f\x14\x9c\x9e\x8e\xdbi\x13d$\xc9\x80\x09\xe8\
+^\x5c{\xfc\x99\xf8#\xaf\xbd\xe1Ko\xbem[n\
+\xf5g\xce\x87\x07 \xc0E\x9a\x81\xff\xfa\xab\x1d\xde\x0d\
+k/\x10\xe5c\xca|\x1d?\xdb@T$\xa5\x0e\xbb\
+\xd7y\x0b\xe0[\x1c,\x9ce\xcd\xf17\x83\xc1\x1fj\
+ \x0c\x12\xb8\x99\xf2\xba\x10\xc9w`\xe1\xad\xd8\xb0Z\
+\xe1\xafOY\x94\x009\xdd\x88!\xb99\xda\xeb8p\
+\x80g\xe8+[:r(\x81f\x84(R6\x8d\xda\
+>~\x9f|\xa7C>\x1b\xd0\xaa\x96:\x9f\x96\xae\xb1\
+\xe9\x0fn\xcc'\xdd\x82\xf3\x04\xe3:\x9c(\x19I?\
+b:\xfa\xbe\xba\xf8G\xd7\x5c\x9b\xbe\x0f\xc34\x81$\
+\x0f<f\xae\xc4/O\x97\x94\x16\xecu\xef[\xffd\
+*\x1ew\xd2\x08\xda\x81\xb9`3H\xe1\x94\x98\x88\x82\
+9\xc4\x04\x1c#\xf0I\x10\xeb\x0e\x08e\x09\x92\xd4\x1a\
+0\xc4\xcf\x19\xe2_\x0cjp~\x1a\x9c\x1f/\x0f\x7f\
+%\xf1d}\xc4m\x11\xecDFW\xd0\x94\xabb\xe4\
+\x9d8\x8c\xb6\x16\x85\xf25:\x85F\x17^3\x06\x97\
+'\x00U\x9e@9\xcc\xf2\x05\xb4Go\x8e{\xceO\
+\xefK=\x89\xa1\xa4\xf7\xcf\x0c\x89,w\xfa,\x0d\xe0\
+^\x0c\x92G\xfb\xf65\x8b\xaas'\xeb\x95s\xe7@\
+\x0b!p\x81X\x05+\xc1\x08|\xee\xb6\x92\xf8\x92\x03\
+\x11Jk\x80\xa7\xe22\xdf\xc5\xf2\xcf\x99XA\xe4\xbd\
+\xac\x141\x8e\x1a\x92c\xf4U\x9c\xf3,\x8c\x1cPb\
+'\xc7Z \x18M6\x05h\x98]4\x81\x92l:\
+'\x7fK\xedG\xcbh\xc1\xcab\xba\xe5\x07\xa5\x14\xe2\
+\xad\x0f\xc1\x14\xc3\xcf\x01\x91\x89;\x80\x8d/\xc47\xae\
+\xffI\xea\x97x\xd1\x0c:\xad\xf4\xf1^6\xe0\xfct\
+\x89\x97\x89\xd5\xd0\x01\xb1\xb6\xfaqw\xef\x9e]\xd8\x9c\
+\xf8\xb0\xe9K\xa9\xe3\x85cC\x13F\xe1&\x07\xc80\
+\x8f|\x90Q\xbc\xb1\x97\x08\xcal\x22\x81\x84\xf99(\
+\xf3\x07tfX=\xf7\xe7\xc1\x94\x0c\x08F0CT\
+2\xe7\x22J\x1d#jl/\xa0?\xff'\x8e\x16y\
+\x0bF`&\xb5O\xf8a@\xf0\xfe\x87\xa9]\xb7\xad\
+\xedy\x0cC\x1e\x00\xf1\x9ay\xaa\xd3&Fh\xe4\xe9\
+\xaa\xab6\xbb\x0b\xab\x1eO\x1fm\xa8\xf74\x03\xe6\xaf\
+\xc9_R\xb1oO\xe2\xa7a\xf1R\x1cQpE\xc6\
+?\xeeb\xd7\xc0B\x94j\x8f\x19\x02\x10\x02\x86\x83r\
+\x86Yn\x83\xf7\x01 \xfc\x17\x15\x9c!\x05\x19\xee\x0d\
+\xa1e\x1e\xbe\xcc\x1f\x8c\x13=\xb0}6M\x99\x13\xa6\
+\x04\x80\xc1OU\xf0\xc1U\xf3\xc2XK\xed\xd1\xd4\xc1\
+\xd5\x8b\x9a\x1f\xbf\xe0*\x92\x9e?\x18\xe1\xb3\xff2J\
+#M\x0c\x16\xafu2\xe8\xb6p\xd3\xf1\xdb\xc2\xe3\xca\
+\xa7\xe0\xde\xd9\xb3\x85o\xf0\xb9\x00\xbfU\xc1G2|\
+\xa6\xeft)\x82\x1f\x0e\xd9\xd8\x0dL,\xd4\xc0vg\
+\xe2\x17\x13\x06v\x04\x03;\x01\xe2j8OH\x16j\
+\xcfN4\xb8\xff\x04\xbb\xd2\x81`[\x83j\x09\xbe\x88\
+\x07z\xbekb\x87\xb0\xa9\xb3\xeei\xba\xee\xf6\x1d4\
+{^\x11\xcc\xa9\x037u\x09&\xbfXK\xeaM'\
+\xda\x1b.*\xdf\xfb(\xd6\xf5\x9f\xa0\x06\x90Z+\x8a\
+\xa7O\xa7\x89\x03\x86td\xe6y\xe0#\xa0\x0d\xc9\xf2\
+\xf1\x86q\xe4p\xb5>i\xcal\x0f7&.\xdc6\
+\xff\x9c\x8c\xcd\x22^\x04\xdb\xcd\x83^\xb4C\x9e \x1d\
+\xdb\x9e\x00\xa3<\x00#\x0e\xad\x95N\xb1O\xd8\xecK\
+02g\xd2\x1e\xf0\xc2\x07\x00\xe9\x04\xbe)\xc2a\xce\
+\xa8\xaa\xa5\xd9\xb7\x1e\xa7\xb2\xe2R\x1c\xea{\xc18\xe2\
+C\x8c\x11\xc2\x85W\xfd\xb1\xc4\x815\x13\xf7>\x8b\x9e\
+\xcf\x81\x1a@#f\x1em\xe5z8?\x93\xc4<\xf0\
+R\x17\x80\xae\xca\xdf\xb3\xeb\xf2\xc8\x82\xaae8*\xe0\
+\x80\x94@\xa0\xe4\xeb6\xbc\x1ck\x03\x8e*\xf8\xac\xe7\
+Q\xb8\x0b\x9a\xd1\x86;\x85.\x10\xb6F\xdd\x01\xb1\x16\
+\x00\x11Mj\x00\x86\xc3\xb6\x22\xf0A\x87\xb7\x13\x0d\x9e\
+\xd4\xceKQI\xc5)*\x9fz\x80\xc6\x14\xd7c<\
+h\x8e\x9f\xc4\x094\xe1G5\x07?B\x8dS\xc3\xbe\
+\x13;\xfeh\xc1\xdb/c\x1d/\x81v\x83\xd4\xdaP\
+\x1cY:\x13\x0dP#2\xf3<\xd1^\x9a??\xd5\
+\xb3pQ\xaf\xff\xdc\xd3\xc7\xb5+.\xbb\xc4\x08\x15\xe2\
+F\xaf\x17;\x81\xcf\x01\xa2\xce\x0e*\x8d\x19\xb4\x128\
+\xc0\x12\x80\x91\x86{\xec\x05%\xa0\xfe\x08\xd7q\xd1C\
+F*0\x0b\x03\xf1\x83\x85x>\x14\x89S\xb4\xa0\x83\
+\x0aF\x9d\xa2<\xb3\x15 \xa6\xc8\x11\x118\xd7\x84\x1f\
+\xc2\xcf\xd3l\xb2\xf5\xeedO\xcf\x87/\x1f{\xfd\xde\
+\xebw\xbc]>\xc3~\xa5\xa9>U\x9bY\x13\xaf\xed\
+\x8c\xd2H\xb6\xc1\xe1\x06\xd4\xa9\xb9\xb9\x85\xee\xbc\xf3H\
+\xfa\xae\xef\xbb\xce\x9e}\xc7\x8dE\xf3,\xb3\xa4\xb8\xdc\
+\xd0\xa3\xb0\x06\xbe\xcf\xf3\x00\x04\x7f\xf0\x0c\xb6L\xcd\x80\
+\x91\x87\xb1e\x15`\xcb*N\x929&N\xf6\xb8n\
+\x0a\x8f\xef\xa4\xc8\xb86\x8a\x8e\x01\xd3\xc5`:\xaf\x07\
+\x81\x11\xf6=D]\xe0H\x18\xf8y0\x8e\x22\x9a\x87\
+\xcf\xe9\x9f\xd6\x9f\xfc\xe0\xe1;\xb6\xbf\xf0\x9b\x9f\xec\x7f\
+\xeb\x8a\xefT\xbc\xb4\xeb\xf5\xf6CX \xab\xfd\x193\
+\xcf\x8c\x9d\x0d\x00<\xa1N\xef\xbe\xdbM\x9b6\xd5\xf9\
+?\x899\xf1\x07\xff\xb5\xd5\xb3CG\x8c\x09\xa3u\xb3\
+0\xbf\xd44\xa2\xa6\x81hA\x82\x81}AG|\x0b\
+EG\xe4\xcc\xde\x00\x1a\x00\xa3\xe7MRn\x94\xcc*\
+;\x00\xb8\x0e\x98\x00G\x00\x9a\x8d\x9e\xd8a\xb5\xb4\x9b\
+p[\x8f\xb6|\xf4\xd6\xc3\xbb6\xfe\xfc\xea\xd7\xdej\
+\xac\xe9\xfa\xef\x076]\xf6\xf2/\xfer\x17<\xcc\x99\
+\xd9<\xda\x0fH\xac\xcag\x9b\xfa\x9d\xce\xb7n\xae\xa0\
+G\x9eX\x8a\x01\xa7\xe6\xff\xd5\xba)\xa3\xab\xaf\x9cY\
+0c\xf2\xec\xc8\xa8\xe8\xd8\xb0nXpZ\xec\xb9a\
+\xcf\xb8\xd8\xc4m\x82\x0d\xc2\xd7\x0083\x5c\x95!\xe7\
+\x1f\xd5\x84\x11\xd8\x180#\xcd\xefr\xbd\xf6\xf6\x13\x9d\
+\xf5\x8du\xfb\xfek\xd7\xc7[\x7f\xfe\xee\x11\x8c\xfb\xc9\
+\xd7\xfex\xda{\xbf\xfb\x8fO\x1a3\x8b\xee\x9f\xfbs\
+r\xf1E\x00\xc0S\xf38L,Z\x0a\xdft\xdd\xe4\
+\xe4\x93\xcf\xf3G\xc9I\xa0\xb2\xe2u\xb7\x8d)\xbb\xe2\
+\xeb\xe3\x0b&\x8d\x1d\x1b\x0a\xeb\xc5yEy\x85\xa1\x90\
+\x16\x0a\x85\xfc\x90\x0d\x86M\xa7\xd71@~WG\xa7\
+\x9e\xeciO\x1con=\xf2\xea\xceO\xdf\xfd\xd9f\
+\x8e\xe6\x98\x8eT\xdd0\xe5\xa3\xddO74\xa0\xccI\
+\xa9\xfc\xe7R\xfb`\x88\xe0\xef\x17\x05\x80\x1aS\x8d'\
+\x17V\xf2@\xac\xb0\xed\xde\x87\xa6QK\xcb84\x18\
+\x0f\xc2\xd5\x8a\xa4\xfc\xc8\xb2\xf9z\xb4|\x14\xceA\x82\
+\x12Mm~\xf7\xf6\xfd\x0c\x1e\xff\xcf\x11&\xdcjP\
+S^\xb9ur\xcd\xf7.\xaa\xdf\xf0\xe3\xcd\x9dx\xe6\
+4`\xfc\xa0\xea\xec\xfe\xaa\x01\xcfn\x94\xa1\xbd\xd5\xb8\
+}\x12\x9a\xbeiS(Y\xf7F\xb4k\xcb\xce\xd1]\
+\x1b\x7f7\x06]X\x8aL\x9c\x98y\xbf\xe2\x8a\xaa\x96\
+\x89_\x9f\xd1:\xeb\xdc\xca\xf8\xa3+c|\xc9\xa7\xd2\
+\x90\xf1\xd4\x8b\xff\xeb9/\x9c\x99T\x0c\x9c\xc9z\xcf\
+\xa6\xef\x88\xe7\xf9<\x0b\x1b\xf1\xe09\x1a\xaa\xf9T>\
+\xb8\x89\xd2\x18\x95\x0f~\xff\xe5\xf3\x97\x08|\x89\xc0\x17\
+\x8b\xc0\xff\x00\x8c\xf4$\xce\x99?CF\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x07<\
+(\
+\xb5/\xfd`w\x1d\x959\x00\x8aI\xec\x0c%\x00\x91\
+\xb8\x01\xefa\xb5\xbev_\xd3\xdc\xf0[\xa7\xc5\x91p\
+\x18]\xbbc=\x22\xa2\xcc\xcc\x90\xc6\x19r]\xff\xff\
+\xae\x0a&\xca\x00\xbb\x00\xd0\x00\xdcP\x1e\x09W\xcd\xeb\
+\xb2\x11\x94\xa6\xe2\xdc\xde\xc0\xd7\x0a]\xa4\xb0\xe7\x5cl\
+\xe0v\xa4\xc0\xe7\x94y;\xf5\xf7\x98\x84Q\xe5\xbf\xc6\
+\xbb\xf5\xffU\xde{\x0a\x97W\xfb5{Oj\x8c\xef\
+\x9bn\xa9\xef\xfb\xe9/S\xbaW\x1f\xef?s)U\
+:f1\xba\xf6~\xd3\xf1\xe9.3\xf8\xa2\xbe}\x86\
+\x06y((\xb2\xb0\xf6<\x9341f\x83\xcc(S\
+90\x97C=\xda\x00K\xacD\xe5L\x09\x8a$\xdc\
+%A\x0e\x15 \x10U\x99X\xc5\x0d\xd6\x9c\x06\xbb,\
+\xb3*\x000h\x0f\xe7\x1c?.\xd5\xa4\x9d\xa1\x19\x19\
+\x19\x8f\x07\x01u]\x98\x06\xb1\xa4\xc8B\x83\xb5)M\
+R\x83D\x114\xc1\x98c\xaeA4&I\xc6\x840\
+.\xcc\x05\x9a\x18\xd6\x9c\xdd6\x08\xe6z\xa0\x0cv\xc1\
+\xb0\x0a\x02\xed\xcd\xb7\xbbs\xe8\xfa\x9c7\xcd*\x9d3\
+DT\x1a\x05&\xfd\xdf7\x10\xc6\xaf\xc4\xc7\xef\xbd\x02\
+d\xf7n\x06\xa5z\xc3\x0d\x15\xba\xb3wQ\xb9\x9b!\
+\xa2\xd2(\xb0\xe5\xc7b;\xfd}\xcds\xaf\xb2\xceU\
+.l\xe4{Pa\xb7\x19t\xce\xe4\xb7\xb6k\xf6\x91\
+\xb5\xb7\x81\xebt\xd9\xd9J\xa7P\xf2#\xc1o}\xf5\
+\x19*x\xb3~|\xe6+\xf5I\xee_\x07;\xaeS\
+*\xec\x99_B\xb7Oy\xed\x7f\x95\x85\xcd\xa2\x84\x14\
+\xc8\xcc^y!\x89\xbd<\x1e)3U\x0d\x22A\x13\
+\xc5\xac\x9c\xcc\x85\xd5 \x94c\xe1v\xf4\xac\x98\xaa\xcb\
+z4k^\x9e\x09eA\x95\xa5A.\x12T\xcdG\
+\x9a\x95cR\x0e\xc6b\x8d\xd5]\x90\xc5\xa1\xa6\x16\xd5\
+|&\x0b\xf6H3\x928\xf6\xac\xee\xcaL\x0dRM\
+\x97SMjb</\xc8\x9a(\x0b\x860\xe6\xc1s\
+Y\xac\xcaD\x12\xc9\x81,+\xe3$\xf8\xc3\xaeiM\
+L4<\x95\x83a\x90\x97Y3\x139\x18\xacY4\
+\xc8\xa46.\xd6\x1c\x0c\x15E\xa6\xa5\xcaL\x0fL\x03\
+\xaa.\x87\xa1\xd1\x80\x10\xe6\xc5\xb1X\xb8TX\x1cI\
+\x94\xb1f\xc5\xda\x04{\xa6)B\x98M\x92\xe0`9\
+\xa4\x09\xba\x9ch\xa2$\xc8QM\xd14-\x08\xa9a\
+>T\xd3\xca4\x88uA\x12\x04k\xf0\xad\xf2\xfb{\
+\xeb\xeaR\xc6\x061kb>12a\xe8\x01\xb2\x9f\
++K\xd7\xea\x182o)\xdd\xab\xc8\xf7X>Th\
+*\x1c\xd9a|\x05\xe6\xcd[\x08\xa5s\xf7\xcd\xc2\x7f\
+\x8f\x95\xff\x9b\x8d\xed\xa2;\xa9\x10\xc2F\xf6n\x00\x06\
+\x17\x0c\xeb\xf1\x98\x1cD\xe4G\xe4$\xb6.|\x18\x9f\
+\xbb\xee\xf8\xfe`\xc3\xb7\x92\xf9\xb1\xbf\x83H\xd3\xc8\xf8\
+\x22\x93e^}\xd9\xfd+\xb5\x1f2\x94\xac\x1e]2\
+q\x93\xc6'\xeect(\xdf\x83,\xa1KG\xe0\x83\
+\xc8\x93\xfd\xba\xcf\xdd\xab\x0c\xb7]\xb6E\xd8\x86\xd2\xf9\
+\xc6\x95\xad\x0b\x99\xe3+o|\xeb\xea\x96_w%\xfb\
+\x0e\xba\x16e\xb7K\x9d\x22\xbe;a\x07\xa3\xa6\xcb\xba\
+\xb0\xe6,\xd9\xb9\xdd\xd8\xbd\xa4\x09=\xcc\xbe\xca\xf6\xf5\
+\x1d2\xb2\xc2f\x09_\xdd\xfb:e\xd9/VS\x92\
+\xa0\xdd\x06\xe9uT\x5c\xd3\x02sA\x95\x13\xbf\xe1\xc3\
+g\xb6@\x18\xca\xa9\x122\xa6\xc7\xc1<PS\xf5H\
+\xece\x99\x13\x13\xb3EN\x81\xe9\xa8q\xb1Bfh\
+FD\x92\x82$\x19\x0e\xb1\x0c1\xd0Q\xcb\xac\x1b\x22\
+\x91\x18\x89r\x15B\x86\x10\x83\x8cADD$\x10\x09\
+D\x02\x11\x11%i\x92t\xf1P\x01N\x1b\xc3A\x9f\
+\x89A\x89\xe0\xf1Y\xa8uAf\x05\xcc^\x95\x01\x16\
+\x10\x83\xa4[\xcc\xe1J\xa69\xf3\x11\xf8Bl\x86g\
+\x88\xa7v\x16\x06\xb29y'W\xa9\x0a\xc8\x9e\xed\xa2\
+\xfd\x9b\xfa\xab\x80\x9f\xcc\x08\x0e\x17x\xcd\xf2\x16\xf4\xe5\
+\x95Q\x87\xf8\x03\xfcE\xf7\xcb.R\xc1$\x1b\x8d\xdc\
+\xc11\xc1N!\xe0\x8a\xff4!I\x82\xac\x87\xa3>\
+\x5c,\x16V-\xb8\x1dh\xb2\x0e\xde\x03#\x01\xbe\xca\
+?q\x87\x0e\x13\xe7L\xc9\xaco\xb4vR\xabp\xfd\
+\x14d\xc5\x08-\xafj\xcc\x0b\xf6\x0a\x9f7\x9a\xa5s\
+p\xee\xdf_L\xa9\xee\x0e$\xeaE\xcb\xf4\xdfJ\xfb\
+K\x02\xf8\x98a\xd0\xe3=\xf8\x7f\xdc\x5c\xe8\x16C\xbc\
+\x0e\x18\x1d\xff\x22\x1fVji'\x97\x08*A\xb3\xd2\
+;\x08\xca\xb2*#i\x99#DY\xbb\x1c\x82\xa2M\
+\x87V\x92\xd6\xb708\xda\xf5U\x96\xa7JZ\xa2J\
+\xce\xecC\x95Ziu\xb6\xa4:\xbe\xd4\xd9\x98%\x0b\
+uBb\xcf\x08\x14\xf6\xe0\xd5=\xee\x9d\x0b\x8bI\x04\
+e\x04\xf4\xa0\x0cN3\x9a\xf6\x82\xea\x8c\x84\xe3\xb1\x9d\
+\x8f\x0f\xcf\x904 \x93\xb8d+TR8\xf8\x86\xff\
+\xd9\x9b\xe2mg\xac\xd8\x92\xa3:U\xd7J\xdc\x92\xf5\
+,\xde9\x83\xe5\x10\x13\xc2\xe8O\x11_\xab\xb5\xb0\xa2\
+\xce?\xc1\xc5\x22\xd1\xd1\x9c']\xc4-\x08\xcf|\xb7\
+]\x95\xc08\xd5\x1a\xe3\xb5\xb8\xc8\x079'\x06(\xd4\
+\xd4\xfc7.\xfc\x10\xe85D\xbcf\xde\x14\x92I\x05\
+bGp\x0e84Oc\x803\xc3\xf4#\xd6w\xe4\
+1\x10Q\x10hQ;\x96\x09\xfc\xe7\xd2\x0b5\xc8\x81\
+\x0e\xca\xad\xd86\xbd\xd2]\x91\xa9b\x1d\xd8\xcd:z\
+\xc3%3=pM\xbf\xe2p\xa0\x9a3\x88\xa5(X\
+\x9d\xea\x08\xa6\xe6\xb6i\xe8\xa0)\xc0d\x8d\xf0\x17:\
+t\x94\x04\x88\x5c{\x0e\x8a\x19\x19\xed\xbb\xc5\xf2\xdbx\
+\xec\xc8ns\x0d4\xe8%\x85\x05pW\x96\x189\x93\
+\xa7\xad\x06\xc25`\xa0>a\x01\x22\xe8\xe3\xf8f\xaf\
+\x1b\xb2\x91\x9f8\x1e0\xcc\xe1:\xba\x04\x84\xfb\xef:\
+;S\x0a\xa1\xe9QM%xO\xf6G\x07\xef\x93\xb7\
+\x1c\x9a6\x11m\x22\xc4\x138$\x08\x9c1h\xb8c\
+4^\x9a\x80T\xc2\x02S\x82\x7f)\x0a~\x80t]\
+\x01\xc9q\xfb\xb3\x97\xe5q\xc3\xe3\xa8M\xc7\x8d\xc5\x88\
+^\x8e\xc3K'1\x81\xd6\xacj\x96\xc2\x8e$\xdbE\
+*\xdddP>f\xc6\xce\xc8aI\x82C\xc3\xc8\x12\
+\xde\xd8\xe2c/\xbfL\xc93(>\xda\x08ETr\
+\xefi\x92\xd33\xa0\x88=\x9c\xa6\xfc\x0f\xa4s\x92\xca\
+\xa4\x88\x19b\x03\xadZ\x95\xa25\x9c\xdd\xe5\xac\x01S\
+lX\x8a\x11JX\x835\x90N\xefh\xd7s\x08\x16\
+\xb0\xd3\xb3\x12\x9b\xf4\x03\xd2\x808Fp`\xb1\x08{\
+\xbf\xc6\xcb\xae\x94\xa7,F\xb7\xdb\xe2\xc4V:\xba)\
+\xf0hL\xf5M\xc1q\xf1\xe0\xe5D\xab\xe2D\xef\xf9\
+.\xe0`\xa8@\x81\xa2K\x9eH]\x14\x04\x0c\xc1\xa2\
+\x0f&\xf4\x06\x91K\xd0\x94H\x9a\x06\x5c\x5cX\x03\x86\
+\x89L.|\xdd\xc6\xb9?\xe5&\xcf\x84%\xbf\xc9s\
+\xc1\xa7\x88\xa9\x9b\x0b\xdb\x12\xf9\xda\x06\x94a\xfbh\x0e\
+\x19\xaa\x94\xcbw+Oq\xc1\xffI\xe9\x07Q\xfc^\
+\xc6\xb9\x91k\xcc_+r\x22R\x1cH\x82;M\x8f\
+#\x19\xf4S\x01\x08\xa4\xc05\x80\x08\xb6\x0a\xa2\x81\x14\
+\x90\x08\xa4\xc05\x80\x00\x17\xd1`\xc9\x0d\x12\x8e\x84\x22\
+$t%\xf5:\x133C\xc0\xc0v\x0bh\x01\xc1w\
+\xd7i~z\xa6q\x197\x98'B\xfe\xed!\xb2\x10\
+\xcf\xc2\xf7\xf7\xc9tf\xbf\xd9&\xc0\x0f\xd9\x8dM\x9f\
+\xb7\x9a~\xb0\x09\xb7O\xec\xef\xec\xc7\x11]\xdf{*\
+3\xdaF\x1a\xee\x9bp|\xce\xc5N@ulI\x8d\
+x\x5c\xfe\xd7\xd7m\x08\xe4\xb9\xbb\xf8P|\xff\xa8\xa1\
+\xbc\xc8C\xcb\xd7\xc6z\x22\xca\xfd\x01\
+\x00\x00\x09\x8e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x84\
+eXIfMM\x00*\x00\x00\x00\x08\x00\x05\x01\x12\
+\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
+\x00\x01\x00\x00\x00J\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
+\x00R\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87i\
+\x00\x04\x00\x00\x00\x01\x00\x00\x00Z\x00\x00\x00\x00\x00\x00\
+\x00H\x00\x00\x00\x01\x00\x00\x00H\x00\x00\x00\x01\x00\x03\
+\xa0\x01\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\xa0\x02\x00\x04\
+\x00\x00\x00\x01\x00\x00\x00@\xa0\x03\x00\x04\x00\x00\x00\x01\
+\x00\x00\x00@\x00\x00\x00\x00\xb5k/\xb3\x00\x00\x00\x09\
+pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x01YiTXtXML:com\
+.adobe.xmp\x00\x00\x00\x00\x00<\
+x:xmpmeta xmlns:\
+x=\x22adobe:ns:meta\
+/\x22 x:xmptk=\x22XMP \
+Core 6.0.0\x22>\x0a   \
+<rdf:RDF xmlns:r\
+df=\x22http://www.w\
+3.org/1999/02/22\
+-rdf-syntax-ns#\x22\
+>\x0a      <rdf:Des\
+cription rdf:abo\
+ut=\x22\x22\x0a          \
+  xmlns:tiff=\x22ht\
+tp://ns.adobe.co\
+m/tiff/1.0/\x22>\x0a  \
+       <tiff:Ori\
+entation>1</tiff\
+:Orientation>\x0a  \
+    </rdf:Descri\
+ption>\x0a   </rdf:\
+RDF>\x0a</x:xmpmeta\
+>\x0a\x19^\xe1\x07\x00\x00\x07\x0fIDATx\x01\
+\xedYM\x88\x1cE\x14~U=3;?\xbb;3\
+\xbb$H\xc8%\xa8\x07\x15sQ\xd4\x83b\x04\x85\x1c\
+DQ\x09x\x08\x82\x87x\x10=\x04\x82\xe0\xc9\xe0A\
+\x0fQ/\x0a\x1e\xbcD\x84\x1c\x8cx\x09\xa8\x07!\x09\
+\xe6\x22\xac\xderRA%\x84\xc4\xdd\x9d\x99uwv\
+g\xe7\xa7\xca\xefUM\xcd\xf4\xcev\xf7\xf6fFv\
+\xd1zlowW\xbd\xfa\xde{_\xbd\xaa\xee~C\
+\xe4\xc53\xe0\x19\xf0\x0cx\x06<\x03\x9e\x01\xcf\x80g\
+\xc03\xe0\x19\xf0\x0c\xfc\x0f\x19\x10\x93\x8dYG\xe0\x09\
+\xbd{\x1b\x93\xc2\xd9\xbd\xe5;\x1c\xc1\x0e\xeb z\xb0\
+\x96\xe8\xc3\x91F&\x85\x93\xc6\x96\xd5\xc9\xa4W\x8d\xd3\
+d\xa7\xcd,\xf7\x0e\xd0_\xd3\x9dJ6#\x84\x86\x08\
+\x88\xd6\xf5\xbaX\xb1#\x99\x04\xa1\xe2P@\xd2\x00\xe7\
+\x10\xdd,6\xcb\x9d))g\xd4\xeeq\xe2-D\xf5\
+D\xa4l\x94Z\x5c\x9bs\xfaz\xaeZ\xbc\xeb\x13\xe4\
+\xfaK\xd0\xe4@qi\xfap\xab~\xe8\x08\xf5Z\xb3\
+y\xf0\x96\xcd\x84(\x12\x1c\x0eQ\xa5\xb0\xfc\x11\x86\x9f\
+\x04F6\x84\xc3x\x0b\xa4\xe4\xa9F\xab\xfaG<N\
+\x9c\x9f\xffZ\xbbM\xfbr\xb1\xf6\xe9\x5cI\xebJ\xb1\
+\x8ec%t\xd4\xb4i/,\x7fo]\xe0@\xf9\x18\
+\x95\xcb&\x13+\xc5\xe5w-N#\x84\xc1x5]\
+5\xf8\xb5\x85\xe1\xf8(\x9cQ\xdc\x9d\xefS\xae\xcd(\
+\xa0\xb3<\xd3=\xa2_\xa6\x90\xe9\xc7\x95^\x85o\xaa\
+K\xd4\xc5l\xb9C\xf7\x94\xaei4<Q\xce\xdf:\
+bg\x94F\x08\xe0@\x8e\x01\xc7\xc8\xf3J\xaf\x03\xa7\
+\xd7\x19b0\x96VZ\xd5\x80\x9dy\xa8Z\xaa?h\
+U/\x8e\xe1{\xdf\x1aNc\x80\xbccP\x0eQ\x09\
+\x9b\x1f\x13\xc1|\x18<\x0e\xd0\x1d\xdc(p#\x82L\
+\xb6`\xcd^\xe4\xbe\x11\x19<)\x94\x81\x10\x82\xfdr\
+\x18|\x96\xb83\x9blO\xa9>\xce\x89\x11\x8c;\xbb\
+\x1d\x83\x00kPR\x8fg(\x22(\xe7\x90\xe9\x02\x09\
+\x9c\x08;J\x1f'N\x95\xbb\xb3q\x9d;\x82G)\
+\x8cM\x80\x05M\x88?\xca\xeaXm\x9d\x89\x1a\x9b\x10\
+\x01cE\xb4\xa7\x83=\x01{J\xff>0\xee3`\
+\x1fL\xc2\x9e\xba\xe03`O\xe9\xdf\x07\xc6}\x06\xec\
+\x83I\xd8S\x17|\x06L\x86\xfe\x89\xbe\x9eO\xc6\xa5\
+\x94(\x13\xc8\x80\xc305\xf8\x9a\x8b1\x8b\x0ff|\
+\x15\xda\xce\x13\x09l\xed\x84\x13\x03?F\xf3.\x09\xe0\
+\xaf>wX\xab7\xe8w\x04\xc4\x85\x11|\x11k\xe2\
+\x92\x17\x07\x18:p)\xb4\xect\xb8V`\xa4o\xd3\
+|A2)\x8c\xd9\xaf'\xeap\x89.\x84a\xf0\x8c\
+\xaa\x10\x99~\xed\xe0\xa7\x10\xceV\x9f\xac\x99t\xffS\
+\x10\xc0\xe0\xb6bcg\x9ag\xc9\x1c\x08V\xe7\x88\x8e\
+\xb4p\xbe&\xc5,\x87\x82@$\xf4\xdd!\xa4\xd6j\
+S\xd0t \x83\xe0\xa9\xbeK\xfd\x00\xccls\x90\x10\
+\xd1\xab\x96jGqq\xbf\xa6u\xee\x87_\x0e\x83\xcf\
+\x5c]$\xe0\xe4`\xa2{\x9cG\x10=\x8c\xa2\x09\xcb\
+\xc0\x1f`1\x91i\x0b\xb0\xfd\xd1\xf6\x14\xf7\x9f\x837\
+\x8e\xc6)\x98\xf6\xd9\xd9\x959\xd9\xed|\xae\xb5|f\
+\xa8\xa8\xb8\x14\x92E\xf0R\x13|\xd5\xad&Q\xf0J\
+c\xe3\xb7KC\xe7Y[\xcbJ\xa9q\x14D]\x10\
+T\xb8\x8f9\xd4\xd4D\xf5@mr\xe0l\x1f\xb5\x04\
+\x14Z\xa7\x03\x83C\x9b]4\x9dj4o_ z\
+\xa0=\xb4\x17\xf6u\xa7\x02\xecp\x14\x0c\xc4\x89\x03\xbc\
+\x9c\xa9\x16\x8e\xbe\x0fz\x9f\xdb\xaa\x89\xaa\x8d\xa0\xef\x1a\
+\xeb\xcbg\x88\xee\x85\xb3Ds\x85\xe5\xc3JKNc\
+\xa8\xb7\xc0\x9c\x94\xf8{\x1aU\x9esDy\xa4\x08\xaf\
+\x90\xf6\x0d\x94\x8c\xd7\x85\x09\x8e\xf5D\x80\x80\xeeF?\
+\xfa:\xb8\xec}\xd0U\xea\xb3@d\x18\x13\xfe!\xc1\
+\xd0'\xa8\xf7\xb8\x92\xf4\xa1\xa0\xe2A\x03O\xad\x9b\xc0\
+Y\xb33\xc4$\x09\xd8\xd5?w\x83\xdc\xebkk3\
+\x8bL,\x86'T\xa1\x01\x0bI\x22\x00\xe9$z\x95\
+B\xedc)\xabo(\xbd\x06u^1<\x04~#\
+\x18)\xa6\x095\xbf\xf3\x8d\xf5\xf9W\xd1\x06\x07\x84[\
+\xe7\xe8\x1fJ\xa5\xb0\xf4\x02\x89\xa9\xaf\x11 \xfa\xb3\xd0\
+\x03\xb4\xc1pX\xad.2%Cz\xed\x5c}c\xfe\
+\xad\xe1\xc8\xadW\x95\xfc\xe2\x93$\x83+\x18\x8be\x92\
+\x05H\x9fk\xe3\x13\x12C\xcc\x90R\xb5\x1fW6\xe6\
+\x1f\xb3#\xdd$n\xc5\x09\xdf\xc5\xec\x01\x86=S\xe7\
+\xc7\x94\xbc\xac4J\xfb\xba\x8d<n\x81\xd1\x0d\x1c8\
+\xe3^\xe9\x06c\xbd83sc\xde\x06\xcf{\x05\x8f\
+\x1d\x1c\xec!56\xea\xdf`\xe6\xff4\xc1\xeb6H\
+\xe8c\xd8\xb3Y\xf3\x9a\xda\x18%\x91\xd6,\xbc\xb7\x9c\
+\x0d\xe3 \xd8\xcb\x99F\xeb\xc0U\xf4]'*`\x9d\
+0\x99a\x9cn\x0f\x85\xd3\x8e\x10\x85Gg\x0bK\x8f\
+X\x1c3c\xfd\xcb\xe8S\x0c\x01V\xb9]\xce\xa16\
+\xcf\xd3\x85\x99\xb2EI\xd6\xb7\x87\xdd\xf0XQ\xe7\xba\
+y\xce_\xc81\x90\xc3i\xe7\x0e~4\xb0\xdc\x836\
+B\x0a1\x94y\x1c\x0eq\x1c\x1eq\xf2\xf4\xf75\x94\
+\x84A@\x08\x87\x8b\xae\xb6r\x8c\xcdp\xd5\x16N\xcd\
+\xb4\x87p\xb0\x01\x0a,'\x98\xc4\xe2\x9ca\xabi\x84\
+\x01b\xc5\xec\xbd\xa6\x97S5V\xcc/@\xb1\xbd\xb6\
+\x83+\xa2\x89 VmP\xf0L\xd2M\xe8\xe3\xa5\xc9\
+\xbb\x8bf\xc2SI\x22\x01\xa9\x10\x8cR\x91-'\xc8\
+\x15\x8e\xbe\xaf\x93\xa4\x1a\xda\xd4\xe3\xd1\x92\x00\xe2G\xc5\
+\xf4$\x12\xc0\xbf\xcb\xc5\x8c\xdb\xd2\xac\xf5F\x22\x0e\xd2\
+\x17O\x04\xde\x90\x8c\xb8\xf3\x16\x0c{\x93K\xe8\x1b\xa8\
+\xef\xa0\x03K\xda\xfc\xae0\x18\x90t\x91\xe8x~\xa5\
+\x8c)\xd1X\x8f\xc8(m\xd63\xafi{\x98{\x9b\
+i\xedL\x8b\x9fU\x09\x22P\xcb\xe6\xf7\x09v\x8e\xd7\
+7\xaf\xe90\x0e\x1bPJu%?jX\xa2f\xd9\
+\x04\x8e\x7f<\x168\xec\x17\x8f\x0b\xf9e|\x82\x86\xe6\
+];\x9d\xc4\x10\xc0\x9b\x98\x0en\x93h\xc2\x93\x8bR\
+\x94\xe1\xf3\x146D\xec\xbe\xee\x10\xb9\xac\x14\x15\xb6\xf2\
+\xd5\xea\xea\xe1e\xa2/y\x87\xb3\x8c\x0cl\x9b\xa0\xcd\
+\x93@\x0b\xfd\x85\x14E\xac\xcf<v\xf8|\x18'#\
+\xc5\x1c\xfc\x10\x97\xfe\xde,\xff\x0a\xbb\x88\x80\xc7m\x13\
+\xe3+z\xcf\xc3\x17\xe0\x14\xa7\x80\x836\xe7S.\x90\
+r.Kz\xf3\xda\xca\xfa\x01\xfc\x86hd\xc4\x9fm\
+\x98I\x1b\x93sD\xe3E\xa8\xfe\x9e\x12\xfaY\xe6\xd6\
+A`\x06\x02\xcc\xea\xb7\x8d\x8d9<\xb7\x05\xbf\xea\xc5\
+8>l\xaf\x96\x96\xdeF\x06\x9c\x84\xbe\x83\xe1\x99\xc4\
+\x0b\x95\xbc\x9a+u\xcf,.\x1eD\x06\x98Gp\xa2\
+\xe3x\xafx\x13\x0c\x9cB>elfa\x14\xde\xba\
+\xf0\xc6\xb8\xd0\xcb\xe4N\xaf\xae\xce.\xa5\xc1\x198\x11\
+\x7f\xc1\xce;\xe1k\x8d,\xe0\x17\x9e\x05>\x87\xb2'\
+\xac\xe7\xf4\xc3\xe7\xd1\xfe\xeb\xc8\x02\x87\xc3\x99\xe3$\x8c\
+\xe9\xdaF\xcfa\xac0\x8e\xfb\xa0b\xfd48\xa3\xb8\
+\xb1\xf7&p\x93\xc6\xdbU\xcc\x8bO\x88\xa4\xed\x1a\xc3\
+\x96I\xe10\x22\x93\x17%\x13\xff\x18\x0a\x1b\x093\xef\
+\xda#\xd7\xaa\xeb\x8c9\xef7\x9c\x187}\xb3g\xc0\
+3\xe0\x19\xf0\x0cx\x06<\x03\x9e\x01\xcf\x80g\xc03\
+\xe0\x19\xf0\x0c\xfc\x87\x19\xf8\x07\xa9>\xac*\xbfw,\
+_\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x03\
+\x00\x00x<\
+\x00q\
+\x00m\x00l\
+\x00\x04\
+\x00\x06\xec0\
+\x00h\
+\x00e\x00l\x00p\
+\x00\x0c\
+\x02=\xac\x14\
+\x00A\
+\x00b\x00o\x00u\x00t\x00T\x00e\x00x\x00t\x00.\x00m\x00d\
+\x00\x09\
+\x034&\xbc\
+\x00h\
+\x00e\x00l\x00p\x00.\x00h\x00t\x00m\x00l\
+\x00\x0f\
+\x04\xbe\xa7\xbc\
+\x00D\
+\x00e\x00b\x00u\x00g\x00O\x00u\x00t\x00p\x00u\x00t\x00.\x00q\x00m\x00l\
+\x00\x15\
+\x08\xf6\xeb\x1c\
+\x00R\
+\x00u\x00n\x00n\x00i\x00n\x00g\x00A\x00p\x00p\x00s\x00D\x00i\x00a\x00l\x00o\x00g\
+\x00.\x00q\x00m\x00l\
+\x00\x15\
+\x095\xf6\xfc\
+\x00P\
+\x00e\x00r\x00f\x00o\x00r\x00m\x00a\x00n\x00c\x00e\x00D\x00i\x00a\x00l\x00o\x00g\
+\x00.\x00q\x00m\x00l\
+\x00\x12\
+\x09\xc1\x84\xfc\
+\x00F\
+\x00a\x00v\x00o\x00u\x00r\x00i\x00t\x00e\x00s\x00G\x00r\x00i\x00d\x00.\x00q\x00m\
+\x00l\
+\x00\x15\
+\x08l\x8b\x5c\
+\x00S\
+\x00e\x00a\x00r\x00c\x00h\x00R\x00e\x00s\x00u\x00l\x00t\x00s\x00V\x00i\x00e\x00w\
+\x00.\x00q\x00m\x00l\
+\x00\x0b\
+\x08g\xc1\xfc\
+\x00A\
+\x00p\x00p\x00G\x00r\x00i\x00d\x00.\x00q\x00m\x00l\
+\x00\x0f\
+\x0e\xca\x18\xfc\
+\x00A\
+\x00b\x00o\x00u\x00t\x00D\x00i\x00a\x00l\x00o\x00g\x00.\x00q\x00m\x00l\
+\x00\x0f\
+\x02\x01\x22\x5c\
+\x00A\
+\x00p\x00p\x00D\x00e\x00l\x00e\x00g\x00a\x00t\x00e\x00.\x00q\x00m\x00l\
+\x00\x0d\
+\x0b\xf4F\xdc\
+\x00S\
+\x00e\x00a\x00r\x00c\x00h\x00B\x00a\x00r\x00.\x00q\x00m\x00l\
+\x00\x0b\
+\x0fp\xf1\xbc\
+\x00L\
+\x00o\x00g\x00V\x00i\x00e\x00w\x00.\x00q\x00m\x00l\
+\x00\x0f\
+\x000$\x5c\
+\x00D\
+\x00e\x00b\x00u\x00g\x00D\x00i\x00a\x00l\x00o\x00g\x00.\x00q\x00m\x00l\
+\x00\x0e\
+\x03\x05\xe7\x1c\
+\x00H\
+\x00e\x00l\x00p\x00W\x00i\x00n\x00d\x00o\x00w\x00.\x00q\x00m\x00l\
+\x00\x0c\
+\x02(R\x5c\
+\x00M\
+\x00a\x00i\x00n\x00M\x00e\x00n\x00u\x00.\x00q\x00m\x00l\
+\x00\x08\
+\x08\x01Z\x5c\
+\x00m\
+\x00a\x00i\x00n\x00.\x00q\x00m\x00l\
+\x00\x10\
+\x09\x8fB\x1c\
+\x00D\
+\x00i\x00s\x00k\x00Q\x00u\x00o\x00t\x00a\x00B\x00a\x00r\x00.\x00q\x00m\x00l\
+\x00\x0f\
+\x0b\xec)\xe7\
+\x00r\
+\x00a\x00w\x00t\x00h\x00e\x00r\x00a\x00p\x00e\x00e\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x01_\xc4\xa7\
+\x00p\
+\x00e\x00n\x00c\x00i\x00l\x002\x00d\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0b\x7f[G\
+\x00Z\
+\x00e\x00a\x00l\x00.\x00p\x00n\x00g\
+\x00\x12\
+\x031\xe6G\
+\x00o\
+\x00p\x00e\x00n\x00t\x00o\x00o\x00n\x00z\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\
+\x00g\
+\x00\x0b\
+\x02\x92\xc4\xa7\
+\x00m\
+\x00e\x00s\x00h\x00l\x00a\x00b\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0c\x18]\xe7\
+\x00N\
+\x00u\x00k\x00e\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x04\xab\x00'\
+\x00l\
+\x00m\x00s\x00t\x00u\x00d\x00i\x00o\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x05\x10^G\
+\x00q\
+\x00t\x00-\x00c\x00r\x00e\x00a\x00t\x00o\x00r\x00.\x00p\x00n\x00g\
+\x00\x07\
+\x00\xb7VG\
+\x00z\
+\x00e\x00d\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x08\x93\x5c\xe7\
+\x00W\
+\x00a\x00r\x00p\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x08V\xc6\xc7\
+\x00p\
+\x00u\x00r\x00e\x00r\x00e\x00f\x00.\x00p\x00n\x00g\
+\x00\x07\
+\x06MW\xa7\
+\x00o\
+\x00m\x00z\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x07\x12h\x07\
+\x00O\
+\x00b\x00s\x00i\x00d\x00i\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x04\x11\x00G\
+\x00c\
+\x00l\x00e\x00a\x00n\x00e\x00r\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x06n\x04g\
+\x00i\
+\x00n\x00k\x00s\x00c\x00a\x00p\x00e\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x00r\xfe\xa7\
+\x00z\
+\x00e\x00d\x00_\x00i\x00n\x00s\x00t\x00a\x00l\x00l\x00e\x00r\x00.\x00p\x00n\x00g\
+\
+\x00\x08\
+\x0c\xa7Xg\
+\x00r\
+\x00u\x00s\x00t\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0c)hg\
+\x00m\
+\x00e\x00s\x00h\x00r\x00o\x00o\x00m\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x05g.g\
+\x00a\
+\x00l\x00l\x00u\x00s\x00i\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x03\x0b{\xa7\
+\x00J\
+\x00o\x00p\x00l\x00i\x00n\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x09\x99\xe1g\
+\x00a\
+\x00p\x00p\x00s\x00e\x00r\x00e\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x00\xa4\xb2g\
+\x00k\
+\x00r\x00i\x00t\x00a\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x03\x8f\xb1\xa7\
+\x00p\
+\x00o\x00d\x00m\x00a\x00n\x00.\x00s\x00v\x00g\
+\x00\x0d\
+\x09\xb0\x90\xa7\
+\x00U\
+\x00l\x00t\x00i\x00M\x00a\x00k\x00e\x00r\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x1e\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x1c\x00\x02\x00\x00\x00\x02\x00\x00\x00\x1c\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x18\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x04$\x00\x00\x00\x00\x00\x01\x00\x02[)\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\xdc\x00\x00\x00\x00\x00\x01\x00\x02\xf58\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03r\x00\x00\x00\x00\x00\x01\x00\x01g'\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x02\xa2\x00\x00\x00\x00\x00\x01\x00\x00\xc7\xd4\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\x00\x00\x00\x00\x00\x00\x01\x00\x00\xfbY\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\x9e\x00\x00\x00\x00\x00\x01\x00\x02\xa9\xc3\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x02\xd6\x00\x00\x00\x00\x00\x01\x00\x00\xec\xcc\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\xf4\x00\x04\x00\x00\x00\x01\x00\x03\x14\xc5\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x02#\xba\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x032\x00\x00\x00\x00\x00\x01\x00\x019\x93\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03P\x00\x00\x00\x00\x00\x01\x00\x01P\xf5\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\x80\x00\x00\x00\x00\x00\x01\x00\x02\x98\xbd\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\xb8\x00\x00\x00\x00\x00\x01\x00\x01\xe8\x94\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x02@\x99\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\xcc\x00\x00\x00\x00\x00\x01\x00\x01\xffp\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\x9c\x00\x00\x00\x00\x00\x01\x00\x01\xa8o\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\x86\x00\x00\x00\x00\x00\x01\x00\x01\x97\xa5\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04\xb8\x00\x00\x00\x00\x00\x01\x00\x02\xce\x82\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x05\x0e\x00\x00\x00\x00\x00\x01\x00\x03\x1c\x05\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xd5R\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x02~\x00\x04\x00\x00\x00\x01\x00\x00\xb4:\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x03\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x12v\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04b\x00\x00\x00\x00\x00\x01\x00\x02\x85 \
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x04L\x00\x00\x00\x00\x00\x01\x00\x02sw\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1H\x7f3\x9c\
+\x00\x00\x00H\x00\x00\x00\x00\x00\x01\x00\x00:X\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x01\xde\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x83\
+\x00\x00\x01\xa1HoI\x98\
+\x00\x00\x01~\x00\x00\x00\x00\x00\x01\x00\x00y\xb9\
+\x00\x00\x01\xa1H\x99\x0f\xf1\
+\x00\x00\x02$\x00\x04\x00\x00\x00\x01\x00\x00\xa0M\
+\x00\x00\x01\xa1H\xc9\x1e\xda\
+\x00\x00\x02\x02\x00\x00\x00\x00\x00\x01\x00\x00\x9d\xb1\
+\x00\x00\x01\xa1Ht)\x83\
+\x00\x00\x00`\x00\x00\x00\x00\x00\x01\x00\x00H\x9d\
+\x00\x00\x01\xa1HoI\x98\
+\x00\x00\x02B\x00\x04\x00\x00\x00\x01\x00\x00\xa4\xe4\
+\x00\x00\x01\xa1H\x91*o\
+\x00\x00\x01>\x00\x00\x00\x00\x00\x01\x00\x00o\xc3\
+\x00\x00\x01\xa1H\x80\xb3q\
+\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00cg\
+\x00\x00\x01\xa1H\x99\x0f\xf2\
+\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00L\xfe\
+\x00\x00\x01\xa1Hp{\xc1\
+\x00\x00\x00\xb4\x00\x04\x00\x00\x00\x01\x00\x00Wa\
+\x00\x00\x01\xa1H\x87/\xf9\
+\x00\x00\x02X\x00\x00\x00\x00\x00\x01\x00\x00\xab\xf6\
+\x00\x00\x01\xa1Hr\xe81\
+\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x00[b\
+\x00\x00\x01\xa1H\x80\xb3q\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x8c|\
+\x00\x00\x01\xa1H\x91*o\
+\x00\x00\x01Z\x00\x00\x00\x00\x00\x01\x00\x00r9\
+\x00\x00\x01\x99\xc3V\x9b(\
+\x00\x00\x01\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x91\x7f\
+\x00\x00\x01\xa1Hq\x9c\xfc\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()